@@ -0,0 +1,220 @@
+from typing import *
+from Machines_gen_usage.Classes_ import State
+from Machines_gen_usage.Tree_ import repeatBounds
+from Machines_gen_usage.AFD_direct import checkBudget
+
+EMPTY = 0
+EPSILON = 1
+
+
+class Terms:
+    """Hash consed regular expressions over class ids. Every term is a number and equal terms get the same number,
+    as the constructors keep them in a normal form: concatenations lean to the right, alternations are flat, sorted
+    and without duplicates, their sets are joined in one, and ∅ and ε are folded away. Terms are ('∅',), ('ε',),
+    ('set', classes), ('.', a, b), ('|', terms) and ('*', a)"""
+
+    def __init__(self, alphabet: Set[int]) -> None:
+        self.alphabet: FrozenSet[int] = frozenset(alphabet)
+        self.terms: List[Tuple[Any, ...]] = []
+        self.ids: Dict[Tuple[Any, ...], int] = {}
+        self.nullable: List[bool] = []
+        self.firsts: List[FrozenSet[int]] = []
+        # (term, class) -> derivative
+        self.memo: Dict[Tuple[int, int], int] = {}
+        self.intern(('∅',))
+        self.intern(('ε',))
+
+    def intern(self, term: Tuple[Any, ...]) -> int:
+        number = self.ids.get(term)
+        if number is not None:
+            return number
+        kind = term[0]
+        if kind == 'set':
+            nullable, first = False, term[1]
+        elif kind == '.':
+            nullable = self.nullable[term[1]] and self.nullable[term[2]]
+            first = self.firsts[term[1]] | self.firsts[term[2]] if self.nullable[term[1]] else self.firsts[term[1]]
+        elif kind == '|':
+            nullable = any(self.nullable[item] for item in term[1])
+            first = frozenset().union(*(self.firsts[item] for item in term[1]))
+        elif kind == '*':
+            nullable, first = True, self.firsts[term[1]]
+        else:
+            nullable, first = kind == 'ε', frozenset()
+        number = len(self.terms)
+        self.ids[term] = number
+        self.terms.append(term)
+        self.nullable.append(nullable)
+        self.firsts.append(first)
+        return number
+
+    def charSet(self, classes: FrozenSet[int]) -> int:
+        return self.intern(('set', frozenset(classes))) if classes else EMPTY
+
+    def factors(self, term: int) -> List[int]:
+        """The terms a concatenation is made of, in order"""
+        result: List[int] = []
+        while self.terms[term][0] == '.':
+            result.append(self.terms[term][1])
+            term = self.terms[term][2]
+        result.append(term)
+        return result
+
+    def concat(self, left: int, right: int) -> int:
+        if left == EMPTY or right == EMPTY:
+            return EMPTY
+        if left == EPSILON:
+            return right
+        if right == EPSILON:
+            return left
+        result = right
+        for factor in reversed(self.factors(left)):
+            result = self.intern(('.', factor, result))
+        return result
+
+    def union(self, items: Iterable[int]) -> int:
+        flat: Set[int] = set()
+        classes: Set[int] = set()
+        for item in items:
+            term = self.terms[item]
+            if term[0] == '|':
+                flat.update(term[1])
+            elif term[0] == 'set':
+                classes.update(term[1])
+            else:
+                flat.add(item)
+        flat.discard(EMPTY)
+        if classes:
+            flat.add(self.charSet(frozenset(classes)))
+        if len(flat) == 0:
+            return EMPTY
+        if len(flat) == 1:
+            return flat.pop()
+        return self.intern(('|', tuple(sorted(flat))))
+
+    def star(self, term: int) -> int:
+        if term == EMPTY or term == EPSILON:
+            return EPSILON
+        if self.terms[term][0] == '*':
+            return term
+        if self.terms[term][0] == '|':
+            # (x|y*|ε)* is (x|y)*
+            items = [self.terms[item][1] if self.terms[item][0] == '*' else item
+                     for item in self.terms[term][1] if item != EPSILON]
+            term = self.union(items)
+            if self.terms[term][0] == '*' or term == EPSILON:
+                return self.star(term)
+        return self.intern(('*', term))
+
+    def repeat(self, term: int, low: int, high: int or None) -> int:
+        """term{low,high} as low copies followed by (term(term(...)?)?)?, or by term* if it has no upper bound"""
+        if high is None:
+            tail = self.star(term)
+        else:
+            tail = EPSILON
+            for _ in range(high - low):
+                tail = self.union((self.concat(term, tail), EPSILON))
+        for _ in range(low):
+            tail = self.concat(term, tail)
+        return tail
+
+    def fromPostfix(self, expression: List[Any]) -> int:
+        """Term of a postfix expression whose leaves are frozensets of class ids (or ε). Concatenations are kept as
+        lists of factors until another operator needs them, so long literals are built in linear time"""
+        epsilon = ord('ε')
+        stack: List[List[int]] = []
+
+        def pop() -> int:
+            result = EPSILON
+            for factor in reversed(stack.pop()):
+                result = self.concat(factor, result)
+            return result
+
+        for token in expression:
+            if token == '.':
+                right = stack.pop()
+                stack[-1].extend(right)
+            elif token == '|':
+                right = pop()
+                stack.append([self.union((pop(), right))])
+            elif token == '*':
+                stack.append([self.star(pop())])
+            elif token == '+':
+                operand = pop()
+                stack.append([operand, self.star(operand)])
+            elif token == '?':
+                stack.append([self.union((pop(), EPSILON))])
+            elif repeatBounds(token) is not None:
+                stack.append([self.repeat(pop(), *repeatBounds(token))])
+            elif isinstance(token, frozenset):
+                stack.append([self.charSet(token)])
+            elif token == epsilon:
+                stack.append([EPSILON])
+            else:
+                stack.append([self.charSet(frozenset({token}))])
+        return pop()
+
+    def derivative(self, term: int, classId: int) -> int:
+        """The term of what is left to match after reading a character of the class"""
+        key = (term, classId)
+        if key in self.memo:
+            return self.memo[key]
+        kind = self.terms[term][0]
+        if kind == 'set':
+            result = EPSILON if classId in self.terms[term][1] else EMPTY
+        elif kind == '.':
+            # Walks the concatenation instead of recursing on it, (a?)(b?)(c?)... can be long
+            parts: List[int] = []
+            node = term
+            while self.terms[node][0] == '.':
+                _, head, node = self.terms[node]
+                parts.append(self.concat(self.derivative(head, classId), node))
+                if not self.nullable[head]:
+                    break
+            else:
+                parts.append(self.derivative(node, classId))
+            result = self.union(parts)
+        elif kind == '|':
+            result = self.union(self.derivative(item, classId) for item in self.terms[term][1])
+        elif kind == '*':
+            result = self.concat(self.derivative(self.terms[term][1], classId), term)
+        else:
+            result = EMPTY
+        self.memo[key] = result
+        return result
+
+
+def make_derivative_AFD(postfix: List[Any], alphaSet: Set[int], token: str = '', id_: str = 'q',
+                        maxStates: int or None = None, maxTransitions: int or None = None):
+    """Deterministic machine of the postfix expression whose states are its derivatives. Equal derivatives are the
+    same term, so the machine is close to the minimal one without building the position tree. Returns the states
+    keyed by term, the initial state and the states by name, like make_direct_AFD"""
+    terms = Terms(alphaSet)
+    start = terms.fromPostfix(postfix)
+    states: Dict[int, State] = {start: State(id_ + '0')}
+    total_states: Dict[str, State] = {id_ + '0': states[start]}
+    toEvaluate: List[int] = [start]
+    transitions = 0
+
+    evaluated = 0
+    while evaluated < len(toEvaluate):
+        actual = toEvaluate[evaluated]
+        evaluated += 1
+        if terms.nullable[actual]:
+            states[actual].isFinalState = True
+            states[actual].token.add(token)
+
+        for letter in sorted(terms.firsts[actual] & terms.alphabet):
+            nextState = terms.derivative(actual, letter)
+            if nextState == EMPTY:
+                continue
+            if nextState not in states:
+                name = id_ + str(len(states))
+                states[nextState] = State(name)
+                total_states[name] = states[nextState]
+                toEvaluate.append(nextState)
+            states[actual].add_transition(letter, states[nextState])
+            transitions += 1
+        checkBudget(len(states), transitions, maxStates, maxTransitions, f'Rule {token!r}')
+
+    return states, states[start], total_states
@@ -1,124 +1,311 @@
-from typing import Dict, List, Set, Tuple
-from Machines_gen_usage.Classes_ import Node, State
+from typing import Any, Dict, List, Set, Tuple
+from Machines_gen_usage.Classes_ import Node, State, CharClasses
+from Machines_gen_usage.Tree_ import positions
+from Machines_gen_usage.CharsSet import splitNarrow
 
 
-def make_direct_AFD(tree: Node, nodes: Dict[str or int, Node], alphaSet: Set[int], token: str = ''):
-    alpha = list(alphaSet)
+class BudgetExceeded(ValueError):
+    """A machine needed more states or transitions than its budget allows. It carries what was built when the
+    construction stopped, and what was being built"""
 
-    states: Dict[Tuple[int or str, ...], State] = {tuple(tree.first_pos): State('q0')}
-    toEvaluate: List[Tuple[int, ...]] = [tuple(tree.first_pos)]
+    def __init__(self, states: int, transitions: int, what: str = '') -> None:
+        super().__init__(states, transitions, what)
+        self.states: int = states
+        self.transitions: int = transitions
+        self.what: str = what
+
+    def __str__(self) -> str:
+        return f'{self.what or "The machine"} passed its budget at {self.states} states and {self.transitions} ' \
+               f'transitions'
+
+
+def checkBudget(states: int, transitions: int, maxStates: int or None, maxTransitions: int or None,
+                what: str) -> None:
+    if (maxStates is not None and states > maxStates) or (maxTransitions is not None and transitions > maxTransitions):
+        raise BudgetExceeded(states, transitions, what)
+
+
+def make_direct_AFD(tree: Node, nodes: Dict[str or int, Node], alphaSet: Set[int], token: str = '',
+                    maxStates: int or None = None, maxTransitions: int or None = None):
+    # Symbols each position can read, so a state only looks at the symbols its positions have
+    symbolsOf: Dict[int, List[int]] = {}
+    for position, node in nodes.items():
+        # make_tree marks the ε leaves as the nullable ones, they read nothing even when a class id has their value
+        if node.is_nullable:
+            continue
+        if isinstance(node.value, frozenset):
+            symbolsOf[position] = sorted(node.value & alphaSet)
+        elif isinstance(node.value, int) and node.value in alphaSet:
+            symbolsOf[position] = [node.value]
+
+    # DFA states are keyed by the bitmask of their positions, so equal sets of positions are the same state
+    states: Dict[int, State] = {tree.first_pos: State('q0')}
+    toEvaluate: List[int] = [tree.first_pos]
     total_states: Dict[str, State] = dict()
-    initSta: Tuple[int, ...] = tuple(tree.first_pos)
+    initSta: int = tree.first_pos
     total_states['q0'] = states[initSta]
-    finalState: str = ''
+    finalState: int = 0
     for state in nodes:
         if nodes[state].value == '#':
-            finalState = state
+            finalState = 1 << state
             break
     gen = 1
+    # A few rules (like (a|b)*a(a|b)(a|b)...) have exponentially many states, the budget stops them early
+    transitions = 0
 
-    while len(toEvaluate) > 0:
-        actualState: Tuple[int, ...] = toEvaluate.pop(0)
+    evaluated = 0
+    while evaluated < len(toEvaluate):
+        actualState: int = toEvaluate[evaluated]
+        evaluated += 1
 
-        for letter in alpha:
-            nextState_st: Set[int] = set()
-            for state in actualState:
-                if nodes[state].value == letter:
-                    nextState_st = nextState_st.union(nodes[state].follow_pos)
+        moves: Dict[int, int] = {}
+        for state in positions(actualState):
+            for letter in symbolsOf.get(state, ()):
+                moves[letter] = moves.get(letter, 0) | nodes[state].follow_pos
+        transitions += len(moves)
+        checkBudget(len(states), transitions, maxStates, maxTransitions, f'Rule {token!r}')
 
-            if len(nextState_st) <= 0:
+        for letter in sorted(moves):
+            nextState: int = moves[letter]
+            if nextState == 0:
                 continue
-            nextState: Tuple[int, ...] = tuple(nextState_st)
             if nextState not in states:
                 states[nextState] = State('q' + str(gen))
                 total_states['q' + str(gen)] = states[nextState]
-                if finalState in nextState_st:
-                    states[nextState].isFinalState = True
                 toEvaluate.append(nextState)
                 gen += 1
             states[actualState].add_transition(letter, states[nextState])
 
     for state in states:
-        if finalState in state:
+        if state & finalState:
             states[state].isFinalState = True
             states[state].token.add(token)
 
     return states, states[initSta], total_states
 
 
-def minimizeAFD(states2: Dict[str or int, State], alpha: Set[int or str], id_:str = 'Q'):
-    initSt = states2['q0']
-    initState = tuple([states2[x] for x in states2 if not states2[x].isFinalState])
-    finalState = tuple([states2[x] for x in states2 if states2[x].isFinalState])
-    minimized_states: Dict[str, Tuple[State, ...]] = {id_+'0': initState, id_+'1': finalState}
-
-    not_toDo = True
-    while not_toDo:
-        evaluated = 1
-        new_minimized_states: Dict[str, Tuple[State, ...]] = dict()
-        for subStates in minimized_states:
-            transitionsDict: Dict[str, Set[State]] = dict()
-            for minState in minimized_states[subStates]:
-                transitions: List[Tuple[str, str]] = []
-                for letter in alpha:
-                    if len(minState.getStates(letter)) <= 0:
-                        pass
-                    else:
-                        newState = minState.getStates(letter).copy().pop()
-                        for subStates2 in minimized_states:
-                            if newState in minimized_states[subStates2]:
-                                transition: Tuple[str, str] = (subStates2, letter)
-                                transitions.append(transition)
-
-                tupleTransitions: str = str(transitions)
-                if tupleTransitions in transitionsDict:
-                    transitionsDict[tupleTransitions].add(minState)
+def mergeAFD(machines: List[State], maxStates: int or None = None,
+             maxTransitions: int or None = None) -> Tuple[Dict[str, State], State]:
+    """Subset construction over the union of the rule machines. A merged state accepts the token of the first
+    rule (in the given order) that accepts there, as the lexer gives priority to the earlier rules."""
+    # Merged states are keyed by the (rule, state) pairs still alive, in rule order
+    initial: Tuple[Tuple[int, State], ...] = tuple(enumerate(machines))
+    states: Dict[Tuple[Tuple[int, int], ...], State] = {tuple((rule, id(st)) for rule, st in initial): State('q0')}
+    total_states: Dict[str, State] = {'q0': states[tuple((rule, id(st)) for rule, st in initial)]}
+    toEvaluate: List[Tuple[Tuple[int, State], ...]] = [initial]
+    transitions = 0
+
+    evaluated = 0
+    while evaluated < len(toEvaluate):
+        actual = toEvaluate[evaluated]
+        evaluated += 1
+        actualState = states[tuple((rule, id(st)) for rule, st in actual)]
+
+        for rule, st in actual:
+            if st.isFinalState:
+                actualState.isFinalState = True
+                actualState.token = set(st.token)
+                break
+
+        moves: Dict[int or str, List[Tuple[int, State]]] = {}
+        for rule, st in actual:
+            for letter, targets in st.transitions.items():
+                for target in targets:
+                    moves.setdefault(letter, []).append((rule, target))
+        transitions += len(moves)
+        checkBudget(len(states), transitions, maxStates, maxTransitions, 'The merged machine')
+
+        for letter, nextState in moves.items():
+            key = tuple((rule, id(st)) for rule, st in nextState)
+            if key not in states:
+                states[key] = State('q' + str(len(states)))
+                total_states[states[key].value] = states[key]
+                toEvaluate.append(tuple(nextState))
+            actualState.add_transition(letter, states[key])
+
+    return total_states, total_states['q0']
+
+
+def mergeInBatches(machines: List[State], alpha: Set[int], batchSize: int = 64, id_: str = 'a',
+                   maxStates: int or None = None, maxTransitions: int or None = None) -> Tuple[Dict[str, State], State]:
+    """Merges the rule machines batchSize at a time and minimizes every partial result before merging it again,
+    so no merged state has to follow more than batchSize machines. The batches keep the order of the rules, so the
+    earliest rule still gives the token. Returns the minimized states named id_ + number and the initial state"""
+    level = 0
+    while True:
+        merged: List[Tuple[Dict[str, State], State]] = []
+        for first in range(0, len(machines), batchSize):
+            states = mergeAFD(machines[first:first + batchSize], maxStates, maxTransitions)[0]
+            last = len(machines) <= batchSize
+            merged.append(minimizeAFD(states, alpha, id_=id_ if last else f'm{level}_{first}_'))
+        if len(merged) == 1:
+            return merged[0]
+        machines = [start for _, start in merged]
+        level += 1
+
+
+def ruleProduct(machines: List[State]) -> Tuple[List[int], Dict[int, Set[int]], int, int]:
+    """Walks the product of the rule machines, the merged machine mergeAFD builds before minimizing it. Returns the
+    rules that never give the token of a product state (earlier rules accept everything they accept), for every
+    rule the earlier rules that take some of its lexemes, and the number of product states with and without the
+    shadowed rules. The initial product state gives no token, as the simulation never emits an empty lexeme, so a
+    rule that only matches the empty string counts as shadowed too"""
+    initial: Tuple[Tuple[int, State], ...] = tuple(enumerate(machines))
+    seen: Set[Tuple[Tuple[int, int], ...]] = {tuple((rule, id(st)) for rule, st in initial)}
+    pending: List[Tuple[Tuple[int, State], ...]] = [initial]
+    wins: Set[int] = set()
+    beaten: Dict[int, Set[int]] = {}
+
+    while pending:
+        actual = pending.pop()
+        finals = [rule for rule, st in actual if st.isFinalState]
+        if finals and actual is not initial:
+            wins.add(finals[0])
+            for rule in finals[1:]:
+                beaten.setdefault(rule, set()).add(finals[0])
+
+        moves: Dict[int or str, List[Tuple[int, State]]] = {}
+        for rule, st in actual:
+            for letter, targets in st.transitions.items():
+                for target in targets:
+                    moves.setdefault(letter, []).append((rule, target))
+        for nextState in moves.values():
+            key = tuple((rule, id(st)) for rule, st in nextState)
+            if key not in seen:
+                seen.add(key)
+                pending.append(tuple(nextState))
+
+    shadowed = [rule for rule in range(len(machines)) if rule not in wins]
+    hidden = set(shadowed)
+    without = {tuple(item for item in key if item[0] not in hidden) for key in seen}
+    without.discard(())
+    return shadowed, beaten, len(seen), len(without)
+
+
+def hopcroft(delta: List[List[int]], numSymbols: int, labels: List[Any]) -> List[int]:
+    """Hopcroft partition refinement. delta[state][symbol] is the next state or -1, labels gives the initial
+    partition, with None for the non final states. Returns the block of every state, or -1 for the states
+    equivalent to the implicit dead state."""
+    sink = len(delta)
+    inverse: List[List[List[int]]] = [[[] for _ in range(sink + 1)] for _ in range(numSymbols)]
+    for state, row in enumerate(delta):
+        for symbol in range(numSymbols):
+            inverse[symbol][row[symbol] if row[symbol] >= 0 else sink].append(state)
+    for symbol in range(numSymbols):
+        inverse[symbol][sink].append(sink)
+
+    blockOf: List[int] = [0] * (sink + 1)
+    blocks: List[Set[int]] = [{sink}]
+    byLabel: Dict[Any, int] = {}
+    for state, label in enumerate(labels):
+        if label not in byLabel:
+            byLabel[label] = len(blocks)
+            blocks.append(set())
+        blockOf[state] = byLabel[label]
+        blocks[blockOf[state]].add(state)
+
+    # The dead state starts in the same block as the non final states
+    if None in byLabel:
+        blocks[0] |= blocks[byLabel[None]]
+        for state in blocks[0]:
+            blockOf[state] = 0
+        blocks[byLabel[None]] = set()
+
+    # Splitting by every block but one is enough, so the block of the dead state is left out
+    waiting: List[Tuple[int, int]] = [(block, symbol) for block in range(1, len(blocks)) for symbol in range(numSymbols)
+                                      if len(blocks[block]) > 0]
+    inWaiting: Set[Tuple[int, int]] = set(waiting)
+
+    while len(waiting) > 0:
+        splitter, symbol = waiting.pop()
+        inWaiting.discard((splitter, symbol))
+
+        touched: Dict[int, Set[int]] = {}
+        for target in blocks[splitter]:
+            for state in inverse[symbol][target]:
+                touched.setdefault(blockOf[state], set()).add(state)
+
+        for block, inside in touched.items():
+            if len(inside) == len(blocks[block]):
+                continue
+            # Moving the states that were reached costs no more than finding them
+            blocks[block] -= inside
+            newBlock = len(blocks)
+            blocks.append(inside)
+            for state in inside:
+                blockOf[state] = newBlock
+            for letter in range(numSymbols):
+                if (block, letter) in inWaiting:
+                    toAdd = newBlock
                 else:
-                    transitionsDict[tupleTransitions] = {minState}
+                    toAdd = newBlock if len(inside) <= len(blocks[block]) else block
+                if (toAdd, letter) not in inWaiting:
+                    waiting.append((toAdd, letter))
+                    inWaiting.add((toAdd, letter))
 
-            for transition_ in transitionsDict:
-                if initSt in transitionsDict[transition_]:
-                    new_minimized_states[id_ + str(0)] = tuple(transitionsDict[transition_])
-                    continue
-                new_minimized_states[id_ + str(evaluated)] = tuple(transitionsDict[transition_])
-                evaluated += 1
+    return [-1 if blockOf[state] == blockOf[sink] else blockOf[state] for state in range(sink)]
 
-        if len(new_minimized_states) == len(minimized_states):
-            not_toDo = False
-        else:
-            minimized_states = new_minimized_states
 
+def minimizeAFD(states2: Dict[str or int, State], alpha: Set[int or str], id_: str = 'Q'):
+    initSt = states2['q0']
+    order: List[State] = list(states2.values())
+    index: Dict[int, int] = {id(state): number for number, state in enumerate(order)}
+    symbols: List[int or str] = list(alpha)
 
-    newMin_States: Dict[str, State] = dict()
-    initial = ''
-    for subStates in minimized_states:
-        index = subStates
-
-        if states2['q0'] in minimized_states[subStates]:
-            initial = index
-        newMin_States[index] = State(index)
-
-        for minState in minimized_states[subStates]:
-            if minState.isFinalState:
-                newMin_States[index].isFinalState = True
-                newMin_States[index].token = minState.token
-                break
+    delta: List[List[int]] = []
+    for state in order:
+        row = []
+        for letter in symbols:
+            targets = state.getStates(letter)
+            row.append(index[id(next(iter(targets)))] if len(targets) > 0 else -1)
+        delta.append(row)
 
-    for subStates in minimized_states:
-        index = subStates
-        tryState: State = tuple(minimized_states[subStates])[0]
-        newMinState: State = newMin_States[index]
+    labels = [(True, frozenset(state.token)) if state.isFinalState else None for state in order]
+    blockOf = hopcroft(delta, len(symbols), labels)
 
-        for letter in alpha:
-            if len(tryState.getStates(letter)) <= 0:
+    # Name the blocks in the order they are reached from the initial state
+    names: Dict[int, str] = {blockOf[index[id(initSt)]]: id_ + '0'}
+    representative: Dict[int, State] = {blockOf[index[id(initSt)]]: initSt}
+    toEvaluate: List[State] = [initSt]
+    evaluated = 0
+    while evaluated < len(toEvaluate):
+        state = toEvaluate[evaluated]
+        evaluated += 1
+        for target in delta[index[id(state)]]:
+            if target < 0 or blockOf[target] == -1 or blockOf[target] in names:
                 continue
+            names[blockOf[target]] = id_ + str(len(names))
+            representative[blockOf[target]] = order[target]
+            toEvaluate.append(order[target])
+
+    newMin_States: Dict[str, State] = dict()
+    for block, name in names.items():
+        newMin_States[name] = State(name)
+        if representative[block].isFinalState:
+            newMin_States[name].isFinalState = True
+            newMin_States[name].token = set(representative[block].token)
+
+    for block, name in names.items():
+        row = delta[index[id(representative[block])]]
+        for column, letter in enumerate(symbols):
+            if row[column] >= 0 and blockOf[row[column]] in names:
+                newMin_States[name].add_transition(letter, newMin_States[names[blockOf[row[column]]]])
 
-            tranState = tryState.getStates(letter).copy().pop()
-            for subStates2 in minimized_states:
-                if tranState in minimized_states[subStates2]:
-                    newMinState.add_transition(letter, newMin_States[subStates2])
-                    break
+    return newMin_States, newMin_States[id_ + '0']
 
-    newMin_States[initial].value = id_+'0'
 
-    return newMin_States, newMin_States[initial]
\ No newline at end of file
+def expandAFD(states: Dict[str, State], classes: CharClasses) -> None:
+    """Replaces the class ids of the transitions by the characters of each class, the characters from NARROW_END
+    on as one IntervalSet transition per class"""
+    split = [splitNarrow(charSet) for charSet in classes.classes]
+    for state in states.values():
+        transitions = state.transitions
+        state.transitions = {}
+        for classId, targets in transitions.items():
+            narrow, wide = split[classId]
+            for char in narrow:
+                state.transitions[char] = set(targets)
+            if wide:
+                state.transitions[wide] = set(targets)
+        state.numTrans = len(state.transitions)
+        state.edits += 1
@@ -0,0 +1,110 @@
+from typing import *
+from Machines_gen_usage.Classes_ import Node, CharClasses
+from Machines_gen_usage.CharsSet import IntervalSet
+from Machines_gen_usage.DenseAFD import buildClassMap, classColumn
+from Machines_gen_usage.Tree_ import make_direct_tree, markedExpression
+
+# Up to this many positions the set of active positions fits in one machine word
+WORD_POSITIONS = 63
+# Positions whose followpos are joined in one table lookup
+CHUNK_BITS = 8
+
+
+class MarkerTable:
+    """accept of a BitNFA: the rule of the first end marker in a set of positions, -1 if it has none. The markers
+    of earlier rules have lower positions, so the lowest one gives the token"""
+
+    def __init__(self, ruleOf: Dict[int, int]) -> None:
+        self.ruleOf: Dict[int, int] = ruleOf
+        self.markers: int = sum(1 << pos for pos in ruleOf)
+
+    def __getitem__(self, mask: int) -> int:
+        ends = mask & self.markers
+        return self.ruleOf[(ends & -ends).bit_length() - 1] if ends else -1
+
+
+class BitNFA:
+    """Glushkov automaton of a position tree (the output of make_direct_tree) simulated without building a DFA. A
+    state is the set of positions that can read the next character, as one integer, and a step is
+    follow(state & byClass[column]), where the followpos of every CHUNK_BITS positions are joined beforehand in a
+    table of 2 ** CHUNK_BITS masks. Building it is linear in the tree and every character costs a few lookups, so it
+    suits small one off rules (up to WORD_POSITIONS positions the sets fit in a machine word)"""
+
+    def __init__(self, tree: Node, nodes: Dict[int, Node], tokens: List[str],
+                 classes: CharClasses or None = None) -> None:
+        self.tokens: List[str] = tokens
+        self.keywords: Dict[int, Dict[str, int]] = {}
+        self.start: int = tree.first_pos
+        self.numPositions: int = max(nodes, default=0)
+
+        # End markers are #<rule>, a tree of a single rule only has the # make_direct_tree adds
+        ruleOf: Dict[int, int] = {pos: int(node.value[1:]) for pos, node in nodes.items()
+                                  if isinstance(node.value, str) and node.value.startswith('#') and len(node.value) > 1}
+        if len(ruleOf) == 0:
+            ruleOf = {pos: 0 for pos, node in nodes.items() if node.value == '#'}
+        self.accept: MarkerTable = MarkerTable(ruleOf)
+
+        # Leaves hold characters, IntervalSets or (after compress_alphabet) class ids of classes
+        epsilon = ord('ε')
+        charSets: Dict[int, IntervalSet] = {}
+        for pos, node in nodes.items():
+            if isinstance(node.value, IntervalSet):
+                charSets[pos] = node.value
+            elif isinstance(node.value, frozenset):
+                charSets[pos] = IntervalSet(interval for classId in node.value
+                                             for interval in classes.classes[classId].intervals)
+            elif isinstance(node.value, int) and node.value != epsilon:
+                charSets[pos] = IntervalSet.of(node.value)
+        own = CharClasses(list(charSets.values()))
+        self.numClasses: int = len(own)
+        self.byClass: List[int] = [0] * self.numClasses
+        for pos, charSet in charSets.items():
+            for column in own.classesOf(charSet):
+                self.byClass[column] |= 1 << pos
+        self.blocks, self.leaves = buildClassMap((charSet, column) for column, charSet in enumerate(own.classes))
+
+        # follows[k][bits] is the union of the followpos of the positions k * CHUNK_BITS + i of the set bits i
+        self.follows: List[List[int]] = []
+        size = 1 << CHUNK_BITS
+        for first in range(0, self.numPositions + 1, CHUNK_BITS):
+            table = [0] * size
+            for bits in range(1, size):
+                low = (bits & -bits).bit_length() - 1
+                node = nodes.get(first + low)
+                table[bits] = table[bits & bits - 1] | (node.follow_pos if node is not None else 0)
+            self.follows.append(table)
+
+    @staticmethod
+    def fromRules(postfixes: List[List[Any]], tokens: List[str], classes: CharClasses or None = None) -> 'BitNFA':
+        """Automaton of several rules, every one ending in its own marker like in LazyAFD"""
+        tree, nodes, _ = make_direct_tree(markedExpression(postfixes))
+        return BitNFA(tree, nodes, tokens, classes)
+
+    def step(self, state: int, char: int) -> int:
+        column = classColumn(self.blocks, self.leaves, char)
+        if column < 0:
+            return -1
+        mask = state & self.byClass[column]
+        result = 0
+        chunk = 0
+        while mask:
+            result |= self.follows[chunk][mask & (1 << CHUNK_BITS) - 1]
+            mask >>= CHUNK_BITS
+            chunk += 1
+        return result if result else -1
+
+    def isFinal(self, state: int) -> bool:
+        return self.accept[state] >= 0
+
+    def getToken(self, state: int) -> str or None:
+        rule = self.accept[state]
+        return self.tokens[rule] if rule >= 0 else None
+
+    def matches(self, string: str or bytes) -> bool:
+        """Whether the whole text is a lexeme of the rules"""
+        state = self.start
+        for char in (string if not isinstance(string, str) else map(ord, string)):
+            state = self.step(state, char)
+            if state < 0:
+                return False
+        return self.isFinal(state)
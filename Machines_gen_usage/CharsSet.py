@@ -1,4 +1,12 @@
 import string
+from bisect import bisect_right
+from sys import maxsize
+from typing import *
+
+# Last Unicode code point. The State machines keep one transition per character only below NARROW_END, the wider
+# characters of a transition are kept as a single range so negated sets and _ stay small
+MAX_CHAR = 0x10FFFF
+NARROW_END = 256
 
 
 def globalChars():
@@ -25,3 +33,183 @@ def obtainSet(first: str, second: str):
     if ord(first) > ord(second):
         return first + second
     return ''.join(chr(i) for i in range(ord(first), ord(second) + 1))
+
+
+class IntervalSet:
+    """Set of characters stored as sorted, disjoint and non adjacent inclusive intervals of their codes"""
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]] = ()) -> None:
+        merged: List[Tuple[int, int]] = []
+        for low, high in sorted(intervals):
+            if merged and low <= merged[-1][1] + 1:
+                if high > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], high)
+            else:
+                merged.append((low, high))
+        self.intervals: Tuple[Tuple[int, int], ...] = tuple(merged)
+
+    @staticmethod
+    def of(*chars: str or int) -> 'IntervalSet':
+        codes = [char if isinstance(char, int) else ord(char) for char in chars]
+        return IntervalSet((code, code) for code in codes)
+
+    def union(self, other: 'IntervalSet') -> 'IntervalSet':
+        return IntervalSet(self.intervals + other.intervals)
+
+    def difference(self, other: 'IntervalSet') -> 'IntervalSet':
+        result: List[Tuple[int, int]] = []
+        index = 0
+        for low, high in self.intervals:
+            while index < len(other.intervals) and other.intervals[index][1] < low:
+                index += 1
+            cursor = index
+            while cursor < len(other.intervals) and other.intervals[cursor][0] <= high:
+                if other.intervals[cursor][0] > low:
+                    result.append((low, other.intervals[cursor][0] - 1))
+                low = max(low, other.intervals[cursor][1] + 1)
+                cursor += 1
+            if low <= high:
+                result.append((low, high))
+        return IntervalSet(result)
+
+    def __contains__(self, char: int) -> bool:
+        index = bisect_right(self.intervals, (char, maxsize)) - 1
+        return index >= 0 and self.intervals[index][1] >= char
+
+    def __iter__(self) -> Iterator[int]:
+        for low, high in self.intervals:
+            yield from range(low, high + 1)
+
+    def __len__(self) -> int:
+        return sum(high - low + 1 for low, high in self.intervals)
+
+    def __bool__(self) -> bool:
+        return len(self.intervals) > 0
+
+    def __eq__(self, other):
+        if isinstance(other, IntervalSet):
+            return self.intervals == other.intervals
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.intervals)
+
+    def __str__(self):
+        return '[' + ' '.join(str(low) if low == high else f'{low}-{high}' for low, high in self.intervals) + ']'
+
+    __repr__ = __str__
+    __or__ = union
+    __sub__ = difference
+
+
+def globalIntervals() -> IntervalSet:
+    """Every Unicode code point, as a single interval"""
+    return IntervalSet([(0, MAX_CHAR)])
+
+
+def splitNarrow(charSet: IntervalSet) -> Tuple[List[int], IntervalSet]:
+    """Characters of the set below NARROW_END one by one, and the rest of the set as ranges"""
+    narrow: List[int] = []
+    wide: List[Tuple[int, int]] = []
+    for low, high in charSet.intervals:
+        if low < NARROW_END:
+            narrow.extend(range(low, min(high, NARROW_END - 1) + 1))
+        if high >= NARROW_END:
+            wide.append((max(low, NARROW_END), high))
+    return narrow, IntervalSet(wide)
+
+
+def utf8Sequences(charSet: IntervalSet) -> List[List[Tuple[int, int]]]:
+    """Splits the set into sequences of byte ranges, one range per byte of the UTF-8 encoding, so the bytes of
+    every character of the set match exactly one sequence. Surrogates have no encoding and are left out"""
+    sequences: List[List[Tuple[int, int]]] = []
+    pending: List[Tuple[int, int]] = list(reversed(charSet.intervals))
+    while pending:
+        low, high = pending.pop()
+        if low <= 0xDFFF and high >= 0xD800:
+            if high > 0xDFFF:
+                pending.append((0xE000, high))
+            if low < 0xD800:
+                pending.append((low, 0xD7FF))
+            continue
+        # Both ends must have the same length of encoding
+        limit = next((limit for limit in (0x7F, 0x7FF, 0xFFFF) if low <= limit < high), None)
+        if limit is not None:
+            pending += [(limit + 1, high), (low, limit)]
+            continue
+        if high <= 0x7F:
+            sequences.append([(low, high)])
+            continue
+        # And the range must not cut a block of continuation bytes, so every byte can be a range of its own
+        for bits in (6, 12, 18):
+            mask = (1 << bits) - 1
+            if low & ~mask == high & ~mask:
+                continue
+            if low & mask != 0:
+                pending += [((low | mask) + 1, high), (low, low | mask)]
+                break
+            if high & mask != mask:
+                pending += [(high & ~mask, high), (low, (high & ~mask) - 1)]
+                break
+        else:
+            sequences.append(list(zip(chr(low).encode('utf-8'), chr(high).encode('utf-8'))))
+    return sequences
+
+
+def evalSet(content: str) -> Tuple[IntervalSet, bool]:
+    """Evaluates the inside of a [...] set, returns the set and whether it is valid"""
+    if content[-1] == r'\\':
+        return IntervalSet(), False
+    totalSet = IntervalSet()
+    negation = content[0] == '^'
+    i = 1 if negation else 0
+    negSet = IntervalSet()
+    while i < len(content) - 2:
+        chLast = content[i]
+        ch = content[i + 1]
+        chNext = content[i + 2]
+
+        if chLast == '\\':
+            i += 1
+            continue
+
+        if chLast == '-':
+            return IntervalSet(), False
+
+        if chLast != '' or chLast != ' ':
+            if ch == '-':
+                if chLast != '' and chNext != '' and ch != '' and chNext != '':
+                    if ord(chLast) > ord(chNext):
+                        return IntervalSet(), False
+
+                    obSet = IntervalSet([(ord(chLast), ord(chNext))])
+                    if not negation:
+                        totalSet = totalSet.union(obSet)
+                    else:
+                        negSet = negSet.union(obSet)
+                    i += 3
+                    continue
+                else:
+                    return IntervalSet(), False
+            else:
+                if not negation:
+                    totalSet = totalSet.union(IntervalSet.of(chLast))
+                else:
+                    negSet = negSet.union(IntervalSet.of(chLast))
+        i += 1
+
+    if len(content) - 1 == i:
+        totalSet = totalSet.union(IntervalSet.of(content[i]))
+    elif len(content) - 2 == i:
+        if content[i + 1] == '-' and content[i + 1] == r'\\':
+            return IntervalSet(), False
+        if content[i] != ' ':
+            totalSet = totalSet.union(IntervalSet.of(content[i]))
+        if content[i + 1] != ' ':
+            totalSet = totalSet.union(IntervalSet.of(content[i + 1]))
+
+    if negation:
+        negSet = negSet.union(totalSet)
+        totalSet = globalIntervals().difference(negSet)
+
+    return totalSet, True
@@ -3,6 +3,8 @@ from typing import Tuple, List, Any
 
 import pandas as pd
 import tabulate
+from bisect import bisect_left, bisect_right
+from Machines_gen_usage.CharsSet import IntervalSet, NARROW_END
 
 
 class Node:
@@ -14,10 +16,11 @@ class Node:
         self.right: 'Node' or None = right
         self.id_: int or None = id_
         self.is_nullable: bool = False
-        self.first_pos: Set[int] = set()
-        self.last_pos: Set[int] = set()
+        # Sets of positions stored as bitmasks, bit i stands for the leaf with id_ i
+        self.first_pos: int = 0
+        self.last_pos: int = 0
         self.isLeft: bool = False
-        self.follow_pos: Set[str] = set()
+        self.follow_pos: int = 0
 
     def getId(self) -> str:
         return str(id(self))
@@ -71,20 +74,27 @@ class FormatPointer:
 class State:
     def __init__(self, value: str) -> None:
         self.value: str = value
-        self.transitions: Dict[str or int, Set['State']] = {}
+        self.transitions: Dict[str or int or IntervalSet, Set['State']] = {}
         self.isFinalState: bool = False
         self.token: Set[str] = set()
         self.numTrans: int = 0
+        # Edits made to this state, used to know when a frozen (dense) copy of its machine is stale
+        self.edits: int = 0
+        self.frozen: Tuple[int, Tuple['State', ...], Any] or None = None
+        # Only in the initial state of a machine: token of a lexeme -> {keyword lexeme: token it takes instead}
+        self.keywords: Dict[str, Dict[str, str]] = {}
 
-    def add_transition(self, value: str or int, state: 'State') -> None:
+    def add_transition(self, value: str or int or IntervalSet, state: 'State') -> None:
         if value in self.transitions:
             self.transitions[value].add(state)
         else:
             self.transitions[value] = {state}
 
         self.numTrans += 1
+        self.edits += 1
 
     def combine_States(self, state: 'State') -> None:
+        self.edits += 1
         for transition in state.transitions:
             if transition in self.transitions:
                 self.transitions[transition] = self.transitions[transition].union(state.transitions[transition])
@@ -100,7 +110,14 @@ class State:
         return str(id(self))
 
     def getStates(self, transition_value) -> Set['State']:
-        return self.transitions[transition_value] if transition_value in self.transitions else set()
+        if transition_value in self.transitions:
+            return self.transitions[transition_value]
+        # Characters from NARROW_END on are kept in IntervalSet transitions, ε is never one of them
+        if isinstance(transition_value, int) and transition_value >= NARROW_END and transition_value != ord('ε'):
+            for value, states in self.transitions.items():
+                if isinstance(value, IntervalSet) and transition_value in value:
+                    return states
+        return set()
 
     def __eq__(self, other):
         """Define la igualdad entre dos instancias de la clase."""
@@ -113,31 +130,19 @@ class State:
         return hash((self.value, id(self)))
 
     def getEpsilonClean(self):
-        states: Set['State'] = self.getStates(ord('ε'))
-        not_explorer: Set['State'] = set()
-
-        for state in states:
-            not_explorer = not_explorer.union(state.getStates(ord('ε')))
-
-        not_explorer = not_explorer - states
-
-        while len(not_explorer) > 0:
-            states = states.union(not_explorer)
-            copy = not_explorer.copy()
-            not_explorer = set()
-            for state in copy:
-                not_explorer = not_explorer.union(state.getStates(ord('ε')))
-            not_explorer = not_explorer - states
-
-        return states.union({self})
+        """ε-closure of this state. Simulations should read it from epsilonClosures, which walks every ε-edge of the
+        machine once"""
+        return set(epsilonClosures(self, reachable=False)[id(self)])
 
     def delState(self, state: 'State'):
+        self.edits += 1
         for transition in self.transitions:
             if state in self.transitions[transition]:
                 self.transitions[transition].remove(state)
 
     def addToken(self, token: str):
         self.token.add(token)
+        self.edits += 1
 
     def getToken(self) -> str or None:
         return str(list(self.token)[0]) if len(self.token) > 0 else None
@@ -146,6 +151,85 @@ class State:
         return self.numTrans
 
 
+def epsilonClosures(initState: State, reachable: bool = True) -> Dict[int, FrozenSet[State]]:
+    """Table id(state) -> ε-closure (the state included) of every state reachable from initState, or only of
+    initState if not reachable. A walk that meets a state whose closure is known takes the whole closure and does not
+    go through its ε-edges again, so the machine is walked once and no step has to follow ε-edges afterwards"""
+    epsilon = ord('ε')
+    states: List[State] = [initState]
+    if reachable:
+        seen: Set[int] = {id(initState)}
+        for state in states:
+            for targets in state.transitions.values():
+                for target in targets:
+                    if id(target) not in seen:
+                        seen.add(id(target))
+                        states.append(target)
+
+    closures: Dict[int, FrozenSet[State]] = {}
+    for state in states:
+        closure: Set[State] = {state}
+        pending: List[State] = [state]
+        while pending:
+            top = pending.pop()
+            if top is not state and id(top) in closures:
+                closure.update(closures[id(top)])
+                continue
+            for target in top.transitions.get(epsilon, ()):
+                if target not in closure:
+                    closure.add(target)
+                    pending.append(target)
+        closures[id(state)] = frozenset(closure)
+    return closures
+
+
+class CharClasses:
+    """Partition of the alphabet into classes of characters that no character set distinguishes. The sets are cut
+    only at the ends of their intervals, so the work depends on the number of intervals and not of characters"""
+
+    def __init__(self, charSets: List[IntervalSet]) -> None:
+        cuts: Set[int] = set()
+        for charSet in charSets:
+            for low, high in charSet.intervals:
+                cuts.add(low)
+                cuts.add(high + 1)
+        # Piece i covers the characters from starts[i] up to starts[i + 1] - 1
+        self.starts: List[int] = sorted(cuts)
+
+        signatures: List[List[int]] = [[] for _ in self.starts]
+        for number, charSet in enumerate(charSets):
+            for low, high in charSet.intervals:
+                for piece in range(bisect_left(self.starts, low), bisect_left(self.starts, high + 1)):
+                    signatures[piece].append(number)
+
+        self.pieceClass: List[int] = []
+        pieces: List[List[Tuple[int, int]]] = []
+        bySignature: Dict[Tuple[int, ...], int] = {}
+        for piece, signature in enumerate(map(tuple, signatures)):
+            if len(signature) == 0:
+                self.pieceClass.append(-1)
+                continue
+            if signature not in bySignature:
+                bySignature[signature] = len(pieces)
+                pieces.append([])
+            pieces[bySignature[signature]].append((self.starts[piece], self.starts[piece + 1] - 1))
+            self.pieceClass.append(bySignature[signature])
+        self.classes: List[IntervalSet] = [IntervalSet(intervals) for intervals in pieces]
+
+    def classOf(self, char: int) -> int:
+        piece = bisect_right(self.starts, char) - 1
+        return self.pieceClass[piece] if piece >= 0 else -1
+
+    def classesOf(self, charSet: IntervalSet) -> FrozenSet[int]:
+        result: Set[int] = set()
+        for low, high in charSet.intervals:
+            result.update(self.pieceClass[bisect_left(self.starts, low):bisect_left(self.starts, high + 1)])
+        return frozenset(result)
+
+    def __len__(self):
+        return len(self.classes)
+
+
 class Grammar_Element:
     def __init__(self, value: str, terminal: bool = False, epsilon: bool = False) -> None:
         self.value: str = value
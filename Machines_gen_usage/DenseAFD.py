@@ -0,0 +1,307 @@
+from array import array
+from typing import *
+import json
+import struct
+import sys
+from Machines_gen_usage.Classes_ import State, epsilonClosures
+from Machines_gen_usage.CharsSet import IntervalSet, MAX_CHAR, splitNarrow
+
+# magic, format version, byte order, numStates, numClasses, start, len(blocks), len(leaves), len(tokens json).
+# The json has the tokens and the keyword tables
+HEADER = struct.Struct('<4sHBxiiiiii')
+MAGIC = b'YLXD'
+FORMAT_VERSION = 3
+BYTE_ORDER = {'little': 0, 'big': 1}
+
+# The class map is split in blocks of 2 ** BLOCK_BITS characters
+BLOCK_BITS = 8
+BLOCK_SIZE = 1 << BLOCK_BITS
+NUM_BLOCKS = (MAX_CHAR >> BLOCK_BITS) + 1
+
+
+def classColumn(blocks: array, leaves: array, char: int) -> int:
+    """Column of the character in a map of buildClassMap, -1 if it has none"""
+    if char < 0 or char > MAX_CHAR:
+        return -1
+    return leaves[blocks[char >> BLOCK_BITS] + (char & BLOCK_SIZE - 1)]
+
+
+def buildClassMap(columns: Iterable[Tuple[IntervalSet, int]]) -> Tuple[array, array]:
+    """Two level map of every code point to its column (-1 if none): leaves[blocks[char >> BLOCK_BITS] +
+    (char & BLOCK_SIZE - 1)]. Blocks with the same columns share their leaf, so the map of all of Unicode is a few
+    leaves long, and the sets are only read by their intervals"""
+    runs = sorted((low, high, column) for charSet, column in columns for low, high in charSet.intervals)
+    blocks = array('i', [0]) * NUM_BLOCKS
+    leaves = array('i')
+    leafOf: Dict[bytes, int] = {}
+    uniform: Dict[int, int] = {}
+
+    def offset(leaf: array) -> int:
+        key = leaf.tobytes()
+        if key not in leafOf:
+            leafOf[key] = len(leaves)
+            leaves.extend(leaf)
+        return leafOf[key]
+
+    def fill(start: int, end: int, column: int) -> None:
+        """Blocks start to end - 1 all in the column"""
+        if column not in uniform:
+            uniform[column] = offset(array('i', [column]) * BLOCK_SIZE)
+        blocks[start:end] = array('i', [uniform[column]]) * (end - start)
+
+    index = 0
+    block = 0
+    while block < NUM_BLOCKS:
+        first = block << BLOCK_BITS
+        last = first + BLOCK_SIZE - 1
+        # The runs are disjoint, so sorted by their start they are also sorted by their end
+        while index < len(runs) and runs[index][1] < first:
+            index += 1
+        # Whole blocks before the next run or inside it are filled at once
+        if index == len(runs) or runs[index][0] > last:
+            end = NUM_BLOCKS if index == len(runs) else runs[index][0] >> BLOCK_BITS
+            fill(block, end, -1)
+            block = end
+            continue
+        if runs[index][0] <= first and runs[index][1] >= last:
+            end = (runs[index][1] + 1) >> BLOCK_BITS
+            fill(block, end, runs[index][2])
+            block = end
+            continue
+
+        leaf = array('i', [-1]) * BLOCK_SIZE
+        cursor = index
+        while cursor < len(runs) and runs[cursor][0] <= last:
+            low, high, column = runs[cursor]
+            start, end = max(low, first) - first, min(high, last) - first + 1
+            leaf[start:end] = array('i', [column]) * (end - start)
+            cursor += 1
+        blocks[block] = offset(leaf)
+        block += 1
+    return blocks, leaves
+
+
+class DenseAFD:
+    """Frozen deterministic machine stored as a flat [state, class] transition table, where the two level class
+    map (blocks, leaves) sends every character to its class of equivalent characters (-1 if no transition uses it)"""
+
+    def __init__(self, blocks: array, leaves: array, numClasses: int, table: array, accept: array,
+                 tokens: List[str or None], start: int = 0,
+                 keywords: Dict[int, Dict[str, int]] or None = None) -> None:
+        self.numStates: int = len(accept)
+        self.numClasses: int = numClasses
+        self.blocks: array = blocks
+        self.leaves: array = leaves
+        self.table: array = table
+        self.accept: array = accept
+        self.tokens: List[str or None] = tokens
+        self.start: int = start
+        # Token index of a lexeme -> {keyword lexeme: token index it takes instead}
+        self.keywords: Dict[int, Dict[str, int]] = keywords if keywords is not None else {}
+
+    def classOf(self, char: int) -> int:
+        return classColumn(self.blocks, self.leaves, char)
+
+    def classIntervals(self) -> List[IntervalSet]:
+        """Characters of every class"""
+        intervals: List[List[Tuple[int, int]]] = [[] for _ in range(self.numClasses)]
+        uniform: Dict[int, int] = {}
+        for block, leaf in enumerate(self.blocks):
+            if leaf not in uniform:
+                columns = set(self.leaves[leaf:leaf + BLOCK_SIZE])
+                uniform[leaf] = columns.pop() if len(columns) == 1 else None
+            first = block << BLOCK_BITS
+            if uniform[leaf] is not None:
+                if uniform[leaf] >= 0:
+                    intervals[uniform[leaf]].append((first, first + BLOCK_SIZE - 1))
+                continue
+            for char in range(BLOCK_SIZE):
+                column = self.leaves[leaf + char]
+                if column >= 0:
+                    intervals[column].append((first + char, first + char))
+        return [IntervalSet(charSet) for charSet in intervals]
+
+    def step(self, state: int, char: int) -> int:
+        column = self.classOf(char)
+        return self.table[state * self.numClasses + column] if column >= 0 else -1
+
+    def run(self, codes: Iterable[int]) -> int:
+        """Token index of the state reached after reading all the codes, -1 if it is not final or none is reached"""
+        state = self.start
+        for code in codes:
+            state = self.step(state, code)
+            if state < 0:
+                return -1
+        return self.accept[state]
+
+    def isFinal(self, state: int) -> bool:
+        return self.accept[state] >= 0
+
+    def getToken(self, state: int) -> str or None:
+        return self.tokens[self.accept[state]] if self.accept[state] >= 0 else None
+
+    def toBytes(self) -> bytes:
+        """Versioned binary form of the machine: a header, the blocks and leaves of the class map, the table, the
+        accept vector and the tokens as json, the arrays stored in the native byte order written in the header"""
+        content = {'tokens': self.tokens, 'keywords': [[token, table] for token, table in self.keywords.items()]}
+        tokens = json.dumps(content, ensure_ascii=False).encode('utf-8')
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, BYTE_ORDER[sys.byteorder], self.numStates, self.numClasses,
+                             self.start, len(self.blocks), len(self.leaves), len(tokens))
+        return (header + self.blocks.tobytes() + self.leaves.tobytes() + self.table.tobytes() +
+                self.accept.tobytes() + tokens)
+
+    @staticmethod
+    def fromBytes(data: bytes or memoryview) -> 'DenseAFD':
+        data = memoryview(data)
+        if len(data) < HEADER.size:
+            raise ValueError('Not a machine file: too short')
+        magic, version, byteOrder, numStates, numClasses, start, numBlocks, leavesSize, tokensSize = \
+            HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError('Not a machine file: bad magic number')
+        # The cache key has the compiler version, so a file of another format is rebuilt rather than converted
+        if version != FORMAT_VERSION:
+            raise ValueError(f'Unsupported machine format version {version}')
+        sizes, offset = (numBlocks, leavesSize, numStates * numClasses, numStates), HEADER.size
+
+        arrays: List[array] = []
+        for size in sizes:
+            values = array('i')
+            values.frombytes(data[offset:offset + size * values.itemsize])
+            if byteOrder != BYTE_ORDER[sys.byteorder]:
+                values.byteswap()
+            arrays.append(values)
+            offset += size * values.itemsize
+        if offset + tokensSize != len(data):
+            raise ValueError('Not a machine file: truncated or corrupted')
+        content = json.loads(bytes(data[offset:]).decode('utf-8'))
+        keywords = {token: table for token, table in content['keywords']}
+
+        blocks, leaves, table, accept = arrays
+        if len(blocks) != NUM_BLOCKS:
+            raise ValueError('Not a machine file: bad class map')
+        return DenseAFD(blocks, leaves, numClasses, table, accept, content['tokens'], start, keywords)
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as file:
+            file.write(self.toBytes())
+
+    @staticmethod
+    def load(path: str) -> 'DenseAFD':
+        with open(path, 'rb') as file:
+            return DenseAFD.fromBytes(file.read())
+
+
+def freezeAFD(initState: State, visited: List[State] or None = None) -> DenseAFD:
+    """Determinizes the machine reachable from initState into a dense transition table"""
+    epsilon = ord('ε')
+    closures: Dict[int, FrozenSet[State]] = epsilonClosures(initState)
+    if visited is not None:
+        visited.extend({id(st): st for closure in closures.values() for st in closure}.values())
+
+    def moves(subset: Tuple[State, ...]) -> Dict[int or IntervalSet, Dict[int, State]]:
+        result: Dict[int or IntervalSet, Dict[int, State]] = {}
+        for state in subset:
+            for st in closures[id(state)]:
+                for symbol, targets in st.transitions.items():
+                    if symbol == epsilon:
+                        continue
+                    for target in targets:
+                        result.setdefault(symbol, {})[id(target)] = target
+        return result
+
+    subsets: Dict[FrozenSet[int], int] = {frozenset([id(initState)]): 0}
+    order: List[Tuple[State, ...]] = [(initState,)]
+    rows: List[Dict[int or IntervalSet, int]] = []
+    symbols: Set[int or IntervalSet] = set()
+
+    index = 0
+    while index < len(order):
+        row: Dict[int or IntervalSet, int] = {}
+        for symbol, targets in moves(order[index]).items():
+            key = frozenset(targets)
+            if key not in subsets:
+                subsets[key] = len(order)
+                order.append(tuple(targets.values()))
+            row[symbol] = subsets[key]
+            symbols.add(symbol)
+        rows.append(row)
+        index += 1
+
+    # Same priority as the path based simulation: the final state with the lowest name wins
+    tokens: List[str or None] = []
+    tokenIndex: Dict[str or None, int] = {}
+    accept = array('i', [-1]) * len(order)
+    for number, subset in enumerate(order):
+        finals = [st for st in subset if st.isFinalState]
+        if len(finals) == 0:
+            continue
+        token = min(finals, key=lambda st: st.value).getToken()
+        if token not in tokenIndex:
+            tokenIndex[token] = len(tokens)
+            tokens.append(token)
+        accept[number] = tokenIndex[token]
+
+    # Characters that every state sends to the same place share a column of the table. The ranges of a machine
+    # come from one partition of the characters, so they never overlap each other or a single character
+    columns: Dict[Tuple[int, ...], int] = {}
+    columnSets: List[Tuple[IntervalSet, int]] = []
+    for symbol in sorted(symbols, key=lambda sym: sym.intervals[0][0] if isinstance(sym, IntervalSet) else sym):
+        signature = tuple(row.get(symbol, -1) for row in rows)
+        if signature not in columns:
+            columns[signature] = len(columns)
+        charSet = symbol if isinstance(symbol, IntervalSet) else IntervalSet.of(symbol)
+        columnSets.append((charSet, columns[signature]))
+    blocks, leaves = buildClassMap(columnSets)
+
+    table = array('i', [-1]) * (len(order) * len(columns))
+    for signature, column in columns.items():
+        for number, target in enumerate(signature):
+            table[number * len(columns) + column] = target
+
+    keywords: Dict[int, Dict[str, int]] = {}
+    for token, lexemes in initState.keywords.items():
+        if token not in tokenIndex:
+            continue
+        for lexeme, keyword in lexemes.items():
+            if keyword not in tokenIndex:
+                tokenIndex[keyword] = len(tokens)
+                tokens.append(keyword)
+            keywords.setdefault(tokenIndex[token], {})[lexeme] = tokenIndex[keyword]
+
+    return DenseAFD(blocks, leaves, len(columns), table, accept, tokens, keywords=keywords)
+
+
+def thawAFD(machine: DenseAFD, id_: str = 'q') -> State:
+    """Rebuilds the states of a frozen machine, named id_ + number, and returns the initial one"""
+    states: List[State] = [State(id_ + str(number)) for number in range(machine.numStates)]
+    split = [splitNarrow(charSet) for charSet in machine.classIntervals()]
+    for number, state in enumerate(states):
+        for column, (narrow, wide) in enumerate(split):
+            target = machine.table[number * machine.numClasses + column]
+            if target < 0:
+                continue
+            for symbol in narrow:
+                state.add_transition(symbol, states[target])
+            if wide:
+                state.add_transition(wide, states[target])
+        if machine.isFinal(number):
+            state.isFinalState = True
+            state.addToken(machine.getToken(number))
+    states[machine.start].keywords = {machine.tokens[token]: {lexeme: machine.tokens[keyword]
+                                                              for lexeme, keyword in table.items()}
+                                      for token, table in machine.keywords.items()}
+    return states[machine.start]
+
+
+def getDense(initState: State) -> DenseAFD:
+    """Returns the frozen form of the machine, freezing it again only if one of its states was edited since"""
+    if initState.frozen is not None:
+        edits, visited, dense = initState.frozen
+        if edits == sum(st.edits for st in visited):
+            return dense
+
+    visited: List[State] = []
+    dense = freezeAFD(initState, visited)
+    initState.frozen = (sum(st.edits for st in visited), tuple(visited), dense)
+    return dense
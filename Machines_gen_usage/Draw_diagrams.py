@@ -1,49 +1,81 @@
 from Machines_gen_usage.Classes_ import *
+from Machines_gen_usage.DenseAFD import DenseAFD
 import graphviz
 
 
 def draw_tree(f_node: Node, expression='default', direct=False, useNum=False):
     dot = graphviz.Digraph(comment='Tree')
 
-    def draw_node(node: Node):
-        nonlocal useNum
-        label = str(node.value) if isinstance(node.value, str) or useNum else chr(node.value)
+    pending: List[Node] = [f_node]
+    while pending:
+        node = pending.pop()
+        if isinstance(node.value, frozenset):
+            label = '{' + ', '.join(str(i) for i in sorted(node.value)) + '}'
+        else:
+            label = str(node.value) if isinstance(node.value, str) or useNum else chr(node.value)
         dot.node(node.getId(), label=label)
-        if node.left is not None:
-            dot.edge(node.getId(), node.left.getId())
-            draw_node(node.left)
-        if node.right is not None:
-            dot.edge(node.getId(), node.right.getId())
-            draw_node(node.right)
-
-    draw_node(f_node)
+        for child in (node.right, node.left):
+            if child is not None:
+                dot.edge(node.getId(), child.getId())
+                pending.append(child)
 
     dot.render('Tree.gv', view=True, directory='./Tree/' + expression + '/' + ('Direct' if direct else 'Infix'))
 
 
-def draw_AF(initState: State, legend: str = 'AF', expression='default', direct=False, name='AFN', useNum=False):
+def draw_AF(initState: State or DenseAFD, legend: str = 'AF', expression='default', direct=False, name='AFN',
+            useNum=False):
     dot: 'graphviz.graphs.Digraph' = graphviz.Digraph(comment='AFN')
     dot.attr(rankdir='LR')
     setStates = set()
 
     dot.attr(label=legend)
 
-    def draw_state(state: 'State'):
-        nonlocal useNum
-        setStates.add(state.getId())
+    if isinstance(initState, DenseAFD):
+        draw_dense(dot, initState, useNum)
+        dot.render(name + '.gv', view=True, directory='./machine/' + expression)
+        return
+
+    pending: List[State] = [initState]
+    setStates.add(initState.getId())
+    while pending:
+        state = pending.pop()
         dot.node(state.getId(), label=state.value, shape='doublecircle' if state.isFinalState else 'circle')
         for transition in state.transitions:
             for destiny in state.transitions[transition]:
                 if destiny.getId() not in setStates:
-                    draw_state(destiny)
-                label = str(transition) if isinstance(transition, str) or useNum else chr(transition)
+                    setStates.add(destiny.getId())
+                    pending.append(destiny)
+                if isinstance(transition, IntervalSet):
+                    label = rangeLabel(transition, useNum)
+                else:
+                    label = str(transition) if isinstance(transition, str) or useNum else chr(transition)
                 dot.edge(state.getId(), destiny.getId(), label=label)
 
-    draw_state(initState)
-
     dot.render(name + '.gv', view=True, directory='./machine/' + expression)
 
 
+def rangeLabel(charSet: IntervalSet, useNum=False) -> str:
+    def char(code: int) -> str:
+        return str(code) if useNum else chr(code)
+    return ', '.join(char(low) if low == high else f'{char(low)}-{char(high)}' for low, high in charSet.intervals)
+
+
+def draw_dense(dot: 'graphviz.graphs.Digraph', machine: DenseAFD, useNum=False):
+    chars: List[IntervalSet] = machine.classIntervals()
+
+    for state in range(machine.numStates):
+        token = machine.getToken(state)
+        dot.node(str(state), label=str(state) if token is None else f'{state}\n{token}',
+                 shape='doublecircle' if machine.isFinal(state) else 'circle')
+        edges: Dict[int, IntervalSet] = {}
+        for column, columnChars in enumerate(chars):
+            target = machine.table[state * machine.numClasses + column]
+            if target >= 0:
+                edges[target] = edges.get(target, IntervalSet()).union(columnChars)
+        for target, edgeChars in edges.items():
+            dot.edge(str(state), str(target), label=rangeLabel(edgeChars, useNum))
+
+
 def draw_LR0(initState: LRO_S, legend: str = 'AF', expression='default', useNum=False):
     dot: 'graphviz.graphs.Digraph' = graphviz.Digraph(comment='LR0')
     dot.attr(rankdir='LR')
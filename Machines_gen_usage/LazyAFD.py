@@ -0,0 +1,96 @@
+from array import array
+from typing import *
+from Machines_gen_usage.Classes_ import CharClasses
+from Machines_gen_usage.Tree_ import make_direct_tree, markedExpression, positions
+from Machines_gen_usage.DenseAFD import buildClassMap, classColumn
+
+
+class LazyAFD:
+    """Deterministic machine built while it is used: a state is the set of positions of the tree of all the rules,
+    and its transitions are computed the first time the simulation takes them. At most maxStates states are kept,
+    when the table is full it is emptied and the states are computed again as they are visited"""
+
+    def __init__(self, postfixes: List[List[Any]], tokens: List[str], classes: CharClasses,
+                 maxStates: int = 4096) -> None:
+        tree, nodes, _ = make_direct_tree(markedExpression(postfixes))
+
+        self.tokens: List[str] = tokens
+        self.keywords: Dict[int, Dict[str, int]] = {}
+        self.maxStates: int = maxStates
+        self.numClasses: int = len(classes)
+        self.follow: Dict[int, int] = {pos: node.follow_pos for pos, node in nodes.items()}
+        self.startMask: int = tree.first_pos
+
+        self.ruleOf: Dict[int, int] = {}
+        self.byClass: List[int] = [0] * self.numClasses
+        for pos, node in nodes.items():
+            if isinstance(node.value, frozenset):
+                for classId in node.value:
+                    self.byClass[classId] |= 1 << pos
+            elif isinstance(node.value, str) and node.value.startswith('#') and len(node.value) > 1:
+                self.ruleOf[pos] = int(node.value[1:])
+        self.markers: int = sum(1 << pos for pos in self.ruleOf)
+
+        self.blocks, self.leaves = buildClassMap((charSet, classId) for classId, charSet in enumerate(classes.classes))
+
+        self.ids: Dict[int, int] = {}
+        self.masks: List[int] = []
+        self.rows: List[array] = []
+        self.accept: List[int] = []
+        self.flushes: int = 0
+        self.computed: int = 0
+        self.start: int = 0
+        self.intern(self.startMask)
+
+    def flush(self) -> None:
+        """Forgets every state but the initial one. The lists are emptied in place, so the simulation can keep
+        references to them"""
+        self.ids.clear()
+        self.masks.clear()
+        self.rows.clear()
+        self.accept.clear()
+        self.flushes += 1
+        self.intern(self.startMask)
+
+    def intern(self, mask: int) -> int:
+        if mask not in self.ids:
+            if len(self.masks) >= self.maxStates:
+                self.flush()
+            self.ids[mask] = len(self.masks)
+            self.masks.append(mask)
+            self.rows.append(array('i', [-2]) * self.numClasses)
+            ends = mask & self.markers
+            self.accept.append(min(self.ruleOf[pos] for pos in positions(ends)) if ends else -1)
+        return self.ids[mask]
+
+    def step(self, state: int, char: int) -> int:
+        column = classColumn(self.blocks, self.leaves, char)
+        if column < 0:
+            return -1
+        target = self.rows[state][column]
+        if target != -2:
+            return target
+
+        self.computed += 1
+        mask = 0
+        for pos in positions(self.masks[state] & self.byClass[column]):
+            mask |= self.follow[pos]
+        if mask == 0:
+            self.rows[state][column] = -1
+            return -1
+        # Interning may empty the table, then the old row is gone and the new state is all that is kept
+        flushes = self.flushes
+        target = self.intern(mask)
+        if self.flushes == flushes:
+            self.rows[state][column] = target
+        return target
+
+    def isFinal(self, state: int) -> bool:
+        return self.accept[state] >= 0
+
+    def getToken(self, state: int) -> str or None:
+        return self.tokens[self.accept[state]] if self.accept[state] >= 0 else None
+
+    def stats(self) -> Dict[str, int]:
+        return {'states': len(self.masks), 'maxStates': self.maxStates, 'computed': self.computed,
+                'flushes': self.flushes}
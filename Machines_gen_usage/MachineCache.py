@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+import threading
+from typing import *
+
+DEFAULT_DIRECTORY = os.environ.get('MACHINE_CACHE_DIR', './machines/cache/')
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def specKey(regex: Dict[str, List[str]], version: str) -> str:
+    """Hash of the rules in priority order together with the version of the compiler that builds them"""
+    normalized = [[str(token), [str(rg) for rg in rgs]] for token, rgs in regex.items()]
+    content = json.dumps([version, normalized], ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+class MachineCache:
+    """Directory of compiled machines addressed by the hash of their specification. The index keeps the size and
+    last use of every entry, and the least recently used entries are removed once the total size passes maxBytes"""
+
+    def __init__(self, directory: str = DEFAULT_DIRECTORY, maxBytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory: str = directory
+        self.maxBytes: int = maxBytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.lock = threading.Lock()
+
+    def indexPath(self) -> str:
+        return os.path.join(self.directory, 'index.json')
+
+    def entryPath(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.dfa')
+
+    def readIndex(self) -> Dict[str, Any]:
+        try:
+            with open(self.indexPath(), 'r', encoding='utf-8') as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            index = {}
+        index.setdefault('tick', 0)
+        index.setdefault('entries', {})
+        return index
+
+    def writeIndex(self, index: Dict[str, Any]) -> None:
+        temporal = self.indexPath() + f'.{os.getpid()}.tmp'
+        with open(temporal, 'w', encoding='utf-8') as file:
+            json.dump(index, file, indent=1)
+        os.replace(temporal, self.indexPath())
+
+    def get(self, key: str) -> str or None:
+        """Returns the path of the entry and marks it as used, or None if it is not cached"""
+        with self.lock:
+            index = self.readIndex()
+            entry = index['entries'].get(key)
+            if entry is None or not os.path.isfile(self.entryPath(key)):
+                self.misses += 1
+                if entry is not None:
+                    del index['entries'][key]
+                    self.writeIndex(index)
+                return None
+            self.hits += 1
+            index['tick'] += 1
+            entry['used'] = index['tick']
+            entry['hits'] = entry.get('hits', 0) + 1
+            self.writeIndex(index)
+            return self.entryPath(key)
+
+    def put(self, key: str, data: bytes, label: str = '') -> str:
+        """Stores a serialized machine and evicts the least recently used entries that do not fit anymore"""
+        with self.lock:
+            os.makedirs(self.directory, exist_ok=True)
+            temporal = self.entryPath(key) + f'.{os.getpid()}.tmp'
+            with open(temporal, 'wb') as file:
+                file.write(data)
+            os.replace(temporal, self.entryPath(key))
+
+            index = self.readIndex()
+            index['tick'] += 1
+            index['entries'][key] = {'label': label, 'size': os.path.getsize(self.entryPath(key)),
+                                     'used': index['tick'], 'hits': 0}
+
+            total = sum(entry['size'] for entry in index['entries'].values())
+            for old in sorted(index['entries'], key=lambda k: index['entries'][k]['used']):
+                if total <= self.maxBytes or old == key:
+                    break
+                total -= index['entries'].pop(old)['size']
+                if os.path.isfile(self.entryPath(old)):
+                    os.remove(self.entryPath(old))
+                self.evictions += 1
+
+            self.writeIndex(index)
+            return self.entryPath(key)
+
+    def clear(self) -> None:
+        with self.lock:
+            for key in self.readIndex()['entries']:
+                if os.path.isfile(self.entryPath(key)):
+                    os.remove(self.entryPath(key))
+            if os.path.isfile(self.indexPath()):
+                os.remove(self.indexPath())
+
+    def stats(self) -> Dict[str, int]:
+        entries = self.readIndex()['entries']
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'bytes': sum(entry['size'] for entry in entries.values()),
+            'maxBytes': self.maxBytes,
+        }
+
+
+caches: Dict[str, MachineCache] = {}
+
+
+def getCache(directory: str or None = None) -> MachineCache:
+    """Returns the shared cache of a directory, so every caller of the same directory counts in the same stats"""
+    directory = os.path.normpath(directory if directory is not None else DEFAULT_DIRECTORY)
+    if directory not in caches:
+        caches[directory] = MachineCache(directory)
+    return caches[directory]
+
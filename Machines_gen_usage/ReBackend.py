@@ -0,0 +1,199 @@
+import re
+from typing import *
+from Machines_gen_usage.Classes_ import Node
+from Machines_gen_usage.CharsSet import IntervalSet
+from Machines_gen_usage.Tree_ import repeatBounds, make_direct_tree, positions
+from Machines_gen_usage.RegexParser import parseRegex, toPostfix, simplify, factorLiterals, isEpsilon
+from Machines_gen_usage.Simulator import exclusiveSim
+from Machines_gen_usage.prepareAFD import prepareAFN, prepareLazy, ruleList
+from Machines_gen_usage.LazyAFD import LazyAFD
+
+# Characters that mean something in a pattern, and inside a [...] set
+SPECIAL = '\\.^$*+?{}[]|()'
+SET_SPECIAL = '\\]^-['
+
+
+def reChar(code: int, inSet: bool = False) -> str:
+    """A character escaped for a pattern, or for a [...] set if inSet"""
+    char = chr(code)
+    if char.isalnum() or (char.isprintable() and char != ' ' and char not in (SET_SPECIAL if inSet else SPECIAL)):
+        return char
+    if code < 0x100:
+        return f'\\x{code:02x}'
+    return f'\\u{code:04x}' if code < 0x10000 else f'\\U{code:08x}'
+
+
+def reSet(charSet: IntervalSet) -> str:
+    if not charSet:
+        # Matches nothing
+        return '(?!)'
+    parts = [reChar(low, True) if low == high else f'{reChar(low, True)}-{reChar(high, True)}'
+             for low, high in charSet.intervals]
+    return '[' + ''.join(parts) + ']'
+
+
+def toRe(tree: Node or None) -> str:
+    """Python re syntax of the syntax tree. An alternative that matches the empty string goes after the others, as
+    re stops at the first alternative that matches (see firstMatchConflict)"""
+    if tree is None:
+        return ''
+    # Every node gives (pattern, whether it is a single atom that takes a quantifier as it is, whether it is nullable)
+    done: Dict[int, Tuple[str, bool, bool]] = {}
+    pending: List[Tuple[Node, bool]] = [(tree, False)]
+    while pending:
+        node, expanded = pending.pop()
+        if id(node) in done:
+            continue
+        if node.left is None:
+            if isEpsilon(node):
+                done[id(node)] = ('', False, True)
+            elif isinstance(node.value, IntervalSet):
+                done[id(node)] = (reSet(node.value), True, False)
+            else:
+                done[id(node)] = (reChar(node.value), True, False)
+            continue
+        if not expanded:
+            pending.append((node, True))
+            pending += [(child, False) for child in (node.right, node.left) if child is not None]
+            continue
+
+        left, atom, nullable = done[id(node.left)]
+        if node.value == '.':
+            right = done[id(node.right)]
+            done[id(node)] = (left + right[0], False, nullable and right[2])
+        elif node.value == '|':
+            right = done[id(node.right)]
+            first, second = (right[0], left) if nullable and not right[2] else (left, right[0])
+            done[id(node)] = (f'(?:{first}|{second})', True, nullable or right[2])
+        else:
+            operand = left if atom else f'(?:{left})'
+            bounds = repeatBounds(node.value)
+            if bounds is not None:
+                low, high = bounds
+                done[id(node)] = (operand + '{' + str(low) + ',' + ('' if high is None else str(high)) + '}', False,
+                                  low == 0 or nullable)
+            else:
+                done[id(node)] = (operand + node.value, False, node.value != '+' or nullable)
+    return done[id(tree)][0]
+
+
+def firstMatchConflict(tree: Node or None) -> str or None:
+    """Why re could take a match of the rule that is not its longest one, None if it cannot. re tries the
+    alternatives in order and the repeats greedily, so its first match is the longest when the rule is
+    deterministic (the next character tells which position reads it, so taking a character never has to be undone)
+    and no alternation has two alternatives that match the empty string (toRe puts the one there is last)"""
+    if tree is None:
+        return None
+    root, nodes, _ = make_direct_tree(toPostfix(tree))
+    epsilon = ord('ε')
+
+    pending: List[Node] = [root]
+    while pending:
+        node = pending.pop()
+        if node.value == '|' and node.left.is_nullable and node.right.is_nullable:
+            return 'two alternatives match the empty string'
+        pending += [child for child in (node.left, node.right) if child is not None]
+
+    for follow in {root.first_pos, *(node.follow_pos for node in nodes.values())}:
+        seen = IntervalSet()
+        for pos in positions(follow):
+            value = nodes[pos].value
+            if isinstance(value, IntervalSet):
+                charSet = value
+            elif isinstance(value, int) and value != epsilon:
+                charSet = IntervalSet.of(value)
+            else:
+                continue
+            joined = seen.union(charSet)
+            if len(joined) < len(seen) + len(charSet):
+                shared = next(iter(seen.difference(seen.difference(charSet))))
+                return f'{chr(shared)!r} can be read by two parts of it'
+            seen = joined
+    return None
+
+
+class ReLexer:
+    """Lexer that runs the rules on the re engine. The pattern tries every rule at the same place inside a
+    lookahead, so each rule leaves its match in its own group and the longest one (the first rule on ties) is the
+    lexeme, as in exclusiveSim. A rule whose first match in re can be shorter than its longest match raises
+    ValueError (see firstMatchConflict). Where no rule matches, the error takes the same text as in exclusiveSim
+    (see errorEnd)"""
+
+    def __init__(self, expressions: Dict[str, List[str]]) -> None:
+        rules = ruleList(expressions)
+        self.tokens: List[str] = [token for token, _ in rules]
+        self.expressions: Dict[str, List[str]] = expressions
+        # Only walked to recover from errors, so it is built on the first one
+        self.machine: LazyAFD or None = None
+        self.patterns: List[str] = []
+        for number, (token, rg) in enumerate(rules):
+            # The literal alternatives share their prefixes, so if|ifelse does not stop re after if
+            tree = factorLiterals(simplify(parseRegex(rg)))
+            conflict = firstMatchConflict(tree)
+            if conflict is not None:
+                raise ValueError(f"Rule {number} {token!r} /{rg}/ can not run on re, its first match is not always "
+                                 f"the longest: {conflict}")
+            self.patterns.append(toRe(tree))
+        self.pattern: 're.Pattern' = re.compile(''.join(f'(?=({pattern}))?' for pattern in self.patterns), re.DOTALL)
+
+    def errorEnd(self, string: str, index: int) -> int:
+        """End of the error that starts at index. The machine walks the text until no lexeme can go on and reports
+        what it walked and the character it failed on as one error"""
+        if self.machine is None:
+            self.machine = prepareLazy(self.expressions)
+        machine = self.machine
+        state = machine.start
+        while index < len(string):
+            state = machine.step(state, ord(string[index]))
+            if state < 0:
+                break
+            index += 1
+        return index + 1
+
+    def tokenize(self, string: str) -> List[Tuple[str, str or int]]:
+        string += ' '
+        listTextTuple: List[Tuple[str, str or int]] = []
+        match = self.pattern.match
+        tokens = self.tokens
+        index = 0
+        while index < len(string):
+            spans = match(string, index).regs
+            end, rule = index, -1
+            for number in range(1, len(spans)):
+                if spans[number][1] > end:
+                    end, rule = spans[number][1], number - 1
+            if rule < 0:
+                end = self.errorEnd(string, index)
+                text = string[index:end]
+                listTextTuple.append((text, 0 if text == ' ' or text == '\n' else 1))
+                index = end
+                continue
+            listTextTuple.append((string[index:end], tokens[rule]))
+            index = end
+
+        if listTextTuple[-1][1] == 1:
+            text = listTextTuple[-1][0]
+            listTextTuple.pop()
+            listTextTuple.append((text[:-1], 1))
+            listTextTuple.append((' ', 0))
+        return listTextTuple
+
+
+def differentialCheck(expressions: Dict[str, List[str]], corpus: List[str], machine: Any = None,
+                      lexer: ReLexer or None = None) -> List[Tuple[int, int, Tuple[str, Any], Tuple[str, Any]]]:
+    """Lexes every text of the corpus with exclusiveSim and with the re backend. Returns the first difference of
+    every text that differs: its index, the index of the lexeme and the lexemes of the machine and of re"""
+    machine = machine if machine is not None else prepareAFN(expressions)
+    lexer = lexer if lexer is not None else ReLexer(expressions)
+    differences: List[Tuple[int, int, Tuple[str, Any], Tuple[str, Any]]] = []
+    for number, text in enumerate(corpus):
+        expected = exclusiveSim(machine, text)
+        result = lexer.tokenize(text)
+        if expected == result:
+            continue
+        position = next((i for i, (a, b) in enumerate(zip(expected, result)) if a != b),
+                        min(len(expected), len(result)))
+        missing = ('', None)
+        differences.append((number, position, expected[position] if position < len(expected) else missing,
+                            result[position] if position < len(result) else missing))
+    return differences
@@ -0,0 +1,436 @@
+import re
+from typing import *
+from Machines_gen_usage.Classes_ import Node
+from Machines_gen_usage.Tree_ import repeatToken, repeatBounds
+from Machines_gen_usage.CharsSet import IntervalSet, globalIntervals, evalSet
+
+# {m}, {m,} and {m,n} right after an atom are counted repeats, any other brace opens a group
+REPEAT = re.compile(r'\{(\d+)(,(\d*))?\}')
+
+
+class RegexParser:
+    """Parser of the yalex regular expressions. Builds the syntax tree in a single left to right pass, with '.' and
+    '|' nodes, '*', '+', '?' and {m,n} nodes over one operand and leaves holding a character code, an IntervalSet
+    or ε. The open groups are kept on an explicit stack, so any depth of nesting parses
+
+    alternation   := concatenation ('|' concatenation)*
+    concatenation := repetition*
+    repetition    := atom ('*' | '+' | '?' | '{' m [',' [n]] '}')*
+    atom          := '(' alternation ')' | '{' alternation '}' | set ('#' set)* | '_' | '\\' char | char
+    """
+
+    def __init__(self, regex: str) -> None:
+        self.regex: str = regex
+        self.index: int = 0
+
+    def peek(self) -> str:
+        return self.regex[self.index] if self.index < len(self.regex) else ''
+
+    def error(self, message: str) -> ValueError:
+        return ValueError(f'{message} at {self.index} in {self.regex!r}')
+
+    def parse(self) -> Node:
+        # Every open group has the alternation before its current alternative, the current alternative and the
+        # bracket that closes it. Empty alternatives are dropped, a||b is a|b
+        groups: List[List[Node or None or str]] = [[None, None, '']]
+
+        def alternation(group: List[Node or None or str]) -> Node or None:
+            before, current = group[0], group[1]
+            if before is None or current is None:
+                return current if before is None else before
+            return Node('|', before, current)
+
+        while True:
+            char = self.peek()
+            if char == '|':
+                self.index += 1
+                groups[-1][0], groups[-1][1] = alternation(groups[-1]), None
+                continue
+            if char in ('(', '{'):
+                self.index += 1
+                groups.append([None, None, ')' if char == '(' else '}'])
+                continue
+            if char in (')', '}', ''):
+                tree = alternation(groups[-1])
+                if len(groups) == 1:
+                    if char != '':
+                        raise self.error(f"Unbalanced '{char}'")
+                    # A regex with nothing in it, like () or '', matches the empty string
+                    return tree if tree is not None else Node(ord('ε'))
+                if char != groups[-1][2]:
+                    raise self.error(f"Expected '{groups[-1][2]}'")
+                self.index += 1
+                groups.pop()
+                atom = self.repetition(tree)
+            else:
+                atom = self.repetition(self.atom())
+            if atom is not None:
+                current = groups[-1][1]
+                groups[-1][1] = atom if current is None else Node('.', current, atom)
+
+    def repetition(self, atom: Node or None) -> Node or None:
+        """The operators that follow the atom, applied to it"""
+        while True:
+            if self.peek() in ('*', '+', '?'):
+                operator = self.peek()
+                length = 1
+            else:
+                bounds = REPEAT.match(self.regex, self.index) if atom is not None else None
+                if bounds is None:
+                    return atom
+                low = int(bounds.group(1))
+                high = low if bounds.group(2) is None else (int(bounds.group(3)) if bounds.group(3) else None)
+                if high is not None and high < low:
+                    raise self.error(f'Bad bounds in {bounds.group(0)}')
+                operator = repeatToken(low, high)
+                length = len(bounds.group(0))
+            if atom is None:
+                raise self.error(f"Nothing to repeat with '{operator}'")
+            self.index += length
+            atom = Node(operator, atom)
+
+    def atom(self) -> Node or None:
+        """An atom that is not a group"""
+        char = self.peek()
+        if char == '[':
+            charSet = self.charSet()
+            while self.peek() == '#' and self.regex[self.index + 1:self.index + 2] == '[':
+                self.index += 1
+                charSet = charSet.difference(self.charSet())
+            # An empty set ([a]#[a]) stays as a leaf that matches nothing, so a concatenation with it does too
+            return Node(charSet)
+        if char in ('*', '+', '?'):
+            raise self.error(f"Nothing to repeat with '{char}'")
+
+        self.index += 1
+        if char == '\\':
+            if self.index == len(self.regex):
+                return None
+            self.index += 1
+            return Node(ord(self.regex[self.index - 1]))
+        if char == '_':
+            return Node(globalIntervals())
+        if char == '#':
+            return None
+        return Node(ord(char))
+
+    def charSet(self) -> IntervalSet:
+        """Reads a [...] set, brackets inside it must be balanced"""
+        balance = 0
+        for end in range(self.index, len(self.regex)):
+            if self.regex[end] == '[':
+                balance += 1
+            elif self.regex[end] == ']':
+                balance -= 1
+                if balance == 0:
+                    break
+        else:
+            raise self.error("Unclosed '['")
+
+        content = self.regex[self.index + 1:end]
+        if content == '':
+            raise self.error('Empty set')
+        charSet, valid = evalSet(content)
+        if not valid:
+            raise self.error(f'Invalid set [{content}]')
+        self.index = end + 1
+        return charSet
+
+
+def parseRegex(regex: str) -> Node:
+    """Syntax tree of the regex, a single ε leaf if it only matches the empty string"""
+    return RegexParser(regex).parse()
+
+
+def toPostfix(tree: Node or None) -> List[str or int or IntervalSet]:
+    """Postfix form of the syntax tree as make_tree reads it. Shared subtrees are written once per use"""
+    postfix: List[str or int or IntervalSet] = []
+    pending: List[Tuple[Node, bool]] = [(tree, False)] if tree is not None else []
+    while pending:
+        node, expanded = pending.pop()
+        if expanded or node.left is None:
+            postfix.append(node.value)
+            continue
+        pending.append((node, True))
+        if node.right is not None:
+            pending.append((node.right, False))
+        pending.append((node.left, False))
+    return postfix
+
+
+def isEpsilon(node: Node) -> bool:
+    return node.left is None and node.value == ord('ε')
+
+
+def isEmptySet(node: Node) -> bool:
+    return node.left is None and isinstance(node.value, IntervalSet) and not node.value
+
+
+def isCharSet(node: Node) -> bool:
+    return node.left is None and (isinstance(node.value, IntervalSet) or
+                                  (isinstance(node.value, int) and node.value != ord('ε')))
+
+
+def simplify(tree: Node or None) -> Node or None:
+    """Rewrites the syntax tree into a smaller one with the same language: ε is dropped from concatenations and
+    repeats, nested repeats are folded ((x*)* is x*, (x+)? is x*, ...), {0,1}, {0,}, {1,} and {1,1} become ?, *, +
+    and x, and the alternatives of an alternation lose their duplicates, join their characters and sets in a single
+    set and turn an ε alternative into ?. An empty set matches nothing: it swallows the concatenations it is in,
+    drops out of alternations and makes x* or x? of it ε. Equal subtrees are numbered (hash consing) so duplicates
+    are found without comparing them again"""
+    if tree is None:
+        return None
+    numbers: Dict[Tuple[Any, int, int], int] = {}
+    done: Dict[int, Tuple[Node, int]] = {}
+
+    def make(value: Any, left: Node or None = None, right: Node or None = None) -> Tuple[Node, int]:
+        key = (value, number(left), number(right))
+        if key not in numbers:
+            numbers[key] = len(numbers)
+        node = Node(value, left, right)
+        done[id(node)] = (node, numbers[key])
+        return node, numbers[key]
+
+    def number(node: Node or None) -> int:
+        return -1 if node is None else done[id(node)][1]
+
+    def unary(operator: str, child: Node) -> Node:
+        if isEpsilon(child):
+            return child
+        bounds = repeatBounds(operator)
+        if isEmptySet(child):
+            # Zero copies of nothing is ε, any copy of it matches nothing
+            optional = operator in ('*', '?') or (bounds is not None and bounds[0] == 0)
+            return make(ord('ε'))[0] if optional else child
+        if bounds is not None:
+            operator = {(0, 1): '?', (0, None): '*', (1, None): '+'}.get(bounds, operator)
+            if bounds == (1, 1):
+                return child
+            if bounds == (0, 0):
+                return make(ord('ε'))[0]
+        if operator in ('*', '+', '?') and child.value in ('*', '+', '?') and child.left is not None:
+            operator = operator if operator == child.value else '*'
+            child = child.left
+        return make(operator, child)[0]
+
+    def branches(node: Node) -> List[Node]:
+        """The alternatives of a chain of alternations, left to right"""
+        alternatives: List[Node] = []
+        pending = [node]
+        while pending:
+            top = pending.pop()
+            if top.value == '|' and top.right is not None:
+                pending += [top.right, top.left]
+            else:
+                alternatives.append(top)
+        return alternatives
+
+    def alternation(sides: List[Node]) -> Node:
+        alternatives: List[Node] = [alternative for side in sides for alternative in branches(side)]
+
+        seen: Set[int] = set()
+        kept: List[Node] = []
+        charSet: IntervalSet or None = None
+        setIndex = 0
+        optional = False
+        for node in alternatives:
+            if number(node) in seen:
+                continue
+            seen.add(number(node))
+            if isEpsilon(node):
+                optional = True
+            elif isCharSet(node):
+                if charSet is None:
+                    setIndex = len(kept)
+                    charSet = IntervalSet()
+                charSet = charSet.union(node.value if isinstance(node.value, IntervalSet) else
+                                        IntervalSet.of(node.value))
+            else:
+                kept.append(node)
+        if charSet is not None and not charSet and (kept or optional):
+            # An empty set adds nothing to the other alternatives
+            charSet = None
+        if charSet is not None:
+            single = [node for node in alternatives if isCharSet(node)]
+            kept.insert(setIndex, single[0] if len(single) == 1 else make(charSet)[0])
+        if len(kept) == 0:
+            return make(ord('ε'))[0]
+
+        result = kept[0]
+        for node in kept[1:]:
+            result = make('|', result, node)[0]
+        return unary('?', result) if optional else result
+
+    pending: List[Tuple[Node, bool]] = [(tree, False)]
+    result: Dict[int, Node] = {}
+    while pending:
+        node, expanded = pending.pop()
+        if id(node) in result:
+            continue
+        if node.left is None:
+            result[id(node)] = make(node.value)[0]
+            continue
+        # A whole chain of alternations is simplified at once, one at a time would flatten it again at every level
+        children = branches(node) if node.value == '|' else [node.left, node.right]
+        if not expanded:
+            pending.append((node, True))
+            for child in reversed(children):
+                if child is not None and id(child) not in result:
+                    pending.append((child, False))
+            continue
+
+        if node.value == '|':
+            result[id(node)] = alternation([result[id(child)] for child in children])
+            continue
+        left = result[id(node.left)]
+        if node.right is None:
+            result[id(node)] = unary(node.value, left)
+            continue
+        right = result[id(node.right)]
+        if node.value == '.':
+            if isEmptySet(left) or isEmptySet(right):
+                result[id(node)] = left if isEmptySet(left) else right
+            elif isEpsilon(left) or isEpsilon(right):
+                result[id(node)] = right if isEpsilon(left) else left
+            elif left.value == '*' and number(left) == number(right):
+                result[id(node)] = left
+            else:
+                result[id(node)] = make('.', left, right)[0]
+    return result[id(tree)]
+
+
+def countPositions(tree: Node or None) -> int:
+    """Positions make_tree gives to the tree, counting the copies of the operands of counted repeats"""
+    counts: Dict[int, int] = {}
+    pending: List[Tuple[Node, bool]] = [(tree, False)] if tree is not None else []
+    while pending:
+        node, expanded = pending.pop()
+        if node.left is None:
+            counts[id(node)] = 1
+            continue
+        if not expanded:
+            pending.append((node, True))
+            pending += [(child, False) for child in (node.right, node.left) if child is not None]
+            continue
+        count = counts[id(node.left)] + (counts[id(node.right)] if node.right is not None else 0)
+        bounds = repeatBounds(node.value)
+        if bounds is not None:
+            low, high = bounds
+            copies = low + 1 if high is None else high
+            count = count * copies if copies > 0 else 1
+        counts[id(node)] = count
+    return counts[id(tree)] if tree is not None else 0
+
+
+def literalOf(tree: Node or None) -> str or None:
+    """The string the tree matches if it is a concatenation of single characters, None otherwise"""
+    chars: List[str] = []
+    pending: List[Node] = [tree] if tree is not None else []
+    while pending:
+        node = pending.pop()
+        if node.value == '.' and node.left is not None:
+            pending += [node.right, node.left]
+        elif isCharSet(node) and isinstance(node.value, int):
+            chars.append(chr(node.value))
+        elif isCharSet(node) and len(node.value) == 1:
+            chars.append(chr(node.value.intervals[0][0]))
+        else:
+            return None
+    return ''.join(chars) if chars else None
+
+
+def literalWords(tree: Node or None) -> List[str] or None:
+    """The strings of an alternation of literals (or of a single literal), None if an alternative is not one"""
+    words: List[str] = []
+    pending: List[Node] = [tree] if tree is not None else []
+    while pending:
+        node = pending.pop()
+        if node.value == '|' and node.left is not None:
+            pending += [node.right, node.left]
+            continue
+        word = literalOf(node)
+        if word is None:
+            return None
+        words.append(word)
+    return words or None
+
+
+def factorLiterals(tree: Node or None) -> Node or None:
+    """Factors the literal alternatives of every alternation into a trie of shared prefixes, so if|in|int|else
+    becomes i(f|n(t)?)|else and every prefix is a single position"""
+    if tree is None:
+        return None
+
+    def trieTree(words: List[str]) -> Node or None:
+        """Alternation of the words sharing their prefixes, None if the only word is the empty one. The trie is
+        built and folded without recursion, as a literal can be thousands of characters long"""
+        # Every level maps the next character to the level after it, '' marks a word ending there
+        root: Dict[str, dict] = {}
+        for word in words:
+            level = root
+            for char in word:
+                level = level.setdefault(char, {})
+            level[''] = {}
+
+        built: Dict[int, Node or None] = {}
+        pending: List[Tuple[Dict[str, dict], bool]] = [(root, False)]
+        while pending:
+            level, expanded = pending.pop()
+            if not expanded:
+                pending.append((level, True))
+                pending += [(child, False) for char, child in level.items() if char != '']
+                continue
+            result: Node or None = None
+            for char, child in level.items():
+                if char == '':
+                    continue
+                rest = built.pop(id(child))
+                branch = Node(ord(char)) if rest is None else Node('.', Node(ord(char)), rest)
+                result = branch if result is None else Node('|', result, branch)
+            if '' in level and result is not None:
+                result = Node('?', result)
+            built[id(level)] = result
+        return built[id(root)]
+
+    done: Dict[int, Node] = {}
+    pending: List[Tuple[Node, bool]] = [(tree, False)]
+    while pending:
+        node, expanded = pending.pop()
+        if id(node) in done:
+            continue
+        if node.left is None:
+            done[id(node)] = node
+            continue
+        if node.value != '|':
+            if not expanded:
+                pending.append((node, True))
+                pending += [(child, False) for child in (node.right, node.left) if child is not None]
+                continue
+            right = done[id(node.right)] if node.right is not None else None
+            done[id(node)] = Node(node.value, done[id(node.left)], right)
+            continue
+
+        alternatives: List[Node] = []
+        stack = [node]
+        while stack:
+            top = stack.pop()
+            if top.value == '|' and top.left is not None:
+                stack += [top.right, top.left]
+            else:
+                alternatives.append(top)
+        if not expanded:
+            pending.append((node, True))
+            pending += [(child, False) for child in reversed(alternatives)]
+            continue
+
+        words = [literalOf(alternative) for alternative in alternatives]
+        result: Node or None = None
+        others = [done[id(alternative)] for alternative, word in zip(alternatives, words) if word is None]
+        literals = [word for word in words if word is not None]
+        for branch in ([trieTree(literals)] if len(literals) > 1 else []) + others:
+            result = branch if result is None else Node('|', result, branch)
+        if len(literals) == 1:
+            single = done[id(alternatives[words.index(literals[0])])]
+            result = single if result is None else Node('|', single, result)
+        done[id(node)] = result
+    return done[id(tree)]
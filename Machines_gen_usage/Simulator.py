@@ -1,6 +1,9 @@
 from Machines_gen_usage.Colors import *
 from typing import *
-from Machines_gen_usage.Classes_ import State
+from Machines_gen_usage.Classes_ import State, epsilonClosures
+from Machines_gen_usage.DenseAFD import DenseAFD, getDense, BLOCK_BITS, BLOCK_SIZE
+from Machines_gen_usage.LazyAFD import LazyAFD
+from Machines_gen_usage.BitNFA import BitNFA
 import time
 from tools import ErroManagerReaders as err
 
@@ -13,6 +16,8 @@ def Simulator(states: Dict[str, State], string: str, expression=""):
 
     def simulation(initState: State):
         paths: List[List[State]] = [[initState]]
+        # The closures are walked once for the machine, the steps below only look them up
+        closures = epsilonClosures(initState)
 
         for ch in string:
             char = ord(ch)
@@ -26,7 +31,7 @@ def Simulator(states: Dict[str, State], string: str, expression=""):
                     newPath.append(st)
                     newPaths.append(newPath)
 
-                for st_e in evalState.getEpsilonClean() - {evalState}:
+                for st_e in closures[id(evalState)] - {evalState}:
                     for st in st_e.getStates(char):
                         newPath = path.copy()
                         newPath.append(st)
@@ -40,7 +45,7 @@ def Simulator(states: Dict[str, State], string: str, expression=""):
             if evalState.isFinalState:
                 return True, path
 
-            for st_e in evalState.getEpsilonClean():
+            for st_e in closures[id(evalState)]:
                 if st_e.isFinalState:
                     finalPath = path.copy()
                     finalPath.append(st_e)
@@ -70,89 +75,81 @@ def Simulator(states: Dict[str, State], string: str, expression=""):
     return simulationResult, pathDict
 
 
-def exclusiveSim(initState: State, string: str):
-    string += ' '
-    paths: List[List[State]] = [[initState]]
-    listTextTuple: List[Tuple[str, str or int]] = []
-    lastPathAccepted: List[Tuple[int, List, str]] = []
+def exclusiveSim(initState: State or DenseAFD or LazyAFD or BitNFA, string: str or bytes or memoryview):
+    """Splits the text into the longest lexemes the machine accepts. Bytes (of a machine built with utf8) are read
+    without decoding them, and their lexemes are bytes"""
+    # Lazy machines and bit sets compute their steps, frozen machines read them from the table
+    lazy = isinstance(initState, (LazyAFD, BitNFA))
+    machine = initState if lazy or isinstance(initState, DenseAFD) else getDense(initState)
+    accept, tokens, blocks, leaves = machine.accept, machine.tokens, machine.blocks, machine.leaves
+    keywords = machine.keywords
+    numClasses, mask = machine.numClasses, BLOCK_SIZE - 1
+    table = machine.table if not lazy else None
+
+    binary = not isinstance(string, str)
+    space, newline = (b' ', b'\n') if binary else (' ', '\n')
+    string = b''.join((string, space)) if binary else string + space
+    if binary and keywords:
+        keywords = {token: {lexeme.encode('utf-8'): keyword for lexeme, keyword in table.items()}
+                    for token, table in keywords.items()}
+    listTextTuple: List[Tuple[str or bytes, str or int]] = []
+    # Last character of the longest lexeme accepted so far and its token index
+    lastAccepted: Tuple[int, int] or None = None
+    state = machine.start
 
     chIndex = 0
     lasChIndex = 0
 
-    while chIndex < len(string):
-        ch = string[chIndex]
-        char = ord(ch)
-        newPaths: List[List[State]] = []
-
-        for path in paths:
-            evalState: State = path[-1]
+    def cut(index: int) -> int:
+        """Emits the longest accepted lexeme (or the error text) and returns where to continue"""
+        nonlocal lasChIndex, lastAccepted
+        if lastAccepted is None:
+            # The error takes the whole character, its UTF-8 continuation bytes too
+            while binary and index + 1 < len(string) and 0x80 <= string[index + 1] < 0xC0:
+                index += 1
+            textToAccept = string[lasChIndex:index + 1]
+            listTextTuple.append((textToAccept, 0 if len(textToAccept) == 0 or textToAccept == space or
+                                                     textToAccept == newline else 1))
+            lasChIndex = index + 1
+            return index + 1
+
+        lastChar, token = lastAccepted
+        lexeme = string[lasChIndex:lastChar + 1]
+        if token in keywords:
+            token = keywords[token].get(lexeme, token)
+        listTextTuple.append((lexeme, tokens[token]))
+        lasChIndex = lastChar + 1
+        lastAccepted = None
+        return lastChar + 1
 
-            for st in evalState.getStates(char):
-                newPath = path.copy()
-                newPath.append(st)
-                newPaths.append(newPath)
-
-            for st_e in evalState.getEpsilonClean() - {evalState}:
-                for st in st_e.getStates(char):
-                    newPath = path.copy()
-                    newPath.append(st)
-                    newPaths.append(newPath)
-
-        if len(newPaths) == 0:
-            if len(lastPathAccepted) == 0:
-                textToAccept = string[lasChIndex:chIndex + 1]
-                listTextTuple.append((textToAccept, 0 if len(textToAccept) == 0 or textToAccept == ' ' or
-                                                         textToAccept == '\n' else 1))
-                chIndex += 1
-                lasChIndex = chIndex
-                paths = [[initState]]
-                continue
-
-            lastChar, lastStateAccepted, _ = lastPathAccepted[0]
-            textToAccept = string[lasChIndex:lastChar + 1]
-            listTextTuple.append((textToAccept, lastStateAccepted[-1].getToken()))
-            lasChIndex = lastChar + 1
-            chIndex = lastChar + 1
-            paths = [[initState]]
-            lastPathAccepted = []
+    while chIndex < len(string):
+        char = string[chIndex] if binary else ord(string[chIndex])
+        if lazy:
+            nextState = machine.step(state, char)
+        else:
+            # Every code point has a place in the two level map, so wide characters cost the same as ASCII
+            column = leaves[blocks[char >> BLOCK_BITS] + (char & mask)]
+            nextState = table[state * numClasses + column] if column >= 0 else -1
+
+        if nextState < 0:
+            chIndex = cut(chIndex)
+            state = machine.start
             continue
 
-        newLastPathAccepted = []
+        if accept[nextState] >= 0:
+            lastAccepted = (chIndex, accept[nextState])
 
-        for path in newPaths:
-            if path[-1].isFinalState:
-                newLastPathAccepted.append(
-                    (chIndex, path, path[-1].value))
-
-        if len(newLastPathAccepted) > 0:
-            lastPathAccepted = sorted(newLastPathAccepted, key=lambda x: x[2])
-
-        paths = newPaths
+        state = nextState
         chIndex += 1
 
         if chIndex == len(string):
-            if len(lastPathAccepted) == 0:
-                textToAccept = string[lasChIndex:chIndex + 1]
-                listTextTuple.append((textToAccept, 0 if len(textToAccept) == 0 or textToAccept == ' ' or
-                                                         textToAccept == '\n' else 1))
-                chIndex += 1
-                lasChIndex = chIndex
-                paths = [[initState]]
-                continue
-
-            lastChar, lastStateAccepted, _ = lastPathAccepted[0]
-            textToAccept = string[lasChIndex:lastChar + 1]
-            listTextTuple.append((textToAccept, lastStateAccepted[-1].getToken()))
-            lasChIndex = lastChar + 1
-            chIndex = lastChar + 1
-            paths = [[initState]]
-            lastPathAccepted = []
-            continue
+            chIndex = cut(chIndex)
+            state = machine.start
 
     if listTextTuple[-1][1] == 1:
         text = listTextTuple[-1][0]
         listTextTuple.pop()
         listTextTuple.append((text[:-1], 1))
-        listTextTuple.append((' ', 0))
+        listTextTuple.append((space, 0))
 
     return listTextTuple
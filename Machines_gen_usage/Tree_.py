@@ -2,81 +2,135 @@ from Machines_gen_usage.Classes_ import Node
 from typing import *
 
 
-def make_tree(expression: List[str or int]) -> Node:
-    stack = []
+def positions(mask: int) -> Iterator[int]:
+    """Yields the positions (set bits) of a bitmask in increasing order"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def repeatToken(low: int, high: int or None) -> str:
+    """Postfix operator of a counted repeat, {low,high} or {low,} when it has no upper bound"""
+    return '{' + str(low) + ',' + ('' if high is None else str(high)) + '}'
+
+
+def repeatBounds(token: Any) -> Tuple[int, int or None] or None:
+    """Bounds of a counted repeat operator, None if the token is not one"""
+    if not isinstance(token, str) or not token.startswith('{') or ',' not in token:
+        return None
+    low, high = token[1:-1].split(',')
+    return int(low), (int(high) if high != '' else None)
+
+
+def markedExpression(postfixes: List[List[Any]]) -> List[Any]:
+    """rule_0 #0 . rule_1 #1 . | ... so every rule of one tree ends in its own marker position"""
+    expression: List[Any] = []
+    for number, postfix in enumerate(postfixes):
+        expression += postfix + [f'#{number}', '.']
+        if number > 0:
+            expression.append('|')
+    return expression
+
+
+def make_tree(expression: List[str or int], table: List[Node] or None = None) -> Node:
+    """Builds the position tree from the postfix expression. If a table is given, every node is also appended
+    to it in post-order, so later passes can walk the tree without recursion"""
     id_ = 1
-    for elem_ in expression:
-        char = str(elem_)
-        if char == '.':
-            right = stack.pop()
-            left = stack.pop()
-            stack.append(Node(char, left, right))
-            stack[-1].is_nullable = left.is_nullable and right.is_nullable
-            if left.is_nullable:
-                stack[-1].first_pos = left.first_pos.union(right.first_pos)
-            else:
-                stack[-1].first_pos = left.first_pos
-            if right.is_nullable:
-                stack[-1].last_pos = left.last_pos.union(right.last_pos)
-            else:
-                stack[-1].last_pos = right.last_pos
-        elif char == '|':
-            right = stack.pop()
-            left = stack.pop()
-            stack.append(Node(char, left, right))
-            stack[-1].is_nullable = left.is_nullable or right.is_nullable
-            stack[-1].first_pos = left.first_pos.union(right.first_pos)
-            stack[-1].last_pos = left.last_pos.union(right.last_pos)
-        elif char == '*':
-            left = stack.pop()
-            stack.append(Node(char, left))
-            stack[-1].is_nullable = True
-            stack[-1].first_pos = left.first_pos
-            stack[-1].last_pos = left.last_pos
+
+    def operation(value: str, left: Node, right: Node or None = None) -> Node:
+        node = Node(value, left, right)
+        if value == '.':
+            node.is_nullable = left.is_nullable and right.is_nullable
+            node.first_pos = left.first_pos | right.first_pos if left.is_nullable else left.first_pos
+            node.last_pos = left.last_pos | right.last_pos if right.is_nullable else right.last_pos
+        elif value == '|':
+            node.is_nullable = left.is_nullable or right.is_nullable
+            node.first_pos = left.first_pos | right.first_pos
+            node.last_pos = left.last_pos | right.last_pos
+        else:
+            # '*', '+' and '?' keep the positions of their operand, only '+' can be not nullable
+            node.is_nullable = value != '+' or left.is_nullable
+            node.first_pos = left.first_pos
+            node.last_pos = left.last_pos
+        if table is not None:
+            table.append(node)
+        return node
+
+    def leaf(value: Any) -> Node:
+        nonlocal id_
+        node = Node(value, id_=id_)
+        node.is_nullable = str(value) == str(ord('ε'))
+        node.first_pos = 1 << id_
+        node.last_pos = 1 << id_
+        id_ += 1
+        if table is not None:
+            table.append(node)
+        return node
+
+    def repeat(node: Node, operand: List[Any], low: int, high: int or None) -> Node:
+        """x{low,high} as low copies of x followed by (x(x(...)?)?)?, or by x* if it has no upper bound. Every copy
+        needs its own positions, so the operand is built again from its postfix for each extra copy"""
+        count = low + 1 if high is None else high
+        if count == 0:
+            return leaf(ord('ε'))
+        copies = [node] + [build(operand) for _ in range(count - 1)]
+
+        result: Node or None = None
+        for copy in copies[:low]:
+            result = copy if result is None else operation('.', result, copy)
+
+        tail: Node or None = None
+        if high is None:
+            tail = operation('*', copies[low])
         else:
-            stack.append(Node(elem_, id_=id_))
-            stack[-1].is_nullable = char == str(ord('ε'))
-            stack[-1].first_pos.add(id_)
-            stack[-1].last_pos.add(id_)
-            id_ += 1
-    return stack.pop()
+            for copy in reversed(copies[low:]):
+                tail = operation('?', copy if tail is None else operation('.', copy, tail))
+
+        if tail is None:
+            return result
+        return tail if result is None else operation('.', result, tail)
+
+    def build(tokens: List[Any]) -> Node:
+        stack: List[Node] = []
+        # Index in tokens where the postfix of each node of the stack starts
+        starts: List[int] = []
+        for index, elem_ in enumerate(tokens):
+            char = str(elem_)
+            if char == '.' or char == '|':
+                right = stack.pop()
+                left = stack.pop()
+                starts.pop()
+                stack.append(operation(char, left, right))
+            elif char == '*' or char == '+' or char == '?':
+                stack.append(operation(char, stack.pop()))
+            elif repeatBounds(elem_) is not None:
+                low, high = repeatBounds(elem_)
+                stack.append(repeat(stack.pop(), tokens[starts[-1]:index], low, high))
+            else:
+                stack.append(leaf(elem_))
+                starts.append(index)
+        return stack.pop()
+
+    return build(expression)
 
 
 def make_direct_tree(expression: List[str or int], token='#') -> tuple[Node, dict[Any, Node], Node]:
     expression = expression + ['#', '.']
     nodes: Dict[str or int, Node] = {}
-    tree_node = make_tree(expression)
+    table: List[Node] = []
+    tree_node = make_tree(expression, table)
 
-    def explore_node(node: Node):
+    for node in table:
         if node.value == '.':
-            explore_node(node.left)
-            explore_node(node.right)
-        elif node.value == '|':
-            explore_node(node.left)
-            explore_node(node.right)
-        elif node.value == '*':
-            explore_node(node.left)
-        else:
+            for element in positions(node.left.last_pos):
+                nodes[element].follow_pos |= node.right.first_pos
+        elif node.value == '*' or node.value == '+':
+            for element in positions(node.last_pos):
+                nodes[element].follow_pos |= node.first_pos
+        elif node.left is None:
             nodes[node.id_] = node
 
-    def explore_followPos(node: Node):
-
-        if node.value == '.':
-            for element in node.left.last_pos:
-                nodes[element].follow_pos = nodes[element].follow_pos.union(node.right.first_pos)
-            explore_followPos(node.left)
-            explore_followPos(node.right)
-        elif node.value == '*':
-            for element in node.last_pos:
-                nodes[element].follow_pos = nodes[element].follow_pos.union(node.first_pos)
-            explore_followPos(node.left)
-        elif node.value == '|':
-            explore_followPos(node.left)
-            explore_followPos(node.right)
-
-    explore_node(tree_node)
-    explore_followPos(tree_node)
-
     tokenTree = Node(token)
     tokenTree.left = tree_node
 
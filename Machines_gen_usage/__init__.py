@@ -1,4 +1,9 @@
-from .prepareAFD import prepareAFN, translateToCode, State, import_module
+from .prepareAFD import prepareAFN, prepareLazy, prepareBits, prepareWithin, translateToCode, State, import_module
+from .DenseAFD import DenseAFD, freezeAFD
+from .LazyAFD import LazyAFD
+from .BitNFA import BitNFA
+from .MachineCache import MachineCache, getCache
 from .Draw_diagrams import draw_AF
 from .Simulator import exclusiveSim
+from .ReBackend import ReLexer, differentialCheck
 simulator = exclusiveSim
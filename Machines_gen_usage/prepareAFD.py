@@ -2,49 +2,207 @@ from tools.Reader import *
 from Machines_gen_usage.infix_converter import *
 from Machines_gen_usage.Tree_ import *
 from Machines_gen_usage.AFD_direct import *
+from Machines_gen_usage.AFD_derivatives import make_derivative_AFD
+from Machines_gen_usage.DenseAFD import DenseAFD, getDense, thawAFD, BLOCK_BITS, BLOCK_SIZE
+from Machines_gen_usage.LazyAFD import LazyAFD
+from Machines_gen_usage.BitNFA import BitNFA, WORD_POSITIONS
+from Machines_gen_usage.RegexParser import parseRegex, toPostfix, simplify, countPositions, factorLiterals, literalWords
+from Machines_gen_usage.MachineCache import getCache, specKey
+from Machines_gen_usage.Colors import *
 import string
-import os
-import importlib.util
 from Machines_gen_usage.Draw_diagrams import draw_tree
-import threading
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from queue import Queue
 
+# Changing how machines are built must change this, so the cached machines are built again
+COMPILER_VERSION = '1.5'
+# Below this many postfix tokens in all the rules, starting a process pool costs more than it saves
+PROCESS_MIN_SIZE = 3000
+# Rule machines merged at once, bigger batches make wider merged states
+MERGE_BATCH = 64
+# Budget of the machines import_module builds, past it the rules run on sets of positions (LazyAFD) instead
+STATE_BUDGET = 100000
+TRANSITION_BUDGET = 4000000
+
+
+def parse_regex(regex: str, utf8: bool = False, literalTrie: bool = False) -> List[str or int or IntervalSet]:
+    """Postfix form of the simplified regex, over the UTF-8 bytes of its characters if utf8. With literalTrie the
+    literal alternatives share their prefixes"""
+    tree = simplify(parseRegex(regex))
+    postfix = toPostfix(factorLiterals(tree) if literalTrie else tree)
+    return utf8_postfix(postfix) if utf8 else postfix
+
+
+def ruleList(expressions: Dict[str, List[str]]) -> List[Tuple[str, str]]:
+    """(token, regex) of every rule, in the order they are tried"""
+    return [(token, rg) for token, regex in expressions.items() for rg in regex]
+
+
+def classRules(expressions: Dict[str, List[str]], utf8: bool = False, literalTrie: bool = False
+               ) -> Tuple[List[Tuple[str, str]], List[List[Any]], List[Set[int]], CharClasses]:
+    """The rules with their postfix expressions over classes of characters shared by all of them (see
+    compress_alphabet), the class ids every expression uses and the classes"""
+    rules = ruleList(expressions)
+    postfixes, alphabets, classes = compress_alphabet([parse_regex(rg, utf8, literalTrie) for _, rg in rules])
+    return rules, postfixes, alphabets, classes
+
+
+def simplifyReport(expressions: Dict[str, List[str]]) -> List[Tuple[str, str, int, int]]:
+    """Token, regex and positions of its tree before and after the simplification, for every rule"""
+    report: List[Tuple[str, str, int, int]] = []
+    for token, rg in ruleList(expressions):
+        tree = parseRegex(rg)
+        report.append((token, rg, countPositions(tree), countPositions(simplify(tree))))
+    return report
+
+
+def build_rule(token: str, postfix: List[Any], alphabet: Set[int], builder: str, id_: str,
+               budget: Tuple[int or None, int or None] = (None, None)) -> State:
+    """Machine of one rule. The followpos machine is minimized, the derivatives one is already close to minimal and
+    the merge minimizes the result anyway. budget is the most states and transitions it may have"""
+    if builder == 'derivatives':
+        return make_derivative_AFD(postfix, alphabet, token, id_, *budget)[1]
+    tree = make_direct_tree(postfix, token=token)
+    direct = make_direct_AFD(tree[0], tree[1], alphabet, token, *budget)
+    return minimizeAFD(direct[2], alphabet, id_=id_)[1]
+
+
+def create_mach(token, postfix, alphabet: Set[int], classes: CharClasses, count, resultQueue: Queue,
+                TreeQueue: Queue or None, builder: str = 'positions',
+                budget: Tuple[int or None, int or None] = (None, None)):
+    if TreeQueue is not None:
+        TreeQueue.put(make_direct_tree(postfix, token=token))
+    # The states of rule number count are named r<count>_<state>, so there is no limit on the number of rules
+    resultQueue.put((count, build_rule(token, postfix, alphabet, builder, f'r{count}_', budget)))
+
+
+def compile_rule(rule: Tuple[str, List[Any], Set[int], str, Tuple[int or None, int or None]]) -> DenseAFD:
+    """Builds the machine of one rule in a worker process, frozen so it can be sent back"""
+    token, postfix, alphabet, builder, budget = rule
+    return getDense(build_rule(token, postfix, alphabet, builder, 'q', budget))
+
+
+def keywordTable(expressions: Dict[str, List[str]], utf8: bool = False,
+                 **options) -> Tuple[State, Dict[str, Dict[str, str]]]:
+    """Builds the machine without the literal rules (keywords, or alternations of them) that an identifier like
+    rule after them also matches, and returns it with the table that gives those lexemes their keyword token back
+    after the match. A literal rule stays in the machine if, without it, one of its words is not matched whole by a
+    rule that comes after it"""
+    rules = ruleList(expressions)
+    literals: Dict[int, List[str]] = {}
+    for number, (_, rg) in enumerate(rules):
+        words = literalWords(simplify(parseRegex(rg)))
+        if words is not None:
+            literals[number] = words
+
+    while True:
+        kept = [number for number in range(len(rules)) if number not in literals]
+        if len(kept) == 0:
+            literals = {}
+            continue
+        keptRules: Dict[str, List[str]] = {}
+        for number in kept:
+            keptRules.setdefault(rules[number][0], []).append(rules[number][1])
+        initState = prepareAFN(keptRules, utf8=utf8, **options)
+        machine = getDense(initState)
+
+        table: Dict[str, Dict[str, str]] = {}
+        staying: List[int] = []
+        for number, words in literals.items():
+            moved: List[Tuple[str, str]] = []
+            for word in words:
+                found = machine.run(word.encode('utf-8') if utf8 else map(ord, word))
+                token = machine.tokens[found] if found >= 0 else None
+                if next((rule for rule in kept if rules[rule][0] == token), -1) < number:
+                    break
+                moved.append((token, word))
+            else:
+                # Of two keywords with the same text the first one keeps it, as it would in the machine
+                for token, word in moved:
+                    table.setdefault(token, {}).setdefault(word, rules[number][0])
+                continue
+            staying.append(number)
+        if len(staying) == 0:
+            initState.keywords = table
+            initState.edits += 1
+            return initState, table
+        for number in staying:
+            del literals[number]
+
+
+def prepareAFN(expressions: Dict[str, List[str]], showTree = False, workers: int or None = None,
+               mode: str = 'auto', utf8: bool = False, literalTrie: bool = False,
+               keywords: bool = False, shadowed: str or None = None, builder: str = 'positions',
+               maxStates: int or None = None, maxTransitions: int or None = None) -> State:
+    """Builds the machine of all the rules. Every rule is compiled on its own, in threads or, with mode
+    'processes', in a pool of `workers` processes (os.cpu_count() if None). 'auto' only starts the pool when the
+    spec is big enough, and the trees are only drawn in thread mode. With utf8 the machine reads the UTF-8 bytes
+    of the text, so it runs over bytes without decoding them. literalTrie shares the prefixes of the literal
+    alternatives of a rule, and keywords moves the keyword rules to a table looked up after the match (see
+    keywordTable), so the machine keeps the size of the identifier rule whatever the number of keywords. shadowed
+    'warn' reports the rules that earlier rules fully shadow and the states of the unminimized merge they cost,
+    'drop' also leaves those rules out of the merged machine. builder 'derivatives' builds the rule machines from
+    the derivatives of their regex (see AFD_derivatives) instead of the followpos of their position tree. A rule
+    machine or merged machine with more than maxStates states or maxTransitions transitions stops the build with
+    BudgetExceeded"""
+    if shadowed not in (None, 'warn', 'drop'):
+        raise ValueError(f"Unknown shadowed rules action '{shadowed}'")
+    if builder not in ('positions', 'derivatives'):
+        raise ValueError(f"Unknown machine builder '{builder}'")
+    if keywords:
+        return keywordTable(expressions, utf8=utf8, showTree=showTree, workers=workers, mode=mode,
+                            literalTrie=literalTrie, shadowed=shadowed, builder=builder, maxStates=maxStates,
+                            maxTransitions=maxTransitions)[0]
+    initState: State or None = None
+    resultQueue = Queue()
+    # The trees are only kept to be drawn, big specs would hold every tree until the end otherwise
+    TreeQueue = Queue() if showTree else None
 
-def create_mach(token, regex, count, resultQueue: Queue, TreeQueue: Queue):
-    parsed: List[List[str or int]] = transformsChar(regex)
-    accepted: List[List[str or int]] = validate(parsed)
-    alphabets: List[Set[int]] = extract_alphabet(accepted)
-    formatted: List[List[str or int]] = format_regex(accepted)
-    postfix: List[str or int] = translate_to_postfix(formatted)
-    tree = make_direct_tree(postfix[0], token=token)
-    TreeQueue.put(tree)
-    direct = make_direct_AFD(tree[0], tree[1], alphabets[0], token)
-    minimize = minimizeAFD(direct[2], alphabets[0], id_=string.ascii_lowercase[count])
-    resultQueue.put(minimize[1])
+    # The DFAs are built over classes of characters shared by all the rules instead of single characters
+    rules, postfixes, alphabets, classes = classRules(expressions, utf8, literalTrie)
 
+    if mode == 'auto':
+        size = sum(len(postfix) for postfix in postfixes)
+        cores = workers if workers is not None else (os.cpu_count() or 1)
+        mode = 'processes' if size >= PROCESS_MIN_SIZE and cores > 1 and len(rules) > 1 else 'threads'
+    if mode not in ('threads', 'processes'):
+        raise ValueError(f"Unknown compilation mode '{mode}'")
 
-def prepareAFN(expressions: Dict[str, List[str]], showTree = False) -> State:
-    initState: State or None = None
+    budget = (maxStates, maxTransitions)
     cont = 0
-    threads: List[threading.Thread] = []
-    resultQueue = Queue()
-    TreeQueue = Queue()
-    for token, regex in expressions.items():
-        for i in range(len(regex)):
-            t = threading.Thread(target=create_mach, args=(token, [regex[i]], cont, resultQueue, TreeQueue))
-            threads.append(t)
-            t.start()
-            cont += 1
+    try:
+        if mode == 'processes' and not showTree:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                frozen = pool.map(compile_rule, [(token, postfixes[cont], alphabets[cont], builder, budget)
+                                                 for cont, (token, _) in enumerate(rules)])
+                for cont in range(len(rules)):
+                    resultQueue.put((cont, thawAFD(next(frozen), id_=f'r{cont}_')))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(create_mach, token, postfixes[cont], alphabets[cont], classes, cont,
+                                       resultQueue, TreeQueue, builder, budget)
+                           for cont, (token, _) in enumerate(rules)]
+                for cont, future in enumerate(futures):
+                    future.result()
+    except BudgetExceeded as error:
+        raise BudgetExceeded(error.states, error.transitions, f'Rule {cont} {rules[cont][0]!r} /{rules[cont][1]}/')
+
+    machines: List[Tuple[int, State]] = []
+    while not resultQueue.empty():
+        machines.append(resultQueue.get())
+    machines.sort(key=lambda machine: machine[0])
+    if shadowed is not None:
+        machines = checkShadowed(rules, machines, drop=shadowed == 'drop')
 
-    for t in threads:
-        t.join()
+    # One deterministic machine for all the rules, the first rule that accepts a lexeme gives its token
+    minimized = mergeInBatches([machine for _, machine in machines], set(range(len(classes))),
+                               batchSize=MERGE_BATCH, id_='a', maxStates=maxStates, maxTransitions=maxTransitions)
+    expandAFD(minimized[0], classes)
+    initState = minimized[1]
 
-    while not resultQueue.empty():
-        mach = resultQueue.get()
-        if initState is None:
-            initState = mach
-        else:
-            initState.combine_States(mach)
+    if TreeQueue is None:
+        return initState
 
     iniTreeNode:Node = Node('Root')
     while not TreeQueue.empty():
@@ -69,143 +227,160 @@ def prepareAFN(expressions: Dict[str, List[str]], showTree = False) -> State:
 
     if showTree:
         draw_tree(iniTreeNode, 'default', useNum=True)
-    initState.value = 'a0'
     return initState
 
 
-def translateToCode(initState: State, isOut: bool = False, header='') -> str:
-    code = ''
-    setStates: Dict[str, State] = {initState.value: initState}
-
-    def addState(state: State):
-        for tran, states in state.transitions.items():
-            for st in states:
-                if st.value not in setStates:
-                    setStates[st.value] = st
-                    addState(st)
+def checkShadowed(rules: List[Tuple[str, str]], machines: List[Tuple[int, State]],
+                  drop: bool = False) -> List[Tuple[int, State]]:
+    """Warns about the rules that never give their token because earlier rules accept all their lexemes, with the
+    states of the merged machine they cost, and leaves them out if drop"""
+    shadowed, beaten, states, without = ruleProduct([machine for _, machine in machines])
+    for rule in shadowed:
+        token, rg = rules[machines[rule][0]]
+        token = token if len(token) <= 30 else token[:27] + '...'
+        by = ', '.join(str(machines[other][0]) for other in sorted(beaten.get(rule, ())))
+        reason = f'shadowed by rules {by}' if by else 'it matches nothing'
+        print(f"{BOLD}{YELLOW}Rule {machines[rule][0]} {token!r} /{rg}/ never gives its token, {reason}{RESET}")
+    if len(shadowed) == 0:
+        return machines
+
+    action = 'Dropped' if drop else 'Dropping them would save'
+    print(f"{BOLD}{YELLOW}{action} {len(shadowed)} shadowed rules: merged machine of {states} -> {without} states"
+          f"{RESET}")
+    if not drop or len(shadowed) == len(machines):
+        return machines
+    hidden = set(shadowed)
+    return [machine for rule, machine in enumerate(machines) if rule not in hidden]
+
+
+def prepareLazy(expressions: Dict[str, List[str]], maxStates: int = 4096, utf8: bool = False,
+                literalTrie: bool = False) -> LazyAFD:
+    """Same rules as prepareAFN, but the states of the machine are only built when the simulation reaches them"""
+    rules, postfixes, _, classes = classRules(expressions, utf8, literalTrie)
+    return LazyAFD(postfixes, [token for token, _ in rules], classes, maxStates=maxStates)
+
+
+def prepareWithin(expressions: Dict[str, List[str]], maxStates: int or None = STATE_BUDGET,
+                  maxTransitions: int or None = TRANSITION_BUDGET, **options) -> State or LazyAFD:
+    """prepareAFN with a budget of states and transitions. When a machine passes it the build stops, the reason is
+    reported and the rules run on sets of positions (prepareLazy), whose memory is bounded whatever the rules"""
+    try:
+        return prepareAFN(expressions, maxStates=maxStates, maxTransitions=maxTransitions, **options)
+    except BudgetExceeded as error:
+        print(f"{BOLD}{YELLOW}{error}, the rules are simulated on sets of positions instead{RESET}")
+        return prepareLazy(expressions, utf8=options.get('utf8', False), literalTrie=options.get('literalTrie', False))
+
+
+def prepareBits(expressions: Dict[str, List[str]], utf8: bool = False, literalTrie: bool = False) -> BitNFA:
+    """Same rules as prepareAFN, simulated on the sets of positions of their tree without building any machine.
+    Meant for a few small rules, with more positions than fit in a machine word prepareLazy runs faster"""
+    rules, postfixes, _, classes = classRules(expressions, utf8, literalTrie)
+    machine = BitNFA.fromRules(postfixes, [token for token, _ in rules], classes)
+    if machine.numPositions > WORD_POSITIONS:
+        print(f"{BOLD}{YELLOW}The rules have {machine.numPositions} positions, more than the {WORD_POSITIONS} of a "
+              f"machine word{RESET}")
+    return machine
 
-    addState(initState)
 
-    for i, state in setStates.items():
-        code = f"{i} = State('{i}')\n" + code
+def translateToCode(initState: State, isOut: bool = False, header='') -> str:
+    if isOut:
+        return translateDense(getDense(initState), header)
+
+    # States are numbered in the order they are reached, 0 being the initial one, and live in the list S
+    number: Dict[int, int] = {id(initState): 0}
+    order: List[State] = [initState]
+    pending: List[State] = [initState]
+    while pending:
+        for tran, states in pending.pop().transitions.items():
+            for st in states:
+                if id(st) not in number:
+                    number[id(st)] = len(order)
+                    order.append(st)
+                    pending.append(st)
+
+    lines: List[str] = ["from Machines_gen_usage.Classes_ import State",
+                        "from Machines_gen_usage.CharsSet import IntervalSet\n",
+                        f"S = [State(str(i)) for i in range({len(order)})]"]
+    for i, state in enumerate(order):
         if state.isFinalState:
-            code += f"{i}.isFinalState = True\n"
-        if len(state.token) > 0:
-            if isOut:
-                code += f"""\n\ndef tk_{i}(): \n"""
-                for j in state.token:
-                    code += f"\t{j}\n"
-                code += f"\n\n{i}.token = tk_{i}\n"
-            else:
-                for j in state.token:
-                    code += f"{i}.addToken( '{j.replace("'", r"\'")}')\n"
-
+            lines.append(f"S[{i}].isFinalState = True")
+        for j in state.token:
+            lines.append(f"S[{i}].addToken('{j.replace("'", r"\'")}')")
         for tran, states in state.transitions.items():
+            symbol = f'IntervalSet({tran.intervals})' if isinstance(tran, IntervalSet) else tran
             for st in states:
-                code += f"{i}.add_transition({tran}, {st.value})\n"
-        code += '\n'
-
-
-
-    if isOut:
-        code = """
-class State:
-    def __init__(self, value: str) -> None:
-        self.value: str = value
-        self.transitions: Dict[str or int, Set['State']] = {}
-        self.isFinalState: bool = False
-        self.numTrans: int = 0
-
-    def add_transition(self, value: str or int, state: 'State') -> None:
-        if value in self.transitions:
-            self.transitions[value].add(state)
-        else:
-            self.transitions[value] = {state}
-
-        self.numTrans += 1
-
-    def getStates(self, transition_value) -> Set['State']:
-        return self.transitions[transition_value] if transition_value in self.transitions else set()
-
-    def __eq__(self, other):
-        if isinstance(other, State):
-            return (self.value, id(self)) == (other.value, id(self))
-        return False
-
-    def __hash__(self):
-        return hash((self.value, id(self)))
-
-    def getToken(self) -> str or None:
-        return str(list(self.token)[0]) if len(self.token) > 0 else None
-
-    def numberTransitions(self) -> int:
-        return self.numTrans
-        
-
-\n\n""" + code
-
-        code = """
+                lines.append(f"S[{i}].add_transition({symbol}, S[{number[id(st)]}])")
+    if initState.keywords:
+        lines.append(f"S[0].keywords = {initState.keywords!r}")
+    lines.append("\na0 = S[0]\n")
+    return '\n'.join(lines)
+
+
+def translateDense(machine: DenseAFD, header='') -> str:
+    """Generates a standalone scanner that simulates the frozen machine over its transition table"""
+    rows = ',\n    '.join(', '.join(str(machine.table[st * machine.numClasses + col])
+                                     for col in range(machine.numClasses))
+                          for st in range(machine.numStates))
+    code = "from typing import *\nfrom array import array\n\n"
+    code += """
 import argparse
 parser = argparse.ArgumentParser(description='Simulate a machine')
-parser.add_argument('source', help='Source file')"""+header + code
-
-        code = f"from typing import *\n\n" + code
-
-
-        code += r"""
+parser.add_argument('source', help='Source file')""" + header + "\n\n"
+
+    code += f"BLOCK_BITS = {BLOCK_BITS}\nBLOCK_MASK = {BLOCK_SIZE - 1}\n"
+    code += f"BLOCKS = array('i', {list(machine.blocks)})\n"
+    code += f"LEAVES = array('i', {list(machine.leaves)})\n"
+    code += f"NUM_CLASSES = {machine.numClasses}\n"
+    code += f"TABLE = array('i', [\n    {rows}\n])\n"
+    code += f"ACCEPT = array('i', {list(machine.accept)})\n"
+    code += f"START = {machine.start}\n"
+    code += f"KEYWORDS = {machine.keywords!r}\n"
+
+    for i, token in enumerate(machine.tokens):
+        code += f"""\n\ndef tk_{i}(): \n\t{token}\n"""
+    code += f"\n\nTOKENS = [{', '.join(f'tk_{i}' for i in range(len(machine.tokens)))}]\n"
+
+    code += r"""
 args = parser.parse_args()
 fileToRead = args.source
-def exclusiveSim(initState: State, string: str):
+def exclusiveSim(initState: int, string: str):
     string += ' '
-    paths: List[List[State]] = [[initState]]
     listTextTuple: List[Tuple[str, str or int]] = []
-    lastPathAccepted: List[Tuple[int, List, int]] = []
+    lastAccepted: Tuple[int, int] or None = None
+    state = initState
 
     chIndex = 0
     lasChIndex = 0
 
     while chIndex < len(string):
-        ch = string[chIndex]
-        char = ord(ch)
-        newPaths: List[List[State]] = []
-
-        for path in paths:
-            evalState: State = path[-1]
-
-            for st in evalState.getStates(char):
-                newPath = path.copy()
-                newPath.append(st)
-                newPaths.append(newPath)
+        char = ord(string[chIndex])
+        column = LEAVES[BLOCKS[char >> BLOCK_BITS] + (char & BLOCK_MASK)]
+        nextState = TABLE[state * NUM_CLASSES + column] if column >= 0 else -1
 
-        if len(newPaths) == 0:
-            if len(lastPathAccepted) == 0:
+        if nextState < 0:
+            if lastAccepted is None:
                 textToAccept = string[lasChIndex:chIndex + 1]
                 listTextTuple.append((textToAccept, 0 if len(textToAccept) == 0 or textToAccept == ' ' else 1))
                 chIndex += 1
                 lasChIndex = chIndex
-                paths = [[initState]]
+                state = initState
                 continue
 
-            lastChar, lastStateAccepted, _ = lastPathAccepted[0]
-            textToAccept = string[lasChIndex:lastChar + 1]
-            listTextTuple.append((textToAccept, lastStateAccepted[-1].token))
+            lastChar, token = lastAccepted
+            lexeme = string[lasChIndex:lastChar + 1]
+            if token in KEYWORDS:
+                token = KEYWORDS[token].get(lexeme, token)
+            listTextTuple.append((lexeme, TOKENS[token]))
             lasChIndex = lastChar + 1
             chIndex = lastChar + 1
-            paths = [[initState]]
-            lastPathAccepted = []
+            state = initState
+            lastAccepted = None
             continue
 
-        newLastPathAccepted = []
+        if ACCEPT[nextState] >= 0:
+            lastAccepted = (chIndex, ACCEPT[nextState])
 
-        for path in newPaths:
-            if path[-1].isFinalState:
-                newLastPathAccepted.append(
-                    (chIndex, path, path[-1].value))
-
-        if len(newLastPathAccepted) > 0:
-            lastPathAccepted = sorted(newLastPathAccepted, key=lambda x: x[2])
-
-        paths = newPaths
+        state = nextState
         chIndex += 1
 
     return listTextTuple
@@ -227,7 +402,7 @@ if __name__ == '__main__':
         contents = file.read()
 
     print(YELLOW, 'Resultado:', RESET)
-    tokens = exclusiveSim(a0, contents)
+    tokens = exclusiveSim(START, contents)
     for message, token in tokens:
         if token != 1 and token != 0:
             print(GREEN, message, RESET, '->')
@@ -235,8 +410,6 @@ if __name__ == '__main__':
         elif token == 1:
             print(RED, 'ERROR IN LINE:', message, RESET)
         """
-    else:
-        code = f"from Machines_gen_usage.Classes_ import State\n\n" + code
     return code
 
 
@@ -244,14 +417,13 @@ def statesTotla(initState: State) -> str:
     code = ''
     setStates: Dict[str, State] = {initState.value: initState}
 
-    def addState(state: State):
-        for tran, states in state.transitions.items():
+    pending: List[State] = [initState]
+    while pending:
+        for tran, states in pending.pop().transitions.items():
             for st in states:
                 if st.value not in setStates:
                     setStates[st.value] = st
-                    addState(st)
-
-    addState(initState)
+                    pending.append(st)
 
     for i, state in setStates.items():
         code = f"{i} = State('{i}')\n" + code
@@ -270,18 +442,28 @@ def statesTotla(initState: State) -> str:
     return code
 
 
-def import_module(file, regex, showTree=False, directory='./machines/'):
-    file = directory + file
-    if os.path.isfile(file):
-        import_module = file.split('.')[0]
-        spec = importlib.util.spec_from_file_location(import_module, file)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        a0 = getattr(module, 'a0', None)
-    else:
-        a0 = prepareAFN(regex, showTree=showTree)
-        code = translateToCode(a0)
-        with open(file, 'w') as fileW:
-            fileW.write(code)
-
-    return a0
+def import_module(file, regex, showTree=False, directory=None, utf8=False, literalTrie=False,
+                  keywords=False, shadowed=None, builder='positions', maxStates=STATE_BUDGET,
+                  maxTransitions=TRANSITION_BUDGET) -> DenseAFD or LazyAFD:
+    """Returns the frozen machine of the regex, compiling it only if the cache has no machine for the same rules.
+    The file name only labels the cache entry, machines are shared between callers with the same rules. Both
+    builders give the same minimized machine, so the builder is not part of the key. Rules whose machine passes
+    the budget get a LazyAFD (see prepareWithin), which is not cached"""
+    cache = getCache(directory)
+    options = ''.join(f'-{name}' for name, used in (('utf8', utf8), ('trie', literalTrie), ('keywords', keywords),
+                                                    ('drop', shadowed == 'drop')) if used)
+    key = specKey(regex, COMPILER_VERSION + options)
+    path = cache.get(key)
+    if path is not None:
+        try:
+            return DenseAFD.load(path)
+        except ValueError:
+            pass
+
+    machine = prepareWithin(regex, maxStates, maxTransitions, showTree=showTree, utf8=utf8, literalTrie=literalTrie,
+                            keywords=keywords, shadowed=shadowed, builder=builder)
+    if isinstance(machine, LazyAFD):
+        return machine
+    machine = getDense(machine)
+    cache.put(key, machine.toBytes(), label=file)
+    return machine
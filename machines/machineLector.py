@@ -1,1870 +0,0 @@
-from Machines_gen_usage.Classes_ import State
-
-f1 = State('f1')
-i1 = State('i1')
-h2 = State('h2')
-h1 = State('h1')
-g2 = State('g2')
-g1 = State('g1')
-e8 = State('e8')
-e7 = State('e7')
-e6 = State('e6')
-e5 = State('e5')
-e4 = State('e4')
-e3 = State('e3')
-e2 = State('e2')
-e1 = State('e1')
-c8 = State('c8')
-c10 = State('c10')
-c9 = State('c9')
-c7 = State('c7')
-c6 = State('c6')
-c5 = State('c5')
-c4 = State('c4')
-c3 = State('c3')
-c2 = State('c2')
-c1 = State('c1')
-b1 = State('b1')
-a1 = State('a1')
-d1 = State('d1')
-d3 = State('d3')
-d2 = State('d2')
-a0 = State('a0')
-a0.add_transition(125, d2)
-a0.add_transition(125, a1)
-a0.add_transition(123, d2)
-a0.add_transition(123, b1)
-a0.add_transition(108, d2)
-a0.add_transition(108, c1)
-a0.add_transition(114, e1)
-a0.add_transition(114, d2)
-a0.add_transition(0, d2)
-a0.add_transition(1, d2)
-a0.add_transition(2, d2)
-a0.add_transition(3, d2)
-a0.add_transition(4, d2)
-a0.add_transition(5, d2)
-a0.add_transition(6, d2)
-a0.add_transition(7, d2)
-a0.add_transition(8, d2)
-a0.add_transition(11, d2)
-a0.add_transition(12, d2)
-a0.add_transition(13, d2)
-a0.add_transition(14, d2)
-a0.add_transition(15, d2)
-a0.add_transition(16, d2)
-a0.add_transition(17, d2)
-a0.add_transition(18, d2)
-a0.add_transition(19, d2)
-a0.add_transition(20, d2)
-a0.add_transition(21, d2)
-a0.add_transition(22, d2)
-a0.add_transition(23, d2)
-a0.add_transition(24, d2)
-a0.add_transition(25, d2)
-a0.add_transition(26, d2)
-a0.add_transition(27, d2)
-a0.add_transition(28, d2)
-a0.add_transition(29, d2)
-a0.add_transition(30, d2)
-a0.add_transition(31, d2)
-a0.add_transition(33, d2)
-a0.add_transition(34, d2)
-a0.add_transition(35, d2)
-a0.add_transition(36, d2)
-a0.add_transition(37, d2)
-a0.add_transition(38, d2)
-a0.add_transition(39, d3)
-a0.add_transition(40, g1)
-a0.add_transition(40, d2)
-a0.add_transition(41, d2)
-a0.add_transition(42, d2)
-a0.add_transition(42, h1)
-a0.add_transition(43, d2)
-a0.add_transition(44, d2)
-a0.add_transition(45, d2)
-a0.add_transition(46, d2)
-a0.add_transition(47, d2)
-a0.add_transition(48, d2)
-a0.add_transition(49, d2)
-a0.add_transition(50, d2)
-a0.add_transition(51, d2)
-a0.add_transition(52, d2)
-a0.add_transition(53, d2)
-a0.add_transition(54, d2)
-a0.add_transition(55, d2)
-a0.add_transition(56, d2)
-a0.add_transition(57, d2)
-a0.add_transition(58, d2)
-a0.add_transition(59, d2)
-a0.add_transition(60, d2)
-a0.add_transition(61, d2)
-a0.add_transition(62, d2)
-a0.add_transition(63, d2)
-a0.add_transition(64, d2)
-a0.add_transition(65, d2)
-a0.add_transition(66, d2)
-a0.add_transition(67, d2)
-a0.add_transition(68, d2)
-a0.add_transition(69, d2)
-a0.add_transition(70, d2)
-a0.add_transition(71, d2)
-a0.add_transition(72, d2)
-a0.add_transition(73, d2)
-a0.add_transition(74, d2)
-a0.add_transition(75, d2)
-a0.add_transition(76, d2)
-a0.add_transition(77, d2)
-a0.add_transition(78, d2)
-a0.add_transition(79, d2)
-a0.add_transition(80, d2)
-a0.add_transition(81, d2)
-a0.add_transition(82, d2)
-a0.add_transition(83, d2)
-a0.add_transition(84, d2)
-a0.add_transition(85, d2)
-a0.add_transition(86, d2)
-a0.add_transition(87, d2)
-a0.add_transition(88, d2)
-a0.add_transition(89, d2)
-a0.add_transition(90, d2)
-a0.add_transition(91, d2)
-a0.add_transition(92, d2)
-a0.add_transition(93, d2)
-a0.add_transition(94, d2)
-a0.add_transition(95, d2)
-a0.add_transition(96, d2)
-a0.add_transition(97, d2)
-a0.add_transition(98, d2)
-a0.add_transition(99, d2)
-a0.add_transition(100, d2)
-a0.add_transition(101, d2)
-a0.add_transition(102, d2)
-a0.add_transition(103, d2)
-a0.add_transition(104, d2)
-a0.add_transition(105, d2)
-a0.add_transition(106, d2)
-a0.add_transition(107, d2)
-a0.add_transition(109, d2)
-a0.add_transition(110, d2)
-a0.add_transition(111, d2)
-a0.add_transition(112, d2)
-a0.add_transition(113, d2)
-a0.add_transition(115, d2)
-a0.add_transition(116, d2)
-a0.add_transition(117, d2)
-a0.add_transition(118, d2)
-a0.add_transition(119, d2)
-a0.add_transition(120, d2)
-a0.add_transition(121, d2)
-a0.add_transition(122, d2)
-a0.add_transition(124, i1)
-a0.add_transition(124, d2)
-a0.add_transition(126, d2)
-a0.add_transition(127, d2)
-a0.add_transition(128, d2)
-a0.add_transition(129, d2)
-a0.add_transition(130, d2)
-a0.add_transition(131, d2)
-a0.add_transition(132, d2)
-a0.add_transition(133, d2)
-a0.add_transition(134, d2)
-a0.add_transition(135, d2)
-a0.add_transition(136, d2)
-a0.add_transition(137, d2)
-a0.add_transition(138, d2)
-a0.add_transition(139, d2)
-a0.add_transition(140, d2)
-a0.add_transition(141, d2)
-a0.add_transition(142, d2)
-a0.add_transition(143, d2)
-a0.add_transition(144, d2)
-a0.add_transition(145, d2)
-a0.add_transition(146, d2)
-a0.add_transition(147, d2)
-a0.add_transition(148, d2)
-a0.add_transition(149, d2)
-a0.add_transition(150, d2)
-a0.add_transition(151, d2)
-a0.add_transition(152, d2)
-a0.add_transition(153, d2)
-a0.add_transition(154, d2)
-a0.add_transition(155, d2)
-a0.add_transition(156, d2)
-a0.add_transition(157, d2)
-a0.add_transition(158, d2)
-a0.add_transition(159, d2)
-a0.add_transition(160, d2)
-a0.add_transition(161, d2)
-a0.add_transition(162, d2)
-a0.add_transition(163, d2)
-a0.add_transition(164, d2)
-a0.add_transition(165, d2)
-a0.add_transition(166, d2)
-a0.add_transition(167, d2)
-a0.add_transition(168, d2)
-a0.add_transition(169, d2)
-a0.add_transition(170, d2)
-a0.add_transition(171, d2)
-a0.add_transition(172, d2)
-a0.add_transition(173, d2)
-a0.add_transition(174, d2)
-a0.add_transition(175, d2)
-a0.add_transition(176, d2)
-a0.add_transition(177, d2)
-a0.add_transition(178, d2)
-a0.add_transition(179, d2)
-a0.add_transition(180, d2)
-a0.add_transition(181, d2)
-a0.add_transition(182, d2)
-a0.add_transition(183, d2)
-a0.add_transition(184, d2)
-a0.add_transition(185, d2)
-a0.add_transition(186, d2)
-a0.add_transition(187, d2)
-a0.add_transition(188, d2)
-a0.add_transition(189, d2)
-a0.add_transition(190, d2)
-a0.add_transition(191, d2)
-a0.add_transition(192, d2)
-a0.add_transition(193, d2)
-a0.add_transition(194, d2)
-a0.add_transition(195, d2)
-a0.add_transition(196, d2)
-a0.add_transition(197, d2)
-a0.add_transition(198, d2)
-a0.add_transition(199, d2)
-a0.add_transition(200, d2)
-a0.add_transition(201, d2)
-a0.add_transition(202, d2)
-a0.add_transition(203, d2)
-a0.add_transition(204, d2)
-a0.add_transition(205, d2)
-a0.add_transition(206, d2)
-a0.add_transition(207, d2)
-a0.add_transition(208, d2)
-a0.add_transition(209, d2)
-a0.add_transition(210, d2)
-a0.add_transition(211, d2)
-a0.add_transition(212, d2)
-a0.add_transition(213, d2)
-a0.add_transition(214, d2)
-a0.add_transition(215, d2)
-a0.add_transition(216, d2)
-a0.add_transition(217, d2)
-a0.add_transition(218, d2)
-a0.add_transition(219, d2)
-a0.add_transition(220, d2)
-a0.add_transition(221, d2)
-a0.add_transition(222, d2)
-a0.add_transition(223, d2)
-a0.add_transition(224, d2)
-a0.add_transition(225, d2)
-a0.add_transition(226, d2)
-a0.add_transition(227, d2)
-a0.add_transition(228, d2)
-a0.add_transition(229, d2)
-a0.add_transition(230, d2)
-a0.add_transition(231, d2)
-a0.add_transition(232, d2)
-a0.add_transition(233, d2)
-a0.add_transition(234, d2)
-a0.add_transition(235, d2)
-a0.add_transition(236, d2)
-a0.add_transition(237, d2)
-a0.add_transition(238, d2)
-a0.add_transition(239, d2)
-a0.add_transition(240, d2)
-a0.add_transition(241, d2)
-a0.add_transition(242, d2)
-a0.add_transition(243, d2)
-a0.add_transition(244, d2)
-a0.add_transition(245, d2)
-a0.add_transition(246, d2)
-a0.add_transition(247, d2)
-a0.add_transition(248, d2)
-a0.add_transition(249, d2)
-a0.add_transition(250, d2)
-a0.add_transition(251, d2)
-a0.add_transition(252, d2)
-a0.add_transition(253, d2)
-a0.add_transition(254, d2)
-a0.add_transition(255, d2)
-a0.add_transition(32, f1)
-a0.add_transition(9, f1)
-a0.add_transition(10, f1)
-
-d2.isFinalState = True
-d2.addToken( 'EXPRESSION')
-d2.add_transition(0, d2)
-d2.add_transition(1, d2)
-d2.add_transition(2, d2)
-d2.add_transition(3, d2)
-d2.add_transition(4, d2)
-d2.add_transition(5, d2)
-d2.add_transition(6, d2)
-d2.add_transition(7, d2)
-d2.add_transition(8, d2)
-d2.add_transition(11, d2)
-d2.add_transition(12, d2)
-d2.add_transition(13, d2)
-d2.add_transition(14, d2)
-d2.add_transition(15, d2)
-d2.add_transition(16, d2)
-d2.add_transition(17, d2)
-d2.add_transition(18, d2)
-d2.add_transition(19, d2)
-d2.add_transition(20, d2)
-d2.add_transition(21, d2)
-d2.add_transition(22, d2)
-d2.add_transition(23, d2)
-d2.add_transition(24, d2)
-d2.add_transition(25, d2)
-d2.add_transition(26, d2)
-d2.add_transition(27, d2)
-d2.add_transition(28, d2)
-d2.add_transition(29, d2)
-d2.add_transition(30, d2)
-d2.add_transition(31, d2)
-d2.add_transition(33, d2)
-d2.add_transition(34, d2)
-d2.add_transition(35, d2)
-d2.add_transition(36, d2)
-d2.add_transition(37, d2)
-d2.add_transition(38, d2)
-d2.add_transition(39, d3)
-d2.add_transition(40, d2)
-d2.add_transition(41, d2)
-d2.add_transition(42, d2)
-d2.add_transition(43, d2)
-d2.add_transition(44, d2)
-d2.add_transition(45, d2)
-d2.add_transition(46, d2)
-d2.add_transition(47, d2)
-d2.add_transition(48, d2)
-d2.add_transition(49, d2)
-d2.add_transition(50, d2)
-d2.add_transition(51, d2)
-d2.add_transition(52, d2)
-d2.add_transition(53, d2)
-d2.add_transition(54, d2)
-d2.add_transition(55, d2)
-d2.add_transition(56, d2)
-d2.add_transition(57, d2)
-d2.add_transition(58, d2)
-d2.add_transition(59, d2)
-d2.add_transition(60, d2)
-d2.add_transition(61, d2)
-d2.add_transition(62, d2)
-d2.add_transition(63, d2)
-d2.add_transition(64, d2)
-d2.add_transition(65, d2)
-d2.add_transition(66, d2)
-d2.add_transition(67, d2)
-d2.add_transition(68, d2)
-d2.add_transition(69, d2)
-d2.add_transition(70, d2)
-d2.add_transition(71, d2)
-d2.add_transition(72, d2)
-d2.add_transition(73, d2)
-d2.add_transition(74, d2)
-d2.add_transition(75, d2)
-d2.add_transition(76, d2)
-d2.add_transition(77, d2)
-d2.add_transition(78, d2)
-d2.add_transition(79, d2)
-d2.add_transition(80, d2)
-d2.add_transition(81, d2)
-d2.add_transition(82, d2)
-d2.add_transition(83, d2)
-d2.add_transition(84, d2)
-d2.add_transition(85, d2)
-d2.add_transition(86, d2)
-d2.add_transition(87, d2)
-d2.add_transition(88, d2)
-d2.add_transition(89, d2)
-d2.add_transition(90, d2)
-d2.add_transition(91, d2)
-d2.add_transition(92, d2)
-d2.add_transition(93, d2)
-d2.add_transition(94, d2)
-d2.add_transition(95, d2)
-d2.add_transition(96, d2)
-d2.add_transition(97, d2)
-d2.add_transition(98, d2)
-d2.add_transition(99, d2)
-d2.add_transition(100, d2)
-d2.add_transition(101, d2)
-d2.add_transition(102, d2)
-d2.add_transition(103, d2)
-d2.add_transition(104, d2)
-d2.add_transition(105, d2)
-d2.add_transition(106, d2)
-d2.add_transition(107, d2)
-d2.add_transition(108, d2)
-d2.add_transition(109, d2)
-d2.add_transition(110, d2)
-d2.add_transition(111, d2)
-d2.add_transition(112, d2)
-d2.add_transition(113, d2)
-d2.add_transition(114, d2)
-d2.add_transition(115, d2)
-d2.add_transition(116, d2)
-d2.add_transition(117, d2)
-d2.add_transition(118, d2)
-d2.add_transition(119, d2)
-d2.add_transition(120, d2)
-d2.add_transition(121, d2)
-d2.add_transition(122, d2)
-d2.add_transition(123, d2)
-d2.add_transition(124, d2)
-d2.add_transition(125, d2)
-d2.add_transition(126, d2)
-d2.add_transition(127, d2)
-d2.add_transition(128, d2)
-d2.add_transition(129, d2)
-d2.add_transition(130, d2)
-d2.add_transition(131, d2)
-d2.add_transition(132, d2)
-d2.add_transition(133, d2)
-d2.add_transition(134, d2)
-d2.add_transition(135, d2)
-d2.add_transition(136, d2)
-d2.add_transition(137, d2)
-d2.add_transition(138, d2)
-d2.add_transition(139, d2)
-d2.add_transition(140, d2)
-d2.add_transition(141, d2)
-d2.add_transition(142, d2)
-d2.add_transition(143, d2)
-d2.add_transition(144, d2)
-d2.add_transition(145, d2)
-d2.add_transition(146, d2)
-d2.add_transition(147, d2)
-d2.add_transition(148, d2)
-d2.add_transition(149, d2)
-d2.add_transition(150, d2)
-d2.add_transition(151, d2)
-d2.add_transition(152, d2)
-d2.add_transition(153, d2)
-d2.add_transition(154, d2)
-d2.add_transition(155, d2)
-d2.add_transition(156, d2)
-d2.add_transition(157, d2)
-d2.add_transition(158, d2)
-d2.add_transition(159, d2)
-d2.add_transition(160, d2)
-d2.add_transition(161, d2)
-d2.add_transition(162, d2)
-d2.add_transition(163, d2)
-d2.add_transition(164, d2)
-d2.add_transition(165, d2)
-d2.add_transition(166, d2)
-d2.add_transition(167, d2)
-d2.add_transition(168, d2)
-d2.add_transition(169, d2)
-d2.add_transition(170, d2)
-d2.add_transition(171, d2)
-d2.add_transition(172, d2)
-d2.add_transition(173, d2)
-d2.add_transition(174, d2)
-d2.add_transition(175, d2)
-d2.add_transition(176, d2)
-d2.add_transition(177, d2)
-d2.add_transition(178, d2)
-d2.add_transition(179, d2)
-d2.add_transition(180, d2)
-d2.add_transition(181, d2)
-d2.add_transition(182, d2)
-d2.add_transition(183, d2)
-d2.add_transition(184, d2)
-d2.add_transition(185, d2)
-d2.add_transition(186, d2)
-d2.add_transition(187, d2)
-d2.add_transition(188, d2)
-d2.add_transition(189, d2)
-d2.add_transition(190, d2)
-d2.add_transition(191, d2)
-d2.add_transition(192, d2)
-d2.add_transition(193, d2)
-d2.add_transition(194, d2)
-d2.add_transition(195, d2)
-d2.add_transition(196, d2)
-d2.add_transition(197, d2)
-d2.add_transition(198, d2)
-d2.add_transition(199, d2)
-d2.add_transition(200, d2)
-d2.add_transition(201, d2)
-d2.add_transition(202, d2)
-d2.add_transition(203, d2)
-d2.add_transition(204, d2)
-d2.add_transition(205, d2)
-d2.add_transition(206, d2)
-d2.add_transition(207, d2)
-d2.add_transition(208, d2)
-d2.add_transition(209, d2)
-d2.add_transition(210, d2)
-d2.add_transition(211, d2)
-d2.add_transition(212, d2)
-d2.add_transition(213, d2)
-d2.add_transition(214, d2)
-d2.add_transition(215, d2)
-d2.add_transition(216, d2)
-d2.add_transition(217, d2)
-d2.add_transition(218, d2)
-d2.add_transition(219, d2)
-d2.add_transition(220, d2)
-d2.add_transition(221, d2)
-d2.add_transition(222, d2)
-d2.add_transition(223, d2)
-d2.add_transition(224, d2)
-d2.add_transition(225, d2)
-d2.add_transition(226, d2)
-d2.add_transition(227, d2)
-d2.add_transition(228, d2)
-d2.add_transition(229, d2)
-d2.add_transition(230, d2)
-d2.add_transition(231, d2)
-d2.add_transition(232, d2)
-d2.add_transition(233, d2)
-d2.add_transition(234, d2)
-d2.add_transition(235, d2)
-d2.add_transition(236, d2)
-d2.add_transition(237, d2)
-d2.add_transition(238, d2)
-d2.add_transition(239, d2)
-d2.add_transition(240, d2)
-d2.add_transition(241, d2)
-d2.add_transition(242, d2)
-d2.add_transition(243, d2)
-d2.add_transition(244, d2)
-d2.add_transition(245, d2)
-d2.add_transition(246, d2)
-d2.add_transition(247, d2)
-d2.add_transition(248, d2)
-d2.add_transition(249, d2)
-d2.add_transition(250, d2)
-d2.add_transition(251, d2)
-d2.add_transition(252, d2)
-d2.add_transition(253, d2)
-d2.add_transition(254, d2)
-d2.add_transition(255, d2)
-
-d3.isFinalState = True
-d3.addToken( 'EXPRESSION')
-d3.add_transition(0, d2)
-d3.add_transition(1, d2)
-d3.add_transition(2, d2)
-d3.add_transition(3, d2)
-d3.add_transition(4, d2)
-d3.add_transition(5, d2)
-d3.add_transition(6, d2)
-d3.add_transition(7, d2)
-d3.add_transition(8, d2)
-d3.add_transition(9, d1)
-d3.add_transition(10, d1)
-d3.add_transition(11, d2)
-d3.add_transition(12, d2)
-d3.add_transition(13, d2)
-d3.add_transition(14, d2)
-d3.add_transition(15, d2)
-d3.add_transition(16, d2)
-d3.add_transition(17, d2)
-d3.add_transition(18, d2)
-d3.add_transition(19, d2)
-d3.add_transition(20, d2)
-d3.add_transition(21, d2)
-d3.add_transition(22, d2)
-d3.add_transition(23, d2)
-d3.add_transition(24, d2)
-d3.add_transition(25, d2)
-d3.add_transition(26, d2)
-d3.add_transition(27, d2)
-d3.add_transition(28, d2)
-d3.add_transition(29, d2)
-d3.add_transition(30, d2)
-d3.add_transition(31, d2)
-d3.add_transition(32, d1)
-d3.add_transition(33, d2)
-d3.add_transition(34, d2)
-d3.add_transition(35, d2)
-d3.add_transition(36, d2)
-d3.add_transition(37, d2)
-d3.add_transition(38, d2)
-d3.add_transition(39, d3)
-d3.add_transition(40, d2)
-d3.add_transition(41, d2)
-d3.add_transition(42, d2)
-d3.add_transition(43, d2)
-d3.add_transition(44, d2)
-d3.add_transition(45, d2)
-d3.add_transition(46, d2)
-d3.add_transition(47, d2)
-d3.add_transition(48, d2)
-d3.add_transition(49, d2)
-d3.add_transition(50, d2)
-d3.add_transition(51, d2)
-d3.add_transition(52, d2)
-d3.add_transition(53, d2)
-d3.add_transition(54, d2)
-d3.add_transition(55, d2)
-d3.add_transition(56, d2)
-d3.add_transition(57, d2)
-d3.add_transition(58, d2)
-d3.add_transition(59, d2)
-d3.add_transition(60, d2)
-d3.add_transition(61, d2)
-d3.add_transition(62, d2)
-d3.add_transition(63, d2)
-d3.add_transition(64, d2)
-d3.add_transition(65, d2)
-d3.add_transition(66, d2)
-d3.add_transition(67, d2)
-d3.add_transition(68, d2)
-d3.add_transition(69, d2)
-d3.add_transition(70, d2)
-d3.add_transition(71, d2)
-d3.add_transition(72, d2)
-d3.add_transition(73, d2)
-d3.add_transition(74, d2)
-d3.add_transition(75, d2)
-d3.add_transition(76, d2)
-d3.add_transition(77, d2)
-d3.add_transition(78, d2)
-d3.add_transition(79, d2)
-d3.add_transition(80, d2)
-d3.add_transition(81, d2)
-d3.add_transition(82, d2)
-d3.add_transition(83, d2)
-d3.add_transition(84, d2)
-d3.add_transition(85, d2)
-d3.add_transition(86, d2)
-d3.add_transition(87, d2)
-d3.add_transition(88, d2)
-d3.add_transition(89, d2)
-d3.add_transition(90, d2)
-d3.add_transition(91, d2)
-d3.add_transition(92, d2)
-d3.add_transition(93, d2)
-d3.add_transition(94, d2)
-d3.add_transition(95, d2)
-d3.add_transition(96, d2)
-d3.add_transition(97, d2)
-d3.add_transition(98, d2)
-d3.add_transition(99, d2)
-d3.add_transition(100, d2)
-d3.add_transition(101, d2)
-d3.add_transition(102, d2)
-d3.add_transition(103, d2)
-d3.add_transition(104, d2)
-d3.add_transition(105, d2)
-d3.add_transition(106, d2)
-d3.add_transition(107, d2)
-d3.add_transition(108, d2)
-d3.add_transition(109, d2)
-d3.add_transition(110, d2)
-d3.add_transition(111, d2)
-d3.add_transition(112, d2)
-d3.add_transition(113, d2)
-d3.add_transition(114, d2)
-d3.add_transition(115, d2)
-d3.add_transition(116, d2)
-d3.add_transition(117, d2)
-d3.add_transition(118, d2)
-d3.add_transition(119, d2)
-d3.add_transition(120, d2)
-d3.add_transition(121, d2)
-d3.add_transition(122, d2)
-d3.add_transition(123, d2)
-d3.add_transition(124, d2)
-d3.add_transition(125, d2)
-d3.add_transition(126, d2)
-d3.add_transition(127, d2)
-d3.add_transition(128, d2)
-d3.add_transition(129, d2)
-d3.add_transition(130, d2)
-d3.add_transition(131, d2)
-d3.add_transition(132, d2)
-d3.add_transition(133, d2)
-d3.add_transition(134, d2)
-d3.add_transition(135, d2)
-d3.add_transition(136, d2)
-d3.add_transition(137, d2)
-d3.add_transition(138, d2)
-d3.add_transition(139, d2)
-d3.add_transition(140, d2)
-d3.add_transition(141, d2)
-d3.add_transition(142, d2)
-d3.add_transition(143, d2)
-d3.add_transition(144, d2)
-d3.add_transition(145, d2)
-d3.add_transition(146, d2)
-d3.add_transition(147, d2)
-d3.add_transition(148, d2)
-d3.add_transition(149, d2)
-d3.add_transition(150, d2)
-d3.add_transition(151, d2)
-d3.add_transition(152, d2)
-d3.add_transition(153, d2)
-d3.add_transition(154, d2)
-d3.add_transition(155, d2)
-d3.add_transition(156, d2)
-d3.add_transition(157, d2)
-d3.add_transition(158, d2)
-d3.add_transition(159, d2)
-d3.add_transition(160, d2)
-d3.add_transition(161, d2)
-d3.add_transition(162, d2)
-d3.add_transition(163, d2)
-d3.add_transition(164, d2)
-d3.add_transition(165, d2)
-d3.add_transition(166, d2)
-d3.add_transition(167, d2)
-d3.add_transition(168, d2)
-d3.add_transition(169, d2)
-d3.add_transition(170, d2)
-d3.add_transition(171, d2)
-d3.add_transition(172, d2)
-d3.add_transition(173, d2)
-d3.add_transition(174, d2)
-d3.add_transition(175, d2)
-d3.add_transition(176, d2)
-d3.add_transition(177, d2)
-d3.add_transition(178, d2)
-d3.add_transition(179, d2)
-d3.add_transition(180, d2)
-d3.add_transition(181, d2)
-d3.add_transition(182, d2)
-d3.add_transition(183, d2)
-d3.add_transition(184, d2)
-d3.add_transition(185, d2)
-d3.add_transition(186, d2)
-d3.add_transition(187, d2)
-d3.add_transition(188, d2)
-d3.add_transition(189, d2)
-d3.add_transition(190, d2)
-d3.add_transition(191, d2)
-d3.add_transition(192, d2)
-d3.add_transition(193, d2)
-d3.add_transition(194, d2)
-d3.add_transition(195, d2)
-d3.add_transition(196, d2)
-d3.add_transition(197, d2)
-d3.add_transition(198, d2)
-d3.add_transition(199, d2)
-d3.add_transition(200, d2)
-d3.add_transition(201, d2)
-d3.add_transition(202, d2)
-d3.add_transition(203, d2)
-d3.add_transition(204, d2)
-d3.add_transition(205, d2)
-d3.add_transition(206, d2)
-d3.add_transition(207, d2)
-d3.add_transition(208, d2)
-d3.add_transition(209, d2)
-d3.add_transition(210, d2)
-d3.add_transition(211, d2)
-d3.add_transition(212, d2)
-d3.add_transition(213, d2)
-d3.add_transition(214, d2)
-d3.add_transition(215, d2)
-d3.add_transition(216, d2)
-d3.add_transition(217, d2)
-d3.add_transition(218, d2)
-d3.add_transition(219, d2)
-d3.add_transition(220, d2)
-d3.add_transition(221, d2)
-d3.add_transition(222, d2)
-d3.add_transition(223, d2)
-d3.add_transition(224, d2)
-d3.add_transition(225, d2)
-d3.add_transition(226, d2)
-d3.add_transition(227, d2)
-d3.add_transition(228, d2)
-d3.add_transition(229, d2)
-d3.add_transition(230, d2)
-d3.add_transition(231, d2)
-d3.add_transition(232, d2)
-d3.add_transition(233, d2)
-d3.add_transition(234, d2)
-d3.add_transition(235, d2)
-d3.add_transition(236, d2)
-d3.add_transition(237, d2)
-d3.add_transition(238, d2)
-d3.add_transition(239, d2)
-d3.add_transition(240, d2)
-d3.add_transition(241, d2)
-d3.add_transition(242, d2)
-d3.add_transition(243, d2)
-d3.add_transition(244, d2)
-d3.add_transition(245, d2)
-d3.add_transition(246, d2)
-d3.add_transition(247, d2)
-d3.add_transition(248, d2)
-d3.add_transition(249, d2)
-d3.add_transition(250, d2)
-d3.add_transition(251, d2)
-d3.add_transition(252, d2)
-d3.add_transition(253, d2)
-d3.add_transition(254, d2)
-d3.add_transition(255, d2)
-
-d1.add_transition(39, d2)
-
-a1.isFinalState = True
-a1.addToken( 'RCURLY')
-
-b1.isFinalState = True
-b1.addToken( 'LCURLY')
-
-c1.add_transition(101, c2)
-
-c2.add_transition(116, c3)
-
-c3.add_transition(32, c4)
-
-c4.add_transition(65, c5)
-c4.add_transition(66, c5)
-c4.add_transition(67, c5)
-c4.add_transition(68, c5)
-c4.add_transition(69, c5)
-c4.add_transition(70, c5)
-c4.add_transition(71, c5)
-c4.add_transition(72, c5)
-c4.add_transition(73, c5)
-c4.add_transition(74, c5)
-c4.add_transition(75, c5)
-c4.add_transition(76, c5)
-c4.add_transition(77, c5)
-c4.add_transition(78, c5)
-c4.add_transition(79, c5)
-c4.add_transition(80, c5)
-c4.add_transition(81, c5)
-c4.add_transition(82, c5)
-c4.add_transition(83, c5)
-c4.add_transition(84, c5)
-c4.add_transition(85, c5)
-c4.add_transition(86, c5)
-c4.add_transition(87, c5)
-c4.add_transition(88, c5)
-c4.add_transition(89, c5)
-c4.add_transition(90, c5)
-c4.add_transition(97, c5)
-c4.add_transition(98, c5)
-c4.add_transition(99, c5)
-c4.add_transition(100, c5)
-c4.add_transition(101, c5)
-c4.add_transition(102, c5)
-c4.add_transition(103, c5)
-c4.add_transition(104, c5)
-c4.add_transition(105, c5)
-c4.add_transition(106, c5)
-c4.add_transition(107, c5)
-c4.add_transition(108, c5)
-c4.add_transition(109, c5)
-c4.add_transition(110, c5)
-c4.add_transition(111, c5)
-c4.add_transition(112, c5)
-c4.add_transition(113, c5)
-c4.add_transition(114, c5)
-c4.add_transition(115, c5)
-c4.add_transition(116, c5)
-c4.add_transition(117, c5)
-c4.add_transition(118, c5)
-c4.add_transition(119, c5)
-c4.add_transition(120, c5)
-c4.add_transition(121, c5)
-c4.add_transition(122, c5)
-
-c5.add_transition(32, c6)
-c5.add_transition(48, c5)
-c5.add_transition(49, c5)
-c5.add_transition(50, c5)
-c5.add_transition(51, c5)
-c5.add_transition(52, c5)
-c5.add_transition(53, c5)
-c5.add_transition(54, c5)
-c5.add_transition(55, c5)
-c5.add_transition(56, c5)
-c5.add_transition(57, c5)
-c5.add_transition(61, c7)
-c5.add_transition(65, c5)
-c5.add_transition(66, c5)
-c5.add_transition(67, c5)
-c5.add_transition(68, c5)
-c5.add_transition(69, c5)
-c5.add_transition(70, c5)
-c5.add_transition(71, c5)
-c5.add_transition(72, c5)
-c5.add_transition(73, c5)
-c5.add_transition(74, c5)
-c5.add_transition(75, c5)
-c5.add_transition(76, c5)
-c5.add_transition(77, c5)
-c5.add_transition(78, c5)
-c5.add_transition(79, c5)
-c5.add_transition(80, c5)
-c5.add_transition(81, c5)
-c5.add_transition(82, c5)
-c5.add_transition(83, c5)
-c5.add_transition(84, c5)
-c5.add_transition(85, c5)
-c5.add_transition(86, c5)
-c5.add_transition(87, c5)
-c5.add_transition(88, c5)
-c5.add_transition(89, c5)
-c5.add_transition(90, c5)
-c5.add_transition(97, c5)
-c5.add_transition(98, c5)
-c5.add_transition(99, c5)
-c5.add_transition(100, c5)
-c5.add_transition(101, c5)
-c5.add_transition(102, c5)
-c5.add_transition(103, c5)
-c5.add_transition(104, c5)
-c5.add_transition(105, c5)
-c5.add_transition(106, c5)
-c5.add_transition(107, c5)
-c5.add_transition(108, c5)
-c5.add_transition(109, c5)
-c5.add_transition(110, c5)
-c5.add_transition(111, c5)
-c5.add_transition(112, c5)
-c5.add_transition(113, c5)
-c5.add_transition(114, c5)
-c5.add_transition(115, c5)
-c5.add_transition(116, c5)
-c5.add_transition(117, c5)
-c5.add_transition(118, c5)
-c5.add_transition(119, c5)
-c5.add_transition(120, c5)
-c5.add_transition(121, c5)
-c5.add_transition(122, c5)
-
-c6.add_transition(32, c6)
-c6.add_transition(61, c7)
-
-c7.add_transition(0, c9)
-c7.add_transition(1, c9)
-c7.add_transition(2, c9)
-c7.add_transition(3, c9)
-c7.add_transition(4, c9)
-c7.add_transition(5, c9)
-c7.add_transition(6, c9)
-c7.add_transition(7, c9)
-c7.add_transition(8, c9)
-c7.add_transition(11, c9)
-c7.add_transition(12, c9)
-c7.add_transition(13, c9)
-c7.add_transition(14, c9)
-c7.add_transition(15, c9)
-c7.add_transition(16, c9)
-c7.add_transition(17, c9)
-c7.add_transition(18, c9)
-c7.add_transition(19, c9)
-c7.add_transition(20, c9)
-c7.add_transition(21, c9)
-c7.add_transition(22, c9)
-c7.add_transition(23, c9)
-c7.add_transition(24, c9)
-c7.add_transition(25, c9)
-c7.add_transition(26, c9)
-c7.add_transition(27, c9)
-c7.add_transition(28, c9)
-c7.add_transition(29, c9)
-c7.add_transition(30, c9)
-c7.add_transition(31, c9)
-c7.add_transition(32, c7)
-c7.add_transition(33, c9)
-c7.add_transition(34, c9)
-c7.add_transition(35, c9)
-c7.add_transition(36, c9)
-c7.add_transition(37, c9)
-c7.add_transition(38, c9)
-c7.add_transition(39, c10)
-c7.add_transition(40, c9)
-c7.add_transition(41, c9)
-c7.add_transition(42, c9)
-c7.add_transition(43, c9)
-c7.add_transition(44, c9)
-c7.add_transition(45, c9)
-c7.add_transition(46, c9)
-c7.add_transition(47, c9)
-c7.add_transition(48, c9)
-c7.add_transition(49, c9)
-c7.add_transition(50, c9)
-c7.add_transition(51, c9)
-c7.add_transition(52, c9)
-c7.add_transition(53, c9)
-c7.add_transition(54, c9)
-c7.add_transition(55, c9)
-c7.add_transition(56, c9)
-c7.add_transition(57, c9)
-c7.add_transition(58, c9)
-c7.add_transition(59, c9)
-c7.add_transition(60, c9)
-c7.add_transition(61, c9)
-c7.add_transition(62, c9)
-c7.add_transition(63, c9)
-c7.add_transition(64, c9)
-c7.add_transition(65, c9)
-c7.add_transition(66, c9)
-c7.add_transition(67, c9)
-c7.add_transition(68, c9)
-c7.add_transition(69, c9)
-c7.add_transition(70, c9)
-c7.add_transition(71, c9)
-c7.add_transition(72, c9)
-c7.add_transition(73, c9)
-c7.add_transition(74, c9)
-c7.add_transition(75, c9)
-c7.add_transition(76, c9)
-c7.add_transition(77, c9)
-c7.add_transition(78, c9)
-c7.add_transition(79, c9)
-c7.add_transition(80, c9)
-c7.add_transition(81, c9)
-c7.add_transition(82, c9)
-c7.add_transition(83, c9)
-c7.add_transition(84, c9)
-c7.add_transition(85, c9)
-c7.add_transition(86, c9)
-c7.add_transition(87, c9)
-c7.add_transition(88, c9)
-c7.add_transition(89, c9)
-c7.add_transition(90, c9)
-c7.add_transition(91, c9)
-c7.add_transition(92, c9)
-c7.add_transition(93, c9)
-c7.add_transition(94, c9)
-c7.add_transition(95, c9)
-c7.add_transition(96, c9)
-c7.add_transition(97, c9)
-c7.add_transition(98, c9)
-c7.add_transition(99, c9)
-c7.add_transition(100, c9)
-c7.add_transition(101, c9)
-c7.add_transition(102, c9)
-c7.add_transition(103, c9)
-c7.add_transition(104, c9)
-c7.add_transition(105, c9)
-c7.add_transition(106, c9)
-c7.add_transition(107, c9)
-c7.add_transition(108, c9)
-c7.add_transition(109, c9)
-c7.add_transition(110, c9)
-c7.add_transition(111, c9)
-c7.add_transition(112, c9)
-c7.add_transition(113, c9)
-c7.add_transition(114, c9)
-c7.add_transition(115, c9)
-c7.add_transition(116, c9)
-c7.add_transition(117, c9)
-c7.add_transition(118, c9)
-c7.add_transition(119, c9)
-c7.add_transition(120, c9)
-c7.add_transition(121, c9)
-c7.add_transition(122, c9)
-c7.add_transition(123, c9)
-c7.add_transition(124, c9)
-c7.add_transition(125, c9)
-c7.add_transition(126, c9)
-c7.add_transition(127, c9)
-c7.add_transition(128, c9)
-c7.add_transition(129, c9)
-c7.add_transition(130, c9)
-c7.add_transition(131, c9)
-c7.add_transition(132, c9)
-c7.add_transition(133, c9)
-c7.add_transition(134, c9)
-c7.add_transition(135, c9)
-c7.add_transition(136, c9)
-c7.add_transition(137, c9)
-c7.add_transition(138, c9)
-c7.add_transition(139, c9)
-c7.add_transition(140, c9)
-c7.add_transition(141, c9)
-c7.add_transition(142, c9)
-c7.add_transition(143, c9)
-c7.add_transition(144, c9)
-c7.add_transition(145, c9)
-c7.add_transition(146, c9)
-c7.add_transition(147, c9)
-c7.add_transition(148, c9)
-c7.add_transition(149, c9)
-c7.add_transition(150, c9)
-c7.add_transition(151, c9)
-c7.add_transition(152, c9)
-c7.add_transition(153, c9)
-c7.add_transition(154, c9)
-c7.add_transition(155, c9)
-c7.add_transition(156, c9)
-c7.add_transition(157, c9)
-c7.add_transition(158, c9)
-c7.add_transition(159, c9)
-c7.add_transition(160, c9)
-c7.add_transition(161, c9)
-c7.add_transition(162, c9)
-c7.add_transition(163, c9)
-c7.add_transition(164, c9)
-c7.add_transition(165, c9)
-c7.add_transition(166, c9)
-c7.add_transition(167, c9)
-c7.add_transition(168, c9)
-c7.add_transition(169, c9)
-c7.add_transition(170, c9)
-c7.add_transition(171, c9)
-c7.add_transition(172, c9)
-c7.add_transition(173, c9)
-c7.add_transition(174, c9)
-c7.add_transition(175, c9)
-c7.add_transition(176, c9)
-c7.add_transition(177, c9)
-c7.add_transition(178, c9)
-c7.add_transition(179, c9)
-c7.add_transition(180, c9)
-c7.add_transition(181, c9)
-c7.add_transition(182, c9)
-c7.add_transition(183, c9)
-c7.add_transition(184, c9)
-c7.add_transition(185, c9)
-c7.add_transition(186, c9)
-c7.add_transition(187, c9)
-c7.add_transition(188, c9)
-c7.add_transition(189, c9)
-c7.add_transition(190, c9)
-c7.add_transition(191, c9)
-c7.add_transition(192, c9)
-c7.add_transition(193, c9)
-c7.add_transition(194, c9)
-c7.add_transition(195, c9)
-c7.add_transition(196, c9)
-c7.add_transition(197, c9)
-c7.add_transition(198, c9)
-c7.add_transition(199, c9)
-c7.add_transition(200, c9)
-c7.add_transition(201, c9)
-c7.add_transition(202, c9)
-c7.add_transition(203, c9)
-c7.add_transition(204, c9)
-c7.add_transition(205, c9)
-c7.add_transition(206, c9)
-c7.add_transition(207, c9)
-c7.add_transition(208, c9)
-c7.add_transition(209, c9)
-c7.add_transition(210, c9)
-c7.add_transition(211, c9)
-c7.add_transition(212, c9)
-c7.add_transition(213, c9)
-c7.add_transition(214, c9)
-c7.add_transition(215, c9)
-c7.add_transition(216, c9)
-c7.add_transition(217, c9)
-c7.add_transition(218, c9)
-c7.add_transition(219, c9)
-c7.add_transition(220, c9)
-c7.add_transition(221, c9)
-c7.add_transition(222, c9)
-c7.add_transition(223, c9)
-c7.add_transition(224, c9)
-c7.add_transition(225, c9)
-c7.add_transition(226, c9)
-c7.add_transition(227, c9)
-c7.add_transition(228, c9)
-c7.add_transition(229, c9)
-c7.add_transition(230, c9)
-c7.add_transition(231, c9)
-c7.add_transition(232, c9)
-c7.add_transition(233, c9)
-c7.add_transition(234, c9)
-c7.add_transition(235, c9)
-c7.add_transition(236, c9)
-c7.add_transition(237, c9)
-c7.add_transition(238, c9)
-c7.add_transition(239, c9)
-c7.add_transition(240, c9)
-c7.add_transition(241, c9)
-c7.add_transition(242, c9)
-c7.add_transition(243, c9)
-c7.add_transition(244, c9)
-c7.add_transition(245, c9)
-c7.add_transition(246, c9)
-c7.add_transition(247, c9)
-c7.add_transition(248, c9)
-c7.add_transition(249, c9)
-c7.add_transition(250, c9)
-c7.add_transition(251, c9)
-c7.add_transition(252, c9)
-c7.add_transition(253, c9)
-c7.add_transition(254, c9)
-c7.add_transition(255, c9)
-
-c9.isFinalState = True
-c9.addToken( 'ASSIGMENT')
-c9.add_transition(0, c9)
-c9.add_transition(1, c9)
-c9.add_transition(2, c9)
-c9.add_transition(3, c9)
-c9.add_transition(4, c9)
-c9.add_transition(5, c9)
-c9.add_transition(6, c9)
-c9.add_transition(7, c9)
-c9.add_transition(8, c9)
-c9.add_transition(11, c9)
-c9.add_transition(12, c9)
-c9.add_transition(13, c9)
-c9.add_transition(14, c9)
-c9.add_transition(15, c9)
-c9.add_transition(16, c9)
-c9.add_transition(17, c9)
-c9.add_transition(18, c9)
-c9.add_transition(19, c9)
-c9.add_transition(20, c9)
-c9.add_transition(21, c9)
-c9.add_transition(22, c9)
-c9.add_transition(23, c9)
-c9.add_transition(24, c9)
-c9.add_transition(25, c9)
-c9.add_transition(26, c9)
-c9.add_transition(27, c9)
-c9.add_transition(28, c9)
-c9.add_transition(29, c9)
-c9.add_transition(30, c9)
-c9.add_transition(31, c9)
-c9.add_transition(33, c9)
-c9.add_transition(34, c9)
-c9.add_transition(35, c9)
-c9.add_transition(36, c9)
-c9.add_transition(37, c9)
-c9.add_transition(38, c9)
-c9.add_transition(39, c10)
-c9.add_transition(40, c9)
-c9.add_transition(41, c9)
-c9.add_transition(42, c9)
-c9.add_transition(43, c9)
-c9.add_transition(44, c9)
-c9.add_transition(45, c9)
-c9.add_transition(46, c9)
-c9.add_transition(47, c9)
-c9.add_transition(48, c9)
-c9.add_transition(49, c9)
-c9.add_transition(50, c9)
-c9.add_transition(51, c9)
-c9.add_transition(52, c9)
-c9.add_transition(53, c9)
-c9.add_transition(54, c9)
-c9.add_transition(55, c9)
-c9.add_transition(56, c9)
-c9.add_transition(57, c9)
-c9.add_transition(58, c9)
-c9.add_transition(59, c9)
-c9.add_transition(60, c9)
-c9.add_transition(61, c9)
-c9.add_transition(62, c9)
-c9.add_transition(63, c9)
-c9.add_transition(64, c9)
-c9.add_transition(65, c9)
-c9.add_transition(66, c9)
-c9.add_transition(67, c9)
-c9.add_transition(68, c9)
-c9.add_transition(69, c9)
-c9.add_transition(70, c9)
-c9.add_transition(71, c9)
-c9.add_transition(72, c9)
-c9.add_transition(73, c9)
-c9.add_transition(74, c9)
-c9.add_transition(75, c9)
-c9.add_transition(76, c9)
-c9.add_transition(77, c9)
-c9.add_transition(78, c9)
-c9.add_transition(79, c9)
-c9.add_transition(80, c9)
-c9.add_transition(81, c9)
-c9.add_transition(82, c9)
-c9.add_transition(83, c9)
-c9.add_transition(84, c9)
-c9.add_transition(85, c9)
-c9.add_transition(86, c9)
-c9.add_transition(87, c9)
-c9.add_transition(88, c9)
-c9.add_transition(89, c9)
-c9.add_transition(90, c9)
-c9.add_transition(91, c9)
-c9.add_transition(92, c9)
-c9.add_transition(93, c9)
-c9.add_transition(94, c9)
-c9.add_transition(95, c9)
-c9.add_transition(96, c9)
-c9.add_transition(97, c9)
-c9.add_transition(98, c9)
-c9.add_transition(99, c9)
-c9.add_transition(100, c9)
-c9.add_transition(101, c9)
-c9.add_transition(102, c9)
-c9.add_transition(103, c9)
-c9.add_transition(104, c9)
-c9.add_transition(105, c9)
-c9.add_transition(106, c9)
-c9.add_transition(107, c9)
-c9.add_transition(108, c9)
-c9.add_transition(109, c9)
-c9.add_transition(110, c9)
-c9.add_transition(111, c9)
-c9.add_transition(112, c9)
-c9.add_transition(113, c9)
-c9.add_transition(114, c9)
-c9.add_transition(115, c9)
-c9.add_transition(116, c9)
-c9.add_transition(117, c9)
-c9.add_transition(118, c9)
-c9.add_transition(119, c9)
-c9.add_transition(120, c9)
-c9.add_transition(121, c9)
-c9.add_transition(122, c9)
-c9.add_transition(123, c9)
-c9.add_transition(124, c9)
-c9.add_transition(125, c9)
-c9.add_transition(126, c9)
-c9.add_transition(127, c9)
-c9.add_transition(128, c9)
-c9.add_transition(129, c9)
-c9.add_transition(130, c9)
-c9.add_transition(131, c9)
-c9.add_transition(132, c9)
-c9.add_transition(133, c9)
-c9.add_transition(134, c9)
-c9.add_transition(135, c9)
-c9.add_transition(136, c9)
-c9.add_transition(137, c9)
-c9.add_transition(138, c9)
-c9.add_transition(139, c9)
-c9.add_transition(140, c9)
-c9.add_transition(141, c9)
-c9.add_transition(142, c9)
-c9.add_transition(143, c9)
-c9.add_transition(144, c9)
-c9.add_transition(145, c9)
-c9.add_transition(146, c9)
-c9.add_transition(147, c9)
-c9.add_transition(148, c9)
-c9.add_transition(149, c9)
-c9.add_transition(150, c9)
-c9.add_transition(151, c9)
-c9.add_transition(152, c9)
-c9.add_transition(153, c9)
-c9.add_transition(154, c9)
-c9.add_transition(155, c9)
-c9.add_transition(156, c9)
-c9.add_transition(157, c9)
-c9.add_transition(158, c9)
-c9.add_transition(159, c9)
-c9.add_transition(160, c9)
-c9.add_transition(161, c9)
-c9.add_transition(162, c9)
-c9.add_transition(163, c9)
-c9.add_transition(164, c9)
-c9.add_transition(165, c9)
-c9.add_transition(166, c9)
-c9.add_transition(167, c9)
-c9.add_transition(168, c9)
-c9.add_transition(169, c9)
-c9.add_transition(170, c9)
-c9.add_transition(171, c9)
-c9.add_transition(172, c9)
-c9.add_transition(173, c9)
-c9.add_transition(174, c9)
-c9.add_transition(175, c9)
-c9.add_transition(176, c9)
-c9.add_transition(177, c9)
-c9.add_transition(178, c9)
-c9.add_transition(179, c9)
-c9.add_transition(180, c9)
-c9.add_transition(181, c9)
-c9.add_transition(182, c9)
-c9.add_transition(183, c9)
-c9.add_transition(184, c9)
-c9.add_transition(185, c9)
-c9.add_transition(186, c9)
-c9.add_transition(187, c9)
-c9.add_transition(188, c9)
-c9.add_transition(189, c9)
-c9.add_transition(190, c9)
-c9.add_transition(191, c9)
-c9.add_transition(192, c9)
-c9.add_transition(193, c9)
-c9.add_transition(194, c9)
-c9.add_transition(195, c9)
-c9.add_transition(196, c9)
-c9.add_transition(197, c9)
-c9.add_transition(198, c9)
-c9.add_transition(199, c9)
-c9.add_transition(200, c9)
-c9.add_transition(201, c9)
-c9.add_transition(202, c9)
-c9.add_transition(203, c9)
-c9.add_transition(204, c9)
-c9.add_transition(205, c9)
-c9.add_transition(206, c9)
-c9.add_transition(207, c9)
-c9.add_transition(208, c9)
-c9.add_transition(209, c9)
-c9.add_transition(210, c9)
-c9.add_transition(211, c9)
-c9.add_transition(212, c9)
-c9.add_transition(213, c9)
-c9.add_transition(214, c9)
-c9.add_transition(215, c9)
-c9.add_transition(216, c9)
-c9.add_transition(217, c9)
-c9.add_transition(218, c9)
-c9.add_transition(219, c9)
-c9.add_transition(220, c9)
-c9.add_transition(221, c9)
-c9.add_transition(222, c9)
-c9.add_transition(223, c9)
-c9.add_transition(224, c9)
-c9.add_transition(225, c9)
-c9.add_transition(226, c9)
-c9.add_transition(227, c9)
-c9.add_transition(228, c9)
-c9.add_transition(229, c9)
-c9.add_transition(230, c9)
-c9.add_transition(231, c9)
-c9.add_transition(232, c9)
-c9.add_transition(233, c9)
-c9.add_transition(234, c9)
-c9.add_transition(235, c9)
-c9.add_transition(236, c9)
-c9.add_transition(237, c9)
-c9.add_transition(238, c9)
-c9.add_transition(239, c9)
-c9.add_transition(240, c9)
-c9.add_transition(241, c9)
-c9.add_transition(242, c9)
-c9.add_transition(243, c9)
-c9.add_transition(244, c9)
-c9.add_transition(245, c9)
-c9.add_transition(246, c9)
-c9.add_transition(247, c9)
-c9.add_transition(248, c9)
-c9.add_transition(249, c9)
-c9.add_transition(250, c9)
-c9.add_transition(251, c9)
-c9.add_transition(252, c9)
-c9.add_transition(253, c9)
-c9.add_transition(254, c9)
-c9.add_transition(255, c9)
-
-c10.isFinalState = True
-c10.addToken( 'ASSIGMENT')
-c10.add_transition(0, c9)
-c10.add_transition(1, c9)
-c10.add_transition(2, c9)
-c10.add_transition(3, c9)
-c10.add_transition(4, c9)
-c10.add_transition(5, c9)
-c10.add_transition(6, c9)
-c10.add_transition(7, c9)
-c10.add_transition(8, c9)
-c10.add_transition(9, c8)
-c10.add_transition(10, c8)
-c10.add_transition(11, c9)
-c10.add_transition(12, c9)
-c10.add_transition(13, c9)
-c10.add_transition(14, c9)
-c10.add_transition(15, c9)
-c10.add_transition(16, c9)
-c10.add_transition(17, c9)
-c10.add_transition(18, c9)
-c10.add_transition(19, c9)
-c10.add_transition(20, c9)
-c10.add_transition(21, c9)
-c10.add_transition(22, c9)
-c10.add_transition(23, c9)
-c10.add_transition(24, c9)
-c10.add_transition(25, c9)
-c10.add_transition(26, c9)
-c10.add_transition(27, c9)
-c10.add_transition(28, c9)
-c10.add_transition(29, c9)
-c10.add_transition(30, c9)
-c10.add_transition(31, c9)
-c10.add_transition(32, c8)
-c10.add_transition(33, c9)
-c10.add_transition(34, c9)
-c10.add_transition(35, c9)
-c10.add_transition(36, c9)
-c10.add_transition(37, c9)
-c10.add_transition(38, c9)
-c10.add_transition(39, c10)
-c10.add_transition(40, c9)
-c10.add_transition(41, c9)
-c10.add_transition(42, c9)
-c10.add_transition(43, c9)
-c10.add_transition(44, c9)
-c10.add_transition(45, c9)
-c10.add_transition(46, c9)
-c10.add_transition(47, c9)
-c10.add_transition(48, c9)
-c10.add_transition(49, c9)
-c10.add_transition(50, c9)
-c10.add_transition(51, c9)
-c10.add_transition(52, c9)
-c10.add_transition(53, c9)
-c10.add_transition(54, c9)
-c10.add_transition(55, c9)
-c10.add_transition(56, c9)
-c10.add_transition(57, c9)
-c10.add_transition(58, c9)
-c10.add_transition(59, c9)
-c10.add_transition(60, c9)
-c10.add_transition(61, c9)
-c10.add_transition(62, c9)
-c10.add_transition(63, c9)
-c10.add_transition(64, c9)
-c10.add_transition(65, c9)
-c10.add_transition(66, c9)
-c10.add_transition(67, c9)
-c10.add_transition(68, c9)
-c10.add_transition(69, c9)
-c10.add_transition(70, c9)
-c10.add_transition(71, c9)
-c10.add_transition(72, c9)
-c10.add_transition(73, c9)
-c10.add_transition(74, c9)
-c10.add_transition(75, c9)
-c10.add_transition(76, c9)
-c10.add_transition(77, c9)
-c10.add_transition(78, c9)
-c10.add_transition(79, c9)
-c10.add_transition(80, c9)
-c10.add_transition(81, c9)
-c10.add_transition(82, c9)
-c10.add_transition(83, c9)
-c10.add_transition(84, c9)
-c10.add_transition(85, c9)
-c10.add_transition(86, c9)
-c10.add_transition(87, c9)
-c10.add_transition(88, c9)
-c10.add_transition(89, c9)
-c10.add_transition(90, c9)
-c10.add_transition(91, c9)
-c10.add_transition(92, c9)
-c10.add_transition(93, c9)
-c10.add_transition(94, c9)
-c10.add_transition(95, c9)
-c10.add_transition(96, c9)
-c10.add_transition(97, c9)
-c10.add_transition(98, c9)
-c10.add_transition(99, c9)
-c10.add_transition(100, c9)
-c10.add_transition(101, c9)
-c10.add_transition(102, c9)
-c10.add_transition(103, c9)
-c10.add_transition(104, c9)
-c10.add_transition(105, c9)
-c10.add_transition(106, c9)
-c10.add_transition(107, c9)
-c10.add_transition(108, c9)
-c10.add_transition(109, c9)
-c10.add_transition(110, c9)
-c10.add_transition(111, c9)
-c10.add_transition(112, c9)
-c10.add_transition(113, c9)
-c10.add_transition(114, c9)
-c10.add_transition(115, c9)
-c10.add_transition(116, c9)
-c10.add_transition(117, c9)
-c10.add_transition(118, c9)
-c10.add_transition(119, c9)
-c10.add_transition(120, c9)
-c10.add_transition(121, c9)
-c10.add_transition(122, c9)
-c10.add_transition(123, c9)
-c10.add_transition(124, c9)
-c10.add_transition(125, c9)
-c10.add_transition(126, c9)
-c10.add_transition(127, c9)
-c10.add_transition(128, c9)
-c10.add_transition(129, c9)
-c10.add_transition(130, c9)
-c10.add_transition(131, c9)
-c10.add_transition(132, c9)
-c10.add_transition(133, c9)
-c10.add_transition(134, c9)
-c10.add_transition(135, c9)
-c10.add_transition(136, c9)
-c10.add_transition(137, c9)
-c10.add_transition(138, c9)
-c10.add_transition(139, c9)
-c10.add_transition(140, c9)
-c10.add_transition(141, c9)
-c10.add_transition(142, c9)
-c10.add_transition(143, c9)
-c10.add_transition(144, c9)
-c10.add_transition(145, c9)
-c10.add_transition(146, c9)
-c10.add_transition(147, c9)
-c10.add_transition(148, c9)
-c10.add_transition(149, c9)
-c10.add_transition(150, c9)
-c10.add_transition(151, c9)
-c10.add_transition(152, c9)
-c10.add_transition(153, c9)
-c10.add_transition(154, c9)
-c10.add_transition(155, c9)
-c10.add_transition(156, c9)
-c10.add_transition(157, c9)
-c10.add_transition(158, c9)
-c10.add_transition(159, c9)
-c10.add_transition(160, c9)
-c10.add_transition(161, c9)
-c10.add_transition(162, c9)
-c10.add_transition(163, c9)
-c10.add_transition(164, c9)
-c10.add_transition(165, c9)
-c10.add_transition(166, c9)
-c10.add_transition(167, c9)
-c10.add_transition(168, c9)
-c10.add_transition(169, c9)
-c10.add_transition(170, c9)
-c10.add_transition(171, c9)
-c10.add_transition(172, c9)
-c10.add_transition(173, c9)
-c10.add_transition(174, c9)
-c10.add_transition(175, c9)
-c10.add_transition(176, c9)
-c10.add_transition(177, c9)
-c10.add_transition(178, c9)
-c10.add_transition(179, c9)
-c10.add_transition(180, c9)
-c10.add_transition(181, c9)
-c10.add_transition(182, c9)
-c10.add_transition(183, c9)
-c10.add_transition(184, c9)
-c10.add_transition(185, c9)
-c10.add_transition(186, c9)
-c10.add_transition(187, c9)
-c10.add_transition(188, c9)
-c10.add_transition(189, c9)
-c10.add_transition(190, c9)
-c10.add_transition(191, c9)
-c10.add_transition(192, c9)
-c10.add_transition(193, c9)
-c10.add_transition(194, c9)
-c10.add_transition(195, c9)
-c10.add_transition(196, c9)
-c10.add_transition(197, c9)
-c10.add_transition(198, c9)
-c10.add_transition(199, c9)
-c10.add_transition(200, c9)
-c10.add_transition(201, c9)
-c10.add_transition(202, c9)
-c10.add_transition(203, c9)
-c10.add_transition(204, c9)
-c10.add_transition(205, c9)
-c10.add_transition(206, c9)
-c10.add_transition(207, c9)
-c10.add_transition(208, c9)
-c10.add_transition(209, c9)
-c10.add_transition(210, c9)
-c10.add_transition(211, c9)
-c10.add_transition(212, c9)
-c10.add_transition(213, c9)
-c10.add_transition(214, c9)
-c10.add_transition(215, c9)
-c10.add_transition(216, c9)
-c10.add_transition(217, c9)
-c10.add_transition(218, c9)
-c10.add_transition(219, c9)
-c10.add_transition(220, c9)
-c10.add_transition(221, c9)
-c10.add_transition(222, c9)
-c10.add_transition(223, c9)
-c10.add_transition(224, c9)
-c10.add_transition(225, c9)
-c10.add_transition(226, c9)
-c10.add_transition(227, c9)
-c10.add_transition(228, c9)
-c10.add_transition(229, c9)
-c10.add_transition(230, c9)
-c10.add_transition(231, c9)
-c10.add_transition(232, c9)
-c10.add_transition(233, c9)
-c10.add_transition(234, c9)
-c10.add_transition(235, c9)
-c10.add_transition(236, c9)
-c10.add_transition(237, c9)
-c10.add_transition(238, c9)
-c10.add_transition(239, c9)
-c10.add_transition(240, c9)
-c10.add_transition(241, c9)
-c10.add_transition(242, c9)
-c10.add_transition(243, c9)
-c10.add_transition(244, c9)
-c10.add_transition(245, c9)
-c10.add_transition(246, c9)
-c10.add_transition(247, c9)
-c10.add_transition(248, c9)
-c10.add_transition(249, c9)
-c10.add_transition(250, c9)
-c10.add_transition(251, c9)
-c10.add_transition(252, c9)
-c10.add_transition(253, c9)
-c10.add_transition(254, c9)
-c10.add_transition(255, c9)
-
-c8.add_transition(39, c9)
-
-e1.add_transition(117, e2)
-
-e2.add_transition(108, e3)
-
-e3.add_transition(101, e4)
-
-e4.add_transition(32, e5)
-
-e5.add_transition(32, e5)
-e5.add_transition(65, e6)
-e5.add_transition(66, e6)
-e5.add_transition(67, e6)
-e5.add_transition(68, e6)
-e5.add_transition(69, e6)
-e5.add_transition(70, e6)
-e5.add_transition(71, e6)
-e5.add_transition(72, e6)
-e5.add_transition(73, e6)
-e5.add_transition(74, e6)
-e5.add_transition(75, e6)
-e5.add_transition(76, e6)
-e5.add_transition(77, e6)
-e5.add_transition(78, e6)
-e5.add_transition(79, e6)
-e5.add_transition(80, e6)
-e5.add_transition(81, e6)
-e5.add_transition(82, e6)
-e5.add_transition(83, e6)
-e5.add_transition(84, e6)
-e5.add_transition(85, e6)
-e5.add_transition(86, e6)
-e5.add_transition(87, e6)
-e5.add_transition(88, e6)
-e5.add_transition(89, e6)
-e5.add_transition(90, e6)
-e5.add_transition(97, e6)
-e5.add_transition(98, e6)
-e5.add_transition(99, e6)
-e5.add_transition(100, e6)
-e5.add_transition(101, e6)
-e5.add_transition(102, e6)
-e5.add_transition(103, e6)
-e5.add_transition(104, e6)
-e5.add_transition(105, e6)
-e5.add_transition(106, e6)
-e5.add_transition(107, e6)
-e5.add_transition(108, e6)
-e5.add_transition(109, e6)
-e5.add_transition(110, e6)
-e5.add_transition(111, e6)
-e5.add_transition(112, e6)
-e5.add_transition(113, e6)
-e5.add_transition(114, e6)
-e5.add_transition(115, e6)
-e5.add_transition(116, e6)
-e5.add_transition(117, e6)
-e5.add_transition(118, e6)
-e5.add_transition(119, e6)
-e5.add_transition(120, e6)
-e5.add_transition(121, e6)
-e5.add_transition(122, e6)
-
-e6.add_transition(32, e7)
-e6.add_transition(48, e6)
-e6.add_transition(49, e6)
-e6.add_transition(50, e6)
-e6.add_transition(51, e6)
-e6.add_transition(52, e6)
-e6.add_transition(53, e6)
-e6.add_transition(54, e6)
-e6.add_transition(55, e6)
-e6.add_transition(56, e6)
-e6.add_transition(57, e6)
-e6.add_transition(61, e8)
-e6.add_transition(65, e6)
-e6.add_transition(66, e6)
-e6.add_transition(67, e6)
-e6.add_transition(68, e6)
-e6.add_transition(69, e6)
-e6.add_transition(70, e6)
-e6.add_transition(71, e6)
-e6.add_transition(72, e6)
-e6.add_transition(73, e6)
-e6.add_transition(74, e6)
-e6.add_transition(75, e6)
-e6.add_transition(76, e6)
-e6.add_transition(77, e6)
-e6.add_transition(78, e6)
-e6.add_transition(79, e6)
-e6.add_transition(80, e6)
-e6.add_transition(81, e6)
-e6.add_transition(82, e6)
-e6.add_transition(83, e6)
-e6.add_transition(84, e6)
-e6.add_transition(85, e6)
-e6.add_transition(86, e6)
-e6.add_transition(87, e6)
-e6.add_transition(88, e6)
-e6.add_transition(89, e6)
-e6.add_transition(90, e6)
-e6.add_transition(97, e6)
-e6.add_transition(98, e6)
-e6.add_transition(99, e6)
-e6.add_transition(100, e6)
-e6.add_transition(101, e6)
-e6.add_transition(102, e6)
-e6.add_transition(103, e6)
-e6.add_transition(104, e6)
-e6.add_transition(105, e6)
-e6.add_transition(106, e6)
-e6.add_transition(107, e6)
-e6.add_transition(108, e6)
-e6.add_transition(109, e6)
-e6.add_transition(110, e6)
-e6.add_transition(111, e6)
-e6.add_transition(112, e6)
-e6.add_transition(113, e6)
-e6.add_transition(114, e6)
-e6.add_transition(115, e6)
-e6.add_transition(116, e6)
-e6.add_transition(117, e6)
-e6.add_transition(118, e6)
-e6.add_transition(119, e6)
-e6.add_transition(120, e6)
-e6.add_transition(121, e6)
-e6.add_transition(122, e6)
-
-e7.add_transition(32, e7)
-e7.add_transition(61, e8)
-
-e8.isFinalState = True
-e8.addToken( 'RULE')
-
-g1.add_transition(42, g2)
-
-g2.isFinalState = True
-g2.addToken( 'COM')
-
-h1.add_transition(41, h2)
-
-h2.isFinalState = True
-h2.addToken( 'ENDCOM')
-
-i1.isFinalState = True
-i1.addToken( 'OR')
-
-f1.isFinalState = True
-f1.addToken( 'WHITESPACE')
-f1.add_transition(32, f1)
-f1.add_transition(9, f1)
-f1.add_transition(10, f1)
-
@@ -1,266 +0,0 @@
-from Machines_gen_usage.Classes_ import State
-
-a2 = State('a2')
-a1 = State('a1')
-a0 = State('a0')
-a0.add_transition(91, a1)
-
-a1.add_transition(0, a1)
-a1.add_transition(1, a1)
-a1.add_transition(2, a1)
-a1.add_transition(3, a1)
-a1.add_transition(4, a1)
-a1.add_transition(5, a1)
-a1.add_transition(6, a1)
-a1.add_transition(7, a1)
-a1.add_transition(8, a1)
-a1.add_transition(9, a1)
-a1.add_transition(10, a1)
-a1.add_transition(11, a1)
-a1.add_transition(12, a1)
-a1.add_transition(13, a1)
-a1.add_transition(14, a1)
-a1.add_transition(15, a1)
-a1.add_transition(16, a1)
-a1.add_transition(17, a1)
-a1.add_transition(18, a1)
-a1.add_transition(19, a1)
-a1.add_transition(20, a1)
-a1.add_transition(21, a1)
-a1.add_transition(22, a1)
-a1.add_transition(23, a1)
-a1.add_transition(24, a1)
-a1.add_transition(25, a1)
-a1.add_transition(26, a1)
-a1.add_transition(27, a1)
-a1.add_transition(28, a1)
-a1.add_transition(29, a1)
-a1.add_transition(30, a1)
-a1.add_transition(31, a1)
-a1.add_transition(32, a1)
-a1.add_transition(33, a1)
-a1.add_transition(34, a1)
-a1.add_transition(35, a1)
-a1.add_transition(36, a1)
-a1.add_transition(37, a1)
-a1.add_transition(38, a1)
-a1.add_transition(39, a1)
-a1.add_transition(40, a1)
-a1.add_transition(41, a1)
-a1.add_transition(42, a1)
-a1.add_transition(43, a1)
-a1.add_transition(44, a1)
-a1.add_transition(45, a1)
-a1.add_transition(46, a1)
-a1.add_transition(47, a1)
-a1.add_transition(48, a1)
-a1.add_transition(49, a1)
-a1.add_transition(50, a1)
-a1.add_transition(51, a1)
-a1.add_transition(52, a1)
-a1.add_transition(53, a1)
-a1.add_transition(54, a1)
-a1.add_transition(55, a1)
-a1.add_transition(56, a1)
-a1.add_transition(57, a1)
-a1.add_transition(58, a1)
-a1.add_transition(59, a1)
-a1.add_transition(60, a1)
-a1.add_transition(61, a1)
-a1.add_transition(62, a1)
-a1.add_transition(63, a1)
-a1.add_transition(64, a1)
-a1.add_transition(65, a1)
-a1.add_transition(66, a1)
-a1.add_transition(67, a1)
-a1.add_transition(68, a1)
-a1.add_transition(69, a1)
-a1.add_transition(70, a1)
-a1.add_transition(71, a1)
-a1.add_transition(72, a1)
-a1.add_transition(73, a1)
-a1.add_transition(74, a1)
-a1.add_transition(75, a1)
-a1.add_transition(76, a1)
-a1.add_transition(77, a1)
-a1.add_transition(78, a1)
-a1.add_transition(79, a1)
-a1.add_transition(80, a1)
-a1.add_transition(81, a1)
-a1.add_transition(82, a1)
-a1.add_transition(83, a1)
-a1.add_transition(84, a1)
-a1.add_transition(85, a1)
-a1.add_transition(86, a1)
-a1.add_transition(87, a1)
-a1.add_transition(88, a1)
-a1.add_transition(89, a1)
-a1.add_transition(90, a1)
-a1.add_transition(92, a1)
-a1.add_transition(93, a2)
-a1.add_transition(94, a1)
-a1.add_transition(95, a1)
-a1.add_transition(96, a1)
-a1.add_transition(97, a1)
-a1.add_transition(98, a1)
-a1.add_transition(99, a1)
-a1.add_transition(100, a1)
-a1.add_transition(101, a1)
-a1.add_transition(102, a1)
-a1.add_transition(103, a1)
-a1.add_transition(104, a1)
-a1.add_transition(105, a1)
-a1.add_transition(106, a1)
-a1.add_transition(107, a1)
-a1.add_transition(108, a1)
-a1.add_transition(109, a1)
-a1.add_transition(110, a1)
-a1.add_transition(111, a1)
-a1.add_transition(112, a1)
-a1.add_transition(113, a1)
-a1.add_transition(114, a1)
-a1.add_transition(115, a1)
-a1.add_transition(116, a1)
-a1.add_transition(117, a1)
-a1.add_transition(118, a1)
-a1.add_transition(119, a1)
-a1.add_transition(120, a1)
-a1.add_transition(121, a1)
-a1.add_transition(122, a1)
-a1.add_transition(123, a1)
-a1.add_transition(124, a1)
-a1.add_transition(125, a1)
-a1.add_transition(126, a1)
-a1.add_transition(127, a1)
-a1.add_transition(128, a1)
-a1.add_transition(129, a1)
-a1.add_transition(130, a1)
-a1.add_transition(131, a1)
-a1.add_transition(132, a1)
-a1.add_transition(133, a1)
-a1.add_transition(134, a1)
-a1.add_transition(135, a1)
-a1.add_transition(136, a1)
-a1.add_transition(137, a1)
-a1.add_transition(138, a1)
-a1.add_transition(139, a1)
-a1.add_transition(140, a1)
-a1.add_transition(141, a1)
-a1.add_transition(142, a1)
-a1.add_transition(143, a1)
-a1.add_transition(144, a1)
-a1.add_transition(145, a1)
-a1.add_transition(146, a1)
-a1.add_transition(147, a1)
-a1.add_transition(148, a1)
-a1.add_transition(149, a1)
-a1.add_transition(150, a1)
-a1.add_transition(151, a1)
-a1.add_transition(152, a1)
-a1.add_transition(153, a1)
-a1.add_transition(154, a1)
-a1.add_transition(155, a1)
-a1.add_transition(156, a1)
-a1.add_transition(157, a1)
-a1.add_transition(158, a1)
-a1.add_transition(159, a1)
-a1.add_transition(160, a1)
-a1.add_transition(161, a1)
-a1.add_transition(162, a1)
-a1.add_transition(163, a1)
-a1.add_transition(164, a1)
-a1.add_transition(165, a1)
-a1.add_transition(166, a1)
-a1.add_transition(167, a1)
-a1.add_transition(168, a1)
-a1.add_transition(169, a1)
-a1.add_transition(170, a1)
-a1.add_transition(171, a1)
-a1.add_transition(172, a1)
-a1.add_transition(173, a1)
-a1.add_transition(174, a1)
-a1.add_transition(175, a1)
-a1.add_transition(176, a1)
-a1.add_transition(177, a1)
-a1.add_transition(178, a1)
-a1.add_transition(179, a1)
-a1.add_transition(180, a1)
-a1.add_transition(181, a1)
-a1.add_transition(182, a1)
-a1.add_transition(183, a1)
-a1.add_transition(184, a1)
-a1.add_transition(185, a1)
-a1.add_transition(186, a1)
-a1.add_transition(187, a1)
-a1.add_transition(188, a1)
-a1.add_transition(189, a1)
-a1.add_transition(190, a1)
-a1.add_transition(191, a1)
-a1.add_transition(192, a1)
-a1.add_transition(193, a1)
-a1.add_transition(194, a1)
-a1.add_transition(195, a1)
-a1.add_transition(196, a1)
-a1.add_transition(197, a1)
-a1.add_transition(198, a1)
-a1.add_transition(199, a1)
-a1.add_transition(200, a1)
-a1.add_transition(201, a1)
-a1.add_transition(202, a1)
-a1.add_transition(203, a1)
-a1.add_transition(204, a1)
-a1.add_transition(205, a1)
-a1.add_transition(206, a1)
-a1.add_transition(207, a1)
-a1.add_transition(208, a1)
-a1.add_transition(209, a1)
-a1.add_transition(210, a1)
-a1.add_transition(211, a1)
-a1.add_transition(212, a1)
-a1.add_transition(213, a1)
-a1.add_transition(214, a1)
-a1.add_transition(215, a1)
-a1.add_transition(216, a1)
-a1.add_transition(217, a1)
-a1.add_transition(218, a1)
-a1.add_transition(219, a1)
-a1.add_transition(220, a1)
-a1.add_transition(221, a1)
-a1.add_transition(222, a1)
-a1.add_transition(223, a1)
-a1.add_transition(224, a1)
-a1.add_transition(225, a1)
-a1.add_transition(226, a1)
-a1.add_transition(227, a1)
-a1.add_transition(228, a1)
-a1.add_transition(229, a1)
-a1.add_transition(230, a1)
-a1.add_transition(231, a1)
-a1.add_transition(232, a1)
-a1.add_transition(233, a1)
-a1.add_transition(234, a1)
-a1.add_transition(235, a1)
-a1.add_transition(236, a1)
-a1.add_transition(237, a1)
-a1.add_transition(238, a1)
-a1.add_transition(239, a1)
-a1.add_transition(240, a1)
-a1.add_transition(241, a1)
-a1.add_transition(242, a1)
-a1.add_transition(243, a1)
-a1.add_transition(244, a1)
-a1.add_transition(245, a1)
-a1.add_transition(246, a1)
-a1.add_transition(247, a1)
-a1.add_transition(248, a1)
-a1.add_transition(249, a1)
-a1.add_transition(250, a1)
-a1.add_transition(251, a1)
-a1.add_transition(252, a1)
-a1.add_transition(253, a1)
-a1.add_transition(254, a1)
-a1.add_transition(255, a1)
-
-a2.isFinalState = True
-a2.addToken( 'IN_SET')
-
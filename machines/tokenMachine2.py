@@ -1,1816 +0,0 @@
-from Machines_gen_usage.Classes_ import State
-
-c1 = State('c1')
-b5 = State('b5')
-b4 = State('b4')
-b2 = State('b2')
-b3 = State('b3')
-b1 = State('b1')
-b6 = State('b6')
-a3 = State('a3')
-a2 = State('a2')
-a1 = State('a1')
-a0 = State('a0')
-a0.add_transition(123, a1)
-a0.add_transition(0, b6)
-a0.add_transition(1, b6)
-a0.add_transition(2, b6)
-a0.add_transition(3, b6)
-a0.add_transition(4, b6)
-a0.add_transition(5, b6)
-a0.add_transition(6, b6)
-a0.add_transition(7, b6)
-a0.add_transition(8, b6)
-a0.add_transition(11, b6)
-a0.add_transition(12, b6)
-a0.add_transition(13, b6)
-a0.add_transition(14, b6)
-a0.add_transition(15, b6)
-a0.add_transition(16, b6)
-a0.add_transition(17, b6)
-a0.add_transition(18, b6)
-a0.add_transition(19, b6)
-a0.add_transition(20, b6)
-a0.add_transition(21, b6)
-a0.add_transition(22, b6)
-a0.add_transition(23, b6)
-a0.add_transition(24, b6)
-a0.add_transition(25, b6)
-a0.add_transition(26, b6)
-a0.add_transition(27, b6)
-a0.add_transition(28, b6)
-a0.add_transition(29, b6)
-a0.add_transition(30, b6)
-a0.add_transition(31, b6)
-a0.add_transition(33, b6)
-a0.add_transition(34, b1)
-a0.add_transition(35, b6)
-a0.add_transition(36, b6)
-a0.add_transition(37, b6)
-a0.add_transition(38, b6)
-a0.add_transition(39, b2)
-a0.add_transition(40, b6)
-a0.add_transition(41, b6)
-a0.add_transition(42, b6)
-a0.add_transition(43, b6)
-a0.add_transition(44, b6)
-a0.add_transition(45, b6)
-a0.add_transition(46, b6)
-a0.add_transition(47, b6)
-a0.add_transition(48, b6)
-a0.add_transition(49, b6)
-a0.add_transition(50, b6)
-a0.add_transition(51, b6)
-a0.add_transition(52, b6)
-a0.add_transition(53, b6)
-a0.add_transition(54, b6)
-a0.add_transition(55, b6)
-a0.add_transition(56, b6)
-a0.add_transition(57, b6)
-a0.add_transition(58, b6)
-a0.add_transition(59, b6)
-a0.add_transition(60, b6)
-a0.add_transition(61, b6)
-a0.add_transition(62, b6)
-a0.add_transition(63, b6)
-a0.add_transition(64, b6)
-a0.add_transition(65, b6)
-a0.add_transition(66, b6)
-a0.add_transition(67, b6)
-a0.add_transition(68, b6)
-a0.add_transition(69, b6)
-a0.add_transition(70, b6)
-a0.add_transition(71, b6)
-a0.add_transition(72, b6)
-a0.add_transition(73, b6)
-a0.add_transition(74, b6)
-a0.add_transition(75, b6)
-a0.add_transition(76, b6)
-a0.add_transition(77, b6)
-a0.add_transition(78, b6)
-a0.add_transition(79, b6)
-a0.add_transition(80, b6)
-a0.add_transition(81, b6)
-a0.add_transition(82, b6)
-a0.add_transition(83, b6)
-a0.add_transition(84, b6)
-a0.add_transition(85, b6)
-a0.add_transition(86, b6)
-a0.add_transition(87, b6)
-a0.add_transition(88, b6)
-a0.add_transition(89, b6)
-a0.add_transition(90, b6)
-a0.add_transition(91, b6)
-a0.add_transition(92, b6)
-a0.add_transition(93, b6)
-a0.add_transition(94, b6)
-a0.add_transition(95, b6)
-a0.add_transition(96, b6)
-a0.add_transition(97, b6)
-a0.add_transition(98, b6)
-a0.add_transition(99, b6)
-a0.add_transition(100, b6)
-a0.add_transition(101, b6)
-a0.add_transition(102, b6)
-a0.add_transition(103, b6)
-a0.add_transition(104, b6)
-a0.add_transition(105, b6)
-a0.add_transition(106, b6)
-a0.add_transition(107, b6)
-a0.add_transition(108, b6)
-a0.add_transition(109, b6)
-a0.add_transition(110, b6)
-a0.add_transition(111, b6)
-a0.add_transition(112, b6)
-a0.add_transition(113, b6)
-a0.add_transition(114, b6)
-a0.add_transition(115, b6)
-a0.add_transition(116, b6)
-a0.add_transition(117, b6)
-a0.add_transition(118, b6)
-a0.add_transition(119, b6)
-a0.add_transition(120, b6)
-a0.add_transition(121, b6)
-a0.add_transition(122, b6)
-a0.add_transition(124, b6)
-a0.add_transition(124, c1)
-a0.add_transition(126, b6)
-a0.add_transition(127, b6)
-a0.add_transition(128, b6)
-a0.add_transition(129, b6)
-a0.add_transition(130, b6)
-a0.add_transition(131, b6)
-a0.add_transition(132, b6)
-a0.add_transition(133, b6)
-a0.add_transition(134, b6)
-a0.add_transition(135, b6)
-a0.add_transition(136, b6)
-a0.add_transition(137, b6)
-a0.add_transition(138, b6)
-a0.add_transition(139, b6)
-a0.add_transition(140, b6)
-a0.add_transition(141, b6)
-a0.add_transition(142, b6)
-a0.add_transition(143, b6)
-a0.add_transition(144, b6)
-a0.add_transition(145, b6)
-a0.add_transition(146, b6)
-a0.add_transition(147, b6)
-a0.add_transition(148, b6)
-a0.add_transition(149, b6)
-a0.add_transition(150, b6)
-a0.add_transition(151, b6)
-a0.add_transition(152, b6)
-a0.add_transition(153, b6)
-a0.add_transition(154, b6)
-a0.add_transition(155, b6)
-a0.add_transition(156, b6)
-a0.add_transition(157, b6)
-a0.add_transition(158, b6)
-a0.add_transition(159, b6)
-a0.add_transition(160, b6)
-a0.add_transition(161, b6)
-a0.add_transition(162, b6)
-a0.add_transition(163, b6)
-a0.add_transition(164, b6)
-a0.add_transition(165, b6)
-a0.add_transition(166, b6)
-a0.add_transition(167, b6)
-a0.add_transition(168, b6)
-a0.add_transition(169, b6)
-a0.add_transition(170, b6)
-a0.add_transition(171, b6)
-a0.add_transition(172, b6)
-a0.add_transition(173, b6)
-a0.add_transition(174, b6)
-a0.add_transition(175, b6)
-a0.add_transition(176, b6)
-a0.add_transition(177, b6)
-a0.add_transition(178, b6)
-a0.add_transition(179, b6)
-a0.add_transition(180, b6)
-a0.add_transition(181, b6)
-a0.add_transition(182, b6)
-a0.add_transition(183, b6)
-a0.add_transition(184, b6)
-a0.add_transition(185, b6)
-a0.add_transition(186, b6)
-a0.add_transition(187, b6)
-a0.add_transition(188, b6)
-a0.add_transition(189, b6)
-a0.add_transition(190, b6)
-a0.add_transition(191, b6)
-a0.add_transition(192, b6)
-a0.add_transition(193, b6)
-a0.add_transition(194, b6)
-a0.add_transition(195, b6)
-a0.add_transition(196, b6)
-a0.add_transition(197, b6)
-a0.add_transition(198, b6)
-a0.add_transition(199, b6)
-a0.add_transition(200, b6)
-a0.add_transition(201, b6)
-a0.add_transition(202, b6)
-a0.add_transition(203, b6)
-a0.add_transition(204, b6)
-a0.add_transition(205, b6)
-a0.add_transition(206, b6)
-a0.add_transition(207, b6)
-a0.add_transition(208, b6)
-a0.add_transition(209, b6)
-a0.add_transition(210, b6)
-a0.add_transition(211, b6)
-a0.add_transition(212, b6)
-a0.add_transition(213, b6)
-a0.add_transition(214, b6)
-a0.add_transition(215, b6)
-a0.add_transition(216, b6)
-a0.add_transition(217, b6)
-a0.add_transition(218, b6)
-a0.add_transition(219, b6)
-a0.add_transition(220, b6)
-a0.add_transition(221, b6)
-a0.add_transition(222, b6)
-a0.add_transition(223, b6)
-a0.add_transition(224, b6)
-a0.add_transition(225, b6)
-a0.add_transition(226, b6)
-a0.add_transition(227, b6)
-a0.add_transition(228, b6)
-a0.add_transition(229, b6)
-a0.add_transition(230, b6)
-a0.add_transition(231, b6)
-a0.add_transition(232, b6)
-a0.add_transition(233, b6)
-a0.add_transition(234, b6)
-a0.add_transition(235, b6)
-a0.add_transition(236, b6)
-a0.add_transition(237, b6)
-a0.add_transition(238, b6)
-a0.add_transition(239, b6)
-a0.add_transition(240, b6)
-a0.add_transition(241, b6)
-a0.add_transition(242, b6)
-a0.add_transition(243, b6)
-a0.add_transition(244, b6)
-a0.add_transition(245, b6)
-a0.add_transition(246, b6)
-a0.add_transition(247, b6)
-a0.add_transition(248, b6)
-a0.add_transition(249, b6)
-a0.add_transition(250, b6)
-a0.add_transition(251, b6)
-a0.add_transition(252, b6)
-a0.add_transition(253, b6)
-a0.add_transition(254, b6)
-a0.add_transition(255, b6)
-
-a1.add_transition(0, a2)
-a1.add_transition(1, a2)
-a1.add_transition(2, a2)
-a1.add_transition(3, a2)
-a1.add_transition(4, a2)
-a1.add_transition(5, a2)
-a1.add_transition(6, a2)
-a1.add_transition(7, a2)
-a1.add_transition(8, a2)
-a1.add_transition(9, a2)
-a1.add_transition(10, a2)
-a1.add_transition(11, a2)
-a1.add_transition(12, a2)
-a1.add_transition(13, a2)
-a1.add_transition(14, a2)
-a1.add_transition(15, a2)
-a1.add_transition(16, a2)
-a1.add_transition(17, a2)
-a1.add_transition(18, a2)
-a1.add_transition(19, a2)
-a1.add_transition(20, a2)
-a1.add_transition(21, a2)
-a1.add_transition(22, a2)
-a1.add_transition(23, a2)
-a1.add_transition(24, a2)
-a1.add_transition(25, a2)
-a1.add_transition(26, a2)
-a1.add_transition(27, a2)
-a1.add_transition(28, a2)
-a1.add_transition(29, a2)
-a1.add_transition(30, a2)
-a1.add_transition(31, a2)
-a1.add_transition(32, a2)
-a1.add_transition(33, a2)
-a1.add_transition(34, a2)
-a1.add_transition(35, a2)
-a1.add_transition(36, a2)
-a1.add_transition(37, a2)
-a1.add_transition(38, a2)
-a1.add_transition(39, a2)
-a1.add_transition(40, a2)
-a1.add_transition(41, a2)
-a1.add_transition(42, a2)
-a1.add_transition(43, a2)
-a1.add_transition(44, a2)
-a1.add_transition(45, a2)
-a1.add_transition(46, a2)
-a1.add_transition(47, a2)
-a1.add_transition(48, a2)
-a1.add_transition(49, a2)
-a1.add_transition(50, a2)
-a1.add_transition(51, a2)
-a1.add_transition(52, a2)
-a1.add_transition(53, a2)
-a1.add_transition(54, a2)
-a1.add_transition(55, a2)
-a1.add_transition(56, a2)
-a1.add_transition(57, a2)
-a1.add_transition(58, a2)
-a1.add_transition(59, a2)
-a1.add_transition(60, a2)
-a1.add_transition(61, a2)
-a1.add_transition(62, a2)
-a1.add_transition(63, a2)
-a1.add_transition(64, a2)
-a1.add_transition(65, a2)
-a1.add_transition(66, a2)
-a1.add_transition(67, a2)
-a1.add_transition(68, a2)
-a1.add_transition(69, a2)
-a1.add_transition(70, a2)
-a1.add_transition(71, a2)
-a1.add_transition(72, a2)
-a1.add_transition(73, a2)
-a1.add_transition(74, a2)
-a1.add_transition(75, a2)
-a1.add_transition(76, a2)
-a1.add_transition(77, a2)
-a1.add_transition(78, a2)
-a1.add_transition(79, a2)
-a1.add_transition(80, a2)
-a1.add_transition(81, a2)
-a1.add_transition(82, a2)
-a1.add_transition(83, a2)
-a1.add_transition(84, a2)
-a1.add_transition(85, a2)
-a1.add_transition(86, a2)
-a1.add_transition(87, a2)
-a1.add_transition(88, a2)
-a1.add_transition(89, a2)
-a1.add_transition(90, a2)
-a1.add_transition(91, a2)
-a1.add_transition(92, a2)
-a1.add_transition(93, a2)
-a1.add_transition(94, a2)
-a1.add_transition(95, a2)
-a1.add_transition(96, a2)
-a1.add_transition(97, a2)
-a1.add_transition(98, a2)
-a1.add_transition(99, a2)
-a1.add_transition(100, a2)
-a1.add_transition(101, a2)
-a1.add_transition(102, a2)
-a1.add_transition(103, a2)
-a1.add_transition(104, a2)
-a1.add_transition(105, a2)
-a1.add_transition(106, a2)
-a1.add_transition(107, a2)
-a1.add_transition(108, a2)
-a1.add_transition(109, a2)
-a1.add_transition(110, a2)
-a1.add_transition(111, a2)
-a1.add_transition(112, a2)
-a1.add_transition(113, a2)
-a1.add_transition(114, a2)
-a1.add_transition(115, a2)
-a1.add_transition(116, a2)
-a1.add_transition(117, a2)
-a1.add_transition(118, a2)
-a1.add_transition(119, a2)
-a1.add_transition(120, a2)
-a1.add_transition(121, a2)
-a1.add_transition(122, a2)
-a1.add_transition(124, a2)
-a1.add_transition(126, a2)
-a1.add_transition(127, a2)
-a1.add_transition(128, a2)
-a1.add_transition(129, a2)
-a1.add_transition(130, a2)
-a1.add_transition(131, a2)
-a1.add_transition(132, a2)
-a1.add_transition(133, a2)
-a1.add_transition(134, a2)
-a1.add_transition(135, a2)
-a1.add_transition(136, a2)
-a1.add_transition(137, a2)
-a1.add_transition(138, a2)
-a1.add_transition(139, a2)
-a1.add_transition(140, a2)
-a1.add_transition(141, a2)
-a1.add_transition(142, a2)
-a1.add_transition(143, a2)
-a1.add_transition(144, a2)
-a1.add_transition(145, a2)
-a1.add_transition(146, a2)
-a1.add_transition(147, a2)
-a1.add_transition(148, a2)
-a1.add_transition(149, a2)
-a1.add_transition(150, a2)
-a1.add_transition(151, a2)
-a1.add_transition(152, a2)
-a1.add_transition(153, a2)
-a1.add_transition(154, a2)
-a1.add_transition(155, a2)
-a1.add_transition(156, a2)
-a1.add_transition(157, a2)
-a1.add_transition(158, a2)
-a1.add_transition(159, a2)
-a1.add_transition(160, a2)
-a1.add_transition(161, a2)
-a1.add_transition(162, a2)
-a1.add_transition(163, a2)
-a1.add_transition(164, a2)
-a1.add_transition(165, a2)
-a1.add_transition(166, a2)
-a1.add_transition(167, a2)
-a1.add_transition(168, a2)
-a1.add_transition(169, a2)
-a1.add_transition(170, a2)
-a1.add_transition(171, a2)
-a1.add_transition(172, a2)
-a1.add_transition(173, a2)
-a1.add_transition(174, a2)
-a1.add_transition(175, a2)
-a1.add_transition(176, a2)
-a1.add_transition(177, a2)
-a1.add_transition(178, a2)
-a1.add_transition(179, a2)
-a1.add_transition(180, a2)
-a1.add_transition(181, a2)
-a1.add_transition(182, a2)
-a1.add_transition(183, a2)
-a1.add_transition(184, a2)
-a1.add_transition(185, a2)
-a1.add_transition(186, a2)
-a1.add_transition(187, a2)
-a1.add_transition(188, a2)
-a1.add_transition(189, a2)
-a1.add_transition(190, a2)
-a1.add_transition(191, a2)
-a1.add_transition(192, a2)
-a1.add_transition(193, a2)
-a1.add_transition(194, a2)
-a1.add_transition(195, a2)
-a1.add_transition(196, a2)
-a1.add_transition(197, a2)
-a1.add_transition(198, a2)
-a1.add_transition(199, a2)
-a1.add_transition(200, a2)
-a1.add_transition(201, a2)
-a1.add_transition(202, a2)
-a1.add_transition(203, a2)
-a1.add_transition(204, a2)
-a1.add_transition(205, a2)
-a1.add_transition(206, a2)
-a1.add_transition(207, a2)
-a1.add_transition(208, a2)
-a1.add_transition(209, a2)
-a1.add_transition(210, a2)
-a1.add_transition(211, a2)
-a1.add_transition(212, a2)
-a1.add_transition(213, a2)
-a1.add_transition(214, a2)
-a1.add_transition(215, a2)
-a1.add_transition(216, a2)
-a1.add_transition(217, a2)
-a1.add_transition(218, a2)
-a1.add_transition(219, a2)
-a1.add_transition(220, a2)
-a1.add_transition(221, a2)
-a1.add_transition(222, a2)
-a1.add_transition(223, a2)
-a1.add_transition(224, a2)
-a1.add_transition(225, a2)
-a1.add_transition(226, a2)
-a1.add_transition(227, a2)
-a1.add_transition(228, a2)
-a1.add_transition(229, a2)
-a1.add_transition(230, a2)
-a1.add_transition(231, a2)
-a1.add_transition(232, a2)
-a1.add_transition(233, a2)
-a1.add_transition(234, a2)
-a1.add_transition(235, a2)
-a1.add_transition(236, a2)
-a1.add_transition(237, a2)
-a1.add_transition(238, a2)
-a1.add_transition(239, a2)
-a1.add_transition(240, a2)
-a1.add_transition(241, a2)
-a1.add_transition(242, a2)
-a1.add_transition(243, a2)
-a1.add_transition(244, a2)
-a1.add_transition(245, a2)
-a1.add_transition(246, a2)
-a1.add_transition(247, a2)
-a1.add_transition(248, a2)
-a1.add_transition(249, a2)
-a1.add_transition(250, a2)
-a1.add_transition(251, a2)
-a1.add_transition(252, a2)
-a1.add_transition(253, a2)
-a1.add_transition(254, a2)
-a1.add_transition(255, a2)
-
-a2.add_transition(0, a2)
-a2.add_transition(1, a2)
-a2.add_transition(2, a2)
-a2.add_transition(3, a2)
-a2.add_transition(4, a2)
-a2.add_transition(5, a2)
-a2.add_transition(6, a2)
-a2.add_transition(7, a2)
-a2.add_transition(8, a2)
-a2.add_transition(9, a2)
-a2.add_transition(10, a2)
-a2.add_transition(11, a2)
-a2.add_transition(12, a2)
-a2.add_transition(13, a2)
-a2.add_transition(14, a2)
-a2.add_transition(15, a2)
-a2.add_transition(16, a2)
-a2.add_transition(17, a2)
-a2.add_transition(18, a2)
-a2.add_transition(19, a2)
-a2.add_transition(20, a2)
-a2.add_transition(21, a2)
-a2.add_transition(22, a2)
-a2.add_transition(23, a2)
-a2.add_transition(24, a2)
-a2.add_transition(25, a2)
-a2.add_transition(26, a2)
-a2.add_transition(27, a2)
-a2.add_transition(28, a2)
-a2.add_transition(29, a2)
-a2.add_transition(30, a2)
-a2.add_transition(31, a2)
-a2.add_transition(32, a2)
-a2.add_transition(33, a2)
-a2.add_transition(34, a2)
-a2.add_transition(35, a2)
-a2.add_transition(36, a2)
-a2.add_transition(37, a2)
-a2.add_transition(38, a2)
-a2.add_transition(39, a2)
-a2.add_transition(40, a2)
-a2.add_transition(41, a2)
-a2.add_transition(42, a2)
-a2.add_transition(43, a2)
-a2.add_transition(44, a2)
-a2.add_transition(45, a2)
-a2.add_transition(46, a2)
-a2.add_transition(47, a2)
-a2.add_transition(48, a2)
-a2.add_transition(49, a2)
-a2.add_transition(50, a2)
-a2.add_transition(51, a2)
-a2.add_transition(52, a2)
-a2.add_transition(53, a2)
-a2.add_transition(54, a2)
-a2.add_transition(55, a2)
-a2.add_transition(56, a2)
-a2.add_transition(57, a2)
-a2.add_transition(58, a2)
-a2.add_transition(59, a2)
-a2.add_transition(60, a2)
-a2.add_transition(61, a2)
-a2.add_transition(62, a2)
-a2.add_transition(63, a2)
-a2.add_transition(64, a2)
-a2.add_transition(65, a2)
-a2.add_transition(66, a2)
-a2.add_transition(67, a2)
-a2.add_transition(68, a2)
-a2.add_transition(69, a2)
-a2.add_transition(70, a2)
-a2.add_transition(71, a2)
-a2.add_transition(72, a2)
-a2.add_transition(73, a2)
-a2.add_transition(74, a2)
-a2.add_transition(75, a2)
-a2.add_transition(76, a2)
-a2.add_transition(77, a2)
-a2.add_transition(78, a2)
-a2.add_transition(79, a2)
-a2.add_transition(80, a2)
-a2.add_transition(81, a2)
-a2.add_transition(82, a2)
-a2.add_transition(83, a2)
-a2.add_transition(84, a2)
-a2.add_transition(85, a2)
-a2.add_transition(86, a2)
-a2.add_transition(87, a2)
-a2.add_transition(88, a2)
-a2.add_transition(89, a2)
-a2.add_transition(90, a2)
-a2.add_transition(91, a2)
-a2.add_transition(92, a2)
-a2.add_transition(93, a2)
-a2.add_transition(94, a2)
-a2.add_transition(95, a2)
-a2.add_transition(96, a2)
-a2.add_transition(97, a2)
-a2.add_transition(98, a2)
-a2.add_transition(99, a2)
-a2.add_transition(100, a2)
-a2.add_transition(101, a2)
-a2.add_transition(102, a2)
-a2.add_transition(103, a2)
-a2.add_transition(104, a2)
-a2.add_transition(105, a2)
-a2.add_transition(106, a2)
-a2.add_transition(107, a2)
-a2.add_transition(108, a2)
-a2.add_transition(109, a2)
-a2.add_transition(110, a2)
-a2.add_transition(111, a2)
-a2.add_transition(112, a2)
-a2.add_transition(113, a2)
-a2.add_transition(114, a2)
-a2.add_transition(115, a2)
-a2.add_transition(116, a2)
-a2.add_transition(117, a2)
-a2.add_transition(118, a2)
-a2.add_transition(119, a2)
-a2.add_transition(120, a2)
-a2.add_transition(121, a2)
-a2.add_transition(122, a2)
-a2.add_transition(124, a2)
-a2.add_transition(125, a3)
-a2.add_transition(126, a2)
-a2.add_transition(127, a2)
-a2.add_transition(128, a2)
-a2.add_transition(129, a2)
-a2.add_transition(130, a2)
-a2.add_transition(131, a2)
-a2.add_transition(132, a2)
-a2.add_transition(133, a2)
-a2.add_transition(134, a2)
-a2.add_transition(135, a2)
-a2.add_transition(136, a2)
-a2.add_transition(137, a2)
-a2.add_transition(138, a2)
-a2.add_transition(139, a2)
-a2.add_transition(140, a2)
-a2.add_transition(141, a2)
-a2.add_transition(142, a2)
-a2.add_transition(143, a2)
-a2.add_transition(144, a2)
-a2.add_transition(145, a2)
-a2.add_transition(146, a2)
-a2.add_transition(147, a2)
-a2.add_transition(148, a2)
-a2.add_transition(149, a2)
-a2.add_transition(150, a2)
-a2.add_transition(151, a2)
-a2.add_transition(152, a2)
-a2.add_transition(153, a2)
-a2.add_transition(154, a2)
-a2.add_transition(155, a2)
-a2.add_transition(156, a2)
-a2.add_transition(157, a2)
-a2.add_transition(158, a2)
-a2.add_transition(159, a2)
-a2.add_transition(160, a2)
-a2.add_transition(161, a2)
-a2.add_transition(162, a2)
-a2.add_transition(163, a2)
-a2.add_transition(164, a2)
-a2.add_transition(165, a2)
-a2.add_transition(166, a2)
-a2.add_transition(167, a2)
-a2.add_transition(168, a2)
-a2.add_transition(169, a2)
-a2.add_transition(170, a2)
-a2.add_transition(171, a2)
-a2.add_transition(172, a2)
-a2.add_transition(173, a2)
-a2.add_transition(174, a2)
-a2.add_transition(175, a2)
-a2.add_transition(176, a2)
-a2.add_transition(177, a2)
-a2.add_transition(178, a2)
-a2.add_transition(179, a2)
-a2.add_transition(180, a2)
-a2.add_transition(181, a2)
-a2.add_transition(182, a2)
-a2.add_transition(183, a2)
-a2.add_transition(184, a2)
-a2.add_transition(185, a2)
-a2.add_transition(186, a2)
-a2.add_transition(187, a2)
-a2.add_transition(188, a2)
-a2.add_transition(189, a2)
-a2.add_transition(190, a2)
-a2.add_transition(191, a2)
-a2.add_transition(192, a2)
-a2.add_transition(193, a2)
-a2.add_transition(194, a2)
-a2.add_transition(195, a2)
-a2.add_transition(196, a2)
-a2.add_transition(197, a2)
-a2.add_transition(198, a2)
-a2.add_transition(199, a2)
-a2.add_transition(200, a2)
-a2.add_transition(201, a2)
-a2.add_transition(202, a2)
-a2.add_transition(203, a2)
-a2.add_transition(204, a2)
-a2.add_transition(205, a2)
-a2.add_transition(206, a2)
-a2.add_transition(207, a2)
-a2.add_transition(208, a2)
-a2.add_transition(209, a2)
-a2.add_transition(210, a2)
-a2.add_transition(211, a2)
-a2.add_transition(212, a2)
-a2.add_transition(213, a2)
-a2.add_transition(214, a2)
-a2.add_transition(215, a2)
-a2.add_transition(216, a2)
-a2.add_transition(217, a2)
-a2.add_transition(218, a2)
-a2.add_transition(219, a2)
-a2.add_transition(220, a2)
-a2.add_transition(221, a2)
-a2.add_transition(222, a2)
-a2.add_transition(223, a2)
-a2.add_transition(224, a2)
-a2.add_transition(225, a2)
-a2.add_transition(226, a2)
-a2.add_transition(227, a2)
-a2.add_transition(228, a2)
-a2.add_transition(229, a2)
-a2.add_transition(230, a2)
-a2.add_transition(231, a2)
-a2.add_transition(232, a2)
-a2.add_transition(233, a2)
-a2.add_transition(234, a2)
-a2.add_transition(235, a2)
-a2.add_transition(236, a2)
-a2.add_transition(237, a2)
-a2.add_transition(238, a2)
-a2.add_transition(239, a2)
-a2.add_transition(240, a2)
-a2.add_transition(241, a2)
-a2.add_transition(242, a2)
-a2.add_transition(243, a2)
-a2.add_transition(244, a2)
-a2.add_transition(245, a2)
-a2.add_transition(246, a2)
-a2.add_transition(247, a2)
-a2.add_transition(248, a2)
-a2.add_transition(249, a2)
-a2.add_transition(250, a2)
-a2.add_transition(251, a2)
-a2.add_transition(252, a2)
-a2.add_transition(253, a2)
-a2.add_transition(254, a2)
-a2.add_transition(255, a2)
-
-a3.isFinalState = True
-a3.addToken( 'RETURN')
-
-b6.isFinalState = True
-b6.addToken( 'TOKEN')
-b6.add_transition(0, b6)
-b6.add_transition(1, b6)
-b6.add_transition(2, b6)
-b6.add_transition(3, b6)
-b6.add_transition(4, b6)
-b6.add_transition(5, b6)
-b6.add_transition(6, b6)
-b6.add_transition(7, b6)
-b6.add_transition(8, b6)
-b6.add_transition(11, b6)
-b6.add_transition(12, b6)
-b6.add_transition(13, b6)
-b6.add_transition(14, b6)
-b6.add_transition(15, b6)
-b6.add_transition(16, b6)
-b6.add_transition(17, b6)
-b6.add_transition(18, b6)
-b6.add_transition(19, b6)
-b6.add_transition(20, b6)
-b6.add_transition(21, b6)
-b6.add_transition(22, b6)
-b6.add_transition(23, b6)
-b6.add_transition(24, b6)
-b6.add_transition(25, b6)
-b6.add_transition(26, b6)
-b6.add_transition(27, b6)
-b6.add_transition(28, b6)
-b6.add_transition(29, b6)
-b6.add_transition(30, b6)
-b6.add_transition(31, b6)
-b6.add_transition(33, b6)
-b6.add_transition(34, b1)
-b6.add_transition(35, b6)
-b6.add_transition(36, b6)
-b6.add_transition(37, b6)
-b6.add_transition(38, b6)
-b6.add_transition(39, b2)
-b6.add_transition(40, b6)
-b6.add_transition(41, b6)
-b6.add_transition(42, b6)
-b6.add_transition(43, b6)
-b6.add_transition(44, b6)
-b6.add_transition(45, b6)
-b6.add_transition(46, b6)
-b6.add_transition(47, b6)
-b6.add_transition(48, b6)
-b6.add_transition(49, b6)
-b6.add_transition(50, b6)
-b6.add_transition(51, b6)
-b6.add_transition(52, b6)
-b6.add_transition(53, b6)
-b6.add_transition(54, b6)
-b6.add_transition(55, b6)
-b6.add_transition(56, b6)
-b6.add_transition(57, b6)
-b6.add_transition(58, b6)
-b6.add_transition(59, b6)
-b6.add_transition(60, b6)
-b6.add_transition(61, b6)
-b6.add_transition(62, b6)
-b6.add_transition(63, b6)
-b6.add_transition(64, b6)
-b6.add_transition(65, b6)
-b6.add_transition(66, b6)
-b6.add_transition(67, b6)
-b6.add_transition(68, b6)
-b6.add_transition(69, b6)
-b6.add_transition(70, b6)
-b6.add_transition(71, b6)
-b6.add_transition(72, b6)
-b6.add_transition(73, b6)
-b6.add_transition(74, b6)
-b6.add_transition(75, b6)
-b6.add_transition(76, b6)
-b6.add_transition(77, b6)
-b6.add_transition(78, b6)
-b6.add_transition(79, b6)
-b6.add_transition(80, b6)
-b6.add_transition(81, b6)
-b6.add_transition(82, b6)
-b6.add_transition(83, b6)
-b6.add_transition(84, b6)
-b6.add_transition(85, b6)
-b6.add_transition(86, b6)
-b6.add_transition(87, b6)
-b6.add_transition(88, b6)
-b6.add_transition(89, b6)
-b6.add_transition(90, b6)
-b6.add_transition(91, b6)
-b6.add_transition(92, b6)
-b6.add_transition(93, b6)
-b6.add_transition(94, b6)
-b6.add_transition(95, b6)
-b6.add_transition(96, b6)
-b6.add_transition(97, b6)
-b6.add_transition(98, b6)
-b6.add_transition(99, b6)
-b6.add_transition(100, b6)
-b6.add_transition(101, b6)
-b6.add_transition(102, b6)
-b6.add_transition(103, b6)
-b6.add_transition(104, b6)
-b6.add_transition(105, b6)
-b6.add_transition(106, b6)
-b6.add_transition(107, b6)
-b6.add_transition(108, b6)
-b6.add_transition(109, b6)
-b6.add_transition(110, b6)
-b6.add_transition(111, b6)
-b6.add_transition(112, b6)
-b6.add_transition(113, b6)
-b6.add_transition(114, b6)
-b6.add_transition(115, b6)
-b6.add_transition(116, b6)
-b6.add_transition(117, b6)
-b6.add_transition(118, b6)
-b6.add_transition(119, b6)
-b6.add_transition(120, b6)
-b6.add_transition(121, b6)
-b6.add_transition(122, b6)
-b6.add_transition(124, b6)
-b6.add_transition(126, b6)
-b6.add_transition(127, b6)
-b6.add_transition(128, b6)
-b6.add_transition(129, b6)
-b6.add_transition(130, b6)
-b6.add_transition(131, b6)
-b6.add_transition(132, b6)
-b6.add_transition(133, b6)
-b6.add_transition(134, b6)
-b6.add_transition(135, b6)
-b6.add_transition(136, b6)
-b6.add_transition(137, b6)
-b6.add_transition(138, b6)
-b6.add_transition(139, b6)
-b6.add_transition(140, b6)
-b6.add_transition(141, b6)
-b6.add_transition(142, b6)
-b6.add_transition(143, b6)
-b6.add_transition(144, b6)
-b6.add_transition(145, b6)
-b6.add_transition(146, b6)
-b6.add_transition(147, b6)
-b6.add_transition(148, b6)
-b6.add_transition(149, b6)
-b6.add_transition(150, b6)
-b6.add_transition(151, b6)
-b6.add_transition(152, b6)
-b6.add_transition(153, b6)
-b6.add_transition(154, b6)
-b6.add_transition(155, b6)
-b6.add_transition(156, b6)
-b6.add_transition(157, b6)
-b6.add_transition(158, b6)
-b6.add_transition(159, b6)
-b6.add_transition(160, b6)
-b6.add_transition(161, b6)
-b6.add_transition(162, b6)
-b6.add_transition(163, b6)
-b6.add_transition(164, b6)
-b6.add_transition(165, b6)
-b6.add_transition(166, b6)
-b6.add_transition(167, b6)
-b6.add_transition(168, b6)
-b6.add_transition(169, b6)
-b6.add_transition(170, b6)
-b6.add_transition(171, b6)
-b6.add_transition(172, b6)
-b6.add_transition(173, b6)
-b6.add_transition(174, b6)
-b6.add_transition(175, b6)
-b6.add_transition(176, b6)
-b6.add_transition(177, b6)
-b6.add_transition(178, b6)
-b6.add_transition(179, b6)
-b6.add_transition(180, b6)
-b6.add_transition(181, b6)
-b6.add_transition(182, b6)
-b6.add_transition(183, b6)
-b6.add_transition(184, b6)
-b6.add_transition(185, b6)
-b6.add_transition(186, b6)
-b6.add_transition(187, b6)
-b6.add_transition(188, b6)
-b6.add_transition(189, b6)
-b6.add_transition(190, b6)
-b6.add_transition(191, b6)
-b6.add_transition(192, b6)
-b6.add_transition(193, b6)
-b6.add_transition(194, b6)
-b6.add_transition(195, b6)
-b6.add_transition(196, b6)
-b6.add_transition(197, b6)
-b6.add_transition(198, b6)
-b6.add_transition(199, b6)
-b6.add_transition(200, b6)
-b6.add_transition(201, b6)
-b6.add_transition(202, b6)
-b6.add_transition(203, b6)
-b6.add_transition(204, b6)
-b6.add_transition(205, b6)
-b6.add_transition(206, b6)
-b6.add_transition(207, b6)
-b6.add_transition(208, b6)
-b6.add_transition(209, b6)
-b6.add_transition(210, b6)
-b6.add_transition(211, b6)
-b6.add_transition(212, b6)
-b6.add_transition(213, b6)
-b6.add_transition(214, b6)
-b6.add_transition(215, b6)
-b6.add_transition(216, b6)
-b6.add_transition(217, b6)
-b6.add_transition(218, b6)
-b6.add_transition(219, b6)
-b6.add_transition(220, b6)
-b6.add_transition(221, b6)
-b6.add_transition(222, b6)
-b6.add_transition(223, b6)
-b6.add_transition(224, b6)
-b6.add_transition(225, b6)
-b6.add_transition(226, b6)
-b6.add_transition(227, b6)
-b6.add_transition(228, b6)
-b6.add_transition(229, b6)
-b6.add_transition(230, b6)
-b6.add_transition(231, b6)
-b6.add_transition(232, b6)
-b6.add_transition(233, b6)
-b6.add_transition(234, b6)
-b6.add_transition(235, b6)
-b6.add_transition(236, b6)
-b6.add_transition(237, b6)
-b6.add_transition(238, b6)
-b6.add_transition(239, b6)
-b6.add_transition(240, b6)
-b6.add_transition(241, b6)
-b6.add_transition(242, b6)
-b6.add_transition(243, b6)
-b6.add_transition(244, b6)
-b6.add_transition(245, b6)
-b6.add_transition(246, b6)
-b6.add_transition(247, b6)
-b6.add_transition(248, b6)
-b6.add_transition(249, b6)
-b6.add_transition(250, b6)
-b6.add_transition(251, b6)
-b6.add_transition(252, b6)
-b6.add_transition(253, b6)
-b6.add_transition(254, b6)
-b6.add_transition(255, b6)
-
-b1.add_transition(0, b3)
-b1.add_transition(1, b3)
-b1.add_transition(2, b3)
-b1.add_transition(3, b3)
-b1.add_transition(4, b3)
-b1.add_transition(5, b3)
-b1.add_transition(6, b3)
-b1.add_transition(7, b3)
-b1.add_transition(8, b3)
-b1.add_transition(9, b3)
-b1.add_transition(10, b3)
-b1.add_transition(11, b3)
-b1.add_transition(12, b3)
-b1.add_transition(13, b3)
-b1.add_transition(14, b3)
-b1.add_transition(15, b3)
-b1.add_transition(16, b3)
-b1.add_transition(17, b3)
-b1.add_transition(18, b3)
-b1.add_transition(19, b3)
-b1.add_transition(20, b3)
-b1.add_transition(21, b3)
-b1.add_transition(22, b3)
-b1.add_transition(23, b3)
-b1.add_transition(24, b3)
-b1.add_transition(25, b3)
-b1.add_transition(26, b3)
-b1.add_transition(27, b3)
-b1.add_transition(28, b3)
-b1.add_transition(29, b3)
-b1.add_transition(30, b3)
-b1.add_transition(31, b3)
-b1.add_transition(32, b3)
-b1.add_transition(33, b3)
-b1.add_transition(35, b3)
-b1.add_transition(36, b3)
-b1.add_transition(37, b3)
-b1.add_transition(38, b3)
-b1.add_transition(39, b3)
-b1.add_transition(40, b3)
-b1.add_transition(41, b3)
-b1.add_transition(42, b3)
-b1.add_transition(43, b3)
-b1.add_transition(44, b3)
-b1.add_transition(45, b3)
-b1.add_transition(46, b3)
-b1.add_transition(47, b3)
-b1.add_transition(48, b3)
-b1.add_transition(49, b3)
-b1.add_transition(50, b3)
-b1.add_transition(51, b3)
-b1.add_transition(52, b3)
-b1.add_transition(53, b3)
-b1.add_transition(54, b3)
-b1.add_transition(55, b3)
-b1.add_transition(56, b3)
-b1.add_transition(57, b3)
-b1.add_transition(58, b3)
-b1.add_transition(59, b3)
-b1.add_transition(60, b3)
-b1.add_transition(61, b3)
-b1.add_transition(62, b3)
-b1.add_transition(63, b3)
-b1.add_transition(64, b3)
-b1.add_transition(65, b3)
-b1.add_transition(66, b3)
-b1.add_transition(67, b3)
-b1.add_transition(68, b3)
-b1.add_transition(69, b3)
-b1.add_transition(70, b3)
-b1.add_transition(71, b3)
-b1.add_transition(72, b3)
-b1.add_transition(73, b3)
-b1.add_transition(74, b3)
-b1.add_transition(75, b3)
-b1.add_transition(76, b3)
-b1.add_transition(77, b3)
-b1.add_transition(78, b3)
-b1.add_transition(79, b3)
-b1.add_transition(80, b3)
-b1.add_transition(81, b3)
-b1.add_transition(82, b3)
-b1.add_transition(83, b3)
-b1.add_transition(84, b3)
-b1.add_transition(85, b3)
-b1.add_transition(86, b3)
-b1.add_transition(87, b3)
-b1.add_transition(88, b3)
-b1.add_transition(89, b3)
-b1.add_transition(90, b3)
-b1.add_transition(91, b3)
-b1.add_transition(92, b3)
-b1.add_transition(93, b3)
-b1.add_transition(94, b3)
-b1.add_transition(95, b3)
-b1.add_transition(96, b3)
-b1.add_transition(97, b3)
-b1.add_transition(98, b3)
-b1.add_transition(99, b3)
-b1.add_transition(100, b3)
-b1.add_transition(101, b3)
-b1.add_transition(102, b3)
-b1.add_transition(103, b3)
-b1.add_transition(104, b3)
-b1.add_transition(105, b3)
-b1.add_transition(106, b3)
-b1.add_transition(107, b3)
-b1.add_transition(108, b3)
-b1.add_transition(109, b3)
-b1.add_transition(110, b3)
-b1.add_transition(111, b3)
-b1.add_transition(112, b3)
-b1.add_transition(113, b3)
-b1.add_transition(114, b3)
-b1.add_transition(115, b3)
-b1.add_transition(116, b3)
-b1.add_transition(117, b3)
-b1.add_transition(118, b3)
-b1.add_transition(119, b3)
-b1.add_transition(120, b3)
-b1.add_transition(121, b3)
-b1.add_transition(122, b3)
-b1.add_transition(123, b3)
-b1.add_transition(124, b3)
-b1.add_transition(125, b3)
-b1.add_transition(126, b3)
-b1.add_transition(127, b3)
-b1.add_transition(128, b3)
-b1.add_transition(129, b3)
-b1.add_transition(130, b3)
-b1.add_transition(131, b3)
-b1.add_transition(132, b3)
-b1.add_transition(133, b3)
-b1.add_transition(134, b3)
-b1.add_transition(135, b3)
-b1.add_transition(136, b3)
-b1.add_transition(137, b3)
-b1.add_transition(138, b3)
-b1.add_transition(139, b3)
-b1.add_transition(140, b3)
-b1.add_transition(141, b3)
-b1.add_transition(142, b3)
-b1.add_transition(143, b3)
-b1.add_transition(144, b3)
-b1.add_transition(145, b3)
-b1.add_transition(146, b3)
-b1.add_transition(147, b3)
-b1.add_transition(148, b3)
-b1.add_transition(149, b3)
-b1.add_transition(150, b3)
-b1.add_transition(151, b3)
-b1.add_transition(152, b3)
-b1.add_transition(153, b3)
-b1.add_transition(154, b3)
-b1.add_transition(155, b3)
-b1.add_transition(156, b3)
-b1.add_transition(157, b3)
-b1.add_transition(158, b3)
-b1.add_transition(159, b3)
-b1.add_transition(160, b3)
-b1.add_transition(161, b3)
-b1.add_transition(162, b3)
-b1.add_transition(163, b3)
-b1.add_transition(164, b3)
-b1.add_transition(165, b3)
-b1.add_transition(166, b3)
-b1.add_transition(167, b3)
-b1.add_transition(168, b3)
-b1.add_transition(169, b3)
-b1.add_transition(170, b3)
-b1.add_transition(171, b3)
-b1.add_transition(172, b3)
-b1.add_transition(173, b3)
-b1.add_transition(174, b3)
-b1.add_transition(175, b3)
-b1.add_transition(176, b3)
-b1.add_transition(177, b3)
-b1.add_transition(178, b3)
-b1.add_transition(179, b3)
-b1.add_transition(180, b3)
-b1.add_transition(181, b3)
-b1.add_transition(182, b3)
-b1.add_transition(183, b3)
-b1.add_transition(184, b3)
-b1.add_transition(185, b3)
-b1.add_transition(186, b3)
-b1.add_transition(187, b3)
-b1.add_transition(188, b3)
-b1.add_transition(189, b3)
-b1.add_transition(190, b3)
-b1.add_transition(191, b3)
-b1.add_transition(192, b3)
-b1.add_transition(193, b3)
-b1.add_transition(194, b3)
-b1.add_transition(195, b3)
-b1.add_transition(196, b3)
-b1.add_transition(197, b3)
-b1.add_transition(198, b3)
-b1.add_transition(199, b3)
-b1.add_transition(200, b3)
-b1.add_transition(201, b3)
-b1.add_transition(202, b3)
-b1.add_transition(203, b3)
-b1.add_transition(204, b3)
-b1.add_transition(205, b3)
-b1.add_transition(206, b3)
-b1.add_transition(207, b3)
-b1.add_transition(208, b3)
-b1.add_transition(209, b3)
-b1.add_transition(210, b3)
-b1.add_transition(211, b3)
-b1.add_transition(212, b3)
-b1.add_transition(213, b3)
-b1.add_transition(214, b3)
-b1.add_transition(215, b3)
-b1.add_transition(216, b3)
-b1.add_transition(217, b3)
-b1.add_transition(218, b3)
-b1.add_transition(219, b3)
-b1.add_transition(220, b3)
-b1.add_transition(221, b3)
-b1.add_transition(222, b3)
-b1.add_transition(223, b3)
-b1.add_transition(224, b3)
-b1.add_transition(225, b3)
-b1.add_transition(226, b3)
-b1.add_transition(227, b3)
-b1.add_transition(228, b3)
-b1.add_transition(229, b3)
-b1.add_transition(230, b3)
-b1.add_transition(231, b3)
-b1.add_transition(232, b3)
-b1.add_transition(233, b3)
-b1.add_transition(234, b3)
-b1.add_transition(235, b3)
-b1.add_transition(236, b3)
-b1.add_transition(237, b3)
-b1.add_transition(238, b3)
-b1.add_transition(239, b3)
-b1.add_transition(240, b3)
-b1.add_transition(241, b3)
-b1.add_transition(242, b3)
-b1.add_transition(243, b3)
-b1.add_transition(244, b3)
-b1.add_transition(245, b3)
-b1.add_transition(246, b3)
-b1.add_transition(247, b3)
-b1.add_transition(248, b3)
-b1.add_transition(249, b3)
-b1.add_transition(250, b3)
-b1.add_transition(251, b3)
-b1.add_transition(252, b3)
-b1.add_transition(253, b3)
-b1.add_transition(254, b3)
-b1.add_transition(255, b3)
-
-b3.add_transition(0, b3)
-b3.add_transition(1, b3)
-b3.add_transition(2, b3)
-b3.add_transition(3, b3)
-b3.add_transition(4, b3)
-b3.add_transition(5, b3)
-b3.add_transition(6, b3)
-b3.add_transition(7, b3)
-b3.add_transition(8, b3)
-b3.add_transition(9, b3)
-b3.add_transition(10, b3)
-b3.add_transition(11, b3)
-b3.add_transition(12, b3)
-b3.add_transition(13, b3)
-b3.add_transition(14, b3)
-b3.add_transition(15, b3)
-b3.add_transition(16, b3)
-b3.add_transition(17, b3)
-b3.add_transition(18, b3)
-b3.add_transition(19, b3)
-b3.add_transition(20, b3)
-b3.add_transition(21, b3)
-b3.add_transition(22, b3)
-b3.add_transition(23, b3)
-b3.add_transition(24, b3)
-b3.add_transition(25, b3)
-b3.add_transition(26, b3)
-b3.add_transition(27, b3)
-b3.add_transition(28, b3)
-b3.add_transition(29, b3)
-b3.add_transition(30, b3)
-b3.add_transition(31, b3)
-b3.add_transition(32, b3)
-b3.add_transition(33, b3)
-b3.add_transition(34, b6)
-b3.add_transition(35, b3)
-b3.add_transition(36, b3)
-b3.add_transition(37, b3)
-b3.add_transition(38, b3)
-b3.add_transition(39, b3)
-b3.add_transition(40, b3)
-b3.add_transition(41, b3)
-b3.add_transition(42, b3)
-b3.add_transition(43, b3)
-b3.add_transition(44, b3)
-b3.add_transition(45, b3)
-b3.add_transition(46, b3)
-b3.add_transition(47, b3)
-b3.add_transition(48, b3)
-b3.add_transition(49, b3)
-b3.add_transition(50, b3)
-b3.add_transition(51, b3)
-b3.add_transition(52, b3)
-b3.add_transition(53, b3)
-b3.add_transition(54, b3)
-b3.add_transition(55, b3)
-b3.add_transition(56, b3)
-b3.add_transition(57, b3)
-b3.add_transition(58, b3)
-b3.add_transition(59, b3)
-b3.add_transition(60, b3)
-b3.add_transition(61, b3)
-b3.add_transition(62, b3)
-b3.add_transition(63, b3)
-b3.add_transition(64, b3)
-b3.add_transition(65, b3)
-b3.add_transition(66, b3)
-b3.add_transition(67, b3)
-b3.add_transition(68, b3)
-b3.add_transition(69, b3)
-b3.add_transition(70, b3)
-b3.add_transition(71, b3)
-b3.add_transition(72, b3)
-b3.add_transition(73, b3)
-b3.add_transition(74, b3)
-b3.add_transition(75, b3)
-b3.add_transition(76, b3)
-b3.add_transition(77, b3)
-b3.add_transition(78, b3)
-b3.add_transition(79, b3)
-b3.add_transition(80, b3)
-b3.add_transition(81, b3)
-b3.add_transition(82, b3)
-b3.add_transition(83, b3)
-b3.add_transition(84, b3)
-b3.add_transition(85, b3)
-b3.add_transition(86, b3)
-b3.add_transition(87, b3)
-b3.add_transition(88, b3)
-b3.add_transition(89, b3)
-b3.add_transition(90, b3)
-b3.add_transition(91, b3)
-b3.add_transition(92, b3)
-b3.add_transition(93, b3)
-b3.add_transition(94, b3)
-b3.add_transition(95, b3)
-b3.add_transition(96, b3)
-b3.add_transition(97, b3)
-b3.add_transition(98, b3)
-b3.add_transition(99, b3)
-b3.add_transition(100, b3)
-b3.add_transition(101, b3)
-b3.add_transition(102, b3)
-b3.add_transition(103, b3)
-b3.add_transition(104, b3)
-b3.add_transition(105, b3)
-b3.add_transition(106, b3)
-b3.add_transition(107, b3)
-b3.add_transition(108, b3)
-b3.add_transition(109, b3)
-b3.add_transition(110, b3)
-b3.add_transition(111, b3)
-b3.add_transition(112, b3)
-b3.add_transition(113, b3)
-b3.add_transition(114, b3)
-b3.add_transition(115, b3)
-b3.add_transition(116, b3)
-b3.add_transition(117, b3)
-b3.add_transition(118, b3)
-b3.add_transition(119, b3)
-b3.add_transition(120, b3)
-b3.add_transition(121, b3)
-b3.add_transition(122, b3)
-b3.add_transition(123, b3)
-b3.add_transition(124, b3)
-b3.add_transition(125, b3)
-b3.add_transition(126, b3)
-b3.add_transition(127, b3)
-b3.add_transition(128, b3)
-b3.add_transition(129, b3)
-b3.add_transition(130, b3)
-b3.add_transition(131, b3)
-b3.add_transition(132, b3)
-b3.add_transition(133, b3)
-b3.add_transition(134, b3)
-b3.add_transition(135, b3)
-b3.add_transition(136, b3)
-b3.add_transition(137, b3)
-b3.add_transition(138, b3)
-b3.add_transition(139, b3)
-b3.add_transition(140, b3)
-b3.add_transition(141, b3)
-b3.add_transition(142, b3)
-b3.add_transition(143, b3)
-b3.add_transition(144, b3)
-b3.add_transition(145, b3)
-b3.add_transition(146, b3)
-b3.add_transition(147, b3)
-b3.add_transition(148, b3)
-b3.add_transition(149, b3)
-b3.add_transition(150, b3)
-b3.add_transition(151, b3)
-b3.add_transition(152, b3)
-b3.add_transition(153, b3)
-b3.add_transition(154, b3)
-b3.add_transition(155, b3)
-b3.add_transition(156, b3)
-b3.add_transition(157, b3)
-b3.add_transition(158, b3)
-b3.add_transition(159, b3)
-b3.add_transition(160, b3)
-b3.add_transition(161, b3)
-b3.add_transition(162, b3)
-b3.add_transition(163, b3)
-b3.add_transition(164, b3)
-b3.add_transition(165, b3)
-b3.add_transition(166, b3)
-b3.add_transition(167, b3)
-b3.add_transition(168, b3)
-b3.add_transition(169, b3)
-b3.add_transition(170, b3)
-b3.add_transition(171, b3)
-b3.add_transition(172, b3)
-b3.add_transition(173, b3)
-b3.add_transition(174, b3)
-b3.add_transition(175, b3)
-b3.add_transition(176, b3)
-b3.add_transition(177, b3)
-b3.add_transition(178, b3)
-b3.add_transition(179, b3)
-b3.add_transition(180, b3)
-b3.add_transition(181, b3)
-b3.add_transition(182, b3)
-b3.add_transition(183, b3)
-b3.add_transition(184, b3)
-b3.add_transition(185, b3)
-b3.add_transition(186, b3)
-b3.add_transition(187, b3)
-b3.add_transition(188, b3)
-b3.add_transition(189, b3)
-b3.add_transition(190, b3)
-b3.add_transition(191, b3)
-b3.add_transition(192, b3)
-b3.add_transition(193, b3)
-b3.add_transition(194, b3)
-b3.add_transition(195, b3)
-b3.add_transition(196, b3)
-b3.add_transition(197, b3)
-b3.add_transition(198, b3)
-b3.add_transition(199, b3)
-b3.add_transition(200, b3)
-b3.add_transition(201, b3)
-b3.add_transition(202, b3)
-b3.add_transition(203, b3)
-b3.add_transition(204, b3)
-b3.add_transition(205, b3)
-b3.add_transition(206, b3)
-b3.add_transition(207, b3)
-b3.add_transition(208, b3)
-b3.add_transition(209, b3)
-b3.add_transition(210, b3)
-b3.add_transition(211, b3)
-b3.add_transition(212, b3)
-b3.add_transition(213, b3)
-b3.add_transition(214, b3)
-b3.add_transition(215, b3)
-b3.add_transition(216, b3)
-b3.add_transition(217, b3)
-b3.add_transition(218, b3)
-b3.add_transition(219, b3)
-b3.add_transition(220, b3)
-b3.add_transition(221, b3)
-b3.add_transition(222, b3)
-b3.add_transition(223, b3)
-b3.add_transition(224, b3)
-b3.add_transition(225, b3)
-b3.add_transition(226, b3)
-b3.add_transition(227, b3)
-b3.add_transition(228, b3)
-b3.add_transition(229, b3)
-b3.add_transition(230, b3)
-b3.add_transition(231, b3)
-b3.add_transition(232, b3)
-b3.add_transition(233, b3)
-b3.add_transition(234, b3)
-b3.add_transition(235, b3)
-b3.add_transition(236, b3)
-b3.add_transition(237, b3)
-b3.add_transition(238, b3)
-b3.add_transition(239, b3)
-b3.add_transition(240, b3)
-b3.add_transition(241, b3)
-b3.add_transition(242, b3)
-b3.add_transition(243, b3)
-b3.add_transition(244, b3)
-b3.add_transition(245, b3)
-b3.add_transition(246, b3)
-b3.add_transition(247, b3)
-b3.add_transition(248, b3)
-b3.add_transition(249, b3)
-b3.add_transition(250, b3)
-b3.add_transition(251, b3)
-b3.add_transition(252, b3)
-b3.add_transition(253, b3)
-b3.add_transition(254, b3)
-b3.add_transition(255, b3)
-
-b2.add_transition(0, b4)
-b2.add_transition(1, b4)
-b2.add_transition(2, b4)
-b2.add_transition(3, b4)
-b2.add_transition(4, b4)
-b2.add_transition(5, b4)
-b2.add_transition(6, b4)
-b2.add_transition(7, b4)
-b2.add_transition(8, b4)
-b2.add_transition(9, b4)
-b2.add_transition(10, b4)
-b2.add_transition(11, b4)
-b2.add_transition(12, b4)
-b2.add_transition(13, b4)
-b2.add_transition(14, b4)
-b2.add_transition(15, b4)
-b2.add_transition(16, b4)
-b2.add_transition(17, b4)
-b2.add_transition(18, b4)
-b2.add_transition(19, b4)
-b2.add_transition(20, b4)
-b2.add_transition(21, b4)
-b2.add_transition(22, b4)
-b2.add_transition(23, b4)
-b2.add_transition(24, b4)
-b2.add_transition(25, b4)
-b2.add_transition(26, b4)
-b2.add_transition(27, b4)
-b2.add_transition(28, b4)
-b2.add_transition(29, b4)
-b2.add_transition(30, b4)
-b2.add_transition(31, b4)
-b2.add_transition(32, b4)
-b2.add_transition(33, b4)
-b2.add_transition(34, b4)
-b2.add_transition(35, b4)
-b2.add_transition(36, b4)
-b2.add_transition(37, b4)
-b2.add_transition(38, b4)
-b2.add_transition(39, b4)
-b2.add_transition(40, b4)
-b2.add_transition(41, b4)
-b2.add_transition(42, b4)
-b2.add_transition(43, b4)
-b2.add_transition(44, b4)
-b2.add_transition(45, b4)
-b2.add_transition(46, b4)
-b2.add_transition(47, b4)
-b2.add_transition(48, b4)
-b2.add_transition(49, b4)
-b2.add_transition(50, b4)
-b2.add_transition(51, b4)
-b2.add_transition(52, b4)
-b2.add_transition(53, b4)
-b2.add_transition(54, b4)
-b2.add_transition(55, b4)
-b2.add_transition(56, b4)
-b2.add_transition(57, b4)
-b2.add_transition(58, b4)
-b2.add_transition(59, b4)
-b2.add_transition(60, b4)
-b2.add_transition(61, b4)
-b2.add_transition(62, b4)
-b2.add_transition(63, b4)
-b2.add_transition(64, b4)
-b2.add_transition(65, b4)
-b2.add_transition(66, b4)
-b2.add_transition(67, b4)
-b2.add_transition(68, b4)
-b2.add_transition(69, b4)
-b2.add_transition(70, b4)
-b2.add_transition(71, b4)
-b2.add_transition(72, b4)
-b2.add_transition(73, b4)
-b2.add_transition(74, b4)
-b2.add_transition(75, b4)
-b2.add_transition(76, b4)
-b2.add_transition(77, b4)
-b2.add_transition(78, b4)
-b2.add_transition(79, b4)
-b2.add_transition(80, b4)
-b2.add_transition(81, b4)
-b2.add_transition(82, b4)
-b2.add_transition(83, b4)
-b2.add_transition(84, b4)
-b2.add_transition(85, b4)
-b2.add_transition(86, b4)
-b2.add_transition(87, b4)
-b2.add_transition(88, b4)
-b2.add_transition(89, b4)
-b2.add_transition(90, b4)
-b2.add_transition(91, b4)
-b2.add_transition(92, b5)
-b2.add_transition(93, b4)
-b2.add_transition(94, b4)
-b2.add_transition(95, b4)
-b2.add_transition(96, b4)
-b2.add_transition(97, b4)
-b2.add_transition(98, b4)
-b2.add_transition(99, b4)
-b2.add_transition(100, b4)
-b2.add_transition(101, b4)
-b2.add_transition(102, b4)
-b2.add_transition(103, b4)
-b2.add_transition(104, b4)
-b2.add_transition(105, b4)
-b2.add_transition(106, b4)
-b2.add_transition(107, b4)
-b2.add_transition(108, b4)
-b2.add_transition(109, b4)
-b2.add_transition(110, b4)
-b2.add_transition(111, b4)
-b2.add_transition(112, b4)
-b2.add_transition(113, b4)
-b2.add_transition(114, b4)
-b2.add_transition(115, b4)
-b2.add_transition(116, b4)
-b2.add_transition(117, b4)
-b2.add_transition(118, b4)
-b2.add_transition(119, b4)
-b2.add_transition(120, b4)
-b2.add_transition(121, b4)
-b2.add_transition(122, b4)
-b2.add_transition(123, b4)
-b2.add_transition(124, b4)
-b2.add_transition(125, b4)
-b2.add_transition(126, b4)
-b2.add_transition(127, b4)
-b2.add_transition(128, b4)
-b2.add_transition(129, b4)
-b2.add_transition(130, b4)
-b2.add_transition(131, b4)
-b2.add_transition(132, b4)
-b2.add_transition(133, b4)
-b2.add_transition(134, b4)
-b2.add_transition(135, b4)
-b2.add_transition(136, b4)
-b2.add_transition(137, b4)
-b2.add_transition(138, b4)
-b2.add_transition(139, b4)
-b2.add_transition(140, b4)
-b2.add_transition(141, b4)
-b2.add_transition(142, b4)
-b2.add_transition(143, b4)
-b2.add_transition(144, b4)
-b2.add_transition(145, b4)
-b2.add_transition(146, b4)
-b2.add_transition(147, b4)
-b2.add_transition(148, b4)
-b2.add_transition(149, b4)
-b2.add_transition(150, b4)
-b2.add_transition(151, b4)
-b2.add_transition(152, b4)
-b2.add_transition(153, b4)
-b2.add_transition(154, b4)
-b2.add_transition(155, b4)
-b2.add_transition(156, b4)
-b2.add_transition(157, b4)
-b2.add_transition(158, b4)
-b2.add_transition(159, b4)
-b2.add_transition(160, b4)
-b2.add_transition(161, b4)
-b2.add_transition(162, b4)
-b2.add_transition(163, b4)
-b2.add_transition(164, b4)
-b2.add_transition(165, b4)
-b2.add_transition(166, b4)
-b2.add_transition(167, b4)
-b2.add_transition(168, b4)
-b2.add_transition(169, b4)
-b2.add_transition(170, b4)
-b2.add_transition(171, b4)
-b2.add_transition(172, b4)
-b2.add_transition(173, b4)
-b2.add_transition(174, b4)
-b2.add_transition(175, b4)
-b2.add_transition(176, b4)
-b2.add_transition(177, b4)
-b2.add_transition(178, b4)
-b2.add_transition(179, b4)
-b2.add_transition(180, b4)
-b2.add_transition(181, b4)
-b2.add_transition(182, b4)
-b2.add_transition(183, b4)
-b2.add_transition(184, b4)
-b2.add_transition(185, b4)
-b2.add_transition(186, b4)
-b2.add_transition(187, b4)
-b2.add_transition(188, b4)
-b2.add_transition(189, b4)
-b2.add_transition(190, b4)
-b2.add_transition(191, b4)
-b2.add_transition(192, b4)
-b2.add_transition(193, b4)
-b2.add_transition(194, b4)
-b2.add_transition(195, b4)
-b2.add_transition(196, b4)
-b2.add_transition(197, b4)
-b2.add_transition(198, b4)
-b2.add_transition(199, b4)
-b2.add_transition(200, b4)
-b2.add_transition(201, b4)
-b2.add_transition(202, b4)
-b2.add_transition(203, b4)
-b2.add_transition(204, b4)
-b2.add_transition(205, b4)
-b2.add_transition(206, b4)
-b2.add_transition(207, b4)
-b2.add_transition(208, b4)
-b2.add_transition(209, b4)
-b2.add_transition(210, b4)
-b2.add_transition(211, b4)
-b2.add_transition(212, b4)
-b2.add_transition(213, b4)
-b2.add_transition(214, b4)
-b2.add_transition(215, b4)
-b2.add_transition(216, b4)
-b2.add_transition(217, b4)
-b2.add_transition(218, b4)
-b2.add_transition(219, b4)
-b2.add_transition(220, b4)
-b2.add_transition(221, b4)
-b2.add_transition(222, b4)
-b2.add_transition(223, b4)
-b2.add_transition(224, b4)
-b2.add_transition(225, b4)
-b2.add_transition(226, b4)
-b2.add_transition(227, b4)
-b2.add_transition(228, b4)
-b2.add_transition(229, b4)
-b2.add_transition(230, b4)
-b2.add_transition(231, b4)
-b2.add_transition(232, b4)
-b2.add_transition(233, b4)
-b2.add_transition(234, b4)
-b2.add_transition(235, b4)
-b2.add_transition(236, b4)
-b2.add_transition(237, b4)
-b2.add_transition(238, b4)
-b2.add_transition(239, b4)
-b2.add_transition(240, b4)
-b2.add_transition(241, b4)
-b2.add_transition(242, b4)
-b2.add_transition(243, b4)
-b2.add_transition(244, b4)
-b2.add_transition(245, b4)
-b2.add_transition(246, b4)
-b2.add_transition(247, b4)
-b2.add_transition(248, b4)
-b2.add_transition(249, b4)
-b2.add_transition(250, b4)
-b2.add_transition(251, b4)
-b2.add_transition(252, b4)
-b2.add_transition(253, b4)
-b2.add_transition(254, b4)
-b2.add_transition(255, b4)
-
-b4.add_transition(39, b6)
-
-b5.add_transition(39, b6)
-b5.add_transition(110, b4)
-b5.add_transition(115, b4)
-b5.add_transition(116, b4)
-b5.add_transition(118, b4)
-
-c1.isFinalState = True
-c1.addToken( 'Unit')
-
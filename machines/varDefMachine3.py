@@ -1,3726 +0,0 @@
-from Machines_gen_usage.Classes_ import State
-
-b9 = State('b9')
-b8 = State('b8')
-b5 = State('b5')
-b10 = State('b10')
-b6 = State('b6')
-b4 = State('b4')
-b7 = State('b7')
-b3 = State('b3')
-b2 = State('b2')
-b1 = State('b1')
-p3 = State('p3')
-p2 = State('p2')
-p1 = State('p1')
-n1 = State('n1')
-k3 = State('k3')
-k2 = State('k2')
-k1 = State('k1')
-l3 = State('l3')
-l2 = State('l2')
-l1 = State('l1')
-m3 = State('m3')
-m2 = State('m2')
-m1 = State('m1')
-i3 = State('i3')
-i2 = State('i2')
-i1 = State('i1')
-j3 = State('j3')
-j2 = State('j2')
-j1 = State('j1')
-o3 = State('o3')
-o2 = State('o2')
-o1 = State('o1')
-f1 = State('f1')
-g1 = State('g1')
-h1 = State('h1')
-e1 = State('e1')
-d1 = State('d1')
-c1 = State('c1')
-a2 = State('a2')
-a1 = State('a1')
-a0 = State('a0')
-a0.add_transition(91, a1)
-a0.add_transition(124, c1)
-a0.add_transition(63, d1)
-a0.add_transition(42, e1)
-a0.add_transition(35, h1)
-a0.add_transition(43, g1)
-a0.add_transition(94, f1)
-a0.add_transition(39, o1)
-a0.add_transition(39, j1)
-a0.add_transition(39, i1)
-a0.add_transition(39, m1)
-a0.add_transition(39, l1)
-a0.add_transition(39, k1)
-a0.add_transition(95, n1)
-a0.add_transition(34, p1)
-a0.add_transition(40, b1)
-
-a1.add_transition(0, a1)
-a1.add_transition(1, a1)
-a1.add_transition(2, a1)
-a1.add_transition(3, a1)
-a1.add_transition(4, a1)
-a1.add_transition(5, a1)
-a1.add_transition(6, a1)
-a1.add_transition(7, a1)
-a1.add_transition(8, a1)
-a1.add_transition(9, a1)
-a1.add_transition(10, a1)
-a1.add_transition(11, a1)
-a1.add_transition(12, a1)
-a1.add_transition(13, a1)
-a1.add_transition(14, a1)
-a1.add_transition(15, a1)
-a1.add_transition(16, a1)
-a1.add_transition(17, a1)
-a1.add_transition(18, a1)
-a1.add_transition(19, a1)
-a1.add_transition(20, a1)
-a1.add_transition(21, a1)
-a1.add_transition(22, a1)
-a1.add_transition(23, a1)
-a1.add_transition(24, a1)
-a1.add_transition(25, a1)
-a1.add_transition(26, a1)
-a1.add_transition(27, a1)
-a1.add_transition(28, a1)
-a1.add_transition(29, a1)
-a1.add_transition(30, a1)
-a1.add_transition(31, a1)
-a1.add_transition(32, a1)
-a1.add_transition(33, a1)
-a1.add_transition(34, a1)
-a1.add_transition(35, a1)
-a1.add_transition(36, a1)
-a1.add_transition(37, a1)
-a1.add_transition(38, a1)
-a1.add_transition(39, a1)
-a1.add_transition(40, a1)
-a1.add_transition(41, a1)
-a1.add_transition(42, a1)
-a1.add_transition(43, a1)
-a1.add_transition(44, a1)
-a1.add_transition(45, a1)
-a1.add_transition(46, a1)
-a1.add_transition(47, a1)
-a1.add_transition(48, a1)
-a1.add_transition(49, a1)
-a1.add_transition(50, a1)
-a1.add_transition(51, a1)
-a1.add_transition(52, a1)
-a1.add_transition(53, a1)
-a1.add_transition(54, a1)
-a1.add_transition(55, a1)
-a1.add_transition(56, a1)
-a1.add_transition(57, a1)
-a1.add_transition(58, a1)
-a1.add_transition(59, a1)
-a1.add_transition(60, a1)
-a1.add_transition(61, a1)
-a1.add_transition(62, a1)
-a1.add_transition(63, a1)
-a1.add_transition(64, a1)
-a1.add_transition(65, a1)
-a1.add_transition(66, a1)
-a1.add_transition(67, a1)
-a1.add_transition(68, a1)
-a1.add_transition(69, a1)
-a1.add_transition(70, a1)
-a1.add_transition(71, a1)
-a1.add_transition(72, a1)
-a1.add_transition(73, a1)
-a1.add_transition(74, a1)
-a1.add_transition(75, a1)
-a1.add_transition(76, a1)
-a1.add_transition(77, a1)
-a1.add_transition(78, a1)
-a1.add_transition(79, a1)
-a1.add_transition(80, a1)
-a1.add_transition(81, a1)
-a1.add_transition(82, a1)
-a1.add_transition(83, a1)
-a1.add_transition(84, a1)
-a1.add_transition(85, a1)
-a1.add_transition(86, a1)
-a1.add_transition(87, a1)
-a1.add_transition(88, a1)
-a1.add_transition(89, a1)
-a1.add_transition(90, a1)
-a1.add_transition(92, a1)
-a1.add_transition(93, a2)
-a1.add_transition(94, a1)
-a1.add_transition(95, a1)
-a1.add_transition(96, a1)
-a1.add_transition(97, a1)
-a1.add_transition(98, a1)
-a1.add_transition(99, a1)
-a1.add_transition(100, a1)
-a1.add_transition(101, a1)
-a1.add_transition(102, a1)
-a1.add_transition(103, a1)
-a1.add_transition(104, a1)
-a1.add_transition(105, a1)
-a1.add_transition(106, a1)
-a1.add_transition(107, a1)
-a1.add_transition(108, a1)
-a1.add_transition(109, a1)
-a1.add_transition(110, a1)
-a1.add_transition(111, a1)
-a1.add_transition(112, a1)
-a1.add_transition(113, a1)
-a1.add_transition(114, a1)
-a1.add_transition(115, a1)
-a1.add_transition(116, a1)
-a1.add_transition(117, a1)
-a1.add_transition(118, a1)
-a1.add_transition(119, a1)
-a1.add_transition(120, a1)
-a1.add_transition(121, a1)
-a1.add_transition(122, a1)
-a1.add_transition(123, a1)
-a1.add_transition(124, a1)
-a1.add_transition(125, a1)
-a1.add_transition(126, a1)
-a1.add_transition(127, a1)
-a1.add_transition(128, a1)
-a1.add_transition(129, a1)
-a1.add_transition(130, a1)
-a1.add_transition(131, a1)
-a1.add_transition(132, a1)
-a1.add_transition(133, a1)
-a1.add_transition(134, a1)
-a1.add_transition(135, a1)
-a1.add_transition(136, a1)
-a1.add_transition(137, a1)
-a1.add_transition(138, a1)
-a1.add_transition(139, a1)
-a1.add_transition(140, a1)
-a1.add_transition(141, a1)
-a1.add_transition(142, a1)
-a1.add_transition(143, a1)
-a1.add_transition(144, a1)
-a1.add_transition(145, a1)
-a1.add_transition(146, a1)
-a1.add_transition(147, a1)
-a1.add_transition(148, a1)
-a1.add_transition(149, a1)
-a1.add_transition(150, a1)
-a1.add_transition(151, a1)
-a1.add_transition(152, a1)
-a1.add_transition(153, a1)
-a1.add_transition(154, a1)
-a1.add_transition(155, a1)
-a1.add_transition(156, a1)
-a1.add_transition(157, a1)
-a1.add_transition(158, a1)
-a1.add_transition(159, a1)
-a1.add_transition(160, a1)
-a1.add_transition(161, a1)
-a1.add_transition(162, a1)
-a1.add_transition(163, a1)
-a1.add_transition(164, a1)
-a1.add_transition(165, a1)
-a1.add_transition(166, a1)
-a1.add_transition(167, a1)
-a1.add_transition(168, a1)
-a1.add_transition(169, a1)
-a1.add_transition(170, a1)
-a1.add_transition(171, a1)
-a1.add_transition(172, a1)
-a1.add_transition(173, a1)
-a1.add_transition(174, a1)
-a1.add_transition(175, a1)
-a1.add_transition(176, a1)
-a1.add_transition(177, a1)
-a1.add_transition(178, a1)
-a1.add_transition(179, a1)
-a1.add_transition(180, a1)
-a1.add_transition(181, a1)
-a1.add_transition(182, a1)
-a1.add_transition(183, a1)
-a1.add_transition(184, a1)
-a1.add_transition(185, a1)
-a1.add_transition(186, a1)
-a1.add_transition(187, a1)
-a1.add_transition(188, a1)
-a1.add_transition(189, a1)
-a1.add_transition(190, a1)
-a1.add_transition(191, a1)
-a1.add_transition(192, a1)
-a1.add_transition(193, a1)
-a1.add_transition(194, a1)
-a1.add_transition(195, a1)
-a1.add_transition(196, a1)
-a1.add_transition(197, a1)
-a1.add_transition(198, a1)
-a1.add_transition(199, a1)
-a1.add_transition(200, a1)
-a1.add_transition(201, a1)
-a1.add_transition(202, a1)
-a1.add_transition(203, a1)
-a1.add_transition(204, a1)
-a1.add_transition(205, a1)
-a1.add_transition(206, a1)
-a1.add_transition(207, a1)
-a1.add_transition(208, a1)
-a1.add_transition(209, a1)
-a1.add_transition(210, a1)
-a1.add_transition(211, a1)
-a1.add_transition(212, a1)
-a1.add_transition(213, a1)
-a1.add_transition(214, a1)
-a1.add_transition(215, a1)
-a1.add_transition(216, a1)
-a1.add_transition(217, a1)
-a1.add_transition(218, a1)
-a1.add_transition(219, a1)
-a1.add_transition(220, a1)
-a1.add_transition(221, a1)
-a1.add_transition(222, a1)
-a1.add_transition(223, a1)
-a1.add_transition(224, a1)
-a1.add_transition(225, a1)
-a1.add_transition(226, a1)
-a1.add_transition(227, a1)
-a1.add_transition(228, a1)
-a1.add_transition(229, a1)
-a1.add_transition(230, a1)
-a1.add_transition(231, a1)
-a1.add_transition(232, a1)
-a1.add_transition(233, a1)
-a1.add_transition(234, a1)
-a1.add_transition(235, a1)
-a1.add_transition(236, a1)
-a1.add_transition(237, a1)
-a1.add_transition(238, a1)
-a1.add_transition(239, a1)
-a1.add_transition(240, a1)
-a1.add_transition(241, a1)
-a1.add_transition(242, a1)
-a1.add_transition(243, a1)
-a1.add_transition(244, a1)
-a1.add_transition(245, a1)
-a1.add_transition(246, a1)
-a1.add_transition(247, a1)
-a1.add_transition(248, a1)
-a1.add_transition(249, a1)
-a1.add_transition(250, a1)
-a1.add_transition(251, a1)
-a1.add_transition(252, a1)
-a1.add_transition(253, a1)
-a1.add_transition(254, a1)
-a1.add_transition(255, a1)
-
-a2.isFinalState = True
-a2.addToken( 'IN_SET')
-
-c1.isFinalState = True
-c1.addToken( 'OPERATOR')
-
-d1.isFinalState = True
-d1.addToken( 'OPERATOR')
-
-e1.isFinalState = True
-e1.addToken( 'OPERATOR')
-
-h1.isFinalState = True
-h1.addToken( 'OPERATOR')
-
-g1.isFinalState = True
-g1.addToken( 'OPERATOR')
-
-f1.isFinalState = True
-f1.addToken( 'OPERATOR')
-
-o1.add_transition(0, o2)
-o1.add_transition(1, o2)
-o1.add_transition(2, o2)
-o1.add_transition(3, o2)
-o1.add_transition(4, o2)
-o1.add_transition(5, o2)
-o1.add_transition(6, o2)
-o1.add_transition(7, o2)
-o1.add_transition(8, o2)
-o1.add_transition(9, o2)
-o1.add_transition(10, o2)
-o1.add_transition(11, o2)
-o1.add_transition(12, o2)
-o1.add_transition(13, o2)
-o1.add_transition(14, o2)
-o1.add_transition(15, o2)
-o1.add_transition(16, o2)
-o1.add_transition(17, o2)
-o1.add_transition(18, o2)
-o1.add_transition(19, o2)
-o1.add_transition(20, o2)
-o1.add_transition(21, o2)
-o1.add_transition(22, o2)
-o1.add_transition(23, o2)
-o1.add_transition(24, o2)
-o1.add_transition(25, o2)
-o1.add_transition(26, o2)
-o1.add_transition(27, o2)
-o1.add_transition(28, o2)
-o1.add_transition(29, o2)
-o1.add_transition(30, o2)
-o1.add_transition(31, o2)
-o1.add_transition(32, o2)
-o1.add_transition(33, o2)
-o1.add_transition(34, o2)
-o1.add_transition(35, o2)
-o1.add_transition(36, o2)
-o1.add_transition(37, o2)
-o1.add_transition(38, o2)
-o1.add_transition(40, o2)
-o1.add_transition(41, o2)
-o1.add_transition(42, o2)
-o1.add_transition(43, o2)
-o1.add_transition(44, o2)
-o1.add_transition(45, o2)
-o1.add_transition(46, o2)
-o1.add_transition(47, o2)
-o1.add_transition(58, o2)
-o1.add_transition(59, o2)
-o1.add_transition(60, o2)
-o1.add_transition(61, o2)
-o1.add_transition(62, o2)
-o1.add_transition(63, o2)
-o1.add_transition(64, o2)
-o1.add_transition(91, o2)
-o1.add_transition(92, o2)
-o1.add_transition(93, o2)
-o1.add_transition(94, o2)
-o1.add_transition(95, o2)
-o1.add_transition(96, o2)
-o1.add_transition(123, o2)
-o1.add_transition(124, o2)
-o1.add_transition(125, o2)
-o1.add_transition(126, o2)
-o1.add_transition(127, o2)
-o1.add_transition(128, o2)
-o1.add_transition(129, o2)
-o1.add_transition(130, o2)
-o1.add_transition(131, o2)
-o1.add_transition(132, o2)
-o1.add_transition(133, o2)
-o1.add_transition(134, o2)
-o1.add_transition(135, o2)
-o1.add_transition(136, o2)
-o1.add_transition(137, o2)
-o1.add_transition(138, o2)
-o1.add_transition(139, o2)
-o1.add_transition(140, o2)
-o1.add_transition(141, o2)
-o1.add_transition(142, o2)
-o1.add_transition(143, o2)
-o1.add_transition(144, o2)
-o1.add_transition(145, o2)
-o1.add_transition(146, o2)
-o1.add_transition(147, o2)
-o1.add_transition(148, o2)
-o1.add_transition(149, o2)
-o1.add_transition(150, o2)
-o1.add_transition(151, o2)
-o1.add_transition(152, o2)
-o1.add_transition(153, o2)
-o1.add_transition(154, o2)
-o1.add_transition(155, o2)
-o1.add_transition(156, o2)
-o1.add_transition(157, o2)
-o1.add_transition(158, o2)
-o1.add_transition(159, o2)
-o1.add_transition(160, o2)
-o1.add_transition(161, o2)
-o1.add_transition(162, o2)
-o1.add_transition(163, o2)
-o1.add_transition(164, o2)
-o1.add_transition(165, o2)
-o1.add_transition(166, o2)
-o1.add_transition(167, o2)
-o1.add_transition(168, o2)
-o1.add_transition(169, o2)
-o1.add_transition(170, o2)
-o1.add_transition(171, o2)
-o1.add_transition(172, o2)
-o1.add_transition(173, o2)
-o1.add_transition(174, o2)
-o1.add_transition(175, o2)
-o1.add_transition(176, o2)
-o1.add_transition(177, o2)
-o1.add_transition(178, o2)
-o1.add_transition(179, o2)
-o1.add_transition(180, o2)
-o1.add_transition(181, o2)
-o1.add_transition(182, o2)
-o1.add_transition(183, o2)
-o1.add_transition(184, o2)
-o1.add_transition(185, o2)
-o1.add_transition(186, o2)
-o1.add_transition(187, o2)
-o1.add_transition(188, o2)
-o1.add_transition(189, o2)
-o1.add_transition(190, o2)
-o1.add_transition(191, o2)
-o1.add_transition(192, o2)
-o1.add_transition(193, o2)
-o1.add_transition(194, o2)
-o1.add_transition(195, o2)
-o1.add_transition(196, o2)
-o1.add_transition(197, o2)
-o1.add_transition(198, o2)
-o1.add_transition(199, o2)
-o1.add_transition(200, o2)
-o1.add_transition(201, o2)
-o1.add_transition(202, o2)
-o1.add_transition(203, o2)
-o1.add_transition(204, o2)
-o1.add_transition(205, o2)
-o1.add_transition(206, o2)
-o1.add_transition(207, o2)
-o1.add_transition(208, o2)
-o1.add_transition(209, o2)
-o1.add_transition(210, o2)
-o1.add_transition(211, o2)
-o1.add_transition(212, o2)
-o1.add_transition(213, o2)
-o1.add_transition(214, o2)
-o1.add_transition(215, o2)
-o1.add_transition(216, o2)
-o1.add_transition(217, o2)
-o1.add_transition(218, o2)
-o1.add_transition(219, o2)
-o1.add_transition(220, o2)
-o1.add_transition(221, o2)
-o1.add_transition(222, o2)
-o1.add_transition(223, o2)
-o1.add_transition(224, o2)
-o1.add_transition(225, o2)
-o1.add_transition(226, o2)
-o1.add_transition(227, o2)
-o1.add_transition(228, o2)
-o1.add_transition(229, o2)
-o1.add_transition(230, o2)
-o1.add_transition(231, o2)
-o1.add_transition(232, o2)
-o1.add_transition(233, o2)
-o1.add_transition(234, o2)
-o1.add_transition(235, o2)
-o1.add_transition(236, o2)
-o1.add_transition(237, o2)
-o1.add_transition(238, o2)
-o1.add_transition(239, o2)
-o1.add_transition(240, o2)
-o1.add_transition(241, o2)
-o1.add_transition(242, o2)
-o1.add_transition(243, o2)
-o1.add_transition(244, o2)
-o1.add_transition(245, o2)
-o1.add_transition(246, o2)
-o1.add_transition(247, o2)
-o1.add_transition(248, o2)
-o1.add_transition(249, o2)
-o1.add_transition(250, o2)
-o1.add_transition(251, o2)
-o1.add_transition(252, o2)
-o1.add_transition(253, o2)
-o1.add_transition(254, o2)
-o1.add_transition(255, o2)
-
-o2.add_transition(39, o3)
-
-o3.isFinalState = True
-o3.addToken( 'SYMBOL')
-
-j1.add_transition(35, j2)
-j1.add_transition(42, j2)
-j1.add_transition(43, j2)
-j1.add_transition(124, j2)
-j1.add_transition(63, j2)
-
-j2.add_transition(39, j3)
-
-j3.isFinalState = True
-j3.addToken( 'SYMBOL')
-
-i1.add_transition(48, i2)
-i1.add_transition(49, i2)
-i1.add_transition(50, i2)
-i1.add_transition(51, i2)
-i1.add_transition(52, i2)
-i1.add_transition(53, i2)
-i1.add_transition(54, i2)
-i1.add_transition(55, i2)
-i1.add_transition(56, i2)
-i1.add_transition(57, i2)
-i1.add_transition(65, i2)
-i1.add_transition(66, i2)
-i1.add_transition(67, i2)
-i1.add_transition(68, i2)
-i1.add_transition(69, i2)
-i1.add_transition(70, i2)
-i1.add_transition(71, i2)
-i1.add_transition(72, i2)
-i1.add_transition(73, i2)
-i1.add_transition(74, i2)
-i1.add_transition(75, i2)
-i1.add_transition(76, i2)
-i1.add_transition(77, i2)
-i1.add_transition(78, i2)
-i1.add_transition(79, i2)
-i1.add_transition(80, i2)
-i1.add_transition(81, i2)
-i1.add_transition(82, i2)
-i1.add_transition(83, i2)
-i1.add_transition(84, i2)
-i1.add_transition(85, i2)
-i1.add_transition(86, i2)
-i1.add_transition(87, i2)
-i1.add_transition(88, i2)
-i1.add_transition(89, i2)
-i1.add_transition(90, i2)
-i1.add_transition(97, i2)
-i1.add_transition(98, i2)
-i1.add_transition(99, i2)
-i1.add_transition(100, i2)
-i1.add_transition(101, i2)
-i1.add_transition(102, i2)
-i1.add_transition(103, i2)
-i1.add_transition(104, i2)
-i1.add_transition(105, i2)
-i1.add_transition(106, i2)
-i1.add_transition(107, i2)
-i1.add_transition(108, i2)
-i1.add_transition(109, i2)
-i1.add_transition(110, i2)
-i1.add_transition(111, i2)
-i1.add_transition(112, i2)
-i1.add_transition(113, i2)
-i1.add_transition(114, i2)
-i1.add_transition(115, i2)
-i1.add_transition(116, i2)
-i1.add_transition(117, i2)
-i1.add_transition(118, i2)
-i1.add_transition(119, i2)
-i1.add_transition(120, i2)
-i1.add_transition(121, i2)
-i1.add_transition(122, i2)
-
-i2.add_transition(39, i3)
-
-i3.isFinalState = True
-i3.addToken( 'SYMBOL')
-
-m1.add_transition(32, m2)
-
-m2.add_transition(39, m3)
-
-m3.isFinalState = True
-m3.addToken( 'SYMBOL')
-
-l1.add_transition(9, l2)
-l1.add_transition(10, l2)
-
-l2.add_transition(39, l3)
-
-l3.isFinalState = True
-l3.addToken( 'SYMBOL')
-
-k1.add_transition(39, k2)
-
-k2.add_transition(39, k3)
-
-k3.isFinalState = True
-k3.addToken( 'SYMBOL')
-
-n1.isFinalState = True
-n1.addToken( 'SYMBOL')
-
-p1.add_transition(0, p2)
-p1.add_transition(1, p2)
-p1.add_transition(2, p2)
-p1.add_transition(3, p2)
-p1.add_transition(4, p2)
-p1.add_transition(5, p2)
-p1.add_transition(6, p2)
-p1.add_transition(7, p2)
-p1.add_transition(8, p2)
-p1.add_transition(9, p2)
-p1.add_transition(10, p2)
-p1.add_transition(11, p2)
-p1.add_transition(12, p2)
-p1.add_transition(13, p2)
-p1.add_transition(14, p2)
-p1.add_transition(15, p2)
-p1.add_transition(16, p2)
-p1.add_transition(17, p2)
-p1.add_transition(18, p2)
-p1.add_transition(19, p2)
-p1.add_transition(20, p2)
-p1.add_transition(21, p2)
-p1.add_transition(22, p2)
-p1.add_transition(23, p2)
-p1.add_transition(24, p2)
-p1.add_transition(25, p2)
-p1.add_transition(26, p2)
-p1.add_transition(27, p2)
-p1.add_transition(28, p2)
-p1.add_transition(29, p2)
-p1.add_transition(30, p2)
-p1.add_transition(31, p2)
-p1.add_transition(32, p2)
-p1.add_transition(33, p2)
-p1.add_transition(34, p2)
-p1.add_transition(35, p2)
-p1.add_transition(36, p2)
-p1.add_transition(37, p2)
-p1.add_transition(38, p2)
-p1.add_transition(39, p2)
-p1.add_transition(40, p2)
-p1.add_transition(41, p2)
-p1.add_transition(42, p2)
-p1.add_transition(43, p2)
-p1.add_transition(44, p2)
-p1.add_transition(45, p2)
-p1.add_transition(46, p2)
-p1.add_transition(47, p2)
-p1.add_transition(48, p2)
-p1.add_transition(49, p2)
-p1.add_transition(50, p2)
-p1.add_transition(51, p2)
-p1.add_transition(52, p2)
-p1.add_transition(53, p2)
-p1.add_transition(54, p2)
-p1.add_transition(55, p2)
-p1.add_transition(56, p2)
-p1.add_transition(57, p2)
-p1.add_transition(58, p2)
-p1.add_transition(59, p2)
-p1.add_transition(60, p2)
-p1.add_transition(61, p2)
-p1.add_transition(62, p2)
-p1.add_transition(63, p2)
-p1.add_transition(64, p2)
-p1.add_transition(65, p2)
-p1.add_transition(66, p2)
-p1.add_transition(67, p2)
-p1.add_transition(68, p2)
-p1.add_transition(69, p2)
-p1.add_transition(70, p2)
-p1.add_transition(71, p2)
-p1.add_transition(72, p2)
-p1.add_transition(73, p2)
-p1.add_transition(74, p2)
-p1.add_transition(75, p2)
-p1.add_transition(76, p2)
-p1.add_transition(77, p2)
-p1.add_transition(78, p2)
-p1.add_transition(79, p2)
-p1.add_transition(80, p2)
-p1.add_transition(81, p2)
-p1.add_transition(82, p2)
-p1.add_transition(83, p2)
-p1.add_transition(84, p2)
-p1.add_transition(85, p2)
-p1.add_transition(86, p2)
-p1.add_transition(87, p2)
-p1.add_transition(88, p2)
-p1.add_transition(89, p2)
-p1.add_transition(90, p2)
-p1.add_transition(91, p2)
-p1.add_transition(92, p2)
-p1.add_transition(93, p2)
-p1.add_transition(94, p2)
-p1.add_transition(95, p2)
-p1.add_transition(96, p2)
-p1.add_transition(97, p2)
-p1.add_transition(98, p2)
-p1.add_transition(99, p2)
-p1.add_transition(100, p2)
-p1.add_transition(101, p2)
-p1.add_transition(102, p2)
-p1.add_transition(103, p2)
-p1.add_transition(104, p2)
-p1.add_transition(105, p2)
-p1.add_transition(106, p2)
-p1.add_transition(107, p2)
-p1.add_transition(108, p2)
-p1.add_transition(109, p2)
-p1.add_transition(110, p2)
-p1.add_transition(111, p2)
-p1.add_transition(112, p2)
-p1.add_transition(113, p2)
-p1.add_transition(114, p2)
-p1.add_transition(115, p2)
-p1.add_transition(116, p2)
-p1.add_transition(117, p2)
-p1.add_transition(118, p2)
-p1.add_transition(119, p2)
-p1.add_transition(120, p2)
-p1.add_transition(121, p2)
-p1.add_transition(122, p2)
-p1.add_transition(123, p2)
-p1.add_transition(124, p2)
-p1.add_transition(125, p2)
-p1.add_transition(126, p2)
-p1.add_transition(127, p2)
-p1.add_transition(128, p2)
-p1.add_transition(129, p2)
-p1.add_transition(130, p2)
-p1.add_transition(131, p2)
-p1.add_transition(132, p2)
-p1.add_transition(133, p2)
-p1.add_transition(134, p2)
-p1.add_transition(135, p2)
-p1.add_transition(136, p2)
-p1.add_transition(137, p2)
-p1.add_transition(138, p2)
-p1.add_transition(139, p2)
-p1.add_transition(140, p2)
-p1.add_transition(141, p2)
-p1.add_transition(142, p2)
-p1.add_transition(143, p2)
-p1.add_transition(144, p2)
-p1.add_transition(145, p2)
-p1.add_transition(146, p2)
-p1.add_transition(147, p2)
-p1.add_transition(148, p2)
-p1.add_transition(149, p2)
-p1.add_transition(150, p2)
-p1.add_transition(151, p2)
-p1.add_transition(152, p2)
-p1.add_transition(153, p2)
-p1.add_transition(154, p2)
-p1.add_transition(155, p2)
-p1.add_transition(156, p2)
-p1.add_transition(157, p2)
-p1.add_transition(158, p2)
-p1.add_transition(159, p2)
-p1.add_transition(160, p2)
-p1.add_transition(161, p2)
-p1.add_transition(162, p2)
-p1.add_transition(163, p2)
-p1.add_transition(164, p2)
-p1.add_transition(165, p2)
-p1.add_transition(166, p2)
-p1.add_transition(167, p2)
-p1.add_transition(168, p2)
-p1.add_transition(169, p2)
-p1.add_transition(170, p2)
-p1.add_transition(171, p2)
-p1.add_transition(172, p2)
-p1.add_transition(173, p2)
-p1.add_transition(174, p2)
-p1.add_transition(175, p2)
-p1.add_transition(176, p2)
-p1.add_transition(177, p2)
-p1.add_transition(178, p2)
-p1.add_transition(179, p2)
-p1.add_transition(180, p2)
-p1.add_transition(181, p2)
-p1.add_transition(182, p2)
-p1.add_transition(183, p2)
-p1.add_transition(184, p2)
-p1.add_transition(185, p2)
-p1.add_transition(186, p2)
-p1.add_transition(187, p2)
-p1.add_transition(188, p2)
-p1.add_transition(189, p2)
-p1.add_transition(190, p2)
-p1.add_transition(191, p2)
-p1.add_transition(192, p2)
-p1.add_transition(193, p2)
-p1.add_transition(194, p2)
-p1.add_transition(195, p2)
-p1.add_transition(196, p2)
-p1.add_transition(197, p2)
-p1.add_transition(198, p2)
-p1.add_transition(199, p2)
-p1.add_transition(200, p2)
-p1.add_transition(201, p2)
-p1.add_transition(202, p2)
-p1.add_transition(203, p2)
-p1.add_transition(204, p2)
-p1.add_transition(205, p2)
-p1.add_transition(206, p2)
-p1.add_transition(207, p2)
-p1.add_transition(208, p2)
-p1.add_transition(209, p2)
-p1.add_transition(210, p2)
-p1.add_transition(211, p2)
-p1.add_transition(212, p2)
-p1.add_transition(213, p2)
-p1.add_transition(214, p2)
-p1.add_transition(215, p2)
-p1.add_transition(216, p2)
-p1.add_transition(217, p2)
-p1.add_transition(218, p2)
-p1.add_transition(219, p2)
-p1.add_transition(220, p2)
-p1.add_transition(221, p2)
-p1.add_transition(222, p2)
-p1.add_transition(223, p2)
-p1.add_transition(224, p2)
-p1.add_transition(225, p2)
-p1.add_transition(226, p2)
-p1.add_transition(227, p2)
-p1.add_transition(228, p2)
-p1.add_transition(229, p2)
-p1.add_transition(230, p2)
-p1.add_transition(231, p2)
-p1.add_transition(232, p2)
-p1.add_transition(233, p2)
-p1.add_transition(234, p2)
-p1.add_transition(235, p2)
-p1.add_transition(236, p2)
-p1.add_transition(237, p2)
-p1.add_transition(238, p2)
-p1.add_transition(239, p2)
-p1.add_transition(240, p2)
-p1.add_transition(241, p2)
-p1.add_transition(242, p2)
-p1.add_transition(243, p2)
-p1.add_transition(244, p2)
-p1.add_transition(245, p2)
-p1.add_transition(246, p2)
-p1.add_transition(247, p2)
-p1.add_transition(248, p2)
-p1.add_transition(249, p2)
-p1.add_transition(250, p2)
-p1.add_transition(251, p2)
-p1.add_transition(252, p2)
-p1.add_transition(253, p2)
-p1.add_transition(254, p2)
-p1.add_transition(255, p2)
-
-p2.add_transition(0, p2)
-p2.add_transition(1, p2)
-p2.add_transition(2, p2)
-p2.add_transition(3, p2)
-p2.add_transition(4, p2)
-p2.add_transition(5, p2)
-p2.add_transition(6, p2)
-p2.add_transition(7, p2)
-p2.add_transition(8, p2)
-p2.add_transition(9, p2)
-p2.add_transition(10, p2)
-p2.add_transition(11, p2)
-p2.add_transition(12, p2)
-p2.add_transition(13, p2)
-p2.add_transition(14, p2)
-p2.add_transition(15, p2)
-p2.add_transition(16, p2)
-p2.add_transition(17, p2)
-p2.add_transition(18, p2)
-p2.add_transition(19, p2)
-p2.add_transition(20, p2)
-p2.add_transition(21, p2)
-p2.add_transition(22, p2)
-p2.add_transition(23, p2)
-p2.add_transition(24, p2)
-p2.add_transition(25, p2)
-p2.add_transition(26, p2)
-p2.add_transition(27, p2)
-p2.add_transition(28, p2)
-p2.add_transition(29, p2)
-p2.add_transition(30, p2)
-p2.add_transition(31, p2)
-p2.add_transition(32, p2)
-p2.add_transition(33, p2)
-p2.add_transition(34, p3)
-p2.add_transition(35, p2)
-p2.add_transition(36, p2)
-p2.add_transition(37, p2)
-p2.add_transition(38, p2)
-p2.add_transition(39, p2)
-p2.add_transition(40, p2)
-p2.add_transition(41, p2)
-p2.add_transition(42, p2)
-p2.add_transition(43, p2)
-p2.add_transition(44, p2)
-p2.add_transition(45, p2)
-p2.add_transition(46, p2)
-p2.add_transition(47, p2)
-p2.add_transition(48, p2)
-p2.add_transition(49, p2)
-p2.add_transition(50, p2)
-p2.add_transition(51, p2)
-p2.add_transition(52, p2)
-p2.add_transition(53, p2)
-p2.add_transition(54, p2)
-p2.add_transition(55, p2)
-p2.add_transition(56, p2)
-p2.add_transition(57, p2)
-p2.add_transition(58, p2)
-p2.add_transition(59, p2)
-p2.add_transition(60, p2)
-p2.add_transition(61, p2)
-p2.add_transition(62, p2)
-p2.add_transition(63, p2)
-p2.add_transition(64, p2)
-p2.add_transition(65, p2)
-p2.add_transition(66, p2)
-p2.add_transition(67, p2)
-p2.add_transition(68, p2)
-p2.add_transition(69, p2)
-p2.add_transition(70, p2)
-p2.add_transition(71, p2)
-p2.add_transition(72, p2)
-p2.add_transition(73, p2)
-p2.add_transition(74, p2)
-p2.add_transition(75, p2)
-p2.add_transition(76, p2)
-p2.add_transition(77, p2)
-p2.add_transition(78, p2)
-p2.add_transition(79, p2)
-p2.add_transition(80, p2)
-p2.add_transition(81, p2)
-p2.add_transition(82, p2)
-p2.add_transition(83, p2)
-p2.add_transition(84, p2)
-p2.add_transition(85, p2)
-p2.add_transition(86, p2)
-p2.add_transition(87, p2)
-p2.add_transition(88, p2)
-p2.add_transition(89, p2)
-p2.add_transition(90, p2)
-p2.add_transition(91, p2)
-p2.add_transition(92, p2)
-p2.add_transition(93, p2)
-p2.add_transition(94, p2)
-p2.add_transition(95, p2)
-p2.add_transition(96, p2)
-p2.add_transition(97, p2)
-p2.add_transition(98, p2)
-p2.add_transition(99, p2)
-p2.add_transition(100, p2)
-p2.add_transition(101, p2)
-p2.add_transition(102, p2)
-p2.add_transition(103, p2)
-p2.add_transition(104, p2)
-p2.add_transition(105, p2)
-p2.add_transition(106, p2)
-p2.add_transition(107, p2)
-p2.add_transition(108, p2)
-p2.add_transition(109, p2)
-p2.add_transition(110, p2)
-p2.add_transition(111, p2)
-p2.add_transition(112, p2)
-p2.add_transition(113, p2)
-p2.add_transition(114, p2)
-p2.add_transition(115, p2)
-p2.add_transition(116, p2)
-p2.add_transition(117, p2)
-p2.add_transition(118, p2)
-p2.add_transition(119, p2)
-p2.add_transition(120, p2)
-p2.add_transition(121, p2)
-p2.add_transition(122, p2)
-p2.add_transition(123, p2)
-p2.add_transition(124, p2)
-p2.add_transition(125, p2)
-p2.add_transition(126, p2)
-p2.add_transition(127, p2)
-p2.add_transition(128, p2)
-p2.add_transition(129, p2)
-p2.add_transition(130, p2)
-p2.add_transition(131, p2)
-p2.add_transition(132, p2)
-p2.add_transition(133, p2)
-p2.add_transition(134, p2)
-p2.add_transition(135, p2)
-p2.add_transition(136, p2)
-p2.add_transition(137, p2)
-p2.add_transition(138, p2)
-p2.add_transition(139, p2)
-p2.add_transition(140, p2)
-p2.add_transition(141, p2)
-p2.add_transition(142, p2)
-p2.add_transition(143, p2)
-p2.add_transition(144, p2)
-p2.add_transition(145, p2)
-p2.add_transition(146, p2)
-p2.add_transition(147, p2)
-p2.add_transition(148, p2)
-p2.add_transition(149, p2)
-p2.add_transition(150, p2)
-p2.add_transition(151, p2)
-p2.add_transition(152, p2)
-p2.add_transition(153, p2)
-p2.add_transition(154, p2)
-p2.add_transition(155, p2)
-p2.add_transition(156, p2)
-p2.add_transition(157, p2)
-p2.add_transition(158, p2)
-p2.add_transition(159, p2)
-p2.add_transition(160, p2)
-p2.add_transition(161, p2)
-p2.add_transition(162, p2)
-p2.add_transition(163, p2)
-p2.add_transition(164, p2)
-p2.add_transition(165, p2)
-p2.add_transition(166, p2)
-p2.add_transition(167, p2)
-p2.add_transition(168, p2)
-p2.add_transition(169, p2)
-p2.add_transition(170, p2)
-p2.add_transition(171, p2)
-p2.add_transition(172, p2)
-p2.add_transition(173, p2)
-p2.add_transition(174, p2)
-p2.add_transition(175, p2)
-p2.add_transition(176, p2)
-p2.add_transition(177, p2)
-p2.add_transition(178, p2)
-p2.add_transition(179, p2)
-p2.add_transition(180, p2)
-p2.add_transition(181, p2)
-p2.add_transition(182, p2)
-p2.add_transition(183, p2)
-p2.add_transition(184, p2)
-p2.add_transition(185, p2)
-p2.add_transition(186, p2)
-p2.add_transition(187, p2)
-p2.add_transition(188, p2)
-p2.add_transition(189, p2)
-p2.add_transition(190, p2)
-p2.add_transition(191, p2)
-p2.add_transition(192, p2)
-p2.add_transition(193, p2)
-p2.add_transition(194, p2)
-p2.add_transition(195, p2)
-p2.add_transition(196, p2)
-p2.add_transition(197, p2)
-p2.add_transition(198, p2)
-p2.add_transition(199, p2)
-p2.add_transition(200, p2)
-p2.add_transition(201, p2)
-p2.add_transition(202, p2)
-p2.add_transition(203, p2)
-p2.add_transition(204, p2)
-p2.add_transition(205, p2)
-p2.add_transition(206, p2)
-p2.add_transition(207, p2)
-p2.add_transition(208, p2)
-p2.add_transition(209, p2)
-p2.add_transition(210, p2)
-p2.add_transition(211, p2)
-p2.add_transition(212, p2)
-p2.add_transition(213, p2)
-p2.add_transition(214, p2)
-p2.add_transition(215, p2)
-p2.add_transition(216, p2)
-p2.add_transition(217, p2)
-p2.add_transition(218, p2)
-p2.add_transition(219, p2)
-p2.add_transition(220, p2)
-p2.add_transition(221, p2)
-p2.add_transition(222, p2)
-p2.add_transition(223, p2)
-p2.add_transition(224, p2)
-p2.add_transition(225, p2)
-p2.add_transition(226, p2)
-p2.add_transition(227, p2)
-p2.add_transition(228, p2)
-p2.add_transition(229, p2)
-p2.add_transition(230, p2)
-p2.add_transition(231, p2)
-p2.add_transition(232, p2)
-p2.add_transition(233, p2)
-p2.add_transition(234, p2)
-p2.add_transition(235, p2)
-p2.add_transition(236, p2)
-p2.add_transition(237, p2)
-p2.add_transition(238, p2)
-p2.add_transition(239, p2)
-p2.add_transition(240, p2)
-p2.add_transition(241, p2)
-p2.add_transition(242, p2)
-p2.add_transition(243, p2)
-p2.add_transition(244, p2)
-p2.add_transition(245, p2)
-p2.add_transition(246, p2)
-p2.add_transition(247, p2)
-p2.add_transition(248, p2)
-p2.add_transition(249, p2)
-p2.add_transition(250, p2)
-p2.add_transition(251, p2)
-p2.add_transition(252, p2)
-p2.add_transition(253, p2)
-p2.add_transition(254, p2)
-p2.add_transition(255, p2)
-
-p3.isFinalState = True
-p3.addToken( 'STRING')
-p3.add_transition(0, p2)
-p3.add_transition(1, p2)
-p3.add_transition(2, p2)
-p3.add_transition(3, p2)
-p3.add_transition(4, p2)
-p3.add_transition(5, p2)
-p3.add_transition(6, p2)
-p3.add_transition(7, p2)
-p3.add_transition(8, p2)
-p3.add_transition(9, p2)
-p3.add_transition(10, p2)
-p3.add_transition(11, p2)
-p3.add_transition(12, p2)
-p3.add_transition(13, p2)
-p3.add_transition(14, p2)
-p3.add_transition(15, p2)
-p3.add_transition(16, p2)
-p3.add_transition(17, p2)
-p3.add_transition(18, p2)
-p3.add_transition(19, p2)
-p3.add_transition(20, p2)
-p3.add_transition(21, p2)
-p3.add_transition(22, p2)
-p3.add_transition(23, p2)
-p3.add_transition(24, p2)
-p3.add_transition(25, p2)
-p3.add_transition(26, p2)
-p3.add_transition(27, p2)
-p3.add_transition(28, p2)
-p3.add_transition(29, p2)
-p3.add_transition(30, p2)
-p3.add_transition(31, p2)
-p3.add_transition(32, p2)
-p3.add_transition(33, p2)
-p3.add_transition(34, p3)
-p3.add_transition(35, p2)
-p3.add_transition(36, p2)
-p3.add_transition(37, p2)
-p3.add_transition(38, p2)
-p3.add_transition(39, p2)
-p3.add_transition(40, p2)
-p3.add_transition(41, p2)
-p3.add_transition(42, p2)
-p3.add_transition(43, p2)
-p3.add_transition(44, p2)
-p3.add_transition(45, p2)
-p3.add_transition(46, p2)
-p3.add_transition(47, p2)
-p3.add_transition(48, p2)
-p3.add_transition(49, p2)
-p3.add_transition(50, p2)
-p3.add_transition(51, p2)
-p3.add_transition(52, p2)
-p3.add_transition(53, p2)
-p3.add_transition(54, p2)
-p3.add_transition(55, p2)
-p3.add_transition(56, p2)
-p3.add_transition(57, p2)
-p3.add_transition(58, p2)
-p3.add_transition(59, p2)
-p3.add_transition(60, p2)
-p3.add_transition(61, p2)
-p3.add_transition(62, p2)
-p3.add_transition(63, p2)
-p3.add_transition(64, p2)
-p3.add_transition(65, p2)
-p3.add_transition(66, p2)
-p3.add_transition(67, p2)
-p3.add_transition(68, p2)
-p3.add_transition(69, p2)
-p3.add_transition(70, p2)
-p3.add_transition(71, p2)
-p3.add_transition(72, p2)
-p3.add_transition(73, p2)
-p3.add_transition(74, p2)
-p3.add_transition(75, p2)
-p3.add_transition(76, p2)
-p3.add_transition(77, p2)
-p3.add_transition(78, p2)
-p3.add_transition(79, p2)
-p3.add_transition(80, p2)
-p3.add_transition(81, p2)
-p3.add_transition(82, p2)
-p3.add_transition(83, p2)
-p3.add_transition(84, p2)
-p3.add_transition(85, p2)
-p3.add_transition(86, p2)
-p3.add_transition(87, p2)
-p3.add_transition(88, p2)
-p3.add_transition(89, p2)
-p3.add_transition(90, p2)
-p3.add_transition(91, p2)
-p3.add_transition(92, p2)
-p3.add_transition(93, p2)
-p3.add_transition(94, p2)
-p3.add_transition(95, p2)
-p3.add_transition(96, p2)
-p3.add_transition(97, p2)
-p3.add_transition(98, p2)
-p3.add_transition(99, p2)
-p3.add_transition(100, p2)
-p3.add_transition(101, p2)
-p3.add_transition(102, p2)
-p3.add_transition(103, p2)
-p3.add_transition(104, p2)
-p3.add_transition(105, p2)
-p3.add_transition(106, p2)
-p3.add_transition(107, p2)
-p3.add_transition(108, p2)
-p3.add_transition(109, p2)
-p3.add_transition(110, p2)
-p3.add_transition(111, p2)
-p3.add_transition(112, p2)
-p3.add_transition(113, p2)
-p3.add_transition(114, p2)
-p3.add_transition(115, p2)
-p3.add_transition(116, p2)
-p3.add_transition(117, p2)
-p3.add_transition(118, p2)
-p3.add_transition(119, p2)
-p3.add_transition(120, p2)
-p3.add_transition(121, p2)
-p3.add_transition(122, p2)
-p3.add_transition(123, p2)
-p3.add_transition(124, p2)
-p3.add_transition(125, p2)
-p3.add_transition(126, p2)
-p3.add_transition(127, p2)
-p3.add_transition(128, p2)
-p3.add_transition(129, p2)
-p3.add_transition(130, p2)
-p3.add_transition(131, p2)
-p3.add_transition(132, p2)
-p3.add_transition(133, p2)
-p3.add_transition(134, p2)
-p3.add_transition(135, p2)
-p3.add_transition(136, p2)
-p3.add_transition(137, p2)
-p3.add_transition(138, p2)
-p3.add_transition(139, p2)
-p3.add_transition(140, p2)
-p3.add_transition(141, p2)
-p3.add_transition(142, p2)
-p3.add_transition(143, p2)
-p3.add_transition(144, p2)
-p3.add_transition(145, p2)
-p3.add_transition(146, p2)
-p3.add_transition(147, p2)
-p3.add_transition(148, p2)
-p3.add_transition(149, p2)
-p3.add_transition(150, p2)
-p3.add_transition(151, p2)
-p3.add_transition(152, p2)
-p3.add_transition(153, p2)
-p3.add_transition(154, p2)
-p3.add_transition(155, p2)
-p3.add_transition(156, p2)
-p3.add_transition(157, p2)
-p3.add_transition(158, p2)
-p3.add_transition(159, p2)
-p3.add_transition(160, p2)
-p3.add_transition(161, p2)
-p3.add_transition(162, p2)
-p3.add_transition(163, p2)
-p3.add_transition(164, p2)
-p3.add_transition(165, p2)
-p3.add_transition(166, p2)
-p3.add_transition(167, p2)
-p3.add_transition(168, p2)
-p3.add_transition(169, p2)
-p3.add_transition(170, p2)
-p3.add_transition(171, p2)
-p3.add_transition(172, p2)
-p3.add_transition(173, p2)
-p3.add_transition(174, p2)
-p3.add_transition(175, p2)
-p3.add_transition(176, p2)
-p3.add_transition(177, p2)
-p3.add_transition(178, p2)
-p3.add_transition(179, p2)
-p3.add_transition(180, p2)
-p3.add_transition(181, p2)
-p3.add_transition(182, p2)
-p3.add_transition(183, p2)
-p3.add_transition(184, p2)
-p3.add_transition(185, p2)
-p3.add_transition(186, p2)
-p3.add_transition(187, p2)
-p3.add_transition(188, p2)
-p3.add_transition(189, p2)
-p3.add_transition(190, p2)
-p3.add_transition(191, p2)
-p3.add_transition(192, p2)
-p3.add_transition(193, p2)
-p3.add_transition(194, p2)
-p3.add_transition(195, p2)
-p3.add_transition(196, p2)
-p3.add_transition(197, p2)
-p3.add_transition(198, p2)
-p3.add_transition(199, p2)
-p3.add_transition(200, p2)
-p3.add_transition(201, p2)
-p3.add_transition(202, p2)
-p3.add_transition(203, p2)
-p3.add_transition(204, p2)
-p3.add_transition(205, p2)
-p3.add_transition(206, p2)
-p3.add_transition(207, p2)
-p3.add_transition(208, p2)
-p3.add_transition(209, p2)
-p3.add_transition(210, p2)
-p3.add_transition(211, p2)
-p3.add_transition(212, p2)
-p3.add_transition(213, p2)
-p3.add_transition(214, p2)
-p3.add_transition(215, p2)
-p3.add_transition(216, p2)
-p3.add_transition(217, p2)
-p3.add_transition(218, p2)
-p3.add_transition(219, p2)
-p3.add_transition(220, p2)
-p3.add_transition(221, p2)
-p3.add_transition(222, p2)
-p3.add_transition(223, p2)
-p3.add_transition(224, p2)
-p3.add_transition(225, p2)
-p3.add_transition(226, p2)
-p3.add_transition(227, p2)
-p3.add_transition(228, p2)
-p3.add_transition(229, p2)
-p3.add_transition(230, p2)
-p3.add_transition(231, p2)
-p3.add_transition(232, p2)
-p3.add_transition(233, p2)
-p3.add_transition(234, p2)
-p3.add_transition(235, p2)
-p3.add_transition(236, p2)
-p3.add_transition(237, p2)
-p3.add_transition(238, p2)
-p3.add_transition(239, p2)
-p3.add_transition(240, p2)
-p3.add_transition(241, p2)
-p3.add_transition(242, p2)
-p3.add_transition(243, p2)
-p3.add_transition(244, p2)
-p3.add_transition(245, p2)
-p3.add_transition(246, p2)
-p3.add_transition(247, p2)
-p3.add_transition(248, p2)
-p3.add_transition(249, p2)
-p3.add_transition(250, p2)
-p3.add_transition(251, p2)
-p3.add_transition(252, p2)
-p3.add_transition(253, p2)
-p3.add_transition(254, p2)
-p3.add_transition(255, p2)
-
-b1.add_transition(0, b2)
-b1.add_transition(1, b2)
-b1.add_transition(2, b2)
-b1.add_transition(3, b2)
-b1.add_transition(4, b2)
-b1.add_transition(5, b2)
-b1.add_transition(6, b2)
-b1.add_transition(7, b2)
-b1.add_transition(8, b2)
-b1.add_transition(11, b2)
-b1.add_transition(12, b2)
-b1.add_transition(13, b2)
-b1.add_transition(14, b2)
-b1.add_transition(15, b2)
-b1.add_transition(16, b2)
-b1.add_transition(17, b2)
-b1.add_transition(18, b2)
-b1.add_transition(19, b2)
-b1.add_transition(20, b2)
-b1.add_transition(21, b2)
-b1.add_transition(22, b2)
-b1.add_transition(23, b2)
-b1.add_transition(24, b2)
-b1.add_transition(25, b2)
-b1.add_transition(26, b2)
-b1.add_transition(27, b2)
-b1.add_transition(28, b2)
-b1.add_transition(29, b2)
-b1.add_transition(30, b2)
-b1.add_transition(31, b2)
-b1.add_transition(32, b2)
-b1.add_transition(33, b2)
-b1.add_transition(34, b3)
-b1.add_transition(35, b2)
-b1.add_transition(36, b2)
-b1.add_transition(37, b2)
-b1.add_transition(38, b2)
-b1.add_transition(39, b5)
-b1.add_transition(40, b2)
-b1.add_transition(41, b2)
-b1.add_transition(42, b2)
-b1.add_transition(43, b2)
-b1.add_transition(44, b2)
-b1.add_transition(45, b2)
-b1.add_transition(46, b2)
-b1.add_transition(47, b2)
-b1.add_transition(48, b2)
-b1.add_transition(49, b2)
-b1.add_transition(50, b2)
-b1.add_transition(51, b2)
-b1.add_transition(52, b2)
-b1.add_transition(53, b2)
-b1.add_transition(54, b2)
-b1.add_transition(55, b2)
-b1.add_transition(56, b2)
-b1.add_transition(57, b2)
-b1.add_transition(58, b2)
-b1.add_transition(59, b2)
-b1.add_transition(60, b2)
-b1.add_transition(61, b2)
-b1.add_transition(62, b2)
-b1.add_transition(63, b2)
-b1.add_transition(64, b2)
-b1.add_transition(65, b2)
-b1.add_transition(66, b2)
-b1.add_transition(67, b2)
-b1.add_transition(68, b2)
-b1.add_transition(69, b2)
-b1.add_transition(70, b2)
-b1.add_transition(71, b2)
-b1.add_transition(72, b2)
-b1.add_transition(73, b2)
-b1.add_transition(74, b2)
-b1.add_transition(75, b2)
-b1.add_transition(76, b2)
-b1.add_transition(77, b2)
-b1.add_transition(78, b2)
-b1.add_transition(79, b2)
-b1.add_transition(80, b2)
-b1.add_transition(81, b2)
-b1.add_transition(82, b2)
-b1.add_transition(83, b2)
-b1.add_transition(84, b2)
-b1.add_transition(85, b2)
-b1.add_transition(86, b2)
-b1.add_transition(87, b2)
-b1.add_transition(88, b2)
-b1.add_transition(89, b2)
-b1.add_transition(90, b2)
-b1.add_transition(91, b2)
-b1.add_transition(92, b2)
-b1.add_transition(93, b2)
-b1.add_transition(94, b2)
-b1.add_transition(95, b2)
-b1.add_transition(96, b2)
-b1.add_transition(97, b2)
-b1.add_transition(98, b2)
-b1.add_transition(99, b2)
-b1.add_transition(100, b2)
-b1.add_transition(101, b2)
-b1.add_transition(102, b2)
-b1.add_transition(103, b2)
-b1.add_transition(104, b2)
-b1.add_transition(105, b2)
-b1.add_transition(106, b2)
-b1.add_transition(107, b2)
-b1.add_transition(108, b2)
-b1.add_transition(109, b2)
-b1.add_transition(110, b2)
-b1.add_transition(111, b2)
-b1.add_transition(112, b2)
-b1.add_transition(113, b2)
-b1.add_transition(114, b2)
-b1.add_transition(115, b2)
-b1.add_transition(116, b2)
-b1.add_transition(117, b2)
-b1.add_transition(118, b2)
-b1.add_transition(119, b2)
-b1.add_transition(120, b2)
-b1.add_transition(121, b2)
-b1.add_transition(122, b2)
-b1.add_transition(123, b2)
-b1.add_transition(124, b2)
-b1.add_transition(125, b2)
-b1.add_transition(126, b2)
-b1.add_transition(127, b2)
-b1.add_transition(128, b2)
-b1.add_transition(129, b2)
-b1.add_transition(130, b2)
-b1.add_transition(131, b2)
-b1.add_transition(132, b2)
-b1.add_transition(133, b2)
-b1.add_transition(134, b2)
-b1.add_transition(135, b2)
-b1.add_transition(136, b2)
-b1.add_transition(137, b2)
-b1.add_transition(138, b2)
-b1.add_transition(139, b2)
-b1.add_transition(140, b2)
-b1.add_transition(141, b2)
-b1.add_transition(142, b2)
-b1.add_transition(143, b2)
-b1.add_transition(144, b2)
-b1.add_transition(145, b2)
-b1.add_transition(146, b2)
-b1.add_transition(147, b2)
-b1.add_transition(148, b2)
-b1.add_transition(149, b2)
-b1.add_transition(150, b2)
-b1.add_transition(151, b2)
-b1.add_transition(152, b2)
-b1.add_transition(153, b2)
-b1.add_transition(154, b2)
-b1.add_transition(155, b2)
-b1.add_transition(156, b2)
-b1.add_transition(157, b2)
-b1.add_transition(158, b2)
-b1.add_transition(159, b2)
-b1.add_transition(160, b2)
-b1.add_transition(161, b2)
-b1.add_transition(162, b2)
-b1.add_transition(163, b2)
-b1.add_transition(164, b2)
-b1.add_transition(165, b2)
-b1.add_transition(166, b2)
-b1.add_transition(167, b2)
-b1.add_transition(168, b2)
-b1.add_transition(169, b2)
-b1.add_transition(170, b2)
-b1.add_transition(171, b2)
-b1.add_transition(172, b2)
-b1.add_transition(173, b2)
-b1.add_transition(174, b2)
-b1.add_transition(175, b2)
-b1.add_transition(176, b2)
-b1.add_transition(177, b2)
-b1.add_transition(178, b2)
-b1.add_transition(179, b2)
-b1.add_transition(180, b2)
-b1.add_transition(181, b2)
-b1.add_transition(182, b2)
-b1.add_transition(183, b2)
-b1.add_transition(184, b2)
-b1.add_transition(185, b2)
-b1.add_transition(186, b2)
-b1.add_transition(187, b2)
-b1.add_transition(188, b2)
-b1.add_transition(189, b2)
-b1.add_transition(190, b2)
-b1.add_transition(191, b2)
-b1.add_transition(192, b2)
-b1.add_transition(193, b2)
-b1.add_transition(194, b2)
-b1.add_transition(195, b2)
-b1.add_transition(196, b2)
-b1.add_transition(197, b2)
-b1.add_transition(198, b2)
-b1.add_transition(199, b2)
-b1.add_transition(200, b2)
-b1.add_transition(201, b2)
-b1.add_transition(202, b2)
-b1.add_transition(203, b2)
-b1.add_transition(204, b2)
-b1.add_transition(205, b2)
-b1.add_transition(206, b2)
-b1.add_transition(207, b2)
-b1.add_transition(208, b2)
-b1.add_transition(209, b2)
-b1.add_transition(210, b2)
-b1.add_transition(211, b2)
-b1.add_transition(212, b2)
-b1.add_transition(213, b2)
-b1.add_transition(214, b2)
-b1.add_transition(215, b2)
-b1.add_transition(216, b2)
-b1.add_transition(217, b2)
-b1.add_transition(218, b2)
-b1.add_transition(219, b2)
-b1.add_transition(220, b2)
-b1.add_transition(221, b2)
-b1.add_transition(222, b2)
-b1.add_transition(223, b2)
-b1.add_transition(224, b2)
-b1.add_transition(225, b2)
-b1.add_transition(226, b2)
-b1.add_transition(227, b2)
-b1.add_transition(228, b2)
-b1.add_transition(229, b2)
-b1.add_transition(230, b2)
-b1.add_transition(231, b2)
-b1.add_transition(232, b2)
-b1.add_transition(233, b2)
-b1.add_transition(234, b2)
-b1.add_transition(235, b2)
-b1.add_transition(236, b2)
-b1.add_transition(237, b2)
-b1.add_transition(238, b2)
-b1.add_transition(239, b2)
-b1.add_transition(240, b2)
-b1.add_transition(241, b2)
-b1.add_transition(242, b2)
-b1.add_transition(243, b2)
-b1.add_transition(244, b2)
-b1.add_transition(245, b2)
-b1.add_transition(246, b2)
-b1.add_transition(247, b2)
-b1.add_transition(248, b2)
-b1.add_transition(249, b2)
-b1.add_transition(250, b2)
-b1.add_transition(251, b2)
-b1.add_transition(252, b2)
-b1.add_transition(253, b2)
-b1.add_transition(254, b2)
-b1.add_transition(255, b2)
-
-b2.add_transition(0, b2)
-b2.add_transition(1, b2)
-b2.add_transition(2, b2)
-b2.add_transition(3, b2)
-b2.add_transition(4, b2)
-b2.add_transition(5, b2)
-b2.add_transition(6, b2)
-b2.add_transition(7, b2)
-b2.add_transition(8, b2)
-b2.add_transition(11, b2)
-b2.add_transition(12, b2)
-b2.add_transition(13, b2)
-b2.add_transition(14, b2)
-b2.add_transition(15, b2)
-b2.add_transition(16, b2)
-b2.add_transition(17, b2)
-b2.add_transition(18, b2)
-b2.add_transition(19, b2)
-b2.add_transition(20, b2)
-b2.add_transition(21, b2)
-b2.add_transition(22, b2)
-b2.add_transition(23, b2)
-b2.add_transition(24, b2)
-b2.add_transition(25, b2)
-b2.add_transition(26, b2)
-b2.add_transition(27, b2)
-b2.add_transition(28, b2)
-b2.add_transition(29, b2)
-b2.add_transition(30, b2)
-b2.add_transition(31, b2)
-b2.add_transition(32, b2)
-b2.add_transition(33, b2)
-b2.add_transition(34, b3)
-b2.add_transition(35, b2)
-b2.add_transition(36, b2)
-b2.add_transition(37, b2)
-b2.add_transition(38, b2)
-b2.add_transition(39, b5)
-b2.add_transition(40, b2)
-b2.add_transition(41, b9)
-b2.add_transition(42, b2)
-b2.add_transition(43, b2)
-b2.add_transition(44, b2)
-b2.add_transition(45, b2)
-b2.add_transition(46, b2)
-b2.add_transition(47, b2)
-b2.add_transition(48, b2)
-b2.add_transition(49, b2)
-b2.add_transition(50, b2)
-b2.add_transition(51, b2)
-b2.add_transition(52, b2)
-b2.add_transition(53, b2)
-b2.add_transition(54, b2)
-b2.add_transition(55, b2)
-b2.add_transition(56, b2)
-b2.add_transition(57, b2)
-b2.add_transition(58, b2)
-b2.add_transition(59, b2)
-b2.add_transition(60, b2)
-b2.add_transition(61, b2)
-b2.add_transition(62, b2)
-b2.add_transition(63, b2)
-b2.add_transition(64, b2)
-b2.add_transition(65, b2)
-b2.add_transition(66, b2)
-b2.add_transition(67, b2)
-b2.add_transition(68, b2)
-b2.add_transition(69, b2)
-b2.add_transition(70, b2)
-b2.add_transition(71, b2)
-b2.add_transition(72, b2)
-b2.add_transition(73, b2)
-b2.add_transition(74, b2)
-b2.add_transition(75, b2)
-b2.add_transition(76, b2)
-b2.add_transition(77, b2)
-b2.add_transition(78, b2)
-b2.add_transition(79, b2)
-b2.add_transition(80, b2)
-b2.add_transition(81, b2)
-b2.add_transition(82, b2)
-b2.add_transition(83, b2)
-b2.add_transition(84, b2)
-b2.add_transition(85, b2)
-b2.add_transition(86, b2)
-b2.add_transition(87, b2)
-b2.add_transition(88, b2)
-b2.add_transition(89, b2)
-b2.add_transition(90, b2)
-b2.add_transition(91, b2)
-b2.add_transition(92, b2)
-b2.add_transition(93, b2)
-b2.add_transition(94, b2)
-b2.add_transition(95, b2)
-b2.add_transition(96, b2)
-b2.add_transition(97, b2)
-b2.add_transition(98, b2)
-b2.add_transition(99, b2)
-b2.add_transition(100, b2)
-b2.add_transition(101, b2)
-b2.add_transition(102, b2)
-b2.add_transition(103, b2)
-b2.add_transition(104, b2)
-b2.add_transition(105, b2)
-b2.add_transition(106, b2)
-b2.add_transition(107, b2)
-b2.add_transition(108, b2)
-b2.add_transition(109, b2)
-b2.add_transition(110, b2)
-b2.add_transition(111, b2)
-b2.add_transition(112, b2)
-b2.add_transition(113, b2)
-b2.add_transition(114, b2)
-b2.add_transition(115, b2)
-b2.add_transition(116, b2)
-b2.add_transition(117, b2)
-b2.add_transition(118, b2)
-b2.add_transition(119, b2)
-b2.add_transition(120, b2)
-b2.add_transition(121, b2)
-b2.add_transition(122, b2)
-b2.add_transition(123, b2)
-b2.add_transition(124, b2)
-b2.add_transition(125, b2)
-b2.add_transition(126, b2)
-b2.add_transition(127, b2)
-b2.add_transition(128, b2)
-b2.add_transition(129, b2)
-b2.add_transition(130, b2)
-b2.add_transition(131, b2)
-b2.add_transition(132, b2)
-b2.add_transition(133, b2)
-b2.add_transition(134, b2)
-b2.add_transition(135, b2)
-b2.add_transition(136, b2)
-b2.add_transition(137, b2)
-b2.add_transition(138, b2)
-b2.add_transition(139, b2)
-b2.add_transition(140, b2)
-b2.add_transition(141, b2)
-b2.add_transition(142, b2)
-b2.add_transition(143, b2)
-b2.add_transition(144, b2)
-b2.add_transition(145, b2)
-b2.add_transition(146, b2)
-b2.add_transition(147, b2)
-b2.add_transition(148, b2)
-b2.add_transition(149, b2)
-b2.add_transition(150, b2)
-b2.add_transition(151, b2)
-b2.add_transition(152, b2)
-b2.add_transition(153, b2)
-b2.add_transition(154, b2)
-b2.add_transition(155, b2)
-b2.add_transition(156, b2)
-b2.add_transition(157, b2)
-b2.add_transition(158, b2)
-b2.add_transition(159, b2)
-b2.add_transition(160, b2)
-b2.add_transition(161, b2)
-b2.add_transition(162, b2)
-b2.add_transition(163, b2)
-b2.add_transition(164, b2)
-b2.add_transition(165, b2)
-b2.add_transition(166, b2)
-b2.add_transition(167, b2)
-b2.add_transition(168, b2)
-b2.add_transition(169, b2)
-b2.add_transition(170, b2)
-b2.add_transition(171, b2)
-b2.add_transition(172, b2)
-b2.add_transition(173, b2)
-b2.add_transition(174, b2)
-b2.add_transition(175, b2)
-b2.add_transition(176, b2)
-b2.add_transition(177, b2)
-b2.add_transition(178, b2)
-b2.add_transition(179, b2)
-b2.add_transition(180, b2)
-b2.add_transition(181, b2)
-b2.add_transition(182, b2)
-b2.add_transition(183, b2)
-b2.add_transition(184, b2)
-b2.add_transition(185, b2)
-b2.add_transition(186, b2)
-b2.add_transition(187, b2)
-b2.add_transition(188, b2)
-b2.add_transition(189, b2)
-b2.add_transition(190, b2)
-b2.add_transition(191, b2)
-b2.add_transition(192, b2)
-b2.add_transition(193, b2)
-b2.add_transition(194, b2)
-b2.add_transition(195, b2)
-b2.add_transition(196, b2)
-b2.add_transition(197, b2)
-b2.add_transition(198, b2)
-b2.add_transition(199, b2)
-b2.add_transition(200, b2)
-b2.add_transition(201, b2)
-b2.add_transition(202, b2)
-b2.add_transition(203, b2)
-b2.add_transition(204, b2)
-b2.add_transition(205, b2)
-b2.add_transition(206, b2)
-b2.add_transition(207, b2)
-b2.add_transition(208, b2)
-b2.add_transition(209, b2)
-b2.add_transition(210, b2)
-b2.add_transition(211, b2)
-b2.add_transition(212, b2)
-b2.add_transition(213, b2)
-b2.add_transition(214, b2)
-b2.add_transition(215, b2)
-b2.add_transition(216, b2)
-b2.add_transition(217, b2)
-b2.add_transition(218, b2)
-b2.add_transition(219, b2)
-b2.add_transition(220, b2)
-b2.add_transition(221, b2)
-b2.add_transition(222, b2)
-b2.add_transition(223, b2)
-b2.add_transition(224, b2)
-b2.add_transition(225, b2)
-b2.add_transition(226, b2)
-b2.add_transition(227, b2)
-b2.add_transition(228, b2)
-b2.add_transition(229, b2)
-b2.add_transition(230, b2)
-b2.add_transition(231, b2)
-b2.add_transition(232, b2)
-b2.add_transition(233, b2)
-b2.add_transition(234, b2)
-b2.add_transition(235, b2)
-b2.add_transition(236, b2)
-b2.add_transition(237, b2)
-b2.add_transition(238, b2)
-b2.add_transition(239, b2)
-b2.add_transition(240, b2)
-b2.add_transition(241, b2)
-b2.add_transition(242, b2)
-b2.add_transition(243, b2)
-b2.add_transition(244, b2)
-b2.add_transition(245, b2)
-b2.add_transition(246, b2)
-b2.add_transition(247, b2)
-b2.add_transition(248, b2)
-b2.add_transition(249, b2)
-b2.add_transition(250, b2)
-b2.add_transition(251, b2)
-b2.add_transition(252, b2)
-b2.add_transition(253, b2)
-b2.add_transition(254, b2)
-b2.add_transition(255, b2)
-
-b3.add_transition(0, b3)
-b3.add_transition(1, b3)
-b3.add_transition(2, b3)
-b3.add_transition(3, b3)
-b3.add_transition(4, b3)
-b3.add_transition(5, b3)
-b3.add_transition(6, b3)
-b3.add_transition(7, b3)
-b3.add_transition(8, b3)
-b3.add_transition(9, b7)
-b3.add_transition(10, b7)
-b3.add_transition(11, b3)
-b3.add_transition(12, b3)
-b3.add_transition(13, b3)
-b3.add_transition(14, b3)
-b3.add_transition(15, b3)
-b3.add_transition(16, b3)
-b3.add_transition(17, b3)
-b3.add_transition(18, b3)
-b3.add_transition(19, b3)
-b3.add_transition(20, b3)
-b3.add_transition(21, b3)
-b3.add_transition(22, b3)
-b3.add_transition(23, b3)
-b3.add_transition(24, b3)
-b3.add_transition(25, b3)
-b3.add_transition(26, b3)
-b3.add_transition(27, b3)
-b3.add_transition(28, b3)
-b3.add_transition(29, b3)
-b3.add_transition(30, b3)
-b3.add_transition(31, b3)
-b3.add_transition(32, b3)
-b3.add_transition(33, b3)
-b3.add_transition(34, b3)
-b3.add_transition(35, b3)
-b3.add_transition(36, b3)
-b3.add_transition(37, b3)
-b3.add_transition(38, b3)
-b3.add_transition(39, b4)
-b3.add_transition(40, b3)
-b3.add_transition(41, b10)
-b3.add_transition(42, b3)
-b3.add_transition(43, b3)
-b3.add_transition(44, b3)
-b3.add_transition(45, b3)
-b3.add_transition(46, b3)
-b3.add_transition(47, b3)
-b3.add_transition(48, b3)
-b3.add_transition(49, b3)
-b3.add_transition(50, b3)
-b3.add_transition(51, b3)
-b3.add_transition(52, b3)
-b3.add_transition(53, b3)
-b3.add_transition(54, b3)
-b3.add_transition(55, b3)
-b3.add_transition(56, b3)
-b3.add_transition(57, b3)
-b3.add_transition(58, b3)
-b3.add_transition(59, b3)
-b3.add_transition(60, b3)
-b3.add_transition(61, b3)
-b3.add_transition(62, b3)
-b3.add_transition(63, b3)
-b3.add_transition(64, b3)
-b3.add_transition(65, b3)
-b3.add_transition(66, b3)
-b3.add_transition(67, b3)
-b3.add_transition(68, b3)
-b3.add_transition(69, b3)
-b3.add_transition(70, b3)
-b3.add_transition(71, b3)
-b3.add_transition(72, b3)
-b3.add_transition(73, b3)
-b3.add_transition(74, b3)
-b3.add_transition(75, b3)
-b3.add_transition(76, b3)
-b3.add_transition(77, b3)
-b3.add_transition(78, b3)
-b3.add_transition(79, b3)
-b3.add_transition(80, b3)
-b3.add_transition(81, b3)
-b3.add_transition(82, b3)
-b3.add_transition(83, b3)
-b3.add_transition(84, b3)
-b3.add_transition(85, b3)
-b3.add_transition(86, b3)
-b3.add_transition(87, b3)
-b3.add_transition(88, b3)
-b3.add_transition(89, b3)
-b3.add_transition(90, b3)
-b3.add_transition(91, b3)
-b3.add_transition(92, b3)
-b3.add_transition(93, b3)
-b3.add_transition(94, b3)
-b3.add_transition(95, b3)
-b3.add_transition(96, b3)
-b3.add_transition(97, b3)
-b3.add_transition(98, b3)
-b3.add_transition(99, b3)
-b3.add_transition(100, b3)
-b3.add_transition(101, b3)
-b3.add_transition(102, b3)
-b3.add_transition(103, b3)
-b3.add_transition(104, b3)
-b3.add_transition(105, b3)
-b3.add_transition(106, b3)
-b3.add_transition(107, b3)
-b3.add_transition(108, b3)
-b3.add_transition(109, b3)
-b3.add_transition(110, b3)
-b3.add_transition(111, b3)
-b3.add_transition(112, b3)
-b3.add_transition(113, b3)
-b3.add_transition(114, b3)
-b3.add_transition(115, b3)
-b3.add_transition(116, b3)
-b3.add_transition(117, b3)
-b3.add_transition(118, b3)
-b3.add_transition(119, b3)
-b3.add_transition(120, b3)
-b3.add_transition(121, b3)
-b3.add_transition(122, b3)
-b3.add_transition(123, b3)
-b3.add_transition(124, b3)
-b3.add_transition(125, b3)
-b3.add_transition(126, b3)
-b3.add_transition(127, b3)
-b3.add_transition(128, b3)
-b3.add_transition(129, b3)
-b3.add_transition(130, b3)
-b3.add_transition(131, b3)
-b3.add_transition(132, b3)
-b3.add_transition(133, b3)
-b3.add_transition(134, b3)
-b3.add_transition(135, b3)
-b3.add_transition(136, b3)
-b3.add_transition(137, b3)
-b3.add_transition(138, b3)
-b3.add_transition(139, b3)
-b3.add_transition(140, b3)
-b3.add_transition(141, b3)
-b3.add_transition(142, b3)
-b3.add_transition(143, b3)
-b3.add_transition(144, b3)
-b3.add_transition(145, b3)
-b3.add_transition(146, b3)
-b3.add_transition(147, b3)
-b3.add_transition(148, b3)
-b3.add_transition(149, b3)
-b3.add_transition(150, b3)
-b3.add_transition(151, b3)
-b3.add_transition(152, b3)
-b3.add_transition(153, b3)
-b3.add_transition(154, b3)
-b3.add_transition(155, b3)
-b3.add_transition(156, b3)
-b3.add_transition(157, b3)
-b3.add_transition(158, b3)
-b3.add_transition(159, b3)
-b3.add_transition(160, b3)
-b3.add_transition(161, b3)
-b3.add_transition(162, b3)
-b3.add_transition(163, b3)
-b3.add_transition(164, b3)
-b3.add_transition(165, b3)
-b3.add_transition(166, b3)
-b3.add_transition(167, b3)
-b3.add_transition(168, b3)
-b3.add_transition(169, b3)
-b3.add_transition(170, b3)
-b3.add_transition(171, b3)
-b3.add_transition(172, b3)
-b3.add_transition(173, b3)
-b3.add_transition(174, b3)
-b3.add_transition(175, b3)
-b3.add_transition(176, b3)
-b3.add_transition(177, b3)
-b3.add_transition(178, b3)
-b3.add_transition(179, b3)
-b3.add_transition(180, b3)
-b3.add_transition(181, b3)
-b3.add_transition(182, b3)
-b3.add_transition(183, b3)
-b3.add_transition(184, b3)
-b3.add_transition(185, b3)
-b3.add_transition(186, b3)
-b3.add_transition(187, b3)
-b3.add_transition(188, b3)
-b3.add_transition(189, b3)
-b3.add_transition(190, b3)
-b3.add_transition(191, b3)
-b3.add_transition(192, b3)
-b3.add_transition(193, b3)
-b3.add_transition(194, b3)
-b3.add_transition(195, b3)
-b3.add_transition(196, b3)
-b3.add_transition(197, b3)
-b3.add_transition(198, b3)
-b3.add_transition(199, b3)
-b3.add_transition(200, b3)
-b3.add_transition(201, b3)
-b3.add_transition(202, b3)
-b3.add_transition(203, b3)
-b3.add_transition(204, b3)
-b3.add_transition(205, b3)
-b3.add_transition(206, b3)
-b3.add_transition(207, b3)
-b3.add_transition(208, b3)
-b3.add_transition(209, b3)
-b3.add_transition(210, b3)
-b3.add_transition(211, b3)
-b3.add_transition(212, b3)
-b3.add_transition(213, b3)
-b3.add_transition(214, b3)
-b3.add_transition(215, b3)
-b3.add_transition(216, b3)
-b3.add_transition(217, b3)
-b3.add_transition(218, b3)
-b3.add_transition(219, b3)
-b3.add_transition(220, b3)
-b3.add_transition(221, b3)
-b3.add_transition(222, b3)
-b3.add_transition(223, b3)
-b3.add_transition(224, b3)
-b3.add_transition(225, b3)
-b3.add_transition(226, b3)
-b3.add_transition(227, b3)
-b3.add_transition(228, b3)
-b3.add_transition(229, b3)
-b3.add_transition(230, b3)
-b3.add_transition(231, b3)
-b3.add_transition(232, b3)
-b3.add_transition(233, b3)
-b3.add_transition(234, b3)
-b3.add_transition(235, b3)
-b3.add_transition(236, b3)
-b3.add_transition(237, b3)
-b3.add_transition(238, b3)
-b3.add_transition(239, b3)
-b3.add_transition(240, b3)
-b3.add_transition(241, b3)
-b3.add_transition(242, b3)
-b3.add_transition(243, b3)
-b3.add_transition(244, b3)
-b3.add_transition(245, b3)
-b3.add_transition(246, b3)
-b3.add_transition(247, b3)
-b3.add_transition(248, b3)
-b3.add_transition(249, b3)
-b3.add_transition(250, b3)
-b3.add_transition(251, b3)
-b3.add_transition(252, b3)
-b3.add_transition(253, b3)
-b3.add_transition(254, b3)
-b3.add_transition(255, b3)
-
-b7.add_transition(0, b7)
-b7.add_transition(1, b7)
-b7.add_transition(2, b7)
-b7.add_transition(3, b7)
-b7.add_transition(4, b7)
-b7.add_transition(5, b7)
-b7.add_transition(6, b7)
-b7.add_transition(7, b7)
-b7.add_transition(8, b7)
-b7.add_transition(9, b7)
-b7.add_transition(10, b7)
-b7.add_transition(11, b7)
-b7.add_transition(12, b7)
-b7.add_transition(13, b7)
-b7.add_transition(14, b7)
-b7.add_transition(15, b7)
-b7.add_transition(16, b7)
-b7.add_transition(17, b7)
-b7.add_transition(18, b7)
-b7.add_transition(19, b7)
-b7.add_transition(20, b7)
-b7.add_transition(21, b7)
-b7.add_transition(22, b7)
-b7.add_transition(23, b7)
-b7.add_transition(24, b7)
-b7.add_transition(25, b7)
-b7.add_transition(26, b7)
-b7.add_transition(27, b7)
-b7.add_transition(28, b7)
-b7.add_transition(29, b7)
-b7.add_transition(30, b7)
-b7.add_transition(31, b7)
-b7.add_transition(32, b7)
-b7.add_transition(33, b7)
-b7.add_transition(34, b3)
-b7.add_transition(35, b7)
-b7.add_transition(36, b7)
-b7.add_transition(37, b7)
-b7.add_transition(38, b7)
-b7.add_transition(39, b7)
-b7.add_transition(40, b7)
-b7.add_transition(41, b7)
-b7.add_transition(42, b7)
-b7.add_transition(43, b7)
-b7.add_transition(44, b7)
-b7.add_transition(45, b7)
-b7.add_transition(46, b7)
-b7.add_transition(47, b7)
-b7.add_transition(48, b7)
-b7.add_transition(49, b7)
-b7.add_transition(50, b7)
-b7.add_transition(51, b7)
-b7.add_transition(52, b7)
-b7.add_transition(53, b7)
-b7.add_transition(54, b7)
-b7.add_transition(55, b7)
-b7.add_transition(56, b7)
-b7.add_transition(57, b7)
-b7.add_transition(58, b7)
-b7.add_transition(59, b7)
-b7.add_transition(60, b7)
-b7.add_transition(61, b7)
-b7.add_transition(62, b7)
-b7.add_transition(63, b7)
-b7.add_transition(64, b7)
-b7.add_transition(65, b7)
-b7.add_transition(66, b7)
-b7.add_transition(67, b7)
-b7.add_transition(68, b7)
-b7.add_transition(69, b7)
-b7.add_transition(70, b7)
-b7.add_transition(71, b7)
-b7.add_transition(72, b7)
-b7.add_transition(73, b7)
-b7.add_transition(74, b7)
-b7.add_transition(75, b7)
-b7.add_transition(76, b7)
-b7.add_transition(77, b7)
-b7.add_transition(78, b7)
-b7.add_transition(79, b7)
-b7.add_transition(80, b7)
-b7.add_transition(81, b7)
-b7.add_transition(82, b7)
-b7.add_transition(83, b7)
-b7.add_transition(84, b7)
-b7.add_transition(85, b7)
-b7.add_transition(86, b7)
-b7.add_transition(87, b7)
-b7.add_transition(88, b7)
-b7.add_transition(89, b7)
-b7.add_transition(90, b7)
-b7.add_transition(91, b7)
-b7.add_transition(92, b7)
-b7.add_transition(93, b7)
-b7.add_transition(94, b7)
-b7.add_transition(95, b7)
-b7.add_transition(96, b7)
-b7.add_transition(97, b7)
-b7.add_transition(98, b7)
-b7.add_transition(99, b7)
-b7.add_transition(100, b7)
-b7.add_transition(101, b7)
-b7.add_transition(102, b7)
-b7.add_transition(103, b7)
-b7.add_transition(104, b7)
-b7.add_transition(105, b7)
-b7.add_transition(106, b7)
-b7.add_transition(107, b7)
-b7.add_transition(108, b7)
-b7.add_transition(109, b7)
-b7.add_transition(110, b7)
-b7.add_transition(111, b7)
-b7.add_transition(112, b7)
-b7.add_transition(113, b7)
-b7.add_transition(114, b7)
-b7.add_transition(115, b7)
-b7.add_transition(116, b7)
-b7.add_transition(117, b7)
-b7.add_transition(118, b7)
-b7.add_transition(119, b7)
-b7.add_transition(120, b7)
-b7.add_transition(121, b7)
-b7.add_transition(122, b7)
-b7.add_transition(123, b7)
-b7.add_transition(124, b7)
-b7.add_transition(125, b7)
-b7.add_transition(126, b7)
-b7.add_transition(127, b7)
-b7.add_transition(128, b7)
-b7.add_transition(129, b7)
-b7.add_transition(130, b7)
-b7.add_transition(131, b7)
-b7.add_transition(132, b7)
-b7.add_transition(133, b7)
-b7.add_transition(134, b7)
-b7.add_transition(135, b7)
-b7.add_transition(136, b7)
-b7.add_transition(137, b7)
-b7.add_transition(138, b7)
-b7.add_transition(139, b7)
-b7.add_transition(140, b7)
-b7.add_transition(141, b7)
-b7.add_transition(142, b7)
-b7.add_transition(143, b7)
-b7.add_transition(144, b7)
-b7.add_transition(145, b7)
-b7.add_transition(146, b7)
-b7.add_transition(147, b7)
-b7.add_transition(148, b7)
-b7.add_transition(149, b7)
-b7.add_transition(150, b7)
-b7.add_transition(151, b7)
-b7.add_transition(152, b7)
-b7.add_transition(153, b7)
-b7.add_transition(154, b7)
-b7.add_transition(155, b7)
-b7.add_transition(156, b7)
-b7.add_transition(157, b7)
-b7.add_transition(158, b7)
-b7.add_transition(159, b7)
-b7.add_transition(160, b7)
-b7.add_transition(161, b7)
-b7.add_transition(162, b7)
-b7.add_transition(163, b7)
-b7.add_transition(164, b7)
-b7.add_transition(165, b7)
-b7.add_transition(166, b7)
-b7.add_transition(167, b7)
-b7.add_transition(168, b7)
-b7.add_transition(169, b7)
-b7.add_transition(170, b7)
-b7.add_transition(171, b7)
-b7.add_transition(172, b7)
-b7.add_transition(173, b7)
-b7.add_transition(174, b7)
-b7.add_transition(175, b7)
-b7.add_transition(176, b7)
-b7.add_transition(177, b7)
-b7.add_transition(178, b7)
-b7.add_transition(179, b7)
-b7.add_transition(180, b7)
-b7.add_transition(181, b7)
-b7.add_transition(182, b7)
-b7.add_transition(183, b7)
-b7.add_transition(184, b7)
-b7.add_transition(185, b7)
-b7.add_transition(186, b7)
-b7.add_transition(187, b7)
-b7.add_transition(188, b7)
-b7.add_transition(189, b7)
-b7.add_transition(190, b7)
-b7.add_transition(191, b7)
-b7.add_transition(192, b7)
-b7.add_transition(193, b7)
-b7.add_transition(194, b7)
-b7.add_transition(195, b7)
-b7.add_transition(196, b7)
-b7.add_transition(197, b7)
-b7.add_transition(198, b7)
-b7.add_transition(199, b7)
-b7.add_transition(200, b7)
-b7.add_transition(201, b7)
-b7.add_transition(202, b7)
-b7.add_transition(203, b7)
-b7.add_transition(204, b7)
-b7.add_transition(205, b7)
-b7.add_transition(206, b7)
-b7.add_transition(207, b7)
-b7.add_transition(208, b7)
-b7.add_transition(209, b7)
-b7.add_transition(210, b7)
-b7.add_transition(211, b7)
-b7.add_transition(212, b7)
-b7.add_transition(213, b7)
-b7.add_transition(214, b7)
-b7.add_transition(215, b7)
-b7.add_transition(216, b7)
-b7.add_transition(217, b7)
-b7.add_transition(218, b7)
-b7.add_transition(219, b7)
-b7.add_transition(220, b7)
-b7.add_transition(221, b7)
-b7.add_transition(222, b7)
-b7.add_transition(223, b7)
-b7.add_transition(224, b7)
-b7.add_transition(225, b7)
-b7.add_transition(226, b7)
-b7.add_transition(227, b7)
-b7.add_transition(228, b7)
-b7.add_transition(229, b7)
-b7.add_transition(230, b7)
-b7.add_transition(231, b7)
-b7.add_transition(232, b7)
-b7.add_transition(233, b7)
-b7.add_transition(234, b7)
-b7.add_transition(235, b7)
-b7.add_transition(236, b7)
-b7.add_transition(237, b7)
-b7.add_transition(238, b7)
-b7.add_transition(239, b7)
-b7.add_transition(240, b7)
-b7.add_transition(241, b7)
-b7.add_transition(242, b7)
-b7.add_transition(243, b7)
-b7.add_transition(244, b7)
-b7.add_transition(245, b7)
-b7.add_transition(246, b7)
-b7.add_transition(247, b7)
-b7.add_transition(248, b7)
-b7.add_transition(249, b7)
-b7.add_transition(250, b7)
-b7.add_transition(251, b7)
-b7.add_transition(252, b7)
-b7.add_transition(253, b7)
-b7.add_transition(254, b7)
-b7.add_transition(255, b7)
-
-b4.add_transition(0, b3)
-b4.add_transition(1, b3)
-b4.add_transition(2, b3)
-b4.add_transition(3, b3)
-b4.add_transition(4, b3)
-b4.add_transition(5, b3)
-b4.add_transition(6, b3)
-b4.add_transition(7, b3)
-b4.add_transition(8, b3)
-b4.add_transition(9, b6)
-b4.add_transition(10, b6)
-b4.add_transition(11, b3)
-b4.add_transition(12, b3)
-b4.add_transition(13, b3)
-b4.add_transition(14, b3)
-b4.add_transition(15, b3)
-b4.add_transition(16, b3)
-b4.add_transition(17, b3)
-b4.add_transition(18, b3)
-b4.add_transition(19, b3)
-b4.add_transition(20, b3)
-b4.add_transition(21, b3)
-b4.add_transition(22, b3)
-b4.add_transition(23, b3)
-b4.add_transition(24, b3)
-b4.add_transition(25, b3)
-b4.add_transition(26, b3)
-b4.add_transition(27, b3)
-b4.add_transition(28, b3)
-b4.add_transition(29, b3)
-b4.add_transition(30, b3)
-b4.add_transition(31, b3)
-b4.add_transition(32, b3)
-b4.add_transition(33, b3)
-b4.add_transition(34, b3)
-b4.add_transition(35, b3)
-b4.add_transition(36, b3)
-b4.add_transition(37, b3)
-b4.add_transition(38, b3)
-b4.add_transition(39, b4)
-b4.add_transition(40, b3)
-b4.add_transition(41, b10)
-b4.add_transition(42, b3)
-b4.add_transition(43, b3)
-b4.add_transition(44, b3)
-b4.add_transition(45, b3)
-b4.add_transition(46, b3)
-b4.add_transition(47, b3)
-b4.add_transition(48, b3)
-b4.add_transition(49, b3)
-b4.add_transition(50, b3)
-b4.add_transition(51, b3)
-b4.add_transition(52, b3)
-b4.add_transition(53, b3)
-b4.add_transition(54, b3)
-b4.add_transition(55, b3)
-b4.add_transition(56, b3)
-b4.add_transition(57, b3)
-b4.add_transition(58, b3)
-b4.add_transition(59, b3)
-b4.add_transition(60, b3)
-b4.add_transition(61, b3)
-b4.add_transition(62, b3)
-b4.add_transition(63, b3)
-b4.add_transition(64, b3)
-b4.add_transition(65, b3)
-b4.add_transition(66, b3)
-b4.add_transition(67, b3)
-b4.add_transition(68, b3)
-b4.add_transition(69, b3)
-b4.add_transition(70, b3)
-b4.add_transition(71, b3)
-b4.add_transition(72, b3)
-b4.add_transition(73, b3)
-b4.add_transition(74, b3)
-b4.add_transition(75, b3)
-b4.add_transition(76, b3)
-b4.add_transition(77, b3)
-b4.add_transition(78, b3)
-b4.add_transition(79, b3)
-b4.add_transition(80, b3)
-b4.add_transition(81, b3)
-b4.add_transition(82, b3)
-b4.add_transition(83, b3)
-b4.add_transition(84, b3)
-b4.add_transition(85, b3)
-b4.add_transition(86, b3)
-b4.add_transition(87, b3)
-b4.add_transition(88, b3)
-b4.add_transition(89, b3)
-b4.add_transition(90, b3)
-b4.add_transition(91, b3)
-b4.add_transition(92, b3)
-b4.add_transition(93, b3)
-b4.add_transition(94, b3)
-b4.add_transition(95, b3)
-b4.add_transition(96, b3)
-b4.add_transition(97, b3)
-b4.add_transition(98, b3)
-b4.add_transition(99, b3)
-b4.add_transition(100, b3)
-b4.add_transition(101, b3)
-b4.add_transition(102, b3)
-b4.add_transition(103, b3)
-b4.add_transition(104, b3)
-b4.add_transition(105, b3)
-b4.add_transition(106, b3)
-b4.add_transition(107, b3)
-b4.add_transition(108, b3)
-b4.add_transition(109, b3)
-b4.add_transition(110, b3)
-b4.add_transition(111, b3)
-b4.add_transition(112, b3)
-b4.add_transition(113, b3)
-b4.add_transition(114, b3)
-b4.add_transition(115, b3)
-b4.add_transition(116, b3)
-b4.add_transition(117, b3)
-b4.add_transition(118, b3)
-b4.add_transition(119, b3)
-b4.add_transition(120, b3)
-b4.add_transition(121, b3)
-b4.add_transition(122, b3)
-b4.add_transition(123, b3)
-b4.add_transition(124, b3)
-b4.add_transition(125, b3)
-b4.add_transition(126, b3)
-b4.add_transition(127, b3)
-b4.add_transition(128, b3)
-b4.add_transition(129, b3)
-b4.add_transition(130, b3)
-b4.add_transition(131, b3)
-b4.add_transition(132, b3)
-b4.add_transition(133, b3)
-b4.add_transition(134, b3)
-b4.add_transition(135, b3)
-b4.add_transition(136, b3)
-b4.add_transition(137, b3)
-b4.add_transition(138, b3)
-b4.add_transition(139, b3)
-b4.add_transition(140, b3)
-b4.add_transition(141, b3)
-b4.add_transition(142, b3)
-b4.add_transition(143, b3)
-b4.add_transition(144, b3)
-b4.add_transition(145, b3)
-b4.add_transition(146, b3)
-b4.add_transition(147, b3)
-b4.add_transition(148, b3)
-b4.add_transition(149, b3)
-b4.add_transition(150, b3)
-b4.add_transition(151, b3)
-b4.add_transition(152, b3)
-b4.add_transition(153, b3)
-b4.add_transition(154, b3)
-b4.add_transition(155, b3)
-b4.add_transition(156, b3)
-b4.add_transition(157, b3)
-b4.add_transition(158, b3)
-b4.add_transition(159, b3)
-b4.add_transition(160, b3)
-b4.add_transition(161, b3)
-b4.add_transition(162, b3)
-b4.add_transition(163, b3)
-b4.add_transition(164, b3)
-b4.add_transition(165, b3)
-b4.add_transition(166, b3)
-b4.add_transition(167, b3)
-b4.add_transition(168, b3)
-b4.add_transition(169, b3)
-b4.add_transition(170, b3)
-b4.add_transition(171, b3)
-b4.add_transition(172, b3)
-b4.add_transition(173, b3)
-b4.add_transition(174, b3)
-b4.add_transition(175, b3)
-b4.add_transition(176, b3)
-b4.add_transition(177, b3)
-b4.add_transition(178, b3)
-b4.add_transition(179, b3)
-b4.add_transition(180, b3)
-b4.add_transition(181, b3)
-b4.add_transition(182, b3)
-b4.add_transition(183, b3)
-b4.add_transition(184, b3)
-b4.add_transition(185, b3)
-b4.add_transition(186, b3)
-b4.add_transition(187, b3)
-b4.add_transition(188, b3)
-b4.add_transition(189, b3)
-b4.add_transition(190, b3)
-b4.add_transition(191, b3)
-b4.add_transition(192, b3)
-b4.add_transition(193, b3)
-b4.add_transition(194, b3)
-b4.add_transition(195, b3)
-b4.add_transition(196, b3)
-b4.add_transition(197, b3)
-b4.add_transition(198, b3)
-b4.add_transition(199, b3)
-b4.add_transition(200, b3)
-b4.add_transition(201, b3)
-b4.add_transition(202, b3)
-b4.add_transition(203, b3)
-b4.add_transition(204, b3)
-b4.add_transition(205, b3)
-b4.add_transition(206, b3)
-b4.add_transition(207, b3)
-b4.add_transition(208, b3)
-b4.add_transition(209, b3)
-b4.add_transition(210, b3)
-b4.add_transition(211, b3)
-b4.add_transition(212, b3)
-b4.add_transition(213, b3)
-b4.add_transition(214, b3)
-b4.add_transition(215, b3)
-b4.add_transition(216, b3)
-b4.add_transition(217, b3)
-b4.add_transition(218, b3)
-b4.add_transition(219, b3)
-b4.add_transition(220, b3)
-b4.add_transition(221, b3)
-b4.add_transition(222, b3)
-b4.add_transition(223, b3)
-b4.add_transition(224, b3)
-b4.add_transition(225, b3)
-b4.add_transition(226, b3)
-b4.add_transition(227, b3)
-b4.add_transition(228, b3)
-b4.add_transition(229, b3)
-b4.add_transition(230, b3)
-b4.add_transition(231, b3)
-b4.add_transition(232, b3)
-b4.add_transition(233, b3)
-b4.add_transition(234, b3)
-b4.add_transition(235, b3)
-b4.add_transition(236, b3)
-b4.add_transition(237, b3)
-b4.add_transition(238, b3)
-b4.add_transition(239, b3)
-b4.add_transition(240, b3)
-b4.add_transition(241, b3)
-b4.add_transition(242, b3)
-b4.add_transition(243, b3)
-b4.add_transition(244, b3)
-b4.add_transition(245, b3)
-b4.add_transition(246, b3)
-b4.add_transition(247, b3)
-b4.add_transition(248, b3)
-b4.add_transition(249, b3)
-b4.add_transition(250, b3)
-b4.add_transition(251, b3)
-b4.add_transition(252, b3)
-b4.add_transition(253, b3)
-b4.add_transition(254, b3)
-b4.add_transition(255, b3)
-
-b6.add_transition(0, b7)
-b6.add_transition(1, b7)
-b6.add_transition(2, b7)
-b6.add_transition(3, b7)
-b6.add_transition(4, b7)
-b6.add_transition(5, b7)
-b6.add_transition(6, b7)
-b6.add_transition(7, b7)
-b6.add_transition(8, b7)
-b6.add_transition(9, b7)
-b6.add_transition(10, b7)
-b6.add_transition(11, b7)
-b6.add_transition(12, b7)
-b6.add_transition(13, b7)
-b6.add_transition(14, b7)
-b6.add_transition(15, b7)
-b6.add_transition(16, b7)
-b6.add_transition(17, b7)
-b6.add_transition(18, b7)
-b6.add_transition(19, b7)
-b6.add_transition(20, b7)
-b6.add_transition(21, b7)
-b6.add_transition(22, b7)
-b6.add_transition(23, b7)
-b6.add_transition(24, b7)
-b6.add_transition(25, b7)
-b6.add_transition(26, b7)
-b6.add_transition(27, b7)
-b6.add_transition(28, b7)
-b6.add_transition(29, b7)
-b6.add_transition(30, b7)
-b6.add_transition(31, b7)
-b6.add_transition(32, b7)
-b6.add_transition(33, b7)
-b6.add_transition(34, b3)
-b6.add_transition(35, b7)
-b6.add_transition(36, b7)
-b6.add_transition(37, b7)
-b6.add_transition(38, b7)
-b6.add_transition(39, b3)
-b6.add_transition(40, b7)
-b6.add_transition(41, b7)
-b6.add_transition(42, b7)
-b6.add_transition(43, b7)
-b6.add_transition(44, b7)
-b6.add_transition(45, b7)
-b6.add_transition(46, b7)
-b6.add_transition(47, b7)
-b6.add_transition(48, b7)
-b6.add_transition(49, b7)
-b6.add_transition(50, b7)
-b6.add_transition(51, b7)
-b6.add_transition(52, b7)
-b6.add_transition(53, b7)
-b6.add_transition(54, b7)
-b6.add_transition(55, b7)
-b6.add_transition(56, b7)
-b6.add_transition(57, b7)
-b6.add_transition(58, b7)
-b6.add_transition(59, b7)
-b6.add_transition(60, b7)
-b6.add_transition(61, b7)
-b6.add_transition(62, b7)
-b6.add_transition(63, b7)
-b6.add_transition(64, b7)
-b6.add_transition(65, b7)
-b6.add_transition(66, b7)
-b6.add_transition(67, b7)
-b6.add_transition(68, b7)
-b6.add_transition(69, b7)
-b6.add_transition(70, b7)
-b6.add_transition(71, b7)
-b6.add_transition(72, b7)
-b6.add_transition(73, b7)
-b6.add_transition(74, b7)
-b6.add_transition(75, b7)
-b6.add_transition(76, b7)
-b6.add_transition(77, b7)
-b6.add_transition(78, b7)
-b6.add_transition(79, b7)
-b6.add_transition(80, b7)
-b6.add_transition(81, b7)
-b6.add_transition(82, b7)
-b6.add_transition(83, b7)
-b6.add_transition(84, b7)
-b6.add_transition(85, b7)
-b6.add_transition(86, b7)
-b6.add_transition(87, b7)
-b6.add_transition(88, b7)
-b6.add_transition(89, b7)
-b6.add_transition(90, b7)
-b6.add_transition(91, b7)
-b6.add_transition(92, b7)
-b6.add_transition(93, b7)
-b6.add_transition(94, b7)
-b6.add_transition(95, b7)
-b6.add_transition(96, b7)
-b6.add_transition(97, b7)
-b6.add_transition(98, b7)
-b6.add_transition(99, b7)
-b6.add_transition(100, b7)
-b6.add_transition(101, b7)
-b6.add_transition(102, b7)
-b6.add_transition(103, b7)
-b6.add_transition(104, b7)
-b6.add_transition(105, b7)
-b6.add_transition(106, b7)
-b6.add_transition(107, b7)
-b6.add_transition(108, b7)
-b6.add_transition(109, b7)
-b6.add_transition(110, b7)
-b6.add_transition(111, b7)
-b6.add_transition(112, b7)
-b6.add_transition(113, b7)
-b6.add_transition(114, b7)
-b6.add_transition(115, b7)
-b6.add_transition(116, b7)
-b6.add_transition(117, b7)
-b6.add_transition(118, b7)
-b6.add_transition(119, b7)
-b6.add_transition(120, b7)
-b6.add_transition(121, b7)
-b6.add_transition(122, b7)
-b6.add_transition(123, b7)
-b6.add_transition(124, b7)
-b6.add_transition(125, b7)
-b6.add_transition(126, b7)
-b6.add_transition(127, b7)
-b6.add_transition(128, b7)
-b6.add_transition(129, b7)
-b6.add_transition(130, b7)
-b6.add_transition(131, b7)
-b6.add_transition(132, b7)
-b6.add_transition(133, b7)
-b6.add_transition(134, b7)
-b6.add_transition(135, b7)
-b6.add_transition(136, b7)
-b6.add_transition(137, b7)
-b6.add_transition(138, b7)
-b6.add_transition(139, b7)
-b6.add_transition(140, b7)
-b6.add_transition(141, b7)
-b6.add_transition(142, b7)
-b6.add_transition(143, b7)
-b6.add_transition(144, b7)
-b6.add_transition(145, b7)
-b6.add_transition(146, b7)
-b6.add_transition(147, b7)
-b6.add_transition(148, b7)
-b6.add_transition(149, b7)
-b6.add_transition(150, b7)
-b6.add_transition(151, b7)
-b6.add_transition(152, b7)
-b6.add_transition(153, b7)
-b6.add_transition(154, b7)
-b6.add_transition(155, b7)
-b6.add_transition(156, b7)
-b6.add_transition(157, b7)
-b6.add_transition(158, b7)
-b6.add_transition(159, b7)
-b6.add_transition(160, b7)
-b6.add_transition(161, b7)
-b6.add_transition(162, b7)
-b6.add_transition(163, b7)
-b6.add_transition(164, b7)
-b6.add_transition(165, b7)
-b6.add_transition(166, b7)
-b6.add_transition(167, b7)
-b6.add_transition(168, b7)
-b6.add_transition(169, b7)
-b6.add_transition(170, b7)
-b6.add_transition(171, b7)
-b6.add_transition(172, b7)
-b6.add_transition(173, b7)
-b6.add_transition(174, b7)
-b6.add_transition(175, b7)
-b6.add_transition(176, b7)
-b6.add_transition(177, b7)
-b6.add_transition(178, b7)
-b6.add_transition(179, b7)
-b6.add_transition(180, b7)
-b6.add_transition(181, b7)
-b6.add_transition(182, b7)
-b6.add_transition(183, b7)
-b6.add_transition(184, b7)
-b6.add_transition(185, b7)
-b6.add_transition(186, b7)
-b6.add_transition(187, b7)
-b6.add_transition(188, b7)
-b6.add_transition(189, b7)
-b6.add_transition(190, b7)
-b6.add_transition(191, b7)
-b6.add_transition(192, b7)
-b6.add_transition(193, b7)
-b6.add_transition(194, b7)
-b6.add_transition(195, b7)
-b6.add_transition(196, b7)
-b6.add_transition(197, b7)
-b6.add_transition(198, b7)
-b6.add_transition(199, b7)
-b6.add_transition(200, b7)
-b6.add_transition(201, b7)
-b6.add_transition(202, b7)
-b6.add_transition(203, b7)
-b6.add_transition(204, b7)
-b6.add_transition(205, b7)
-b6.add_transition(206, b7)
-b6.add_transition(207, b7)
-b6.add_transition(208, b7)
-b6.add_transition(209, b7)
-b6.add_transition(210, b7)
-b6.add_transition(211, b7)
-b6.add_transition(212, b7)
-b6.add_transition(213, b7)
-b6.add_transition(214, b7)
-b6.add_transition(215, b7)
-b6.add_transition(216, b7)
-b6.add_transition(217, b7)
-b6.add_transition(218, b7)
-b6.add_transition(219, b7)
-b6.add_transition(220, b7)
-b6.add_transition(221, b7)
-b6.add_transition(222, b7)
-b6.add_transition(223, b7)
-b6.add_transition(224, b7)
-b6.add_transition(225, b7)
-b6.add_transition(226, b7)
-b6.add_transition(227, b7)
-b6.add_transition(228, b7)
-b6.add_transition(229, b7)
-b6.add_transition(230, b7)
-b6.add_transition(231, b7)
-b6.add_transition(232, b7)
-b6.add_transition(233, b7)
-b6.add_transition(234, b7)
-b6.add_transition(235, b7)
-b6.add_transition(236, b7)
-b6.add_transition(237, b7)
-b6.add_transition(238, b7)
-b6.add_transition(239, b7)
-b6.add_transition(240, b7)
-b6.add_transition(241, b7)
-b6.add_transition(242, b7)
-b6.add_transition(243, b7)
-b6.add_transition(244, b7)
-b6.add_transition(245, b7)
-b6.add_transition(246, b7)
-b6.add_transition(247, b7)
-b6.add_transition(248, b7)
-b6.add_transition(249, b7)
-b6.add_transition(250, b7)
-b6.add_transition(251, b7)
-b6.add_transition(252, b7)
-b6.add_transition(253, b7)
-b6.add_transition(254, b7)
-b6.add_transition(255, b7)
-
-b10.isFinalState = True
-b10.addToken( 'IN_GROUP')
-b10.add_transition(0, b3)
-b10.add_transition(1, b3)
-b10.add_transition(2, b3)
-b10.add_transition(3, b3)
-b10.add_transition(4, b3)
-b10.add_transition(5, b3)
-b10.add_transition(6, b3)
-b10.add_transition(7, b3)
-b10.add_transition(8, b3)
-b10.add_transition(9, b7)
-b10.add_transition(10, b7)
-b10.add_transition(11, b3)
-b10.add_transition(12, b3)
-b10.add_transition(13, b3)
-b10.add_transition(14, b3)
-b10.add_transition(15, b3)
-b10.add_transition(16, b3)
-b10.add_transition(17, b3)
-b10.add_transition(18, b3)
-b10.add_transition(19, b3)
-b10.add_transition(20, b3)
-b10.add_transition(21, b3)
-b10.add_transition(22, b3)
-b10.add_transition(23, b3)
-b10.add_transition(24, b3)
-b10.add_transition(25, b3)
-b10.add_transition(26, b3)
-b10.add_transition(27, b3)
-b10.add_transition(28, b3)
-b10.add_transition(29, b3)
-b10.add_transition(30, b3)
-b10.add_transition(31, b3)
-b10.add_transition(32, b3)
-b10.add_transition(33, b3)
-b10.add_transition(34, b3)
-b10.add_transition(35, b3)
-b10.add_transition(36, b3)
-b10.add_transition(37, b3)
-b10.add_transition(38, b3)
-b10.add_transition(39, b4)
-b10.add_transition(40, b3)
-b10.add_transition(41, b10)
-b10.add_transition(42, b3)
-b10.add_transition(43, b3)
-b10.add_transition(44, b3)
-b10.add_transition(45, b3)
-b10.add_transition(46, b3)
-b10.add_transition(47, b3)
-b10.add_transition(48, b3)
-b10.add_transition(49, b3)
-b10.add_transition(50, b3)
-b10.add_transition(51, b3)
-b10.add_transition(52, b3)
-b10.add_transition(53, b3)
-b10.add_transition(54, b3)
-b10.add_transition(55, b3)
-b10.add_transition(56, b3)
-b10.add_transition(57, b3)
-b10.add_transition(58, b3)
-b10.add_transition(59, b3)
-b10.add_transition(60, b3)
-b10.add_transition(61, b3)
-b10.add_transition(62, b3)
-b10.add_transition(63, b3)
-b10.add_transition(64, b3)
-b10.add_transition(65, b3)
-b10.add_transition(66, b3)
-b10.add_transition(67, b3)
-b10.add_transition(68, b3)
-b10.add_transition(69, b3)
-b10.add_transition(70, b3)
-b10.add_transition(71, b3)
-b10.add_transition(72, b3)
-b10.add_transition(73, b3)
-b10.add_transition(74, b3)
-b10.add_transition(75, b3)
-b10.add_transition(76, b3)
-b10.add_transition(77, b3)
-b10.add_transition(78, b3)
-b10.add_transition(79, b3)
-b10.add_transition(80, b3)
-b10.add_transition(81, b3)
-b10.add_transition(82, b3)
-b10.add_transition(83, b3)
-b10.add_transition(84, b3)
-b10.add_transition(85, b3)
-b10.add_transition(86, b3)
-b10.add_transition(87, b3)
-b10.add_transition(88, b3)
-b10.add_transition(89, b3)
-b10.add_transition(90, b3)
-b10.add_transition(91, b3)
-b10.add_transition(92, b3)
-b10.add_transition(93, b3)
-b10.add_transition(94, b3)
-b10.add_transition(95, b3)
-b10.add_transition(96, b3)
-b10.add_transition(97, b3)
-b10.add_transition(98, b3)
-b10.add_transition(99, b3)
-b10.add_transition(100, b3)
-b10.add_transition(101, b3)
-b10.add_transition(102, b3)
-b10.add_transition(103, b3)
-b10.add_transition(104, b3)
-b10.add_transition(105, b3)
-b10.add_transition(106, b3)
-b10.add_transition(107, b3)
-b10.add_transition(108, b3)
-b10.add_transition(109, b3)
-b10.add_transition(110, b3)
-b10.add_transition(111, b3)
-b10.add_transition(112, b3)
-b10.add_transition(113, b3)
-b10.add_transition(114, b3)
-b10.add_transition(115, b3)
-b10.add_transition(116, b3)
-b10.add_transition(117, b3)
-b10.add_transition(118, b3)
-b10.add_transition(119, b3)
-b10.add_transition(120, b3)
-b10.add_transition(121, b3)
-b10.add_transition(122, b3)
-b10.add_transition(123, b3)
-b10.add_transition(124, b3)
-b10.add_transition(125, b3)
-b10.add_transition(126, b3)
-b10.add_transition(127, b3)
-b10.add_transition(128, b3)
-b10.add_transition(129, b3)
-b10.add_transition(130, b3)
-b10.add_transition(131, b3)
-b10.add_transition(132, b3)
-b10.add_transition(133, b3)
-b10.add_transition(134, b3)
-b10.add_transition(135, b3)
-b10.add_transition(136, b3)
-b10.add_transition(137, b3)
-b10.add_transition(138, b3)
-b10.add_transition(139, b3)
-b10.add_transition(140, b3)
-b10.add_transition(141, b3)
-b10.add_transition(142, b3)
-b10.add_transition(143, b3)
-b10.add_transition(144, b3)
-b10.add_transition(145, b3)
-b10.add_transition(146, b3)
-b10.add_transition(147, b3)
-b10.add_transition(148, b3)
-b10.add_transition(149, b3)
-b10.add_transition(150, b3)
-b10.add_transition(151, b3)
-b10.add_transition(152, b3)
-b10.add_transition(153, b3)
-b10.add_transition(154, b3)
-b10.add_transition(155, b3)
-b10.add_transition(156, b3)
-b10.add_transition(157, b3)
-b10.add_transition(158, b3)
-b10.add_transition(159, b3)
-b10.add_transition(160, b3)
-b10.add_transition(161, b3)
-b10.add_transition(162, b3)
-b10.add_transition(163, b3)
-b10.add_transition(164, b3)
-b10.add_transition(165, b3)
-b10.add_transition(166, b3)
-b10.add_transition(167, b3)
-b10.add_transition(168, b3)
-b10.add_transition(169, b3)
-b10.add_transition(170, b3)
-b10.add_transition(171, b3)
-b10.add_transition(172, b3)
-b10.add_transition(173, b3)
-b10.add_transition(174, b3)
-b10.add_transition(175, b3)
-b10.add_transition(176, b3)
-b10.add_transition(177, b3)
-b10.add_transition(178, b3)
-b10.add_transition(179, b3)
-b10.add_transition(180, b3)
-b10.add_transition(181, b3)
-b10.add_transition(182, b3)
-b10.add_transition(183, b3)
-b10.add_transition(184, b3)
-b10.add_transition(185, b3)
-b10.add_transition(186, b3)
-b10.add_transition(187, b3)
-b10.add_transition(188, b3)
-b10.add_transition(189, b3)
-b10.add_transition(190, b3)
-b10.add_transition(191, b3)
-b10.add_transition(192, b3)
-b10.add_transition(193, b3)
-b10.add_transition(194, b3)
-b10.add_transition(195, b3)
-b10.add_transition(196, b3)
-b10.add_transition(197, b3)
-b10.add_transition(198, b3)
-b10.add_transition(199, b3)
-b10.add_transition(200, b3)
-b10.add_transition(201, b3)
-b10.add_transition(202, b3)
-b10.add_transition(203, b3)
-b10.add_transition(204, b3)
-b10.add_transition(205, b3)
-b10.add_transition(206, b3)
-b10.add_transition(207, b3)
-b10.add_transition(208, b3)
-b10.add_transition(209, b3)
-b10.add_transition(210, b3)
-b10.add_transition(211, b3)
-b10.add_transition(212, b3)
-b10.add_transition(213, b3)
-b10.add_transition(214, b3)
-b10.add_transition(215, b3)
-b10.add_transition(216, b3)
-b10.add_transition(217, b3)
-b10.add_transition(218, b3)
-b10.add_transition(219, b3)
-b10.add_transition(220, b3)
-b10.add_transition(221, b3)
-b10.add_transition(222, b3)
-b10.add_transition(223, b3)
-b10.add_transition(224, b3)
-b10.add_transition(225, b3)
-b10.add_transition(226, b3)
-b10.add_transition(227, b3)
-b10.add_transition(228, b3)
-b10.add_transition(229, b3)
-b10.add_transition(230, b3)
-b10.add_transition(231, b3)
-b10.add_transition(232, b3)
-b10.add_transition(233, b3)
-b10.add_transition(234, b3)
-b10.add_transition(235, b3)
-b10.add_transition(236, b3)
-b10.add_transition(237, b3)
-b10.add_transition(238, b3)
-b10.add_transition(239, b3)
-b10.add_transition(240, b3)
-b10.add_transition(241, b3)
-b10.add_transition(242, b3)
-b10.add_transition(243, b3)
-b10.add_transition(244, b3)
-b10.add_transition(245, b3)
-b10.add_transition(246, b3)
-b10.add_transition(247, b3)
-b10.add_transition(248, b3)
-b10.add_transition(249, b3)
-b10.add_transition(250, b3)
-b10.add_transition(251, b3)
-b10.add_transition(252, b3)
-b10.add_transition(253, b3)
-b10.add_transition(254, b3)
-b10.add_transition(255, b3)
-
-b5.add_transition(0, b2)
-b5.add_transition(1, b2)
-b5.add_transition(2, b2)
-b5.add_transition(3, b2)
-b5.add_transition(4, b2)
-b5.add_transition(5, b2)
-b5.add_transition(6, b2)
-b5.add_transition(7, b2)
-b5.add_transition(8, b2)
-b5.add_transition(9, b8)
-b5.add_transition(10, b8)
-b5.add_transition(11, b2)
-b5.add_transition(12, b2)
-b5.add_transition(13, b2)
-b5.add_transition(14, b2)
-b5.add_transition(15, b2)
-b5.add_transition(16, b2)
-b5.add_transition(17, b2)
-b5.add_transition(18, b2)
-b5.add_transition(19, b2)
-b5.add_transition(20, b2)
-b5.add_transition(21, b2)
-b5.add_transition(22, b2)
-b5.add_transition(23, b2)
-b5.add_transition(24, b2)
-b5.add_transition(25, b2)
-b5.add_transition(26, b2)
-b5.add_transition(27, b2)
-b5.add_transition(28, b2)
-b5.add_transition(29, b2)
-b5.add_transition(30, b2)
-b5.add_transition(31, b2)
-b5.add_transition(32, b2)
-b5.add_transition(33, b2)
-b5.add_transition(34, b3)
-b5.add_transition(35, b2)
-b5.add_transition(36, b2)
-b5.add_transition(37, b2)
-b5.add_transition(38, b2)
-b5.add_transition(39, b5)
-b5.add_transition(40, b2)
-b5.add_transition(41, b9)
-b5.add_transition(42, b2)
-b5.add_transition(43, b2)
-b5.add_transition(44, b2)
-b5.add_transition(45, b2)
-b5.add_transition(46, b2)
-b5.add_transition(47, b2)
-b5.add_transition(48, b2)
-b5.add_transition(49, b2)
-b5.add_transition(50, b2)
-b5.add_transition(51, b2)
-b5.add_transition(52, b2)
-b5.add_transition(53, b2)
-b5.add_transition(54, b2)
-b5.add_transition(55, b2)
-b5.add_transition(56, b2)
-b5.add_transition(57, b2)
-b5.add_transition(58, b2)
-b5.add_transition(59, b2)
-b5.add_transition(60, b2)
-b5.add_transition(61, b2)
-b5.add_transition(62, b2)
-b5.add_transition(63, b2)
-b5.add_transition(64, b2)
-b5.add_transition(65, b2)
-b5.add_transition(66, b2)
-b5.add_transition(67, b2)
-b5.add_transition(68, b2)
-b5.add_transition(69, b2)
-b5.add_transition(70, b2)
-b5.add_transition(71, b2)
-b5.add_transition(72, b2)
-b5.add_transition(73, b2)
-b5.add_transition(74, b2)
-b5.add_transition(75, b2)
-b5.add_transition(76, b2)
-b5.add_transition(77, b2)
-b5.add_transition(78, b2)
-b5.add_transition(79, b2)
-b5.add_transition(80, b2)
-b5.add_transition(81, b2)
-b5.add_transition(82, b2)
-b5.add_transition(83, b2)
-b5.add_transition(84, b2)
-b5.add_transition(85, b2)
-b5.add_transition(86, b2)
-b5.add_transition(87, b2)
-b5.add_transition(88, b2)
-b5.add_transition(89, b2)
-b5.add_transition(90, b2)
-b5.add_transition(91, b2)
-b5.add_transition(92, b2)
-b5.add_transition(93, b2)
-b5.add_transition(94, b2)
-b5.add_transition(95, b2)
-b5.add_transition(96, b2)
-b5.add_transition(97, b2)
-b5.add_transition(98, b2)
-b5.add_transition(99, b2)
-b5.add_transition(100, b2)
-b5.add_transition(101, b2)
-b5.add_transition(102, b2)
-b5.add_transition(103, b2)
-b5.add_transition(104, b2)
-b5.add_transition(105, b2)
-b5.add_transition(106, b2)
-b5.add_transition(107, b2)
-b5.add_transition(108, b2)
-b5.add_transition(109, b2)
-b5.add_transition(110, b2)
-b5.add_transition(111, b2)
-b5.add_transition(112, b2)
-b5.add_transition(113, b2)
-b5.add_transition(114, b2)
-b5.add_transition(115, b2)
-b5.add_transition(116, b2)
-b5.add_transition(117, b2)
-b5.add_transition(118, b2)
-b5.add_transition(119, b2)
-b5.add_transition(120, b2)
-b5.add_transition(121, b2)
-b5.add_transition(122, b2)
-b5.add_transition(123, b2)
-b5.add_transition(124, b2)
-b5.add_transition(125, b2)
-b5.add_transition(126, b2)
-b5.add_transition(127, b2)
-b5.add_transition(128, b2)
-b5.add_transition(129, b2)
-b5.add_transition(130, b2)
-b5.add_transition(131, b2)
-b5.add_transition(132, b2)
-b5.add_transition(133, b2)
-b5.add_transition(134, b2)
-b5.add_transition(135, b2)
-b5.add_transition(136, b2)
-b5.add_transition(137, b2)
-b5.add_transition(138, b2)
-b5.add_transition(139, b2)
-b5.add_transition(140, b2)
-b5.add_transition(141, b2)
-b5.add_transition(142, b2)
-b5.add_transition(143, b2)
-b5.add_transition(144, b2)
-b5.add_transition(145, b2)
-b5.add_transition(146, b2)
-b5.add_transition(147, b2)
-b5.add_transition(148, b2)
-b5.add_transition(149, b2)
-b5.add_transition(150, b2)
-b5.add_transition(151, b2)
-b5.add_transition(152, b2)
-b5.add_transition(153, b2)
-b5.add_transition(154, b2)
-b5.add_transition(155, b2)
-b5.add_transition(156, b2)
-b5.add_transition(157, b2)
-b5.add_transition(158, b2)
-b5.add_transition(159, b2)
-b5.add_transition(160, b2)
-b5.add_transition(161, b2)
-b5.add_transition(162, b2)
-b5.add_transition(163, b2)
-b5.add_transition(164, b2)
-b5.add_transition(165, b2)
-b5.add_transition(166, b2)
-b5.add_transition(167, b2)
-b5.add_transition(168, b2)
-b5.add_transition(169, b2)
-b5.add_transition(170, b2)
-b5.add_transition(171, b2)
-b5.add_transition(172, b2)
-b5.add_transition(173, b2)
-b5.add_transition(174, b2)
-b5.add_transition(175, b2)
-b5.add_transition(176, b2)
-b5.add_transition(177, b2)
-b5.add_transition(178, b2)
-b5.add_transition(179, b2)
-b5.add_transition(180, b2)
-b5.add_transition(181, b2)
-b5.add_transition(182, b2)
-b5.add_transition(183, b2)
-b5.add_transition(184, b2)
-b5.add_transition(185, b2)
-b5.add_transition(186, b2)
-b5.add_transition(187, b2)
-b5.add_transition(188, b2)
-b5.add_transition(189, b2)
-b5.add_transition(190, b2)
-b5.add_transition(191, b2)
-b5.add_transition(192, b2)
-b5.add_transition(193, b2)
-b5.add_transition(194, b2)
-b5.add_transition(195, b2)
-b5.add_transition(196, b2)
-b5.add_transition(197, b2)
-b5.add_transition(198, b2)
-b5.add_transition(199, b2)
-b5.add_transition(200, b2)
-b5.add_transition(201, b2)
-b5.add_transition(202, b2)
-b5.add_transition(203, b2)
-b5.add_transition(204, b2)
-b5.add_transition(205, b2)
-b5.add_transition(206, b2)
-b5.add_transition(207, b2)
-b5.add_transition(208, b2)
-b5.add_transition(209, b2)
-b5.add_transition(210, b2)
-b5.add_transition(211, b2)
-b5.add_transition(212, b2)
-b5.add_transition(213, b2)
-b5.add_transition(214, b2)
-b5.add_transition(215, b2)
-b5.add_transition(216, b2)
-b5.add_transition(217, b2)
-b5.add_transition(218, b2)
-b5.add_transition(219, b2)
-b5.add_transition(220, b2)
-b5.add_transition(221, b2)
-b5.add_transition(222, b2)
-b5.add_transition(223, b2)
-b5.add_transition(224, b2)
-b5.add_transition(225, b2)
-b5.add_transition(226, b2)
-b5.add_transition(227, b2)
-b5.add_transition(228, b2)
-b5.add_transition(229, b2)
-b5.add_transition(230, b2)
-b5.add_transition(231, b2)
-b5.add_transition(232, b2)
-b5.add_transition(233, b2)
-b5.add_transition(234, b2)
-b5.add_transition(235, b2)
-b5.add_transition(236, b2)
-b5.add_transition(237, b2)
-b5.add_transition(238, b2)
-b5.add_transition(239, b2)
-b5.add_transition(240, b2)
-b5.add_transition(241, b2)
-b5.add_transition(242, b2)
-b5.add_transition(243, b2)
-b5.add_transition(244, b2)
-b5.add_transition(245, b2)
-b5.add_transition(246, b2)
-b5.add_transition(247, b2)
-b5.add_transition(248, b2)
-b5.add_transition(249, b2)
-b5.add_transition(250, b2)
-b5.add_transition(251, b2)
-b5.add_transition(252, b2)
-b5.add_transition(253, b2)
-b5.add_transition(254, b2)
-b5.add_transition(255, b2)
-
-b8.add_transition(39, b2)
-
-b9.isFinalState = True
-b9.addToken( 'IN_GROUP')
-b9.add_transition(0, b2)
-b9.add_transition(1, b2)
-b9.add_transition(2, b2)
-b9.add_transition(3, b2)
-b9.add_transition(4, b2)
-b9.add_transition(5, b2)
-b9.add_transition(6, b2)
-b9.add_transition(7, b2)
-b9.add_transition(8, b2)
-b9.add_transition(11, b2)
-b9.add_transition(12, b2)
-b9.add_transition(13, b2)
-b9.add_transition(14, b2)
-b9.add_transition(15, b2)
-b9.add_transition(16, b2)
-b9.add_transition(17, b2)
-b9.add_transition(18, b2)
-b9.add_transition(19, b2)
-b9.add_transition(20, b2)
-b9.add_transition(21, b2)
-b9.add_transition(22, b2)
-b9.add_transition(23, b2)
-b9.add_transition(24, b2)
-b9.add_transition(25, b2)
-b9.add_transition(26, b2)
-b9.add_transition(27, b2)
-b9.add_transition(28, b2)
-b9.add_transition(29, b2)
-b9.add_transition(30, b2)
-b9.add_transition(31, b2)
-b9.add_transition(32, b2)
-b9.add_transition(33, b2)
-b9.add_transition(34, b3)
-b9.add_transition(35, b2)
-b9.add_transition(36, b2)
-b9.add_transition(37, b2)
-b9.add_transition(38, b2)
-b9.add_transition(39, b5)
-b9.add_transition(40, b2)
-b9.add_transition(41, b9)
-b9.add_transition(42, b2)
-b9.add_transition(43, b2)
-b9.add_transition(44, b2)
-b9.add_transition(45, b2)
-b9.add_transition(46, b2)
-b9.add_transition(47, b2)
-b9.add_transition(48, b2)
-b9.add_transition(49, b2)
-b9.add_transition(50, b2)
-b9.add_transition(51, b2)
-b9.add_transition(52, b2)
-b9.add_transition(53, b2)
-b9.add_transition(54, b2)
-b9.add_transition(55, b2)
-b9.add_transition(56, b2)
-b9.add_transition(57, b2)
-b9.add_transition(58, b2)
-b9.add_transition(59, b2)
-b9.add_transition(60, b2)
-b9.add_transition(61, b2)
-b9.add_transition(62, b2)
-b9.add_transition(63, b2)
-b9.add_transition(64, b2)
-b9.add_transition(65, b2)
-b9.add_transition(66, b2)
-b9.add_transition(67, b2)
-b9.add_transition(68, b2)
-b9.add_transition(69, b2)
-b9.add_transition(70, b2)
-b9.add_transition(71, b2)
-b9.add_transition(72, b2)
-b9.add_transition(73, b2)
-b9.add_transition(74, b2)
-b9.add_transition(75, b2)
-b9.add_transition(76, b2)
-b9.add_transition(77, b2)
-b9.add_transition(78, b2)
-b9.add_transition(79, b2)
-b9.add_transition(80, b2)
-b9.add_transition(81, b2)
-b9.add_transition(82, b2)
-b9.add_transition(83, b2)
-b9.add_transition(84, b2)
-b9.add_transition(85, b2)
-b9.add_transition(86, b2)
-b9.add_transition(87, b2)
-b9.add_transition(88, b2)
-b9.add_transition(89, b2)
-b9.add_transition(90, b2)
-b9.add_transition(91, b2)
-b9.add_transition(92, b2)
-b9.add_transition(93, b2)
-b9.add_transition(94, b2)
-b9.add_transition(95, b2)
-b9.add_transition(96, b2)
-b9.add_transition(97, b2)
-b9.add_transition(98, b2)
-b9.add_transition(99, b2)
-b9.add_transition(100, b2)
-b9.add_transition(101, b2)
-b9.add_transition(102, b2)
-b9.add_transition(103, b2)
-b9.add_transition(104, b2)
-b9.add_transition(105, b2)
-b9.add_transition(106, b2)
-b9.add_transition(107, b2)
-b9.add_transition(108, b2)
-b9.add_transition(109, b2)
-b9.add_transition(110, b2)
-b9.add_transition(111, b2)
-b9.add_transition(112, b2)
-b9.add_transition(113, b2)
-b9.add_transition(114, b2)
-b9.add_transition(115, b2)
-b9.add_transition(116, b2)
-b9.add_transition(117, b2)
-b9.add_transition(118, b2)
-b9.add_transition(119, b2)
-b9.add_transition(120, b2)
-b9.add_transition(121, b2)
-b9.add_transition(122, b2)
-b9.add_transition(123, b2)
-b9.add_transition(124, b2)
-b9.add_transition(125, b2)
-b9.add_transition(126, b2)
-b9.add_transition(127, b2)
-b9.add_transition(128, b2)
-b9.add_transition(129, b2)
-b9.add_transition(130, b2)
-b9.add_transition(131, b2)
-b9.add_transition(132, b2)
-b9.add_transition(133, b2)
-b9.add_transition(134, b2)
-b9.add_transition(135, b2)
-b9.add_transition(136, b2)
-b9.add_transition(137, b2)
-b9.add_transition(138, b2)
-b9.add_transition(139, b2)
-b9.add_transition(140, b2)
-b9.add_transition(141, b2)
-b9.add_transition(142, b2)
-b9.add_transition(143, b2)
-b9.add_transition(144, b2)
-b9.add_transition(145, b2)
-b9.add_transition(146, b2)
-b9.add_transition(147, b2)
-b9.add_transition(148, b2)
-b9.add_transition(149, b2)
-b9.add_transition(150, b2)
-b9.add_transition(151, b2)
-b9.add_transition(152, b2)
-b9.add_transition(153, b2)
-b9.add_transition(154, b2)
-b9.add_transition(155, b2)
-b9.add_transition(156, b2)
-b9.add_transition(157, b2)
-b9.add_transition(158, b2)
-b9.add_transition(159, b2)
-b9.add_transition(160, b2)
-b9.add_transition(161, b2)
-b9.add_transition(162, b2)
-b9.add_transition(163, b2)
-b9.add_transition(164, b2)
-b9.add_transition(165, b2)
-b9.add_transition(166, b2)
-b9.add_transition(167, b2)
-b9.add_transition(168, b2)
-b9.add_transition(169, b2)
-b9.add_transition(170, b2)
-b9.add_transition(171, b2)
-b9.add_transition(172, b2)
-b9.add_transition(173, b2)
-b9.add_transition(174, b2)
-b9.add_transition(175, b2)
-b9.add_transition(176, b2)
-b9.add_transition(177, b2)
-b9.add_transition(178, b2)
-b9.add_transition(179, b2)
-b9.add_transition(180, b2)
-b9.add_transition(181, b2)
-b9.add_transition(182, b2)
-b9.add_transition(183, b2)
-b9.add_transition(184, b2)
-b9.add_transition(185, b2)
-b9.add_transition(186, b2)
-b9.add_transition(187, b2)
-b9.add_transition(188, b2)
-b9.add_transition(189, b2)
-b9.add_transition(190, b2)
-b9.add_transition(191, b2)
-b9.add_transition(192, b2)
-b9.add_transition(193, b2)
-b9.add_transition(194, b2)
-b9.add_transition(195, b2)
-b9.add_transition(196, b2)
-b9.add_transition(197, b2)
-b9.add_transition(198, b2)
-b9.add_transition(199, b2)
-b9.add_transition(200, b2)
-b9.add_transition(201, b2)
-b9.add_transition(202, b2)
-b9.add_transition(203, b2)
-b9.add_transition(204, b2)
-b9.add_transition(205, b2)
-b9.add_transition(206, b2)
-b9.add_transition(207, b2)
-b9.add_transition(208, b2)
-b9.add_transition(209, b2)
-b9.add_transition(210, b2)
-b9.add_transition(211, b2)
-b9.add_transition(212, b2)
-b9.add_transition(213, b2)
-b9.add_transition(214, b2)
-b9.add_transition(215, b2)
-b9.add_transition(216, b2)
-b9.add_transition(217, b2)
-b9.add_transition(218, b2)
-b9.add_transition(219, b2)
-b9.add_transition(220, b2)
-b9.add_transition(221, b2)
-b9.add_transition(222, b2)
-b9.add_transition(223, b2)
-b9.add_transition(224, b2)
-b9.add_transition(225, b2)
-b9.add_transition(226, b2)
-b9.add_transition(227, b2)
-b9.add_transition(228, b2)
-b9.add_transition(229, b2)
-b9.add_transition(230, b2)
-b9.add_transition(231, b2)
-b9.add_transition(232, b2)
-b9.add_transition(233, b2)
-b9.add_transition(234, b2)
-b9.add_transition(235, b2)
-b9.add_transition(236, b2)
-b9.add_transition(237, b2)
-b9.add_transition(238, b2)
-b9.add_transition(239, b2)
-b9.add_transition(240, b2)
-b9.add_transition(241, b2)
-b9.add_transition(242, b2)
-b9.add_transition(243, b2)
-b9.add_transition(244, b2)
-b9.add_transition(245, b2)
-b9.add_transition(246, b2)
-b9.add_transition(247, b2)
-b9.add_transition(248, b2)
-b9.add_transition(249, b2)
-b9.add_transition(250, b2)
-b9.add_transition(251, b2)
-b9.add_transition(252, b2)
-b9.add_transition(253, b2)
-b9.add_transition(254, b2)
-b9.add_transition(255, b2)
-
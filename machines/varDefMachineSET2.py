@@ -1,1132 +0,0 @@
-from Machines_gen_usage.Classes_ import State
-
-e3 = State('e3')
-e2 = State('e2')
-e1 = State('e1')
-d1 = State('d1')
-b3 = State('b3')
-b2 = State('b2')
-b1 = State('b1')
-a3 = State('a3')
-a2 = State('a2')
-a1 = State('a1')
-c3 = State('c3')
-c2 = State('c2')
-c1 = State('c1')
-a0 = State('a0')
-a0.add_transition(39, c1)
-a0.add_transition(39, a1)
-a0.add_transition(39, b1)
-a0.add_transition(45, d1)
-a0.add_transition(34, e1)
-
-c1.add_transition(116, c2)
-
-c2.add_transition(39, c3)
-
-c3.isFinalState = True
-c3.addToken( 'IND')
-
-a1.add_transition(32, a2)
-a1.add_transition(48, a2)
-a1.add_transition(49, a2)
-a1.add_transition(50, a2)
-a1.add_transition(51, a2)
-a1.add_transition(52, a2)
-a1.add_transition(53, a2)
-a1.add_transition(54, a2)
-a1.add_transition(55, a2)
-a1.add_transition(56, a2)
-a1.add_transition(57, a2)
-a1.add_transition(65, a2)
-a1.add_transition(66, a2)
-a1.add_transition(67, a2)
-a1.add_transition(68, a2)
-a1.add_transition(69, a2)
-a1.add_transition(70, a2)
-a1.add_transition(71, a2)
-a1.add_transition(72, a2)
-a1.add_transition(73, a2)
-a1.add_transition(74, a2)
-a1.add_transition(75, a2)
-a1.add_transition(76, a2)
-a1.add_transition(77, a2)
-a1.add_transition(78, a2)
-a1.add_transition(79, a2)
-a1.add_transition(80, a2)
-a1.add_transition(81, a2)
-a1.add_transition(82, a2)
-a1.add_transition(83, a2)
-a1.add_transition(84, a2)
-a1.add_transition(85, a2)
-a1.add_transition(86, a2)
-a1.add_transition(87, a2)
-a1.add_transition(88, a2)
-a1.add_transition(89, a2)
-a1.add_transition(90, a2)
-a1.add_transition(97, a2)
-a1.add_transition(98, a2)
-a1.add_transition(99, a2)
-a1.add_transition(100, a2)
-a1.add_transition(101, a2)
-a1.add_transition(102, a2)
-a1.add_transition(103, a2)
-a1.add_transition(104, a2)
-a1.add_transition(105, a2)
-a1.add_transition(106, a2)
-a1.add_transition(107, a2)
-a1.add_transition(108, a2)
-a1.add_transition(109, a2)
-a1.add_transition(110, a2)
-a1.add_transition(111, a2)
-a1.add_transition(112, a2)
-a1.add_transition(113, a2)
-a1.add_transition(114, a2)
-a1.add_transition(115, a2)
-a1.add_transition(116, a2)
-a1.add_transition(117, a2)
-a1.add_transition(118, a2)
-a1.add_transition(119, a2)
-a1.add_transition(120, a2)
-a1.add_transition(121, a2)
-a1.add_transition(122, a2)
-
-a2.add_transition(39, a3)
-
-a3.isFinalState = True
-a3.addToken( 'IND')
-
-b1.add_transition(0, b2)
-b1.add_transition(1, b2)
-b1.add_transition(2, b2)
-b1.add_transition(3, b2)
-b1.add_transition(4, b2)
-b1.add_transition(5, b2)
-b1.add_transition(6, b2)
-b1.add_transition(7, b2)
-b1.add_transition(8, b2)
-b1.add_transition(9, b2)
-b1.add_transition(10, b2)
-b1.add_transition(11, b2)
-b1.add_transition(12, b2)
-b1.add_transition(13, b2)
-b1.add_transition(14, b2)
-b1.add_transition(15, b2)
-b1.add_transition(16, b2)
-b1.add_transition(17, b2)
-b1.add_transition(18, b2)
-b1.add_transition(19, b2)
-b1.add_transition(20, b2)
-b1.add_transition(21, b2)
-b1.add_transition(22, b2)
-b1.add_transition(23, b2)
-b1.add_transition(24, b2)
-b1.add_transition(25, b2)
-b1.add_transition(26, b2)
-b1.add_transition(27, b2)
-b1.add_transition(28, b2)
-b1.add_transition(29, b2)
-b1.add_transition(30, b2)
-b1.add_transition(31, b2)
-b1.add_transition(32, b2)
-b1.add_transition(33, b2)
-b1.add_transition(34, b2)
-b1.add_transition(35, b2)
-b1.add_transition(36, b2)
-b1.add_transition(37, b2)
-b1.add_transition(38, b2)
-b1.add_transition(40, b2)
-b1.add_transition(41, b2)
-b1.add_transition(42, b2)
-b1.add_transition(43, b2)
-b1.add_transition(44, b2)
-b1.add_transition(45, b2)
-b1.add_transition(46, b2)
-b1.add_transition(47, b2)
-b1.add_transition(48, b2)
-b1.add_transition(49, b2)
-b1.add_transition(50, b2)
-b1.add_transition(51, b2)
-b1.add_transition(52, b2)
-b1.add_transition(53, b2)
-b1.add_transition(54, b2)
-b1.add_transition(55, b2)
-b1.add_transition(56, b2)
-b1.add_transition(57, b2)
-b1.add_transition(58, b2)
-b1.add_transition(59, b2)
-b1.add_transition(60, b2)
-b1.add_transition(61, b2)
-b1.add_transition(62, b2)
-b1.add_transition(63, b2)
-b1.add_transition(64, b2)
-b1.add_transition(65, b2)
-b1.add_transition(66, b2)
-b1.add_transition(67, b2)
-b1.add_transition(68, b2)
-b1.add_transition(69, b2)
-b1.add_transition(70, b2)
-b1.add_transition(71, b2)
-b1.add_transition(72, b2)
-b1.add_transition(73, b2)
-b1.add_transition(74, b2)
-b1.add_transition(75, b2)
-b1.add_transition(76, b2)
-b1.add_transition(77, b2)
-b1.add_transition(78, b2)
-b1.add_transition(79, b2)
-b1.add_transition(80, b2)
-b1.add_transition(81, b2)
-b1.add_transition(82, b2)
-b1.add_transition(83, b2)
-b1.add_transition(84, b2)
-b1.add_transition(85, b2)
-b1.add_transition(86, b2)
-b1.add_transition(87, b2)
-b1.add_transition(88, b2)
-b1.add_transition(89, b2)
-b1.add_transition(90, b2)
-b1.add_transition(91, b2)
-b1.add_transition(92, b2)
-b1.add_transition(93, b2)
-b1.add_transition(94, b2)
-b1.add_transition(95, b2)
-b1.add_transition(96, b2)
-b1.add_transition(97, b2)
-b1.add_transition(98, b2)
-b1.add_transition(99, b2)
-b1.add_transition(100, b2)
-b1.add_transition(101, b2)
-b1.add_transition(102, b2)
-b1.add_transition(103, b2)
-b1.add_transition(104, b2)
-b1.add_transition(105, b2)
-b1.add_transition(106, b2)
-b1.add_transition(107, b2)
-b1.add_transition(108, b2)
-b1.add_transition(109, b2)
-b1.add_transition(110, b2)
-b1.add_transition(111, b2)
-b1.add_transition(112, b2)
-b1.add_transition(113, b2)
-b1.add_transition(114, b2)
-b1.add_transition(115, b2)
-b1.add_transition(116, b2)
-b1.add_transition(117, b2)
-b1.add_transition(118, b2)
-b1.add_transition(119, b2)
-b1.add_transition(120, b2)
-b1.add_transition(121, b2)
-b1.add_transition(122, b2)
-b1.add_transition(123, b2)
-b1.add_transition(124, b2)
-b1.add_transition(125, b2)
-b1.add_transition(126, b2)
-b1.add_transition(127, b2)
-b1.add_transition(128, b2)
-b1.add_transition(129, b2)
-b1.add_transition(130, b2)
-b1.add_transition(131, b2)
-b1.add_transition(132, b2)
-b1.add_transition(133, b2)
-b1.add_transition(134, b2)
-b1.add_transition(135, b2)
-b1.add_transition(136, b2)
-b1.add_transition(137, b2)
-b1.add_transition(138, b2)
-b1.add_transition(139, b2)
-b1.add_transition(140, b2)
-b1.add_transition(141, b2)
-b1.add_transition(142, b2)
-b1.add_transition(143, b2)
-b1.add_transition(144, b2)
-b1.add_transition(145, b2)
-b1.add_transition(146, b2)
-b1.add_transition(147, b2)
-b1.add_transition(148, b2)
-b1.add_transition(149, b2)
-b1.add_transition(150, b2)
-b1.add_transition(151, b2)
-b1.add_transition(152, b2)
-b1.add_transition(153, b2)
-b1.add_transition(154, b2)
-b1.add_transition(155, b2)
-b1.add_transition(156, b2)
-b1.add_transition(157, b2)
-b1.add_transition(158, b2)
-b1.add_transition(159, b2)
-b1.add_transition(160, b2)
-b1.add_transition(161, b2)
-b1.add_transition(162, b2)
-b1.add_transition(163, b2)
-b1.add_transition(164, b2)
-b1.add_transition(165, b2)
-b1.add_transition(166, b2)
-b1.add_transition(167, b2)
-b1.add_transition(168, b2)
-b1.add_transition(169, b2)
-b1.add_transition(170, b2)
-b1.add_transition(171, b2)
-b1.add_transition(172, b2)
-b1.add_transition(173, b2)
-b1.add_transition(174, b2)
-b1.add_transition(175, b2)
-b1.add_transition(176, b2)
-b1.add_transition(177, b2)
-b1.add_transition(178, b2)
-b1.add_transition(179, b2)
-b1.add_transition(180, b2)
-b1.add_transition(181, b2)
-b1.add_transition(182, b2)
-b1.add_transition(183, b2)
-b1.add_transition(184, b2)
-b1.add_transition(185, b2)
-b1.add_transition(186, b2)
-b1.add_transition(187, b2)
-b1.add_transition(188, b2)
-b1.add_transition(189, b2)
-b1.add_transition(190, b2)
-b1.add_transition(191, b2)
-b1.add_transition(192, b2)
-b1.add_transition(193, b2)
-b1.add_transition(194, b2)
-b1.add_transition(195, b2)
-b1.add_transition(196, b2)
-b1.add_transition(197, b2)
-b1.add_transition(198, b2)
-b1.add_transition(199, b2)
-b1.add_transition(200, b2)
-b1.add_transition(201, b2)
-b1.add_transition(202, b2)
-b1.add_transition(203, b2)
-b1.add_transition(204, b2)
-b1.add_transition(205, b2)
-b1.add_transition(206, b2)
-b1.add_transition(207, b2)
-b1.add_transition(208, b2)
-b1.add_transition(209, b2)
-b1.add_transition(210, b2)
-b1.add_transition(211, b2)
-b1.add_transition(212, b2)
-b1.add_transition(213, b2)
-b1.add_transition(214, b2)
-b1.add_transition(215, b2)
-b1.add_transition(216, b2)
-b1.add_transition(217, b2)
-b1.add_transition(218, b2)
-b1.add_transition(219, b2)
-b1.add_transition(220, b2)
-b1.add_transition(221, b2)
-b1.add_transition(222, b2)
-b1.add_transition(223, b2)
-b1.add_transition(224, b2)
-b1.add_transition(225, b2)
-b1.add_transition(226, b2)
-b1.add_transition(227, b2)
-b1.add_transition(228, b2)
-b1.add_transition(229, b2)
-b1.add_transition(230, b2)
-b1.add_transition(231, b2)
-b1.add_transition(232, b2)
-b1.add_transition(233, b2)
-b1.add_transition(234, b2)
-b1.add_transition(235, b2)
-b1.add_transition(236, b2)
-b1.add_transition(237, b2)
-b1.add_transition(238, b2)
-b1.add_transition(239, b2)
-b1.add_transition(240, b2)
-b1.add_transition(241, b2)
-b1.add_transition(242, b2)
-b1.add_transition(243, b2)
-b1.add_transition(244, b2)
-b1.add_transition(245, b2)
-b1.add_transition(246, b2)
-b1.add_transition(247, b2)
-b1.add_transition(248, b2)
-b1.add_transition(249, b2)
-b1.add_transition(250, b2)
-b1.add_transition(251, b2)
-b1.add_transition(252, b2)
-b1.add_transition(253, b2)
-b1.add_transition(254, b2)
-b1.add_transition(255, b2)
-
-b2.add_transition(39, b3)
-
-b3.isFinalState = True
-b3.addToken( 'IND')
-
-d1.isFinalState = True
-d1.addToken( 'OPER')
-
-e1.add_transition(0, e2)
-e1.add_transition(1, e2)
-e1.add_transition(2, e2)
-e1.add_transition(3, e2)
-e1.add_transition(4, e2)
-e1.add_transition(5, e2)
-e1.add_transition(6, e2)
-e1.add_transition(7, e2)
-e1.add_transition(8, e2)
-e1.add_transition(9, e2)
-e1.add_transition(10, e2)
-e1.add_transition(11, e2)
-e1.add_transition(12, e2)
-e1.add_transition(13, e2)
-e1.add_transition(14, e2)
-e1.add_transition(15, e2)
-e1.add_transition(16, e2)
-e1.add_transition(17, e2)
-e1.add_transition(18, e2)
-e1.add_transition(19, e2)
-e1.add_transition(20, e2)
-e1.add_transition(21, e2)
-e1.add_transition(22, e2)
-e1.add_transition(23, e2)
-e1.add_transition(24, e2)
-e1.add_transition(25, e2)
-e1.add_transition(26, e2)
-e1.add_transition(27, e2)
-e1.add_transition(28, e2)
-e1.add_transition(29, e2)
-e1.add_transition(30, e2)
-e1.add_transition(31, e2)
-e1.add_transition(32, e2)
-e1.add_transition(33, e2)
-e1.add_transition(34, e2)
-e1.add_transition(35, e2)
-e1.add_transition(36, e2)
-e1.add_transition(37, e2)
-e1.add_transition(38, e2)
-e1.add_transition(39, e2)
-e1.add_transition(40, e2)
-e1.add_transition(41, e2)
-e1.add_transition(42, e2)
-e1.add_transition(43, e2)
-e1.add_transition(44, e2)
-e1.add_transition(45, e2)
-e1.add_transition(46, e2)
-e1.add_transition(47, e2)
-e1.add_transition(48, e2)
-e1.add_transition(49, e2)
-e1.add_transition(50, e2)
-e1.add_transition(51, e2)
-e1.add_transition(52, e2)
-e1.add_transition(53, e2)
-e1.add_transition(54, e2)
-e1.add_transition(55, e2)
-e1.add_transition(56, e2)
-e1.add_transition(57, e2)
-e1.add_transition(58, e2)
-e1.add_transition(59, e2)
-e1.add_transition(60, e2)
-e1.add_transition(61, e2)
-e1.add_transition(62, e2)
-e1.add_transition(63, e2)
-e1.add_transition(64, e2)
-e1.add_transition(65, e2)
-e1.add_transition(66, e2)
-e1.add_transition(67, e2)
-e1.add_transition(68, e2)
-e1.add_transition(69, e2)
-e1.add_transition(70, e2)
-e1.add_transition(71, e2)
-e1.add_transition(72, e2)
-e1.add_transition(73, e2)
-e1.add_transition(74, e2)
-e1.add_transition(75, e2)
-e1.add_transition(76, e2)
-e1.add_transition(77, e2)
-e1.add_transition(78, e2)
-e1.add_transition(79, e2)
-e1.add_transition(80, e2)
-e1.add_transition(81, e2)
-e1.add_transition(82, e2)
-e1.add_transition(83, e2)
-e1.add_transition(84, e2)
-e1.add_transition(85, e2)
-e1.add_transition(86, e2)
-e1.add_transition(87, e2)
-e1.add_transition(88, e2)
-e1.add_transition(89, e2)
-e1.add_transition(90, e2)
-e1.add_transition(91, e2)
-e1.add_transition(92, e2)
-e1.add_transition(93, e2)
-e1.add_transition(94, e2)
-e1.add_transition(95, e2)
-e1.add_transition(96, e2)
-e1.add_transition(98, e2)
-e1.add_transition(99, e2)
-e1.add_transition(100, e2)
-e1.add_transition(101, e2)
-e1.add_transition(102, e2)
-e1.add_transition(103, e2)
-e1.add_transition(104, e2)
-e1.add_transition(105, e2)
-e1.add_transition(106, e2)
-e1.add_transition(107, e2)
-e1.add_transition(108, e2)
-e1.add_transition(109, e2)
-e1.add_transition(110, e2)
-e1.add_transition(111, e2)
-e1.add_transition(112, e2)
-e1.add_transition(113, e2)
-e1.add_transition(114, e2)
-e1.add_transition(115, e2)
-e1.add_transition(116, e2)
-e1.add_transition(117, e2)
-e1.add_transition(118, e2)
-e1.add_transition(119, e2)
-e1.add_transition(120, e2)
-e1.add_transition(121, e2)
-e1.add_transition(122, e2)
-e1.add_transition(123, e2)
-e1.add_transition(124, e2)
-e1.add_transition(125, e2)
-e1.add_transition(126, e2)
-e1.add_transition(127, e2)
-e1.add_transition(128, e2)
-e1.add_transition(129, e2)
-e1.add_transition(130, e2)
-e1.add_transition(131, e2)
-e1.add_transition(132, e2)
-e1.add_transition(133, e2)
-e1.add_transition(134, e2)
-e1.add_transition(135, e2)
-e1.add_transition(136, e2)
-e1.add_transition(137, e2)
-e1.add_transition(138, e2)
-e1.add_transition(139, e2)
-e1.add_transition(140, e2)
-e1.add_transition(141, e2)
-e1.add_transition(142, e2)
-e1.add_transition(143, e2)
-e1.add_transition(144, e2)
-e1.add_transition(145, e2)
-e1.add_transition(146, e2)
-e1.add_transition(147, e2)
-e1.add_transition(148, e2)
-e1.add_transition(149, e2)
-e1.add_transition(150, e2)
-e1.add_transition(151, e2)
-e1.add_transition(152, e2)
-e1.add_transition(153, e2)
-e1.add_transition(154, e2)
-e1.add_transition(155, e2)
-e1.add_transition(156, e2)
-e1.add_transition(157, e2)
-e1.add_transition(158, e2)
-e1.add_transition(159, e2)
-e1.add_transition(160, e2)
-e1.add_transition(161, e2)
-e1.add_transition(162, e2)
-e1.add_transition(163, e2)
-e1.add_transition(164, e2)
-e1.add_transition(165, e2)
-e1.add_transition(166, e2)
-e1.add_transition(167, e2)
-e1.add_transition(168, e2)
-e1.add_transition(169, e2)
-e1.add_transition(170, e2)
-e1.add_transition(171, e2)
-e1.add_transition(172, e2)
-e1.add_transition(173, e2)
-e1.add_transition(174, e2)
-e1.add_transition(175, e2)
-e1.add_transition(176, e2)
-e1.add_transition(177, e2)
-e1.add_transition(178, e2)
-e1.add_transition(179, e2)
-e1.add_transition(180, e2)
-e1.add_transition(181, e2)
-e1.add_transition(182, e2)
-e1.add_transition(183, e2)
-e1.add_transition(184, e2)
-e1.add_transition(185, e2)
-e1.add_transition(186, e2)
-e1.add_transition(187, e2)
-e1.add_transition(188, e2)
-e1.add_transition(189, e2)
-e1.add_transition(190, e2)
-e1.add_transition(191, e2)
-e1.add_transition(192, e2)
-e1.add_transition(193, e2)
-e1.add_transition(194, e2)
-e1.add_transition(195, e2)
-e1.add_transition(196, e2)
-e1.add_transition(197, e2)
-e1.add_transition(198, e2)
-e1.add_transition(199, e2)
-e1.add_transition(200, e2)
-e1.add_transition(201, e2)
-e1.add_transition(202, e2)
-e1.add_transition(203, e2)
-e1.add_transition(204, e2)
-e1.add_transition(205, e2)
-e1.add_transition(206, e2)
-e1.add_transition(207, e2)
-e1.add_transition(208, e2)
-e1.add_transition(209, e2)
-e1.add_transition(210, e2)
-e1.add_transition(211, e2)
-e1.add_transition(212, e2)
-e1.add_transition(213, e2)
-e1.add_transition(214, e2)
-e1.add_transition(215, e2)
-e1.add_transition(216, e2)
-e1.add_transition(217, e2)
-e1.add_transition(218, e2)
-e1.add_transition(219, e2)
-e1.add_transition(220, e2)
-e1.add_transition(221, e2)
-e1.add_transition(222, e2)
-e1.add_transition(223, e2)
-e1.add_transition(224, e2)
-e1.add_transition(225, e2)
-e1.add_transition(226, e2)
-e1.add_transition(227, e2)
-e1.add_transition(228, e2)
-e1.add_transition(229, e2)
-e1.add_transition(230, e2)
-e1.add_transition(231, e2)
-e1.add_transition(232, e2)
-e1.add_transition(233, e2)
-e1.add_transition(234, e2)
-e1.add_transition(235, e2)
-e1.add_transition(236, e2)
-e1.add_transition(237, e2)
-e1.add_transition(238, e2)
-e1.add_transition(239, e2)
-e1.add_transition(240, e2)
-e1.add_transition(241, e2)
-e1.add_transition(242, e2)
-e1.add_transition(243, e2)
-e1.add_transition(244, e2)
-e1.add_transition(245, e2)
-e1.add_transition(246, e2)
-e1.add_transition(247, e2)
-e1.add_transition(248, e2)
-e1.add_transition(249, e2)
-e1.add_transition(250, e2)
-e1.add_transition(251, e2)
-e1.add_transition(252, e2)
-e1.add_transition(253, e2)
-e1.add_transition(254, e2)
-e1.add_transition(255, e2)
-
-e2.add_transition(0, e2)
-e2.add_transition(1, e2)
-e2.add_transition(2, e2)
-e2.add_transition(3, e2)
-e2.add_transition(4, e2)
-e2.add_transition(5, e2)
-e2.add_transition(6, e2)
-e2.add_transition(7, e2)
-e2.add_transition(8, e2)
-e2.add_transition(9, e2)
-e2.add_transition(10, e2)
-e2.add_transition(11, e2)
-e2.add_transition(12, e2)
-e2.add_transition(13, e2)
-e2.add_transition(14, e2)
-e2.add_transition(15, e2)
-e2.add_transition(16, e2)
-e2.add_transition(17, e2)
-e2.add_transition(18, e2)
-e2.add_transition(19, e2)
-e2.add_transition(20, e2)
-e2.add_transition(21, e2)
-e2.add_transition(22, e2)
-e2.add_transition(23, e2)
-e2.add_transition(24, e2)
-e2.add_transition(25, e2)
-e2.add_transition(26, e2)
-e2.add_transition(27, e2)
-e2.add_transition(28, e2)
-e2.add_transition(29, e2)
-e2.add_transition(30, e2)
-e2.add_transition(31, e2)
-e2.add_transition(32, e2)
-e2.add_transition(33, e2)
-e2.add_transition(34, e3)
-e2.add_transition(35, e2)
-e2.add_transition(36, e2)
-e2.add_transition(37, e2)
-e2.add_transition(38, e2)
-e2.add_transition(39, e2)
-e2.add_transition(40, e2)
-e2.add_transition(41, e2)
-e2.add_transition(42, e2)
-e2.add_transition(43, e2)
-e2.add_transition(44, e2)
-e2.add_transition(45, e2)
-e2.add_transition(46, e2)
-e2.add_transition(47, e2)
-e2.add_transition(48, e2)
-e2.add_transition(49, e2)
-e2.add_transition(50, e2)
-e2.add_transition(51, e2)
-e2.add_transition(52, e2)
-e2.add_transition(53, e2)
-e2.add_transition(54, e2)
-e2.add_transition(55, e2)
-e2.add_transition(56, e2)
-e2.add_transition(57, e2)
-e2.add_transition(58, e2)
-e2.add_transition(59, e2)
-e2.add_transition(60, e2)
-e2.add_transition(61, e2)
-e2.add_transition(62, e2)
-e2.add_transition(63, e2)
-e2.add_transition(64, e2)
-e2.add_transition(65, e2)
-e2.add_transition(66, e2)
-e2.add_transition(67, e2)
-e2.add_transition(68, e2)
-e2.add_transition(69, e2)
-e2.add_transition(70, e2)
-e2.add_transition(71, e2)
-e2.add_transition(72, e2)
-e2.add_transition(73, e2)
-e2.add_transition(74, e2)
-e2.add_transition(75, e2)
-e2.add_transition(76, e2)
-e2.add_transition(77, e2)
-e2.add_transition(78, e2)
-e2.add_transition(79, e2)
-e2.add_transition(80, e2)
-e2.add_transition(81, e2)
-e2.add_transition(82, e2)
-e2.add_transition(83, e2)
-e2.add_transition(84, e2)
-e2.add_transition(85, e2)
-e2.add_transition(86, e2)
-e2.add_transition(87, e2)
-e2.add_transition(88, e2)
-e2.add_transition(89, e2)
-e2.add_transition(90, e2)
-e2.add_transition(91, e2)
-e2.add_transition(92, e2)
-e2.add_transition(93, e2)
-e2.add_transition(94, e2)
-e2.add_transition(95, e2)
-e2.add_transition(96, e2)
-e2.add_transition(98, e2)
-e2.add_transition(99, e2)
-e2.add_transition(100, e2)
-e2.add_transition(101, e2)
-e2.add_transition(102, e2)
-e2.add_transition(103, e2)
-e2.add_transition(104, e2)
-e2.add_transition(105, e2)
-e2.add_transition(106, e2)
-e2.add_transition(107, e2)
-e2.add_transition(108, e2)
-e2.add_transition(109, e2)
-e2.add_transition(110, e2)
-e2.add_transition(111, e2)
-e2.add_transition(112, e2)
-e2.add_transition(113, e2)
-e2.add_transition(114, e2)
-e2.add_transition(115, e2)
-e2.add_transition(116, e2)
-e2.add_transition(117, e2)
-e2.add_transition(118, e2)
-e2.add_transition(119, e2)
-e2.add_transition(120, e2)
-e2.add_transition(121, e2)
-e2.add_transition(122, e2)
-e2.add_transition(123, e2)
-e2.add_transition(124, e2)
-e2.add_transition(125, e2)
-e2.add_transition(126, e2)
-e2.add_transition(127, e2)
-e2.add_transition(128, e2)
-e2.add_transition(129, e2)
-e2.add_transition(130, e2)
-e2.add_transition(131, e2)
-e2.add_transition(132, e2)
-e2.add_transition(133, e2)
-e2.add_transition(134, e2)
-e2.add_transition(135, e2)
-e2.add_transition(136, e2)
-e2.add_transition(137, e2)
-e2.add_transition(138, e2)
-e2.add_transition(139, e2)
-e2.add_transition(140, e2)
-e2.add_transition(141, e2)
-e2.add_transition(142, e2)
-e2.add_transition(143, e2)
-e2.add_transition(144, e2)
-e2.add_transition(145, e2)
-e2.add_transition(146, e2)
-e2.add_transition(147, e2)
-e2.add_transition(148, e2)
-e2.add_transition(149, e2)
-e2.add_transition(150, e2)
-e2.add_transition(151, e2)
-e2.add_transition(152, e2)
-e2.add_transition(153, e2)
-e2.add_transition(154, e2)
-e2.add_transition(155, e2)
-e2.add_transition(156, e2)
-e2.add_transition(157, e2)
-e2.add_transition(158, e2)
-e2.add_transition(159, e2)
-e2.add_transition(160, e2)
-e2.add_transition(161, e2)
-e2.add_transition(162, e2)
-e2.add_transition(163, e2)
-e2.add_transition(164, e2)
-e2.add_transition(165, e2)
-e2.add_transition(166, e2)
-e2.add_transition(167, e2)
-e2.add_transition(168, e2)
-e2.add_transition(169, e2)
-e2.add_transition(170, e2)
-e2.add_transition(171, e2)
-e2.add_transition(172, e2)
-e2.add_transition(173, e2)
-e2.add_transition(174, e2)
-e2.add_transition(175, e2)
-e2.add_transition(176, e2)
-e2.add_transition(177, e2)
-e2.add_transition(178, e2)
-e2.add_transition(179, e2)
-e2.add_transition(180, e2)
-e2.add_transition(181, e2)
-e2.add_transition(182, e2)
-e2.add_transition(183, e2)
-e2.add_transition(184, e2)
-e2.add_transition(185, e2)
-e2.add_transition(186, e2)
-e2.add_transition(187, e2)
-e2.add_transition(188, e2)
-e2.add_transition(189, e2)
-e2.add_transition(190, e2)
-e2.add_transition(191, e2)
-e2.add_transition(192, e2)
-e2.add_transition(193, e2)
-e2.add_transition(194, e2)
-e2.add_transition(195, e2)
-e2.add_transition(196, e2)
-e2.add_transition(197, e2)
-e2.add_transition(198, e2)
-e2.add_transition(199, e2)
-e2.add_transition(200, e2)
-e2.add_transition(201, e2)
-e2.add_transition(202, e2)
-e2.add_transition(203, e2)
-e2.add_transition(204, e2)
-e2.add_transition(205, e2)
-e2.add_transition(206, e2)
-e2.add_transition(207, e2)
-e2.add_transition(208, e2)
-e2.add_transition(209, e2)
-e2.add_transition(210, e2)
-e2.add_transition(211, e2)
-e2.add_transition(212, e2)
-e2.add_transition(213, e2)
-e2.add_transition(214, e2)
-e2.add_transition(215, e2)
-e2.add_transition(216, e2)
-e2.add_transition(217, e2)
-e2.add_transition(218, e2)
-e2.add_transition(219, e2)
-e2.add_transition(220, e2)
-e2.add_transition(221, e2)
-e2.add_transition(222, e2)
-e2.add_transition(223, e2)
-e2.add_transition(224, e2)
-e2.add_transition(225, e2)
-e2.add_transition(226, e2)
-e2.add_transition(227, e2)
-e2.add_transition(228, e2)
-e2.add_transition(229, e2)
-e2.add_transition(230, e2)
-e2.add_transition(231, e2)
-e2.add_transition(232, e2)
-e2.add_transition(233, e2)
-e2.add_transition(234, e2)
-e2.add_transition(235, e2)
-e2.add_transition(236, e2)
-e2.add_transition(237, e2)
-e2.add_transition(238, e2)
-e2.add_transition(239, e2)
-e2.add_transition(240, e2)
-e2.add_transition(241, e2)
-e2.add_transition(242, e2)
-e2.add_transition(243, e2)
-e2.add_transition(244, e2)
-e2.add_transition(245, e2)
-e2.add_transition(246, e2)
-e2.add_transition(247, e2)
-e2.add_transition(248, e2)
-e2.add_transition(249, e2)
-e2.add_transition(250, e2)
-e2.add_transition(251, e2)
-e2.add_transition(252, e2)
-e2.add_transition(253, e2)
-e2.add_transition(254, e2)
-e2.add_transition(255, e2)
-
-e3.isFinalState = True
-e3.addToken( 'GROUP')
-e3.add_transition(0, e2)
-e3.add_transition(1, e2)
-e3.add_transition(2, e2)
-e3.add_transition(3, e2)
-e3.add_transition(4, e2)
-e3.add_transition(5, e2)
-e3.add_transition(6, e2)
-e3.add_transition(7, e2)
-e3.add_transition(8, e2)
-e3.add_transition(9, e2)
-e3.add_transition(10, e2)
-e3.add_transition(11, e2)
-e3.add_transition(12, e2)
-e3.add_transition(13, e2)
-e3.add_transition(14, e2)
-e3.add_transition(15, e2)
-e3.add_transition(16, e2)
-e3.add_transition(17, e2)
-e3.add_transition(18, e2)
-e3.add_transition(19, e2)
-e3.add_transition(20, e2)
-e3.add_transition(21, e2)
-e3.add_transition(22, e2)
-e3.add_transition(23, e2)
-e3.add_transition(24, e2)
-e3.add_transition(25, e2)
-e3.add_transition(26, e2)
-e3.add_transition(27, e2)
-e3.add_transition(28, e2)
-e3.add_transition(29, e2)
-e3.add_transition(30, e2)
-e3.add_transition(31, e2)
-e3.add_transition(32, e2)
-e3.add_transition(33, e2)
-e3.add_transition(34, e3)
-e3.add_transition(35, e2)
-e3.add_transition(36, e2)
-e3.add_transition(37, e2)
-e3.add_transition(38, e2)
-e3.add_transition(39, e2)
-e3.add_transition(40, e2)
-e3.add_transition(41, e2)
-e3.add_transition(42, e2)
-e3.add_transition(43, e2)
-e3.add_transition(44, e2)
-e3.add_transition(45, e2)
-e3.add_transition(46, e2)
-e3.add_transition(47, e2)
-e3.add_transition(48, e2)
-e3.add_transition(49, e2)
-e3.add_transition(50, e2)
-e3.add_transition(51, e2)
-e3.add_transition(52, e2)
-e3.add_transition(53, e2)
-e3.add_transition(54, e2)
-e3.add_transition(55, e2)
-e3.add_transition(56, e2)
-e3.add_transition(57, e2)
-e3.add_transition(58, e2)
-e3.add_transition(59, e2)
-e3.add_transition(60, e2)
-e3.add_transition(61, e2)
-e3.add_transition(62, e2)
-e3.add_transition(63, e2)
-e3.add_transition(64, e2)
-e3.add_transition(65, e2)
-e3.add_transition(66, e2)
-e3.add_transition(67, e2)
-e3.add_transition(68, e2)
-e3.add_transition(69, e2)
-e3.add_transition(70, e2)
-e3.add_transition(71, e2)
-e3.add_transition(72, e2)
-e3.add_transition(73, e2)
-e3.add_transition(74, e2)
-e3.add_transition(75, e2)
-e3.add_transition(76, e2)
-e3.add_transition(77, e2)
-e3.add_transition(78, e2)
-e3.add_transition(79, e2)
-e3.add_transition(80, e2)
-e3.add_transition(81, e2)
-e3.add_transition(82, e2)
-e3.add_transition(83, e2)
-e3.add_transition(84, e2)
-e3.add_transition(85, e2)
-e3.add_transition(86, e2)
-e3.add_transition(87, e2)
-e3.add_transition(88, e2)
-e3.add_transition(89, e2)
-e3.add_transition(90, e2)
-e3.add_transition(91, e2)
-e3.add_transition(92, e2)
-e3.add_transition(93, e2)
-e3.add_transition(94, e2)
-e3.add_transition(95, e2)
-e3.add_transition(96, e2)
-e3.add_transition(98, e2)
-e3.add_transition(99, e2)
-e3.add_transition(100, e2)
-e3.add_transition(101, e2)
-e3.add_transition(102, e2)
-e3.add_transition(103, e2)
-e3.add_transition(104, e2)
-e3.add_transition(105, e2)
-e3.add_transition(106, e2)
-e3.add_transition(107, e2)
-e3.add_transition(108, e2)
-e3.add_transition(109, e2)
-e3.add_transition(110, e2)
-e3.add_transition(111, e2)
-e3.add_transition(112, e2)
-e3.add_transition(113, e2)
-e3.add_transition(114, e2)
-e3.add_transition(115, e2)
-e3.add_transition(116, e2)
-e3.add_transition(117, e2)
-e3.add_transition(118, e2)
-e3.add_transition(119, e2)
-e3.add_transition(120, e2)
-e3.add_transition(121, e2)
-e3.add_transition(122, e2)
-e3.add_transition(123, e2)
-e3.add_transition(124, e2)
-e3.add_transition(125, e2)
-e3.add_transition(126, e2)
-e3.add_transition(127, e2)
-e3.add_transition(128, e2)
-e3.add_transition(129, e2)
-e3.add_transition(130, e2)
-e3.add_transition(131, e2)
-e3.add_transition(132, e2)
-e3.add_transition(133, e2)
-e3.add_transition(134, e2)
-e3.add_transition(135, e2)
-e3.add_transition(136, e2)
-e3.add_transition(137, e2)
-e3.add_transition(138, e2)
-e3.add_transition(139, e2)
-e3.add_transition(140, e2)
-e3.add_transition(141, e2)
-e3.add_transition(142, e2)
-e3.add_transition(143, e2)
-e3.add_transition(144, e2)
-e3.add_transition(145, e2)
-e3.add_transition(146, e2)
-e3.add_transition(147, e2)
-e3.add_transition(148, e2)
-e3.add_transition(149, e2)
-e3.add_transition(150, e2)
-e3.add_transition(151, e2)
-e3.add_transition(152, e2)
-e3.add_transition(153, e2)
-e3.add_transition(154, e2)
-e3.add_transition(155, e2)
-e3.add_transition(156, e2)
-e3.add_transition(157, e2)
-e3.add_transition(158, e2)
-e3.add_transition(159, e2)
-e3.add_transition(160, e2)
-e3.add_transition(161, e2)
-e3.add_transition(162, e2)
-e3.add_transition(163, e2)
-e3.add_transition(164, e2)
-e3.add_transition(165, e2)
-e3.add_transition(166, e2)
-e3.add_transition(167, e2)
-e3.add_transition(168, e2)
-e3.add_transition(169, e2)
-e3.add_transition(170, e2)
-e3.add_transition(171, e2)
-e3.add_transition(172, e2)
-e3.add_transition(173, e2)
-e3.add_transition(174, e2)
-e3.add_transition(175, e2)
-e3.add_transition(176, e2)
-e3.add_transition(177, e2)
-e3.add_transition(178, e2)
-e3.add_transition(179, e2)
-e3.add_transition(180, e2)
-e3.add_transition(181, e2)
-e3.add_transition(182, e2)
-e3.add_transition(183, e2)
-e3.add_transition(184, e2)
-e3.add_transition(185, e2)
-e3.add_transition(186, e2)
-e3.add_transition(187, e2)
-e3.add_transition(188, e2)
-e3.add_transition(189, e2)
-e3.add_transition(190, e2)
-e3.add_transition(191, e2)
-e3.add_transition(192, e2)
-e3.add_transition(193, e2)
-e3.add_transition(194, e2)
-e3.add_transition(195, e2)
-e3.add_transition(196, e2)
-e3.add_transition(197, e2)
-e3.add_transition(198, e2)
-e3.add_transition(199, e2)
-e3.add_transition(200, e2)
-e3.add_transition(201, e2)
-e3.add_transition(202, e2)
-e3.add_transition(203, e2)
-e3.add_transition(204, e2)
-e3.add_transition(205, e2)
-e3.add_transition(206, e2)
-e3.add_transition(207, e2)
-e3.add_transition(208, e2)
-e3.add_transition(209, e2)
-e3.add_transition(210, e2)
-e3.add_transition(211, e2)
-e3.add_transition(212, e2)
-e3.add_transition(213, e2)
-e3.add_transition(214, e2)
-e3.add_transition(215, e2)
-e3.add_transition(216, e2)
-e3.add_transition(217, e2)
-e3.add_transition(218, e2)
-e3.add_transition(219, e2)
-e3.add_transition(220, e2)
-e3.add_transition(221, e2)
-e3.add_transition(222, e2)
-e3.add_transition(223, e2)
-e3.add_transition(224, e2)
-e3.add_transition(225, e2)
-e3.add_transition(226, e2)
-e3.add_transition(227, e2)
-e3.add_transition(228, e2)
-e3.add_transition(229, e2)
-e3.add_transition(230, e2)
-e3.add_transition(231, e2)
-e3.add_transition(232, e2)
-e3.add_transition(233, e2)
-e3.add_transition(234, e2)
-e3.add_transition(235, e2)
-e3.add_transition(236, e2)
-e3.add_transition(237, e2)
-e3.add_transition(238, e2)
-e3.add_transition(239, e2)
-e3.add_transition(240, e2)
-e3.add_transition(241, e2)
-e3.add_transition(242, e2)
-e3.add_transition(243, e2)
-e3.add_transition(244, e2)
-e3.add_transition(245, e2)
-e3.add_transition(246, e2)
-e3.add_transition(247, e2)
-e3.add_transition(248, e2)
-e3.add_transition(249, e2)
-e3.add_transition(250, e2)
-e3.add_transition(251, e2)
-e3.add_transition(252, e2)
-e3.add_transition(253, e2)
-e3.add_transition(254, e2)
-e3.add_transition(255, e2)
-
@@ -1,2945 +0,0 @@
-from Machines_gen_usage.Classes_ import State
-
-e7 = State('e7')
-e13 = State('e13')
-e8 = State('e8')
-e3 = State('e3')
-e11 = State('e11')
-e14 = State('e14')
-e1 = State('e1')
-e12 = State('e12')
-e15 = State('e15')
-e10 = State('e10')
-e5 = State('e5')
-e9 = State('e9')
-e4 = State('e4')
-e6 = State('e6')
-e2 = State('e2')
-d3 = State('d3')
-d2 = State('d2')
-d1 = State('d1')
-c4 = State('c4')
-c3 = State('c3')
-c2 = State('c2')
-c1 = State('c1')
-b8 = State('b8')
-b7 = State('b7')
-b6 = State('b6')
-b5 = State('b5')
-b4 = State('b4')
-b3 = State('b3')
-b2 = State('b2')
-b1 = State('b1')
-a8 = State('a8')
-a7 = State('a7')
-a6 = State('a6')
-a5 = State('a5')
-a4 = State('a4')
-a3 = State('a3')
-a2 = State('a2')
-a1 = State('a1')
-a0 = State('a0')
-a0.add_transition(37, a1)
-a0.add_transition(73, b1)
-a0.add_transition(97, c1)
-a0.add_transition(98, c1)
-a0.add_transition(99, c1)
-a0.add_transition(100, c1)
-a0.add_transition(101, c1)
-a0.add_transition(102, c1)
-a0.add_transition(103, c1)
-a0.add_transition(104, c1)
-a0.add_transition(105, c1)
-a0.add_transition(106, c1)
-a0.add_transition(107, c1)
-a0.add_transition(108, c1)
-a0.add_transition(109, c1)
-a0.add_transition(110, c1)
-a0.add_transition(111, c1)
-a0.add_transition(112, c1)
-a0.add_transition(113, c1)
-a0.add_transition(114, c1)
-a0.add_transition(115, c1)
-a0.add_transition(116, c1)
-a0.add_transition(117, c1)
-a0.add_transition(118, c1)
-a0.add_transition(119, c1)
-a0.add_transition(120, c1)
-a0.add_transition(121, c1)
-a0.add_transition(122, c1)
-a0.add_transition(47, d1)
-a0.add_transition(47, e2)
-
-a1.add_transition(116, a2)
-
-a2.add_transition(111, a3)
-
-a3.add_transition(107, a4)
-
-a4.add_transition(101, a5)
-
-a5.add_transition(110, a6)
-
-a6.add_transition(32, a7)
-
-a7.add_transition(32, a8)
-a7.add_transition(65, a8)
-a7.add_transition(66, a8)
-a7.add_transition(67, a8)
-a7.add_transition(68, a8)
-a7.add_transition(69, a8)
-a7.add_transition(70, a8)
-a7.add_transition(71, a8)
-a7.add_transition(72, a8)
-a7.add_transition(73, a8)
-a7.add_transition(74, a8)
-a7.add_transition(75, a8)
-a7.add_transition(76, a8)
-a7.add_transition(77, a8)
-a7.add_transition(78, a8)
-a7.add_transition(79, a8)
-a7.add_transition(80, a8)
-a7.add_transition(81, a8)
-a7.add_transition(82, a8)
-a7.add_transition(83, a8)
-a7.add_transition(84, a8)
-a7.add_transition(85, a8)
-a7.add_transition(86, a8)
-a7.add_transition(87, a8)
-a7.add_transition(88, a8)
-a7.add_transition(89, a8)
-a7.add_transition(90, a8)
-
-a8.isFinalState = True
-a8.addToken( 'TK_SECTION')
-a8.add_transition(32, a8)
-a8.add_transition(65, a8)
-a8.add_transition(66, a8)
-a8.add_transition(67, a8)
-a8.add_transition(68, a8)
-a8.add_transition(69, a8)
-a8.add_transition(70, a8)
-a8.add_transition(71, a8)
-a8.add_transition(72, a8)
-a8.add_transition(73, a8)
-a8.add_transition(74, a8)
-a8.add_transition(75, a8)
-a8.add_transition(76, a8)
-a8.add_transition(77, a8)
-a8.add_transition(78, a8)
-a8.add_transition(79, a8)
-a8.add_transition(80, a8)
-a8.add_transition(81, a8)
-a8.add_transition(82, a8)
-a8.add_transition(83, a8)
-a8.add_transition(84, a8)
-a8.add_transition(85, a8)
-a8.add_transition(86, a8)
-a8.add_transition(87, a8)
-a8.add_transition(88, a8)
-a8.add_transition(89, a8)
-a8.add_transition(90, a8)
-
-b1.add_transition(71, b2)
-
-b2.add_transition(78, b3)
-
-b3.add_transition(79, b4)
-
-b4.add_transition(82, b5)
-
-b5.add_transition(69, b6)
-
-b6.add_transition(32, b7)
-
-b7.add_transition(32, b8)
-b7.add_transition(65, b8)
-b7.add_transition(66, b8)
-b7.add_transition(67, b8)
-b7.add_transition(68, b8)
-b7.add_transition(69, b8)
-b7.add_transition(70, b8)
-b7.add_transition(71, b8)
-b7.add_transition(72, b8)
-b7.add_transition(73, b8)
-b7.add_transition(74, b8)
-b7.add_transition(75, b8)
-b7.add_transition(76, b8)
-b7.add_transition(77, b8)
-b7.add_transition(78, b8)
-b7.add_transition(79, b8)
-b7.add_transition(80, b8)
-b7.add_transition(81, b8)
-b7.add_transition(82, b8)
-b7.add_transition(83, b8)
-b7.add_transition(84, b8)
-b7.add_transition(85, b8)
-b7.add_transition(86, b8)
-b7.add_transition(87, b8)
-b7.add_transition(88, b8)
-b7.add_transition(89, b8)
-b7.add_transition(90, b8)
-
-b8.isFinalState = True
-b8.addToken( 'TK_SECTION')
-b8.add_transition(32, b8)
-b8.add_transition(65, b8)
-b8.add_transition(66, b8)
-b8.add_transition(67, b8)
-b8.add_transition(68, b8)
-b8.add_transition(69, b8)
-b8.add_transition(70, b8)
-b8.add_transition(71, b8)
-b8.add_transition(72, b8)
-b8.add_transition(73, b8)
-b8.add_transition(74, b8)
-b8.add_transition(75, b8)
-b8.add_transition(76, b8)
-b8.add_transition(77, b8)
-b8.add_transition(78, b8)
-b8.add_transition(79, b8)
-b8.add_transition(80, b8)
-b8.add_transition(81, b8)
-b8.add_transition(82, b8)
-b8.add_transition(83, b8)
-b8.add_transition(84, b8)
-b8.add_transition(85, b8)
-b8.add_transition(86, b8)
-b8.add_transition(87, b8)
-b8.add_transition(88, b8)
-b8.add_transition(89, b8)
-b8.add_transition(90, b8)
-
-c1.add_transition(58, c2)
-c1.add_transition(97, c1)
-c1.add_transition(98, c1)
-c1.add_transition(99, c1)
-c1.add_transition(100, c1)
-c1.add_transition(101, c1)
-c1.add_transition(102, c1)
-c1.add_transition(103, c1)
-c1.add_transition(104, c1)
-c1.add_transition(105, c1)
-c1.add_transition(106, c1)
-c1.add_transition(107, c1)
-c1.add_transition(108, c1)
-c1.add_transition(109, c1)
-c1.add_transition(110, c1)
-c1.add_transition(111, c1)
-c1.add_transition(112, c1)
-c1.add_transition(113, c1)
-c1.add_transition(114, c1)
-c1.add_transition(115, c1)
-c1.add_transition(116, c1)
-c1.add_transition(117, c1)
-c1.add_transition(118, c1)
-c1.add_transition(119, c1)
-c1.add_transition(120, c1)
-c1.add_transition(121, c1)
-c1.add_transition(122, c1)
-
-c2.add_transition(10, c3)
-c2.add_transition(32, c3)
-c2.add_transition(65, c3)
-c2.add_transition(66, c3)
-c2.add_transition(67, c3)
-c2.add_transition(68, c3)
-c2.add_transition(69, c3)
-c2.add_transition(70, c3)
-c2.add_transition(71, c3)
-c2.add_transition(72, c3)
-c2.add_transition(73, c3)
-c2.add_transition(74, c3)
-c2.add_transition(75, c3)
-c2.add_transition(76, c3)
-c2.add_transition(77, c3)
-c2.add_transition(78, c3)
-c2.add_transition(79, c3)
-c2.add_transition(80, c3)
-c2.add_transition(81, c3)
-c2.add_transition(82, c3)
-c2.add_transition(83, c3)
-c2.add_transition(84, c3)
-c2.add_transition(85, c3)
-c2.add_transition(86, c3)
-c2.add_transition(87, c3)
-c2.add_transition(88, c3)
-c2.add_transition(89, c3)
-c2.add_transition(90, c3)
-c2.add_transition(97, c3)
-c2.add_transition(98, c3)
-c2.add_transition(99, c3)
-c2.add_transition(100, c3)
-c2.add_transition(101, c3)
-c2.add_transition(102, c3)
-c2.add_transition(103, c3)
-c2.add_transition(104, c3)
-c2.add_transition(105, c3)
-c2.add_transition(106, c3)
-c2.add_transition(107, c3)
-c2.add_transition(108, c3)
-c2.add_transition(109, c3)
-c2.add_transition(110, c3)
-c2.add_transition(111, c3)
-c2.add_transition(112, c3)
-c2.add_transition(113, c3)
-c2.add_transition(114, c3)
-c2.add_transition(115, c3)
-c2.add_transition(116, c3)
-c2.add_transition(117, c3)
-c2.add_transition(118, c3)
-c2.add_transition(119, c3)
-c2.add_transition(120, c3)
-c2.add_transition(121, c3)
-c2.add_transition(122, c3)
-c2.add_transition(124, c3)
-
-c3.add_transition(10, c3)
-c3.add_transition(32, c3)
-c3.add_transition(59, c4)
-c3.add_transition(65, c3)
-c3.add_transition(66, c3)
-c3.add_transition(67, c3)
-c3.add_transition(68, c3)
-c3.add_transition(69, c3)
-c3.add_transition(70, c3)
-c3.add_transition(71, c3)
-c3.add_transition(72, c3)
-c3.add_transition(73, c3)
-c3.add_transition(74, c3)
-c3.add_transition(75, c3)
-c3.add_transition(76, c3)
-c3.add_transition(77, c3)
-c3.add_transition(78, c3)
-c3.add_transition(79, c3)
-c3.add_transition(80, c3)
-c3.add_transition(81, c3)
-c3.add_transition(82, c3)
-c3.add_transition(83, c3)
-c3.add_transition(84, c3)
-c3.add_transition(85, c3)
-c3.add_transition(86, c3)
-c3.add_transition(87, c3)
-c3.add_transition(88, c3)
-c3.add_transition(89, c3)
-c3.add_transition(90, c3)
-c3.add_transition(97, c3)
-c3.add_transition(98, c3)
-c3.add_transition(99, c3)
-c3.add_transition(100, c3)
-c3.add_transition(101, c3)
-c3.add_transition(102, c3)
-c3.add_transition(103, c3)
-c3.add_transition(104, c3)
-c3.add_transition(105, c3)
-c3.add_transition(106, c3)
-c3.add_transition(107, c3)
-c3.add_transition(108, c3)
-c3.add_transition(109, c3)
-c3.add_transition(110, c3)
-c3.add_transition(111, c3)
-c3.add_transition(112, c3)
-c3.add_transition(113, c3)
-c3.add_transition(114, c3)
-c3.add_transition(115, c3)
-c3.add_transition(116, c3)
-c3.add_transition(117, c3)
-c3.add_transition(118, c3)
-c3.add_transition(119, c3)
-c3.add_transition(120, c3)
-c3.add_transition(121, c3)
-c3.add_transition(122, c3)
-c3.add_transition(124, c3)
-
-c4.isFinalState = True
-c4.addToken( 'PRODUCTION')
-
-d1.add_transition(47, d2)
-
-d2.add_transition(10, d3)
-d2.add_transition(46, d2)
-
-d3.isFinalState = True
-d3.addToken( 'COMMENT')
-
-e2.add_transition(42, e6)
-
-e6.add_transition(0, e4)
-e6.add_transition(1, e4)
-e6.add_transition(2, e4)
-e6.add_transition(3, e4)
-e6.add_transition(4, e4)
-e6.add_transition(5, e4)
-e6.add_transition(6, e4)
-e6.add_transition(7, e4)
-e6.add_transition(8, e4)
-e6.add_transition(9, e4)
-e6.add_transition(10, e4)
-e6.add_transition(11, e4)
-e6.add_transition(12, e4)
-e6.add_transition(13, e4)
-e6.add_transition(14, e4)
-e6.add_transition(15, e4)
-e6.add_transition(16, e4)
-e6.add_transition(17, e4)
-e6.add_transition(18, e4)
-e6.add_transition(19, e4)
-e6.add_transition(20, e4)
-e6.add_transition(21, e4)
-e6.add_transition(22, e4)
-e6.add_transition(23, e4)
-e6.add_transition(24, e4)
-e6.add_transition(25, e4)
-e6.add_transition(26, e4)
-e6.add_transition(27, e4)
-e6.add_transition(28, e4)
-e6.add_transition(29, e4)
-e6.add_transition(30, e4)
-e6.add_transition(31, e4)
-e6.add_transition(32, e4)
-e6.add_transition(33, e4)
-e6.add_transition(34, e4)
-e6.add_transition(35, e4)
-e6.add_transition(36, e4)
-e6.add_transition(37, e4)
-e6.add_transition(38, e4)
-e6.add_transition(39, e4)
-e6.add_transition(40, e4)
-e6.add_transition(41, e4)
-e6.add_transition(42, e8)
-e6.add_transition(43, e4)
-e6.add_transition(44, e4)
-e6.add_transition(45, e4)
-e6.add_transition(46, e4)
-e6.add_transition(47, e1)
-e6.add_transition(48, e4)
-e6.add_transition(49, e4)
-e6.add_transition(50, e4)
-e6.add_transition(51, e4)
-e6.add_transition(52, e4)
-e6.add_transition(53, e4)
-e6.add_transition(54, e4)
-e6.add_transition(55, e4)
-e6.add_transition(56, e4)
-e6.add_transition(57, e4)
-e6.add_transition(58, e4)
-e6.add_transition(59, e4)
-e6.add_transition(60, e4)
-e6.add_transition(61, e4)
-e6.add_transition(62, e4)
-e6.add_transition(63, e4)
-e6.add_transition(64, e4)
-e6.add_transition(65, e4)
-e6.add_transition(66, e4)
-e6.add_transition(67, e4)
-e6.add_transition(68, e4)
-e6.add_transition(69, e4)
-e6.add_transition(70, e4)
-e6.add_transition(71, e4)
-e6.add_transition(72, e4)
-e6.add_transition(73, e4)
-e6.add_transition(74, e4)
-e6.add_transition(75, e4)
-e6.add_transition(76, e4)
-e6.add_transition(77, e4)
-e6.add_transition(78, e4)
-e6.add_transition(79, e4)
-e6.add_transition(80, e4)
-e6.add_transition(81, e4)
-e6.add_transition(82, e4)
-e6.add_transition(83, e4)
-e6.add_transition(84, e4)
-e6.add_transition(85, e4)
-e6.add_transition(86, e4)
-e6.add_transition(87, e4)
-e6.add_transition(88, e4)
-e6.add_transition(89, e4)
-e6.add_transition(90, e4)
-e6.add_transition(91, e4)
-e6.add_transition(92, e4)
-e6.add_transition(93, e4)
-e6.add_transition(94, e4)
-e6.add_transition(95, e4)
-e6.add_transition(96, e4)
-e6.add_transition(97, e4)
-e6.add_transition(98, e4)
-e6.add_transition(99, e4)
-e6.add_transition(100, e4)
-e6.add_transition(101, e4)
-e6.add_transition(102, e4)
-e6.add_transition(103, e4)
-e6.add_transition(104, e4)
-e6.add_transition(105, e4)
-e6.add_transition(106, e4)
-e6.add_transition(107, e4)
-e6.add_transition(108, e4)
-e6.add_transition(109, e4)
-e6.add_transition(110, e4)
-e6.add_transition(111, e4)
-e6.add_transition(112, e4)
-e6.add_transition(113, e4)
-e6.add_transition(114, e4)
-e6.add_transition(115, e4)
-e6.add_transition(116, e4)
-e6.add_transition(117, e4)
-e6.add_transition(118, e4)
-e6.add_transition(119, e4)
-e6.add_transition(120, e4)
-e6.add_transition(121, e4)
-e6.add_transition(122, e4)
-e6.add_transition(123, e4)
-e6.add_transition(124, e4)
-e6.add_transition(125, e4)
-e6.add_transition(126, e4)
-e6.add_transition(127, e4)
-e6.add_transition(128, e4)
-e6.add_transition(129, e4)
-e6.add_transition(130, e4)
-e6.add_transition(131, e4)
-e6.add_transition(132, e4)
-e6.add_transition(133, e4)
-e6.add_transition(134, e4)
-e6.add_transition(135, e4)
-e6.add_transition(136, e4)
-e6.add_transition(137, e4)
-e6.add_transition(138, e4)
-e6.add_transition(139, e4)
-e6.add_transition(140, e4)
-e6.add_transition(141, e4)
-e6.add_transition(142, e4)
-e6.add_transition(143, e4)
-e6.add_transition(144, e4)
-e6.add_transition(145, e4)
-e6.add_transition(146, e4)
-e6.add_transition(147, e4)
-e6.add_transition(148, e4)
-e6.add_transition(149, e4)
-e6.add_transition(150, e4)
-e6.add_transition(151, e4)
-e6.add_transition(152, e4)
-e6.add_transition(153, e4)
-e6.add_transition(154, e4)
-e6.add_transition(155, e4)
-e6.add_transition(156, e4)
-e6.add_transition(157, e4)
-e6.add_transition(158, e4)
-e6.add_transition(159, e4)
-e6.add_transition(160, e4)
-e6.add_transition(161, e4)
-e6.add_transition(162, e4)
-e6.add_transition(163, e4)
-e6.add_transition(164, e4)
-e6.add_transition(165, e4)
-e6.add_transition(166, e4)
-e6.add_transition(167, e4)
-e6.add_transition(168, e4)
-e6.add_transition(169, e4)
-e6.add_transition(170, e4)
-e6.add_transition(171, e4)
-e6.add_transition(172, e4)
-e6.add_transition(173, e4)
-e6.add_transition(174, e4)
-e6.add_transition(175, e4)
-e6.add_transition(176, e4)
-e6.add_transition(177, e4)
-e6.add_transition(178, e4)
-e6.add_transition(179, e4)
-e6.add_transition(180, e4)
-e6.add_transition(181, e4)
-e6.add_transition(182, e4)
-e6.add_transition(183, e4)
-e6.add_transition(184, e4)
-e6.add_transition(185, e4)
-e6.add_transition(186, e4)
-e6.add_transition(187, e4)
-e6.add_transition(188, e4)
-e6.add_transition(189, e4)
-e6.add_transition(190, e4)
-e6.add_transition(191, e4)
-e6.add_transition(192, e4)
-e6.add_transition(193, e4)
-e6.add_transition(194, e4)
-e6.add_transition(195, e4)
-e6.add_transition(196, e4)
-e6.add_transition(197, e4)
-e6.add_transition(198, e4)
-e6.add_transition(199, e4)
-e6.add_transition(200, e4)
-e6.add_transition(201, e4)
-e6.add_transition(202, e4)
-e6.add_transition(203, e4)
-e6.add_transition(204, e4)
-e6.add_transition(205, e4)
-e6.add_transition(206, e4)
-e6.add_transition(207, e4)
-e6.add_transition(208, e4)
-e6.add_transition(209, e4)
-e6.add_transition(210, e4)
-e6.add_transition(211, e4)
-e6.add_transition(212, e4)
-e6.add_transition(213, e4)
-e6.add_transition(214, e4)
-e6.add_transition(215, e4)
-e6.add_transition(216, e4)
-e6.add_transition(217, e4)
-e6.add_transition(218, e4)
-e6.add_transition(219, e4)
-e6.add_transition(220, e4)
-e6.add_transition(221, e4)
-e6.add_transition(222, e4)
-e6.add_transition(223, e4)
-e6.add_transition(224, e4)
-e6.add_transition(225, e4)
-e6.add_transition(226, e4)
-e6.add_transition(227, e4)
-e6.add_transition(228, e4)
-e6.add_transition(229, e4)
-e6.add_transition(230, e4)
-e6.add_transition(231, e4)
-e6.add_transition(232, e4)
-e6.add_transition(233, e4)
-e6.add_transition(234, e4)
-e6.add_transition(235, e4)
-e6.add_transition(236, e4)
-e6.add_transition(237, e4)
-e6.add_transition(238, e4)
-e6.add_transition(239, e4)
-e6.add_transition(240, e4)
-e6.add_transition(241, e4)
-e6.add_transition(242, e4)
-e6.add_transition(243, e4)
-e6.add_transition(244, e4)
-e6.add_transition(245, e4)
-e6.add_transition(246, e4)
-e6.add_transition(247, e4)
-e6.add_transition(248, e4)
-e6.add_transition(249, e4)
-e6.add_transition(250, e4)
-e6.add_transition(251, e4)
-e6.add_transition(252, e4)
-e6.add_transition(253, e4)
-e6.add_transition(254, e4)
-e6.add_transition(255, e4)
-
-e4.add_transition(0, e4)
-e4.add_transition(1, e4)
-e4.add_transition(2, e4)
-e4.add_transition(3, e4)
-e4.add_transition(4, e4)
-e4.add_transition(5, e4)
-e4.add_transition(6, e4)
-e4.add_transition(7, e4)
-e4.add_transition(8, e4)
-e4.add_transition(9, e4)
-e4.add_transition(10, e4)
-e4.add_transition(11, e4)
-e4.add_transition(12, e4)
-e4.add_transition(13, e4)
-e4.add_transition(14, e4)
-e4.add_transition(15, e4)
-e4.add_transition(16, e4)
-e4.add_transition(17, e4)
-e4.add_transition(18, e4)
-e4.add_transition(19, e4)
-e4.add_transition(20, e4)
-e4.add_transition(21, e4)
-e4.add_transition(22, e4)
-e4.add_transition(23, e4)
-e4.add_transition(24, e4)
-e4.add_transition(25, e4)
-e4.add_transition(26, e4)
-e4.add_transition(27, e4)
-e4.add_transition(28, e4)
-e4.add_transition(29, e4)
-e4.add_transition(30, e4)
-e4.add_transition(31, e4)
-e4.add_transition(32, e4)
-e4.add_transition(33, e4)
-e4.add_transition(34, e4)
-e4.add_transition(35, e4)
-e4.add_transition(36, e4)
-e4.add_transition(37, e4)
-e4.add_transition(38, e4)
-e4.add_transition(39, e4)
-e4.add_transition(40, e4)
-e4.add_transition(41, e4)
-e4.add_transition(42, e9)
-e4.add_transition(43, e4)
-e4.add_transition(44, e4)
-e4.add_transition(45, e4)
-e4.add_transition(46, e4)
-e4.add_transition(47, e11)
-e4.add_transition(48, e4)
-e4.add_transition(49, e4)
-e4.add_transition(50, e4)
-e4.add_transition(51, e4)
-e4.add_transition(52, e4)
-e4.add_transition(53, e4)
-e4.add_transition(54, e4)
-e4.add_transition(55, e4)
-e4.add_transition(56, e4)
-e4.add_transition(57, e4)
-e4.add_transition(58, e4)
-e4.add_transition(59, e4)
-e4.add_transition(60, e4)
-e4.add_transition(61, e4)
-e4.add_transition(62, e4)
-e4.add_transition(63, e4)
-e4.add_transition(64, e4)
-e4.add_transition(65, e4)
-e4.add_transition(66, e4)
-e4.add_transition(67, e4)
-e4.add_transition(68, e4)
-e4.add_transition(69, e4)
-e4.add_transition(70, e4)
-e4.add_transition(71, e4)
-e4.add_transition(72, e4)
-e4.add_transition(73, e4)
-e4.add_transition(74, e4)
-e4.add_transition(75, e4)
-e4.add_transition(76, e4)
-e4.add_transition(77, e4)
-e4.add_transition(78, e4)
-e4.add_transition(79, e4)
-e4.add_transition(80, e4)
-e4.add_transition(81, e4)
-e4.add_transition(82, e4)
-e4.add_transition(83, e4)
-e4.add_transition(84, e4)
-e4.add_transition(85, e4)
-e4.add_transition(86, e4)
-e4.add_transition(87, e4)
-e4.add_transition(88, e4)
-e4.add_transition(89, e4)
-e4.add_transition(90, e4)
-e4.add_transition(91, e4)
-e4.add_transition(92, e4)
-e4.add_transition(93, e4)
-e4.add_transition(94, e4)
-e4.add_transition(95, e4)
-e4.add_transition(96, e4)
-e4.add_transition(97, e4)
-e4.add_transition(98, e4)
-e4.add_transition(99, e4)
-e4.add_transition(100, e4)
-e4.add_transition(101, e4)
-e4.add_transition(102, e4)
-e4.add_transition(103, e4)
-e4.add_transition(104, e4)
-e4.add_transition(105, e4)
-e4.add_transition(106, e4)
-e4.add_transition(107, e4)
-e4.add_transition(108, e4)
-e4.add_transition(109, e4)
-e4.add_transition(110, e4)
-e4.add_transition(111, e4)
-e4.add_transition(112, e4)
-e4.add_transition(113, e4)
-e4.add_transition(114, e4)
-e4.add_transition(115, e4)
-e4.add_transition(116, e4)
-e4.add_transition(117, e4)
-e4.add_transition(118, e4)
-e4.add_transition(119, e4)
-e4.add_transition(120, e4)
-e4.add_transition(121, e4)
-e4.add_transition(122, e4)
-e4.add_transition(123, e4)
-e4.add_transition(124, e4)
-e4.add_transition(125, e4)
-e4.add_transition(126, e4)
-e4.add_transition(127, e4)
-e4.add_transition(128, e4)
-e4.add_transition(129, e4)
-e4.add_transition(130, e4)
-e4.add_transition(131, e4)
-e4.add_transition(132, e4)
-e4.add_transition(133, e4)
-e4.add_transition(134, e4)
-e4.add_transition(135, e4)
-e4.add_transition(136, e4)
-e4.add_transition(137, e4)
-e4.add_transition(138, e4)
-e4.add_transition(139, e4)
-e4.add_transition(140, e4)
-e4.add_transition(141, e4)
-e4.add_transition(142, e4)
-e4.add_transition(143, e4)
-e4.add_transition(144, e4)
-e4.add_transition(145, e4)
-e4.add_transition(146, e4)
-e4.add_transition(147, e4)
-e4.add_transition(148, e4)
-e4.add_transition(149, e4)
-e4.add_transition(150, e4)
-e4.add_transition(151, e4)
-e4.add_transition(152, e4)
-e4.add_transition(153, e4)
-e4.add_transition(154, e4)
-e4.add_transition(155, e4)
-e4.add_transition(156, e4)
-e4.add_transition(157, e4)
-e4.add_transition(158, e4)
-e4.add_transition(159, e4)
-e4.add_transition(160, e4)
-e4.add_transition(161, e4)
-e4.add_transition(162, e4)
-e4.add_transition(163, e4)
-e4.add_transition(164, e4)
-e4.add_transition(165, e4)
-e4.add_transition(166, e4)
-e4.add_transition(167, e4)
-e4.add_transition(168, e4)
-e4.add_transition(169, e4)
-e4.add_transition(170, e4)
-e4.add_transition(171, e4)
-e4.add_transition(172, e4)
-e4.add_transition(173, e4)
-e4.add_transition(174, e4)
-e4.add_transition(175, e4)
-e4.add_transition(176, e4)
-e4.add_transition(177, e4)
-e4.add_transition(178, e4)
-e4.add_transition(179, e4)
-e4.add_transition(180, e4)
-e4.add_transition(181, e4)
-e4.add_transition(182, e4)
-e4.add_transition(183, e4)
-e4.add_transition(184, e4)
-e4.add_transition(185, e4)
-e4.add_transition(186, e4)
-e4.add_transition(187, e4)
-e4.add_transition(188, e4)
-e4.add_transition(189, e4)
-e4.add_transition(190, e4)
-e4.add_transition(191, e4)
-e4.add_transition(192, e4)
-e4.add_transition(193, e4)
-e4.add_transition(194, e4)
-e4.add_transition(195, e4)
-e4.add_transition(196, e4)
-e4.add_transition(197, e4)
-e4.add_transition(198, e4)
-e4.add_transition(199, e4)
-e4.add_transition(200, e4)
-e4.add_transition(201, e4)
-e4.add_transition(202, e4)
-e4.add_transition(203, e4)
-e4.add_transition(204, e4)
-e4.add_transition(205, e4)
-e4.add_transition(206, e4)
-e4.add_transition(207, e4)
-e4.add_transition(208, e4)
-e4.add_transition(209, e4)
-e4.add_transition(210, e4)
-e4.add_transition(211, e4)
-e4.add_transition(212, e4)
-e4.add_transition(213, e4)
-e4.add_transition(214, e4)
-e4.add_transition(215, e4)
-e4.add_transition(216, e4)
-e4.add_transition(217, e4)
-e4.add_transition(218, e4)
-e4.add_transition(219, e4)
-e4.add_transition(220, e4)
-e4.add_transition(221, e4)
-e4.add_transition(222, e4)
-e4.add_transition(223, e4)
-e4.add_transition(224, e4)
-e4.add_transition(225, e4)
-e4.add_transition(226, e4)
-e4.add_transition(227, e4)
-e4.add_transition(228, e4)
-e4.add_transition(229, e4)
-e4.add_transition(230, e4)
-e4.add_transition(231, e4)
-e4.add_transition(232, e4)
-e4.add_transition(233, e4)
-e4.add_transition(234, e4)
-e4.add_transition(235, e4)
-e4.add_transition(236, e4)
-e4.add_transition(237, e4)
-e4.add_transition(238, e4)
-e4.add_transition(239, e4)
-e4.add_transition(240, e4)
-e4.add_transition(241, e4)
-e4.add_transition(242, e4)
-e4.add_transition(243, e4)
-e4.add_transition(244, e4)
-e4.add_transition(245, e4)
-e4.add_transition(246, e4)
-e4.add_transition(247, e4)
-e4.add_transition(248, e4)
-e4.add_transition(249, e4)
-e4.add_transition(250, e4)
-e4.add_transition(251, e4)
-e4.add_transition(252, e4)
-e4.add_transition(253, e4)
-e4.add_transition(254, e4)
-e4.add_transition(255, e4)
-
-e9.add_transition(0, e6)
-e9.add_transition(1, e6)
-e9.add_transition(2, e6)
-e9.add_transition(3, e6)
-e9.add_transition(4, e6)
-e9.add_transition(5, e6)
-e9.add_transition(6, e6)
-e9.add_transition(7, e6)
-e9.add_transition(8, e6)
-e9.add_transition(9, e6)
-e9.add_transition(10, e6)
-e9.add_transition(11, e6)
-e9.add_transition(12, e6)
-e9.add_transition(13, e6)
-e9.add_transition(14, e6)
-e9.add_transition(15, e6)
-e9.add_transition(16, e6)
-e9.add_transition(17, e6)
-e9.add_transition(18, e6)
-e9.add_transition(19, e6)
-e9.add_transition(20, e6)
-e9.add_transition(21, e6)
-e9.add_transition(22, e6)
-e9.add_transition(23, e6)
-e9.add_transition(24, e6)
-e9.add_transition(25, e6)
-e9.add_transition(26, e6)
-e9.add_transition(27, e6)
-e9.add_transition(28, e6)
-e9.add_transition(29, e6)
-e9.add_transition(30, e6)
-e9.add_transition(31, e6)
-e9.add_transition(32, e6)
-e9.add_transition(33, e6)
-e9.add_transition(34, e6)
-e9.add_transition(35, e6)
-e9.add_transition(36, e6)
-e9.add_transition(37, e6)
-e9.add_transition(38, e6)
-e9.add_transition(39, e6)
-e9.add_transition(40, e6)
-e9.add_transition(41, e6)
-e9.add_transition(42, e5)
-e9.add_transition(43, e6)
-e9.add_transition(44, e6)
-e9.add_transition(45, e6)
-e9.add_transition(46, e6)
-e9.add_transition(47, e14)
-e9.add_transition(48, e6)
-e9.add_transition(49, e6)
-e9.add_transition(50, e6)
-e9.add_transition(51, e6)
-e9.add_transition(52, e6)
-e9.add_transition(53, e6)
-e9.add_transition(54, e6)
-e9.add_transition(55, e6)
-e9.add_transition(56, e6)
-e9.add_transition(57, e6)
-e9.add_transition(58, e6)
-e9.add_transition(59, e6)
-e9.add_transition(60, e6)
-e9.add_transition(61, e6)
-e9.add_transition(62, e6)
-e9.add_transition(63, e6)
-e9.add_transition(64, e6)
-e9.add_transition(65, e6)
-e9.add_transition(66, e6)
-e9.add_transition(67, e6)
-e9.add_transition(68, e6)
-e9.add_transition(69, e6)
-e9.add_transition(70, e6)
-e9.add_transition(71, e6)
-e9.add_transition(72, e6)
-e9.add_transition(73, e6)
-e9.add_transition(74, e6)
-e9.add_transition(75, e6)
-e9.add_transition(76, e6)
-e9.add_transition(77, e6)
-e9.add_transition(78, e6)
-e9.add_transition(79, e6)
-e9.add_transition(80, e6)
-e9.add_transition(81, e6)
-e9.add_transition(82, e6)
-e9.add_transition(83, e6)
-e9.add_transition(84, e6)
-e9.add_transition(85, e6)
-e9.add_transition(86, e6)
-e9.add_transition(87, e6)
-e9.add_transition(88, e6)
-e9.add_transition(89, e6)
-e9.add_transition(90, e6)
-e9.add_transition(91, e6)
-e9.add_transition(92, e6)
-e9.add_transition(93, e6)
-e9.add_transition(94, e6)
-e9.add_transition(95, e6)
-e9.add_transition(96, e6)
-e9.add_transition(97, e6)
-e9.add_transition(98, e6)
-e9.add_transition(99, e6)
-e9.add_transition(100, e6)
-e9.add_transition(101, e6)
-e9.add_transition(102, e6)
-e9.add_transition(103, e6)
-e9.add_transition(104, e6)
-e9.add_transition(105, e6)
-e9.add_transition(106, e6)
-e9.add_transition(107, e6)
-e9.add_transition(108, e6)
-e9.add_transition(109, e6)
-e9.add_transition(110, e6)
-e9.add_transition(111, e6)
-e9.add_transition(112, e6)
-e9.add_transition(113, e6)
-e9.add_transition(114, e6)
-e9.add_transition(115, e6)
-e9.add_transition(116, e6)
-e9.add_transition(117, e6)
-e9.add_transition(118, e6)
-e9.add_transition(119, e6)
-e9.add_transition(120, e6)
-e9.add_transition(121, e6)
-e9.add_transition(122, e6)
-e9.add_transition(123, e6)
-e9.add_transition(124, e6)
-e9.add_transition(125, e6)
-e9.add_transition(126, e6)
-e9.add_transition(127, e6)
-e9.add_transition(128, e6)
-e9.add_transition(129, e6)
-e9.add_transition(130, e6)
-e9.add_transition(131, e6)
-e9.add_transition(132, e6)
-e9.add_transition(133, e6)
-e9.add_transition(134, e6)
-e9.add_transition(135, e6)
-e9.add_transition(136, e6)
-e9.add_transition(137, e6)
-e9.add_transition(138, e6)
-e9.add_transition(139, e6)
-e9.add_transition(140, e6)
-e9.add_transition(141, e6)
-e9.add_transition(142, e6)
-e9.add_transition(143, e6)
-e9.add_transition(144, e6)
-e9.add_transition(145, e6)
-e9.add_transition(146, e6)
-e9.add_transition(147, e6)
-e9.add_transition(148, e6)
-e9.add_transition(149, e6)
-e9.add_transition(150, e6)
-e9.add_transition(151, e6)
-e9.add_transition(152, e6)
-e9.add_transition(153, e6)
-e9.add_transition(154, e6)
-e9.add_transition(155, e6)
-e9.add_transition(156, e6)
-e9.add_transition(157, e6)
-e9.add_transition(158, e6)
-e9.add_transition(159, e6)
-e9.add_transition(160, e6)
-e9.add_transition(161, e6)
-e9.add_transition(162, e6)
-e9.add_transition(163, e6)
-e9.add_transition(164, e6)
-e9.add_transition(165, e6)
-e9.add_transition(166, e6)
-e9.add_transition(167, e6)
-e9.add_transition(168, e6)
-e9.add_transition(169, e6)
-e9.add_transition(170, e6)
-e9.add_transition(171, e6)
-e9.add_transition(172, e6)
-e9.add_transition(173, e6)
-e9.add_transition(174, e6)
-e9.add_transition(175, e6)
-e9.add_transition(176, e6)
-e9.add_transition(177, e6)
-e9.add_transition(178, e6)
-e9.add_transition(179, e6)
-e9.add_transition(180, e6)
-e9.add_transition(181, e6)
-e9.add_transition(182, e6)
-e9.add_transition(183, e6)
-e9.add_transition(184, e6)
-e9.add_transition(185, e6)
-e9.add_transition(186, e6)
-e9.add_transition(187, e6)
-e9.add_transition(188, e6)
-e9.add_transition(189, e6)
-e9.add_transition(190, e6)
-e9.add_transition(191, e6)
-e9.add_transition(192, e6)
-e9.add_transition(193, e6)
-e9.add_transition(194, e6)
-e9.add_transition(195, e6)
-e9.add_transition(196, e6)
-e9.add_transition(197, e6)
-e9.add_transition(198, e6)
-e9.add_transition(199, e6)
-e9.add_transition(200, e6)
-e9.add_transition(201, e6)
-e9.add_transition(202, e6)
-e9.add_transition(203, e6)
-e9.add_transition(204, e6)
-e9.add_transition(205, e6)
-e9.add_transition(206, e6)
-e9.add_transition(207, e6)
-e9.add_transition(208, e6)
-e9.add_transition(209, e6)
-e9.add_transition(210, e6)
-e9.add_transition(211, e6)
-e9.add_transition(212, e6)
-e9.add_transition(213, e6)
-e9.add_transition(214, e6)
-e9.add_transition(215, e6)
-e9.add_transition(216, e6)
-e9.add_transition(217, e6)
-e9.add_transition(218, e6)
-e9.add_transition(219, e6)
-e9.add_transition(220, e6)
-e9.add_transition(221, e6)
-e9.add_transition(222, e6)
-e9.add_transition(223, e6)
-e9.add_transition(224, e6)
-e9.add_transition(225, e6)
-e9.add_transition(226, e6)
-e9.add_transition(227, e6)
-e9.add_transition(228, e6)
-e9.add_transition(229, e6)
-e9.add_transition(230, e6)
-e9.add_transition(231, e6)
-e9.add_transition(232, e6)
-e9.add_transition(233, e6)
-e9.add_transition(234, e6)
-e9.add_transition(235, e6)
-e9.add_transition(236, e6)
-e9.add_transition(237, e6)
-e9.add_transition(238, e6)
-e9.add_transition(239, e6)
-e9.add_transition(240, e6)
-e9.add_transition(241, e6)
-e9.add_transition(242, e6)
-e9.add_transition(243, e6)
-e9.add_transition(244, e6)
-e9.add_transition(245, e6)
-e9.add_transition(246, e6)
-e9.add_transition(247, e6)
-e9.add_transition(248, e6)
-e9.add_transition(249, e6)
-e9.add_transition(250, e6)
-e9.add_transition(251, e6)
-e9.add_transition(252, e6)
-e9.add_transition(253, e6)
-e9.add_transition(254, e6)
-e9.add_transition(255, e6)
-
-e5.add_transition(0, e4)
-e5.add_transition(1, e4)
-e5.add_transition(2, e4)
-e5.add_transition(3, e4)
-e5.add_transition(4, e4)
-e5.add_transition(5, e4)
-e5.add_transition(6, e4)
-e5.add_transition(7, e4)
-e5.add_transition(8, e4)
-e5.add_transition(9, e4)
-e5.add_transition(10, e4)
-e5.add_transition(11, e4)
-e5.add_transition(12, e4)
-e5.add_transition(13, e4)
-e5.add_transition(14, e4)
-e5.add_transition(15, e4)
-e5.add_transition(16, e4)
-e5.add_transition(17, e4)
-e5.add_transition(18, e4)
-e5.add_transition(19, e4)
-e5.add_transition(20, e4)
-e5.add_transition(21, e4)
-e5.add_transition(22, e4)
-e5.add_transition(23, e4)
-e5.add_transition(24, e4)
-e5.add_transition(25, e4)
-e5.add_transition(26, e4)
-e5.add_transition(27, e4)
-e5.add_transition(28, e4)
-e5.add_transition(29, e4)
-e5.add_transition(30, e4)
-e5.add_transition(31, e4)
-e5.add_transition(32, e4)
-e5.add_transition(33, e4)
-e5.add_transition(34, e4)
-e5.add_transition(35, e4)
-e5.add_transition(36, e4)
-e5.add_transition(37, e4)
-e5.add_transition(38, e4)
-e5.add_transition(39, e4)
-e5.add_transition(40, e4)
-e5.add_transition(41, e4)
-e5.add_transition(42, e10)
-e5.add_transition(43, e4)
-e5.add_transition(44, e4)
-e5.add_transition(45, e4)
-e5.add_transition(46, e4)
-e5.add_transition(47, e1)
-e5.add_transition(48, e4)
-e5.add_transition(49, e4)
-e5.add_transition(50, e4)
-e5.add_transition(51, e4)
-e5.add_transition(52, e4)
-e5.add_transition(53, e4)
-e5.add_transition(54, e4)
-e5.add_transition(55, e4)
-e5.add_transition(56, e4)
-e5.add_transition(57, e4)
-e5.add_transition(58, e4)
-e5.add_transition(59, e4)
-e5.add_transition(60, e4)
-e5.add_transition(61, e4)
-e5.add_transition(62, e4)
-e5.add_transition(63, e4)
-e5.add_transition(64, e4)
-e5.add_transition(65, e4)
-e5.add_transition(66, e4)
-e5.add_transition(67, e4)
-e5.add_transition(68, e4)
-e5.add_transition(69, e4)
-e5.add_transition(70, e4)
-e5.add_transition(71, e4)
-e5.add_transition(72, e4)
-e5.add_transition(73, e4)
-e5.add_transition(74, e4)
-e5.add_transition(75, e4)
-e5.add_transition(76, e4)
-e5.add_transition(77, e4)
-e5.add_transition(78, e4)
-e5.add_transition(79, e4)
-e5.add_transition(80, e4)
-e5.add_transition(81, e4)
-e5.add_transition(82, e4)
-e5.add_transition(83, e4)
-e5.add_transition(84, e4)
-e5.add_transition(85, e4)
-e5.add_transition(86, e4)
-e5.add_transition(87, e4)
-e5.add_transition(88, e4)
-e5.add_transition(89, e4)
-e5.add_transition(90, e4)
-e5.add_transition(91, e4)
-e5.add_transition(92, e4)
-e5.add_transition(93, e4)
-e5.add_transition(94, e4)
-e5.add_transition(95, e4)
-e5.add_transition(96, e4)
-e5.add_transition(97, e4)
-e5.add_transition(98, e4)
-e5.add_transition(99, e4)
-e5.add_transition(100, e4)
-e5.add_transition(101, e4)
-e5.add_transition(102, e4)
-e5.add_transition(103, e4)
-e5.add_transition(104, e4)
-e5.add_transition(105, e4)
-e5.add_transition(106, e4)
-e5.add_transition(107, e4)
-e5.add_transition(108, e4)
-e5.add_transition(109, e4)
-e5.add_transition(110, e4)
-e5.add_transition(111, e4)
-e5.add_transition(112, e4)
-e5.add_transition(113, e4)
-e5.add_transition(114, e4)
-e5.add_transition(115, e4)
-e5.add_transition(116, e4)
-e5.add_transition(117, e4)
-e5.add_transition(118, e4)
-e5.add_transition(119, e4)
-e5.add_transition(120, e4)
-e5.add_transition(121, e4)
-e5.add_transition(122, e4)
-e5.add_transition(123, e4)
-e5.add_transition(124, e4)
-e5.add_transition(125, e4)
-e5.add_transition(126, e4)
-e5.add_transition(127, e4)
-e5.add_transition(128, e4)
-e5.add_transition(129, e4)
-e5.add_transition(130, e4)
-e5.add_transition(131, e4)
-e5.add_transition(132, e4)
-e5.add_transition(133, e4)
-e5.add_transition(134, e4)
-e5.add_transition(135, e4)
-e5.add_transition(136, e4)
-e5.add_transition(137, e4)
-e5.add_transition(138, e4)
-e5.add_transition(139, e4)
-e5.add_transition(140, e4)
-e5.add_transition(141, e4)
-e5.add_transition(142, e4)
-e5.add_transition(143, e4)
-e5.add_transition(144, e4)
-e5.add_transition(145, e4)
-e5.add_transition(146, e4)
-e5.add_transition(147, e4)
-e5.add_transition(148, e4)
-e5.add_transition(149, e4)
-e5.add_transition(150, e4)
-e5.add_transition(151, e4)
-e5.add_transition(152, e4)
-e5.add_transition(153, e4)
-e5.add_transition(154, e4)
-e5.add_transition(155, e4)
-e5.add_transition(156, e4)
-e5.add_transition(157, e4)
-e5.add_transition(158, e4)
-e5.add_transition(159, e4)
-e5.add_transition(160, e4)
-e5.add_transition(161, e4)
-e5.add_transition(162, e4)
-e5.add_transition(163, e4)
-e5.add_transition(164, e4)
-e5.add_transition(165, e4)
-e5.add_transition(166, e4)
-e5.add_transition(167, e4)
-e5.add_transition(168, e4)
-e5.add_transition(169, e4)
-e5.add_transition(170, e4)
-e5.add_transition(171, e4)
-e5.add_transition(172, e4)
-e5.add_transition(173, e4)
-e5.add_transition(174, e4)
-e5.add_transition(175, e4)
-e5.add_transition(176, e4)
-e5.add_transition(177, e4)
-e5.add_transition(178, e4)
-e5.add_transition(179, e4)
-e5.add_transition(180, e4)
-e5.add_transition(181, e4)
-e5.add_transition(182, e4)
-e5.add_transition(183, e4)
-e5.add_transition(184, e4)
-e5.add_transition(185, e4)
-e5.add_transition(186, e4)
-e5.add_transition(187, e4)
-e5.add_transition(188, e4)
-e5.add_transition(189, e4)
-e5.add_transition(190, e4)
-e5.add_transition(191, e4)
-e5.add_transition(192, e4)
-e5.add_transition(193, e4)
-e5.add_transition(194, e4)
-e5.add_transition(195, e4)
-e5.add_transition(196, e4)
-e5.add_transition(197, e4)
-e5.add_transition(198, e4)
-e5.add_transition(199, e4)
-e5.add_transition(200, e4)
-e5.add_transition(201, e4)
-e5.add_transition(202, e4)
-e5.add_transition(203, e4)
-e5.add_transition(204, e4)
-e5.add_transition(205, e4)
-e5.add_transition(206, e4)
-e5.add_transition(207, e4)
-e5.add_transition(208, e4)
-e5.add_transition(209, e4)
-e5.add_transition(210, e4)
-e5.add_transition(211, e4)
-e5.add_transition(212, e4)
-e5.add_transition(213, e4)
-e5.add_transition(214, e4)
-e5.add_transition(215, e4)
-e5.add_transition(216, e4)
-e5.add_transition(217, e4)
-e5.add_transition(218, e4)
-e5.add_transition(219, e4)
-e5.add_transition(220, e4)
-e5.add_transition(221, e4)
-e5.add_transition(222, e4)
-e5.add_transition(223, e4)
-e5.add_transition(224, e4)
-e5.add_transition(225, e4)
-e5.add_transition(226, e4)
-e5.add_transition(227, e4)
-e5.add_transition(228, e4)
-e5.add_transition(229, e4)
-e5.add_transition(230, e4)
-e5.add_transition(231, e4)
-e5.add_transition(232, e4)
-e5.add_transition(233, e4)
-e5.add_transition(234, e4)
-e5.add_transition(235, e4)
-e5.add_transition(236, e4)
-e5.add_transition(237, e4)
-e5.add_transition(238, e4)
-e5.add_transition(239, e4)
-e5.add_transition(240, e4)
-e5.add_transition(241, e4)
-e5.add_transition(242, e4)
-e5.add_transition(243, e4)
-e5.add_transition(244, e4)
-e5.add_transition(245, e4)
-e5.add_transition(246, e4)
-e5.add_transition(247, e4)
-e5.add_transition(248, e4)
-e5.add_transition(249, e4)
-e5.add_transition(250, e4)
-e5.add_transition(251, e4)
-e5.add_transition(252, e4)
-e5.add_transition(253, e4)
-e5.add_transition(254, e4)
-e5.add_transition(255, e4)
-
-e10.add_transition(0, e4)
-e10.add_transition(1, e4)
-e10.add_transition(2, e4)
-e10.add_transition(3, e4)
-e10.add_transition(4, e4)
-e10.add_transition(5, e4)
-e10.add_transition(6, e4)
-e10.add_transition(7, e4)
-e10.add_transition(8, e4)
-e10.add_transition(9, e4)
-e10.add_transition(10, e4)
-e10.add_transition(11, e4)
-e10.add_transition(12, e4)
-e10.add_transition(13, e4)
-e10.add_transition(14, e4)
-e10.add_transition(15, e4)
-e10.add_transition(16, e4)
-e10.add_transition(17, e4)
-e10.add_transition(18, e4)
-e10.add_transition(19, e4)
-e10.add_transition(20, e4)
-e10.add_transition(21, e4)
-e10.add_transition(22, e4)
-e10.add_transition(23, e4)
-e10.add_transition(24, e4)
-e10.add_transition(25, e4)
-e10.add_transition(26, e4)
-e10.add_transition(27, e4)
-e10.add_transition(28, e4)
-e10.add_transition(29, e4)
-e10.add_transition(30, e4)
-e10.add_transition(31, e4)
-e10.add_transition(32, e4)
-e10.add_transition(33, e4)
-e10.add_transition(34, e4)
-e10.add_transition(35, e4)
-e10.add_transition(36, e4)
-e10.add_transition(37, e4)
-e10.add_transition(38, e4)
-e10.add_transition(39, e4)
-e10.add_transition(40, e4)
-e10.add_transition(41, e4)
-e10.add_transition(42, e9)
-e10.add_transition(43, e4)
-e10.add_transition(44, e4)
-e10.add_transition(45, e4)
-e10.add_transition(46, e4)
-e10.add_transition(47, e15)
-e10.add_transition(48, e4)
-e10.add_transition(49, e4)
-e10.add_transition(50, e4)
-e10.add_transition(51, e4)
-e10.add_transition(52, e4)
-e10.add_transition(53, e4)
-e10.add_transition(54, e4)
-e10.add_transition(55, e4)
-e10.add_transition(56, e4)
-e10.add_transition(57, e4)
-e10.add_transition(58, e4)
-e10.add_transition(59, e4)
-e10.add_transition(60, e4)
-e10.add_transition(61, e4)
-e10.add_transition(62, e4)
-e10.add_transition(63, e4)
-e10.add_transition(64, e4)
-e10.add_transition(65, e4)
-e10.add_transition(66, e4)
-e10.add_transition(67, e4)
-e10.add_transition(68, e4)
-e10.add_transition(69, e4)
-e10.add_transition(70, e4)
-e10.add_transition(71, e4)
-e10.add_transition(72, e4)
-e10.add_transition(73, e4)
-e10.add_transition(74, e4)
-e10.add_transition(75, e4)
-e10.add_transition(76, e4)
-e10.add_transition(77, e4)
-e10.add_transition(78, e4)
-e10.add_transition(79, e4)
-e10.add_transition(80, e4)
-e10.add_transition(81, e4)
-e10.add_transition(82, e4)
-e10.add_transition(83, e4)
-e10.add_transition(84, e4)
-e10.add_transition(85, e4)
-e10.add_transition(86, e4)
-e10.add_transition(87, e4)
-e10.add_transition(88, e4)
-e10.add_transition(89, e4)
-e10.add_transition(90, e4)
-e10.add_transition(91, e4)
-e10.add_transition(92, e4)
-e10.add_transition(93, e4)
-e10.add_transition(94, e4)
-e10.add_transition(95, e4)
-e10.add_transition(96, e4)
-e10.add_transition(97, e4)
-e10.add_transition(98, e4)
-e10.add_transition(99, e4)
-e10.add_transition(100, e4)
-e10.add_transition(101, e4)
-e10.add_transition(102, e4)
-e10.add_transition(103, e4)
-e10.add_transition(104, e4)
-e10.add_transition(105, e4)
-e10.add_transition(106, e4)
-e10.add_transition(107, e4)
-e10.add_transition(108, e4)
-e10.add_transition(109, e4)
-e10.add_transition(110, e4)
-e10.add_transition(111, e4)
-e10.add_transition(112, e4)
-e10.add_transition(113, e4)
-e10.add_transition(114, e4)
-e10.add_transition(115, e4)
-e10.add_transition(116, e4)
-e10.add_transition(117, e4)
-e10.add_transition(118, e4)
-e10.add_transition(119, e4)
-e10.add_transition(120, e4)
-e10.add_transition(121, e4)
-e10.add_transition(122, e4)
-e10.add_transition(123, e4)
-e10.add_transition(124, e4)
-e10.add_transition(125, e4)
-e10.add_transition(126, e4)
-e10.add_transition(127, e4)
-e10.add_transition(128, e4)
-e10.add_transition(129, e4)
-e10.add_transition(130, e4)
-e10.add_transition(131, e4)
-e10.add_transition(132, e4)
-e10.add_transition(133, e4)
-e10.add_transition(134, e4)
-e10.add_transition(135, e4)
-e10.add_transition(136, e4)
-e10.add_transition(137, e4)
-e10.add_transition(138, e4)
-e10.add_transition(139, e4)
-e10.add_transition(140, e4)
-e10.add_transition(141, e4)
-e10.add_transition(142, e4)
-e10.add_transition(143, e4)
-e10.add_transition(144, e4)
-e10.add_transition(145, e4)
-e10.add_transition(146, e4)
-e10.add_transition(147, e4)
-e10.add_transition(148, e4)
-e10.add_transition(149, e4)
-e10.add_transition(150, e4)
-e10.add_transition(151, e4)
-e10.add_transition(152, e4)
-e10.add_transition(153, e4)
-e10.add_transition(154, e4)
-e10.add_transition(155, e4)
-e10.add_transition(156, e4)
-e10.add_transition(157, e4)
-e10.add_transition(158, e4)
-e10.add_transition(159, e4)
-e10.add_transition(160, e4)
-e10.add_transition(161, e4)
-e10.add_transition(162, e4)
-e10.add_transition(163, e4)
-e10.add_transition(164, e4)
-e10.add_transition(165, e4)
-e10.add_transition(166, e4)
-e10.add_transition(167, e4)
-e10.add_transition(168, e4)
-e10.add_transition(169, e4)
-e10.add_transition(170, e4)
-e10.add_transition(171, e4)
-e10.add_transition(172, e4)
-e10.add_transition(173, e4)
-e10.add_transition(174, e4)
-e10.add_transition(175, e4)
-e10.add_transition(176, e4)
-e10.add_transition(177, e4)
-e10.add_transition(178, e4)
-e10.add_transition(179, e4)
-e10.add_transition(180, e4)
-e10.add_transition(181, e4)
-e10.add_transition(182, e4)
-e10.add_transition(183, e4)
-e10.add_transition(184, e4)
-e10.add_transition(185, e4)
-e10.add_transition(186, e4)
-e10.add_transition(187, e4)
-e10.add_transition(188, e4)
-e10.add_transition(189, e4)
-e10.add_transition(190, e4)
-e10.add_transition(191, e4)
-e10.add_transition(192, e4)
-e10.add_transition(193, e4)
-e10.add_transition(194, e4)
-e10.add_transition(195, e4)
-e10.add_transition(196, e4)
-e10.add_transition(197, e4)
-e10.add_transition(198, e4)
-e10.add_transition(199, e4)
-e10.add_transition(200, e4)
-e10.add_transition(201, e4)
-e10.add_transition(202, e4)
-e10.add_transition(203, e4)
-e10.add_transition(204, e4)
-e10.add_transition(205, e4)
-e10.add_transition(206, e4)
-e10.add_transition(207, e4)
-e10.add_transition(208, e4)
-e10.add_transition(209, e4)
-e10.add_transition(210, e4)
-e10.add_transition(211, e4)
-e10.add_transition(212, e4)
-e10.add_transition(213, e4)
-e10.add_transition(214, e4)
-e10.add_transition(215, e4)
-e10.add_transition(216, e4)
-e10.add_transition(217, e4)
-e10.add_transition(218, e4)
-e10.add_transition(219, e4)
-e10.add_transition(220, e4)
-e10.add_transition(221, e4)
-e10.add_transition(222, e4)
-e10.add_transition(223, e4)
-e10.add_transition(224, e4)
-e10.add_transition(225, e4)
-e10.add_transition(226, e4)
-e10.add_transition(227, e4)
-e10.add_transition(228, e4)
-e10.add_transition(229, e4)
-e10.add_transition(230, e4)
-e10.add_transition(231, e4)
-e10.add_transition(232, e4)
-e10.add_transition(233, e4)
-e10.add_transition(234, e4)
-e10.add_transition(235, e4)
-e10.add_transition(236, e4)
-e10.add_transition(237, e4)
-e10.add_transition(238, e4)
-e10.add_transition(239, e4)
-e10.add_transition(240, e4)
-e10.add_transition(241, e4)
-e10.add_transition(242, e4)
-e10.add_transition(243, e4)
-e10.add_transition(244, e4)
-e10.add_transition(245, e4)
-e10.add_transition(246, e4)
-e10.add_transition(247, e4)
-e10.add_transition(248, e4)
-e10.add_transition(249, e4)
-e10.add_transition(250, e4)
-e10.add_transition(251, e4)
-e10.add_transition(252, e4)
-e10.add_transition(253, e4)
-e10.add_transition(254, e4)
-e10.add_transition(255, e4)
-
-e15.isFinalState = True
-e15.addToken( 'COMMENT')
-e15.add_transition(47, e12)
-
-e12.add_transition(0, e6)
-e12.add_transition(1, e6)
-e12.add_transition(2, e6)
-e12.add_transition(3, e6)
-e12.add_transition(4, e6)
-e12.add_transition(5, e6)
-e12.add_transition(6, e6)
-e12.add_transition(7, e6)
-e12.add_transition(8, e6)
-e12.add_transition(9, e6)
-e12.add_transition(10, e6)
-e12.add_transition(11, e6)
-e12.add_transition(12, e6)
-e12.add_transition(13, e6)
-e12.add_transition(14, e6)
-e12.add_transition(15, e6)
-e12.add_transition(16, e6)
-e12.add_transition(17, e6)
-e12.add_transition(18, e6)
-e12.add_transition(19, e6)
-e12.add_transition(20, e6)
-e12.add_transition(21, e6)
-e12.add_transition(22, e6)
-e12.add_transition(23, e6)
-e12.add_transition(24, e6)
-e12.add_transition(25, e6)
-e12.add_transition(26, e6)
-e12.add_transition(27, e6)
-e12.add_transition(28, e6)
-e12.add_transition(29, e6)
-e12.add_transition(30, e6)
-e12.add_transition(31, e6)
-e12.add_transition(32, e6)
-e12.add_transition(33, e6)
-e12.add_transition(34, e6)
-e12.add_transition(35, e6)
-e12.add_transition(36, e6)
-e12.add_transition(37, e6)
-e12.add_transition(38, e6)
-e12.add_transition(39, e6)
-e12.add_transition(40, e6)
-e12.add_transition(41, e6)
-e12.add_transition(43, e6)
-e12.add_transition(44, e6)
-e12.add_transition(45, e6)
-e12.add_transition(46, e6)
-e12.add_transition(47, e6)
-e12.add_transition(48, e6)
-e12.add_transition(49, e6)
-e12.add_transition(50, e6)
-e12.add_transition(51, e6)
-e12.add_transition(52, e6)
-e12.add_transition(53, e6)
-e12.add_transition(54, e6)
-e12.add_transition(55, e6)
-e12.add_transition(56, e6)
-e12.add_transition(57, e6)
-e12.add_transition(58, e6)
-e12.add_transition(59, e6)
-e12.add_transition(60, e6)
-e12.add_transition(61, e6)
-e12.add_transition(62, e6)
-e12.add_transition(63, e6)
-e12.add_transition(64, e6)
-e12.add_transition(65, e6)
-e12.add_transition(66, e6)
-e12.add_transition(67, e6)
-e12.add_transition(68, e6)
-e12.add_transition(69, e6)
-e12.add_transition(70, e6)
-e12.add_transition(71, e6)
-e12.add_transition(72, e6)
-e12.add_transition(73, e6)
-e12.add_transition(74, e6)
-e12.add_transition(75, e6)
-e12.add_transition(76, e6)
-e12.add_transition(77, e6)
-e12.add_transition(78, e6)
-e12.add_transition(79, e6)
-e12.add_transition(80, e6)
-e12.add_transition(81, e6)
-e12.add_transition(82, e6)
-e12.add_transition(83, e6)
-e12.add_transition(84, e6)
-e12.add_transition(85, e6)
-e12.add_transition(86, e6)
-e12.add_transition(87, e6)
-e12.add_transition(88, e6)
-e12.add_transition(89, e6)
-e12.add_transition(90, e6)
-e12.add_transition(91, e6)
-e12.add_transition(92, e6)
-e12.add_transition(93, e6)
-e12.add_transition(94, e6)
-e12.add_transition(95, e6)
-e12.add_transition(96, e6)
-e12.add_transition(97, e6)
-e12.add_transition(98, e6)
-e12.add_transition(99, e6)
-e12.add_transition(100, e6)
-e12.add_transition(101, e6)
-e12.add_transition(102, e6)
-e12.add_transition(103, e6)
-e12.add_transition(104, e6)
-e12.add_transition(105, e6)
-e12.add_transition(106, e6)
-e12.add_transition(107, e6)
-e12.add_transition(108, e6)
-e12.add_transition(109, e6)
-e12.add_transition(110, e6)
-e12.add_transition(111, e6)
-e12.add_transition(112, e6)
-e12.add_transition(113, e6)
-e12.add_transition(114, e6)
-e12.add_transition(115, e6)
-e12.add_transition(116, e6)
-e12.add_transition(117, e6)
-e12.add_transition(118, e6)
-e12.add_transition(119, e6)
-e12.add_transition(120, e6)
-e12.add_transition(121, e6)
-e12.add_transition(122, e6)
-e12.add_transition(123, e6)
-e12.add_transition(124, e6)
-e12.add_transition(125, e6)
-e12.add_transition(126, e6)
-e12.add_transition(127, e6)
-e12.add_transition(128, e6)
-e12.add_transition(129, e6)
-e12.add_transition(130, e6)
-e12.add_transition(131, e6)
-e12.add_transition(132, e6)
-e12.add_transition(133, e6)
-e12.add_transition(134, e6)
-e12.add_transition(135, e6)
-e12.add_transition(136, e6)
-e12.add_transition(137, e6)
-e12.add_transition(138, e6)
-e12.add_transition(139, e6)
-e12.add_transition(140, e6)
-e12.add_transition(141, e6)
-e12.add_transition(142, e6)
-e12.add_transition(143, e6)
-e12.add_transition(144, e6)
-e12.add_transition(145, e6)
-e12.add_transition(146, e6)
-e12.add_transition(147, e6)
-e12.add_transition(148, e6)
-e12.add_transition(149, e6)
-e12.add_transition(150, e6)
-e12.add_transition(151, e6)
-e12.add_transition(152, e6)
-e12.add_transition(153, e6)
-e12.add_transition(154, e6)
-e12.add_transition(155, e6)
-e12.add_transition(156, e6)
-e12.add_transition(157, e6)
-e12.add_transition(158, e6)
-e12.add_transition(159, e6)
-e12.add_transition(160, e6)
-e12.add_transition(161, e6)
-e12.add_transition(162, e6)
-e12.add_transition(163, e6)
-e12.add_transition(164, e6)
-e12.add_transition(165, e6)
-e12.add_transition(166, e6)
-e12.add_transition(167, e6)
-e12.add_transition(168, e6)
-e12.add_transition(169, e6)
-e12.add_transition(170, e6)
-e12.add_transition(171, e6)
-e12.add_transition(172, e6)
-e12.add_transition(173, e6)
-e12.add_transition(174, e6)
-e12.add_transition(175, e6)
-e12.add_transition(176, e6)
-e12.add_transition(177, e6)
-e12.add_transition(178, e6)
-e12.add_transition(179, e6)
-e12.add_transition(180, e6)
-e12.add_transition(181, e6)
-e12.add_transition(182, e6)
-e12.add_transition(183, e6)
-e12.add_transition(184, e6)
-e12.add_transition(185, e6)
-e12.add_transition(186, e6)
-e12.add_transition(187, e6)
-e12.add_transition(188, e6)
-e12.add_transition(189, e6)
-e12.add_transition(190, e6)
-e12.add_transition(191, e6)
-e12.add_transition(192, e6)
-e12.add_transition(193, e6)
-e12.add_transition(194, e6)
-e12.add_transition(195, e6)
-e12.add_transition(196, e6)
-e12.add_transition(197, e6)
-e12.add_transition(198, e6)
-e12.add_transition(199, e6)
-e12.add_transition(200, e6)
-e12.add_transition(201, e6)
-e12.add_transition(202, e6)
-e12.add_transition(203, e6)
-e12.add_transition(204, e6)
-e12.add_transition(205, e6)
-e12.add_transition(206, e6)
-e12.add_transition(207, e6)
-e12.add_transition(208, e6)
-e12.add_transition(209, e6)
-e12.add_transition(210, e6)
-e12.add_transition(211, e6)
-e12.add_transition(212, e6)
-e12.add_transition(213, e6)
-e12.add_transition(214, e6)
-e12.add_transition(215, e6)
-e12.add_transition(216, e6)
-e12.add_transition(217, e6)
-e12.add_transition(218, e6)
-e12.add_transition(219, e6)
-e12.add_transition(220, e6)
-e12.add_transition(221, e6)
-e12.add_transition(222, e6)
-e12.add_transition(223, e6)
-e12.add_transition(224, e6)
-e12.add_transition(225, e6)
-e12.add_transition(226, e6)
-e12.add_transition(227, e6)
-e12.add_transition(228, e6)
-e12.add_transition(229, e6)
-e12.add_transition(230, e6)
-e12.add_transition(231, e6)
-e12.add_transition(232, e6)
-e12.add_transition(233, e6)
-e12.add_transition(234, e6)
-e12.add_transition(235, e6)
-e12.add_transition(236, e6)
-e12.add_transition(237, e6)
-e12.add_transition(238, e6)
-e12.add_transition(239, e6)
-e12.add_transition(240, e6)
-e12.add_transition(241, e6)
-e12.add_transition(242, e6)
-e12.add_transition(243, e6)
-e12.add_transition(244, e6)
-e12.add_transition(245, e6)
-e12.add_transition(246, e6)
-e12.add_transition(247, e6)
-e12.add_transition(248, e6)
-e12.add_transition(249, e6)
-e12.add_transition(250, e6)
-e12.add_transition(251, e6)
-e12.add_transition(252, e6)
-e12.add_transition(253, e6)
-e12.add_transition(254, e6)
-e12.add_transition(255, e6)
-
-e1.add_transition(47, e12)
-
-e14.isFinalState = True
-e14.addToken( 'COMMENT')
-
-e11.add_transition(0, e6)
-e11.add_transition(1, e6)
-e11.add_transition(2, e6)
-e11.add_transition(3, e6)
-e11.add_transition(4, e6)
-e11.add_transition(5, e6)
-e11.add_transition(6, e6)
-e11.add_transition(7, e6)
-e11.add_transition(8, e6)
-e11.add_transition(9, e6)
-e11.add_transition(10, e6)
-e11.add_transition(11, e6)
-e11.add_transition(12, e6)
-e11.add_transition(13, e6)
-e11.add_transition(14, e6)
-e11.add_transition(15, e6)
-e11.add_transition(16, e6)
-e11.add_transition(17, e6)
-e11.add_transition(18, e6)
-e11.add_transition(19, e6)
-e11.add_transition(20, e6)
-e11.add_transition(21, e6)
-e11.add_transition(22, e6)
-e11.add_transition(23, e6)
-e11.add_transition(24, e6)
-e11.add_transition(25, e6)
-e11.add_transition(26, e6)
-e11.add_transition(27, e6)
-e11.add_transition(28, e6)
-e11.add_transition(29, e6)
-e11.add_transition(30, e6)
-e11.add_transition(31, e6)
-e11.add_transition(32, e6)
-e11.add_transition(33, e6)
-e11.add_transition(34, e6)
-e11.add_transition(35, e6)
-e11.add_transition(36, e6)
-e11.add_transition(37, e6)
-e11.add_transition(38, e6)
-e11.add_transition(39, e6)
-e11.add_transition(40, e6)
-e11.add_transition(41, e6)
-e11.add_transition(43, e6)
-e11.add_transition(44, e6)
-e11.add_transition(45, e6)
-e11.add_transition(46, e6)
-e11.add_transition(47, e3)
-e11.add_transition(48, e6)
-e11.add_transition(49, e6)
-e11.add_transition(50, e6)
-e11.add_transition(51, e6)
-e11.add_transition(52, e6)
-e11.add_transition(53, e6)
-e11.add_transition(54, e6)
-e11.add_transition(55, e6)
-e11.add_transition(56, e6)
-e11.add_transition(57, e6)
-e11.add_transition(58, e6)
-e11.add_transition(59, e6)
-e11.add_transition(60, e6)
-e11.add_transition(61, e6)
-e11.add_transition(62, e6)
-e11.add_transition(63, e6)
-e11.add_transition(64, e6)
-e11.add_transition(65, e6)
-e11.add_transition(66, e6)
-e11.add_transition(67, e6)
-e11.add_transition(68, e6)
-e11.add_transition(69, e6)
-e11.add_transition(70, e6)
-e11.add_transition(71, e6)
-e11.add_transition(72, e6)
-e11.add_transition(73, e6)
-e11.add_transition(74, e6)
-e11.add_transition(75, e6)
-e11.add_transition(76, e6)
-e11.add_transition(77, e6)
-e11.add_transition(78, e6)
-e11.add_transition(79, e6)
-e11.add_transition(80, e6)
-e11.add_transition(81, e6)
-e11.add_transition(82, e6)
-e11.add_transition(83, e6)
-e11.add_transition(84, e6)
-e11.add_transition(85, e6)
-e11.add_transition(86, e6)
-e11.add_transition(87, e6)
-e11.add_transition(88, e6)
-e11.add_transition(89, e6)
-e11.add_transition(90, e6)
-e11.add_transition(91, e6)
-e11.add_transition(92, e6)
-e11.add_transition(93, e6)
-e11.add_transition(94, e6)
-e11.add_transition(95, e6)
-e11.add_transition(96, e6)
-e11.add_transition(97, e6)
-e11.add_transition(98, e6)
-e11.add_transition(99, e6)
-e11.add_transition(100, e6)
-e11.add_transition(101, e6)
-e11.add_transition(102, e6)
-e11.add_transition(103, e6)
-e11.add_transition(104, e6)
-e11.add_transition(105, e6)
-e11.add_transition(106, e6)
-e11.add_transition(107, e6)
-e11.add_transition(108, e6)
-e11.add_transition(109, e6)
-e11.add_transition(110, e6)
-e11.add_transition(111, e6)
-e11.add_transition(112, e6)
-e11.add_transition(113, e6)
-e11.add_transition(114, e6)
-e11.add_transition(115, e6)
-e11.add_transition(116, e6)
-e11.add_transition(117, e6)
-e11.add_transition(118, e6)
-e11.add_transition(119, e6)
-e11.add_transition(120, e6)
-e11.add_transition(121, e6)
-e11.add_transition(122, e6)
-e11.add_transition(123, e6)
-e11.add_transition(124, e6)
-e11.add_transition(125, e6)
-e11.add_transition(126, e6)
-e11.add_transition(127, e6)
-e11.add_transition(128, e6)
-e11.add_transition(129, e6)
-e11.add_transition(130, e6)
-e11.add_transition(131, e6)
-e11.add_transition(132, e6)
-e11.add_transition(133, e6)
-e11.add_transition(134, e6)
-e11.add_transition(135, e6)
-e11.add_transition(136, e6)
-e11.add_transition(137, e6)
-e11.add_transition(138, e6)
-e11.add_transition(139, e6)
-e11.add_transition(140, e6)
-e11.add_transition(141, e6)
-e11.add_transition(142, e6)
-e11.add_transition(143, e6)
-e11.add_transition(144, e6)
-e11.add_transition(145, e6)
-e11.add_transition(146, e6)
-e11.add_transition(147, e6)
-e11.add_transition(148, e6)
-e11.add_transition(149, e6)
-e11.add_transition(150, e6)
-e11.add_transition(151, e6)
-e11.add_transition(152, e6)
-e11.add_transition(153, e6)
-e11.add_transition(154, e6)
-e11.add_transition(155, e6)
-e11.add_transition(156, e6)
-e11.add_transition(157, e6)
-e11.add_transition(158, e6)
-e11.add_transition(159, e6)
-e11.add_transition(160, e6)
-e11.add_transition(161, e6)
-e11.add_transition(162, e6)
-e11.add_transition(163, e6)
-e11.add_transition(164, e6)
-e11.add_transition(165, e6)
-e11.add_transition(166, e6)
-e11.add_transition(167, e6)
-e11.add_transition(168, e6)
-e11.add_transition(169, e6)
-e11.add_transition(170, e6)
-e11.add_transition(171, e6)
-e11.add_transition(172, e6)
-e11.add_transition(173, e6)
-e11.add_transition(174, e6)
-e11.add_transition(175, e6)
-e11.add_transition(176, e6)
-e11.add_transition(177, e6)
-e11.add_transition(178, e6)
-e11.add_transition(179, e6)
-e11.add_transition(180, e6)
-e11.add_transition(181, e6)
-e11.add_transition(182, e6)
-e11.add_transition(183, e6)
-e11.add_transition(184, e6)
-e11.add_transition(185, e6)
-e11.add_transition(186, e6)
-e11.add_transition(187, e6)
-e11.add_transition(188, e6)
-e11.add_transition(189, e6)
-e11.add_transition(190, e6)
-e11.add_transition(191, e6)
-e11.add_transition(192, e6)
-e11.add_transition(193, e6)
-e11.add_transition(194, e6)
-e11.add_transition(195, e6)
-e11.add_transition(196, e6)
-e11.add_transition(197, e6)
-e11.add_transition(198, e6)
-e11.add_transition(199, e6)
-e11.add_transition(200, e6)
-e11.add_transition(201, e6)
-e11.add_transition(202, e6)
-e11.add_transition(203, e6)
-e11.add_transition(204, e6)
-e11.add_transition(205, e6)
-e11.add_transition(206, e6)
-e11.add_transition(207, e6)
-e11.add_transition(208, e6)
-e11.add_transition(209, e6)
-e11.add_transition(210, e6)
-e11.add_transition(211, e6)
-e11.add_transition(212, e6)
-e11.add_transition(213, e6)
-e11.add_transition(214, e6)
-e11.add_transition(215, e6)
-e11.add_transition(216, e6)
-e11.add_transition(217, e6)
-e11.add_transition(218, e6)
-e11.add_transition(219, e6)
-e11.add_transition(220, e6)
-e11.add_transition(221, e6)
-e11.add_transition(222, e6)
-e11.add_transition(223, e6)
-e11.add_transition(224, e6)
-e11.add_transition(225, e6)
-e11.add_transition(226, e6)
-e11.add_transition(227, e6)
-e11.add_transition(228, e6)
-e11.add_transition(229, e6)
-e11.add_transition(230, e6)
-e11.add_transition(231, e6)
-e11.add_transition(232, e6)
-e11.add_transition(233, e6)
-e11.add_transition(234, e6)
-e11.add_transition(235, e6)
-e11.add_transition(236, e6)
-e11.add_transition(237, e6)
-e11.add_transition(238, e6)
-e11.add_transition(239, e6)
-e11.add_transition(240, e6)
-e11.add_transition(241, e6)
-e11.add_transition(242, e6)
-e11.add_transition(243, e6)
-e11.add_transition(244, e6)
-e11.add_transition(245, e6)
-e11.add_transition(246, e6)
-e11.add_transition(247, e6)
-e11.add_transition(248, e6)
-e11.add_transition(249, e6)
-e11.add_transition(250, e6)
-e11.add_transition(251, e6)
-e11.add_transition(252, e6)
-e11.add_transition(253, e6)
-e11.add_transition(254, e6)
-e11.add_transition(255, e6)
-
-e3.add_transition(0, e4)
-e3.add_transition(1, e4)
-e3.add_transition(2, e4)
-e3.add_transition(3, e4)
-e3.add_transition(4, e4)
-e3.add_transition(5, e4)
-e3.add_transition(6, e4)
-e3.add_transition(7, e4)
-e3.add_transition(8, e4)
-e3.add_transition(9, e4)
-e3.add_transition(10, e4)
-e3.add_transition(11, e4)
-e3.add_transition(12, e4)
-e3.add_transition(13, e4)
-e3.add_transition(14, e4)
-e3.add_transition(15, e4)
-e3.add_transition(16, e4)
-e3.add_transition(17, e4)
-e3.add_transition(18, e4)
-e3.add_transition(19, e4)
-e3.add_transition(20, e4)
-e3.add_transition(21, e4)
-e3.add_transition(22, e4)
-e3.add_transition(23, e4)
-e3.add_transition(24, e4)
-e3.add_transition(25, e4)
-e3.add_transition(26, e4)
-e3.add_transition(27, e4)
-e3.add_transition(28, e4)
-e3.add_transition(29, e4)
-e3.add_transition(30, e4)
-e3.add_transition(31, e4)
-e3.add_transition(32, e4)
-e3.add_transition(33, e4)
-e3.add_transition(34, e4)
-e3.add_transition(35, e4)
-e3.add_transition(36, e4)
-e3.add_transition(37, e4)
-e3.add_transition(38, e4)
-e3.add_transition(39, e4)
-e3.add_transition(40, e4)
-e3.add_transition(41, e4)
-e3.add_transition(42, e8)
-e3.add_transition(43, e4)
-e3.add_transition(44, e4)
-e3.add_transition(45, e4)
-e3.add_transition(46, e4)
-e3.add_transition(47, e7)
-e3.add_transition(48, e4)
-e3.add_transition(49, e4)
-e3.add_transition(50, e4)
-e3.add_transition(51, e4)
-e3.add_transition(52, e4)
-e3.add_transition(53, e4)
-e3.add_transition(54, e4)
-e3.add_transition(55, e4)
-e3.add_transition(56, e4)
-e3.add_transition(57, e4)
-e3.add_transition(58, e4)
-e3.add_transition(59, e4)
-e3.add_transition(60, e4)
-e3.add_transition(61, e4)
-e3.add_transition(62, e4)
-e3.add_transition(63, e4)
-e3.add_transition(64, e4)
-e3.add_transition(65, e4)
-e3.add_transition(66, e4)
-e3.add_transition(67, e4)
-e3.add_transition(68, e4)
-e3.add_transition(69, e4)
-e3.add_transition(70, e4)
-e3.add_transition(71, e4)
-e3.add_transition(72, e4)
-e3.add_transition(73, e4)
-e3.add_transition(74, e4)
-e3.add_transition(75, e4)
-e3.add_transition(76, e4)
-e3.add_transition(77, e4)
-e3.add_transition(78, e4)
-e3.add_transition(79, e4)
-e3.add_transition(80, e4)
-e3.add_transition(81, e4)
-e3.add_transition(82, e4)
-e3.add_transition(83, e4)
-e3.add_transition(84, e4)
-e3.add_transition(85, e4)
-e3.add_transition(86, e4)
-e3.add_transition(87, e4)
-e3.add_transition(88, e4)
-e3.add_transition(89, e4)
-e3.add_transition(90, e4)
-e3.add_transition(91, e4)
-e3.add_transition(92, e4)
-e3.add_transition(93, e4)
-e3.add_transition(94, e4)
-e3.add_transition(95, e4)
-e3.add_transition(96, e4)
-e3.add_transition(97, e4)
-e3.add_transition(98, e4)
-e3.add_transition(99, e4)
-e3.add_transition(100, e4)
-e3.add_transition(101, e4)
-e3.add_transition(102, e4)
-e3.add_transition(103, e4)
-e3.add_transition(104, e4)
-e3.add_transition(105, e4)
-e3.add_transition(106, e4)
-e3.add_transition(107, e4)
-e3.add_transition(108, e4)
-e3.add_transition(109, e4)
-e3.add_transition(110, e4)
-e3.add_transition(111, e4)
-e3.add_transition(112, e4)
-e3.add_transition(113, e4)
-e3.add_transition(114, e4)
-e3.add_transition(115, e4)
-e3.add_transition(116, e4)
-e3.add_transition(117, e4)
-e3.add_transition(118, e4)
-e3.add_transition(119, e4)
-e3.add_transition(120, e4)
-e3.add_transition(121, e4)
-e3.add_transition(122, e4)
-e3.add_transition(123, e4)
-e3.add_transition(124, e4)
-e3.add_transition(125, e4)
-e3.add_transition(126, e4)
-e3.add_transition(127, e4)
-e3.add_transition(128, e4)
-e3.add_transition(129, e4)
-e3.add_transition(130, e4)
-e3.add_transition(131, e4)
-e3.add_transition(132, e4)
-e3.add_transition(133, e4)
-e3.add_transition(134, e4)
-e3.add_transition(135, e4)
-e3.add_transition(136, e4)
-e3.add_transition(137, e4)
-e3.add_transition(138, e4)
-e3.add_transition(139, e4)
-e3.add_transition(140, e4)
-e3.add_transition(141, e4)
-e3.add_transition(142, e4)
-e3.add_transition(143, e4)
-e3.add_transition(144, e4)
-e3.add_transition(145, e4)
-e3.add_transition(146, e4)
-e3.add_transition(147, e4)
-e3.add_transition(148, e4)
-e3.add_transition(149, e4)
-e3.add_transition(150, e4)
-e3.add_transition(151, e4)
-e3.add_transition(152, e4)
-e3.add_transition(153, e4)
-e3.add_transition(154, e4)
-e3.add_transition(155, e4)
-e3.add_transition(156, e4)
-e3.add_transition(157, e4)
-e3.add_transition(158, e4)
-e3.add_transition(159, e4)
-e3.add_transition(160, e4)
-e3.add_transition(161, e4)
-e3.add_transition(162, e4)
-e3.add_transition(163, e4)
-e3.add_transition(164, e4)
-e3.add_transition(165, e4)
-e3.add_transition(166, e4)
-e3.add_transition(167, e4)
-e3.add_transition(168, e4)
-e3.add_transition(169, e4)
-e3.add_transition(170, e4)
-e3.add_transition(171, e4)
-e3.add_transition(172, e4)
-e3.add_transition(173, e4)
-e3.add_transition(174, e4)
-e3.add_transition(175, e4)
-e3.add_transition(176, e4)
-e3.add_transition(177, e4)
-e3.add_transition(178, e4)
-e3.add_transition(179, e4)
-e3.add_transition(180, e4)
-e3.add_transition(181, e4)
-e3.add_transition(182, e4)
-e3.add_transition(183, e4)
-e3.add_transition(184, e4)
-e3.add_transition(185, e4)
-e3.add_transition(186, e4)
-e3.add_transition(187, e4)
-e3.add_transition(188, e4)
-e3.add_transition(189, e4)
-e3.add_transition(190, e4)
-e3.add_transition(191, e4)
-e3.add_transition(192, e4)
-e3.add_transition(193, e4)
-e3.add_transition(194, e4)
-e3.add_transition(195, e4)
-e3.add_transition(196, e4)
-e3.add_transition(197, e4)
-e3.add_transition(198, e4)
-e3.add_transition(199, e4)
-e3.add_transition(200, e4)
-e3.add_transition(201, e4)
-e3.add_transition(202, e4)
-e3.add_transition(203, e4)
-e3.add_transition(204, e4)
-e3.add_transition(205, e4)
-e3.add_transition(206, e4)
-e3.add_transition(207, e4)
-e3.add_transition(208, e4)
-e3.add_transition(209, e4)
-e3.add_transition(210, e4)
-e3.add_transition(211, e4)
-e3.add_transition(212, e4)
-e3.add_transition(213, e4)
-e3.add_transition(214, e4)
-e3.add_transition(215, e4)
-e3.add_transition(216, e4)
-e3.add_transition(217, e4)
-e3.add_transition(218, e4)
-e3.add_transition(219, e4)
-e3.add_transition(220, e4)
-e3.add_transition(221, e4)
-e3.add_transition(222, e4)
-e3.add_transition(223, e4)
-e3.add_transition(224, e4)
-e3.add_transition(225, e4)
-e3.add_transition(226, e4)
-e3.add_transition(227, e4)
-e3.add_transition(228, e4)
-e3.add_transition(229, e4)
-e3.add_transition(230, e4)
-e3.add_transition(231, e4)
-e3.add_transition(232, e4)
-e3.add_transition(233, e4)
-e3.add_transition(234, e4)
-e3.add_transition(235, e4)
-e3.add_transition(236, e4)
-e3.add_transition(237, e4)
-e3.add_transition(238, e4)
-e3.add_transition(239, e4)
-e3.add_transition(240, e4)
-e3.add_transition(241, e4)
-e3.add_transition(242, e4)
-e3.add_transition(243, e4)
-e3.add_transition(244, e4)
-e3.add_transition(245, e4)
-e3.add_transition(246, e4)
-e3.add_transition(247, e4)
-e3.add_transition(248, e4)
-e3.add_transition(249, e4)
-e3.add_transition(250, e4)
-e3.add_transition(251, e4)
-e3.add_transition(252, e4)
-e3.add_transition(253, e4)
-e3.add_transition(254, e4)
-e3.add_transition(255, e4)
-
-e8.add_transition(42, e13)
-e8.add_transition(47, e14)
-
-e13.add_transition(0, e6)
-e13.add_transition(1, e6)
-e13.add_transition(2, e6)
-e13.add_transition(3, e6)
-e13.add_transition(4, e6)
-e13.add_transition(5, e6)
-e13.add_transition(6, e6)
-e13.add_transition(7, e6)
-e13.add_transition(8, e6)
-e13.add_transition(9, e6)
-e13.add_transition(10, e6)
-e13.add_transition(11, e6)
-e13.add_transition(12, e6)
-e13.add_transition(13, e6)
-e13.add_transition(14, e6)
-e13.add_transition(15, e6)
-e13.add_transition(16, e6)
-e13.add_transition(17, e6)
-e13.add_transition(18, e6)
-e13.add_transition(19, e6)
-e13.add_transition(20, e6)
-e13.add_transition(21, e6)
-e13.add_transition(22, e6)
-e13.add_transition(23, e6)
-e13.add_transition(24, e6)
-e13.add_transition(25, e6)
-e13.add_transition(26, e6)
-e13.add_transition(27, e6)
-e13.add_transition(28, e6)
-e13.add_transition(29, e6)
-e13.add_transition(30, e6)
-e13.add_transition(31, e6)
-e13.add_transition(32, e6)
-e13.add_transition(33, e6)
-e13.add_transition(34, e6)
-e13.add_transition(35, e6)
-e13.add_transition(36, e6)
-e13.add_transition(37, e6)
-e13.add_transition(38, e6)
-e13.add_transition(39, e6)
-e13.add_transition(40, e6)
-e13.add_transition(41, e6)
-e13.add_transition(42, e6)
-e13.add_transition(43, e6)
-e13.add_transition(44, e6)
-e13.add_transition(45, e6)
-e13.add_transition(46, e6)
-e13.add_transition(48, e6)
-e13.add_transition(49, e6)
-e13.add_transition(50, e6)
-e13.add_transition(51, e6)
-e13.add_transition(52, e6)
-e13.add_transition(53, e6)
-e13.add_transition(54, e6)
-e13.add_transition(55, e6)
-e13.add_transition(56, e6)
-e13.add_transition(57, e6)
-e13.add_transition(58, e6)
-e13.add_transition(59, e6)
-e13.add_transition(60, e6)
-e13.add_transition(61, e6)
-e13.add_transition(62, e6)
-e13.add_transition(63, e6)
-e13.add_transition(64, e6)
-e13.add_transition(65, e6)
-e13.add_transition(66, e6)
-e13.add_transition(67, e6)
-e13.add_transition(68, e6)
-e13.add_transition(69, e6)
-e13.add_transition(70, e6)
-e13.add_transition(71, e6)
-e13.add_transition(72, e6)
-e13.add_transition(73, e6)
-e13.add_transition(74, e6)
-e13.add_transition(75, e6)
-e13.add_transition(76, e6)
-e13.add_transition(77, e6)
-e13.add_transition(78, e6)
-e13.add_transition(79, e6)
-e13.add_transition(80, e6)
-e13.add_transition(81, e6)
-e13.add_transition(82, e6)
-e13.add_transition(83, e6)
-e13.add_transition(84, e6)
-e13.add_transition(85, e6)
-e13.add_transition(86, e6)
-e13.add_transition(87, e6)
-e13.add_transition(88, e6)
-e13.add_transition(89, e6)
-e13.add_transition(90, e6)
-e13.add_transition(91, e6)
-e13.add_transition(92, e6)
-e13.add_transition(93, e6)
-e13.add_transition(94, e6)
-e13.add_transition(95, e6)
-e13.add_transition(96, e6)
-e13.add_transition(97, e6)
-e13.add_transition(98, e6)
-e13.add_transition(99, e6)
-e13.add_transition(100, e6)
-e13.add_transition(101, e6)
-e13.add_transition(102, e6)
-e13.add_transition(103, e6)
-e13.add_transition(104, e6)
-e13.add_transition(105, e6)
-e13.add_transition(106, e6)
-e13.add_transition(107, e6)
-e13.add_transition(108, e6)
-e13.add_transition(109, e6)
-e13.add_transition(110, e6)
-e13.add_transition(111, e6)
-e13.add_transition(112, e6)
-e13.add_transition(113, e6)
-e13.add_transition(114, e6)
-e13.add_transition(115, e6)
-e13.add_transition(116, e6)
-e13.add_transition(117, e6)
-e13.add_transition(118, e6)
-e13.add_transition(119, e6)
-e13.add_transition(120, e6)
-e13.add_transition(121, e6)
-e13.add_transition(122, e6)
-e13.add_transition(123, e6)
-e13.add_transition(124, e6)
-e13.add_transition(125, e6)
-e13.add_transition(126, e6)
-e13.add_transition(127, e6)
-e13.add_transition(128, e6)
-e13.add_transition(129, e6)
-e13.add_transition(130, e6)
-e13.add_transition(131, e6)
-e13.add_transition(132, e6)
-e13.add_transition(133, e6)
-e13.add_transition(134, e6)
-e13.add_transition(135, e6)
-e13.add_transition(136, e6)
-e13.add_transition(137, e6)
-e13.add_transition(138, e6)
-e13.add_transition(139, e6)
-e13.add_transition(140, e6)
-e13.add_transition(141, e6)
-e13.add_transition(142, e6)
-e13.add_transition(143, e6)
-e13.add_transition(144, e6)
-e13.add_transition(145, e6)
-e13.add_transition(146, e6)
-e13.add_transition(147, e6)
-e13.add_transition(148, e6)
-e13.add_transition(149, e6)
-e13.add_transition(150, e6)
-e13.add_transition(151, e6)
-e13.add_transition(152, e6)
-e13.add_transition(153, e6)
-e13.add_transition(154, e6)
-e13.add_transition(155, e6)
-e13.add_transition(156, e6)
-e13.add_transition(157, e6)
-e13.add_transition(158, e6)
-e13.add_transition(159, e6)
-e13.add_transition(160, e6)
-e13.add_transition(161, e6)
-e13.add_transition(162, e6)
-e13.add_transition(163, e6)
-e13.add_transition(164, e6)
-e13.add_transition(165, e6)
-e13.add_transition(166, e6)
-e13.add_transition(167, e6)
-e13.add_transition(168, e6)
-e13.add_transition(169, e6)
-e13.add_transition(170, e6)
-e13.add_transition(171, e6)
-e13.add_transition(172, e6)
-e13.add_transition(173, e6)
-e13.add_transition(174, e6)
-e13.add_transition(175, e6)
-e13.add_transition(176, e6)
-e13.add_transition(177, e6)
-e13.add_transition(178, e6)
-e13.add_transition(179, e6)
-e13.add_transition(180, e6)
-e13.add_transition(181, e6)
-e13.add_transition(182, e6)
-e13.add_transition(183, e6)
-e13.add_transition(184, e6)
-e13.add_transition(185, e6)
-e13.add_transition(186, e6)
-e13.add_transition(187, e6)
-e13.add_transition(188, e6)
-e13.add_transition(189, e6)
-e13.add_transition(190, e6)
-e13.add_transition(191, e6)
-e13.add_transition(192, e6)
-e13.add_transition(193, e6)
-e13.add_transition(194, e6)
-e13.add_transition(195, e6)
-e13.add_transition(196, e6)
-e13.add_transition(197, e6)
-e13.add_transition(198, e6)
-e13.add_transition(199, e6)
-e13.add_transition(200, e6)
-e13.add_transition(201, e6)
-e13.add_transition(202, e6)
-e13.add_transition(203, e6)
-e13.add_transition(204, e6)
-e13.add_transition(205, e6)
-e13.add_transition(206, e6)
-e13.add_transition(207, e6)
-e13.add_transition(208, e6)
-e13.add_transition(209, e6)
-e13.add_transition(210, e6)
-e13.add_transition(211, e6)
-e13.add_transition(212, e6)
-e13.add_transition(213, e6)
-e13.add_transition(214, e6)
-e13.add_transition(215, e6)
-e13.add_transition(216, e6)
-e13.add_transition(217, e6)
-e13.add_transition(218, e6)
-e13.add_transition(219, e6)
-e13.add_transition(220, e6)
-e13.add_transition(221, e6)
-e13.add_transition(222, e6)
-e13.add_transition(223, e6)
-e13.add_transition(224, e6)
-e13.add_transition(225, e6)
-e13.add_transition(226, e6)
-e13.add_transition(227, e6)
-e13.add_transition(228, e6)
-e13.add_transition(229, e6)
-e13.add_transition(230, e6)
-e13.add_transition(231, e6)
-e13.add_transition(232, e6)
-e13.add_transition(233, e6)
-e13.add_transition(234, e6)
-e13.add_transition(235, e6)
-e13.add_transition(236, e6)
-e13.add_transition(237, e6)
-e13.add_transition(238, e6)
-e13.add_transition(239, e6)
-e13.add_transition(240, e6)
-e13.add_transition(241, e6)
-e13.add_transition(242, e6)
-e13.add_transition(243, e6)
-e13.add_transition(244, e6)
-e13.add_transition(245, e6)
-e13.add_transition(246, e6)
-e13.add_transition(247, e6)
-e13.add_transition(248, e6)
-e13.add_transition(249, e6)
-e13.add_transition(250, e6)
-e13.add_transition(251, e6)
-e13.add_transition(252, e6)
-e13.add_transition(253, e6)
-e13.add_transition(254, e6)
-e13.add_transition(255, e6)
-
-e7.add_transition(0, e4)
-e7.add_transition(1, e4)
-e7.add_transition(2, e4)
-e7.add_transition(3, e4)
-e7.add_transition(4, e4)
-e7.add_transition(5, e4)
-e7.add_transition(6, e4)
-e7.add_transition(7, e4)
-e7.add_transition(8, e4)
-e7.add_transition(9, e4)
-e7.add_transition(10, e4)
-e7.add_transition(11, e4)
-e7.add_transition(12, e4)
-e7.add_transition(13, e4)
-e7.add_transition(14, e4)
-e7.add_transition(15, e4)
-e7.add_transition(16, e4)
-e7.add_transition(17, e4)
-e7.add_transition(18, e4)
-e7.add_transition(19, e4)
-e7.add_transition(20, e4)
-e7.add_transition(21, e4)
-e7.add_transition(22, e4)
-e7.add_transition(23, e4)
-e7.add_transition(24, e4)
-e7.add_transition(25, e4)
-e7.add_transition(26, e4)
-e7.add_transition(27, e4)
-e7.add_transition(28, e4)
-e7.add_transition(29, e4)
-e7.add_transition(30, e4)
-e7.add_transition(31, e4)
-e7.add_transition(32, e4)
-e7.add_transition(33, e4)
-e7.add_transition(34, e4)
-e7.add_transition(35, e4)
-e7.add_transition(36, e4)
-e7.add_transition(37, e4)
-e7.add_transition(38, e4)
-e7.add_transition(39, e4)
-e7.add_transition(40, e4)
-e7.add_transition(41, e4)
-e7.add_transition(42, e8)
-e7.add_transition(43, e4)
-e7.add_transition(44, e4)
-e7.add_transition(45, e4)
-e7.add_transition(46, e4)
-e7.add_transition(47, e11)
-e7.add_transition(48, e4)
-e7.add_transition(49, e4)
-e7.add_transition(50, e4)
-e7.add_transition(51, e4)
-e7.add_transition(52, e4)
-e7.add_transition(53, e4)
-e7.add_transition(54, e4)
-e7.add_transition(55, e4)
-e7.add_transition(56, e4)
-e7.add_transition(57, e4)
-e7.add_transition(58, e4)
-e7.add_transition(59, e4)
-e7.add_transition(60, e4)
-e7.add_transition(61, e4)
-e7.add_transition(62, e4)
-e7.add_transition(63, e4)
-e7.add_transition(64, e4)
-e7.add_transition(65, e4)
-e7.add_transition(66, e4)
-e7.add_transition(67, e4)
-e7.add_transition(68, e4)
-e7.add_transition(69, e4)
-e7.add_transition(70, e4)
-e7.add_transition(71, e4)
-e7.add_transition(72, e4)
-e7.add_transition(73, e4)
-e7.add_transition(74, e4)
-e7.add_transition(75, e4)
-e7.add_transition(76, e4)
-e7.add_transition(77, e4)
-e7.add_transition(78, e4)
-e7.add_transition(79, e4)
-e7.add_transition(80, e4)
-e7.add_transition(81, e4)
-e7.add_transition(82, e4)
-e7.add_transition(83, e4)
-e7.add_transition(84, e4)
-e7.add_transition(85, e4)
-e7.add_transition(86, e4)
-e7.add_transition(87, e4)
-e7.add_transition(88, e4)
-e7.add_transition(89, e4)
-e7.add_transition(90, e4)
-e7.add_transition(91, e4)
-e7.add_transition(92, e4)
-e7.add_transition(93, e4)
-e7.add_transition(94, e4)
-e7.add_transition(95, e4)
-e7.add_transition(96, e4)
-e7.add_transition(97, e4)
-e7.add_transition(98, e4)
-e7.add_transition(99, e4)
-e7.add_transition(100, e4)
-e7.add_transition(101, e4)
-e7.add_transition(102, e4)
-e7.add_transition(103, e4)
-e7.add_transition(104, e4)
-e7.add_transition(105, e4)
-e7.add_transition(106, e4)
-e7.add_transition(107, e4)
-e7.add_transition(108, e4)
-e7.add_transition(109, e4)
-e7.add_transition(110, e4)
-e7.add_transition(111, e4)
-e7.add_transition(112, e4)
-e7.add_transition(113, e4)
-e7.add_transition(114, e4)
-e7.add_transition(115, e4)
-e7.add_transition(116, e4)
-e7.add_transition(117, e4)
-e7.add_transition(118, e4)
-e7.add_transition(119, e4)
-e7.add_transition(120, e4)
-e7.add_transition(121, e4)
-e7.add_transition(122, e4)
-e7.add_transition(123, e4)
-e7.add_transition(124, e4)
-e7.add_transition(125, e4)
-e7.add_transition(126, e4)
-e7.add_transition(127, e4)
-e7.add_transition(128, e4)
-e7.add_transition(129, e4)
-e7.add_transition(130, e4)
-e7.add_transition(131, e4)
-e7.add_transition(132, e4)
-e7.add_transition(133, e4)
-e7.add_transition(134, e4)
-e7.add_transition(135, e4)
-e7.add_transition(136, e4)
-e7.add_transition(137, e4)
-e7.add_transition(138, e4)
-e7.add_transition(139, e4)
-e7.add_transition(140, e4)
-e7.add_transition(141, e4)
-e7.add_transition(142, e4)
-e7.add_transition(143, e4)
-e7.add_transition(144, e4)
-e7.add_transition(145, e4)
-e7.add_transition(146, e4)
-e7.add_transition(147, e4)
-e7.add_transition(148, e4)
-e7.add_transition(149, e4)
-e7.add_transition(150, e4)
-e7.add_transition(151, e4)
-e7.add_transition(152, e4)
-e7.add_transition(153, e4)
-e7.add_transition(154, e4)
-e7.add_transition(155, e4)
-e7.add_transition(156, e4)
-e7.add_transition(157, e4)
-e7.add_transition(158, e4)
-e7.add_transition(159, e4)
-e7.add_transition(160, e4)
-e7.add_transition(161, e4)
-e7.add_transition(162, e4)
-e7.add_transition(163, e4)
-e7.add_transition(164, e4)
-e7.add_transition(165, e4)
-e7.add_transition(166, e4)
-e7.add_transition(167, e4)
-e7.add_transition(168, e4)
-e7.add_transition(169, e4)
-e7.add_transition(170, e4)
-e7.add_transition(171, e4)
-e7.add_transition(172, e4)
-e7.add_transition(173, e4)
-e7.add_transition(174, e4)
-e7.add_transition(175, e4)
-e7.add_transition(176, e4)
-e7.add_transition(177, e4)
-e7.add_transition(178, e4)
-e7.add_transition(179, e4)
-e7.add_transition(180, e4)
-e7.add_transition(181, e4)
-e7.add_transition(182, e4)
-e7.add_transition(183, e4)
-e7.add_transition(184, e4)
-e7.add_transition(185, e4)
-e7.add_transition(186, e4)
-e7.add_transition(187, e4)
-e7.add_transition(188, e4)
-e7.add_transition(189, e4)
-e7.add_transition(190, e4)
-e7.add_transition(191, e4)
-e7.add_transition(192, e4)
-e7.add_transition(193, e4)
-e7.add_transition(194, e4)
-e7.add_transition(195, e4)
-e7.add_transition(196, e4)
-e7.add_transition(197, e4)
-e7.add_transition(198, e4)
-e7.add_transition(199, e4)
-e7.add_transition(200, e4)
-e7.add_transition(201, e4)
-e7.add_transition(202, e4)
-e7.add_transition(203, e4)
-e7.add_transition(204, e4)
-e7.add_transition(205, e4)
-e7.add_transition(206, e4)
-e7.add_transition(207, e4)
-e7.add_transition(208, e4)
-e7.add_transition(209, e4)
-e7.add_transition(210, e4)
-e7.add_transition(211, e4)
-e7.add_transition(212, e4)
-e7.add_transition(213, e4)
-e7.add_transition(214, e4)
-e7.add_transition(215, e4)
-e7.add_transition(216, e4)
-e7.add_transition(217, e4)
-e7.add_transition(218, e4)
-e7.add_transition(219, e4)
-e7.add_transition(220, e4)
-e7.add_transition(221, e4)
-e7.add_transition(222, e4)
-e7.add_transition(223, e4)
-e7.add_transition(224, e4)
-e7.add_transition(225, e4)
-e7.add_transition(226, e4)
-e7.add_transition(227, e4)
-e7.add_transition(228, e4)
-e7.add_transition(229, e4)
-e7.add_transition(230, e4)
-e7.add_transition(231, e4)
-e7.add_transition(232, e4)
-e7.add_transition(233, e4)
-e7.add_transition(234, e4)
-e7.add_transition(235, e4)
-e7.add_transition(236, e4)
-e7.add_transition(237, e4)
-e7.add_transition(238, e4)
-e7.add_transition(239, e4)
-e7.add_transition(240, e4)
-e7.add_transition(241, e4)
-e7.add_transition(242, e4)
-e7.add_transition(243, e4)
-e7.add_transition(244, e4)
-e7.add_transition(245, e4)
-e7.add_transition(246, e4)
-e7.add_transition(247, e4)
-e7.add_transition(248, e4)
-e7.add_transition(249, e4)
-e7.add_transition(250, e4)
-e7.add_transition(251, e4)
-e7.add_transition(252, e4)
-e7.add_transition(253, e4)
-e7.add_transition(254, e4)
-e7.add_transition(255, e4)
-
@@ -1,6936 +0,0 @@
-from Machines_gen_usage.Classes_ import State
-
-g4 = State('g4')
-g5 = State('g5')
-g3 = State('g3')
-g2 = State('g2')
-g1 = State('g1')
-d8 = State('d8')
-d7 = State('d7')
-d5 = State('d5')
-d4 = State('d4')
-d3 = State('d3')
-d11 = State('d11')
-d10 = State('d10')
-d9 = State('d9')
-d6 = State('d6')
-d1 = State('d1')
-d2 = State('d2')
-c8 = State('c8')
-c13 = State('c13')
-c12 = State('c12')
-c10 = State('c10')
-c11 = State('c11')
-c9 = State('c9')
-c14 = State('c14')
-c7 = State('c7')
-c6 = State('c6')
-c4 = State('c4')
-c5 = State('c5')
-c3 = State('c3')
-c2 = State('c2')
-c1 = State('c1')
-f1 = State('f1')
-b7 = State('b7')
-b6 = State('b6')
-b5 = State('b5')
-b4 = State('b4')
-b3 = State('b3')
-b2 = State('b2')
-b1 = State('b1')
-e7 = State('e7')
-e6 = State('e6')
-e3 = State('e3')
-e4 = State('e4')
-e2 = State('e2')
-e10 = State('e10')
-e9 = State('e9')
-e8 = State('e8')
-e5 = State('e5')
-e1 = State('e1')
-a4 = State('a4')
-a3 = State('a3')
-a2 = State('a2')
-a1 = State('a1')
-a0 = State('a0')
-a0.add_transition(40, a1)
-a0.add_transition(40, e1)
-a0.add_transition(114, e1)
-a0.add_transition(114, b1)
-a0.add_transition(114, f1)
-a0.add_transition(97, e1)
-a0.add_transition(97, f1)
-a0.add_transition(98, e1)
-a0.add_transition(98, f1)
-a0.add_transition(99, e1)
-a0.add_transition(99, f1)
-a0.add_transition(100, e1)
-a0.add_transition(100, f1)
-a0.add_transition(101, e1)
-a0.add_transition(101, f1)
-a0.add_transition(102, e1)
-a0.add_transition(102, f1)
-a0.add_transition(103, e1)
-a0.add_transition(103, f1)
-a0.add_transition(104, e1)
-a0.add_transition(104, f1)
-a0.add_transition(105, e1)
-a0.add_transition(105, f1)
-a0.add_transition(106, e1)
-a0.add_transition(106, f1)
-a0.add_transition(107, e1)
-a0.add_transition(107, f1)
-a0.add_transition(108, e1)
-a0.add_transition(108, c1)
-a0.add_transition(108, f1)
-a0.add_transition(109, e1)
-a0.add_transition(109, f1)
-a0.add_transition(110, e1)
-a0.add_transition(110, f1)
-a0.add_transition(111, e1)
-a0.add_transition(111, f1)
-a0.add_transition(112, e1)
-a0.add_transition(112, f1)
-a0.add_transition(113, e1)
-a0.add_transition(113, f1)
-a0.add_transition(115, e1)
-a0.add_transition(115, f1)
-a0.add_transition(116, e1)
-a0.add_transition(116, f1)
-a0.add_transition(117, e1)
-a0.add_transition(117, f1)
-a0.add_transition(118, e1)
-a0.add_transition(118, f1)
-a0.add_transition(119, e1)
-a0.add_transition(119, f1)
-a0.add_transition(120, e1)
-a0.add_transition(120, f1)
-a0.add_transition(121, e1)
-a0.add_transition(121, f1)
-a0.add_transition(122, e1)
-a0.add_transition(122, f1)
-a0.add_transition(124, d2)
-a0.add_transition(124, e1)
-a0.add_transition(123, g1)
-a0.add_transition(0, e1)
-a0.add_transition(1, e1)
-a0.add_transition(2, e1)
-a0.add_transition(3, e1)
-a0.add_transition(4, e1)
-a0.add_transition(5, e1)
-a0.add_transition(6, e1)
-a0.add_transition(7, e1)
-a0.add_transition(8, e1)
-a0.add_transition(11, e1)
-a0.add_transition(12, e1)
-a0.add_transition(13, e1)
-a0.add_transition(14, e1)
-a0.add_transition(15, e1)
-a0.add_transition(16, e1)
-a0.add_transition(17, e1)
-a0.add_transition(18, e1)
-a0.add_transition(19, e1)
-a0.add_transition(20, e1)
-a0.add_transition(21, e1)
-a0.add_transition(22, e1)
-a0.add_transition(23, e1)
-a0.add_transition(24, e1)
-a0.add_transition(25, e1)
-a0.add_transition(26, e1)
-a0.add_transition(27, e1)
-a0.add_transition(28, e1)
-a0.add_transition(29, e1)
-a0.add_transition(30, e1)
-a0.add_transition(31, e1)
-a0.add_transition(33, e1)
-a0.add_transition(34, e2)
-a0.add_transition(35, e1)
-a0.add_transition(36, e1)
-a0.add_transition(37, e1)
-a0.add_transition(38, e1)
-a0.add_transition(39, e3)
-a0.add_transition(41, e1)
-a0.add_transition(42, e1)
-a0.add_transition(43, e1)
-a0.add_transition(44, e1)
-a0.add_transition(45, e1)
-a0.add_transition(46, e1)
-a0.add_transition(47, e1)
-a0.add_transition(48, e1)
-a0.add_transition(49, e1)
-a0.add_transition(50, e1)
-a0.add_transition(51, e1)
-a0.add_transition(52, e1)
-a0.add_transition(53, e1)
-a0.add_transition(54, e1)
-a0.add_transition(55, e1)
-a0.add_transition(56, e1)
-a0.add_transition(57, e1)
-a0.add_transition(58, e1)
-a0.add_transition(59, e1)
-a0.add_transition(60, e1)
-a0.add_transition(61, e1)
-a0.add_transition(62, e1)
-a0.add_transition(63, e1)
-a0.add_transition(64, e1)
-a0.add_transition(65, e1)
-a0.add_transition(66, e1)
-a0.add_transition(67, e1)
-a0.add_transition(68, e1)
-a0.add_transition(69, e1)
-a0.add_transition(70, e1)
-a0.add_transition(71, e1)
-a0.add_transition(72, e1)
-a0.add_transition(73, e1)
-a0.add_transition(74, e1)
-a0.add_transition(75, e1)
-a0.add_transition(76, e1)
-a0.add_transition(77, e1)
-a0.add_transition(78, e1)
-a0.add_transition(79, e1)
-a0.add_transition(80, e1)
-a0.add_transition(81, e1)
-a0.add_transition(82, e1)
-a0.add_transition(83, e1)
-a0.add_transition(84, e1)
-a0.add_transition(85, e1)
-a0.add_transition(86, e1)
-a0.add_transition(87, e1)
-a0.add_transition(88, e1)
-a0.add_transition(89, e1)
-a0.add_transition(90, e1)
-a0.add_transition(91, e1)
-a0.add_transition(92, e1)
-a0.add_transition(93, e1)
-a0.add_transition(94, e1)
-a0.add_transition(95, e1)
-a0.add_transition(96, e1)
-a0.add_transition(126, e1)
-a0.add_transition(127, e1)
-a0.add_transition(128, e1)
-a0.add_transition(129, e1)
-a0.add_transition(130, e1)
-a0.add_transition(131, e1)
-a0.add_transition(132, e1)
-a0.add_transition(133, e1)
-a0.add_transition(134, e1)
-a0.add_transition(135, e1)
-a0.add_transition(136, e1)
-a0.add_transition(137, e1)
-a0.add_transition(138, e1)
-a0.add_transition(139, e1)
-a0.add_transition(140, e1)
-a0.add_transition(141, e1)
-a0.add_transition(142, e1)
-a0.add_transition(143, e1)
-a0.add_transition(144, e1)
-a0.add_transition(145, e1)
-a0.add_transition(146, e1)
-a0.add_transition(147, e1)
-a0.add_transition(148, e1)
-a0.add_transition(149, e1)
-a0.add_transition(150, e1)
-a0.add_transition(151, e1)
-a0.add_transition(152, e1)
-a0.add_transition(153, e1)
-a0.add_transition(154, e1)
-a0.add_transition(155, e1)
-a0.add_transition(156, e1)
-a0.add_transition(157, e1)
-a0.add_transition(158, e1)
-a0.add_transition(159, e1)
-a0.add_transition(160, e1)
-a0.add_transition(161, e1)
-a0.add_transition(162, e1)
-a0.add_transition(163, e1)
-a0.add_transition(164, e1)
-a0.add_transition(165, e1)
-a0.add_transition(166, e1)
-a0.add_transition(167, e1)
-a0.add_transition(168, e1)
-a0.add_transition(169, e1)
-a0.add_transition(170, e1)
-a0.add_transition(171, e1)
-a0.add_transition(172, e1)
-a0.add_transition(173, e1)
-a0.add_transition(174, e1)
-a0.add_transition(175, e1)
-a0.add_transition(176, e1)
-a0.add_transition(177, e1)
-a0.add_transition(178, e1)
-a0.add_transition(179, e1)
-a0.add_transition(180, e1)
-a0.add_transition(181, e1)
-a0.add_transition(182, e1)
-a0.add_transition(183, e1)
-a0.add_transition(184, e1)
-a0.add_transition(185, e1)
-a0.add_transition(186, e1)
-a0.add_transition(187, e1)
-a0.add_transition(188, e1)
-a0.add_transition(189, e1)
-a0.add_transition(190, e1)
-a0.add_transition(191, e1)
-a0.add_transition(192, e1)
-a0.add_transition(193, e1)
-a0.add_transition(194, e1)
-a0.add_transition(195, e1)
-a0.add_transition(196, e1)
-a0.add_transition(197, e1)
-a0.add_transition(198, e1)
-a0.add_transition(199, e1)
-a0.add_transition(200, e1)
-a0.add_transition(201, e1)
-a0.add_transition(202, e1)
-a0.add_transition(203, e1)
-a0.add_transition(204, e1)
-a0.add_transition(205, e1)
-a0.add_transition(206, e1)
-a0.add_transition(207, e1)
-a0.add_transition(208, e1)
-a0.add_transition(209, e1)
-a0.add_transition(210, e1)
-a0.add_transition(211, e1)
-a0.add_transition(212, e1)
-a0.add_transition(213, e1)
-a0.add_transition(214, e1)
-a0.add_transition(215, e1)
-a0.add_transition(216, e1)
-a0.add_transition(217, e1)
-a0.add_transition(218, e1)
-a0.add_transition(219, e1)
-a0.add_transition(220, e1)
-a0.add_transition(221, e1)
-a0.add_transition(222, e1)
-a0.add_transition(223, e1)
-a0.add_transition(224, e1)
-a0.add_transition(225, e1)
-a0.add_transition(226, e1)
-a0.add_transition(227, e1)
-a0.add_transition(228, e1)
-a0.add_transition(229, e1)
-a0.add_transition(230, e1)
-a0.add_transition(231, e1)
-a0.add_transition(232, e1)
-a0.add_transition(233, e1)
-a0.add_transition(234, e1)
-a0.add_transition(235, e1)
-a0.add_transition(236, e1)
-a0.add_transition(237, e1)
-a0.add_transition(238, e1)
-a0.add_transition(239, e1)
-a0.add_transition(240, e1)
-a0.add_transition(241, e1)
-a0.add_transition(242, e1)
-a0.add_transition(243, e1)
-a0.add_transition(244, e1)
-a0.add_transition(245, e1)
-a0.add_transition(246, e1)
-a0.add_transition(247, e1)
-a0.add_transition(248, e1)
-a0.add_transition(249, e1)
-a0.add_transition(250, e1)
-a0.add_transition(251, e1)
-a0.add_transition(252, e1)
-a0.add_transition(253, e1)
-a0.add_transition(254, e1)
-a0.add_transition(255, e1)
-
-a1.add_transition(42, a2)
-
-a2.add_transition(0, a2)
-a2.add_transition(1, a2)
-a2.add_transition(2, a2)
-a2.add_transition(3, a2)
-a2.add_transition(4, a2)
-a2.add_transition(5, a2)
-a2.add_transition(6, a2)
-a2.add_transition(7, a2)
-a2.add_transition(8, a2)
-a2.add_transition(9, a2)
-a2.add_transition(10, a2)
-a2.add_transition(11, a2)
-a2.add_transition(12, a2)
-a2.add_transition(13, a2)
-a2.add_transition(14, a2)
-a2.add_transition(15, a2)
-a2.add_transition(16, a2)
-a2.add_transition(17, a2)
-a2.add_transition(18, a2)
-a2.add_transition(19, a2)
-a2.add_transition(20, a2)
-a2.add_transition(21, a2)
-a2.add_transition(22, a2)
-a2.add_transition(23, a2)
-a2.add_transition(24, a2)
-a2.add_transition(25, a2)
-a2.add_transition(26, a2)
-a2.add_transition(27, a2)
-a2.add_transition(28, a2)
-a2.add_transition(29, a2)
-a2.add_transition(30, a2)
-a2.add_transition(31, a2)
-a2.add_transition(32, a2)
-a2.add_transition(33, a2)
-a2.add_transition(34, a2)
-a2.add_transition(35, a2)
-a2.add_transition(36, a2)
-a2.add_transition(37, a2)
-a2.add_transition(38, a2)
-a2.add_transition(39, a2)
-a2.add_transition(40, a2)
-a2.add_transition(42, a3)
-a2.add_transition(43, a2)
-a2.add_transition(44, a2)
-a2.add_transition(45, a2)
-a2.add_transition(46, a2)
-a2.add_transition(47, a2)
-a2.add_transition(48, a2)
-a2.add_transition(49, a2)
-a2.add_transition(50, a2)
-a2.add_transition(51, a2)
-a2.add_transition(52, a2)
-a2.add_transition(53, a2)
-a2.add_transition(54, a2)
-a2.add_transition(55, a2)
-a2.add_transition(56, a2)
-a2.add_transition(57, a2)
-a2.add_transition(58, a2)
-a2.add_transition(59, a2)
-a2.add_transition(60, a2)
-a2.add_transition(61, a2)
-a2.add_transition(62, a2)
-a2.add_transition(63, a2)
-a2.add_transition(64, a2)
-a2.add_transition(65, a2)
-a2.add_transition(66, a2)
-a2.add_transition(67, a2)
-a2.add_transition(68, a2)
-a2.add_transition(69, a2)
-a2.add_transition(70, a2)
-a2.add_transition(71, a2)
-a2.add_transition(72, a2)
-a2.add_transition(73, a2)
-a2.add_transition(74, a2)
-a2.add_transition(75, a2)
-a2.add_transition(76, a2)
-a2.add_transition(77, a2)
-a2.add_transition(78, a2)
-a2.add_transition(79, a2)
-a2.add_transition(80, a2)
-a2.add_transition(81, a2)
-a2.add_transition(82, a2)
-a2.add_transition(83, a2)
-a2.add_transition(84, a2)
-a2.add_transition(85, a2)
-a2.add_transition(86, a2)
-a2.add_transition(87, a2)
-a2.add_transition(88, a2)
-a2.add_transition(89, a2)
-a2.add_transition(90, a2)
-a2.add_transition(91, a2)
-a2.add_transition(92, a2)
-a2.add_transition(93, a2)
-a2.add_transition(94, a2)
-a2.add_transition(95, a2)
-a2.add_transition(96, a2)
-a2.add_transition(97, a2)
-a2.add_transition(98, a2)
-a2.add_transition(99, a2)
-a2.add_transition(100, a2)
-a2.add_transition(101, a2)
-a2.add_transition(102, a2)
-a2.add_transition(103, a2)
-a2.add_transition(104, a2)
-a2.add_transition(105, a2)
-a2.add_transition(106, a2)
-a2.add_transition(107, a2)
-a2.add_transition(108, a2)
-a2.add_transition(109, a2)
-a2.add_transition(110, a2)
-a2.add_transition(111, a2)
-a2.add_transition(112, a2)
-a2.add_transition(113, a2)
-a2.add_transition(114, a2)
-a2.add_transition(115, a2)
-a2.add_transition(116, a2)
-a2.add_transition(117, a2)
-a2.add_transition(118, a2)
-a2.add_transition(119, a2)
-a2.add_transition(120, a2)
-a2.add_transition(121, a2)
-a2.add_transition(122, a2)
-a2.add_transition(123, a2)
-a2.add_transition(124, a2)
-a2.add_transition(125, a2)
-a2.add_transition(126, a2)
-a2.add_transition(127, a2)
-a2.add_transition(128, a2)
-a2.add_transition(129, a2)
-a2.add_transition(130, a2)
-a2.add_transition(131, a2)
-a2.add_transition(132, a2)
-a2.add_transition(133, a2)
-a2.add_transition(134, a2)
-a2.add_transition(135, a2)
-a2.add_transition(136, a2)
-a2.add_transition(137, a2)
-a2.add_transition(138, a2)
-a2.add_transition(139, a2)
-a2.add_transition(140, a2)
-a2.add_transition(141, a2)
-a2.add_transition(142, a2)
-a2.add_transition(143, a2)
-a2.add_transition(144, a2)
-a2.add_transition(145, a2)
-a2.add_transition(146, a2)
-a2.add_transition(147, a2)
-a2.add_transition(148, a2)
-a2.add_transition(149, a2)
-a2.add_transition(150, a2)
-a2.add_transition(151, a2)
-a2.add_transition(152, a2)
-a2.add_transition(153, a2)
-a2.add_transition(154, a2)
-a2.add_transition(155, a2)
-a2.add_transition(156, a2)
-a2.add_transition(157, a2)
-a2.add_transition(158, a2)
-a2.add_transition(159, a2)
-a2.add_transition(160, a2)
-a2.add_transition(161, a2)
-a2.add_transition(162, a2)
-a2.add_transition(163, a2)
-a2.add_transition(164, a2)
-a2.add_transition(165, a2)
-a2.add_transition(166, a2)
-a2.add_transition(167, a2)
-a2.add_transition(168, a2)
-a2.add_transition(169, a2)
-a2.add_transition(170, a2)
-a2.add_transition(171, a2)
-a2.add_transition(172, a2)
-a2.add_transition(173, a2)
-a2.add_transition(174, a2)
-a2.add_transition(175, a2)
-a2.add_transition(176, a2)
-a2.add_transition(177, a2)
-a2.add_transition(178, a2)
-a2.add_transition(179, a2)
-a2.add_transition(180, a2)
-a2.add_transition(181, a2)
-a2.add_transition(182, a2)
-a2.add_transition(183, a2)
-a2.add_transition(184, a2)
-a2.add_transition(185, a2)
-a2.add_transition(186, a2)
-a2.add_transition(187, a2)
-a2.add_transition(188, a2)
-a2.add_transition(189, a2)
-a2.add_transition(190, a2)
-a2.add_transition(191, a2)
-a2.add_transition(192, a2)
-a2.add_transition(193, a2)
-a2.add_transition(194, a2)
-a2.add_transition(195, a2)
-a2.add_transition(196, a2)
-a2.add_transition(197, a2)
-a2.add_transition(198, a2)
-a2.add_transition(199, a2)
-a2.add_transition(200, a2)
-a2.add_transition(201, a2)
-a2.add_transition(202, a2)
-a2.add_transition(203, a2)
-a2.add_transition(204, a2)
-a2.add_transition(205, a2)
-a2.add_transition(206, a2)
-a2.add_transition(207, a2)
-a2.add_transition(208, a2)
-a2.add_transition(209, a2)
-a2.add_transition(210, a2)
-a2.add_transition(211, a2)
-a2.add_transition(212, a2)
-a2.add_transition(213, a2)
-a2.add_transition(214, a2)
-a2.add_transition(215, a2)
-a2.add_transition(216, a2)
-a2.add_transition(217, a2)
-a2.add_transition(218, a2)
-a2.add_transition(219, a2)
-a2.add_transition(220, a2)
-a2.add_transition(221, a2)
-a2.add_transition(222, a2)
-a2.add_transition(223, a2)
-a2.add_transition(224, a2)
-a2.add_transition(225, a2)
-a2.add_transition(226, a2)
-a2.add_transition(227, a2)
-a2.add_transition(228, a2)
-a2.add_transition(229, a2)
-a2.add_transition(230, a2)
-a2.add_transition(231, a2)
-a2.add_transition(232, a2)
-a2.add_transition(233, a2)
-a2.add_transition(234, a2)
-a2.add_transition(235, a2)
-a2.add_transition(236, a2)
-a2.add_transition(237, a2)
-a2.add_transition(238, a2)
-a2.add_transition(239, a2)
-a2.add_transition(240, a2)
-a2.add_transition(241, a2)
-a2.add_transition(242, a2)
-a2.add_transition(243, a2)
-a2.add_transition(244, a2)
-a2.add_transition(245, a2)
-a2.add_transition(246, a2)
-a2.add_transition(247, a2)
-a2.add_transition(248, a2)
-a2.add_transition(249, a2)
-a2.add_transition(250, a2)
-a2.add_transition(251, a2)
-a2.add_transition(252, a2)
-a2.add_transition(253, a2)
-a2.add_transition(254, a2)
-a2.add_transition(255, a2)
-
-a3.add_transition(0, a2)
-a3.add_transition(1, a2)
-a3.add_transition(2, a2)
-a3.add_transition(3, a2)
-a3.add_transition(4, a2)
-a3.add_transition(5, a2)
-a3.add_transition(6, a2)
-a3.add_transition(7, a2)
-a3.add_transition(8, a2)
-a3.add_transition(9, a2)
-a3.add_transition(10, a2)
-a3.add_transition(11, a2)
-a3.add_transition(12, a2)
-a3.add_transition(13, a2)
-a3.add_transition(14, a2)
-a3.add_transition(15, a2)
-a3.add_transition(16, a2)
-a3.add_transition(17, a2)
-a3.add_transition(18, a2)
-a3.add_transition(19, a2)
-a3.add_transition(20, a2)
-a3.add_transition(21, a2)
-a3.add_transition(22, a2)
-a3.add_transition(23, a2)
-a3.add_transition(24, a2)
-a3.add_transition(25, a2)
-a3.add_transition(26, a2)
-a3.add_transition(27, a2)
-a3.add_transition(28, a2)
-a3.add_transition(29, a2)
-a3.add_transition(30, a2)
-a3.add_transition(31, a2)
-a3.add_transition(32, a2)
-a3.add_transition(33, a2)
-a3.add_transition(34, a2)
-a3.add_transition(35, a2)
-a3.add_transition(36, a2)
-a3.add_transition(37, a2)
-a3.add_transition(38, a2)
-a3.add_transition(39, a2)
-a3.add_transition(40, a2)
-a3.add_transition(41, a4)
-a3.add_transition(42, a3)
-a3.add_transition(43, a2)
-a3.add_transition(44, a2)
-a3.add_transition(45, a2)
-a3.add_transition(46, a2)
-a3.add_transition(47, a2)
-a3.add_transition(48, a2)
-a3.add_transition(49, a2)
-a3.add_transition(50, a2)
-a3.add_transition(51, a2)
-a3.add_transition(52, a2)
-a3.add_transition(53, a2)
-a3.add_transition(54, a2)
-a3.add_transition(55, a2)
-a3.add_transition(56, a2)
-a3.add_transition(57, a2)
-a3.add_transition(58, a2)
-a3.add_transition(59, a2)
-a3.add_transition(60, a2)
-a3.add_transition(61, a2)
-a3.add_transition(62, a2)
-a3.add_transition(63, a2)
-a3.add_transition(64, a2)
-a3.add_transition(65, a2)
-a3.add_transition(66, a2)
-a3.add_transition(67, a2)
-a3.add_transition(68, a2)
-a3.add_transition(69, a2)
-a3.add_transition(70, a2)
-a3.add_transition(71, a2)
-a3.add_transition(72, a2)
-a3.add_transition(73, a2)
-a3.add_transition(74, a2)
-a3.add_transition(75, a2)
-a3.add_transition(76, a2)
-a3.add_transition(77, a2)
-a3.add_transition(78, a2)
-a3.add_transition(79, a2)
-a3.add_transition(80, a2)
-a3.add_transition(81, a2)
-a3.add_transition(82, a2)
-a3.add_transition(83, a2)
-a3.add_transition(84, a2)
-a3.add_transition(85, a2)
-a3.add_transition(86, a2)
-a3.add_transition(87, a2)
-a3.add_transition(88, a2)
-a3.add_transition(89, a2)
-a3.add_transition(90, a2)
-a3.add_transition(91, a2)
-a3.add_transition(92, a2)
-a3.add_transition(93, a2)
-a3.add_transition(94, a2)
-a3.add_transition(95, a2)
-a3.add_transition(96, a2)
-a3.add_transition(97, a2)
-a3.add_transition(98, a2)
-a3.add_transition(99, a2)
-a3.add_transition(100, a2)
-a3.add_transition(101, a2)
-a3.add_transition(102, a2)
-a3.add_transition(103, a2)
-a3.add_transition(104, a2)
-a3.add_transition(105, a2)
-a3.add_transition(106, a2)
-a3.add_transition(107, a2)
-a3.add_transition(108, a2)
-a3.add_transition(109, a2)
-a3.add_transition(110, a2)
-a3.add_transition(111, a2)
-a3.add_transition(112, a2)
-a3.add_transition(113, a2)
-a3.add_transition(114, a2)
-a3.add_transition(115, a2)
-a3.add_transition(116, a2)
-a3.add_transition(117, a2)
-a3.add_transition(118, a2)
-a3.add_transition(119, a2)
-a3.add_transition(120, a2)
-a3.add_transition(121, a2)
-a3.add_transition(122, a2)
-a3.add_transition(123, a2)
-a3.add_transition(124, a2)
-a3.add_transition(125, a2)
-a3.add_transition(126, a2)
-a3.add_transition(127, a2)
-a3.add_transition(128, a2)
-a3.add_transition(129, a2)
-a3.add_transition(130, a2)
-a3.add_transition(131, a2)
-a3.add_transition(132, a2)
-a3.add_transition(133, a2)
-a3.add_transition(134, a2)
-a3.add_transition(135, a2)
-a3.add_transition(136, a2)
-a3.add_transition(137, a2)
-a3.add_transition(138, a2)
-a3.add_transition(139, a2)
-a3.add_transition(140, a2)
-a3.add_transition(141, a2)
-a3.add_transition(142, a2)
-a3.add_transition(143, a2)
-a3.add_transition(144, a2)
-a3.add_transition(145, a2)
-a3.add_transition(146, a2)
-a3.add_transition(147, a2)
-a3.add_transition(148, a2)
-a3.add_transition(149, a2)
-a3.add_transition(150, a2)
-a3.add_transition(151, a2)
-a3.add_transition(152, a2)
-a3.add_transition(153, a2)
-a3.add_transition(154, a2)
-a3.add_transition(155, a2)
-a3.add_transition(156, a2)
-a3.add_transition(157, a2)
-a3.add_transition(158, a2)
-a3.add_transition(159, a2)
-a3.add_transition(160, a2)
-a3.add_transition(161, a2)
-a3.add_transition(162, a2)
-a3.add_transition(163, a2)
-a3.add_transition(164, a2)
-a3.add_transition(165, a2)
-a3.add_transition(166, a2)
-a3.add_transition(167, a2)
-a3.add_transition(168, a2)
-a3.add_transition(169, a2)
-a3.add_transition(170, a2)
-a3.add_transition(171, a2)
-a3.add_transition(172, a2)
-a3.add_transition(173, a2)
-a3.add_transition(174, a2)
-a3.add_transition(175, a2)
-a3.add_transition(176, a2)
-a3.add_transition(177, a2)
-a3.add_transition(178, a2)
-a3.add_transition(179, a2)
-a3.add_transition(180, a2)
-a3.add_transition(181, a2)
-a3.add_transition(182, a2)
-a3.add_transition(183, a2)
-a3.add_transition(184, a2)
-a3.add_transition(185, a2)
-a3.add_transition(186, a2)
-a3.add_transition(187, a2)
-a3.add_transition(188, a2)
-a3.add_transition(189, a2)
-a3.add_transition(190, a2)
-a3.add_transition(191, a2)
-a3.add_transition(192, a2)
-a3.add_transition(193, a2)
-a3.add_transition(194, a2)
-a3.add_transition(195, a2)
-a3.add_transition(196, a2)
-a3.add_transition(197, a2)
-a3.add_transition(198, a2)
-a3.add_transition(199, a2)
-a3.add_transition(200, a2)
-a3.add_transition(201, a2)
-a3.add_transition(202, a2)
-a3.add_transition(203, a2)
-a3.add_transition(204, a2)
-a3.add_transition(205, a2)
-a3.add_transition(206, a2)
-a3.add_transition(207, a2)
-a3.add_transition(208, a2)
-a3.add_transition(209, a2)
-a3.add_transition(210, a2)
-a3.add_transition(211, a2)
-a3.add_transition(212, a2)
-a3.add_transition(213, a2)
-a3.add_transition(214, a2)
-a3.add_transition(215, a2)
-a3.add_transition(216, a2)
-a3.add_transition(217, a2)
-a3.add_transition(218, a2)
-a3.add_transition(219, a2)
-a3.add_transition(220, a2)
-a3.add_transition(221, a2)
-a3.add_transition(222, a2)
-a3.add_transition(223, a2)
-a3.add_transition(224, a2)
-a3.add_transition(225, a2)
-a3.add_transition(226, a2)
-a3.add_transition(227, a2)
-a3.add_transition(228, a2)
-a3.add_transition(229, a2)
-a3.add_transition(230, a2)
-a3.add_transition(231, a2)
-a3.add_transition(232, a2)
-a3.add_transition(233, a2)
-a3.add_transition(234, a2)
-a3.add_transition(235, a2)
-a3.add_transition(236, a2)
-a3.add_transition(237, a2)
-a3.add_transition(238, a2)
-a3.add_transition(239, a2)
-a3.add_transition(240, a2)
-a3.add_transition(241, a2)
-a3.add_transition(242, a2)
-a3.add_transition(243, a2)
-a3.add_transition(244, a2)
-a3.add_transition(245, a2)
-a3.add_transition(246, a2)
-a3.add_transition(247, a2)
-a3.add_transition(248, a2)
-a3.add_transition(249, a2)
-a3.add_transition(250, a2)
-a3.add_transition(251, a2)
-a3.add_transition(252, a2)
-a3.add_transition(253, a2)
-a3.add_transition(254, a2)
-a3.add_transition(255, a2)
-
-a4.isFinalState = True
-a4.addToken( 'COMMENTARY')
-
-e1.add_transition(0, e1)
-e1.add_transition(1, e1)
-e1.add_transition(2, e1)
-e1.add_transition(3, e1)
-e1.add_transition(4, e1)
-e1.add_transition(5, e1)
-e1.add_transition(6, e1)
-e1.add_transition(7, e1)
-e1.add_transition(8, e1)
-e1.add_transition(11, e1)
-e1.add_transition(12, e1)
-e1.add_transition(13, e1)
-e1.add_transition(14, e1)
-e1.add_transition(15, e1)
-e1.add_transition(16, e1)
-e1.add_transition(17, e1)
-e1.add_transition(18, e1)
-e1.add_transition(19, e1)
-e1.add_transition(20, e1)
-e1.add_transition(21, e1)
-e1.add_transition(22, e1)
-e1.add_transition(23, e1)
-e1.add_transition(24, e1)
-e1.add_transition(25, e1)
-e1.add_transition(26, e1)
-e1.add_transition(27, e1)
-e1.add_transition(28, e1)
-e1.add_transition(29, e1)
-e1.add_transition(30, e1)
-e1.add_transition(31, e1)
-e1.add_transition(32, e5)
-e1.add_transition(33, e1)
-e1.add_transition(34, e2)
-e1.add_transition(35, e1)
-e1.add_transition(36, e1)
-e1.add_transition(37, e1)
-e1.add_transition(38, e1)
-e1.add_transition(39, e3)
-e1.add_transition(40, e1)
-e1.add_transition(41, e1)
-e1.add_transition(42, e1)
-e1.add_transition(43, e1)
-e1.add_transition(44, e1)
-e1.add_transition(45, e1)
-e1.add_transition(46, e1)
-e1.add_transition(47, e1)
-e1.add_transition(48, e1)
-e1.add_transition(49, e1)
-e1.add_transition(50, e1)
-e1.add_transition(51, e1)
-e1.add_transition(52, e1)
-e1.add_transition(53, e1)
-e1.add_transition(54, e1)
-e1.add_transition(55, e1)
-e1.add_transition(56, e1)
-e1.add_transition(57, e1)
-e1.add_transition(58, e1)
-e1.add_transition(59, e1)
-e1.add_transition(60, e1)
-e1.add_transition(61, e1)
-e1.add_transition(62, e1)
-e1.add_transition(63, e1)
-e1.add_transition(64, e1)
-e1.add_transition(65, e1)
-e1.add_transition(66, e1)
-e1.add_transition(67, e1)
-e1.add_transition(68, e1)
-e1.add_transition(69, e1)
-e1.add_transition(70, e1)
-e1.add_transition(71, e1)
-e1.add_transition(72, e1)
-e1.add_transition(73, e1)
-e1.add_transition(74, e1)
-e1.add_transition(75, e1)
-e1.add_transition(76, e1)
-e1.add_transition(77, e1)
-e1.add_transition(78, e1)
-e1.add_transition(79, e1)
-e1.add_transition(80, e1)
-e1.add_transition(81, e1)
-e1.add_transition(82, e1)
-e1.add_transition(83, e1)
-e1.add_transition(84, e1)
-e1.add_transition(85, e1)
-e1.add_transition(86, e1)
-e1.add_transition(87, e1)
-e1.add_transition(88, e1)
-e1.add_transition(89, e1)
-e1.add_transition(90, e1)
-e1.add_transition(91, e1)
-e1.add_transition(92, e1)
-e1.add_transition(93, e1)
-e1.add_transition(94, e1)
-e1.add_transition(95, e1)
-e1.add_transition(96, e1)
-e1.add_transition(97, e1)
-e1.add_transition(98, e1)
-e1.add_transition(99, e1)
-e1.add_transition(100, e1)
-e1.add_transition(101, e1)
-e1.add_transition(102, e1)
-e1.add_transition(103, e1)
-e1.add_transition(104, e1)
-e1.add_transition(105, e1)
-e1.add_transition(106, e1)
-e1.add_transition(107, e1)
-e1.add_transition(108, e1)
-e1.add_transition(109, e1)
-e1.add_transition(110, e1)
-e1.add_transition(111, e1)
-e1.add_transition(112, e1)
-e1.add_transition(113, e1)
-e1.add_transition(114, e1)
-e1.add_transition(115, e1)
-e1.add_transition(116, e1)
-e1.add_transition(117, e1)
-e1.add_transition(118, e1)
-e1.add_transition(119, e1)
-e1.add_transition(120, e1)
-e1.add_transition(121, e1)
-e1.add_transition(122, e1)
-e1.add_transition(124, e1)
-e1.add_transition(126, e1)
-e1.add_transition(127, e1)
-e1.add_transition(128, e1)
-e1.add_transition(129, e1)
-e1.add_transition(130, e1)
-e1.add_transition(131, e1)
-e1.add_transition(132, e1)
-e1.add_transition(133, e1)
-e1.add_transition(134, e1)
-e1.add_transition(135, e1)
-e1.add_transition(136, e1)
-e1.add_transition(137, e1)
-e1.add_transition(138, e1)
-e1.add_transition(139, e1)
-e1.add_transition(140, e1)
-e1.add_transition(141, e1)
-e1.add_transition(142, e1)
-e1.add_transition(143, e1)
-e1.add_transition(144, e1)
-e1.add_transition(145, e1)
-e1.add_transition(146, e1)
-e1.add_transition(147, e1)
-e1.add_transition(148, e1)
-e1.add_transition(149, e1)
-e1.add_transition(150, e1)
-e1.add_transition(151, e1)
-e1.add_transition(152, e1)
-e1.add_transition(153, e1)
-e1.add_transition(154, e1)
-e1.add_transition(155, e1)
-e1.add_transition(156, e1)
-e1.add_transition(157, e1)
-e1.add_transition(158, e1)
-e1.add_transition(159, e1)
-e1.add_transition(160, e1)
-e1.add_transition(161, e1)
-e1.add_transition(162, e1)
-e1.add_transition(163, e1)
-e1.add_transition(164, e1)
-e1.add_transition(165, e1)
-e1.add_transition(166, e1)
-e1.add_transition(167, e1)
-e1.add_transition(168, e1)
-e1.add_transition(169, e1)
-e1.add_transition(170, e1)
-e1.add_transition(171, e1)
-e1.add_transition(172, e1)
-e1.add_transition(173, e1)
-e1.add_transition(174, e1)
-e1.add_transition(175, e1)
-e1.add_transition(176, e1)
-e1.add_transition(177, e1)
-e1.add_transition(178, e1)
-e1.add_transition(179, e1)
-e1.add_transition(180, e1)
-e1.add_transition(181, e1)
-e1.add_transition(182, e1)
-e1.add_transition(183, e1)
-e1.add_transition(184, e1)
-e1.add_transition(185, e1)
-e1.add_transition(186, e1)
-e1.add_transition(187, e1)
-e1.add_transition(188, e1)
-e1.add_transition(189, e1)
-e1.add_transition(190, e1)
-e1.add_transition(191, e1)
-e1.add_transition(192, e1)
-e1.add_transition(193, e1)
-e1.add_transition(194, e1)
-e1.add_transition(195, e1)
-e1.add_transition(196, e1)
-e1.add_transition(197, e1)
-e1.add_transition(198, e1)
-e1.add_transition(199, e1)
-e1.add_transition(200, e1)
-e1.add_transition(201, e1)
-e1.add_transition(202, e1)
-e1.add_transition(203, e1)
-e1.add_transition(204, e1)
-e1.add_transition(205, e1)
-e1.add_transition(206, e1)
-e1.add_transition(207, e1)
-e1.add_transition(208, e1)
-e1.add_transition(209, e1)
-e1.add_transition(210, e1)
-e1.add_transition(211, e1)
-e1.add_transition(212, e1)
-e1.add_transition(213, e1)
-e1.add_transition(214, e1)
-e1.add_transition(215, e1)
-e1.add_transition(216, e1)
-e1.add_transition(217, e1)
-e1.add_transition(218, e1)
-e1.add_transition(219, e1)
-e1.add_transition(220, e1)
-e1.add_transition(221, e1)
-e1.add_transition(222, e1)
-e1.add_transition(223, e1)
-e1.add_transition(224, e1)
-e1.add_transition(225, e1)
-e1.add_transition(226, e1)
-e1.add_transition(227, e1)
-e1.add_transition(228, e1)
-e1.add_transition(229, e1)
-e1.add_transition(230, e1)
-e1.add_transition(231, e1)
-e1.add_transition(232, e1)
-e1.add_transition(233, e1)
-e1.add_transition(234, e1)
-e1.add_transition(235, e1)
-e1.add_transition(236, e1)
-e1.add_transition(237, e1)
-e1.add_transition(238, e1)
-e1.add_transition(239, e1)
-e1.add_transition(240, e1)
-e1.add_transition(241, e1)
-e1.add_transition(242, e1)
-e1.add_transition(243, e1)
-e1.add_transition(244, e1)
-e1.add_transition(245, e1)
-e1.add_transition(246, e1)
-e1.add_transition(247, e1)
-e1.add_transition(248, e1)
-e1.add_transition(249, e1)
-e1.add_transition(250, e1)
-e1.add_transition(251, e1)
-e1.add_transition(252, e1)
-e1.add_transition(253, e1)
-e1.add_transition(254, e1)
-e1.add_transition(255, e1)
-
-e5.add_transition(32, e5)
-e5.add_transition(123, e8)
-
-e8.add_transition(0, e9)
-e8.add_transition(1, e9)
-e8.add_transition(2, e9)
-e8.add_transition(3, e9)
-e8.add_transition(4, e9)
-e8.add_transition(5, e9)
-e8.add_transition(6, e9)
-e8.add_transition(7, e9)
-e8.add_transition(8, e9)
-e8.add_transition(9, e9)
-e8.add_transition(10, e9)
-e8.add_transition(11, e9)
-e8.add_transition(12, e9)
-e8.add_transition(13, e9)
-e8.add_transition(14, e9)
-e8.add_transition(15, e9)
-e8.add_transition(16, e9)
-e8.add_transition(17, e9)
-e8.add_transition(18, e9)
-e8.add_transition(19, e9)
-e8.add_transition(20, e9)
-e8.add_transition(21, e9)
-e8.add_transition(22, e9)
-e8.add_transition(23, e9)
-e8.add_transition(24, e9)
-e8.add_transition(25, e9)
-e8.add_transition(26, e9)
-e8.add_transition(27, e9)
-e8.add_transition(28, e9)
-e8.add_transition(29, e9)
-e8.add_transition(30, e9)
-e8.add_transition(31, e9)
-e8.add_transition(32, e9)
-e8.add_transition(33, e9)
-e8.add_transition(34, e9)
-e8.add_transition(35, e9)
-e8.add_transition(36, e9)
-e8.add_transition(37, e9)
-e8.add_transition(38, e9)
-e8.add_transition(39, e9)
-e8.add_transition(40, e9)
-e8.add_transition(41, e9)
-e8.add_transition(42, e9)
-e8.add_transition(43, e9)
-e8.add_transition(44, e9)
-e8.add_transition(45, e9)
-e8.add_transition(46, e9)
-e8.add_transition(47, e9)
-e8.add_transition(48, e9)
-e8.add_transition(49, e9)
-e8.add_transition(50, e9)
-e8.add_transition(51, e9)
-e8.add_transition(52, e9)
-e8.add_transition(53, e9)
-e8.add_transition(54, e9)
-e8.add_transition(55, e9)
-e8.add_transition(56, e9)
-e8.add_transition(57, e9)
-e8.add_transition(58, e9)
-e8.add_transition(59, e9)
-e8.add_transition(60, e9)
-e8.add_transition(61, e9)
-e8.add_transition(62, e9)
-e8.add_transition(63, e9)
-e8.add_transition(64, e9)
-e8.add_transition(65, e9)
-e8.add_transition(66, e9)
-e8.add_transition(67, e9)
-e8.add_transition(68, e9)
-e8.add_transition(69, e9)
-e8.add_transition(70, e9)
-e8.add_transition(71, e9)
-e8.add_transition(72, e9)
-e8.add_transition(73, e9)
-e8.add_transition(74, e9)
-e8.add_transition(75, e9)
-e8.add_transition(76, e9)
-e8.add_transition(77, e9)
-e8.add_transition(78, e9)
-e8.add_transition(79, e9)
-e8.add_transition(80, e9)
-e8.add_transition(81, e9)
-e8.add_transition(82, e9)
-e8.add_transition(83, e9)
-e8.add_transition(84, e9)
-e8.add_transition(85, e9)
-e8.add_transition(86, e9)
-e8.add_transition(87, e9)
-e8.add_transition(88, e9)
-e8.add_transition(89, e9)
-e8.add_transition(90, e9)
-e8.add_transition(91, e9)
-e8.add_transition(92, e9)
-e8.add_transition(93, e9)
-e8.add_transition(94, e9)
-e8.add_transition(95, e9)
-e8.add_transition(96, e9)
-e8.add_transition(97, e9)
-e8.add_transition(98, e9)
-e8.add_transition(99, e9)
-e8.add_transition(100, e9)
-e8.add_transition(101, e9)
-e8.add_transition(102, e9)
-e8.add_transition(103, e9)
-e8.add_transition(104, e9)
-e8.add_transition(105, e9)
-e8.add_transition(106, e9)
-e8.add_transition(107, e9)
-e8.add_transition(108, e9)
-e8.add_transition(109, e9)
-e8.add_transition(110, e9)
-e8.add_transition(111, e9)
-e8.add_transition(112, e9)
-e8.add_transition(113, e9)
-e8.add_transition(114, e9)
-e8.add_transition(115, e9)
-e8.add_transition(116, e9)
-e8.add_transition(117, e9)
-e8.add_transition(118, e9)
-e8.add_transition(119, e9)
-e8.add_transition(120, e9)
-e8.add_transition(121, e9)
-e8.add_transition(122, e9)
-e8.add_transition(124, e9)
-e8.add_transition(126, e9)
-e8.add_transition(127, e9)
-e8.add_transition(128, e9)
-e8.add_transition(129, e9)
-e8.add_transition(130, e9)
-e8.add_transition(131, e9)
-e8.add_transition(132, e9)
-e8.add_transition(133, e9)
-e8.add_transition(134, e9)
-e8.add_transition(135, e9)
-e8.add_transition(136, e9)
-e8.add_transition(137, e9)
-e8.add_transition(138, e9)
-e8.add_transition(139, e9)
-e8.add_transition(140, e9)
-e8.add_transition(141, e9)
-e8.add_transition(142, e9)
-e8.add_transition(143, e9)
-e8.add_transition(144, e9)
-e8.add_transition(145, e9)
-e8.add_transition(146, e9)
-e8.add_transition(147, e9)
-e8.add_transition(148, e9)
-e8.add_transition(149, e9)
-e8.add_transition(150, e9)
-e8.add_transition(151, e9)
-e8.add_transition(152, e9)
-e8.add_transition(153, e9)
-e8.add_transition(154, e9)
-e8.add_transition(155, e9)
-e8.add_transition(156, e9)
-e8.add_transition(157, e9)
-e8.add_transition(158, e9)
-e8.add_transition(159, e9)
-e8.add_transition(160, e9)
-e8.add_transition(161, e9)
-e8.add_transition(162, e9)
-e8.add_transition(163, e9)
-e8.add_transition(164, e9)
-e8.add_transition(165, e9)
-e8.add_transition(166, e9)
-e8.add_transition(167, e9)
-e8.add_transition(168, e9)
-e8.add_transition(169, e9)
-e8.add_transition(170, e9)
-e8.add_transition(171, e9)
-e8.add_transition(172, e9)
-e8.add_transition(173, e9)
-e8.add_transition(174, e9)
-e8.add_transition(175, e9)
-e8.add_transition(176, e9)
-e8.add_transition(177, e9)
-e8.add_transition(178, e9)
-e8.add_transition(179, e9)
-e8.add_transition(180, e9)
-e8.add_transition(181, e9)
-e8.add_transition(182, e9)
-e8.add_transition(183, e9)
-e8.add_transition(184, e9)
-e8.add_transition(185, e9)
-e8.add_transition(186, e9)
-e8.add_transition(187, e9)
-e8.add_transition(188, e9)
-e8.add_transition(189, e9)
-e8.add_transition(190, e9)
-e8.add_transition(191, e9)
-e8.add_transition(192, e9)
-e8.add_transition(193, e9)
-e8.add_transition(194, e9)
-e8.add_transition(195, e9)
-e8.add_transition(196, e9)
-e8.add_transition(197, e9)
-e8.add_transition(198, e9)
-e8.add_transition(199, e9)
-e8.add_transition(200, e9)
-e8.add_transition(201, e9)
-e8.add_transition(202, e9)
-e8.add_transition(203, e9)
-e8.add_transition(204, e9)
-e8.add_transition(205, e9)
-e8.add_transition(206, e9)
-e8.add_transition(207, e9)
-e8.add_transition(208, e9)
-e8.add_transition(209, e9)
-e8.add_transition(210, e9)
-e8.add_transition(211, e9)
-e8.add_transition(212, e9)
-e8.add_transition(213, e9)
-e8.add_transition(214, e9)
-e8.add_transition(215, e9)
-e8.add_transition(216, e9)
-e8.add_transition(217, e9)
-e8.add_transition(218, e9)
-e8.add_transition(219, e9)
-e8.add_transition(220, e9)
-e8.add_transition(221, e9)
-e8.add_transition(222, e9)
-e8.add_transition(223, e9)
-e8.add_transition(224, e9)
-e8.add_transition(225, e9)
-e8.add_transition(226, e9)
-e8.add_transition(227, e9)
-e8.add_transition(228, e9)
-e8.add_transition(229, e9)
-e8.add_transition(230, e9)
-e8.add_transition(231, e9)
-e8.add_transition(232, e9)
-e8.add_transition(233, e9)
-e8.add_transition(234, e9)
-e8.add_transition(235, e9)
-e8.add_transition(236, e9)
-e8.add_transition(237, e9)
-e8.add_transition(238, e9)
-e8.add_transition(239, e9)
-e8.add_transition(240, e9)
-e8.add_transition(241, e9)
-e8.add_transition(242, e9)
-e8.add_transition(243, e9)
-e8.add_transition(244, e9)
-e8.add_transition(245, e9)
-e8.add_transition(246, e9)
-e8.add_transition(247, e9)
-e8.add_transition(248, e9)
-e8.add_transition(249, e9)
-e8.add_transition(250, e9)
-e8.add_transition(251, e9)
-e8.add_transition(252, e9)
-e8.add_transition(253, e9)
-e8.add_transition(254, e9)
-e8.add_transition(255, e9)
-
-e9.add_transition(0, e9)
-e9.add_transition(1, e9)
-e9.add_transition(2, e9)
-e9.add_transition(3, e9)
-e9.add_transition(4, e9)
-e9.add_transition(5, e9)
-e9.add_transition(6, e9)
-e9.add_transition(7, e9)
-e9.add_transition(8, e9)
-e9.add_transition(9, e9)
-e9.add_transition(10, e9)
-e9.add_transition(11, e9)
-e9.add_transition(12, e9)
-e9.add_transition(13, e9)
-e9.add_transition(14, e9)
-e9.add_transition(15, e9)
-e9.add_transition(16, e9)
-e9.add_transition(17, e9)
-e9.add_transition(18, e9)
-e9.add_transition(19, e9)
-e9.add_transition(20, e9)
-e9.add_transition(21, e9)
-e9.add_transition(22, e9)
-e9.add_transition(23, e9)
-e9.add_transition(24, e9)
-e9.add_transition(25, e9)
-e9.add_transition(26, e9)
-e9.add_transition(27, e9)
-e9.add_transition(28, e9)
-e9.add_transition(29, e9)
-e9.add_transition(30, e9)
-e9.add_transition(31, e9)
-e9.add_transition(32, e9)
-e9.add_transition(33, e9)
-e9.add_transition(34, e9)
-e9.add_transition(35, e9)
-e9.add_transition(36, e9)
-e9.add_transition(37, e9)
-e9.add_transition(38, e9)
-e9.add_transition(39, e9)
-e9.add_transition(40, e9)
-e9.add_transition(41, e9)
-e9.add_transition(42, e9)
-e9.add_transition(43, e9)
-e9.add_transition(44, e9)
-e9.add_transition(45, e9)
-e9.add_transition(46, e9)
-e9.add_transition(47, e9)
-e9.add_transition(48, e9)
-e9.add_transition(49, e9)
-e9.add_transition(50, e9)
-e9.add_transition(51, e9)
-e9.add_transition(52, e9)
-e9.add_transition(53, e9)
-e9.add_transition(54, e9)
-e9.add_transition(55, e9)
-e9.add_transition(56, e9)
-e9.add_transition(57, e9)
-e9.add_transition(58, e9)
-e9.add_transition(59, e9)
-e9.add_transition(60, e9)
-e9.add_transition(61, e9)
-e9.add_transition(62, e9)
-e9.add_transition(63, e9)
-e9.add_transition(64, e9)
-e9.add_transition(65, e9)
-e9.add_transition(66, e9)
-e9.add_transition(67, e9)
-e9.add_transition(68, e9)
-e9.add_transition(69, e9)
-e9.add_transition(70, e9)
-e9.add_transition(71, e9)
-e9.add_transition(72, e9)
-e9.add_transition(73, e9)
-e9.add_transition(74, e9)
-e9.add_transition(75, e9)
-e9.add_transition(76, e9)
-e9.add_transition(77, e9)
-e9.add_transition(78, e9)
-e9.add_transition(79, e9)
-e9.add_transition(80, e9)
-e9.add_transition(81, e9)
-e9.add_transition(82, e9)
-e9.add_transition(83, e9)
-e9.add_transition(84, e9)
-e9.add_transition(85, e9)
-e9.add_transition(86, e9)
-e9.add_transition(87, e9)
-e9.add_transition(88, e9)
-e9.add_transition(89, e9)
-e9.add_transition(90, e9)
-e9.add_transition(91, e9)
-e9.add_transition(92, e9)
-e9.add_transition(93, e9)
-e9.add_transition(94, e9)
-e9.add_transition(95, e9)
-e9.add_transition(96, e9)
-e9.add_transition(97, e9)
-e9.add_transition(98, e9)
-e9.add_transition(99, e9)
-e9.add_transition(100, e9)
-e9.add_transition(101, e9)
-e9.add_transition(102, e9)
-e9.add_transition(103, e9)
-e9.add_transition(104, e9)
-e9.add_transition(105, e9)
-e9.add_transition(106, e9)
-e9.add_transition(107, e9)
-e9.add_transition(108, e9)
-e9.add_transition(109, e9)
-e9.add_transition(110, e9)
-e9.add_transition(111, e9)
-e9.add_transition(112, e9)
-e9.add_transition(113, e9)
-e9.add_transition(114, e9)
-e9.add_transition(115, e9)
-e9.add_transition(116, e9)
-e9.add_transition(117, e9)
-e9.add_transition(118, e9)
-e9.add_transition(119, e9)
-e9.add_transition(120, e9)
-e9.add_transition(121, e9)
-e9.add_transition(122, e9)
-e9.add_transition(124, e9)
-e9.add_transition(125, e10)
-e9.add_transition(126, e9)
-e9.add_transition(127, e9)
-e9.add_transition(128, e9)
-e9.add_transition(129, e9)
-e9.add_transition(130, e9)
-e9.add_transition(131, e9)
-e9.add_transition(132, e9)
-e9.add_transition(133, e9)
-e9.add_transition(134, e9)
-e9.add_transition(135, e9)
-e9.add_transition(136, e9)
-e9.add_transition(137, e9)
-e9.add_transition(138, e9)
-e9.add_transition(139, e9)
-e9.add_transition(140, e9)
-e9.add_transition(141, e9)
-e9.add_transition(142, e9)
-e9.add_transition(143, e9)
-e9.add_transition(144, e9)
-e9.add_transition(145, e9)
-e9.add_transition(146, e9)
-e9.add_transition(147, e9)
-e9.add_transition(148, e9)
-e9.add_transition(149, e9)
-e9.add_transition(150, e9)
-e9.add_transition(151, e9)
-e9.add_transition(152, e9)
-e9.add_transition(153, e9)
-e9.add_transition(154, e9)
-e9.add_transition(155, e9)
-e9.add_transition(156, e9)
-e9.add_transition(157, e9)
-e9.add_transition(158, e9)
-e9.add_transition(159, e9)
-e9.add_transition(160, e9)
-e9.add_transition(161, e9)
-e9.add_transition(162, e9)
-e9.add_transition(163, e9)
-e9.add_transition(164, e9)
-e9.add_transition(165, e9)
-e9.add_transition(166, e9)
-e9.add_transition(167, e9)
-e9.add_transition(168, e9)
-e9.add_transition(169, e9)
-e9.add_transition(170, e9)
-e9.add_transition(171, e9)
-e9.add_transition(172, e9)
-e9.add_transition(173, e9)
-e9.add_transition(174, e9)
-e9.add_transition(175, e9)
-e9.add_transition(176, e9)
-e9.add_transition(177, e9)
-e9.add_transition(178, e9)
-e9.add_transition(179, e9)
-e9.add_transition(180, e9)
-e9.add_transition(181, e9)
-e9.add_transition(182, e9)
-e9.add_transition(183, e9)
-e9.add_transition(184, e9)
-e9.add_transition(185, e9)
-e9.add_transition(186, e9)
-e9.add_transition(187, e9)
-e9.add_transition(188, e9)
-e9.add_transition(189, e9)
-e9.add_transition(190, e9)
-e9.add_transition(191, e9)
-e9.add_transition(192, e9)
-e9.add_transition(193, e9)
-e9.add_transition(194, e9)
-e9.add_transition(195, e9)
-e9.add_transition(196, e9)
-e9.add_transition(197, e9)
-e9.add_transition(198, e9)
-e9.add_transition(199, e9)
-e9.add_transition(200, e9)
-e9.add_transition(201, e9)
-e9.add_transition(202, e9)
-e9.add_transition(203, e9)
-e9.add_transition(204, e9)
-e9.add_transition(205, e9)
-e9.add_transition(206, e9)
-e9.add_transition(207, e9)
-e9.add_transition(208, e9)
-e9.add_transition(209, e9)
-e9.add_transition(210, e9)
-e9.add_transition(211, e9)
-e9.add_transition(212, e9)
-e9.add_transition(213, e9)
-e9.add_transition(214, e9)
-e9.add_transition(215, e9)
-e9.add_transition(216, e9)
-e9.add_transition(217, e9)
-e9.add_transition(218, e9)
-e9.add_transition(219, e9)
-e9.add_transition(220, e9)
-e9.add_transition(221, e9)
-e9.add_transition(222, e9)
-e9.add_transition(223, e9)
-e9.add_transition(224, e9)
-e9.add_transition(225, e9)
-e9.add_transition(226, e9)
-e9.add_transition(227, e9)
-e9.add_transition(228, e9)
-e9.add_transition(229, e9)
-e9.add_transition(230, e9)
-e9.add_transition(231, e9)
-e9.add_transition(232, e9)
-e9.add_transition(233, e9)
-e9.add_transition(234, e9)
-e9.add_transition(235, e9)
-e9.add_transition(236, e9)
-e9.add_transition(237, e9)
-e9.add_transition(238, e9)
-e9.add_transition(239, e9)
-e9.add_transition(240, e9)
-e9.add_transition(241, e9)
-e9.add_transition(242, e9)
-e9.add_transition(243, e9)
-e9.add_transition(244, e9)
-e9.add_transition(245, e9)
-e9.add_transition(246, e9)
-e9.add_transition(247, e9)
-e9.add_transition(248, e9)
-e9.add_transition(249, e9)
-e9.add_transition(250, e9)
-e9.add_transition(251, e9)
-e9.add_transition(252, e9)
-e9.add_transition(253, e9)
-e9.add_transition(254, e9)
-e9.add_transition(255, e9)
-
-e10.isFinalState = True
-e10.addToken( 'FIRST')
-
-e2.add_transition(0, e4)
-e2.add_transition(1, e4)
-e2.add_transition(2, e4)
-e2.add_transition(3, e4)
-e2.add_transition(4, e4)
-e2.add_transition(5, e4)
-e2.add_transition(6, e4)
-e2.add_transition(7, e4)
-e2.add_transition(8, e4)
-e2.add_transition(9, e4)
-e2.add_transition(10, e4)
-e2.add_transition(11, e4)
-e2.add_transition(12, e4)
-e2.add_transition(13, e4)
-e2.add_transition(14, e4)
-e2.add_transition(15, e4)
-e2.add_transition(16, e4)
-e2.add_transition(17, e4)
-e2.add_transition(18, e4)
-e2.add_transition(19, e4)
-e2.add_transition(20, e4)
-e2.add_transition(21, e4)
-e2.add_transition(22, e4)
-e2.add_transition(23, e4)
-e2.add_transition(24, e4)
-e2.add_transition(25, e4)
-e2.add_transition(26, e4)
-e2.add_transition(27, e4)
-e2.add_transition(28, e4)
-e2.add_transition(29, e4)
-e2.add_transition(30, e4)
-e2.add_transition(31, e4)
-e2.add_transition(32, e4)
-e2.add_transition(33, e4)
-e2.add_transition(35, e4)
-e2.add_transition(36, e4)
-e2.add_transition(37, e4)
-e2.add_transition(38, e4)
-e2.add_transition(39, e4)
-e2.add_transition(40, e4)
-e2.add_transition(41, e4)
-e2.add_transition(42, e4)
-e2.add_transition(43, e4)
-e2.add_transition(44, e4)
-e2.add_transition(45, e4)
-e2.add_transition(46, e4)
-e2.add_transition(47, e4)
-e2.add_transition(48, e4)
-e2.add_transition(49, e4)
-e2.add_transition(50, e4)
-e2.add_transition(51, e4)
-e2.add_transition(52, e4)
-e2.add_transition(53, e4)
-e2.add_transition(54, e4)
-e2.add_transition(55, e4)
-e2.add_transition(56, e4)
-e2.add_transition(57, e4)
-e2.add_transition(58, e4)
-e2.add_transition(59, e4)
-e2.add_transition(60, e4)
-e2.add_transition(61, e4)
-e2.add_transition(62, e4)
-e2.add_transition(63, e4)
-e2.add_transition(64, e4)
-e2.add_transition(65, e4)
-e2.add_transition(66, e4)
-e2.add_transition(67, e4)
-e2.add_transition(68, e4)
-e2.add_transition(69, e4)
-e2.add_transition(70, e4)
-e2.add_transition(71, e4)
-e2.add_transition(72, e4)
-e2.add_transition(73, e4)
-e2.add_transition(74, e4)
-e2.add_transition(75, e4)
-e2.add_transition(76, e4)
-e2.add_transition(77, e4)
-e2.add_transition(78, e4)
-e2.add_transition(79, e4)
-e2.add_transition(80, e4)
-e2.add_transition(81, e4)
-e2.add_transition(82, e4)
-e2.add_transition(83, e4)
-e2.add_transition(84, e4)
-e2.add_transition(85, e4)
-e2.add_transition(86, e4)
-e2.add_transition(87, e4)
-e2.add_transition(88, e4)
-e2.add_transition(89, e4)
-e2.add_transition(90, e4)
-e2.add_transition(91, e4)
-e2.add_transition(92, e4)
-e2.add_transition(93, e4)
-e2.add_transition(94, e4)
-e2.add_transition(95, e4)
-e2.add_transition(96, e4)
-e2.add_transition(97, e4)
-e2.add_transition(98, e4)
-e2.add_transition(99, e4)
-e2.add_transition(100, e4)
-e2.add_transition(101, e4)
-e2.add_transition(102, e4)
-e2.add_transition(103, e4)
-e2.add_transition(104, e4)
-e2.add_transition(105, e4)
-e2.add_transition(106, e4)
-e2.add_transition(107, e4)
-e2.add_transition(108, e4)
-e2.add_transition(109, e4)
-e2.add_transition(110, e4)
-e2.add_transition(111, e4)
-e2.add_transition(112, e4)
-e2.add_transition(113, e4)
-e2.add_transition(114, e4)
-e2.add_transition(115, e4)
-e2.add_transition(116, e4)
-e2.add_transition(117, e4)
-e2.add_transition(118, e4)
-e2.add_transition(119, e4)
-e2.add_transition(120, e4)
-e2.add_transition(121, e4)
-e2.add_transition(122, e4)
-e2.add_transition(123, e4)
-e2.add_transition(124, e4)
-e2.add_transition(125, e4)
-e2.add_transition(126, e4)
-e2.add_transition(127, e4)
-e2.add_transition(128, e4)
-e2.add_transition(129, e4)
-e2.add_transition(130, e4)
-e2.add_transition(131, e4)
-e2.add_transition(132, e4)
-e2.add_transition(133, e4)
-e2.add_transition(134, e4)
-e2.add_transition(135, e4)
-e2.add_transition(136, e4)
-e2.add_transition(137, e4)
-e2.add_transition(138, e4)
-e2.add_transition(139, e4)
-e2.add_transition(140, e4)
-e2.add_transition(141, e4)
-e2.add_transition(142, e4)
-e2.add_transition(143, e4)
-e2.add_transition(144, e4)
-e2.add_transition(145, e4)
-e2.add_transition(146, e4)
-e2.add_transition(147, e4)
-e2.add_transition(148, e4)
-e2.add_transition(149, e4)
-e2.add_transition(150, e4)
-e2.add_transition(151, e4)
-e2.add_transition(152, e4)
-e2.add_transition(153, e4)
-e2.add_transition(154, e4)
-e2.add_transition(155, e4)
-e2.add_transition(156, e4)
-e2.add_transition(157, e4)
-e2.add_transition(158, e4)
-e2.add_transition(159, e4)
-e2.add_transition(160, e4)
-e2.add_transition(161, e4)
-e2.add_transition(162, e4)
-e2.add_transition(163, e4)
-e2.add_transition(164, e4)
-e2.add_transition(165, e4)
-e2.add_transition(166, e4)
-e2.add_transition(167, e4)
-e2.add_transition(168, e4)
-e2.add_transition(169, e4)
-e2.add_transition(170, e4)
-e2.add_transition(171, e4)
-e2.add_transition(172, e4)
-e2.add_transition(173, e4)
-e2.add_transition(174, e4)
-e2.add_transition(175, e4)
-e2.add_transition(176, e4)
-e2.add_transition(177, e4)
-e2.add_transition(178, e4)
-e2.add_transition(179, e4)
-e2.add_transition(180, e4)
-e2.add_transition(181, e4)
-e2.add_transition(182, e4)
-e2.add_transition(183, e4)
-e2.add_transition(184, e4)
-e2.add_transition(185, e4)
-e2.add_transition(186, e4)
-e2.add_transition(187, e4)
-e2.add_transition(188, e4)
-e2.add_transition(189, e4)
-e2.add_transition(190, e4)
-e2.add_transition(191, e4)
-e2.add_transition(192, e4)
-e2.add_transition(193, e4)
-e2.add_transition(194, e4)
-e2.add_transition(195, e4)
-e2.add_transition(196, e4)
-e2.add_transition(197, e4)
-e2.add_transition(198, e4)
-e2.add_transition(199, e4)
-e2.add_transition(200, e4)
-e2.add_transition(201, e4)
-e2.add_transition(202, e4)
-e2.add_transition(203, e4)
-e2.add_transition(204, e4)
-e2.add_transition(205, e4)
-e2.add_transition(206, e4)
-e2.add_transition(207, e4)
-e2.add_transition(208, e4)
-e2.add_transition(209, e4)
-e2.add_transition(210, e4)
-e2.add_transition(211, e4)
-e2.add_transition(212, e4)
-e2.add_transition(213, e4)
-e2.add_transition(214, e4)
-e2.add_transition(215, e4)
-e2.add_transition(216, e4)
-e2.add_transition(217, e4)
-e2.add_transition(218, e4)
-e2.add_transition(219, e4)
-e2.add_transition(220, e4)
-e2.add_transition(221, e4)
-e2.add_transition(222, e4)
-e2.add_transition(223, e4)
-e2.add_transition(224, e4)
-e2.add_transition(225, e4)
-e2.add_transition(226, e4)
-e2.add_transition(227, e4)
-e2.add_transition(228, e4)
-e2.add_transition(229, e4)
-e2.add_transition(230, e4)
-e2.add_transition(231, e4)
-e2.add_transition(232, e4)
-e2.add_transition(233, e4)
-e2.add_transition(234, e4)
-e2.add_transition(235, e4)
-e2.add_transition(236, e4)
-e2.add_transition(237, e4)
-e2.add_transition(238, e4)
-e2.add_transition(239, e4)
-e2.add_transition(240, e4)
-e2.add_transition(241, e4)
-e2.add_transition(242, e4)
-e2.add_transition(243, e4)
-e2.add_transition(244, e4)
-e2.add_transition(245, e4)
-e2.add_transition(246, e4)
-e2.add_transition(247, e4)
-e2.add_transition(248, e4)
-e2.add_transition(249, e4)
-e2.add_transition(250, e4)
-e2.add_transition(251, e4)
-e2.add_transition(252, e4)
-e2.add_transition(253, e4)
-e2.add_transition(254, e4)
-e2.add_transition(255, e4)
-
-e4.add_transition(0, e4)
-e4.add_transition(1, e4)
-e4.add_transition(2, e4)
-e4.add_transition(3, e4)
-e4.add_transition(4, e4)
-e4.add_transition(5, e4)
-e4.add_transition(6, e4)
-e4.add_transition(7, e4)
-e4.add_transition(8, e4)
-e4.add_transition(9, e4)
-e4.add_transition(10, e4)
-e4.add_transition(11, e4)
-e4.add_transition(12, e4)
-e4.add_transition(13, e4)
-e4.add_transition(14, e4)
-e4.add_transition(15, e4)
-e4.add_transition(16, e4)
-e4.add_transition(17, e4)
-e4.add_transition(18, e4)
-e4.add_transition(19, e4)
-e4.add_transition(20, e4)
-e4.add_transition(21, e4)
-e4.add_transition(22, e4)
-e4.add_transition(23, e4)
-e4.add_transition(24, e4)
-e4.add_transition(25, e4)
-e4.add_transition(26, e4)
-e4.add_transition(27, e4)
-e4.add_transition(28, e4)
-e4.add_transition(29, e4)
-e4.add_transition(30, e4)
-e4.add_transition(31, e4)
-e4.add_transition(32, e4)
-e4.add_transition(33, e4)
-e4.add_transition(34, e1)
-e4.add_transition(35, e4)
-e4.add_transition(36, e4)
-e4.add_transition(37, e4)
-e4.add_transition(38, e4)
-e4.add_transition(39, e4)
-e4.add_transition(40, e4)
-e4.add_transition(41, e4)
-e4.add_transition(42, e4)
-e4.add_transition(43, e4)
-e4.add_transition(44, e4)
-e4.add_transition(45, e4)
-e4.add_transition(46, e4)
-e4.add_transition(47, e4)
-e4.add_transition(48, e4)
-e4.add_transition(49, e4)
-e4.add_transition(50, e4)
-e4.add_transition(51, e4)
-e4.add_transition(52, e4)
-e4.add_transition(53, e4)
-e4.add_transition(54, e4)
-e4.add_transition(55, e4)
-e4.add_transition(56, e4)
-e4.add_transition(57, e4)
-e4.add_transition(58, e4)
-e4.add_transition(59, e4)
-e4.add_transition(60, e4)
-e4.add_transition(61, e4)
-e4.add_transition(62, e4)
-e4.add_transition(63, e4)
-e4.add_transition(64, e4)
-e4.add_transition(65, e4)
-e4.add_transition(66, e4)
-e4.add_transition(67, e4)
-e4.add_transition(68, e4)
-e4.add_transition(69, e4)
-e4.add_transition(70, e4)
-e4.add_transition(71, e4)
-e4.add_transition(72, e4)
-e4.add_transition(73, e4)
-e4.add_transition(74, e4)
-e4.add_transition(75, e4)
-e4.add_transition(76, e4)
-e4.add_transition(77, e4)
-e4.add_transition(78, e4)
-e4.add_transition(79, e4)
-e4.add_transition(80, e4)
-e4.add_transition(81, e4)
-e4.add_transition(82, e4)
-e4.add_transition(83, e4)
-e4.add_transition(84, e4)
-e4.add_transition(85, e4)
-e4.add_transition(86, e4)
-e4.add_transition(87, e4)
-e4.add_transition(88, e4)
-e4.add_transition(89, e4)
-e4.add_transition(90, e4)
-e4.add_transition(91, e4)
-e4.add_transition(92, e4)
-e4.add_transition(93, e4)
-e4.add_transition(94, e4)
-e4.add_transition(95, e4)
-e4.add_transition(96, e4)
-e4.add_transition(97, e4)
-e4.add_transition(98, e4)
-e4.add_transition(99, e4)
-e4.add_transition(100, e4)
-e4.add_transition(101, e4)
-e4.add_transition(102, e4)
-e4.add_transition(103, e4)
-e4.add_transition(104, e4)
-e4.add_transition(105, e4)
-e4.add_transition(106, e4)
-e4.add_transition(107, e4)
-e4.add_transition(108, e4)
-e4.add_transition(109, e4)
-e4.add_transition(110, e4)
-e4.add_transition(111, e4)
-e4.add_transition(112, e4)
-e4.add_transition(113, e4)
-e4.add_transition(114, e4)
-e4.add_transition(115, e4)
-e4.add_transition(116, e4)
-e4.add_transition(117, e4)
-e4.add_transition(118, e4)
-e4.add_transition(119, e4)
-e4.add_transition(120, e4)
-e4.add_transition(121, e4)
-e4.add_transition(122, e4)
-e4.add_transition(123, e4)
-e4.add_transition(124, e4)
-e4.add_transition(125, e4)
-e4.add_transition(126, e4)
-e4.add_transition(127, e4)
-e4.add_transition(128, e4)
-e4.add_transition(129, e4)
-e4.add_transition(130, e4)
-e4.add_transition(131, e4)
-e4.add_transition(132, e4)
-e4.add_transition(133, e4)
-e4.add_transition(134, e4)
-e4.add_transition(135, e4)
-e4.add_transition(136, e4)
-e4.add_transition(137, e4)
-e4.add_transition(138, e4)
-e4.add_transition(139, e4)
-e4.add_transition(140, e4)
-e4.add_transition(141, e4)
-e4.add_transition(142, e4)
-e4.add_transition(143, e4)
-e4.add_transition(144, e4)
-e4.add_transition(145, e4)
-e4.add_transition(146, e4)
-e4.add_transition(147, e4)
-e4.add_transition(148, e4)
-e4.add_transition(149, e4)
-e4.add_transition(150, e4)
-e4.add_transition(151, e4)
-e4.add_transition(152, e4)
-e4.add_transition(153, e4)
-e4.add_transition(154, e4)
-e4.add_transition(155, e4)
-e4.add_transition(156, e4)
-e4.add_transition(157, e4)
-e4.add_transition(158, e4)
-e4.add_transition(159, e4)
-e4.add_transition(160, e4)
-e4.add_transition(161, e4)
-e4.add_transition(162, e4)
-e4.add_transition(163, e4)
-e4.add_transition(164, e4)
-e4.add_transition(165, e4)
-e4.add_transition(166, e4)
-e4.add_transition(167, e4)
-e4.add_transition(168, e4)
-e4.add_transition(169, e4)
-e4.add_transition(170, e4)
-e4.add_transition(171, e4)
-e4.add_transition(172, e4)
-e4.add_transition(173, e4)
-e4.add_transition(174, e4)
-e4.add_transition(175, e4)
-e4.add_transition(176, e4)
-e4.add_transition(177, e4)
-e4.add_transition(178, e4)
-e4.add_transition(179, e4)
-e4.add_transition(180, e4)
-e4.add_transition(181, e4)
-e4.add_transition(182, e4)
-e4.add_transition(183, e4)
-e4.add_transition(184, e4)
-e4.add_transition(185, e4)
-e4.add_transition(186, e4)
-e4.add_transition(187, e4)
-e4.add_transition(188, e4)
-e4.add_transition(189, e4)
-e4.add_transition(190, e4)
-e4.add_transition(191, e4)
-e4.add_transition(192, e4)
-e4.add_transition(193, e4)
-e4.add_transition(194, e4)
-e4.add_transition(195, e4)
-e4.add_transition(196, e4)
-e4.add_transition(197, e4)
-e4.add_transition(198, e4)
-e4.add_transition(199, e4)
-e4.add_transition(200, e4)
-e4.add_transition(201, e4)
-e4.add_transition(202, e4)
-e4.add_transition(203, e4)
-e4.add_transition(204, e4)
-e4.add_transition(205, e4)
-e4.add_transition(206, e4)
-e4.add_transition(207, e4)
-e4.add_transition(208, e4)
-e4.add_transition(209, e4)
-e4.add_transition(210, e4)
-e4.add_transition(211, e4)
-e4.add_transition(212, e4)
-e4.add_transition(213, e4)
-e4.add_transition(214, e4)
-e4.add_transition(215, e4)
-e4.add_transition(216, e4)
-e4.add_transition(217, e4)
-e4.add_transition(218, e4)
-e4.add_transition(219, e4)
-e4.add_transition(220, e4)
-e4.add_transition(221, e4)
-e4.add_transition(222, e4)
-e4.add_transition(223, e4)
-e4.add_transition(224, e4)
-e4.add_transition(225, e4)
-e4.add_transition(226, e4)
-e4.add_transition(227, e4)
-e4.add_transition(228, e4)
-e4.add_transition(229, e4)
-e4.add_transition(230, e4)
-e4.add_transition(231, e4)
-e4.add_transition(232, e4)
-e4.add_transition(233, e4)
-e4.add_transition(234, e4)
-e4.add_transition(235, e4)
-e4.add_transition(236, e4)
-e4.add_transition(237, e4)
-e4.add_transition(238, e4)
-e4.add_transition(239, e4)
-e4.add_transition(240, e4)
-e4.add_transition(241, e4)
-e4.add_transition(242, e4)
-e4.add_transition(243, e4)
-e4.add_transition(244, e4)
-e4.add_transition(245, e4)
-e4.add_transition(246, e4)
-e4.add_transition(247, e4)
-e4.add_transition(248, e4)
-e4.add_transition(249, e4)
-e4.add_transition(250, e4)
-e4.add_transition(251, e4)
-e4.add_transition(252, e4)
-e4.add_transition(253, e4)
-e4.add_transition(254, e4)
-e4.add_transition(255, e4)
-
-e3.add_transition(0, e6)
-e3.add_transition(1, e6)
-e3.add_transition(2, e6)
-e3.add_transition(3, e6)
-e3.add_transition(4, e6)
-e3.add_transition(5, e6)
-e3.add_transition(6, e6)
-e3.add_transition(7, e6)
-e3.add_transition(8, e6)
-e3.add_transition(9, e6)
-e3.add_transition(10, e6)
-e3.add_transition(11, e6)
-e3.add_transition(12, e6)
-e3.add_transition(13, e6)
-e3.add_transition(14, e6)
-e3.add_transition(15, e6)
-e3.add_transition(16, e6)
-e3.add_transition(17, e6)
-e3.add_transition(18, e6)
-e3.add_transition(19, e6)
-e3.add_transition(20, e6)
-e3.add_transition(21, e6)
-e3.add_transition(22, e6)
-e3.add_transition(23, e6)
-e3.add_transition(24, e6)
-e3.add_transition(25, e6)
-e3.add_transition(26, e6)
-e3.add_transition(27, e6)
-e3.add_transition(28, e6)
-e3.add_transition(29, e6)
-e3.add_transition(30, e6)
-e3.add_transition(31, e6)
-e3.add_transition(32, e6)
-e3.add_transition(33, e6)
-e3.add_transition(34, e6)
-e3.add_transition(35, e6)
-e3.add_transition(36, e6)
-e3.add_transition(37, e6)
-e3.add_transition(38, e6)
-e3.add_transition(39, e6)
-e3.add_transition(40, e6)
-e3.add_transition(41, e6)
-e3.add_transition(42, e6)
-e3.add_transition(43, e6)
-e3.add_transition(44, e6)
-e3.add_transition(45, e6)
-e3.add_transition(46, e6)
-e3.add_transition(47, e6)
-e3.add_transition(48, e6)
-e3.add_transition(49, e6)
-e3.add_transition(50, e6)
-e3.add_transition(51, e6)
-e3.add_transition(52, e6)
-e3.add_transition(53, e6)
-e3.add_transition(54, e6)
-e3.add_transition(55, e6)
-e3.add_transition(56, e6)
-e3.add_transition(57, e6)
-e3.add_transition(58, e6)
-e3.add_transition(59, e6)
-e3.add_transition(60, e6)
-e3.add_transition(61, e6)
-e3.add_transition(62, e6)
-e3.add_transition(63, e6)
-e3.add_transition(64, e6)
-e3.add_transition(65, e6)
-e3.add_transition(66, e6)
-e3.add_transition(67, e6)
-e3.add_transition(68, e6)
-e3.add_transition(69, e6)
-e3.add_transition(70, e6)
-e3.add_transition(71, e6)
-e3.add_transition(72, e6)
-e3.add_transition(73, e6)
-e3.add_transition(74, e6)
-e3.add_transition(75, e6)
-e3.add_transition(76, e6)
-e3.add_transition(77, e6)
-e3.add_transition(78, e6)
-e3.add_transition(79, e6)
-e3.add_transition(80, e6)
-e3.add_transition(81, e6)
-e3.add_transition(82, e6)
-e3.add_transition(83, e6)
-e3.add_transition(84, e6)
-e3.add_transition(85, e6)
-e3.add_transition(86, e6)
-e3.add_transition(87, e6)
-e3.add_transition(88, e6)
-e3.add_transition(89, e6)
-e3.add_transition(90, e6)
-e3.add_transition(91, e6)
-e3.add_transition(92, e7)
-e3.add_transition(93, e6)
-e3.add_transition(94, e6)
-e3.add_transition(95, e6)
-e3.add_transition(96, e6)
-e3.add_transition(97, e6)
-e3.add_transition(98, e6)
-e3.add_transition(99, e6)
-e3.add_transition(100, e6)
-e3.add_transition(101, e6)
-e3.add_transition(102, e6)
-e3.add_transition(103, e6)
-e3.add_transition(104, e6)
-e3.add_transition(105, e6)
-e3.add_transition(106, e6)
-e3.add_transition(107, e6)
-e3.add_transition(108, e6)
-e3.add_transition(109, e6)
-e3.add_transition(110, e6)
-e3.add_transition(111, e6)
-e3.add_transition(112, e6)
-e3.add_transition(113, e6)
-e3.add_transition(114, e6)
-e3.add_transition(115, e6)
-e3.add_transition(116, e6)
-e3.add_transition(117, e6)
-e3.add_transition(118, e6)
-e3.add_transition(119, e6)
-e3.add_transition(120, e6)
-e3.add_transition(121, e6)
-e3.add_transition(122, e6)
-e3.add_transition(123, e6)
-e3.add_transition(124, e6)
-e3.add_transition(125, e6)
-e3.add_transition(126, e6)
-e3.add_transition(127, e6)
-e3.add_transition(128, e6)
-e3.add_transition(129, e6)
-e3.add_transition(130, e6)
-e3.add_transition(131, e6)
-e3.add_transition(132, e6)
-e3.add_transition(133, e6)
-e3.add_transition(134, e6)
-e3.add_transition(135, e6)
-e3.add_transition(136, e6)
-e3.add_transition(137, e6)
-e3.add_transition(138, e6)
-e3.add_transition(139, e6)
-e3.add_transition(140, e6)
-e3.add_transition(141, e6)
-e3.add_transition(142, e6)
-e3.add_transition(143, e6)
-e3.add_transition(144, e6)
-e3.add_transition(145, e6)
-e3.add_transition(146, e6)
-e3.add_transition(147, e6)
-e3.add_transition(148, e6)
-e3.add_transition(149, e6)
-e3.add_transition(150, e6)
-e3.add_transition(151, e6)
-e3.add_transition(152, e6)
-e3.add_transition(153, e6)
-e3.add_transition(154, e6)
-e3.add_transition(155, e6)
-e3.add_transition(156, e6)
-e3.add_transition(157, e6)
-e3.add_transition(158, e6)
-e3.add_transition(159, e6)
-e3.add_transition(160, e6)
-e3.add_transition(161, e6)
-e3.add_transition(162, e6)
-e3.add_transition(163, e6)
-e3.add_transition(164, e6)
-e3.add_transition(165, e6)
-e3.add_transition(166, e6)
-e3.add_transition(167, e6)
-e3.add_transition(168, e6)
-e3.add_transition(169, e6)
-e3.add_transition(170, e6)
-e3.add_transition(171, e6)
-e3.add_transition(172, e6)
-e3.add_transition(173, e6)
-e3.add_transition(174, e6)
-e3.add_transition(175, e6)
-e3.add_transition(176, e6)
-e3.add_transition(177, e6)
-e3.add_transition(178, e6)
-e3.add_transition(179, e6)
-e3.add_transition(180, e6)
-e3.add_transition(181, e6)
-e3.add_transition(182, e6)
-e3.add_transition(183, e6)
-e3.add_transition(184, e6)
-e3.add_transition(185, e6)
-e3.add_transition(186, e6)
-e3.add_transition(187, e6)
-e3.add_transition(188, e6)
-e3.add_transition(189, e6)
-e3.add_transition(190, e6)
-e3.add_transition(191, e6)
-e3.add_transition(192, e6)
-e3.add_transition(193, e6)
-e3.add_transition(194, e6)
-e3.add_transition(195, e6)
-e3.add_transition(196, e6)
-e3.add_transition(197, e6)
-e3.add_transition(198, e6)
-e3.add_transition(199, e6)
-e3.add_transition(200, e6)
-e3.add_transition(201, e6)
-e3.add_transition(202, e6)
-e3.add_transition(203, e6)
-e3.add_transition(204, e6)
-e3.add_transition(205, e6)
-e3.add_transition(206, e6)
-e3.add_transition(207, e6)
-e3.add_transition(208, e6)
-e3.add_transition(209, e6)
-e3.add_transition(210, e6)
-e3.add_transition(211, e6)
-e3.add_transition(212, e6)
-e3.add_transition(213, e6)
-e3.add_transition(214, e6)
-e3.add_transition(215, e6)
-e3.add_transition(216, e6)
-e3.add_transition(217, e6)
-e3.add_transition(218, e6)
-e3.add_transition(219, e6)
-e3.add_transition(220, e6)
-e3.add_transition(221, e6)
-e3.add_transition(222, e6)
-e3.add_transition(223, e6)
-e3.add_transition(224, e6)
-e3.add_transition(225, e6)
-e3.add_transition(226, e6)
-e3.add_transition(227, e6)
-e3.add_transition(228, e6)
-e3.add_transition(229, e6)
-e3.add_transition(230, e6)
-e3.add_transition(231, e6)
-e3.add_transition(232, e6)
-e3.add_transition(233, e6)
-e3.add_transition(234, e6)
-e3.add_transition(235, e6)
-e3.add_transition(236, e6)
-e3.add_transition(237, e6)
-e3.add_transition(238, e6)
-e3.add_transition(239, e6)
-e3.add_transition(240, e6)
-e3.add_transition(241, e6)
-e3.add_transition(242, e6)
-e3.add_transition(243, e6)
-e3.add_transition(244, e6)
-e3.add_transition(245, e6)
-e3.add_transition(246, e6)
-e3.add_transition(247, e6)
-e3.add_transition(248, e6)
-e3.add_transition(249, e6)
-e3.add_transition(250, e6)
-e3.add_transition(251, e6)
-e3.add_transition(252, e6)
-e3.add_transition(253, e6)
-e3.add_transition(254, e6)
-e3.add_transition(255, e6)
-
-e6.add_transition(39, e1)
-
-e7.add_transition(39, e1)
-e7.add_transition(110, e6)
-e7.add_transition(115, e6)
-e7.add_transition(116, e6)
-e7.add_transition(118, e6)
-
-b1.add_transition(117, b2)
-
-b2.add_transition(108, b3)
-
-b3.add_transition(101, b4)
-
-b4.add_transition(32, b4)
-b4.add_transition(97, b5)
-b4.add_transition(98, b5)
-b4.add_transition(99, b5)
-b4.add_transition(100, b5)
-b4.add_transition(101, b5)
-b4.add_transition(102, b5)
-b4.add_transition(103, b5)
-b4.add_transition(104, b5)
-b4.add_transition(105, b5)
-b4.add_transition(106, b5)
-b4.add_transition(107, b5)
-b4.add_transition(108, b5)
-b4.add_transition(109, b5)
-b4.add_transition(110, b5)
-b4.add_transition(111, b5)
-b4.add_transition(112, b5)
-b4.add_transition(113, b5)
-b4.add_transition(114, b5)
-b4.add_transition(115, b5)
-b4.add_transition(116, b5)
-b4.add_transition(117, b5)
-b4.add_transition(118, b5)
-b4.add_transition(119, b5)
-b4.add_transition(120, b5)
-b4.add_transition(121, b5)
-b4.add_transition(122, b5)
-
-b5.add_transition(32, b6)
-b5.add_transition(61, b7)
-b5.add_transition(97, b5)
-b5.add_transition(98, b5)
-b5.add_transition(99, b5)
-b5.add_transition(100, b5)
-b5.add_transition(101, b5)
-b5.add_transition(102, b5)
-b5.add_transition(103, b5)
-b5.add_transition(104, b5)
-b5.add_transition(105, b5)
-b5.add_transition(106, b5)
-b5.add_transition(107, b5)
-b5.add_transition(108, b5)
-b5.add_transition(109, b5)
-b5.add_transition(110, b5)
-b5.add_transition(111, b5)
-b5.add_transition(112, b5)
-b5.add_transition(113, b5)
-b5.add_transition(114, b5)
-b5.add_transition(115, b5)
-b5.add_transition(116, b5)
-b5.add_transition(117, b5)
-b5.add_transition(118, b5)
-b5.add_transition(119, b5)
-b5.add_transition(120, b5)
-b5.add_transition(121, b5)
-b5.add_transition(122, b5)
-
-b6.add_transition(32, b6)
-b6.add_transition(61, b7)
-
-b7.isFinalState = True
-b7.addToken( 'RULES')
-
-f1.isFinalState = True
-f1.addToken( 'FIRST')
-f1.add_transition(97, f1)
-f1.add_transition(98, f1)
-f1.add_transition(99, f1)
-f1.add_transition(100, f1)
-f1.add_transition(101, f1)
-f1.add_transition(102, f1)
-f1.add_transition(103, f1)
-f1.add_transition(104, f1)
-f1.add_transition(105, f1)
-f1.add_transition(106, f1)
-f1.add_transition(107, f1)
-f1.add_transition(108, f1)
-f1.add_transition(109, f1)
-f1.add_transition(110, f1)
-f1.add_transition(111, f1)
-f1.add_transition(112, f1)
-f1.add_transition(113, f1)
-f1.add_transition(114, f1)
-f1.add_transition(115, f1)
-f1.add_transition(116, f1)
-f1.add_transition(117, f1)
-f1.add_transition(118, f1)
-f1.add_transition(119, f1)
-f1.add_transition(120, f1)
-f1.add_transition(121, f1)
-f1.add_transition(122, f1)
-
-c1.add_transition(101, c2)
-
-c2.add_transition(116, c3)
-
-c3.add_transition(32, c5)
-
-c5.add_transition(32, c5)
-c5.add_transition(97, c4)
-c5.add_transition(98, c4)
-c5.add_transition(99, c4)
-c5.add_transition(100, c4)
-c5.add_transition(101, c4)
-c5.add_transition(102, c4)
-c5.add_transition(103, c4)
-c5.add_transition(104, c4)
-c5.add_transition(105, c4)
-c5.add_transition(106, c4)
-c5.add_transition(107, c4)
-c5.add_transition(108, c4)
-c5.add_transition(109, c4)
-c5.add_transition(110, c4)
-c5.add_transition(111, c4)
-c5.add_transition(112, c4)
-c5.add_transition(113, c4)
-c5.add_transition(114, c4)
-c5.add_transition(115, c4)
-c5.add_transition(116, c4)
-c5.add_transition(117, c4)
-c5.add_transition(118, c4)
-c5.add_transition(119, c4)
-c5.add_transition(120, c4)
-c5.add_transition(121, c4)
-c5.add_transition(122, c4)
-
-c4.add_transition(32, c6)
-c4.add_transition(97, c4)
-c4.add_transition(98, c4)
-c4.add_transition(99, c4)
-c4.add_transition(100, c4)
-c4.add_transition(101, c4)
-c4.add_transition(102, c4)
-c4.add_transition(103, c4)
-c4.add_transition(104, c4)
-c4.add_transition(105, c4)
-c4.add_transition(106, c4)
-c4.add_transition(107, c4)
-c4.add_transition(108, c4)
-c4.add_transition(109, c4)
-c4.add_transition(110, c4)
-c4.add_transition(111, c4)
-c4.add_transition(112, c4)
-c4.add_transition(113, c4)
-c4.add_transition(114, c4)
-c4.add_transition(115, c4)
-c4.add_transition(116, c4)
-c4.add_transition(117, c4)
-c4.add_transition(118, c4)
-c4.add_transition(119, c4)
-c4.add_transition(120, c4)
-c4.add_transition(121, c4)
-c4.add_transition(122, c4)
-
-c6.add_transition(32, c6)
-c6.add_transition(61, c7)
-
-c7.add_transition(0, c14)
-c7.add_transition(1, c14)
-c7.add_transition(2, c14)
-c7.add_transition(3, c14)
-c7.add_transition(4, c14)
-c7.add_transition(5, c14)
-c7.add_transition(6, c14)
-c7.add_transition(7, c14)
-c7.add_transition(8, c14)
-c7.add_transition(10, c8)
-c7.add_transition(11, c14)
-c7.add_transition(12, c14)
-c7.add_transition(13, c14)
-c7.add_transition(14, c14)
-c7.add_transition(15, c14)
-c7.add_transition(16, c14)
-c7.add_transition(17, c14)
-c7.add_transition(18, c14)
-c7.add_transition(19, c14)
-c7.add_transition(20, c14)
-c7.add_transition(21, c14)
-c7.add_transition(22, c14)
-c7.add_transition(23, c14)
-c7.add_transition(24, c14)
-c7.add_transition(25, c14)
-c7.add_transition(26, c14)
-c7.add_transition(27, c14)
-c7.add_transition(28, c14)
-c7.add_transition(29, c14)
-c7.add_transition(30, c14)
-c7.add_transition(31, c14)
-c7.add_transition(32, c7)
-c7.add_transition(33, c14)
-c7.add_transition(34, c9)
-c7.add_transition(35, c14)
-c7.add_transition(36, c14)
-c7.add_transition(37, c14)
-c7.add_transition(38, c14)
-c7.add_transition(39, c10)
-c7.add_transition(40, c14)
-c7.add_transition(41, c14)
-c7.add_transition(42, c14)
-c7.add_transition(43, c14)
-c7.add_transition(44, c14)
-c7.add_transition(45, c14)
-c7.add_transition(46, c14)
-c7.add_transition(47, c14)
-c7.add_transition(48, c14)
-c7.add_transition(49, c14)
-c7.add_transition(50, c14)
-c7.add_transition(51, c14)
-c7.add_transition(52, c14)
-c7.add_transition(53, c14)
-c7.add_transition(54, c14)
-c7.add_transition(55, c14)
-c7.add_transition(56, c14)
-c7.add_transition(57, c14)
-c7.add_transition(58, c14)
-c7.add_transition(59, c14)
-c7.add_transition(60, c14)
-c7.add_transition(61, c14)
-c7.add_transition(62, c14)
-c7.add_transition(63, c14)
-c7.add_transition(64, c14)
-c7.add_transition(65, c14)
-c7.add_transition(66, c14)
-c7.add_transition(67, c14)
-c7.add_transition(68, c14)
-c7.add_transition(69, c14)
-c7.add_transition(70, c14)
-c7.add_transition(71, c14)
-c7.add_transition(72, c14)
-c7.add_transition(73, c14)
-c7.add_transition(74, c14)
-c7.add_transition(75, c14)
-c7.add_transition(76, c14)
-c7.add_transition(77, c14)
-c7.add_transition(78, c14)
-c7.add_transition(79, c14)
-c7.add_transition(80, c14)
-c7.add_transition(81, c14)
-c7.add_transition(82, c14)
-c7.add_transition(83, c14)
-c7.add_transition(84, c14)
-c7.add_transition(85, c14)
-c7.add_transition(86, c14)
-c7.add_transition(87, c14)
-c7.add_transition(88, c14)
-c7.add_transition(89, c14)
-c7.add_transition(90, c14)
-c7.add_transition(91, c14)
-c7.add_transition(92, c14)
-c7.add_transition(93, c14)
-c7.add_transition(94, c14)
-c7.add_transition(95, c14)
-c7.add_transition(96, c14)
-c7.add_transition(97, c14)
-c7.add_transition(98, c14)
-c7.add_transition(99, c14)
-c7.add_transition(100, c14)
-c7.add_transition(101, c14)
-c7.add_transition(102, c14)
-c7.add_transition(103, c14)
-c7.add_transition(104, c14)
-c7.add_transition(105, c14)
-c7.add_transition(106, c14)
-c7.add_transition(107, c14)
-c7.add_transition(108, c14)
-c7.add_transition(109, c14)
-c7.add_transition(110, c14)
-c7.add_transition(111, c14)
-c7.add_transition(112, c14)
-c7.add_transition(113, c14)
-c7.add_transition(114, c14)
-c7.add_transition(115, c14)
-c7.add_transition(116, c14)
-c7.add_transition(117, c14)
-c7.add_transition(118, c14)
-c7.add_transition(119, c14)
-c7.add_transition(120, c14)
-c7.add_transition(121, c14)
-c7.add_transition(122, c14)
-c7.add_transition(124, c14)
-c7.add_transition(126, c14)
-c7.add_transition(127, c14)
-c7.add_transition(128, c14)
-c7.add_transition(129, c14)
-c7.add_transition(130, c14)
-c7.add_transition(131, c14)
-c7.add_transition(132, c14)
-c7.add_transition(133, c14)
-c7.add_transition(134, c14)
-c7.add_transition(135, c14)
-c7.add_transition(136, c14)
-c7.add_transition(137, c14)
-c7.add_transition(138, c14)
-c7.add_transition(139, c14)
-c7.add_transition(140, c14)
-c7.add_transition(141, c14)
-c7.add_transition(142, c14)
-c7.add_transition(143, c14)
-c7.add_transition(144, c14)
-c7.add_transition(145, c14)
-c7.add_transition(146, c14)
-c7.add_transition(147, c14)
-c7.add_transition(148, c14)
-c7.add_transition(149, c14)
-c7.add_transition(150, c14)
-c7.add_transition(151, c14)
-c7.add_transition(152, c14)
-c7.add_transition(153, c14)
-c7.add_transition(154, c14)
-c7.add_transition(155, c14)
-c7.add_transition(156, c14)
-c7.add_transition(157, c14)
-c7.add_transition(158, c14)
-c7.add_transition(159, c14)
-c7.add_transition(160, c14)
-c7.add_transition(161, c14)
-c7.add_transition(162, c14)
-c7.add_transition(163, c14)
-c7.add_transition(164, c14)
-c7.add_transition(165, c14)
-c7.add_transition(166, c14)
-c7.add_transition(167, c14)
-c7.add_transition(168, c14)
-c7.add_transition(169, c14)
-c7.add_transition(170, c14)
-c7.add_transition(171, c14)
-c7.add_transition(172, c14)
-c7.add_transition(173, c14)
-c7.add_transition(174, c14)
-c7.add_transition(175, c14)
-c7.add_transition(176, c14)
-c7.add_transition(177, c14)
-c7.add_transition(178, c14)
-c7.add_transition(179, c14)
-c7.add_transition(180, c14)
-c7.add_transition(181, c14)
-c7.add_transition(182, c14)
-c7.add_transition(183, c14)
-c7.add_transition(184, c14)
-c7.add_transition(185, c14)
-c7.add_transition(186, c14)
-c7.add_transition(187, c14)
-c7.add_transition(188, c14)
-c7.add_transition(189, c14)
-c7.add_transition(190, c14)
-c7.add_transition(191, c14)
-c7.add_transition(192, c14)
-c7.add_transition(193, c14)
-c7.add_transition(194, c14)
-c7.add_transition(195, c14)
-c7.add_transition(196, c14)
-c7.add_transition(197, c14)
-c7.add_transition(198, c14)
-c7.add_transition(199, c14)
-c7.add_transition(200, c14)
-c7.add_transition(201, c14)
-c7.add_transition(202, c14)
-c7.add_transition(203, c14)
-c7.add_transition(204, c14)
-c7.add_transition(205, c14)
-c7.add_transition(206, c14)
-c7.add_transition(207, c14)
-c7.add_transition(208, c14)
-c7.add_transition(209, c14)
-c7.add_transition(210, c14)
-c7.add_transition(211, c14)
-c7.add_transition(212, c14)
-c7.add_transition(213, c14)
-c7.add_transition(214, c14)
-c7.add_transition(215, c14)
-c7.add_transition(216, c14)
-c7.add_transition(217, c14)
-c7.add_transition(218, c14)
-c7.add_transition(219, c14)
-c7.add_transition(220, c14)
-c7.add_transition(221, c14)
-c7.add_transition(222, c14)
-c7.add_transition(223, c14)
-c7.add_transition(224, c14)
-c7.add_transition(225, c14)
-c7.add_transition(226, c14)
-c7.add_transition(227, c14)
-c7.add_transition(228, c14)
-c7.add_transition(229, c14)
-c7.add_transition(230, c14)
-c7.add_transition(231, c14)
-c7.add_transition(232, c14)
-c7.add_transition(233, c14)
-c7.add_transition(234, c14)
-c7.add_transition(235, c14)
-c7.add_transition(236, c14)
-c7.add_transition(237, c14)
-c7.add_transition(238, c14)
-c7.add_transition(239, c14)
-c7.add_transition(240, c14)
-c7.add_transition(241, c14)
-c7.add_transition(242, c14)
-c7.add_transition(243, c14)
-c7.add_transition(244, c14)
-c7.add_transition(245, c14)
-c7.add_transition(246, c14)
-c7.add_transition(247, c14)
-c7.add_transition(248, c14)
-c7.add_transition(249, c14)
-c7.add_transition(250, c14)
-c7.add_transition(251, c14)
-c7.add_transition(252, c14)
-c7.add_transition(253, c14)
-c7.add_transition(254, c14)
-c7.add_transition(255, c14)
-
-c14.isFinalState = True
-c14.addToken( 'DECLARATIONS')
-c14.add_transition(0, c14)
-c14.add_transition(1, c14)
-c14.add_transition(2, c14)
-c14.add_transition(3, c14)
-c14.add_transition(4, c14)
-c14.add_transition(5, c14)
-c14.add_transition(6, c14)
-c14.add_transition(7, c14)
-c14.add_transition(8, c14)
-c14.add_transition(11, c14)
-c14.add_transition(12, c14)
-c14.add_transition(13, c14)
-c14.add_transition(14, c14)
-c14.add_transition(15, c14)
-c14.add_transition(16, c14)
-c14.add_transition(17, c14)
-c14.add_transition(18, c14)
-c14.add_transition(19, c14)
-c14.add_transition(20, c14)
-c14.add_transition(21, c14)
-c14.add_transition(22, c14)
-c14.add_transition(23, c14)
-c14.add_transition(24, c14)
-c14.add_transition(25, c14)
-c14.add_transition(26, c14)
-c14.add_transition(27, c14)
-c14.add_transition(28, c14)
-c14.add_transition(29, c14)
-c14.add_transition(30, c14)
-c14.add_transition(31, c14)
-c14.add_transition(33, c14)
-c14.add_transition(34, c9)
-c14.add_transition(35, c14)
-c14.add_transition(36, c14)
-c14.add_transition(37, c14)
-c14.add_transition(38, c14)
-c14.add_transition(39, c10)
-c14.add_transition(40, c14)
-c14.add_transition(41, c14)
-c14.add_transition(42, c14)
-c14.add_transition(43, c14)
-c14.add_transition(44, c14)
-c14.add_transition(45, c14)
-c14.add_transition(46, c14)
-c14.add_transition(47, c14)
-c14.add_transition(48, c14)
-c14.add_transition(49, c14)
-c14.add_transition(50, c14)
-c14.add_transition(51, c14)
-c14.add_transition(52, c14)
-c14.add_transition(53, c14)
-c14.add_transition(54, c14)
-c14.add_transition(55, c14)
-c14.add_transition(56, c14)
-c14.add_transition(57, c14)
-c14.add_transition(58, c14)
-c14.add_transition(59, c14)
-c14.add_transition(60, c14)
-c14.add_transition(61, c14)
-c14.add_transition(62, c14)
-c14.add_transition(63, c14)
-c14.add_transition(64, c14)
-c14.add_transition(65, c14)
-c14.add_transition(66, c14)
-c14.add_transition(67, c14)
-c14.add_transition(68, c14)
-c14.add_transition(69, c14)
-c14.add_transition(70, c14)
-c14.add_transition(71, c14)
-c14.add_transition(72, c14)
-c14.add_transition(73, c14)
-c14.add_transition(74, c14)
-c14.add_transition(75, c14)
-c14.add_transition(76, c14)
-c14.add_transition(77, c14)
-c14.add_transition(78, c14)
-c14.add_transition(79, c14)
-c14.add_transition(80, c14)
-c14.add_transition(81, c14)
-c14.add_transition(82, c14)
-c14.add_transition(83, c14)
-c14.add_transition(84, c14)
-c14.add_transition(85, c14)
-c14.add_transition(86, c14)
-c14.add_transition(87, c14)
-c14.add_transition(88, c14)
-c14.add_transition(89, c14)
-c14.add_transition(90, c14)
-c14.add_transition(91, c14)
-c14.add_transition(92, c14)
-c14.add_transition(93, c14)
-c14.add_transition(94, c14)
-c14.add_transition(95, c14)
-c14.add_transition(96, c14)
-c14.add_transition(97, c14)
-c14.add_transition(98, c14)
-c14.add_transition(99, c14)
-c14.add_transition(100, c14)
-c14.add_transition(101, c14)
-c14.add_transition(102, c14)
-c14.add_transition(103, c14)
-c14.add_transition(104, c14)
-c14.add_transition(105, c14)
-c14.add_transition(106, c14)
-c14.add_transition(107, c14)
-c14.add_transition(108, c14)
-c14.add_transition(109, c14)
-c14.add_transition(110, c14)
-c14.add_transition(111, c14)
-c14.add_transition(112, c14)
-c14.add_transition(113, c14)
-c14.add_transition(114, c14)
-c14.add_transition(115, c14)
-c14.add_transition(116, c14)
-c14.add_transition(117, c14)
-c14.add_transition(118, c14)
-c14.add_transition(119, c14)
-c14.add_transition(120, c14)
-c14.add_transition(121, c14)
-c14.add_transition(122, c14)
-c14.add_transition(124, c14)
-c14.add_transition(126, c14)
-c14.add_transition(127, c14)
-c14.add_transition(128, c14)
-c14.add_transition(129, c14)
-c14.add_transition(130, c14)
-c14.add_transition(131, c14)
-c14.add_transition(132, c14)
-c14.add_transition(133, c14)
-c14.add_transition(134, c14)
-c14.add_transition(135, c14)
-c14.add_transition(136, c14)
-c14.add_transition(137, c14)
-c14.add_transition(138, c14)
-c14.add_transition(139, c14)
-c14.add_transition(140, c14)
-c14.add_transition(141, c14)
-c14.add_transition(142, c14)
-c14.add_transition(143, c14)
-c14.add_transition(144, c14)
-c14.add_transition(145, c14)
-c14.add_transition(146, c14)
-c14.add_transition(147, c14)
-c14.add_transition(148, c14)
-c14.add_transition(149, c14)
-c14.add_transition(150, c14)
-c14.add_transition(151, c14)
-c14.add_transition(152, c14)
-c14.add_transition(153, c14)
-c14.add_transition(154, c14)
-c14.add_transition(155, c14)
-c14.add_transition(156, c14)
-c14.add_transition(157, c14)
-c14.add_transition(158, c14)
-c14.add_transition(159, c14)
-c14.add_transition(160, c14)
-c14.add_transition(161, c14)
-c14.add_transition(162, c14)
-c14.add_transition(163, c14)
-c14.add_transition(164, c14)
-c14.add_transition(165, c14)
-c14.add_transition(166, c14)
-c14.add_transition(167, c14)
-c14.add_transition(168, c14)
-c14.add_transition(169, c14)
-c14.add_transition(170, c14)
-c14.add_transition(171, c14)
-c14.add_transition(172, c14)
-c14.add_transition(173, c14)
-c14.add_transition(174, c14)
-c14.add_transition(175, c14)
-c14.add_transition(176, c14)
-c14.add_transition(177, c14)
-c14.add_transition(178, c14)
-c14.add_transition(179, c14)
-c14.add_transition(180, c14)
-c14.add_transition(181, c14)
-c14.add_transition(182, c14)
-c14.add_transition(183, c14)
-c14.add_transition(184, c14)
-c14.add_transition(185, c14)
-c14.add_transition(186, c14)
-c14.add_transition(187, c14)
-c14.add_transition(188, c14)
-c14.add_transition(189, c14)
-c14.add_transition(190, c14)
-c14.add_transition(191, c14)
-c14.add_transition(192, c14)
-c14.add_transition(193, c14)
-c14.add_transition(194, c14)
-c14.add_transition(195, c14)
-c14.add_transition(196, c14)
-c14.add_transition(197, c14)
-c14.add_transition(198, c14)
-c14.add_transition(199, c14)
-c14.add_transition(200, c14)
-c14.add_transition(201, c14)
-c14.add_transition(202, c14)
-c14.add_transition(203, c14)
-c14.add_transition(204, c14)
-c14.add_transition(205, c14)
-c14.add_transition(206, c14)
-c14.add_transition(207, c14)
-c14.add_transition(208, c14)
-c14.add_transition(209, c14)
-c14.add_transition(210, c14)
-c14.add_transition(211, c14)
-c14.add_transition(212, c14)
-c14.add_transition(213, c14)
-c14.add_transition(214, c14)
-c14.add_transition(215, c14)
-c14.add_transition(216, c14)
-c14.add_transition(217, c14)
-c14.add_transition(218, c14)
-c14.add_transition(219, c14)
-c14.add_transition(220, c14)
-c14.add_transition(221, c14)
-c14.add_transition(222, c14)
-c14.add_transition(223, c14)
-c14.add_transition(224, c14)
-c14.add_transition(225, c14)
-c14.add_transition(226, c14)
-c14.add_transition(227, c14)
-c14.add_transition(228, c14)
-c14.add_transition(229, c14)
-c14.add_transition(230, c14)
-c14.add_transition(231, c14)
-c14.add_transition(232, c14)
-c14.add_transition(233, c14)
-c14.add_transition(234, c14)
-c14.add_transition(235, c14)
-c14.add_transition(236, c14)
-c14.add_transition(237, c14)
-c14.add_transition(238, c14)
-c14.add_transition(239, c14)
-c14.add_transition(240, c14)
-c14.add_transition(241, c14)
-c14.add_transition(242, c14)
-c14.add_transition(243, c14)
-c14.add_transition(244, c14)
-c14.add_transition(245, c14)
-c14.add_transition(246, c14)
-c14.add_transition(247, c14)
-c14.add_transition(248, c14)
-c14.add_transition(249, c14)
-c14.add_transition(250, c14)
-c14.add_transition(251, c14)
-c14.add_transition(252, c14)
-c14.add_transition(253, c14)
-c14.add_transition(254, c14)
-c14.add_transition(255, c14)
-
-c9.add_transition(0, c11)
-c9.add_transition(1, c11)
-c9.add_transition(2, c11)
-c9.add_transition(3, c11)
-c9.add_transition(4, c11)
-c9.add_transition(5, c11)
-c9.add_transition(6, c11)
-c9.add_transition(7, c11)
-c9.add_transition(8, c11)
-c9.add_transition(9, c11)
-c9.add_transition(10, c11)
-c9.add_transition(11, c11)
-c9.add_transition(12, c11)
-c9.add_transition(13, c11)
-c9.add_transition(14, c11)
-c9.add_transition(15, c11)
-c9.add_transition(16, c11)
-c9.add_transition(17, c11)
-c9.add_transition(18, c11)
-c9.add_transition(19, c11)
-c9.add_transition(20, c11)
-c9.add_transition(21, c11)
-c9.add_transition(22, c11)
-c9.add_transition(23, c11)
-c9.add_transition(24, c11)
-c9.add_transition(25, c11)
-c9.add_transition(26, c11)
-c9.add_transition(27, c11)
-c9.add_transition(28, c11)
-c9.add_transition(29, c11)
-c9.add_transition(30, c11)
-c9.add_transition(31, c11)
-c9.add_transition(32, c11)
-c9.add_transition(33, c11)
-c9.add_transition(35, c11)
-c9.add_transition(36, c11)
-c9.add_transition(37, c11)
-c9.add_transition(38, c11)
-c9.add_transition(39, c11)
-c9.add_transition(40, c11)
-c9.add_transition(41, c11)
-c9.add_transition(42, c11)
-c9.add_transition(43, c11)
-c9.add_transition(44, c11)
-c9.add_transition(45, c11)
-c9.add_transition(46, c11)
-c9.add_transition(47, c11)
-c9.add_transition(48, c11)
-c9.add_transition(49, c11)
-c9.add_transition(50, c11)
-c9.add_transition(51, c11)
-c9.add_transition(52, c11)
-c9.add_transition(53, c11)
-c9.add_transition(54, c11)
-c9.add_transition(55, c11)
-c9.add_transition(56, c11)
-c9.add_transition(57, c11)
-c9.add_transition(58, c11)
-c9.add_transition(59, c11)
-c9.add_transition(60, c11)
-c9.add_transition(61, c11)
-c9.add_transition(62, c11)
-c9.add_transition(63, c11)
-c9.add_transition(64, c11)
-c9.add_transition(65, c11)
-c9.add_transition(66, c11)
-c9.add_transition(67, c11)
-c9.add_transition(68, c11)
-c9.add_transition(69, c11)
-c9.add_transition(70, c11)
-c9.add_transition(71, c11)
-c9.add_transition(72, c11)
-c9.add_transition(73, c11)
-c9.add_transition(74, c11)
-c9.add_transition(75, c11)
-c9.add_transition(76, c11)
-c9.add_transition(77, c11)
-c9.add_transition(78, c11)
-c9.add_transition(79, c11)
-c9.add_transition(80, c11)
-c9.add_transition(81, c11)
-c9.add_transition(82, c11)
-c9.add_transition(83, c11)
-c9.add_transition(84, c11)
-c9.add_transition(85, c11)
-c9.add_transition(86, c11)
-c9.add_transition(87, c11)
-c9.add_transition(88, c11)
-c9.add_transition(89, c11)
-c9.add_transition(90, c11)
-c9.add_transition(91, c11)
-c9.add_transition(92, c11)
-c9.add_transition(93, c11)
-c9.add_transition(94, c11)
-c9.add_transition(95, c11)
-c9.add_transition(96, c11)
-c9.add_transition(97, c11)
-c9.add_transition(98, c11)
-c9.add_transition(99, c11)
-c9.add_transition(100, c11)
-c9.add_transition(101, c11)
-c9.add_transition(102, c11)
-c9.add_transition(103, c11)
-c9.add_transition(104, c11)
-c9.add_transition(105, c11)
-c9.add_transition(106, c11)
-c9.add_transition(107, c11)
-c9.add_transition(108, c11)
-c9.add_transition(109, c11)
-c9.add_transition(110, c11)
-c9.add_transition(111, c11)
-c9.add_transition(112, c11)
-c9.add_transition(113, c11)
-c9.add_transition(114, c11)
-c9.add_transition(115, c11)
-c9.add_transition(116, c11)
-c9.add_transition(117, c11)
-c9.add_transition(118, c11)
-c9.add_transition(119, c11)
-c9.add_transition(120, c11)
-c9.add_transition(121, c11)
-c9.add_transition(122, c11)
-c9.add_transition(123, c11)
-c9.add_transition(124, c11)
-c9.add_transition(125, c11)
-c9.add_transition(126, c11)
-c9.add_transition(127, c11)
-c9.add_transition(128, c11)
-c9.add_transition(129, c11)
-c9.add_transition(130, c11)
-c9.add_transition(131, c11)
-c9.add_transition(132, c11)
-c9.add_transition(133, c11)
-c9.add_transition(134, c11)
-c9.add_transition(135, c11)
-c9.add_transition(136, c11)
-c9.add_transition(137, c11)
-c9.add_transition(138, c11)
-c9.add_transition(139, c11)
-c9.add_transition(140, c11)
-c9.add_transition(141, c11)
-c9.add_transition(142, c11)
-c9.add_transition(143, c11)
-c9.add_transition(144, c11)
-c9.add_transition(145, c11)
-c9.add_transition(146, c11)
-c9.add_transition(147, c11)
-c9.add_transition(148, c11)
-c9.add_transition(149, c11)
-c9.add_transition(150, c11)
-c9.add_transition(151, c11)
-c9.add_transition(152, c11)
-c9.add_transition(153, c11)
-c9.add_transition(154, c11)
-c9.add_transition(155, c11)
-c9.add_transition(156, c11)
-c9.add_transition(157, c11)
-c9.add_transition(158, c11)
-c9.add_transition(159, c11)
-c9.add_transition(160, c11)
-c9.add_transition(161, c11)
-c9.add_transition(162, c11)
-c9.add_transition(163, c11)
-c9.add_transition(164, c11)
-c9.add_transition(165, c11)
-c9.add_transition(166, c11)
-c9.add_transition(167, c11)
-c9.add_transition(168, c11)
-c9.add_transition(169, c11)
-c9.add_transition(170, c11)
-c9.add_transition(171, c11)
-c9.add_transition(172, c11)
-c9.add_transition(173, c11)
-c9.add_transition(174, c11)
-c9.add_transition(175, c11)
-c9.add_transition(176, c11)
-c9.add_transition(177, c11)
-c9.add_transition(178, c11)
-c9.add_transition(179, c11)
-c9.add_transition(180, c11)
-c9.add_transition(181, c11)
-c9.add_transition(182, c11)
-c9.add_transition(183, c11)
-c9.add_transition(184, c11)
-c9.add_transition(185, c11)
-c9.add_transition(186, c11)
-c9.add_transition(187, c11)
-c9.add_transition(188, c11)
-c9.add_transition(189, c11)
-c9.add_transition(190, c11)
-c9.add_transition(191, c11)
-c9.add_transition(192, c11)
-c9.add_transition(193, c11)
-c9.add_transition(194, c11)
-c9.add_transition(195, c11)
-c9.add_transition(196, c11)
-c9.add_transition(197, c11)
-c9.add_transition(198, c11)
-c9.add_transition(199, c11)
-c9.add_transition(200, c11)
-c9.add_transition(201, c11)
-c9.add_transition(202, c11)
-c9.add_transition(203, c11)
-c9.add_transition(204, c11)
-c9.add_transition(205, c11)
-c9.add_transition(206, c11)
-c9.add_transition(207, c11)
-c9.add_transition(208, c11)
-c9.add_transition(209, c11)
-c9.add_transition(210, c11)
-c9.add_transition(211, c11)
-c9.add_transition(212, c11)
-c9.add_transition(213, c11)
-c9.add_transition(214, c11)
-c9.add_transition(215, c11)
-c9.add_transition(216, c11)
-c9.add_transition(217, c11)
-c9.add_transition(218, c11)
-c9.add_transition(219, c11)
-c9.add_transition(220, c11)
-c9.add_transition(221, c11)
-c9.add_transition(222, c11)
-c9.add_transition(223, c11)
-c9.add_transition(224, c11)
-c9.add_transition(225, c11)
-c9.add_transition(226, c11)
-c9.add_transition(227, c11)
-c9.add_transition(228, c11)
-c9.add_transition(229, c11)
-c9.add_transition(230, c11)
-c9.add_transition(231, c11)
-c9.add_transition(232, c11)
-c9.add_transition(233, c11)
-c9.add_transition(234, c11)
-c9.add_transition(235, c11)
-c9.add_transition(236, c11)
-c9.add_transition(237, c11)
-c9.add_transition(238, c11)
-c9.add_transition(239, c11)
-c9.add_transition(240, c11)
-c9.add_transition(241, c11)
-c9.add_transition(242, c11)
-c9.add_transition(243, c11)
-c9.add_transition(244, c11)
-c9.add_transition(245, c11)
-c9.add_transition(246, c11)
-c9.add_transition(247, c11)
-c9.add_transition(248, c11)
-c9.add_transition(249, c11)
-c9.add_transition(250, c11)
-c9.add_transition(251, c11)
-c9.add_transition(252, c11)
-c9.add_transition(253, c11)
-c9.add_transition(254, c11)
-c9.add_transition(255, c11)
-
-c11.add_transition(0, c11)
-c11.add_transition(1, c11)
-c11.add_transition(2, c11)
-c11.add_transition(3, c11)
-c11.add_transition(4, c11)
-c11.add_transition(5, c11)
-c11.add_transition(6, c11)
-c11.add_transition(7, c11)
-c11.add_transition(8, c11)
-c11.add_transition(9, c11)
-c11.add_transition(10, c11)
-c11.add_transition(11, c11)
-c11.add_transition(12, c11)
-c11.add_transition(13, c11)
-c11.add_transition(14, c11)
-c11.add_transition(15, c11)
-c11.add_transition(16, c11)
-c11.add_transition(17, c11)
-c11.add_transition(18, c11)
-c11.add_transition(19, c11)
-c11.add_transition(20, c11)
-c11.add_transition(21, c11)
-c11.add_transition(22, c11)
-c11.add_transition(23, c11)
-c11.add_transition(24, c11)
-c11.add_transition(25, c11)
-c11.add_transition(26, c11)
-c11.add_transition(27, c11)
-c11.add_transition(28, c11)
-c11.add_transition(29, c11)
-c11.add_transition(30, c11)
-c11.add_transition(31, c11)
-c11.add_transition(32, c11)
-c11.add_transition(33, c11)
-c11.add_transition(34, c14)
-c11.add_transition(35, c11)
-c11.add_transition(36, c11)
-c11.add_transition(37, c11)
-c11.add_transition(38, c11)
-c11.add_transition(39, c11)
-c11.add_transition(40, c11)
-c11.add_transition(41, c11)
-c11.add_transition(42, c11)
-c11.add_transition(43, c11)
-c11.add_transition(44, c11)
-c11.add_transition(45, c11)
-c11.add_transition(46, c11)
-c11.add_transition(47, c11)
-c11.add_transition(48, c11)
-c11.add_transition(49, c11)
-c11.add_transition(50, c11)
-c11.add_transition(51, c11)
-c11.add_transition(52, c11)
-c11.add_transition(53, c11)
-c11.add_transition(54, c11)
-c11.add_transition(55, c11)
-c11.add_transition(56, c11)
-c11.add_transition(57, c11)
-c11.add_transition(58, c11)
-c11.add_transition(59, c11)
-c11.add_transition(60, c11)
-c11.add_transition(61, c11)
-c11.add_transition(62, c11)
-c11.add_transition(63, c11)
-c11.add_transition(64, c11)
-c11.add_transition(65, c11)
-c11.add_transition(66, c11)
-c11.add_transition(67, c11)
-c11.add_transition(68, c11)
-c11.add_transition(69, c11)
-c11.add_transition(70, c11)
-c11.add_transition(71, c11)
-c11.add_transition(72, c11)
-c11.add_transition(73, c11)
-c11.add_transition(74, c11)
-c11.add_transition(75, c11)
-c11.add_transition(76, c11)
-c11.add_transition(77, c11)
-c11.add_transition(78, c11)
-c11.add_transition(79, c11)
-c11.add_transition(80, c11)
-c11.add_transition(81, c11)
-c11.add_transition(82, c11)
-c11.add_transition(83, c11)
-c11.add_transition(84, c11)
-c11.add_transition(85, c11)
-c11.add_transition(86, c11)
-c11.add_transition(87, c11)
-c11.add_transition(88, c11)
-c11.add_transition(89, c11)
-c11.add_transition(90, c11)
-c11.add_transition(91, c11)
-c11.add_transition(92, c11)
-c11.add_transition(93, c11)
-c11.add_transition(94, c11)
-c11.add_transition(95, c11)
-c11.add_transition(96, c11)
-c11.add_transition(97, c11)
-c11.add_transition(98, c11)
-c11.add_transition(99, c11)
-c11.add_transition(100, c11)
-c11.add_transition(101, c11)
-c11.add_transition(102, c11)
-c11.add_transition(103, c11)
-c11.add_transition(104, c11)
-c11.add_transition(105, c11)
-c11.add_transition(106, c11)
-c11.add_transition(107, c11)
-c11.add_transition(108, c11)
-c11.add_transition(109, c11)
-c11.add_transition(110, c11)
-c11.add_transition(111, c11)
-c11.add_transition(112, c11)
-c11.add_transition(113, c11)
-c11.add_transition(114, c11)
-c11.add_transition(115, c11)
-c11.add_transition(116, c11)
-c11.add_transition(117, c11)
-c11.add_transition(118, c11)
-c11.add_transition(119, c11)
-c11.add_transition(120, c11)
-c11.add_transition(121, c11)
-c11.add_transition(122, c11)
-c11.add_transition(123, c11)
-c11.add_transition(124, c11)
-c11.add_transition(125, c11)
-c11.add_transition(126, c11)
-c11.add_transition(127, c11)
-c11.add_transition(128, c11)
-c11.add_transition(129, c11)
-c11.add_transition(130, c11)
-c11.add_transition(131, c11)
-c11.add_transition(132, c11)
-c11.add_transition(133, c11)
-c11.add_transition(134, c11)
-c11.add_transition(135, c11)
-c11.add_transition(136, c11)
-c11.add_transition(137, c11)
-c11.add_transition(138, c11)
-c11.add_transition(139, c11)
-c11.add_transition(140, c11)
-c11.add_transition(141, c11)
-c11.add_transition(142, c11)
-c11.add_transition(143, c11)
-c11.add_transition(144, c11)
-c11.add_transition(145, c11)
-c11.add_transition(146, c11)
-c11.add_transition(147, c11)
-c11.add_transition(148, c11)
-c11.add_transition(149, c11)
-c11.add_transition(150, c11)
-c11.add_transition(151, c11)
-c11.add_transition(152, c11)
-c11.add_transition(153, c11)
-c11.add_transition(154, c11)
-c11.add_transition(155, c11)
-c11.add_transition(156, c11)
-c11.add_transition(157, c11)
-c11.add_transition(158, c11)
-c11.add_transition(159, c11)
-c11.add_transition(160, c11)
-c11.add_transition(161, c11)
-c11.add_transition(162, c11)
-c11.add_transition(163, c11)
-c11.add_transition(164, c11)
-c11.add_transition(165, c11)
-c11.add_transition(166, c11)
-c11.add_transition(167, c11)
-c11.add_transition(168, c11)
-c11.add_transition(169, c11)
-c11.add_transition(170, c11)
-c11.add_transition(171, c11)
-c11.add_transition(172, c11)
-c11.add_transition(173, c11)
-c11.add_transition(174, c11)
-c11.add_transition(175, c11)
-c11.add_transition(176, c11)
-c11.add_transition(177, c11)
-c11.add_transition(178, c11)
-c11.add_transition(179, c11)
-c11.add_transition(180, c11)
-c11.add_transition(181, c11)
-c11.add_transition(182, c11)
-c11.add_transition(183, c11)
-c11.add_transition(184, c11)
-c11.add_transition(185, c11)
-c11.add_transition(186, c11)
-c11.add_transition(187, c11)
-c11.add_transition(188, c11)
-c11.add_transition(189, c11)
-c11.add_transition(190, c11)
-c11.add_transition(191, c11)
-c11.add_transition(192, c11)
-c11.add_transition(193, c11)
-c11.add_transition(194, c11)
-c11.add_transition(195, c11)
-c11.add_transition(196, c11)
-c11.add_transition(197, c11)
-c11.add_transition(198, c11)
-c11.add_transition(199, c11)
-c11.add_transition(200, c11)
-c11.add_transition(201, c11)
-c11.add_transition(202, c11)
-c11.add_transition(203, c11)
-c11.add_transition(204, c11)
-c11.add_transition(205, c11)
-c11.add_transition(206, c11)
-c11.add_transition(207, c11)
-c11.add_transition(208, c11)
-c11.add_transition(209, c11)
-c11.add_transition(210, c11)
-c11.add_transition(211, c11)
-c11.add_transition(212, c11)
-c11.add_transition(213, c11)
-c11.add_transition(214, c11)
-c11.add_transition(215, c11)
-c11.add_transition(216, c11)
-c11.add_transition(217, c11)
-c11.add_transition(218, c11)
-c11.add_transition(219, c11)
-c11.add_transition(220, c11)
-c11.add_transition(221, c11)
-c11.add_transition(222, c11)
-c11.add_transition(223, c11)
-c11.add_transition(224, c11)
-c11.add_transition(225, c11)
-c11.add_transition(226, c11)
-c11.add_transition(227, c11)
-c11.add_transition(228, c11)
-c11.add_transition(229, c11)
-c11.add_transition(230, c11)
-c11.add_transition(231, c11)
-c11.add_transition(232, c11)
-c11.add_transition(233, c11)
-c11.add_transition(234, c11)
-c11.add_transition(235, c11)
-c11.add_transition(236, c11)
-c11.add_transition(237, c11)
-c11.add_transition(238, c11)
-c11.add_transition(239, c11)
-c11.add_transition(240, c11)
-c11.add_transition(241, c11)
-c11.add_transition(242, c11)
-c11.add_transition(243, c11)
-c11.add_transition(244, c11)
-c11.add_transition(245, c11)
-c11.add_transition(246, c11)
-c11.add_transition(247, c11)
-c11.add_transition(248, c11)
-c11.add_transition(249, c11)
-c11.add_transition(250, c11)
-c11.add_transition(251, c11)
-c11.add_transition(252, c11)
-c11.add_transition(253, c11)
-c11.add_transition(254, c11)
-c11.add_transition(255, c11)
-
-c10.add_transition(0, c12)
-c10.add_transition(1, c12)
-c10.add_transition(2, c12)
-c10.add_transition(3, c12)
-c10.add_transition(4, c12)
-c10.add_transition(5, c12)
-c10.add_transition(6, c12)
-c10.add_transition(7, c12)
-c10.add_transition(8, c12)
-c10.add_transition(9, c12)
-c10.add_transition(10, c12)
-c10.add_transition(11, c12)
-c10.add_transition(12, c12)
-c10.add_transition(13, c12)
-c10.add_transition(14, c12)
-c10.add_transition(15, c12)
-c10.add_transition(16, c12)
-c10.add_transition(17, c12)
-c10.add_transition(18, c12)
-c10.add_transition(19, c12)
-c10.add_transition(20, c12)
-c10.add_transition(21, c12)
-c10.add_transition(22, c12)
-c10.add_transition(23, c12)
-c10.add_transition(24, c12)
-c10.add_transition(25, c12)
-c10.add_transition(26, c12)
-c10.add_transition(27, c12)
-c10.add_transition(28, c12)
-c10.add_transition(29, c12)
-c10.add_transition(30, c12)
-c10.add_transition(31, c12)
-c10.add_transition(32, c12)
-c10.add_transition(33, c12)
-c10.add_transition(34, c12)
-c10.add_transition(35, c12)
-c10.add_transition(36, c12)
-c10.add_transition(37, c12)
-c10.add_transition(38, c12)
-c10.add_transition(39, c12)
-c10.add_transition(40, c12)
-c10.add_transition(41, c12)
-c10.add_transition(42, c12)
-c10.add_transition(43, c12)
-c10.add_transition(44, c12)
-c10.add_transition(45, c12)
-c10.add_transition(46, c12)
-c10.add_transition(47, c12)
-c10.add_transition(48, c12)
-c10.add_transition(49, c12)
-c10.add_transition(50, c12)
-c10.add_transition(51, c12)
-c10.add_transition(52, c12)
-c10.add_transition(53, c12)
-c10.add_transition(54, c12)
-c10.add_transition(55, c12)
-c10.add_transition(56, c12)
-c10.add_transition(57, c12)
-c10.add_transition(58, c12)
-c10.add_transition(59, c12)
-c10.add_transition(60, c12)
-c10.add_transition(61, c12)
-c10.add_transition(62, c12)
-c10.add_transition(63, c12)
-c10.add_transition(64, c12)
-c10.add_transition(65, c12)
-c10.add_transition(66, c12)
-c10.add_transition(67, c12)
-c10.add_transition(68, c12)
-c10.add_transition(69, c12)
-c10.add_transition(70, c12)
-c10.add_transition(71, c12)
-c10.add_transition(72, c12)
-c10.add_transition(73, c12)
-c10.add_transition(74, c12)
-c10.add_transition(75, c12)
-c10.add_transition(76, c12)
-c10.add_transition(77, c12)
-c10.add_transition(78, c12)
-c10.add_transition(79, c12)
-c10.add_transition(80, c12)
-c10.add_transition(81, c12)
-c10.add_transition(82, c12)
-c10.add_transition(83, c12)
-c10.add_transition(84, c12)
-c10.add_transition(85, c12)
-c10.add_transition(86, c12)
-c10.add_transition(87, c12)
-c10.add_transition(88, c12)
-c10.add_transition(89, c12)
-c10.add_transition(90, c12)
-c10.add_transition(91, c12)
-c10.add_transition(92, c13)
-c10.add_transition(93, c12)
-c10.add_transition(94, c12)
-c10.add_transition(95, c12)
-c10.add_transition(96, c12)
-c10.add_transition(97, c12)
-c10.add_transition(98, c12)
-c10.add_transition(99, c12)
-c10.add_transition(100, c12)
-c10.add_transition(101, c12)
-c10.add_transition(102, c12)
-c10.add_transition(103, c12)
-c10.add_transition(104, c12)
-c10.add_transition(105, c12)
-c10.add_transition(106, c12)
-c10.add_transition(107, c12)
-c10.add_transition(108, c12)
-c10.add_transition(109, c12)
-c10.add_transition(110, c12)
-c10.add_transition(111, c12)
-c10.add_transition(112, c12)
-c10.add_transition(113, c12)
-c10.add_transition(114, c12)
-c10.add_transition(115, c12)
-c10.add_transition(116, c12)
-c10.add_transition(117, c12)
-c10.add_transition(118, c12)
-c10.add_transition(119, c12)
-c10.add_transition(120, c12)
-c10.add_transition(121, c12)
-c10.add_transition(122, c12)
-c10.add_transition(123, c12)
-c10.add_transition(124, c12)
-c10.add_transition(125, c12)
-c10.add_transition(126, c12)
-c10.add_transition(127, c12)
-c10.add_transition(128, c12)
-c10.add_transition(129, c12)
-c10.add_transition(130, c12)
-c10.add_transition(131, c12)
-c10.add_transition(132, c12)
-c10.add_transition(133, c12)
-c10.add_transition(134, c12)
-c10.add_transition(135, c12)
-c10.add_transition(136, c12)
-c10.add_transition(137, c12)
-c10.add_transition(138, c12)
-c10.add_transition(139, c12)
-c10.add_transition(140, c12)
-c10.add_transition(141, c12)
-c10.add_transition(142, c12)
-c10.add_transition(143, c12)
-c10.add_transition(144, c12)
-c10.add_transition(145, c12)
-c10.add_transition(146, c12)
-c10.add_transition(147, c12)
-c10.add_transition(148, c12)
-c10.add_transition(149, c12)
-c10.add_transition(150, c12)
-c10.add_transition(151, c12)
-c10.add_transition(152, c12)
-c10.add_transition(153, c12)
-c10.add_transition(154, c12)
-c10.add_transition(155, c12)
-c10.add_transition(156, c12)
-c10.add_transition(157, c12)
-c10.add_transition(158, c12)
-c10.add_transition(159, c12)
-c10.add_transition(160, c12)
-c10.add_transition(161, c12)
-c10.add_transition(162, c12)
-c10.add_transition(163, c12)
-c10.add_transition(164, c12)
-c10.add_transition(165, c12)
-c10.add_transition(166, c12)
-c10.add_transition(167, c12)
-c10.add_transition(168, c12)
-c10.add_transition(169, c12)
-c10.add_transition(170, c12)
-c10.add_transition(171, c12)
-c10.add_transition(172, c12)
-c10.add_transition(173, c12)
-c10.add_transition(174, c12)
-c10.add_transition(175, c12)
-c10.add_transition(176, c12)
-c10.add_transition(177, c12)
-c10.add_transition(178, c12)
-c10.add_transition(179, c12)
-c10.add_transition(180, c12)
-c10.add_transition(181, c12)
-c10.add_transition(182, c12)
-c10.add_transition(183, c12)
-c10.add_transition(184, c12)
-c10.add_transition(185, c12)
-c10.add_transition(186, c12)
-c10.add_transition(187, c12)
-c10.add_transition(188, c12)
-c10.add_transition(189, c12)
-c10.add_transition(190, c12)
-c10.add_transition(191, c12)
-c10.add_transition(192, c12)
-c10.add_transition(193, c12)
-c10.add_transition(194, c12)
-c10.add_transition(195, c12)
-c10.add_transition(196, c12)
-c10.add_transition(197, c12)
-c10.add_transition(198, c12)
-c10.add_transition(199, c12)
-c10.add_transition(200, c12)
-c10.add_transition(201, c12)
-c10.add_transition(202, c12)
-c10.add_transition(203, c12)
-c10.add_transition(204, c12)
-c10.add_transition(205, c12)
-c10.add_transition(206, c12)
-c10.add_transition(207, c12)
-c10.add_transition(208, c12)
-c10.add_transition(209, c12)
-c10.add_transition(210, c12)
-c10.add_transition(211, c12)
-c10.add_transition(212, c12)
-c10.add_transition(213, c12)
-c10.add_transition(214, c12)
-c10.add_transition(215, c12)
-c10.add_transition(216, c12)
-c10.add_transition(217, c12)
-c10.add_transition(218, c12)
-c10.add_transition(219, c12)
-c10.add_transition(220, c12)
-c10.add_transition(221, c12)
-c10.add_transition(222, c12)
-c10.add_transition(223, c12)
-c10.add_transition(224, c12)
-c10.add_transition(225, c12)
-c10.add_transition(226, c12)
-c10.add_transition(227, c12)
-c10.add_transition(228, c12)
-c10.add_transition(229, c12)
-c10.add_transition(230, c12)
-c10.add_transition(231, c12)
-c10.add_transition(232, c12)
-c10.add_transition(233, c12)
-c10.add_transition(234, c12)
-c10.add_transition(235, c12)
-c10.add_transition(236, c12)
-c10.add_transition(237, c12)
-c10.add_transition(238, c12)
-c10.add_transition(239, c12)
-c10.add_transition(240, c12)
-c10.add_transition(241, c12)
-c10.add_transition(242, c12)
-c10.add_transition(243, c12)
-c10.add_transition(244, c12)
-c10.add_transition(245, c12)
-c10.add_transition(246, c12)
-c10.add_transition(247, c12)
-c10.add_transition(248, c12)
-c10.add_transition(249, c12)
-c10.add_transition(250, c12)
-c10.add_transition(251, c12)
-c10.add_transition(252, c12)
-c10.add_transition(253, c12)
-c10.add_transition(254, c12)
-c10.add_transition(255, c12)
-
-c12.add_transition(39, c14)
-
-c13.add_transition(39, c14)
-c13.add_transition(110, c12)
-c13.add_transition(115, c12)
-c13.add_transition(116, c12)
-c13.add_transition(118, c12)
-
-c8.add_transition(0, c14)
-c8.add_transition(1, c14)
-c8.add_transition(2, c14)
-c8.add_transition(3, c14)
-c8.add_transition(4, c14)
-c8.add_transition(5, c14)
-c8.add_transition(6, c14)
-c8.add_transition(7, c14)
-c8.add_transition(8, c14)
-c8.add_transition(10, c8)
-c8.add_transition(11, c14)
-c8.add_transition(12, c14)
-c8.add_transition(13, c14)
-c8.add_transition(14, c14)
-c8.add_transition(15, c14)
-c8.add_transition(16, c14)
-c8.add_transition(17, c14)
-c8.add_transition(18, c14)
-c8.add_transition(19, c14)
-c8.add_transition(20, c14)
-c8.add_transition(21, c14)
-c8.add_transition(22, c14)
-c8.add_transition(23, c14)
-c8.add_transition(24, c14)
-c8.add_transition(25, c14)
-c8.add_transition(26, c14)
-c8.add_transition(27, c14)
-c8.add_transition(28, c14)
-c8.add_transition(29, c14)
-c8.add_transition(30, c14)
-c8.add_transition(31, c14)
-c8.add_transition(33, c14)
-c8.add_transition(34, c9)
-c8.add_transition(35, c14)
-c8.add_transition(36, c14)
-c8.add_transition(37, c14)
-c8.add_transition(38, c14)
-c8.add_transition(39, c10)
-c8.add_transition(40, c14)
-c8.add_transition(41, c14)
-c8.add_transition(42, c14)
-c8.add_transition(43, c14)
-c8.add_transition(44, c14)
-c8.add_transition(45, c14)
-c8.add_transition(46, c14)
-c8.add_transition(47, c14)
-c8.add_transition(48, c14)
-c8.add_transition(49, c14)
-c8.add_transition(50, c14)
-c8.add_transition(51, c14)
-c8.add_transition(52, c14)
-c8.add_transition(53, c14)
-c8.add_transition(54, c14)
-c8.add_transition(55, c14)
-c8.add_transition(56, c14)
-c8.add_transition(57, c14)
-c8.add_transition(58, c14)
-c8.add_transition(59, c14)
-c8.add_transition(60, c14)
-c8.add_transition(61, c14)
-c8.add_transition(62, c14)
-c8.add_transition(63, c14)
-c8.add_transition(64, c14)
-c8.add_transition(65, c14)
-c8.add_transition(66, c14)
-c8.add_transition(67, c14)
-c8.add_transition(68, c14)
-c8.add_transition(69, c14)
-c8.add_transition(70, c14)
-c8.add_transition(71, c14)
-c8.add_transition(72, c14)
-c8.add_transition(73, c14)
-c8.add_transition(74, c14)
-c8.add_transition(75, c14)
-c8.add_transition(76, c14)
-c8.add_transition(77, c14)
-c8.add_transition(78, c14)
-c8.add_transition(79, c14)
-c8.add_transition(80, c14)
-c8.add_transition(81, c14)
-c8.add_transition(82, c14)
-c8.add_transition(83, c14)
-c8.add_transition(84, c14)
-c8.add_transition(85, c14)
-c8.add_transition(86, c14)
-c8.add_transition(87, c14)
-c8.add_transition(88, c14)
-c8.add_transition(89, c14)
-c8.add_transition(90, c14)
-c8.add_transition(91, c14)
-c8.add_transition(92, c14)
-c8.add_transition(93, c14)
-c8.add_transition(94, c14)
-c8.add_transition(95, c14)
-c8.add_transition(96, c14)
-c8.add_transition(97, c14)
-c8.add_transition(98, c14)
-c8.add_transition(99, c14)
-c8.add_transition(100, c14)
-c8.add_transition(101, c14)
-c8.add_transition(102, c14)
-c8.add_transition(103, c14)
-c8.add_transition(104, c14)
-c8.add_transition(105, c14)
-c8.add_transition(106, c14)
-c8.add_transition(107, c14)
-c8.add_transition(108, c14)
-c8.add_transition(109, c14)
-c8.add_transition(110, c14)
-c8.add_transition(111, c14)
-c8.add_transition(112, c14)
-c8.add_transition(113, c14)
-c8.add_transition(114, c14)
-c8.add_transition(115, c14)
-c8.add_transition(116, c14)
-c8.add_transition(117, c14)
-c8.add_transition(118, c14)
-c8.add_transition(119, c14)
-c8.add_transition(120, c14)
-c8.add_transition(121, c14)
-c8.add_transition(122, c14)
-c8.add_transition(124, c14)
-c8.add_transition(126, c14)
-c8.add_transition(127, c14)
-c8.add_transition(128, c14)
-c8.add_transition(129, c14)
-c8.add_transition(130, c14)
-c8.add_transition(131, c14)
-c8.add_transition(132, c14)
-c8.add_transition(133, c14)
-c8.add_transition(134, c14)
-c8.add_transition(135, c14)
-c8.add_transition(136, c14)
-c8.add_transition(137, c14)
-c8.add_transition(138, c14)
-c8.add_transition(139, c14)
-c8.add_transition(140, c14)
-c8.add_transition(141, c14)
-c8.add_transition(142, c14)
-c8.add_transition(143, c14)
-c8.add_transition(144, c14)
-c8.add_transition(145, c14)
-c8.add_transition(146, c14)
-c8.add_transition(147, c14)
-c8.add_transition(148, c14)
-c8.add_transition(149, c14)
-c8.add_transition(150, c14)
-c8.add_transition(151, c14)
-c8.add_transition(152, c14)
-c8.add_transition(153, c14)
-c8.add_transition(154, c14)
-c8.add_transition(155, c14)
-c8.add_transition(156, c14)
-c8.add_transition(157, c14)
-c8.add_transition(158, c14)
-c8.add_transition(159, c14)
-c8.add_transition(160, c14)
-c8.add_transition(161, c14)
-c8.add_transition(162, c14)
-c8.add_transition(163, c14)
-c8.add_transition(164, c14)
-c8.add_transition(165, c14)
-c8.add_transition(166, c14)
-c8.add_transition(167, c14)
-c8.add_transition(168, c14)
-c8.add_transition(169, c14)
-c8.add_transition(170, c14)
-c8.add_transition(171, c14)
-c8.add_transition(172, c14)
-c8.add_transition(173, c14)
-c8.add_transition(174, c14)
-c8.add_transition(175, c14)
-c8.add_transition(176, c14)
-c8.add_transition(177, c14)
-c8.add_transition(178, c14)
-c8.add_transition(179, c14)
-c8.add_transition(180, c14)
-c8.add_transition(181, c14)
-c8.add_transition(182, c14)
-c8.add_transition(183, c14)
-c8.add_transition(184, c14)
-c8.add_transition(185, c14)
-c8.add_transition(186, c14)
-c8.add_transition(187, c14)
-c8.add_transition(188, c14)
-c8.add_transition(189, c14)
-c8.add_transition(190, c14)
-c8.add_transition(191, c14)
-c8.add_transition(192, c14)
-c8.add_transition(193, c14)
-c8.add_transition(194, c14)
-c8.add_transition(195, c14)
-c8.add_transition(196, c14)
-c8.add_transition(197, c14)
-c8.add_transition(198, c14)
-c8.add_transition(199, c14)
-c8.add_transition(200, c14)
-c8.add_transition(201, c14)
-c8.add_transition(202, c14)
-c8.add_transition(203, c14)
-c8.add_transition(204, c14)
-c8.add_transition(205, c14)
-c8.add_transition(206, c14)
-c8.add_transition(207, c14)
-c8.add_transition(208, c14)
-c8.add_transition(209, c14)
-c8.add_transition(210, c14)
-c8.add_transition(211, c14)
-c8.add_transition(212, c14)
-c8.add_transition(213, c14)
-c8.add_transition(214, c14)
-c8.add_transition(215, c14)
-c8.add_transition(216, c14)
-c8.add_transition(217, c14)
-c8.add_transition(218, c14)
-c8.add_transition(219, c14)
-c8.add_transition(220, c14)
-c8.add_transition(221, c14)
-c8.add_transition(222, c14)
-c8.add_transition(223, c14)
-c8.add_transition(224, c14)
-c8.add_transition(225, c14)
-c8.add_transition(226, c14)
-c8.add_transition(227, c14)
-c8.add_transition(228, c14)
-c8.add_transition(229, c14)
-c8.add_transition(230, c14)
-c8.add_transition(231, c14)
-c8.add_transition(232, c14)
-c8.add_transition(233, c14)
-c8.add_transition(234, c14)
-c8.add_transition(235, c14)
-c8.add_transition(236, c14)
-c8.add_transition(237, c14)
-c8.add_transition(238, c14)
-c8.add_transition(239, c14)
-c8.add_transition(240, c14)
-c8.add_transition(241, c14)
-c8.add_transition(242, c14)
-c8.add_transition(243, c14)
-c8.add_transition(244, c14)
-c8.add_transition(245, c14)
-c8.add_transition(246, c14)
-c8.add_transition(247, c14)
-c8.add_transition(248, c14)
-c8.add_transition(249, c14)
-c8.add_transition(250, c14)
-c8.add_transition(251, c14)
-c8.add_transition(252, c14)
-c8.add_transition(253, c14)
-c8.add_transition(254, c14)
-c8.add_transition(255, c14)
-
-d2.add_transition(0, d1)
-d2.add_transition(1, d1)
-d2.add_transition(2, d1)
-d2.add_transition(3, d1)
-d2.add_transition(4, d1)
-d2.add_transition(5, d1)
-d2.add_transition(6, d1)
-d2.add_transition(7, d1)
-d2.add_transition(8, d1)
-d2.add_transition(11, d1)
-d2.add_transition(12, d1)
-d2.add_transition(13, d1)
-d2.add_transition(14, d1)
-d2.add_transition(15, d1)
-d2.add_transition(16, d1)
-d2.add_transition(17, d1)
-d2.add_transition(18, d1)
-d2.add_transition(19, d1)
-d2.add_transition(20, d1)
-d2.add_transition(21, d1)
-d2.add_transition(22, d1)
-d2.add_transition(23, d1)
-d2.add_transition(24, d1)
-d2.add_transition(25, d1)
-d2.add_transition(26, d1)
-d2.add_transition(27, d1)
-d2.add_transition(28, d1)
-d2.add_transition(29, d1)
-d2.add_transition(30, d1)
-d2.add_transition(31, d1)
-d2.add_transition(32, d2)
-d2.add_transition(33, d1)
-d2.add_transition(34, d3)
-d2.add_transition(35, d1)
-d2.add_transition(36, d1)
-d2.add_transition(37, d1)
-d2.add_transition(38, d1)
-d2.add_transition(39, d5)
-d2.add_transition(40, d1)
-d2.add_transition(41, d1)
-d2.add_transition(42, d1)
-d2.add_transition(43, d1)
-d2.add_transition(44, d1)
-d2.add_transition(45, d1)
-d2.add_transition(46, d1)
-d2.add_transition(47, d1)
-d2.add_transition(48, d1)
-d2.add_transition(49, d1)
-d2.add_transition(50, d1)
-d2.add_transition(51, d1)
-d2.add_transition(52, d1)
-d2.add_transition(53, d1)
-d2.add_transition(54, d1)
-d2.add_transition(55, d1)
-d2.add_transition(56, d1)
-d2.add_transition(57, d1)
-d2.add_transition(58, d1)
-d2.add_transition(59, d1)
-d2.add_transition(60, d1)
-d2.add_transition(61, d1)
-d2.add_transition(62, d1)
-d2.add_transition(63, d1)
-d2.add_transition(64, d1)
-d2.add_transition(65, d1)
-d2.add_transition(66, d1)
-d2.add_transition(67, d1)
-d2.add_transition(68, d1)
-d2.add_transition(69, d1)
-d2.add_transition(70, d1)
-d2.add_transition(71, d1)
-d2.add_transition(72, d1)
-d2.add_transition(73, d1)
-d2.add_transition(74, d1)
-d2.add_transition(75, d1)
-d2.add_transition(76, d1)
-d2.add_transition(77, d1)
-d2.add_transition(78, d1)
-d2.add_transition(79, d1)
-d2.add_transition(80, d1)
-d2.add_transition(81, d1)
-d2.add_transition(82, d1)
-d2.add_transition(83, d1)
-d2.add_transition(84, d1)
-d2.add_transition(85, d1)
-d2.add_transition(86, d1)
-d2.add_transition(87, d1)
-d2.add_transition(88, d1)
-d2.add_transition(89, d1)
-d2.add_transition(90, d1)
-d2.add_transition(91, d1)
-d2.add_transition(92, d1)
-d2.add_transition(93, d1)
-d2.add_transition(94, d1)
-d2.add_transition(95, d1)
-d2.add_transition(96, d1)
-d2.add_transition(97, d1)
-d2.add_transition(98, d1)
-d2.add_transition(99, d1)
-d2.add_transition(100, d1)
-d2.add_transition(101, d1)
-d2.add_transition(102, d1)
-d2.add_transition(103, d1)
-d2.add_transition(104, d1)
-d2.add_transition(105, d1)
-d2.add_transition(106, d1)
-d2.add_transition(107, d1)
-d2.add_transition(108, d1)
-d2.add_transition(109, d1)
-d2.add_transition(110, d1)
-d2.add_transition(111, d1)
-d2.add_transition(112, d1)
-d2.add_transition(113, d1)
-d2.add_transition(114, d1)
-d2.add_transition(115, d1)
-d2.add_transition(116, d1)
-d2.add_transition(117, d1)
-d2.add_transition(118, d1)
-d2.add_transition(119, d1)
-d2.add_transition(120, d1)
-d2.add_transition(121, d1)
-d2.add_transition(122, d1)
-d2.add_transition(124, d1)
-d2.add_transition(126, d1)
-d2.add_transition(127, d1)
-d2.add_transition(128, d1)
-d2.add_transition(129, d1)
-d2.add_transition(130, d1)
-d2.add_transition(131, d1)
-d2.add_transition(132, d1)
-d2.add_transition(133, d1)
-d2.add_transition(134, d1)
-d2.add_transition(135, d1)
-d2.add_transition(136, d1)
-d2.add_transition(137, d1)
-d2.add_transition(138, d1)
-d2.add_transition(139, d1)
-d2.add_transition(140, d1)
-d2.add_transition(141, d1)
-d2.add_transition(142, d1)
-d2.add_transition(143, d1)
-d2.add_transition(144, d1)
-d2.add_transition(145, d1)
-d2.add_transition(146, d1)
-d2.add_transition(147, d1)
-d2.add_transition(148, d1)
-d2.add_transition(149, d1)
-d2.add_transition(150, d1)
-d2.add_transition(151, d1)
-d2.add_transition(152, d1)
-d2.add_transition(153, d1)
-d2.add_transition(154, d1)
-d2.add_transition(155, d1)
-d2.add_transition(156, d1)
-d2.add_transition(157, d1)
-d2.add_transition(158, d1)
-d2.add_transition(159, d1)
-d2.add_transition(160, d1)
-d2.add_transition(161, d1)
-d2.add_transition(162, d1)
-d2.add_transition(163, d1)
-d2.add_transition(164, d1)
-d2.add_transition(165, d1)
-d2.add_transition(166, d1)
-d2.add_transition(167, d1)
-d2.add_transition(168, d1)
-d2.add_transition(169, d1)
-d2.add_transition(170, d1)
-d2.add_transition(171, d1)
-d2.add_transition(172, d1)
-d2.add_transition(173, d1)
-d2.add_transition(174, d1)
-d2.add_transition(175, d1)
-d2.add_transition(176, d1)
-d2.add_transition(177, d1)
-d2.add_transition(178, d1)
-d2.add_transition(179, d1)
-d2.add_transition(180, d1)
-d2.add_transition(181, d1)
-d2.add_transition(182, d1)
-d2.add_transition(183, d1)
-d2.add_transition(184, d1)
-d2.add_transition(185, d1)
-d2.add_transition(186, d1)
-d2.add_transition(187, d1)
-d2.add_transition(188, d1)
-d2.add_transition(189, d1)
-d2.add_transition(190, d1)
-d2.add_transition(191, d1)
-d2.add_transition(192, d1)
-d2.add_transition(193, d1)
-d2.add_transition(194, d1)
-d2.add_transition(195, d1)
-d2.add_transition(196, d1)
-d2.add_transition(197, d1)
-d2.add_transition(198, d1)
-d2.add_transition(199, d1)
-d2.add_transition(200, d1)
-d2.add_transition(201, d1)
-d2.add_transition(202, d1)
-d2.add_transition(203, d1)
-d2.add_transition(204, d1)
-d2.add_transition(205, d1)
-d2.add_transition(206, d1)
-d2.add_transition(207, d1)
-d2.add_transition(208, d1)
-d2.add_transition(209, d1)
-d2.add_transition(210, d1)
-d2.add_transition(211, d1)
-d2.add_transition(212, d1)
-d2.add_transition(213, d1)
-d2.add_transition(214, d1)
-d2.add_transition(215, d1)
-d2.add_transition(216, d1)
-d2.add_transition(217, d1)
-d2.add_transition(218, d1)
-d2.add_transition(219, d1)
-d2.add_transition(220, d1)
-d2.add_transition(221, d1)
-d2.add_transition(222, d1)
-d2.add_transition(223, d1)
-d2.add_transition(224, d1)
-d2.add_transition(225, d1)
-d2.add_transition(226, d1)
-d2.add_transition(227, d1)
-d2.add_transition(228, d1)
-d2.add_transition(229, d1)
-d2.add_transition(230, d1)
-d2.add_transition(231, d1)
-d2.add_transition(232, d1)
-d2.add_transition(233, d1)
-d2.add_transition(234, d1)
-d2.add_transition(235, d1)
-d2.add_transition(236, d1)
-d2.add_transition(237, d1)
-d2.add_transition(238, d1)
-d2.add_transition(239, d1)
-d2.add_transition(240, d1)
-d2.add_transition(241, d1)
-d2.add_transition(242, d1)
-d2.add_transition(243, d1)
-d2.add_transition(244, d1)
-d2.add_transition(245, d1)
-d2.add_transition(246, d1)
-d2.add_transition(247, d1)
-d2.add_transition(248, d1)
-d2.add_transition(249, d1)
-d2.add_transition(250, d1)
-d2.add_transition(251, d1)
-d2.add_transition(252, d1)
-d2.add_transition(253, d1)
-d2.add_transition(254, d1)
-d2.add_transition(255, d1)
-
-d1.add_transition(0, d1)
-d1.add_transition(1, d1)
-d1.add_transition(2, d1)
-d1.add_transition(3, d1)
-d1.add_transition(4, d1)
-d1.add_transition(5, d1)
-d1.add_transition(6, d1)
-d1.add_transition(7, d1)
-d1.add_transition(8, d1)
-d1.add_transition(11, d1)
-d1.add_transition(12, d1)
-d1.add_transition(13, d1)
-d1.add_transition(14, d1)
-d1.add_transition(15, d1)
-d1.add_transition(16, d1)
-d1.add_transition(17, d1)
-d1.add_transition(18, d1)
-d1.add_transition(19, d1)
-d1.add_transition(20, d1)
-d1.add_transition(21, d1)
-d1.add_transition(22, d1)
-d1.add_transition(23, d1)
-d1.add_transition(24, d1)
-d1.add_transition(25, d1)
-d1.add_transition(26, d1)
-d1.add_transition(27, d1)
-d1.add_transition(28, d1)
-d1.add_transition(29, d1)
-d1.add_transition(30, d1)
-d1.add_transition(31, d1)
-d1.add_transition(32, d6)
-d1.add_transition(33, d1)
-d1.add_transition(34, d3)
-d1.add_transition(35, d1)
-d1.add_transition(36, d1)
-d1.add_transition(37, d1)
-d1.add_transition(38, d1)
-d1.add_transition(39, d5)
-d1.add_transition(40, d1)
-d1.add_transition(41, d1)
-d1.add_transition(42, d1)
-d1.add_transition(43, d1)
-d1.add_transition(44, d1)
-d1.add_transition(45, d1)
-d1.add_transition(46, d1)
-d1.add_transition(47, d1)
-d1.add_transition(48, d1)
-d1.add_transition(49, d1)
-d1.add_transition(50, d1)
-d1.add_transition(51, d1)
-d1.add_transition(52, d1)
-d1.add_transition(53, d1)
-d1.add_transition(54, d1)
-d1.add_transition(55, d1)
-d1.add_transition(56, d1)
-d1.add_transition(57, d1)
-d1.add_transition(58, d1)
-d1.add_transition(59, d1)
-d1.add_transition(60, d1)
-d1.add_transition(61, d1)
-d1.add_transition(62, d1)
-d1.add_transition(63, d1)
-d1.add_transition(64, d1)
-d1.add_transition(65, d1)
-d1.add_transition(66, d1)
-d1.add_transition(67, d1)
-d1.add_transition(68, d1)
-d1.add_transition(69, d1)
-d1.add_transition(70, d1)
-d1.add_transition(71, d1)
-d1.add_transition(72, d1)
-d1.add_transition(73, d1)
-d1.add_transition(74, d1)
-d1.add_transition(75, d1)
-d1.add_transition(76, d1)
-d1.add_transition(77, d1)
-d1.add_transition(78, d1)
-d1.add_transition(79, d1)
-d1.add_transition(80, d1)
-d1.add_transition(81, d1)
-d1.add_transition(82, d1)
-d1.add_transition(83, d1)
-d1.add_transition(84, d1)
-d1.add_transition(85, d1)
-d1.add_transition(86, d1)
-d1.add_transition(87, d1)
-d1.add_transition(88, d1)
-d1.add_transition(89, d1)
-d1.add_transition(90, d1)
-d1.add_transition(91, d1)
-d1.add_transition(92, d1)
-d1.add_transition(93, d1)
-d1.add_transition(94, d1)
-d1.add_transition(95, d1)
-d1.add_transition(96, d1)
-d1.add_transition(97, d1)
-d1.add_transition(98, d1)
-d1.add_transition(99, d1)
-d1.add_transition(100, d1)
-d1.add_transition(101, d1)
-d1.add_transition(102, d1)
-d1.add_transition(103, d1)
-d1.add_transition(104, d1)
-d1.add_transition(105, d1)
-d1.add_transition(106, d1)
-d1.add_transition(107, d1)
-d1.add_transition(108, d1)
-d1.add_transition(109, d1)
-d1.add_transition(110, d1)
-d1.add_transition(111, d1)
-d1.add_transition(112, d1)
-d1.add_transition(113, d1)
-d1.add_transition(114, d1)
-d1.add_transition(115, d1)
-d1.add_transition(116, d1)
-d1.add_transition(117, d1)
-d1.add_transition(118, d1)
-d1.add_transition(119, d1)
-d1.add_transition(120, d1)
-d1.add_transition(121, d1)
-d1.add_transition(122, d1)
-d1.add_transition(124, d1)
-d1.add_transition(126, d1)
-d1.add_transition(127, d1)
-d1.add_transition(128, d1)
-d1.add_transition(129, d1)
-d1.add_transition(130, d1)
-d1.add_transition(131, d1)
-d1.add_transition(132, d1)
-d1.add_transition(133, d1)
-d1.add_transition(134, d1)
-d1.add_transition(135, d1)
-d1.add_transition(136, d1)
-d1.add_transition(137, d1)
-d1.add_transition(138, d1)
-d1.add_transition(139, d1)
-d1.add_transition(140, d1)
-d1.add_transition(141, d1)
-d1.add_transition(142, d1)
-d1.add_transition(143, d1)
-d1.add_transition(144, d1)
-d1.add_transition(145, d1)
-d1.add_transition(146, d1)
-d1.add_transition(147, d1)
-d1.add_transition(148, d1)
-d1.add_transition(149, d1)
-d1.add_transition(150, d1)
-d1.add_transition(151, d1)
-d1.add_transition(152, d1)
-d1.add_transition(153, d1)
-d1.add_transition(154, d1)
-d1.add_transition(155, d1)
-d1.add_transition(156, d1)
-d1.add_transition(157, d1)
-d1.add_transition(158, d1)
-d1.add_transition(159, d1)
-d1.add_transition(160, d1)
-d1.add_transition(161, d1)
-d1.add_transition(162, d1)
-d1.add_transition(163, d1)
-d1.add_transition(164, d1)
-d1.add_transition(165, d1)
-d1.add_transition(166, d1)
-d1.add_transition(167, d1)
-d1.add_transition(168, d1)
-d1.add_transition(169, d1)
-d1.add_transition(170, d1)
-d1.add_transition(171, d1)
-d1.add_transition(172, d1)
-d1.add_transition(173, d1)
-d1.add_transition(174, d1)
-d1.add_transition(175, d1)
-d1.add_transition(176, d1)
-d1.add_transition(177, d1)
-d1.add_transition(178, d1)
-d1.add_transition(179, d1)
-d1.add_transition(180, d1)
-d1.add_transition(181, d1)
-d1.add_transition(182, d1)
-d1.add_transition(183, d1)
-d1.add_transition(184, d1)
-d1.add_transition(185, d1)
-d1.add_transition(186, d1)
-d1.add_transition(187, d1)
-d1.add_transition(188, d1)
-d1.add_transition(189, d1)
-d1.add_transition(190, d1)
-d1.add_transition(191, d1)
-d1.add_transition(192, d1)
-d1.add_transition(193, d1)
-d1.add_transition(194, d1)
-d1.add_transition(195, d1)
-d1.add_transition(196, d1)
-d1.add_transition(197, d1)
-d1.add_transition(198, d1)
-d1.add_transition(199, d1)
-d1.add_transition(200, d1)
-d1.add_transition(201, d1)
-d1.add_transition(202, d1)
-d1.add_transition(203, d1)
-d1.add_transition(204, d1)
-d1.add_transition(205, d1)
-d1.add_transition(206, d1)
-d1.add_transition(207, d1)
-d1.add_transition(208, d1)
-d1.add_transition(209, d1)
-d1.add_transition(210, d1)
-d1.add_transition(211, d1)
-d1.add_transition(212, d1)
-d1.add_transition(213, d1)
-d1.add_transition(214, d1)
-d1.add_transition(215, d1)
-d1.add_transition(216, d1)
-d1.add_transition(217, d1)
-d1.add_transition(218, d1)
-d1.add_transition(219, d1)
-d1.add_transition(220, d1)
-d1.add_transition(221, d1)
-d1.add_transition(222, d1)
-d1.add_transition(223, d1)
-d1.add_transition(224, d1)
-d1.add_transition(225, d1)
-d1.add_transition(226, d1)
-d1.add_transition(227, d1)
-d1.add_transition(228, d1)
-d1.add_transition(229, d1)
-d1.add_transition(230, d1)
-d1.add_transition(231, d1)
-d1.add_transition(232, d1)
-d1.add_transition(233, d1)
-d1.add_transition(234, d1)
-d1.add_transition(235, d1)
-d1.add_transition(236, d1)
-d1.add_transition(237, d1)
-d1.add_transition(238, d1)
-d1.add_transition(239, d1)
-d1.add_transition(240, d1)
-d1.add_transition(241, d1)
-d1.add_transition(242, d1)
-d1.add_transition(243, d1)
-d1.add_transition(244, d1)
-d1.add_transition(245, d1)
-d1.add_transition(246, d1)
-d1.add_transition(247, d1)
-d1.add_transition(248, d1)
-d1.add_transition(249, d1)
-d1.add_transition(250, d1)
-d1.add_transition(251, d1)
-d1.add_transition(252, d1)
-d1.add_transition(253, d1)
-d1.add_transition(254, d1)
-d1.add_transition(255, d1)
-
-d6.add_transition(32, d6)
-d6.add_transition(123, d9)
-
-d9.add_transition(0, d10)
-d9.add_transition(1, d10)
-d9.add_transition(2, d10)
-d9.add_transition(3, d10)
-d9.add_transition(4, d10)
-d9.add_transition(5, d10)
-d9.add_transition(6, d10)
-d9.add_transition(7, d10)
-d9.add_transition(8, d10)
-d9.add_transition(9, d10)
-d9.add_transition(10, d10)
-d9.add_transition(11, d10)
-d9.add_transition(12, d10)
-d9.add_transition(13, d10)
-d9.add_transition(14, d10)
-d9.add_transition(15, d10)
-d9.add_transition(16, d10)
-d9.add_transition(17, d10)
-d9.add_transition(18, d10)
-d9.add_transition(19, d10)
-d9.add_transition(20, d10)
-d9.add_transition(21, d10)
-d9.add_transition(22, d10)
-d9.add_transition(23, d10)
-d9.add_transition(24, d10)
-d9.add_transition(25, d10)
-d9.add_transition(26, d10)
-d9.add_transition(27, d10)
-d9.add_transition(28, d10)
-d9.add_transition(29, d10)
-d9.add_transition(30, d10)
-d9.add_transition(31, d10)
-d9.add_transition(32, d10)
-d9.add_transition(33, d10)
-d9.add_transition(34, d10)
-d9.add_transition(35, d10)
-d9.add_transition(36, d10)
-d9.add_transition(37, d10)
-d9.add_transition(38, d10)
-d9.add_transition(39, d10)
-d9.add_transition(40, d10)
-d9.add_transition(41, d10)
-d9.add_transition(42, d10)
-d9.add_transition(43, d10)
-d9.add_transition(44, d10)
-d9.add_transition(45, d10)
-d9.add_transition(46, d10)
-d9.add_transition(47, d10)
-d9.add_transition(48, d10)
-d9.add_transition(49, d10)
-d9.add_transition(50, d10)
-d9.add_transition(51, d10)
-d9.add_transition(52, d10)
-d9.add_transition(53, d10)
-d9.add_transition(54, d10)
-d9.add_transition(55, d10)
-d9.add_transition(56, d10)
-d9.add_transition(57, d10)
-d9.add_transition(58, d10)
-d9.add_transition(59, d10)
-d9.add_transition(60, d10)
-d9.add_transition(61, d10)
-d9.add_transition(62, d10)
-d9.add_transition(63, d10)
-d9.add_transition(64, d10)
-d9.add_transition(65, d10)
-d9.add_transition(66, d10)
-d9.add_transition(67, d10)
-d9.add_transition(68, d10)
-d9.add_transition(69, d10)
-d9.add_transition(70, d10)
-d9.add_transition(71, d10)
-d9.add_transition(72, d10)
-d9.add_transition(73, d10)
-d9.add_transition(74, d10)
-d9.add_transition(75, d10)
-d9.add_transition(76, d10)
-d9.add_transition(77, d10)
-d9.add_transition(78, d10)
-d9.add_transition(79, d10)
-d9.add_transition(80, d10)
-d9.add_transition(81, d10)
-d9.add_transition(82, d10)
-d9.add_transition(83, d10)
-d9.add_transition(84, d10)
-d9.add_transition(85, d10)
-d9.add_transition(86, d10)
-d9.add_transition(87, d10)
-d9.add_transition(88, d10)
-d9.add_transition(89, d10)
-d9.add_transition(90, d10)
-d9.add_transition(91, d10)
-d9.add_transition(92, d10)
-d9.add_transition(93, d10)
-d9.add_transition(94, d10)
-d9.add_transition(95, d10)
-d9.add_transition(96, d10)
-d9.add_transition(97, d10)
-d9.add_transition(98, d10)
-d9.add_transition(99, d10)
-d9.add_transition(100, d10)
-d9.add_transition(101, d10)
-d9.add_transition(102, d10)
-d9.add_transition(103, d10)
-d9.add_transition(104, d10)
-d9.add_transition(105, d10)
-d9.add_transition(106, d10)
-d9.add_transition(107, d10)
-d9.add_transition(108, d10)
-d9.add_transition(109, d10)
-d9.add_transition(110, d10)
-d9.add_transition(111, d10)
-d9.add_transition(112, d10)
-d9.add_transition(113, d10)
-d9.add_transition(114, d10)
-d9.add_transition(115, d10)
-d9.add_transition(116, d10)
-d9.add_transition(117, d10)
-d9.add_transition(118, d10)
-d9.add_transition(119, d10)
-d9.add_transition(120, d10)
-d9.add_transition(121, d10)
-d9.add_transition(122, d10)
-d9.add_transition(124, d10)
-d9.add_transition(126, d10)
-d9.add_transition(127, d10)
-d9.add_transition(128, d10)
-d9.add_transition(129, d10)
-d9.add_transition(130, d10)
-d9.add_transition(131, d10)
-d9.add_transition(132, d10)
-d9.add_transition(133, d10)
-d9.add_transition(134, d10)
-d9.add_transition(135, d10)
-d9.add_transition(136, d10)
-d9.add_transition(137, d10)
-d9.add_transition(138, d10)
-d9.add_transition(139, d10)
-d9.add_transition(140, d10)
-d9.add_transition(141, d10)
-d9.add_transition(142, d10)
-d9.add_transition(143, d10)
-d9.add_transition(144, d10)
-d9.add_transition(145, d10)
-d9.add_transition(146, d10)
-d9.add_transition(147, d10)
-d9.add_transition(148, d10)
-d9.add_transition(149, d10)
-d9.add_transition(150, d10)
-d9.add_transition(151, d10)
-d9.add_transition(152, d10)
-d9.add_transition(153, d10)
-d9.add_transition(154, d10)
-d9.add_transition(155, d10)
-d9.add_transition(156, d10)
-d9.add_transition(157, d10)
-d9.add_transition(158, d10)
-d9.add_transition(159, d10)
-d9.add_transition(160, d10)
-d9.add_transition(161, d10)
-d9.add_transition(162, d10)
-d9.add_transition(163, d10)
-d9.add_transition(164, d10)
-d9.add_transition(165, d10)
-d9.add_transition(166, d10)
-d9.add_transition(167, d10)
-d9.add_transition(168, d10)
-d9.add_transition(169, d10)
-d9.add_transition(170, d10)
-d9.add_transition(171, d10)
-d9.add_transition(172, d10)
-d9.add_transition(173, d10)
-d9.add_transition(174, d10)
-d9.add_transition(175, d10)
-d9.add_transition(176, d10)
-d9.add_transition(177, d10)
-d9.add_transition(178, d10)
-d9.add_transition(179, d10)
-d9.add_transition(180, d10)
-d9.add_transition(181, d10)
-d9.add_transition(182, d10)
-d9.add_transition(183, d10)
-d9.add_transition(184, d10)
-d9.add_transition(185, d10)
-d9.add_transition(186, d10)
-d9.add_transition(187, d10)
-d9.add_transition(188, d10)
-d9.add_transition(189, d10)
-d9.add_transition(190, d10)
-d9.add_transition(191, d10)
-d9.add_transition(192, d10)
-d9.add_transition(193, d10)
-d9.add_transition(194, d10)
-d9.add_transition(195, d10)
-d9.add_transition(196, d10)
-d9.add_transition(197, d10)
-d9.add_transition(198, d10)
-d9.add_transition(199, d10)
-d9.add_transition(200, d10)
-d9.add_transition(201, d10)
-d9.add_transition(202, d10)
-d9.add_transition(203, d10)
-d9.add_transition(204, d10)
-d9.add_transition(205, d10)
-d9.add_transition(206, d10)
-d9.add_transition(207, d10)
-d9.add_transition(208, d10)
-d9.add_transition(209, d10)
-d9.add_transition(210, d10)
-d9.add_transition(211, d10)
-d9.add_transition(212, d10)
-d9.add_transition(213, d10)
-d9.add_transition(214, d10)
-d9.add_transition(215, d10)
-d9.add_transition(216, d10)
-d9.add_transition(217, d10)
-d9.add_transition(218, d10)
-d9.add_transition(219, d10)
-d9.add_transition(220, d10)
-d9.add_transition(221, d10)
-d9.add_transition(222, d10)
-d9.add_transition(223, d10)
-d9.add_transition(224, d10)
-d9.add_transition(225, d10)
-d9.add_transition(226, d10)
-d9.add_transition(227, d10)
-d9.add_transition(228, d10)
-d9.add_transition(229, d10)
-d9.add_transition(230, d10)
-d9.add_transition(231, d10)
-d9.add_transition(232, d10)
-d9.add_transition(233, d10)
-d9.add_transition(234, d10)
-d9.add_transition(235, d10)
-d9.add_transition(236, d10)
-d9.add_transition(237, d10)
-d9.add_transition(238, d10)
-d9.add_transition(239, d10)
-d9.add_transition(240, d10)
-d9.add_transition(241, d10)
-d9.add_transition(242, d10)
-d9.add_transition(243, d10)
-d9.add_transition(244, d10)
-d9.add_transition(245, d10)
-d9.add_transition(246, d10)
-d9.add_transition(247, d10)
-d9.add_transition(248, d10)
-d9.add_transition(249, d10)
-d9.add_transition(250, d10)
-d9.add_transition(251, d10)
-d9.add_transition(252, d10)
-d9.add_transition(253, d10)
-d9.add_transition(254, d10)
-d9.add_transition(255, d10)
-
-d10.add_transition(0, d10)
-d10.add_transition(1, d10)
-d10.add_transition(2, d10)
-d10.add_transition(3, d10)
-d10.add_transition(4, d10)
-d10.add_transition(5, d10)
-d10.add_transition(6, d10)
-d10.add_transition(7, d10)
-d10.add_transition(8, d10)
-d10.add_transition(9, d10)
-d10.add_transition(10, d10)
-d10.add_transition(11, d10)
-d10.add_transition(12, d10)
-d10.add_transition(13, d10)
-d10.add_transition(14, d10)
-d10.add_transition(15, d10)
-d10.add_transition(16, d10)
-d10.add_transition(17, d10)
-d10.add_transition(18, d10)
-d10.add_transition(19, d10)
-d10.add_transition(20, d10)
-d10.add_transition(21, d10)
-d10.add_transition(22, d10)
-d10.add_transition(23, d10)
-d10.add_transition(24, d10)
-d10.add_transition(25, d10)
-d10.add_transition(26, d10)
-d10.add_transition(27, d10)
-d10.add_transition(28, d10)
-d10.add_transition(29, d10)
-d10.add_transition(30, d10)
-d10.add_transition(31, d10)
-d10.add_transition(32, d10)
-d10.add_transition(33, d10)
-d10.add_transition(34, d10)
-d10.add_transition(35, d10)
-d10.add_transition(36, d10)
-d10.add_transition(37, d10)
-d10.add_transition(38, d10)
-d10.add_transition(39, d10)
-d10.add_transition(40, d10)
-d10.add_transition(41, d10)
-d10.add_transition(42, d10)
-d10.add_transition(43, d10)
-d10.add_transition(44, d10)
-d10.add_transition(45, d10)
-d10.add_transition(46, d10)
-d10.add_transition(47, d10)
-d10.add_transition(48, d10)
-d10.add_transition(49, d10)
-d10.add_transition(50, d10)
-d10.add_transition(51, d10)
-d10.add_transition(52, d10)
-d10.add_transition(53, d10)
-d10.add_transition(54, d10)
-d10.add_transition(55, d10)
-d10.add_transition(56, d10)
-d10.add_transition(57, d10)
-d10.add_transition(58, d10)
-d10.add_transition(59, d10)
-d10.add_transition(60, d10)
-d10.add_transition(61, d10)
-d10.add_transition(62, d10)
-d10.add_transition(63, d10)
-d10.add_transition(64, d10)
-d10.add_transition(65, d10)
-d10.add_transition(66, d10)
-d10.add_transition(67, d10)
-d10.add_transition(68, d10)
-d10.add_transition(69, d10)
-d10.add_transition(70, d10)
-d10.add_transition(71, d10)
-d10.add_transition(72, d10)
-d10.add_transition(73, d10)
-d10.add_transition(74, d10)
-d10.add_transition(75, d10)
-d10.add_transition(76, d10)
-d10.add_transition(77, d10)
-d10.add_transition(78, d10)
-d10.add_transition(79, d10)
-d10.add_transition(80, d10)
-d10.add_transition(81, d10)
-d10.add_transition(82, d10)
-d10.add_transition(83, d10)
-d10.add_transition(84, d10)
-d10.add_transition(85, d10)
-d10.add_transition(86, d10)
-d10.add_transition(87, d10)
-d10.add_transition(88, d10)
-d10.add_transition(89, d10)
-d10.add_transition(90, d10)
-d10.add_transition(91, d10)
-d10.add_transition(92, d10)
-d10.add_transition(93, d10)
-d10.add_transition(94, d10)
-d10.add_transition(95, d10)
-d10.add_transition(96, d10)
-d10.add_transition(97, d10)
-d10.add_transition(98, d10)
-d10.add_transition(99, d10)
-d10.add_transition(100, d10)
-d10.add_transition(101, d10)
-d10.add_transition(102, d10)
-d10.add_transition(103, d10)
-d10.add_transition(104, d10)
-d10.add_transition(105, d10)
-d10.add_transition(106, d10)
-d10.add_transition(107, d10)
-d10.add_transition(108, d10)
-d10.add_transition(109, d10)
-d10.add_transition(110, d10)
-d10.add_transition(111, d10)
-d10.add_transition(112, d10)
-d10.add_transition(113, d10)
-d10.add_transition(114, d10)
-d10.add_transition(115, d10)
-d10.add_transition(116, d10)
-d10.add_transition(117, d10)
-d10.add_transition(118, d10)
-d10.add_transition(119, d10)
-d10.add_transition(120, d10)
-d10.add_transition(121, d10)
-d10.add_transition(122, d10)
-d10.add_transition(124, d10)
-d10.add_transition(125, d11)
-d10.add_transition(126, d10)
-d10.add_transition(127, d10)
-d10.add_transition(128, d10)
-d10.add_transition(129, d10)
-d10.add_transition(130, d10)
-d10.add_transition(131, d10)
-d10.add_transition(132, d10)
-d10.add_transition(133, d10)
-d10.add_transition(134, d10)
-d10.add_transition(135, d10)
-d10.add_transition(136, d10)
-d10.add_transition(137, d10)
-d10.add_transition(138, d10)
-d10.add_transition(139, d10)
-d10.add_transition(140, d10)
-d10.add_transition(141, d10)
-d10.add_transition(142, d10)
-d10.add_transition(143, d10)
-d10.add_transition(144, d10)
-d10.add_transition(145, d10)
-d10.add_transition(146, d10)
-d10.add_transition(147, d10)
-d10.add_transition(148, d10)
-d10.add_transition(149, d10)
-d10.add_transition(150, d10)
-d10.add_transition(151, d10)
-d10.add_transition(152, d10)
-d10.add_transition(153, d10)
-d10.add_transition(154, d10)
-d10.add_transition(155, d10)
-d10.add_transition(156, d10)
-d10.add_transition(157, d10)
-d10.add_transition(158, d10)
-d10.add_transition(159, d10)
-d10.add_transition(160, d10)
-d10.add_transition(161, d10)
-d10.add_transition(162, d10)
-d10.add_transition(163, d10)
-d10.add_transition(164, d10)
-d10.add_transition(165, d10)
-d10.add_transition(166, d10)
-d10.add_transition(167, d10)
-d10.add_transition(168, d10)
-d10.add_transition(169, d10)
-d10.add_transition(170, d10)
-d10.add_transition(171, d10)
-d10.add_transition(172, d10)
-d10.add_transition(173, d10)
-d10.add_transition(174, d10)
-d10.add_transition(175, d10)
-d10.add_transition(176, d10)
-d10.add_transition(177, d10)
-d10.add_transition(178, d10)
-d10.add_transition(179, d10)
-d10.add_transition(180, d10)
-d10.add_transition(181, d10)
-d10.add_transition(182, d10)
-d10.add_transition(183, d10)
-d10.add_transition(184, d10)
-d10.add_transition(185, d10)
-d10.add_transition(186, d10)
-d10.add_transition(187, d10)
-d10.add_transition(188, d10)
-d10.add_transition(189, d10)
-d10.add_transition(190, d10)
-d10.add_transition(191, d10)
-d10.add_transition(192, d10)
-d10.add_transition(193, d10)
-d10.add_transition(194, d10)
-d10.add_transition(195, d10)
-d10.add_transition(196, d10)
-d10.add_transition(197, d10)
-d10.add_transition(198, d10)
-d10.add_transition(199, d10)
-d10.add_transition(200, d10)
-d10.add_transition(201, d10)
-d10.add_transition(202, d10)
-d10.add_transition(203, d10)
-d10.add_transition(204, d10)
-d10.add_transition(205, d10)
-d10.add_transition(206, d10)
-d10.add_transition(207, d10)
-d10.add_transition(208, d10)
-d10.add_transition(209, d10)
-d10.add_transition(210, d10)
-d10.add_transition(211, d10)
-d10.add_transition(212, d10)
-d10.add_transition(213, d10)
-d10.add_transition(214, d10)
-d10.add_transition(215, d10)
-d10.add_transition(216, d10)
-d10.add_transition(217, d10)
-d10.add_transition(218, d10)
-d10.add_transition(219, d10)
-d10.add_transition(220, d10)
-d10.add_transition(221, d10)
-d10.add_transition(222, d10)
-d10.add_transition(223, d10)
-d10.add_transition(224, d10)
-d10.add_transition(225, d10)
-d10.add_transition(226, d10)
-d10.add_transition(227, d10)
-d10.add_transition(228, d10)
-d10.add_transition(229, d10)
-d10.add_transition(230, d10)
-d10.add_transition(231, d10)
-d10.add_transition(232, d10)
-d10.add_transition(233, d10)
-d10.add_transition(234, d10)
-d10.add_transition(235, d10)
-d10.add_transition(236, d10)
-d10.add_transition(237, d10)
-d10.add_transition(238, d10)
-d10.add_transition(239, d10)
-d10.add_transition(240, d10)
-d10.add_transition(241, d10)
-d10.add_transition(242, d10)
-d10.add_transition(243, d10)
-d10.add_transition(244, d10)
-d10.add_transition(245, d10)
-d10.add_transition(246, d10)
-d10.add_transition(247, d10)
-d10.add_transition(248, d10)
-d10.add_transition(249, d10)
-d10.add_transition(250, d10)
-d10.add_transition(251, d10)
-d10.add_transition(252, d10)
-d10.add_transition(253, d10)
-d10.add_transition(254, d10)
-d10.add_transition(255, d10)
-
-d11.isFinalState = True
-d11.addToken( 'TOKENS')
-
-d3.add_transition(0, d4)
-d3.add_transition(1, d4)
-d3.add_transition(2, d4)
-d3.add_transition(3, d4)
-d3.add_transition(4, d4)
-d3.add_transition(5, d4)
-d3.add_transition(6, d4)
-d3.add_transition(7, d4)
-d3.add_transition(8, d4)
-d3.add_transition(9, d4)
-d3.add_transition(10, d4)
-d3.add_transition(11, d4)
-d3.add_transition(12, d4)
-d3.add_transition(13, d4)
-d3.add_transition(14, d4)
-d3.add_transition(15, d4)
-d3.add_transition(16, d4)
-d3.add_transition(17, d4)
-d3.add_transition(18, d4)
-d3.add_transition(19, d4)
-d3.add_transition(20, d4)
-d3.add_transition(21, d4)
-d3.add_transition(22, d4)
-d3.add_transition(23, d4)
-d3.add_transition(24, d4)
-d3.add_transition(25, d4)
-d3.add_transition(26, d4)
-d3.add_transition(27, d4)
-d3.add_transition(28, d4)
-d3.add_transition(29, d4)
-d3.add_transition(30, d4)
-d3.add_transition(31, d4)
-d3.add_transition(32, d4)
-d3.add_transition(33, d4)
-d3.add_transition(35, d4)
-d3.add_transition(36, d4)
-d3.add_transition(37, d4)
-d3.add_transition(38, d4)
-d3.add_transition(39, d4)
-d3.add_transition(40, d4)
-d3.add_transition(41, d4)
-d3.add_transition(42, d4)
-d3.add_transition(43, d4)
-d3.add_transition(44, d4)
-d3.add_transition(45, d4)
-d3.add_transition(46, d4)
-d3.add_transition(47, d4)
-d3.add_transition(48, d4)
-d3.add_transition(49, d4)
-d3.add_transition(50, d4)
-d3.add_transition(51, d4)
-d3.add_transition(52, d4)
-d3.add_transition(53, d4)
-d3.add_transition(54, d4)
-d3.add_transition(55, d4)
-d3.add_transition(56, d4)
-d3.add_transition(57, d4)
-d3.add_transition(58, d4)
-d3.add_transition(59, d4)
-d3.add_transition(60, d4)
-d3.add_transition(61, d4)
-d3.add_transition(62, d4)
-d3.add_transition(63, d4)
-d3.add_transition(64, d4)
-d3.add_transition(65, d4)
-d3.add_transition(66, d4)
-d3.add_transition(67, d4)
-d3.add_transition(68, d4)
-d3.add_transition(69, d4)
-d3.add_transition(70, d4)
-d3.add_transition(71, d4)
-d3.add_transition(72, d4)
-d3.add_transition(73, d4)
-d3.add_transition(74, d4)
-d3.add_transition(75, d4)
-d3.add_transition(76, d4)
-d3.add_transition(77, d4)
-d3.add_transition(78, d4)
-d3.add_transition(79, d4)
-d3.add_transition(80, d4)
-d3.add_transition(81, d4)
-d3.add_transition(82, d4)
-d3.add_transition(83, d4)
-d3.add_transition(84, d4)
-d3.add_transition(85, d4)
-d3.add_transition(86, d4)
-d3.add_transition(87, d4)
-d3.add_transition(88, d4)
-d3.add_transition(89, d4)
-d3.add_transition(90, d4)
-d3.add_transition(91, d4)
-d3.add_transition(92, d4)
-d3.add_transition(93, d4)
-d3.add_transition(94, d4)
-d3.add_transition(95, d4)
-d3.add_transition(96, d4)
-d3.add_transition(97, d4)
-d3.add_transition(98, d4)
-d3.add_transition(99, d4)
-d3.add_transition(100, d4)
-d3.add_transition(101, d4)
-d3.add_transition(102, d4)
-d3.add_transition(103, d4)
-d3.add_transition(104, d4)
-d3.add_transition(105, d4)
-d3.add_transition(106, d4)
-d3.add_transition(107, d4)
-d3.add_transition(108, d4)
-d3.add_transition(109, d4)
-d3.add_transition(110, d4)
-d3.add_transition(111, d4)
-d3.add_transition(112, d4)
-d3.add_transition(113, d4)
-d3.add_transition(114, d4)
-d3.add_transition(115, d4)
-d3.add_transition(116, d4)
-d3.add_transition(117, d4)
-d3.add_transition(118, d4)
-d3.add_transition(119, d4)
-d3.add_transition(120, d4)
-d3.add_transition(121, d4)
-d3.add_transition(122, d4)
-d3.add_transition(123, d4)
-d3.add_transition(124, d4)
-d3.add_transition(125, d4)
-d3.add_transition(126, d4)
-d3.add_transition(127, d4)
-d3.add_transition(128, d4)
-d3.add_transition(129, d4)
-d3.add_transition(130, d4)
-d3.add_transition(131, d4)
-d3.add_transition(132, d4)
-d3.add_transition(133, d4)
-d3.add_transition(134, d4)
-d3.add_transition(135, d4)
-d3.add_transition(136, d4)
-d3.add_transition(137, d4)
-d3.add_transition(138, d4)
-d3.add_transition(139, d4)
-d3.add_transition(140, d4)
-d3.add_transition(141, d4)
-d3.add_transition(142, d4)
-d3.add_transition(143, d4)
-d3.add_transition(144, d4)
-d3.add_transition(145, d4)
-d3.add_transition(146, d4)
-d3.add_transition(147, d4)
-d3.add_transition(148, d4)
-d3.add_transition(149, d4)
-d3.add_transition(150, d4)
-d3.add_transition(151, d4)
-d3.add_transition(152, d4)
-d3.add_transition(153, d4)
-d3.add_transition(154, d4)
-d3.add_transition(155, d4)
-d3.add_transition(156, d4)
-d3.add_transition(157, d4)
-d3.add_transition(158, d4)
-d3.add_transition(159, d4)
-d3.add_transition(160, d4)
-d3.add_transition(161, d4)
-d3.add_transition(162, d4)
-d3.add_transition(163, d4)
-d3.add_transition(164, d4)
-d3.add_transition(165, d4)
-d3.add_transition(166, d4)
-d3.add_transition(167, d4)
-d3.add_transition(168, d4)
-d3.add_transition(169, d4)
-d3.add_transition(170, d4)
-d3.add_transition(171, d4)
-d3.add_transition(172, d4)
-d3.add_transition(173, d4)
-d3.add_transition(174, d4)
-d3.add_transition(175, d4)
-d3.add_transition(176, d4)
-d3.add_transition(177, d4)
-d3.add_transition(178, d4)
-d3.add_transition(179, d4)
-d3.add_transition(180, d4)
-d3.add_transition(181, d4)
-d3.add_transition(182, d4)
-d3.add_transition(183, d4)
-d3.add_transition(184, d4)
-d3.add_transition(185, d4)
-d3.add_transition(186, d4)
-d3.add_transition(187, d4)
-d3.add_transition(188, d4)
-d3.add_transition(189, d4)
-d3.add_transition(190, d4)
-d3.add_transition(191, d4)
-d3.add_transition(192, d4)
-d3.add_transition(193, d4)
-d3.add_transition(194, d4)
-d3.add_transition(195, d4)
-d3.add_transition(196, d4)
-d3.add_transition(197, d4)
-d3.add_transition(198, d4)
-d3.add_transition(199, d4)
-d3.add_transition(200, d4)
-d3.add_transition(201, d4)
-d3.add_transition(202, d4)
-d3.add_transition(203, d4)
-d3.add_transition(204, d4)
-d3.add_transition(205, d4)
-d3.add_transition(206, d4)
-d3.add_transition(207, d4)
-d3.add_transition(208, d4)
-d3.add_transition(209, d4)
-d3.add_transition(210, d4)
-d3.add_transition(211, d4)
-d3.add_transition(212, d4)
-d3.add_transition(213, d4)
-d3.add_transition(214, d4)
-d3.add_transition(215, d4)
-d3.add_transition(216, d4)
-d3.add_transition(217, d4)
-d3.add_transition(218, d4)
-d3.add_transition(219, d4)
-d3.add_transition(220, d4)
-d3.add_transition(221, d4)
-d3.add_transition(222, d4)
-d3.add_transition(223, d4)
-d3.add_transition(224, d4)
-d3.add_transition(225, d4)
-d3.add_transition(226, d4)
-d3.add_transition(227, d4)
-d3.add_transition(228, d4)
-d3.add_transition(229, d4)
-d3.add_transition(230, d4)
-d3.add_transition(231, d4)
-d3.add_transition(232, d4)
-d3.add_transition(233, d4)
-d3.add_transition(234, d4)
-d3.add_transition(235, d4)
-d3.add_transition(236, d4)
-d3.add_transition(237, d4)
-d3.add_transition(238, d4)
-d3.add_transition(239, d4)
-d3.add_transition(240, d4)
-d3.add_transition(241, d4)
-d3.add_transition(242, d4)
-d3.add_transition(243, d4)
-d3.add_transition(244, d4)
-d3.add_transition(245, d4)
-d3.add_transition(246, d4)
-d3.add_transition(247, d4)
-d3.add_transition(248, d4)
-d3.add_transition(249, d4)
-d3.add_transition(250, d4)
-d3.add_transition(251, d4)
-d3.add_transition(252, d4)
-d3.add_transition(253, d4)
-d3.add_transition(254, d4)
-d3.add_transition(255, d4)
-
-d4.add_transition(0, d4)
-d4.add_transition(1, d4)
-d4.add_transition(2, d4)
-d4.add_transition(3, d4)
-d4.add_transition(4, d4)
-d4.add_transition(5, d4)
-d4.add_transition(6, d4)
-d4.add_transition(7, d4)
-d4.add_transition(8, d4)
-d4.add_transition(9, d4)
-d4.add_transition(10, d4)
-d4.add_transition(11, d4)
-d4.add_transition(12, d4)
-d4.add_transition(13, d4)
-d4.add_transition(14, d4)
-d4.add_transition(15, d4)
-d4.add_transition(16, d4)
-d4.add_transition(17, d4)
-d4.add_transition(18, d4)
-d4.add_transition(19, d4)
-d4.add_transition(20, d4)
-d4.add_transition(21, d4)
-d4.add_transition(22, d4)
-d4.add_transition(23, d4)
-d4.add_transition(24, d4)
-d4.add_transition(25, d4)
-d4.add_transition(26, d4)
-d4.add_transition(27, d4)
-d4.add_transition(28, d4)
-d4.add_transition(29, d4)
-d4.add_transition(30, d4)
-d4.add_transition(31, d4)
-d4.add_transition(32, d4)
-d4.add_transition(33, d4)
-d4.add_transition(34, d1)
-d4.add_transition(35, d4)
-d4.add_transition(36, d4)
-d4.add_transition(37, d4)
-d4.add_transition(38, d4)
-d4.add_transition(39, d4)
-d4.add_transition(40, d4)
-d4.add_transition(41, d4)
-d4.add_transition(42, d4)
-d4.add_transition(43, d4)
-d4.add_transition(44, d4)
-d4.add_transition(45, d4)
-d4.add_transition(46, d4)
-d4.add_transition(47, d4)
-d4.add_transition(48, d4)
-d4.add_transition(49, d4)
-d4.add_transition(50, d4)
-d4.add_transition(51, d4)
-d4.add_transition(52, d4)
-d4.add_transition(53, d4)
-d4.add_transition(54, d4)
-d4.add_transition(55, d4)
-d4.add_transition(56, d4)
-d4.add_transition(57, d4)
-d4.add_transition(58, d4)
-d4.add_transition(59, d4)
-d4.add_transition(60, d4)
-d4.add_transition(61, d4)
-d4.add_transition(62, d4)
-d4.add_transition(63, d4)
-d4.add_transition(64, d4)
-d4.add_transition(65, d4)
-d4.add_transition(66, d4)
-d4.add_transition(67, d4)
-d4.add_transition(68, d4)
-d4.add_transition(69, d4)
-d4.add_transition(70, d4)
-d4.add_transition(71, d4)
-d4.add_transition(72, d4)
-d4.add_transition(73, d4)
-d4.add_transition(74, d4)
-d4.add_transition(75, d4)
-d4.add_transition(76, d4)
-d4.add_transition(77, d4)
-d4.add_transition(78, d4)
-d4.add_transition(79, d4)
-d4.add_transition(80, d4)
-d4.add_transition(81, d4)
-d4.add_transition(82, d4)
-d4.add_transition(83, d4)
-d4.add_transition(84, d4)
-d4.add_transition(85, d4)
-d4.add_transition(86, d4)
-d4.add_transition(87, d4)
-d4.add_transition(88, d4)
-d4.add_transition(89, d4)
-d4.add_transition(90, d4)
-d4.add_transition(91, d4)
-d4.add_transition(92, d4)
-d4.add_transition(93, d4)
-d4.add_transition(94, d4)
-d4.add_transition(95, d4)
-d4.add_transition(96, d4)
-d4.add_transition(97, d4)
-d4.add_transition(98, d4)
-d4.add_transition(99, d4)
-d4.add_transition(100, d4)
-d4.add_transition(101, d4)
-d4.add_transition(102, d4)
-d4.add_transition(103, d4)
-d4.add_transition(104, d4)
-d4.add_transition(105, d4)
-d4.add_transition(106, d4)
-d4.add_transition(107, d4)
-d4.add_transition(108, d4)
-d4.add_transition(109, d4)
-d4.add_transition(110, d4)
-d4.add_transition(111, d4)
-d4.add_transition(112, d4)
-d4.add_transition(113, d4)
-d4.add_transition(114, d4)
-d4.add_transition(115, d4)
-d4.add_transition(116, d4)
-d4.add_transition(117, d4)
-d4.add_transition(118, d4)
-d4.add_transition(119, d4)
-d4.add_transition(120, d4)
-d4.add_transition(121, d4)
-d4.add_transition(122, d4)
-d4.add_transition(123, d4)
-d4.add_transition(124, d4)
-d4.add_transition(125, d4)
-d4.add_transition(126, d4)
-d4.add_transition(127, d4)
-d4.add_transition(128, d4)
-d4.add_transition(129, d4)
-d4.add_transition(130, d4)
-d4.add_transition(131, d4)
-d4.add_transition(132, d4)
-d4.add_transition(133, d4)
-d4.add_transition(134, d4)
-d4.add_transition(135, d4)
-d4.add_transition(136, d4)
-d4.add_transition(137, d4)
-d4.add_transition(138, d4)
-d4.add_transition(139, d4)
-d4.add_transition(140, d4)
-d4.add_transition(141, d4)
-d4.add_transition(142, d4)
-d4.add_transition(143, d4)
-d4.add_transition(144, d4)
-d4.add_transition(145, d4)
-d4.add_transition(146, d4)
-d4.add_transition(147, d4)
-d4.add_transition(148, d4)
-d4.add_transition(149, d4)
-d4.add_transition(150, d4)
-d4.add_transition(151, d4)
-d4.add_transition(152, d4)
-d4.add_transition(153, d4)
-d4.add_transition(154, d4)
-d4.add_transition(155, d4)
-d4.add_transition(156, d4)
-d4.add_transition(157, d4)
-d4.add_transition(158, d4)
-d4.add_transition(159, d4)
-d4.add_transition(160, d4)
-d4.add_transition(161, d4)
-d4.add_transition(162, d4)
-d4.add_transition(163, d4)
-d4.add_transition(164, d4)
-d4.add_transition(165, d4)
-d4.add_transition(166, d4)
-d4.add_transition(167, d4)
-d4.add_transition(168, d4)
-d4.add_transition(169, d4)
-d4.add_transition(170, d4)
-d4.add_transition(171, d4)
-d4.add_transition(172, d4)
-d4.add_transition(173, d4)
-d4.add_transition(174, d4)
-d4.add_transition(175, d4)
-d4.add_transition(176, d4)
-d4.add_transition(177, d4)
-d4.add_transition(178, d4)
-d4.add_transition(179, d4)
-d4.add_transition(180, d4)
-d4.add_transition(181, d4)
-d4.add_transition(182, d4)
-d4.add_transition(183, d4)
-d4.add_transition(184, d4)
-d4.add_transition(185, d4)
-d4.add_transition(186, d4)
-d4.add_transition(187, d4)
-d4.add_transition(188, d4)
-d4.add_transition(189, d4)
-d4.add_transition(190, d4)
-d4.add_transition(191, d4)
-d4.add_transition(192, d4)
-d4.add_transition(193, d4)
-d4.add_transition(194, d4)
-d4.add_transition(195, d4)
-d4.add_transition(196, d4)
-d4.add_transition(197, d4)
-d4.add_transition(198, d4)
-d4.add_transition(199, d4)
-d4.add_transition(200, d4)
-d4.add_transition(201, d4)
-d4.add_transition(202, d4)
-d4.add_transition(203, d4)
-d4.add_transition(204, d4)
-d4.add_transition(205, d4)
-d4.add_transition(206, d4)
-d4.add_transition(207, d4)
-d4.add_transition(208, d4)
-d4.add_transition(209, d4)
-d4.add_transition(210, d4)
-d4.add_transition(211, d4)
-d4.add_transition(212, d4)
-d4.add_transition(213, d4)
-d4.add_transition(214, d4)
-d4.add_transition(215, d4)
-d4.add_transition(216, d4)
-d4.add_transition(217, d4)
-d4.add_transition(218, d4)
-d4.add_transition(219, d4)
-d4.add_transition(220, d4)
-d4.add_transition(221, d4)
-d4.add_transition(222, d4)
-d4.add_transition(223, d4)
-d4.add_transition(224, d4)
-d4.add_transition(225, d4)
-d4.add_transition(226, d4)
-d4.add_transition(227, d4)
-d4.add_transition(228, d4)
-d4.add_transition(229, d4)
-d4.add_transition(230, d4)
-d4.add_transition(231, d4)
-d4.add_transition(232, d4)
-d4.add_transition(233, d4)
-d4.add_transition(234, d4)
-d4.add_transition(235, d4)
-d4.add_transition(236, d4)
-d4.add_transition(237, d4)
-d4.add_transition(238, d4)
-d4.add_transition(239, d4)
-d4.add_transition(240, d4)
-d4.add_transition(241, d4)
-d4.add_transition(242, d4)
-d4.add_transition(243, d4)
-d4.add_transition(244, d4)
-d4.add_transition(245, d4)
-d4.add_transition(246, d4)
-d4.add_transition(247, d4)
-d4.add_transition(248, d4)
-d4.add_transition(249, d4)
-d4.add_transition(250, d4)
-d4.add_transition(251, d4)
-d4.add_transition(252, d4)
-d4.add_transition(253, d4)
-d4.add_transition(254, d4)
-d4.add_transition(255, d4)
-
-d5.add_transition(0, d7)
-d5.add_transition(1, d7)
-d5.add_transition(2, d7)
-d5.add_transition(3, d7)
-d5.add_transition(4, d7)
-d5.add_transition(5, d7)
-d5.add_transition(6, d7)
-d5.add_transition(7, d7)
-d5.add_transition(8, d7)
-d5.add_transition(9, d7)
-d5.add_transition(10, d7)
-d5.add_transition(11, d7)
-d5.add_transition(12, d7)
-d5.add_transition(13, d7)
-d5.add_transition(14, d7)
-d5.add_transition(15, d7)
-d5.add_transition(16, d7)
-d5.add_transition(17, d7)
-d5.add_transition(18, d7)
-d5.add_transition(19, d7)
-d5.add_transition(20, d7)
-d5.add_transition(21, d7)
-d5.add_transition(22, d7)
-d5.add_transition(23, d7)
-d5.add_transition(24, d7)
-d5.add_transition(25, d7)
-d5.add_transition(26, d7)
-d5.add_transition(27, d7)
-d5.add_transition(28, d7)
-d5.add_transition(29, d7)
-d5.add_transition(30, d7)
-d5.add_transition(31, d7)
-d5.add_transition(32, d7)
-d5.add_transition(33, d7)
-d5.add_transition(34, d7)
-d5.add_transition(35, d7)
-d5.add_transition(36, d7)
-d5.add_transition(37, d7)
-d5.add_transition(38, d7)
-d5.add_transition(39, d7)
-d5.add_transition(40, d7)
-d5.add_transition(41, d7)
-d5.add_transition(42, d7)
-d5.add_transition(43, d7)
-d5.add_transition(44, d7)
-d5.add_transition(45, d7)
-d5.add_transition(46, d7)
-d5.add_transition(47, d7)
-d5.add_transition(48, d7)
-d5.add_transition(49, d7)
-d5.add_transition(50, d7)
-d5.add_transition(51, d7)
-d5.add_transition(52, d7)
-d5.add_transition(53, d7)
-d5.add_transition(54, d7)
-d5.add_transition(55, d7)
-d5.add_transition(56, d7)
-d5.add_transition(57, d7)
-d5.add_transition(58, d7)
-d5.add_transition(59, d7)
-d5.add_transition(60, d7)
-d5.add_transition(61, d7)
-d5.add_transition(62, d7)
-d5.add_transition(63, d7)
-d5.add_transition(64, d7)
-d5.add_transition(65, d7)
-d5.add_transition(66, d7)
-d5.add_transition(67, d7)
-d5.add_transition(68, d7)
-d5.add_transition(69, d7)
-d5.add_transition(70, d7)
-d5.add_transition(71, d7)
-d5.add_transition(72, d7)
-d5.add_transition(73, d7)
-d5.add_transition(74, d7)
-d5.add_transition(75, d7)
-d5.add_transition(76, d7)
-d5.add_transition(77, d7)
-d5.add_transition(78, d7)
-d5.add_transition(79, d7)
-d5.add_transition(80, d7)
-d5.add_transition(81, d7)
-d5.add_transition(82, d7)
-d5.add_transition(83, d7)
-d5.add_transition(84, d7)
-d5.add_transition(85, d7)
-d5.add_transition(86, d7)
-d5.add_transition(87, d7)
-d5.add_transition(88, d7)
-d5.add_transition(89, d7)
-d5.add_transition(90, d7)
-d5.add_transition(91, d7)
-d5.add_transition(92, d8)
-d5.add_transition(93, d7)
-d5.add_transition(94, d7)
-d5.add_transition(95, d7)
-d5.add_transition(96, d7)
-d5.add_transition(97, d7)
-d5.add_transition(98, d7)
-d5.add_transition(99, d7)
-d5.add_transition(100, d7)
-d5.add_transition(101, d7)
-d5.add_transition(102, d7)
-d5.add_transition(103, d7)
-d5.add_transition(104, d7)
-d5.add_transition(105, d7)
-d5.add_transition(106, d7)
-d5.add_transition(107, d7)
-d5.add_transition(108, d7)
-d5.add_transition(109, d7)
-d5.add_transition(110, d7)
-d5.add_transition(111, d7)
-d5.add_transition(112, d7)
-d5.add_transition(113, d7)
-d5.add_transition(114, d7)
-d5.add_transition(115, d7)
-d5.add_transition(116, d7)
-d5.add_transition(117, d7)
-d5.add_transition(118, d7)
-d5.add_transition(119, d7)
-d5.add_transition(120, d7)
-d5.add_transition(121, d7)
-d5.add_transition(122, d7)
-d5.add_transition(123, d7)
-d5.add_transition(124, d7)
-d5.add_transition(125, d7)
-d5.add_transition(126, d7)
-d5.add_transition(127, d7)
-d5.add_transition(128, d7)
-d5.add_transition(129, d7)
-d5.add_transition(130, d7)
-d5.add_transition(131, d7)
-d5.add_transition(132, d7)
-d5.add_transition(133, d7)
-d5.add_transition(134, d7)
-d5.add_transition(135, d7)
-d5.add_transition(136, d7)
-d5.add_transition(137, d7)
-d5.add_transition(138, d7)
-d5.add_transition(139, d7)
-d5.add_transition(140, d7)
-d5.add_transition(141, d7)
-d5.add_transition(142, d7)
-d5.add_transition(143, d7)
-d5.add_transition(144, d7)
-d5.add_transition(145, d7)
-d5.add_transition(146, d7)
-d5.add_transition(147, d7)
-d5.add_transition(148, d7)
-d5.add_transition(149, d7)
-d5.add_transition(150, d7)
-d5.add_transition(151, d7)
-d5.add_transition(152, d7)
-d5.add_transition(153, d7)
-d5.add_transition(154, d7)
-d5.add_transition(155, d7)
-d5.add_transition(156, d7)
-d5.add_transition(157, d7)
-d5.add_transition(158, d7)
-d5.add_transition(159, d7)
-d5.add_transition(160, d7)
-d5.add_transition(161, d7)
-d5.add_transition(162, d7)
-d5.add_transition(163, d7)
-d5.add_transition(164, d7)
-d5.add_transition(165, d7)
-d5.add_transition(166, d7)
-d5.add_transition(167, d7)
-d5.add_transition(168, d7)
-d5.add_transition(169, d7)
-d5.add_transition(170, d7)
-d5.add_transition(171, d7)
-d5.add_transition(172, d7)
-d5.add_transition(173, d7)
-d5.add_transition(174, d7)
-d5.add_transition(175, d7)
-d5.add_transition(176, d7)
-d5.add_transition(177, d7)
-d5.add_transition(178, d7)
-d5.add_transition(179, d7)
-d5.add_transition(180, d7)
-d5.add_transition(181, d7)
-d5.add_transition(182, d7)
-d5.add_transition(183, d7)
-d5.add_transition(184, d7)
-d5.add_transition(185, d7)
-d5.add_transition(186, d7)
-d5.add_transition(187, d7)
-d5.add_transition(188, d7)
-d5.add_transition(189, d7)
-d5.add_transition(190, d7)
-d5.add_transition(191, d7)
-d5.add_transition(192, d7)
-d5.add_transition(193, d7)
-d5.add_transition(194, d7)
-d5.add_transition(195, d7)
-d5.add_transition(196, d7)
-d5.add_transition(197, d7)
-d5.add_transition(198, d7)
-d5.add_transition(199, d7)
-d5.add_transition(200, d7)
-d5.add_transition(201, d7)
-d5.add_transition(202, d7)
-d5.add_transition(203, d7)
-d5.add_transition(204, d7)
-d5.add_transition(205, d7)
-d5.add_transition(206, d7)
-d5.add_transition(207, d7)
-d5.add_transition(208, d7)
-d5.add_transition(209, d7)
-d5.add_transition(210, d7)
-d5.add_transition(211, d7)
-d5.add_transition(212, d7)
-d5.add_transition(213, d7)
-d5.add_transition(214, d7)
-d5.add_transition(215, d7)
-d5.add_transition(216, d7)
-d5.add_transition(217, d7)
-d5.add_transition(218, d7)
-d5.add_transition(219, d7)
-d5.add_transition(220, d7)
-d5.add_transition(221, d7)
-d5.add_transition(222, d7)
-d5.add_transition(223, d7)
-d5.add_transition(224, d7)
-d5.add_transition(225, d7)
-d5.add_transition(226, d7)
-d5.add_transition(227, d7)
-d5.add_transition(228, d7)
-d5.add_transition(229, d7)
-d5.add_transition(230, d7)
-d5.add_transition(231, d7)
-d5.add_transition(232, d7)
-d5.add_transition(233, d7)
-d5.add_transition(234, d7)
-d5.add_transition(235, d7)
-d5.add_transition(236, d7)
-d5.add_transition(237, d7)
-d5.add_transition(238, d7)
-d5.add_transition(239, d7)
-d5.add_transition(240, d7)
-d5.add_transition(241, d7)
-d5.add_transition(242, d7)
-d5.add_transition(243, d7)
-d5.add_transition(244, d7)
-d5.add_transition(245, d7)
-d5.add_transition(246, d7)
-d5.add_transition(247, d7)
-d5.add_transition(248, d7)
-d5.add_transition(249, d7)
-d5.add_transition(250, d7)
-d5.add_transition(251, d7)
-d5.add_transition(252, d7)
-d5.add_transition(253, d7)
-d5.add_transition(254, d7)
-d5.add_transition(255, d7)
-
-d7.add_transition(39, d1)
-
-d8.add_transition(39, d1)
-d8.add_transition(110, d7)
-d8.add_transition(115, d7)
-d8.add_transition(116, d7)
-d8.add_transition(118, d7)
-
-g1.add_transition(0, g2)
-g1.add_transition(1, g2)
-g1.add_transition(2, g2)
-g1.add_transition(3, g2)
-g1.add_transition(4, g2)
-g1.add_transition(5, g2)
-g1.add_transition(6, g2)
-g1.add_transition(7, g2)
-g1.add_transition(8, g2)
-g1.add_transition(9, g2)
-g1.add_transition(10, g2)
-g1.add_transition(11, g2)
-g1.add_transition(12, g2)
-g1.add_transition(13, g2)
-g1.add_transition(14, g2)
-g1.add_transition(15, g2)
-g1.add_transition(16, g2)
-g1.add_transition(17, g2)
-g1.add_transition(18, g2)
-g1.add_transition(19, g2)
-g1.add_transition(20, g2)
-g1.add_transition(21, g2)
-g1.add_transition(22, g2)
-g1.add_transition(23, g2)
-g1.add_transition(24, g2)
-g1.add_transition(25, g2)
-g1.add_transition(26, g2)
-g1.add_transition(27, g2)
-g1.add_transition(28, g2)
-g1.add_transition(29, g2)
-g1.add_transition(30, g2)
-g1.add_transition(31, g2)
-g1.add_transition(32, g2)
-g1.add_transition(33, g2)
-g1.add_transition(34, g2)
-g1.add_transition(35, g2)
-g1.add_transition(36, g2)
-g1.add_transition(37, g2)
-g1.add_transition(38, g2)
-g1.add_transition(39, g2)
-g1.add_transition(40, g2)
-g1.add_transition(41, g2)
-g1.add_transition(42, g2)
-g1.add_transition(43, g2)
-g1.add_transition(44, g2)
-g1.add_transition(45, g2)
-g1.add_transition(46, g2)
-g1.add_transition(47, g2)
-g1.add_transition(48, g2)
-g1.add_transition(49, g2)
-g1.add_transition(50, g2)
-g1.add_transition(51, g2)
-g1.add_transition(52, g2)
-g1.add_transition(53, g2)
-g1.add_transition(54, g2)
-g1.add_transition(55, g2)
-g1.add_transition(56, g2)
-g1.add_transition(57, g2)
-g1.add_transition(58, g2)
-g1.add_transition(59, g2)
-g1.add_transition(60, g2)
-g1.add_transition(61, g2)
-g1.add_transition(62, g2)
-g1.add_transition(63, g2)
-g1.add_transition(64, g2)
-g1.add_transition(65, g2)
-g1.add_transition(66, g2)
-g1.add_transition(67, g2)
-g1.add_transition(68, g2)
-g1.add_transition(69, g2)
-g1.add_transition(70, g2)
-g1.add_transition(71, g2)
-g1.add_transition(72, g2)
-g1.add_transition(73, g2)
-g1.add_transition(74, g2)
-g1.add_transition(75, g2)
-g1.add_transition(76, g2)
-g1.add_transition(77, g2)
-g1.add_transition(78, g2)
-g1.add_transition(79, g2)
-g1.add_transition(80, g2)
-g1.add_transition(81, g2)
-g1.add_transition(82, g2)
-g1.add_transition(83, g2)
-g1.add_transition(84, g2)
-g1.add_transition(85, g2)
-g1.add_transition(86, g2)
-g1.add_transition(87, g2)
-g1.add_transition(88, g2)
-g1.add_transition(89, g2)
-g1.add_transition(90, g2)
-g1.add_transition(91, g2)
-g1.add_transition(92, g3)
-g1.add_transition(93, g2)
-g1.add_transition(94, g2)
-g1.add_transition(95, g2)
-g1.add_transition(96, g2)
-g1.add_transition(97, g2)
-g1.add_transition(98, g2)
-g1.add_transition(99, g2)
-g1.add_transition(100, g2)
-g1.add_transition(101, g2)
-g1.add_transition(102, g2)
-g1.add_transition(103, g2)
-g1.add_transition(104, g2)
-g1.add_transition(105, g2)
-g1.add_transition(106, g2)
-g1.add_transition(107, g2)
-g1.add_transition(108, g2)
-g1.add_transition(109, g2)
-g1.add_transition(110, g2)
-g1.add_transition(111, g2)
-g1.add_transition(112, g2)
-g1.add_transition(113, g2)
-g1.add_transition(114, g2)
-g1.add_transition(115, g2)
-g1.add_transition(116, g2)
-g1.add_transition(117, g2)
-g1.add_transition(118, g2)
-g1.add_transition(119, g2)
-g1.add_transition(120, g2)
-g1.add_transition(121, g2)
-g1.add_transition(122, g2)
-g1.add_transition(124, g2)
-g1.add_transition(126, g2)
-g1.add_transition(127, g2)
-g1.add_transition(128, g2)
-g1.add_transition(129, g2)
-g1.add_transition(130, g2)
-g1.add_transition(131, g2)
-g1.add_transition(132, g2)
-g1.add_transition(133, g2)
-g1.add_transition(134, g2)
-g1.add_transition(135, g2)
-g1.add_transition(136, g2)
-g1.add_transition(137, g2)
-g1.add_transition(138, g2)
-g1.add_transition(139, g2)
-g1.add_transition(140, g2)
-g1.add_transition(141, g2)
-g1.add_transition(142, g2)
-g1.add_transition(143, g2)
-g1.add_transition(144, g2)
-g1.add_transition(145, g2)
-g1.add_transition(146, g2)
-g1.add_transition(147, g2)
-g1.add_transition(148, g2)
-g1.add_transition(149, g2)
-g1.add_transition(150, g2)
-g1.add_transition(151, g2)
-g1.add_transition(152, g2)
-g1.add_transition(153, g2)
-g1.add_transition(154, g2)
-g1.add_transition(155, g2)
-g1.add_transition(156, g2)
-g1.add_transition(157, g2)
-g1.add_transition(158, g2)
-g1.add_transition(159, g2)
-g1.add_transition(160, g2)
-g1.add_transition(161, g2)
-g1.add_transition(162, g2)
-g1.add_transition(163, g2)
-g1.add_transition(164, g2)
-g1.add_transition(165, g2)
-g1.add_transition(166, g2)
-g1.add_transition(167, g2)
-g1.add_transition(168, g2)
-g1.add_transition(169, g2)
-g1.add_transition(170, g2)
-g1.add_transition(171, g2)
-g1.add_transition(172, g2)
-g1.add_transition(173, g2)
-g1.add_transition(174, g2)
-g1.add_transition(175, g2)
-g1.add_transition(176, g2)
-g1.add_transition(177, g2)
-g1.add_transition(178, g2)
-g1.add_transition(179, g2)
-g1.add_transition(180, g2)
-g1.add_transition(181, g2)
-g1.add_transition(182, g2)
-g1.add_transition(183, g2)
-g1.add_transition(184, g2)
-g1.add_transition(185, g2)
-g1.add_transition(186, g2)
-g1.add_transition(187, g2)
-g1.add_transition(188, g2)
-g1.add_transition(189, g2)
-g1.add_transition(190, g2)
-g1.add_transition(191, g2)
-g1.add_transition(192, g2)
-g1.add_transition(193, g2)
-g1.add_transition(194, g2)
-g1.add_transition(195, g2)
-g1.add_transition(196, g2)
-g1.add_transition(197, g2)
-g1.add_transition(198, g2)
-g1.add_transition(199, g2)
-g1.add_transition(200, g2)
-g1.add_transition(201, g2)
-g1.add_transition(202, g2)
-g1.add_transition(203, g2)
-g1.add_transition(204, g2)
-g1.add_transition(205, g2)
-g1.add_transition(206, g2)
-g1.add_transition(207, g2)
-g1.add_transition(208, g2)
-g1.add_transition(209, g2)
-g1.add_transition(210, g2)
-g1.add_transition(211, g2)
-g1.add_transition(212, g2)
-g1.add_transition(213, g2)
-g1.add_transition(214, g2)
-g1.add_transition(215, g2)
-g1.add_transition(216, g2)
-g1.add_transition(217, g2)
-g1.add_transition(218, g2)
-g1.add_transition(219, g2)
-g1.add_transition(220, g2)
-g1.add_transition(221, g2)
-g1.add_transition(222, g2)
-g1.add_transition(223, g2)
-g1.add_transition(224, g2)
-g1.add_transition(225, g2)
-g1.add_transition(226, g2)
-g1.add_transition(227, g2)
-g1.add_transition(228, g2)
-g1.add_transition(229, g2)
-g1.add_transition(230, g2)
-g1.add_transition(231, g2)
-g1.add_transition(232, g2)
-g1.add_transition(233, g2)
-g1.add_transition(234, g2)
-g1.add_transition(235, g2)
-g1.add_transition(236, g2)
-g1.add_transition(237, g2)
-g1.add_transition(238, g2)
-g1.add_transition(239, g2)
-g1.add_transition(240, g2)
-g1.add_transition(241, g2)
-g1.add_transition(242, g2)
-g1.add_transition(243, g2)
-g1.add_transition(244, g2)
-g1.add_transition(245, g2)
-g1.add_transition(246, g2)
-g1.add_transition(247, g2)
-g1.add_transition(248, g2)
-g1.add_transition(249, g2)
-g1.add_transition(250, g2)
-g1.add_transition(251, g2)
-g1.add_transition(252, g2)
-g1.add_transition(253, g2)
-g1.add_transition(254, g2)
-g1.add_transition(255, g2)
-
-g2.add_transition(0, g2)
-g2.add_transition(1, g2)
-g2.add_transition(2, g2)
-g2.add_transition(3, g2)
-g2.add_transition(4, g2)
-g2.add_transition(5, g2)
-g2.add_transition(6, g2)
-g2.add_transition(7, g2)
-g2.add_transition(8, g2)
-g2.add_transition(9, g2)
-g2.add_transition(10, g2)
-g2.add_transition(11, g2)
-g2.add_transition(12, g2)
-g2.add_transition(13, g2)
-g2.add_transition(14, g2)
-g2.add_transition(15, g2)
-g2.add_transition(16, g2)
-g2.add_transition(17, g2)
-g2.add_transition(18, g2)
-g2.add_transition(19, g2)
-g2.add_transition(20, g2)
-g2.add_transition(21, g2)
-g2.add_transition(22, g2)
-g2.add_transition(23, g2)
-g2.add_transition(24, g2)
-g2.add_transition(25, g2)
-g2.add_transition(26, g2)
-g2.add_transition(27, g2)
-g2.add_transition(28, g2)
-g2.add_transition(29, g2)
-g2.add_transition(30, g2)
-g2.add_transition(31, g2)
-g2.add_transition(32, g2)
-g2.add_transition(33, g2)
-g2.add_transition(34, g2)
-g2.add_transition(35, g2)
-g2.add_transition(36, g2)
-g2.add_transition(37, g2)
-g2.add_transition(38, g2)
-g2.add_transition(39, g2)
-g2.add_transition(40, g2)
-g2.add_transition(41, g2)
-g2.add_transition(42, g2)
-g2.add_transition(43, g2)
-g2.add_transition(44, g2)
-g2.add_transition(45, g2)
-g2.add_transition(46, g2)
-g2.add_transition(47, g2)
-g2.add_transition(48, g2)
-g2.add_transition(49, g2)
-g2.add_transition(50, g2)
-g2.add_transition(51, g2)
-g2.add_transition(52, g2)
-g2.add_transition(53, g2)
-g2.add_transition(54, g2)
-g2.add_transition(55, g2)
-g2.add_transition(56, g2)
-g2.add_transition(57, g2)
-g2.add_transition(58, g2)
-g2.add_transition(59, g2)
-g2.add_transition(60, g2)
-g2.add_transition(61, g2)
-g2.add_transition(62, g2)
-g2.add_transition(63, g2)
-g2.add_transition(64, g2)
-g2.add_transition(65, g2)
-g2.add_transition(66, g2)
-g2.add_transition(67, g2)
-g2.add_transition(68, g2)
-g2.add_transition(69, g2)
-g2.add_transition(70, g2)
-g2.add_transition(71, g2)
-g2.add_transition(72, g2)
-g2.add_transition(73, g2)
-g2.add_transition(74, g2)
-g2.add_transition(75, g2)
-g2.add_transition(76, g2)
-g2.add_transition(77, g2)
-g2.add_transition(78, g2)
-g2.add_transition(79, g2)
-g2.add_transition(80, g2)
-g2.add_transition(81, g2)
-g2.add_transition(82, g2)
-g2.add_transition(83, g2)
-g2.add_transition(84, g2)
-g2.add_transition(85, g2)
-g2.add_transition(86, g2)
-g2.add_transition(87, g2)
-g2.add_transition(88, g2)
-g2.add_transition(89, g2)
-g2.add_transition(90, g2)
-g2.add_transition(91, g2)
-g2.add_transition(92, g3)
-g2.add_transition(93, g2)
-g2.add_transition(94, g2)
-g2.add_transition(95, g2)
-g2.add_transition(96, g2)
-g2.add_transition(97, g2)
-g2.add_transition(98, g2)
-g2.add_transition(99, g2)
-g2.add_transition(100, g2)
-g2.add_transition(101, g2)
-g2.add_transition(102, g2)
-g2.add_transition(103, g2)
-g2.add_transition(104, g2)
-g2.add_transition(105, g2)
-g2.add_transition(106, g2)
-g2.add_transition(107, g2)
-g2.add_transition(108, g2)
-g2.add_transition(109, g2)
-g2.add_transition(110, g2)
-g2.add_transition(111, g2)
-g2.add_transition(112, g2)
-g2.add_transition(113, g2)
-g2.add_transition(114, g2)
-g2.add_transition(115, g2)
-g2.add_transition(116, g2)
-g2.add_transition(117, g2)
-g2.add_transition(118, g2)
-g2.add_transition(119, g2)
-g2.add_transition(120, g2)
-g2.add_transition(121, g2)
-g2.add_transition(122, g2)
-g2.add_transition(124, g2)
-g2.add_transition(125, g4)
-g2.add_transition(126, g2)
-g2.add_transition(127, g2)
-g2.add_transition(128, g2)
-g2.add_transition(129, g2)
-g2.add_transition(130, g2)
-g2.add_transition(131, g2)
-g2.add_transition(132, g2)
-g2.add_transition(133, g2)
-g2.add_transition(134, g2)
-g2.add_transition(135, g2)
-g2.add_transition(136, g2)
-g2.add_transition(137, g2)
-g2.add_transition(138, g2)
-g2.add_transition(139, g2)
-g2.add_transition(140, g2)
-g2.add_transition(141, g2)
-g2.add_transition(142, g2)
-g2.add_transition(143, g2)
-g2.add_transition(144, g2)
-g2.add_transition(145, g2)
-g2.add_transition(146, g2)
-g2.add_transition(147, g2)
-g2.add_transition(148, g2)
-g2.add_transition(149, g2)
-g2.add_transition(150, g2)
-g2.add_transition(151, g2)
-g2.add_transition(152, g2)
-g2.add_transition(153, g2)
-g2.add_transition(154, g2)
-g2.add_transition(155, g2)
-g2.add_transition(156, g2)
-g2.add_transition(157, g2)
-g2.add_transition(158, g2)
-g2.add_transition(159, g2)
-g2.add_transition(160, g2)
-g2.add_transition(161, g2)
-g2.add_transition(162, g2)
-g2.add_transition(163, g2)
-g2.add_transition(164, g2)
-g2.add_transition(165, g2)
-g2.add_transition(166, g2)
-g2.add_transition(167, g2)
-g2.add_transition(168, g2)
-g2.add_transition(169, g2)
-g2.add_transition(170, g2)
-g2.add_transition(171, g2)
-g2.add_transition(172, g2)
-g2.add_transition(173, g2)
-g2.add_transition(174, g2)
-g2.add_transition(175, g2)
-g2.add_transition(176, g2)
-g2.add_transition(177, g2)
-g2.add_transition(178, g2)
-g2.add_transition(179, g2)
-g2.add_transition(180, g2)
-g2.add_transition(181, g2)
-g2.add_transition(182, g2)
-g2.add_transition(183, g2)
-g2.add_transition(184, g2)
-g2.add_transition(185, g2)
-g2.add_transition(186, g2)
-g2.add_transition(187, g2)
-g2.add_transition(188, g2)
-g2.add_transition(189, g2)
-g2.add_transition(190, g2)
-g2.add_transition(191, g2)
-g2.add_transition(192, g2)
-g2.add_transition(193, g2)
-g2.add_transition(194, g2)
-g2.add_transition(195, g2)
-g2.add_transition(196, g2)
-g2.add_transition(197, g2)
-g2.add_transition(198, g2)
-g2.add_transition(199, g2)
-g2.add_transition(200, g2)
-g2.add_transition(201, g2)
-g2.add_transition(202, g2)
-g2.add_transition(203, g2)
-g2.add_transition(204, g2)
-g2.add_transition(205, g2)
-g2.add_transition(206, g2)
-g2.add_transition(207, g2)
-g2.add_transition(208, g2)
-g2.add_transition(209, g2)
-g2.add_transition(210, g2)
-g2.add_transition(211, g2)
-g2.add_transition(212, g2)
-g2.add_transition(213, g2)
-g2.add_transition(214, g2)
-g2.add_transition(215, g2)
-g2.add_transition(216, g2)
-g2.add_transition(217, g2)
-g2.add_transition(218, g2)
-g2.add_transition(219, g2)
-g2.add_transition(220, g2)
-g2.add_transition(221, g2)
-g2.add_transition(222, g2)
-g2.add_transition(223, g2)
-g2.add_transition(224, g2)
-g2.add_transition(225, g2)
-g2.add_transition(226, g2)
-g2.add_transition(227, g2)
-g2.add_transition(228, g2)
-g2.add_transition(229, g2)
-g2.add_transition(230, g2)
-g2.add_transition(231, g2)
-g2.add_transition(232, g2)
-g2.add_transition(233, g2)
-g2.add_transition(234, g2)
-g2.add_transition(235, g2)
-g2.add_transition(236, g2)
-g2.add_transition(237, g2)
-g2.add_transition(238, g2)
-g2.add_transition(239, g2)
-g2.add_transition(240, g2)
-g2.add_transition(241, g2)
-g2.add_transition(242, g2)
-g2.add_transition(243, g2)
-g2.add_transition(244, g2)
-g2.add_transition(245, g2)
-g2.add_transition(246, g2)
-g2.add_transition(247, g2)
-g2.add_transition(248, g2)
-g2.add_transition(249, g2)
-g2.add_transition(250, g2)
-g2.add_transition(251, g2)
-g2.add_transition(252, g2)
-g2.add_transition(253, g2)
-g2.add_transition(254, g2)
-g2.add_transition(255, g2)
-
-g3.add_transition(0, g2)
-g3.add_transition(1, g2)
-g3.add_transition(2, g2)
-g3.add_transition(3, g2)
-g3.add_transition(4, g2)
-g3.add_transition(5, g2)
-g3.add_transition(6, g2)
-g3.add_transition(7, g2)
-g3.add_transition(8, g2)
-g3.add_transition(9, g2)
-g3.add_transition(10, g2)
-g3.add_transition(11, g2)
-g3.add_transition(12, g2)
-g3.add_transition(13, g2)
-g3.add_transition(14, g2)
-g3.add_transition(15, g2)
-g3.add_transition(16, g2)
-g3.add_transition(17, g2)
-g3.add_transition(18, g2)
-g3.add_transition(19, g2)
-g3.add_transition(20, g2)
-g3.add_transition(21, g2)
-g3.add_transition(22, g2)
-g3.add_transition(23, g2)
-g3.add_transition(24, g2)
-g3.add_transition(25, g2)
-g3.add_transition(26, g2)
-g3.add_transition(27, g2)
-g3.add_transition(28, g2)
-g3.add_transition(29, g2)
-g3.add_transition(30, g2)
-g3.add_transition(31, g2)
-g3.add_transition(32, g2)
-g3.add_transition(33, g2)
-g3.add_transition(34, g2)
-g3.add_transition(35, g2)
-g3.add_transition(36, g2)
-g3.add_transition(37, g2)
-g3.add_transition(38, g2)
-g3.add_transition(39, g2)
-g3.add_transition(40, g2)
-g3.add_transition(41, g2)
-g3.add_transition(42, g2)
-g3.add_transition(43, g2)
-g3.add_transition(44, g2)
-g3.add_transition(45, g2)
-g3.add_transition(46, g2)
-g3.add_transition(47, g2)
-g3.add_transition(48, g2)
-g3.add_transition(49, g2)
-g3.add_transition(50, g2)
-g3.add_transition(51, g2)
-g3.add_transition(52, g2)
-g3.add_transition(53, g2)
-g3.add_transition(54, g2)
-g3.add_transition(55, g2)
-g3.add_transition(56, g2)
-g3.add_transition(57, g2)
-g3.add_transition(58, g2)
-g3.add_transition(59, g2)
-g3.add_transition(60, g2)
-g3.add_transition(61, g2)
-g3.add_transition(62, g2)
-g3.add_transition(63, g2)
-g3.add_transition(64, g2)
-g3.add_transition(65, g2)
-g3.add_transition(66, g2)
-g3.add_transition(67, g2)
-g3.add_transition(68, g2)
-g3.add_transition(69, g2)
-g3.add_transition(70, g2)
-g3.add_transition(71, g2)
-g3.add_transition(72, g2)
-g3.add_transition(73, g2)
-g3.add_transition(74, g2)
-g3.add_transition(75, g2)
-g3.add_transition(76, g2)
-g3.add_transition(77, g2)
-g3.add_transition(78, g2)
-g3.add_transition(79, g2)
-g3.add_transition(80, g2)
-g3.add_transition(81, g2)
-g3.add_transition(82, g2)
-g3.add_transition(83, g2)
-g3.add_transition(84, g2)
-g3.add_transition(85, g2)
-g3.add_transition(86, g2)
-g3.add_transition(87, g2)
-g3.add_transition(88, g2)
-g3.add_transition(89, g2)
-g3.add_transition(90, g2)
-g3.add_transition(91, g2)
-g3.add_transition(92, g3)
-g3.add_transition(93, g2)
-g3.add_transition(94, g2)
-g3.add_transition(95, g2)
-g3.add_transition(96, g2)
-g3.add_transition(97, g2)
-g3.add_transition(98, g2)
-g3.add_transition(99, g2)
-g3.add_transition(100, g2)
-g3.add_transition(101, g2)
-g3.add_transition(102, g2)
-g3.add_transition(103, g2)
-g3.add_transition(104, g2)
-g3.add_transition(105, g2)
-g3.add_transition(106, g2)
-g3.add_transition(107, g2)
-g3.add_transition(108, g2)
-g3.add_transition(109, g2)
-g3.add_transition(110, g2)
-g3.add_transition(111, g2)
-g3.add_transition(112, g2)
-g3.add_transition(113, g2)
-g3.add_transition(114, g2)
-g3.add_transition(115, g2)
-g3.add_transition(116, g2)
-g3.add_transition(117, g2)
-g3.add_transition(118, g2)
-g3.add_transition(119, g2)
-g3.add_transition(120, g2)
-g3.add_transition(121, g2)
-g3.add_transition(122, g2)
-g3.add_transition(123, g2)
-g3.add_transition(124, g2)
-g3.add_transition(125, g5)
-g3.add_transition(126, g2)
-g3.add_transition(127, g2)
-g3.add_transition(128, g2)
-g3.add_transition(129, g2)
-g3.add_transition(130, g2)
-g3.add_transition(131, g2)
-g3.add_transition(132, g2)
-g3.add_transition(133, g2)
-g3.add_transition(134, g2)
-g3.add_transition(135, g2)
-g3.add_transition(136, g2)
-g3.add_transition(137, g2)
-g3.add_transition(138, g2)
-g3.add_transition(139, g2)
-g3.add_transition(140, g2)
-g3.add_transition(141, g2)
-g3.add_transition(142, g2)
-g3.add_transition(143, g2)
-g3.add_transition(144, g2)
-g3.add_transition(145, g2)
-g3.add_transition(146, g2)
-g3.add_transition(147, g2)
-g3.add_transition(148, g2)
-g3.add_transition(149, g2)
-g3.add_transition(150, g2)
-g3.add_transition(151, g2)
-g3.add_transition(152, g2)
-g3.add_transition(153, g2)
-g3.add_transition(154, g2)
-g3.add_transition(155, g2)
-g3.add_transition(156, g2)
-g3.add_transition(157, g2)
-g3.add_transition(158, g2)
-g3.add_transition(159, g2)
-g3.add_transition(160, g2)
-g3.add_transition(161, g2)
-g3.add_transition(162, g2)
-g3.add_transition(163, g2)
-g3.add_transition(164, g2)
-g3.add_transition(165, g2)
-g3.add_transition(166, g2)
-g3.add_transition(167, g2)
-g3.add_transition(168, g2)
-g3.add_transition(169, g2)
-g3.add_transition(170, g2)
-g3.add_transition(171, g2)
-g3.add_transition(172, g2)
-g3.add_transition(173, g2)
-g3.add_transition(174, g2)
-g3.add_transition(175, g2)
-g3.add_transition(176, g2)
-g3.add_transition(177, g2)
-g3.add_transition(178, g2)
-g3.add_transition(179, g2)
-g3.add_transition(180, g2)
-g3.add_transition(181, g2)
-g3.add_transition(182, g2)
-g3.add_transition(183, g2)
-g3.add_transition(184, g2)
-g3.add_transition(185, g2)
-g3.add_transition(186, g2)
-g3.add_transition(187, g2)
-g3.add_transition(188, g2)
-g3.add_transition(189, g2)
-g3.add_transition(190, g2)
-g3.add_transition(191, g2)
-g3.add_transition(192, g2)
-g3.add_transition(193, g2)
-g3.add_transition(194, g2)
-g3.add_transition(195, g2)
-g3.add_transition(196, g2)
-g3.add_transition(197, g2)
-g3.add_transition(198, g2)
-g3.add_transition(199, g2)
-g3.add_transition(200, g2)
-g3.add_transition(201, g2)
-g3.add_transition(202, g2)
-g3.add_transition(203, g2)
-g3.add_transition(204, g2)
-g3.add_transition(205, g2)
-g3.add_transition(206, g2)
-g3.add_transition(207, g2)
-g3.add_transition(208, g2)
-g3.add_transition(209, g2)
-g3.add_transition(210, g2)
-g3.add_transition(211, g2)
-g3.add_transition(212, g2)
-g3.add_transition(213, g2)
-g3.add_transition(214, g2)
-g3.add_transition(215, g2)
-g3.add_transition(216, g2)
-g3.add_transition(217, g2)
-g3.add_transition(218, g2)
-g3.add_transition(219, g2)
-g3.add_transition(220, g2)
-g3.add_transition(221, g2)
-g3.add_transition(222, g2)
-g3.add_transition(223, g2)
-g3.add_transition(224, g2)
-g3.add_transition(225, g2)
-g3.add_transition(226, g2)
-g3.add_transition(227, g2)
-g3.add_transition(228, g2)
-g3.add_transition(229, g2)
-g3.add_transition(230, g2)
-g3.add_transition(231, g2)
-g3.add_transition(232, g2)
-g3.add_transition(233, g2)
-g3.add_transition(234, g2)
-g3.add_transition(235, g2)
-g3.add_transition(236, g2)
-g3.add_transition(237, g2)
-g3.add_transition(238, g2)
-g3.add_transition(239, g2)
-g3.add_transition(240, g2)
-g3.add_transition(241, g2)
-g3.add_transition(242, g2)
-g3.add_transition(243, g2)
-g3.add_transition(244, g2)
-g3.add_transition(245, g2)
-g3.add_transition(246, g2)
-g3.add_transition(247, g2)
-g3.add_transition(248, g2)
-g3.add_transition(249, g2)
-g3.add_transition(250, g2)
-g3.add_transition(251, g2)
-g3.add_transition(252, g2)
-g3.add_transition(253, g2)
-g3.add_transition(254, g2)
-g3.add_transition(255, g2)
-
-g5.isFinalState = True
-g5.addToken( 'HEADER')
-g5.add_transition(0, g2)
-g5.add_transition(1, g2)
-g5.add_transition(2, g2)
-g5.add_transition(3, g2)
-g5.add_transition(4, g2)
-g5.add_transition(5, g2)
-g5.add_transition(6, g2)
-g5.add_transition(7, g2)
-g5.add_transition(8, g2)
-g5.add_transition(9, g2)
-g5.add_transition(10, g2)
-g5.add_transition(11, g2)
-g5.add_transition(12, g2)
-g5.add_transition(13, g2)
-g5.add_transition(14, g2)
-g5.add_transition(15, g2)
-g5.add_transition(16, g2)
-g5.add_transition(17, g2)
-g5.add_transition(18, g2)
-g5.add_transition(19, g2)
-g5.add_transition(20, g2)
-g5.add_transition(21, g2)
-g5.add_transition(22, g2)
-g5.add_transition(23, g2)
-g5.add_transition(24, g2)
-g5.add_transition(25, g2)
-g5.add_transition(26, g2)
-g5.add_transition(27, g2)
-g5.add_transition(28, g2)
-g5.add_transition(29, g2)
-g5.add_transition(30, g2)
-g5.add_transition(31, g2)
-g5.add_transition(32, g2)
-g5.add_transition(33, g2)
-g5.add_transition(34, g2)
-g5.add_transition(35, g2)
-g5.add_transition(36, g2)
-g5.add_transition(37, g2)
-g5.add_transition(38, g2)
-g5.add_transition(39, g2)
-g5.add_transition(40, g2)
-g5.add_transition(41, g2)
-g5.add_transition(42, g2)
-g5.add_transition(43, g2)
-g5.add_transition(44, g2)
-g5.add_transition(45, g2)
-g5.add_transition(46, g2)
-g5.add_transition(47, g2)
-g5.add_transition(48, g2)
-g5.add_transition(49, g2)
-g5.add_transition(50, g2)
-g5.add_transition(51, g2)
-g5.add_transition(52, g2)
-g5.add_transition(53, g2)
-g5.add_transition(54, g2)
-g5.add_transition(55, g2)
-g5.add_transition(56, g2)
-g5.add_transition(57, g2)
-g5.add_transition(58, g2)
-g5.add_transition(59, g2)
-g5.add_transition(60, g2)
-g5.add_transition(61, g2)
-g5.add_transition(62, g2)
-g5.add_transition(63, g2)
-g5.add_transition(64, g2)
-g5.add_transition(65, g2)
-g5.add_transition(66, g2)
-g5.add_transition(67, g2)
-g5.add_transition(68, g2)
-g5.add_transition(69, g2)
-g5.add_transition(70, g2)
-g5.add_transition(71, g2)
-g5.add_transition(72, g2)
-g5.add_transition(73, g2)
-g5.add_transition(74, g2)
-g5.add_transition(75, g2)
-g5.add_transition(76, g2)
-g5.add_transition(77, g2)
-g5.add_transition(78, g2)
-g5.add_transition(79, g2)
-g5.add_transition(80, g2)
-g5.add_transition(81, g2)
-g5.add_transition(82, g2)
-g5.add_transition(83, g2)
-g5.add_transition(84, g2)
-g5.add_transition(85, g2)
-g5.add_transition(86, g2)
-g5.add_transition(87, g2)
-g5.add_transition(88, g2)
-g5.add_transition(89, g2)
-g5.add_transition(90, g2)
-g5.add_transition(91, g2)
-g5.add_transition(92, g3)
-g5.add_transition(93, g2)
-g5.add_transition(94, g2)
-g5.add_transition(95, g2)
-g5.add_transition(96, g2)
-g5.add_transition(97, g2)
-g5.add_transition(98, g2)
-g5.add_transition(99, g2)
-g5.add_transition(100, g2)
-g5.add_transition(101, g2)
-g5.add_transition(102, g2)
-g5.add_transition(103, g2)
-g5.add_transition(104, g2)
-g5.add_transition(105, g2)
-g5.add_transition(106, g2)
-g5.add_transition(107, g2)
-g5.add_transition(108, g2)
-g5.add_transition(109, g2)
-g5.add_transition(110, g2)
-g5.add_transition(111, g2)
-g5.add_transition(112, g2)
-g5.add_transition(113, g2)
-g5.add_transition(114, g2)
-g5.add_transition(115, g2)
-g5.add_transition(116, g2)
-g5.add_transition(117, g2)
-g5.add_transition(118, g2)
-g5.add_transition(119, g2)
-g5.add_transition(120, g2)
-g5.add_transition(121, g2)
-g5.add_transition(122, g2)
-g5.add_transition(124, g2)
-g5.add_transition(125, g4)
-g5.add_transition(126, g2)
-g5.add_transition(127, g2)
-g5.add_transition(128, g2)
-g5.add_transition(129, g2)
-g5.add_transition(130, g2)
-g5.add_transition(131, g2)
-g5.add_transition(132, g2)
-g5.add_transition(133, g2)
-g5.add_transition(134, g2)
-g5.add_transition(135, g2)
-g5.add_transition(136, g2)
-g5.add_transition(137, g2)
-g5.add_transition(138, g2)
-g5.add_transition(139, g2)
-g5.add_transition(140, g2)
-g5.add_transition(141, g2)
-g5.add_transition(142, g2)
-g5.add_transition(143, g2)
-g5.add_transition(144, g2)
-g5.add_transition(145, g2)
-g5.add_transition(146, g2)
-g5.add_transition(147, g2)
-g5.add_transition(148, g2)
-g5.add_transition(149, g2)
-g5.add_transition(150, g2)
-g5.add_transition(151, g2)
-g5.add_transition(152, g2)
-g5.add_transition(153, g2)
-g5.add_transition(154, g2)
-g5.add_transition(155, g2)
-g5.add_transition(156, g2)
-g5.add_transition(157, g2)
-g5.add_transition(158, g2)
-g5.add_transition(159, g2)
-g5.add_transition(160, g2)
-g5.add_transition(161, g2)
-g5.add_transition(162, g2)
-g5.add_transition(163, g2)
-g5.add_transition(164, g2)
-g5.add_transition(165, g2)
-g5.add_transition(166, g2)
-g5.add_transition(167, g2)
-g5.add_transition(168, g2)
-g5.add_transition(169, g2)
-g5.add_transition(170, g2)
-g5.add_transition(171, g2)
-g5.add_transition(172, g2)
-g5.add_transition(173, g2)
-g5.add_transition(174, g2)
-g5.add_transition(175, g2)
-g5.add_transition(176, g2)
-g5.add_transition(177, g2)
-g5.add_transition(178, g2)
-g5.add_transition(179, g2)
-g5.add_transition(180, g2)
-g5.add_transition(181, g2)
-g5.add_transition(182, g2)
-g5.add_transition(183, g2)
-g5.add_transition(184, g2)
-g5.add_transition(185, g2)
-g5.add_transition(186, g2)
-g5.add_transition(187, g2)
-g5.add_transition(188, g2)
-g5.add_transition(189, g2)
-g5.add_transition(190, g2)
-g5.add_transition(191, g2)
-g5.add_transition(192, g2)
-g5.add_transition(193, g2)
-g5.add_transition(194, g2)
-g5.add_transition(195, g2)
-g5.add_transition(196, g2)
-g5.add_transition(197, g2)
-g5.add_transition(198, g2)
-g5.add_transition(199, g2)
-g5.add_transition(200, g2)
-g5.add_transition(201, g2)
-g5.add_transition(202, g2)
-g5.add_transition(203, g2)
-g5.add_transition(204, g2)
-g5.add_transition(205, g2)
-g5.add_transition(206, g2)
-g5.add_transition(207, g2)
-g5.add_transition(208, g2)
-g5.add_transition(209, g2)
-g5.add_transition(210, g2)
-g5.add_transition(211, g2)
-g5.add_transition(212, g2)
-g5.add_transition(213, g2)
-g5.add_transition(214, g2)
-g5.add_transition(215, g2)
-g5.add_transition(216, g2)
-g5.add_transition(217, g2)
-g5.add_transition(218, g2)
-g5.add_transition(219, g2)
-g5.add_transition(220, g2)
-g5.add_transition(221, g2)
-g5.add_transition(222, g2)
-g5.add_transition(223, g2)
-g5.add_transition(224, g2)
-g5.add_transition(225, g2)
-g5.add_transition(226, g2)
-g5.add_transition(227, g2)
-g5.add_transition(228, g2)
-g5.add_transition(229, g2)
-g5.add_transition(230, g2)
-g5.add_transition(231, g2)
-g5.add_transition(232, g2)
-g5.add_transition(233, g2)
-g5.add_transition(234, g2)
-g5.add_transition(235, g2)
-g5.add_transition(236, g2)
-g5.add_transition(237, g2)
-g5.add_transition(238, g2)
-g5.add_transition(239, g2)
-g5.add_transition(240, g2)
-g5.add_transition(241, g2)
-g5.add_transition(242, g2)
-g5.add_transition(243, g2)
-g5.add_transition(244, g2)
-g5.add_transition(245, g2)
-g5.add_transition(246, g2)
-g5.add_transition(247, g2)
-g5.add_transition(248, g2)
-g5.add_transition(249, g2)
-g5.add_transition(250, g2)
-g5.add_transition(251, g2)
-g5.add_transition(252, g2)
-g5.add_transition(253, g2)
-g5.add_transition(254, g2)
-g5.add_transition(255, g2)
-
-g4.isFinalState = True
-g4.addToken( 'HEADER')
-
@@ -60,7 +60,7 @@ class YpReader:
         }
 
         # Import the machineLector module
-        machineLector = import_module('machineLector.py', YpParts, directory='./')
+        machineLector = import_module('machineLector.py', YpParts)
 
         # Simulate the machineLector
         result = simulator(machineLector, self.content)
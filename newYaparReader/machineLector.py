@@ -1,350 +0,0 @@
-from Machines_gen_usage.Classes_ import State
-
-e4 = State('e4')
-e3 = State('e3')
-e2 = State('e2')
-e1 = State('e1')
-d8 = State('d8')
-d7 = State('d7')
-d6 = State('d6')
-d5 = State('d5')
-d4 = State('d4')
-d3 = State('d3')
-d2 = State('d2')
-d1 = State('d1')
-c8 = State('c8')
-c7 = State('c7')
-c6 = State('c6')
-c5 = State('c5')
-c4 = State('c4')
-c3 = State('c3')
-c2 = State('c2')
-c1 = State('c1')
-b2 = State('b2')
-b1 = State('b1')
-a2 = State('a2')
-a1 = State('a1')
-a0 = State('a0')
-a0.add_transition(47, a1)
-a0.add_transition(42, b1)
-a0.add_transition(37, c1)
-a0.add_transition(73, d1)
-a0.add_transition(97, e1)
-a0.add_transition(98, e1)
-a0.add_transition(99, e1)
-a0.add_transition(100, e1)
-a0.add_transition(101, e1)
-a0.add_transition(102, e1)
-a0.add_transition(103, e1)
-a0.add_transition(104, e1)
-a0.add_transition(105, e1)
-a0.add_transition(106, e1)
-a0.add_transition(107, e1)
-a0.add_transition(108, e1)
-a0.add_transition(109, e1)
-a0.add_transition(110, e1)
-a0.add_transition(111, e1)
-a0.add_transition(112, e1)
-a0.add_transition(113, e1)
-a0.add_transition(114, e1)
-a0.add_transition(115, e1)
-a0.add_transition(116, e1)
-a0.add_transition(117, e1)
-a0.add_transition(118, e1)
-a0.add_transition(119, e1)
-a0.add_transition(120, e1)
-a0.add_transition(121, e1)
-a0.add_transition(122, e1)
-
-a1.add_transition(42, a2)
-
-a2.isFinalState = True
-a2.addToken( 'COMMENT')
-
-b1.add_transition(47, b2)
-
-b2.isFinalState = True
-b2.addToken( 'COMMENT')
-
-c1.add_transition(116, c2)
-
-c2.add_transition(111, c3)
-
-c3.add_transition(107, c4)
-
-c4.add_transition(101, c5)
-
-c5.add_transition(110, c6)
-
-c6.add_transition(32, c7)
-
-c7.add_transition(65, c8)
-c7.add_transition(66, c8)
-c7.add_transition(67, c8)
-c7.add_transition(68, c8)
-c7.add_transition(69, c8)
-c7.add_transition(70, c8)
-c7.add_transition(71, c8)
-c7.add_transition(72, c8)
-c7.add_transition(73, c8)
-c7.add_transition(74, c8)
-c7.add_transition(75, c8)
-c7.add_transition(76, c8)
-c7.add_transition(77, c8)
-c7.add_transition(78, c8)
-c7.add_transition(79, c8)
-c7.add_transition(80, c8)
-c7.add_transition(81, c8)
-c7.add_transition(82, c8)
-c7.add_transition(83, c8)
-c7.add_transition(84, c8)
-c7.add_transition(85, c8)
-c7.add_transition(86, c8)
-c7.add_transition(87, c8)
-c7.add_transition(88, c8)
-c7.add_transition(89, c8)
-c7.add_transition(90, c8)
-
-c8.isFinalState = True
-c8.addToken( 'TOKEN')
-c8.add_transition(32, c7)
-c8.add_transition(65, c8)
-c8.add_transition(66, c8)
-c8.add_transition(67, c8)
-c8.add_transition(68, c8)
-c8.add_transition(69, c8)
-c8.add_transition(70, c8)
-c8.add_transition(71, c8)
-c8.add_transition(72, c8)
-c8.add_transition(73, c8)
-c8.add_transition(74, c8)
-c8.add_transition(75, c8)
-c8.add_transition(76, c8)
-c8.add_transition(77, c8)
-c8.add_transition(78, c8)
-c8.add_transition(79, c8)
-c8.add_transition(80, c8)
-c8.add_transition(81, c8)
-c8.add_transition(82, c8)
-c8.add_transition(83, c8)
-c8.add_transition(84, c8)
-c8.add_transition(85, c8)
-c8.add_transition(86, c8)
-c8.add_transition(87, c8)
-c8.add_transition(88, c8)
-c8.add_transition(89, c8)
-c8.add_transition(90, c8)
-
-d1.add_transition(71, d2)
-
-d2.add_transition(78, d3)
-
-d3.add_transition(79, d4)
-
-d4.add_transition(82, d5)
-
-d5.add_transition(69, d6)
-
-d6.add_transition(32, d7)
-
-d7.add_transition(65, d8)
-d7.add_transition(66, d8)
-d7.add_transition(67, d8)
-d7.add_transition(68, d8)
-d7.add_transition(69, d8)
-d7.add_transition(70, d8)
-d7.add_transition(71, d8)
-d7.add_transition(72, d8)
-d7.add_transition(73, d8)
-d7.add_transition(74, d8)
-d7.add_transition(75, d8)
-d7.add_transition(76, d8)
-d7.add_transition(77, d8)
-d7.add_transition(78, d8)
-d7.add_transition(79, d8)
-d7.add_transition(80, d8)
-d7.add_transition(81, d8)
-d7.add_transition(82, d8)
-d7.add_transition(83, d8)
-d7.add_transition(84, d8)
-d7.add_transition(85, d8)
-d7.add_transition(86, d8)
-d7.add_transition(87, d8)
-d7.add_transition(88, d8)
-d7.add_transition(89, d8)
-d7.add_transition(90, d8)
-
-d8.isFinalState = True
-d8.addToken( 'TOKEN')
-d8.add_transition(32, d7)
-d8.add_transition(65, d8)
-d8.add_transition(66, d8)
-d8.add_transition(67, d8)
-d8.add_transition(68, d8)
-d8.add_transition(69, d8)
-d8.add_transition(70, d8)
-d8.add_transition(71, d8)
-d8.add_transition(72, d8)
-d8.add_transition(73, d8)
-d8.add_transition(74, d8)
-d8.add_transition(75, d8)
-d8.add_transition(76, d8)
-d8.add_transition(77, d8)
-d8.add_transition(78, d8)
-d8.add_transition(79, d8)
-d8.add_transition(80, d8)
-d8.add_transition(81, d8)
-d8.add_transition(82, d8)
-d8.add_transition(83, d8)
-d8.add_transition(84, d8)
-d8.add_transition(85, d8)
-d8.add_transition(86, d8)
-d8.add_transition(87, d8)
-d8.add_transition(88, d8)
-d8.add_transition(89, d8)
-d8.add_transition(90, d8)
-
-e1.add_transition(58, e2)
-e1.add_transition(97, e1)
-e1.add_transition(98, e1)
-e1.add_transition(99, e1)
-e1.add_transition(100, e1)
-e1.add_transition(101, e1)
-e1.add_transition(102, e1)
-e1.add_transition(103, e1)
-e1.add_transition(104, e1)
-e1.add_transition(105, e1)
-e1.add_transition(106, e1)
-e1.add_transition(107, e1)
-e1.add_transition(108, e1)
-e1.add_transition(109, e1)
-e1.add_transition(110, e1)
-e1.add_transition(111, e1)
-e1.add_transition(112, e1)
-e1.add_transition(113, e1)
-e1.add_transition(114, e1)
-e1.add_transition(115, e1)
-e1.add_transition(116, e1)
-e1.add_transition(117, e1)
-e1.add_transition(118, e1)
-e1.add_transition(119, e1)
-e1.add_transition(120, e1)
-e1.add_transition(121, e1)
-e1.add_transition(122, e1)
-
-e2.add_transition(10, e3)
-e2.add_transition(32, e3)
-e2.add_transition(65, e3)
-e2.add_transition(66, e3)
-e2.add_transition(67, e3)
-e2.add_transition(68, e3)
-e2.add_transition(69, e3)
-e2.add_transition(70, e3)
-e2.add_transition(71, e3)
-e2.add_transition(72, e3)
-e2.add_transition(73, e3)
-e2.add_transition(74, e3)
-e2.add_transition(75, e3)
-e2.add_transition(76, e3)
-e2.add_transition(77, e3)
-e2.add_transition(78, e3)
-e2.add_transition(79, e3)
-e2.add_transition(80, e3)
-e2.add_transition(81, e3)
-e2.add_transition(82, e3)
-e2.add_transition(83, e3)
-e2.add_transition(84, e3)
-e2.add_transition(85, e3)
-e2.add_transition(86, e3)
-e2.add_transition(87, e3)
-e2.add_transition(88, e3)
-e2.add_transition(89, e3)
-e2.add_transition(90, e3)
-e2.add_transition(97, e3)
-e2.add_transition(98, e3)
-e2.add_transition(99, e3)
-e2.add_transition(100, e3)
-e2.add_transition(101, e3)
-e2.add_transition(102, e3)
-e2.add_transition(103, e3)
-e2.add_transition(104, e3)
-e2.add_transition(105, e3)
-e2.add_transition(106, e3)
-e2.add_transition(107, e3)
-e2.add_transition(108, e3)
-e2.add_transition(109, e3)
-e2.add_transition(110, e3)
-e2.add_transition(111, e3)
-e2.add_transition(112, e3)
-e2.add_transition(113, e3)
-e2.add_transition(114, e3)
-e2.add_transition(115, e3)
-e2.add_transition(116, e3)
-e2.add_transition(117, e3)
-e2.add_transition(118, e3)
-e2.add_transition(119, e3)
-e2.add_transition(120, e3)
-e2.add_transition(121, e3)
-e2.add_transition(122, e3)
-e2.add_transition(124, e3)
-
-e3.add_transition(10, e3)
-e3.add_transition(32, e3)
-e3.add_transition(59, e4)
-e3.add_transition(65, e3)
-e3.add_transition(66, e3)
-e3.add_transition(67, e3)
-e3.add_transition(68, e3)
-e3.add_transition(69, e3)
-e3.add_transition(70, e3)
-e3.add_transition(71, e3)
-e3.add_transition(72, e3)
-e3.add_transition(73, e3)
-e3.add_transition(74, e3)
-e3.add_transition(75, e3)
-e3.add_transition(76, e3)
-e3.add_transition(77, e3)
-e3.add_transition(78, e3)
-e3.add_transition(79, e3)
-e3.add_transition(80, e3)
-e3.add_transition(81, e3)
-e3.add_transition(82, e3)
-e3.add_transition(83, e3)
-e3.add_transition(84, e3)
-e3.add_transition(85, e3)
-e3.add_transition(86, e3)
-e3.add_transition(87, e3)
-e3.add_transition(88, e3)
-e3.add_transition(89, e3)
-e3.add_transition(90, e3)
-e3.add_transition(97, e3)
-e3.add_transition(98, e3)
-e3.add_transition(99, e3)
-e3.add_transition(100, e3)
-e3.add_transition(101, e3)
-e3.add_transition(102, e3)
-e3.add_transition(103, e3)
-e3.add_transition(104, e3)
-e3.add_transition(105, e3)
-e3.add_transition(106, e3)
-e3.add_transition(107, e3)
-e3.add_transition(108, e3)
-e3.add_transition(109, e3)
-e3.add_transition(110, e3)
-e3.add_transition(111, e3)
-e3.add_transition(112, e3)
-e3.add_transition(113, e3)
-e3.add_transition(114, e3)
-e3.add_transition(115, e3)
-e3.add_transition(116, e3)
-e3.add_transition(117, e3)
-e3.add_transition(118, e3)
-e3.add_transition(119, e3)
-e3.add_transition(120, e3)
-e3.add_transition(121, e3)
-e3.add_transition(122, e3)
-e3.add_transition(124, e3)
-
-e4.isFinalState = True
-e4.addToken( 'PRODUCTION')
-
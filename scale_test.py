@@ -0,0 +1,92 @@
+import argparse
+import random
+import resource
+import sys
+import time
+from Machines_gen_usage.prepareAFD import prepareAFN
+from Machines_gen_usage.DenseAFD import getDense
+from Machines_gen_usage.Simulator import exclusiveSim
+from Machines_gen_usage.ReBackend import ReLexer
+
+# Keyword rules the scale test compiles, and the time and peak memory its build has to stay within
+SCALE_RULES = 5000
+MAX_BUILD_SECONDS = 120
+MAX_RSS_MB = 2048
+
+
+def keywordSpec(count: int, seed: int = 0):
+    """count keyword rules (like a big opcode table) followed by identifiers, numbers and white space"""
+    rand = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add(''.join(rand.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rand.randint(3, 9))))
+    words = sorted(words)
+    spec = {f'KW_{i}': [word] for i, word in enumerate(words)}
+    spec['ID'] = ['[a-zA-Z][a-zA-Z0-9]*']
+    spec['NUMBER'] = ['[0-9]+']
+    spec['WS'] = ['[ \n\t]+']
+    return spec, words
+
+
+def maxRss() -> int:
+    """Peak memory of the process in MB"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024
+
+
+def scaleRun(count: int, mode: str = 'auto', keywords: bool = False, builder: str = 'positions'):
+    """Builds the keyword spec of count rules and lexes a line with every keyword. Returns the machine, the
+    tokens found, the tokens expected and the build and lex times"""
+    spec, words = keywordSpec(count)
+    start = time.perf_counter()
+    machine = getDense(prepareAFN(spec, mode=mode, keywords=keywords, builder=builder))
+    built = time.perf_counter()
+
+    text = ' '.join(words) + ' notakeyword123 42'
+    tokens = [token for _, token in exclusiveSim(machine, text) if token not in (0, 'WS')]
+    lexed = time.perf_counter()
+
+    expected = [f'KW_{i}' for i in range(len(words))] + ['ID', 'NUMBER']
+    return machine, tokens, expected, built - start, lexed - built
+
+
+def test_keyword_scale():
+    """5k keyword rules build within the time and memory bounds and every keyword gets its own token"""
+    _, tokens, expected, buildTime, _ = scaleRun(SCALE_RULES)
+    assert tokens == expected
+    assert buildTime < MAX_BUILD_SECONDS, f'build took {buildTime:.1f}s'
+    assert maxRss() < MAX_RSS_MB, f'peak memory {maxRss()} MB'
+
+
+def test_long_literal():
+    """A literal alternative thousands of characters long is factored into the trie without recursing on it"""
+    word = 'x' * 3000
+    spec = {'KW': [f'{word}|{word[:-1]}y|if|in'], 'ID': ['[a-z]+'], 'WS': ['[ ]+']}
+    text = f'{word} {word[:-1]}y if ab {word}x'
+    expected = ['KW', 'KW', 'KW', 'ID', 'ID']
+    tokens = [token for _, token in exclusiveSim(prepareAFN(spec, literalTrie=True), text) if token not in (0, 'WS')]
+    assert tokens == expected
+    assert [token for _, token in ReLexer(spec).tokenize(text) if token not in (0, 'WS')] == expected
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compiles a lexer with thousands of keyword rules')
+    parser.add_argument('-n', '--rules', type=int, default=SCALE_RULES)
+    parser.add_argument('-m', '--mode', default='auto', choices=['auto', 'threads', 'processes'])
+    parser.add_argument('-k', '--keywords', action='store_true', help='Looks the keywords up after the match')
+    parser.add_argument('-b', '--builder', default='positions', choices=['positions', 'derivatives'])
+    args = parser.parse_args()
+
+    machine, tokens, expected, buildTime, lexTime = scaleRun(args.rules, args.mode, args.keywords, args.builder)
+    print(f'rules {args.rules + 3}, states {machine.numStates}, classes {machine.numClasses}')
+    print(f'build {buildTime:.2f}s, lex {lexTime:.3f}s, max rss {maxRss()} MB')
+    failures = []
+    if tokens != expected:
+        failures.append('the tokens differ')
+    if buildTime >= MAX_BUILD_SECONDS:
+        failures.append(f'the build took more than {MAX_BUILD_SECONDS}s')
+    if maxRss() >= MAX_RSS_MB:
+        failures.append(f'it used more than {MAX_RSS_MB} MB')
+    if failures:
+        print('FAILED: ' + ', '.join(failures))
+        sys.exit(1)
+    print('OK')
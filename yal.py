@@ -6,6 +6,8 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Compile a program')
     parser.add_argument('source', help='Source file')
     parser.add_argument('-o', help='Output file', default='')
+    parser.add_argument('--simplify-report', action='store_true',
+                        help='Prints the positions of every rule before and after simplifying it')
     args = parser.parse_args()
     content = reader(args.source)
     ev = eval_Text(content)
@@ -16,7 +18,7 @@ if __name__ == '__main__':
     if getTotal() == 0:
         raise Exception('No tokens found')
 
-    codes = create_mach(False, args.o)
+    codes = create_mach(False, args.o, args.simplify_report)
 
     for files in codes:
         print('- File:', files)
@@ -159,6 +159,7 @@ regexInSet = {
 }
 
 machineValue = import_module("varDefMachine3.py", regex)
+valueRules = dict(regex)
 machineSet = import_module("varDefMachineSET2.py", regexInSet)
 setSA = import_module("onlyProduct.py", {'IN_SET': ["\[([^a[]]|a|' ')*\]"]})
 
@@ -166,6 +167,7 @@ setSA = import_module("onlyProduct.py", {'IN_SET': ["\[([^a[]]|a|' ')*\]"]})
 def clear():
     global dictVar
     global machineValue
+    global valueRules
     global machineSet
     global total_machines
     global findHeader
@@ -177,6 +179,7 @@ def clear():
     total_machines = {}
     dictVar = {}
     machineValue = import_module("varDefMachine3.py", regex)
+    valueRules = dict(regex)
     machineSet = import_module("varDefMachineSET2.py", regexInSet)
 
 
@@ -336,9 +339,9 @@ def eval_Value(var, value, notDo=False):
     else:
         if value != '' and not notDo:
             dictVar[var] = op
-            rg = {var: [var]}
-            newMachine = prepareAFN(rg)
-            machineValue.combine_States(newMachine)
+            # Every variable is one more rule after the ones of the value machine
+            valueRules[var] = valueRules.get(var, []) + [var]
+            machineValue = import_module("varDefMachine3.py", valueRules)
 
     return new_ev, op
 
@@ -385,7 +388,7 @@ def Eval_tokens(token):
     return [(message, token) for message, token in new_eval]
 
 
-def create_mach(draws_machine=True, defect_file:str = ''):
+def create_mach(draws_machine=True, defect_file:str = '', simplify_report=False):
     global total_machines, orderPy
     if len(total_machines) == 0:
         return
@@ -403,7 +406,21 @@ def create_mach(draws_machine=True, defect_file:str = ''):
     for machine in total_machines:
         for pr in total_machines[machine]:
             print(pr, total_machines[machine][pr])
-        mach = prepareAFN(total_machines[machine], draws_machine)
+        if simplify_report:
+            # Positions of every rule tree before and after simplify, the size make_direct_tree works on
+            report = simplifyReport(total_machines[machine])
+            for token, rg, before, after in report:
+                print(f"{YELLOW}{token} /{rg}/: {before} -> {after} positions{RESET}")
+            print(f"{BOLD}{YELLOW}Simplified {machine}: {sum(item[2] for item in report)} -> "
+                  f"{sum(item[3] for item in report)} positions{RESET}")
+        # Warns the author of the .yal about the rules that can never produce their token
+        try:
+            mach = prepareAFN(total_machines[machine], draws_machine, shadowed='warn', maxStates=STATE_BUDGET,
+                              maxTransitions=TRANSITION_BUDGET)
+        except BudgetExceeded as error:
+            # The generated scanner runs on the whole table, so a machine past the budget is not generated
+            print(f"{BOLD}{RED}{error}, the scanner of {machine} is not generated{RESET}")
+            continue
         code += translateToCode(mach, True, headerC)
         fileName = "./scaner/out_" + str(machine) + ".py" if defect_file == '' else defect_file
         defect_file = ''